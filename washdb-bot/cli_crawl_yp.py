@@ -23,6 +23,7 @@ from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from db.batch_writer import BatchWriter
 from db.save_discoveries import upsert_discovered
 from runner.logging_setup import get_logger
 from runner.safety import create_safety_limits_from_env, create_rate_limiter_from_env
@@ -107,7 +108,7 @@ def progress_callback(target_idx: int, total_targets: int, target, results: list
     logger.info(
         f"Progress: {target_idx}/{total_targets} ({progress_pct:.1f}%) | "
         f"City: {target.city} | Category: {target.category_label} | "
-        f"Results: {len(results)} | Acceptance: {stats.get('acceptance_rate', 0):.1f}%"
+        f"Results: {stats.get('total_accepted', len(results))} | Acceptance: {stats.get('acceptance_rate', 0):.1f}%"
     )
 
 
@@ -230,6 +231,7 @@ Note: Targets are automatically generated from city_registry on first run.
     engine = create_engine(DATABASE_URL, echo=False)
     Session = sessionmaker(bind=engine)
     session = Session()
+    writer = None
 
     try:
         # Ensure targets exist (auto-generate from city_registry if needed)
@@ -256,6 +258,17 @@ Note: Targets are automatically generated from city_registry on first run.
         total_early_exits = 0
         total_errors = 0
 
+        # Results are upserted in batches from a background thread while
+        # the crawl continues
+        if not args.dry_run:
+            writer = BatchWriter(
+                upsert_discovered,
+                name="yp",
+                batch_size=int(os.getenv("YP_WRITER_BATCH_SIZE", "50")),
+                count_names=("inserted", "skipped", "updated"),
+            )
+        failed_writes = 0
+
         for batch in crawl_city_targets(
             state_ids=state_ids,
             session=session,
@@ -266,6 +279,7 @@ Note: Targets are automatically generated from city_registry on first run.
             use_session_breaks=not args.no_session_breaks,
             use_monitoring=not args.disable_monitoring,
             use_adaptive_rate_limiting=not args.disable_adaptive_rate_limiting,
+            writer=writer,
         ):
             # Check safety limits before processing
             if not safety.check_should_continue():
@@ -280,8 +294,8 @@ Note: Targets are automatically generated from city_registry on first run.
                 time.sleep(delay)
 
             target = batch['target']
-            results = batch['results']
             stats = batch['stats']
+            accepted = stats.get('total_accepted', 0)
 
             total_targets_processed += 1
             if stats.get('early_exit'):
@@ -290,30 +304,29 @@ Note: Targets are automatically generated from city_registry on first run.
             # Record page processed
             safety.record_page_processed()
 
-            if results and not args.dry_run:
-                # Save to database
-                try:
-                    inserted, skipped, updated = upsert_discovered(results)
-                    total_results_saved += inserted + updated
-
-                    logger.info(
-                        f"Saved: {inserted} new, {updated} updated, {skipped} skipped"
-                    )
-
-                    # Record success
-                    safety.record_success()
-                    limiter.record_success()
-
-                except Exception as e:
-                    logger.error(f"Failed to save results: {e}")
+            if accepted and writer:
+                # Saved by the writer; report failed batches written since the last target
+                writer_stats = writer.get_stats()
+                logger.info(
+                    f"Saved so far: {writer_stats['inserted']} new, {writer_stats['updated']} updated, "
+                    f"{writer_stats['skipped']} skipped ({writer_stats['pending']} pending)"
+                )
+
+                if writer_stats['failed'] > failed_writes:
+                    failed_writes = writer_stats['failed']
+                    logger.error(f"Failed to save results: {writer_stats['last_error']}")
                     total_errors += 1
 
                     # Record failure
-                    safety.record_failure(str(e))
+                    safety.record_failure(writer_stats['last_error'])
                     limiter.record_failure()
+                else:
+                    # Record success
+                    safety.record_success()
+                    limiter.record_success()
 
-            elif results:
-                logger.info(f"Dry run: would have saved {len(results)} results")
+            elif accepted:
+                logger.info(f"Dry run: would have saved {accepted} results")
                 # Count dry run as success
                 safety.record_success()
                 limiter.record_success()
@@ -322,6 +335,14 @@ Note: Targets are automatically generated from city_registry on first run.
                 safety.record_failure("No results found for target")
                 limiter.record_failure()
 
+        # Write remaining results
+        if writer:
+            writer.close()
+            writer_stats = writer.get_stats()
+            total_results_saved = writer_stats['inserted'] + writer_stats['updated']
+            if writer_stats['failed'] > failed_writes:
+                total_errors += 1
+
         # Final summary
         print()
         print("=" * 80)
@@ -364,6 +385,8 @@ Note: Targets are automatically generated from city_registry on first run.
         return 1
 
     finally:
+        if writer:
+            writer.close()
         session.close()
 
 
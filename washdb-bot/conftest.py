@@ -0,0 +1,59 @@
+"""
+Pytest configuration shared by every test tree (tests/ and seo_intelligence/tests/).
+
+Keeps services that persist local state on disk pointed at tmp_path, so a
+test run never reads or wipes the real stores under data/.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_domain_quarantine(tmp_path, monkeypatch):
+    """Point the shared quarantine store at tmp_path and reset the singleton."""
+    import seo_intelligence.services.domain_quarantine as domain_quarantine_module
+
+    monkeypatch.setenv("DOMAIN_QUARANTINE_DB", str(tmp_path / "domain_quarantine.db"))
+    monkeypatch.setattr(domain_quarantine_module, "_domain_quarantine", None)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_rate_limiter(tmp_path, monkeypatch):
+    """Point the shared rate limit store at tmp_path and reset the singleton."""
+    import seo_intelligence.services.rate_limiter as rate_limiter_module
+
+    monkeypatch.setenv("RATE_LIMITER_DB", str(tmp_path / "rate_limiter.db"))
+    monkeypatch.setattr(rate_limiter_module, "_rate_limiter_instance", None)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_listing_cache(tmp_path, monkeypatch):
+    """Point the shared YP listing store at tmp_path and reset the singleton."""
+    import scrape_yp.listing_cache as listing_cache_module
+
+    monkeypatch.setenv("YP_LISTING_CACHE_DB", str(tmp_path / "yp_listing_cache.db"))
+    monkeypatch.setattr(listing_cache_module, "_listing_cache", None)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_robots_cache(tmp_path, monkeypatch):
+    """Point the shared robots.txt store at tmp_path and reset the singleton."""
+    import seo_intelligence.services.robots_checker as robots_checker_module
+
+    monkeypatch.setenv("ROBOTS_CACHE_DB", str(tmp_path / "robots_cache.db"))
+    monkeypatch.setattr(robots_checker_module, "_robots_checker_instance", None)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_proxy_scorer(tmp_path, monkeypatch):
+    """Point the shared proxy stats store at tmp_path and reset the singleton."""
+    import scrape_yp.proxy_scoring as proxy_scoring_module
+
+    monkeypatch.setenv("PROXY_STATS_DB", str(tmp_path / "proxy_stats.db"))
+    monkeypatch.setattr(proxy_scoring_module, "_proxy_scorer", None)
+    yield
+
@@ -20,6 +20,7 @@ from db.update_details import (
     update_batch,
 )
 from db.database_manager import DatabaseManager, get_db_manager
+from db.engine_registry import EngineRegistry, get_engine, get_engine_registry
 from db.schema_inspector import get_schema_inspector
 
 __version__ = "0.1.0"
@@ -37,5 +38,8 @@ __all__ = [
     "update_batch",
     "DatabaseManager",
     "get_db_manager",
+    "EngineRegistry",
+    "get_engine",
+    "get_engine_registry",
     "get_schema_inspector",
 ]
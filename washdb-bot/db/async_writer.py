@@ -0,0 +1,257 @@
+"""
+Write-behind database writer for the async (Playwright) crawlers.
+
+The Google and Yelp city-first crawlers run inside an event loop; a
+synchronous session.commit() per business stalls every page navigation
+and timer on that loop for a database round trip. AsyncBatchWriter takes
+records from the crawler through an asyncio.Queue; a writer task groups
+them into batches and runs the (blocking) save function in a worker
+thread, so the loop keeps driving the browser while Postgres works.
+
+put() returns a future for the record's result (e.g. its company id);
+flush() is the barrier a crawler awaits when a target is finished.
+
+Usage:
+    from db.async_writer import AsyncBatchWriter, upsert_companies
+
+    writer = AsyncBatchWriter(upsert_companies, name="google")
+    future = await writer.put(company_row)
+    ...
+    await writer.flush()   # target complete: everything is written
+    company_id = future.result()
+    await writer.close()
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from db.batching import FLUSH, STOP, account_batch, new_writer_stats, write_batch_async
+from runner.logging_setup import get_logger
+from runner.metrics import stage_timer
+
+logger = get_logger("async_writer")
+
+ASYNC_WRITER_BATCH_SIZE = int(os.getenv("ASYNC_WRITER_BATCH_SIZE", "25"))
+ASYNC_WRITER_FLUSH_INTERVAL = float(os.getenv("ASYNC_WRITER_FLUSH_INTERVAL", "2.0"))
+
+
+class AsyncBatchWriter:
+    """
+    Writes records in batches from a background task.
+
+    A batch is written when batch_size records are pending, when
+    flush_interval seconds have passed since its first record, on flush()
+    and on close(). write_fn is called in a worker thread with the batch
+    and returns one result per record. If a batch fails, its records are
+    retried one at a time, so only the records that fail on their own
+    resolve with None; the writer keeps going.
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[List[Any]], Sequence[Any]],
+        name: str = "writer",
+        batch_size: int = ASYNC_WRITER_BATCH_SIZE,
+        flush_interval: float = ASYNC_WRITER_FLUSH_INTERVAL,
+        max_pending: int = 500,
+    ):
+        """
+        Create the writer (the task starts with the first put()).
+
+        Args:
+            write_fn: Saves one batch (blocking); returns a result per record
+            name: Name used in logs
+            batch_size: Records per batch
+            flush_interval: Maximum seconds a partial batch waits
+            max_pending: Records queued before put() waits
+        """
+        self.write_fn = write_fn
+        self.name = name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._stats = new_writer_stats(flush_wait_seconds=0.0, max_queue_depth=0)
+
+    def _start(self):
+        """Create the queue and writer task on the running loop."""
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._task = asyncio.get_running_loop().create_task(self._run(), name=f"{self.name}-async-writer")
+
+    async def put(self, record: Any) -> asyncio.Future:
+        """
+        Queue a record for writing (waits while the queue is full).
+
+        Args:
+            record: Record passed to write_fn as part of a batch
+
+        Returns:
+            Future resolved with the record's write result (None on failure)
+
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        if self._closed:
+            raise RuntimeError(f"AsyncBatchWriter '{self.name}' is closed")
+        self._start()
+
+        future = asyncio.get_running_loop().create_future()
+        start = time.perf_counter()
+        await self._queue.put((record, future))
+        self._stats['put_blocked_seconds'] += time.perf_counter() - start
+        self._stats['queued'] += 1
+        self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], self._queue.qsize())
+        return future
+
+    async def flush(self):
+        """Write all queued records and wait until they are written."""
+        if self._task is None or self._closed:
+            return
+        start = time.perf_counter()
+        await self._queue.put(FLUSH)
+        await self._queue.join()
+        self._stats['flush_wait_seconds'] += time.perf_counter() - start
+
+    async def close(self):
+        """Write all queued records and stop the writer task."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is None:
+            return
+        await self._queue.put(STOP)
+        await self._task
+
+        logger.info(
+            f"AsyncBatchWriter '{self.name}' closed: {self._stats['written']} written, "
+            f"{self._stats['failed']} failed in {self._stats['batches']} batches"
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _run(self):
+        """Writer task: collect records into batches and write them."""
+        batch: List[Any] = []
+        deadline = None
+
+        while True:
+            try:
+                if deadline is None:
+                    item = await self._queue.get()
+                else:
+                    item = await asyncio.wait_for(self._queue.get(), max(0.0, deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                # Partial batch waited flush_interval
+                await self._write(batch)
+                batch, deadline = [], None
+                continue
+
+            if item is FLUSH or item is STOP:
+                await self._write(batch)
+                batch, deadline = [], None
+                self._queue.task_done()
+                if item is STOP:
+                    return
+                continue
+
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+
+            if len(batch) >= self.batch_size:
+                await self._write(batch)
+                batch, deadline = [], None
+
+    async def _write(self, batch: List[Any]):
+        """Write one batch in a worker thread and resolve its futures."""
+        if not batch:
+            return
+
+        records = [record for record, _ in batch]
+        start = time.perf_counter()
+        with stage_timer(self.name, "db_write"):
+            outcome = await write_batch_async(
+                lambda chunk: asyncio.to_thread(self.write_fn, chunk), records
+            )
+        account_batch(
+            self._stats, outcome, time.perf_counter() - start,
+            self.name, f"AsyncBatchWriter '{self.name}'", logger,
+        )
+
+        for (_, future), result in zip(batch, outcome.record_results()):
+            if not future.done():
+                future.set_result(result)
+        for _ in batch:
+            self._queue.task_done()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get writer statistics.
+
+        Returns:
+            dict: Records queued/written/failed, batches, time spent
+            writing, time put() and flush() spent waiting, current and
+            peak queue depth
+        """
+        stats = dict(self._stats)
+        stats['queue_depth'] = self._queue.qsize() if self._queue is not None else 0
+        stats['records_per_sec'] = (
+            stats['written'] / stats['write_seconds'] if stats['write_seconds'] else 0.0
+        )
+        return stats
+
+
+def upsert_companies(rows: List[Dict[str, Any]]) -> List[Optional[int]]:
+    """
+    Insert companies in one statement, keeping existing rows by website.
+
+    Uses INSERT ... ON CONFLICT (website) DO NOTHING RETURNING id; ids of
+    companies that already existed are looked up in a second query.
+
+    Args:
+        rows: Column -> value mappings for the companies table (each
+            with a canonical 'website')
+
+    Returns:
+        Company ID per row (existing or new), in the order of rows
+    """
+    from db.database_manager import get_db_manager
+    from db.models import Company
+
+    if not rows:
+        return []
+
+    # A multi-row VALUES needs the same columns in every row
+    columns = sorted({col for row in rows for col in row})
+    values = [{col: row.get(col) for col in columns} for row in rows]
+
+    with get_db_manager().get_session() as session:
+        stmt = (
+            pg_insert(Company)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=[Company.website])
+            .returning(Company.id, Company.website)
+        )
+        ids_by_website = {website: company_id for company_id, website in session.execute(stmt)}
+
+        existing = {row['website'] for row in rows} - set(ids_by_website)
+        if existing:
+            found = session.execute(
+                select(Company.id, Company.website).where(Company.website.in_(existing))
+            )
+            ids_by_website.update({website: company_id for company_id, website in found})
+
+    return [ids_by_website.get(row['website']) for row in rows]
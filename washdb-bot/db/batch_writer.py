@@ -0,0 +1,210 @@
+"""
+Background batched database writer.
+
+Scrapers hand accepted records to a BatchWriter instead of writing them
+inline: a writer thread groups them into batches and calls the save
+function (e.g. upsert_discovered), so page fetching never waits on the
+database. The pending queue is bounded; when the database falls behind,
+put() blocks and the slowdown propagates back to the scraper instead of
+records piling up in memory.
+
+Usage:
+    from db.batch_writer import BatchWriter
+    from db.save_discoveries import upsert_discovered
+
+    writer = BatchWriter(upsert_discovered, name="yp", count_names=("inserted", "skipped", "updated"))
+    writer.put(company_dict)
+    ...
+    failed = writer.flush()  # records that could not be saved since the last flush
+    writer.close()      # writes what is left
+    writer.get_stats()  # {'written': ..., 'inserted': ..., ...}
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from db.batching import FLUSH, STOP, account_batch, new_writer_stats, sum_counts, write_batch
+from runner.logging_setup import get_logger
+from runner.metrics import stage_timer
+
+logger = get_logger("batch_writer")
+
+
+class BatchWriter:
+    """
+    Writes records from a background thread in batches.
+
+    A batch is written when batch_size records are pending, when
+    flush_interval seconds have passed since its first record, on flush()
+    and on close(). If a batch fails, its records are retried one at a
+    time so only the bad records are lost; those are logged, counted and
+    reported by the next flush().
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[List[Any]], Optional[Sequence[int]]],
+        name: str = "writer",
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+        max_pending: int = 500,
+        count_names: Sequence[str] = (),
+    ):
+        """
+        Start the writer thread.
+
+        Args:
+            write_fn: Saves one batch; may return counts (e.g. inserted,
+                skipped, updated) that are summed under count_names
+            name: Name used in logs and the thread name
+            batch_size: Records per batch
+            flush_interval: Maximum seconds a partial batch waits
+            max_pending: Records queued before put() blocks
+            count_names: Names of the counts returned by write_fn
+        """
+        self.write_fn = write_fn
+        self.name = name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.count_names = tuple(count_names)
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = new_writer_stats()
+        self._counts = {count_name: 0 for count_name in self.count_names}
+        self._failed_since_flush = 0
+
+        self._thread = threading.Thread(target=self._run, name=f"{name}-batch-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, record: Any):
+        """
+        Queue a record for writing (blocks while the queue is full).
+
+        Args:
+            record: Record passed to write_fn as part of a batch
+
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        if self._closed:
+            raise RuntimeError(f"BatchWriter '{self.name}' is closed")
+
+        start = time.perf_counter()
+        self._queue.put(record)
+        blocked = time.perf_counter() - start
+
+        with self._lock:
+            self._stats['queued'] += 1
+            self._stats['put_blocked_seconds'] += blocked
+
+    def flush(self) -> int:
+        """
+        Write all queued records and wait until they are written.
+
+        Returns:
+            Number of records that could not be written since the previous
+            flush() (callers must not treat those records as saved)
+        """
+        if not self._closed:
+            self._queue.put(FLUSH)
+            self._queue.join()
+
+        with self._lock:
+            failed, self._failed_since_flush = self._failed_since_flush, 0
+        return failed
+
+    def close(self):
+        """Write all queued records and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(STOP)
+        self._thread.join()
+
+        stats = self.get_stats()
+        logger.info(
+            f"BatchWriter '{self.name}' closed: {stats['written']} written, "
+            f"{stats['failed']} failed in {stats['batches']} batches"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _run(self):
+        """Writer thread: collect records into batches and write them."""
+        batch: List[Any] = []
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # Partial batch waited flush_interval
+                self._write(batch)
+                for _ in range(len(batch)):
+                    self._queue.task_done()
+                batch, deadline = [], None
+                continue
+
+            if item is FLUSH or item is STOP:
+                self._write(batch)
+                # Acknowledge the batch and the marker itself
+                for _ in range(len(batch) + 1):
+                    self._queue.task_done()
+                batch, deadline = [], None
+                if item is STOP:
+                    return
+                continue
+
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                for _ in range(len(batch)):
+                    self._queue.task_done()
+                batch, deadline = [], None
+
+    def _write(self, batch: List[Any]):
+        """Write one batch, retrying its records one by one if it fails."""
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        with stage_timer(self.name, "db_write"):
+            outcome = write_batch(self.write_fn, batch)
+
+        with self._lock:
+            account_batch(
+                self._stats, outcome, time.perf_counter() - start,
+                self.name, f"BatchWriter '{self.name}'", logger,
+            )
+            self._failed_since_flush += outcome.failed
+            for count_name, value in sum_counts(outcome, self.count_names).items():
+                self._counts[count_name] += value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get writer statistics.
+
+        Returns:
+            dict: Records queued/written/failed, batches, time spent writing,
+            time put() spent blocked, pending records and summed write counts
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(self._counts)
+        stats['pending'] = self._queue.qsize()
+        stats['records_per_sec'] = (
+            stats['written'] / stats['write_seconds'] if stats['write_seconds'] else 0.0
+        )
+        return stats
@@ -0,0 +1,189 @@
+"""
+Batch writing shared by the database writers.
+
+BatchWriter (writer thread), AsyncBatchWriter (asyncio task) and the
+Google crawler's page save all write records in batches. A batch is
+written with one write_fn call; if that fails (e.g. one row violates a
+constraint), its records are retried one at a time so only the records
+that fail on their own are lost.
+
+Usage:
+    from db.batching import write_batch
+
+    outcome = write_batch(write_fn, records)
+    outcome.written, outcome.failed   # records saved / lost
+    outcome.record_results()          # write_fn result per record (None if lost)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from runner.metrics import record_items
+
+# Writer queue markers: write the pending batch now / and then exit
+FLUSH = object()
+STOP = object()
+
+
+@dataclass
+class BatchOutcome:
+    """Result of writing one batch."""
+    size: int
+    # (indexes of the records written together, write_fn return value)
+    calls: List[Tuple[List[int], Any]] = field(default_factory=list)
+    # index -> error, for records that could not be written
+    errors: Dict[int, Exception] = field(default_factory=dict)
+    # Error of the whole-batch write that triggered the per-record retry
+    batch_error: Optional[Exception] = None
+
+    @property
+    def written(self) -> int:
+        return sum(len(indexes) for indexes, _ in self.calls)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    def record_results(self) -> List[Any]:
+        """
+        Split the write_fn results per record.
+
+        Only for write_fns that return one result per record.
+
+        Returns:
+            Result per record, in batch order (None for failed records)
+        """
+        results: List[Any] = [None] * self.size
+        for indexes, returned in self.calls:
+            for index, result in zip(indexes, returned):
+                results[index] = result
+        return results
+
+
+def write_batch(write_fn: Callable[[List[Any]], Any], records: List[Any]) -> BatchOutcome:
+    """
+    Write a batch, retrying its records one by one if it fails.
+
+    Args:
+        write_fn: Saves a list of records
+        records: The batch
+
+    Returns:
+        BatchOutcome
+    """
+    outcome = BatchOutcome(size=len(records))
+    try:
+        outcome.calls.append((list(range(len(records))), write_fn(records)))
+        return outcome
+    except Exception as e:
+        if len(records) == 1:
+            outcome.errors[0] = e
+            return outcome
+        outcome.batch_error = e
+
+    for index, record in enumerate(records):
+        try:
+            outcome.calls.append(([index], write_fn([record])))
+        except Exception as e:
+            outcome.errors[index] = e
+    return outcome
+
+
+async def write_batch_async(
+    write_fn: Callable[[List[Any]], Awaitable[Any]],
+    records: List[Any],
+) -> BatchOutcome:
+    """
+    Write a batch with a coroutine, retrying its records one by one if it fails.
+
+    Args:
+        write_fn: Coroutine function saving a list of records
+        records: The batch
+
+    Returns:
+        BatchOutcome
+    """
+    outcome = BatchOutcome(size=len(records))
+    try:
+        outcome.calls.append((list(range(len(records))), await write_fn(records)))
+        return outcome
+    except Exception as e:
+        if len(records) == 1:
+            outcome.errors[0] = e
+            return outcome
+        outcome.batch_error = e
+
+    for index, record in enumerate(records):
+        try:
+            outcome.calls.append(([index], await write_fn([record])))
+        except Exception as e:
+            outcome.errors[index] = e
+    return outcome
+
+
+def new_writer_stats(**extra) -> Dict[str, Any]:
+    """Counters reported by a batch writer's get_stats() (plus extra ones)."""
+    stats = {
+        'queued': 0,
+        'written': 0,
+        'failed': 0,
+        'batches': 0,
+        'write_seconds': 0.0,
+        'put_blocked_seconds': 0.0,
+        'last_error': None,
+    }
+    stats.update(extra)
+    return stats
+
+
+def account_batch(
+    stats: Dict[str, Any],
+    outcome: BatchOutcome,
+    seconds: float,
+    name: str,
+    label: str,
+    log: logging.Logger,
+):
+    """
+    Log a written batch's failures and add it to a writer's stats.
+
+    Args:
+        stats: Dict from new_writer_stats() (caller holds its lock, if any)
+        outcome: The written batch
+        seconds: Time spent writing it
+        name: Writer name for the db_write metrics
+        label: Writer name used in log messages
+        log: Logger of the writer module
+    """
+    if outcome.batch_error is not None:
+        log.warning(
+            f"{label}: batch of {outcome.size} failed ({outcome.batch_error}), retrying records individually"
+        )
+    for error in outcome.errors.values():
+        log.error(f"{label}: failed to write record: {error}")
+        stats['last_error'] = str(error)[:200]
+
+    record_items(name, "db_write", outcome.written)
+    stats['written'] += outcome.written
+    stats['failed'] += outcome.failed
+    stats['batches'] += 1
+    stats['write_seconds'] += seconds
+
+
+def sum_counts(outcome: BatchOutcome, count_names: Sequence[str]) -> Dict[str, int]:
+    """
+    Sum the counts returned by a write_fn (e.g. inserted, skipped, updated).
+
+    Args:
+        outcome: The written batch
+        count_names: Names of the counts write_fn returns, in order
+
+    Returns:
+        count name -> total over the batch's write_fn calls
+    """
+    totals = {count_name: 0 for count_name in count_names}
+    for _, counts in outcome.calls:
+        for count_name, value in zip(count_names, counts or ()):
+            totals[count_name] += value
+    return totals
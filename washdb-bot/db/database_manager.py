@@ -5,13 +5,12 @@ Supports both washbot_db (primary) and scraper (SEO intelligence) databases
 """
 
 import os
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
 from typing import Generator, Literal
 from dotenv import load_dotenv
 
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Load environment
@@ -37,22 +36,15 @@ class DatabaseManager:
         self._initialize_engines()
 
     def _initialize_engines(self):
-        """Initialize SQLAlchemy engines for both databases with connection pooling"""
+        """Get the shared engines for both databases from the engine registry"""
         try:
             # Initialize washbot database engine (primary)
             washdb_url = os.getenv("DATABASE_URL")
             if not washdb_url:
                 raise RuntimeError("DATABASE_URL not set in environment")
 
-            self.washdb_engine = create_engine(
-                washdb_url,
-                poolclass=QueuePool,
-                pool_size=10,
-                max_overflow=20,
-                pool_pre_ping=True,  # Verify connections before using
-                pool_recycle=3600,  # Recycle connections after 1 hour
-                echo=False
-            )
+            # The registry sizes the DATABASE_URL engine for this primary load (10 + 20)
+            self.washdb_engine = get_engine(washdb_url)
             self.WashdbSessionLocal = sessionmaker(
                 autocommit=False,
                 autoflush=False,
@@ -63,15 +55,7 @@ class DatabaseManager:
             # Initialize scraper database engine (SEO intelligence)
             scraper_url = os.getenv("SCRAPER_DATABASE_URL")
             if scraper_url:
-                self.scraper_engine = create_engine(
-                    scraper_url,
-                    poolclass=QueuePool,
-                    pool_size=5,
-                    max_overflow=10,
-                    pool_pre_ping=True,
-                    pool_recycle=3600,
-                    echo=False
-                )
+                self.scraper_engine = get_engine(scraper_url)
                 self.ScraperSessionLocal = sessionmaker(
                     autocommit=False,
                     autoflush=False,
@@ -0,0 +1,297 @@
+"""
+Shared SQLAlchemy engines with a process-wide connection budget.
+
+Services used to call create_engine() themselves, each getting a private
+pool (default 5 + 10 overflow). With the SEO modules, workers and the
+dashboard in one process, dozens of mostly idle pools together exceeded
+Postgres max_connections. EngineRegistry hands out one engine per
+database URL instead, created lazily on first use, and sizes the pools
+so their combined capacity (pool_size + max_overflow) stays within
+DB_CONNECTION_BUDGET.
+
+The primary database (DATABASE_URL) carries DatabaseManager's load and
+gets a larger pool. Its capacity is held back from the budget until its
+engine exists, so engines created earlier cannot shrink it.
+
+PgBouncer mode (DB_PGBOUNCER=1) uses NullPool - PgBouncer does the
+pooling - and turns off psycopg's server-side prepared statements, which
+break under transaction pooling.
+
+Environment:
+    DB_CONNECTION_BUDGET  Max connections across all engines (default 50)
+    DB_POOL_SIZE          Persistent connections per engine (default 5)
+    DB_MAX_OVERFLOW       Extra connections per engine under load (default 10)
+    DB_PRIMARY_POOL_SIZE     Persistent connections for DATABASE_URL (default 10)
+    DB_PRIMARY_MAX_OVERFLOW  Extra connections for DATABASE_URL (default 20)
+    DB_POOL_TIMEOUT       Seconds to wait for a free connection (default 30)
+    DB_POOL_RECYCLE       Recycle connections older than this (default 1800)
+    DB_PGBOUNCER          1 = PgBouncer-friendly mode
+
+Usage:
+    from db.engine_registry import get_engine
+
+    engine = get_engine()                      # DATABASE_URL
+    engine = get_engine(os.getenv("SCRAPER_DATABASE_URL"))
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import NullPool, QueuePool
+
+from runner.logging_setup import get_logger
+
+load_dotenv()
+
+logger = get_logger("engine_registry")
+
+DB_CONNECTION_BUDGET = int(os.getenv("DB_CONNECTION_BUDGET", "50"))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_PRIMARY_POOL_SIZE = int(os.getenv("DB_PRIMARY_POOL_SIZE", "10"))
+DB_PRIMARY_MAX_OVERFLOW = int(os.getenv("DB_PRIMARY_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "").lower() in ("1", "true", "yes")
+
+
+class EngineRegistry:
+    """
+    One shared engine per database URL, within a connection budget.
+
+    Engines are created on first request. Each gets up to
+    pool_size + max_overflow connections (primary_pool_size +
+    primary_max_overflow for DATABASE_URL), reduced if the budget does not
+    have that many left (an engine always gets at least one connection).
+    Until the primary engine exists its capacity is reserved, so its size
+    does not depend on which engine is created first. Pool events are
+    counted so get_stats() can report utilization.
+    """
+
+    def __init__(
+        self,
+        budget: int = DB_CONNECTION_BUDGET,
+        pool_size: int = DB_POOL_SIZE,
+        max_overflow: int = DB_MAX_OVERFLOW,
+        primary_pool_size: int = DB_PRIMARY_POOL_SIZE,
+        primary_max_overflow: int = DB_PRIMARY_MAX_OVERFLOW,
+        pool_timeout: int = DB_POOL_TIMEOUT,
+        pool_recycle: int = DB_POOL_RECYCLE,
+        pgbouncer: bool = DB_PGBOUNCER,
+    ):
+        """
+        Args:
+            budget: Max connections across all engines
+            pool_size: Persistent connections per engine
+            max_overflow: Extra connections per engine under load
+            primary_pool_size: Persistent connections for DATABASE_URL
+            primary_max_overflow: Extra connections for DATABASE_URL
+            pool_timeout: Seconds to wait for a free connection
+            pool_recycle: Recycle connections older than this (seconds)
+            pgbouncer: Use NullPool and no prepared statements
+        """
+        self.budget = budget
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.primary_pool_size = primary_pool_size
+        self.primary_max_overflow = primary_max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pgbouncer = pgbouncer
+
+        self._lock = threading.Lock()
+        self._engines: Dict[str, Engine] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._allocated = 0
+        self._pid = os.getpid()
+
+    def get_engine(self, url: Optional[str] = None) -> Engine:
+        """
+        Get the shared engine for a database URL.
+
+        Args:
+            url: Database URL (default DATABASE_URL)
+
+        Returns:
+            SQLAlchemy Engine shared by every caller using this URL
+
+        Raises:
+            RuntimeError: If no URL is given and DATABASE_URL is not set
+        """
+        url = url or os.getenv("DATABASE_URL")
+        if not url:
+            raise RuntimeError("DATABASE_URL not set in environment")
+
+        with self._lock:
+            self._check_fork()
+            engine = self._engines.get(url)
+            if engine is None:
+                engine = self._create_engine(url)
+                self._engines[url] = engine
+            return engine
+
+    def _create_engine(self, url: str) -> Engine:
+        """Create an engine sized to the remaining budget (lock held)."""
+        name = make_url(url).render_as_string(hide_password=True)
+        stats = {
+            'name': name,
+            'capacity': 0,
+            'pool_size': 0,
+            'checkouts': 0,
+            'connects': 0,
+            'checked_out': 0,
+            'peak_checked_out': 0,
+        }
+
+        if self.pgbouncer:
+            kwargs: Dict[str, Any] = {'poolclass': NullPool}
+            if make_url(url).get_driver_name() == "psycopg":
+                # Prepared statements don't survive transaction pooling
+                kwargs['connect_args'] = {'prepare_threshold': None}
+            stats['mode'] = 'pgbouncer'
+        else:
+            primary_url = os.getenv("DATABASE_URL")
+            primary_capacity = self.primary_pool_size + self.primary_max_overflow
+            available = self.budget - self._allocated
+            if url == primary_url:
+                wanted, pool_size = primary_capacity, self.primary_pool_size
+            else:
+                wanted, pool_size = self.pool_size + self.max_overflow, self.pool_size
+                if primary_url and primary_url not in self._engines:
+                    # Keep the primary engine's share for when it is created
+                    available -= primary_capacity
+            capacity = min(wanted, available)
+            if capacity < wanted:
+                logger.warning(
+                    f"Connection budget ({self.budget}) limits {name} to "
+                    f"{max(capacity, 1)} connections (wanted {wanted})"
+                )
+            capacity = max(capacity, 1)
+            pool_size = min(pool_size, capacity)
+            self._allocated += capacity
+
+            kwargs = {
+                'poolclass': QueuePool,
+                'pool_size': pool_size,
+                'max_overflow': capacity - pool_size,
+                'pool_timeout': self.pool_timeout,
+                'pool_recycle': self.pool_recycle,
+                'pool_pre_ping': True,
+            }
+            stats.update(mode='pooled', capacity=capacity, pool_size=pool_size)
+
+        engine = create_engine(url, echo=False, **kwargs)
+        self._track(engine, stats)
+        self._stats[url] = stats
+
+        logger.info(
+            f"Engine created for {name} ({stats['mode']}, capacity={stats['capacity'] or 'unpooled'}, "
+            f"budget used {self._allocated}/{self.budget})"
+        )
+        return engine
+
+    def _track(self, engine: Engine, stats: Dict[str, Any]):
+        """Count connects and checkouts/checkins on an engine's pool."""
+        lock = threading.Lock()
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            with lock:
+                stats['connects'] += 1
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            with lock:
+                stats['checkouts'] += 1
+                stats['checked_out'] += 1
+                stats['peak_checked_out'] = max(stats['peak_checked_out'], stats['checked_out'])
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            with lock:
+                stats['checked_out'] = max(0, stats['checked_out'] - 1)
+
+    def _check_fork(self):
+        """Drop inherited engines in a forked child (lock held)."""
+        if os.getpid() == self._pid:
+            return
+        for engine in self._engines.values():
+            # Leave the parent's connections open for the parent
+            engine.dispose(close=False)
+        self._engines.clear()
+        self._stats.clear()
+        self._allocated = 0
+        self._pid = os.getpid()
+
+    def dispose_all(self):
+        """Close every engine's pooled connections (engines stay usable)."""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool utilization for all engines.
+
+        Returns:
+            dict: Budget, connections allocated and in use, and per engine
+            its capacity, checked-out/idle connections, peak usage,
+            checkout and connect counts and utilization (0-1)
+        """
+        with self._lock:
+            engines = []
+            in_use = 0
+            for url, engine in self._engines.items():
+                stats = dict(self._stats[url])
+                pool = engine.pool
+                if isinstance(pool, QueuePool):
+                    stats['checked_out'] = pool.checkedout()
+                    stats['idle'] = pool.checkedin()
+                    stats['overflow'] = max(0, pool.overflow())
+                stats['utilization'] = (
+                    round(stats['checked_out'] / stats['capacity'], 3) if stats['capacity'] else None
+                )
+                in_use += stats['checked_out']
+                engines.append(stats)
+
+            return {
+                'budget': self.budget,
+                'allocated': self._allocated,
+                'in_use': in_use,
+                'pgbouncer': self.pgbouncer,
+                'engines': engines,
+            }
+
+
+# Global instance
+_engine_registry: Optional[EngineRegistry] = None
+_engine_registry_lock = threading.Lock()
+
+
+def get_engine_registry() -> EngineRegistry:
+    """Get the global EngineRegistry instance."""
+    global _engine_registry
+
+    if _engine_registry is None:
+        with _engine_registry_lock:
+            if _engine_registry is None:
+                _engine_registry = EngineRegistry()
+
+    return _engine_registry
+
+
+def get_engine(url: Optional[str] = None) -> Engine:
+    """
+    Get the shared engine for a database URL.
+
+    Args:
+        url: Database URL (default DATABASE_URL)
+
+    Returns:
+        Shared SQLAlchemy Engine
+    """
+    return get_engine_registry().get_engine(url)
@@ -0,0 +1,55 @@
+-- ============================================================================
+-- Migration 031: Content Topic Index
+-- ============================================================================
+-- Persistent inverted index for content gap analysis:
+-- - content_index_pages: one row per indexed competitor URL (latest snapshot)
+--   with its content hash, so unchanged pages are never re-analyzed
+-- - content_topic_index: topic -> (competitor, URL) postings with coverage
+--
+-- Maintained incrementally by CompetitorCrawler._save_page. Gap analysis
+-- reads postings instead of re-extracting topics from raw page content.
+-- ============================================================================
+
+-- Track this migration
+INSERT INTO schema_migrations (version, name, applied_at)
+VALUES ('031', 'add_content_topic_index', NOW())
+ON CONFLICT (version) DO NOTHING;
+
+-- ============================================================================
+-- INDEXED PAGES
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS content_index_pages (
+    competitor_id INTEGER NOT NULL REFERENCES competitors(competitor_id) ON DELETE CASCADE,
+    url TEXT NOT NULL,
+    page_id INTEGER REFERENCES competitor_pages(page_id) ON DELETE SET NULL,
+    content_hash VARCHAR(64) NOT NULL,
+    word_count INTEGER DEFAULT 0,
+    formats TEXT[] DEFAULT '{}',
+    indexed_at TIMESTAMP DEFAULT NOW() NOT NULL,
+
+    PRIMARY KEY (competitor_id, url)
+);
+
+COMMENT ON TABLE content_index_pages IS 'Latest indexed snapshot per competitor URL (topic index bookkeeping)';
+COMMENT ON COLUMN content_index_pages.formats IS 'Detected content formats: faq, how_to, listicle, comparison, review, case_study';
+
+-- ============================================================================
+-- TOPIC POSTINGS
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS content_topic_index (
+    topic VARCHAR(255) NOT NULL,
+    competitor_id INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    coverage_score DECIMAL(5,2) DEFAULT 0,
+
+    PRIMARY KEY (topic, competitor_id, url),
+    FOREIGN KEY (competitor_id, url)
+        REFERENCES content_index_pages(competitor_id, url) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_content_topic_index_page
+    ON content_topic_index(competitor_id, url);
+
+COMMENT ON TABLE content_topic_index IS 'Inverted index: topic -> competitor pages covering it, with coverage score (0-100)';
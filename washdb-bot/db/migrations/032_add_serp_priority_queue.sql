@@ -0,0 +1,293 @@
+-- ============================================================================
+-- Migration 032: SERP Priority Queue
+-- ============================================================================
+-- Materializes the SERP scraping priority of every verified company so that
+-- workers pop batches with an index scan instead of re-scoring all verified
+-- companies (with a LIKE subquery over serp_snapshots per company) per batch.
+--
+-- - serp_priority_queue: one row per verified company with a website,
+--   its priority tier, last SERP scrape and claim lease
+-- - Triggers keep it current when verification/profile fields change on
+--   companies
+-- - New serp_snapshots are queued by an insert trigger and matched to
+--   companies in batches by serp_priority_queue_sync_snapshots() (called by
+--   SerpPriorityQueue before claiming), not per insert: the name match
+--   cannot use an index
+-- - priority_expires_at marks when staleness moves a row to another tier;
+--   SerpPriorityQueue re-scores only those rows before claiming
+--
+-- Priority tiers (serp_priority() is the only implementation):
+--   1 CRITICAL  never scraped, high-value services
+--   2 HIGH      never scraped, or high-value and >60 days old
+--   3 MEDIUM    high-value 31-60 days, or other >60 days
+--   4 LOW       14-60 days
+--   5 SKIP      scraped within 14 days
+-- ============================================================================
+
+-- Track this migration
+INSERT INTO schema_migrations (version, name, applied_at)
+VALUES ('032', 'add_serp_priority_queue', NOW())
+ON CONFLICT (version) DO NOTHING;
+
+-- ============================================================================
+-- QUEUE TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS serp_priority_queue (
+    company_id INTEGER PRIMARY KEY REFERENCES companies(id) ON DELETE CASCADE,
+    is_high_value BOOLEAN NOT NULL DEFAULT FALSE,
+    has_complete_profile BOOLEAN NOT NULL DEFAULT FALSE,
+    last_scraped TIMESTAMP,
+    priority SMALLINT NOT NULL DEFAULT 2,
+    priority_expires_at TIMESTAMP,
+    claimed_by VARCHAR(100),
+    claimed_until TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+-- Pop order: tier, never scraped first, oldest scrape, id
+CREATE INDEX IF NOT EXISTS idx_serp_priority_queue_order
+    ON serp_priority_queue(priority, last_scraped NULLS FIRST, company_id);
+
+-- Rows whose tier changes with time
+CREATE INDEX IF NOT EXISTS idx_serp_priority_queue_expires
+    ON serp_priority_queue(priority_expires_at)
+    WHERE priority_expires_at IS NOT NULL;
+
+COMMENT ON TABLE serp_priority_queue IS 'Materialized SERP scraping priority per verified company (maintained by triggers)';
+COMMENT ON COLUMN serp_priority_queue.priority_expires_at IS 'When the priority tier changes due to staleness (NULL = final tier)';
+COMMENT ON COLUMN serp_priority_queue.claimed_until IS 'Claim lease; expired claims are reclaimable by other workers';
+
+-- ============================================================================
+-- SCORING FUNCTIONS
+-- ============================================================================
+
+-- Keep in sync with SerpPriorityQueue.HIGH_VALUE_SERVICES
+CREATE OR REPLACE FUNCTION serp_is_high_value(metadata JSONB)
+RETURNS BOOLEAN AS $$
+    SELECT COALESCE(bool_or(lower(service) LIKE ANY (ARRAY[
+        '%pressure_washing%', '%power_washing%',
+        '%window_cleaning%', '%commercial_cleaning%',
+        '%soft_washing%', '%roof_cleaning%'
+    ])), FALSE)
+    FROM jsonb_array_elements_text(
+        CASE
+            WHEN jsonb_typeof(metadata->'verification'->'llm_classification'->'services') = 'array'
+            THEN metadata->'verification'->'llm_classification'->'services'
+            ELSE '[]'::jsonb
+        END
+    ) AS service;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION serp_priority(last_scraped TIMESTAMP, is_high_value BOOLEAN)
+RETURNS SMALLINT AS $$
+    SELECT (CASE
+        WHEN last_scraped IS NULL THEN CASE WHEN is_high_value THEN 1 ELSE 2 END
+        WHEN NOW() - last_scraped < INTERVAL '14 days' THEN 5
+        WHEN NOW() - last_scraped >= INTERVAL '61 days' THEN CASE WHEN is_high_value THEN 2 ELSE 3 END
+        WHEN NOW() - last_scraped >= INTERVAL '31 days' THEN CASE WHEN is_high_value THEN 3 ELSE 4 END
+        ELSE 4
+    END)::SMALLINT;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION serp_priority_expires_at(last_scraped TIMESTAMP)
+RETURNS TIMESTAMP AS $$
+    SELECT CASE
+        WHEN last_scraped IS NULL THEN NULL
+        WHEN NOW() - last_scraped < INTERVAL '14 days' THEN last_scraped + INTERVAL '14 days'
+        WHEN NOW() - last_scraped < INTERVAL '31 days' THEN last_scraped + INTERVAL '31 days'
+        WHEN NOW() - last_scraped < INTERVAL '61 days' THEN last_scraped + INTERVAL '61 days'
+        ELSE NULL
+    END;
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================================
+-- TRIGGERS
+-- ============================================================================
+
+-- Verification/profile changes on companies
+CREATE OR REPLACE FUNCTION serp_priority_queue_sync_company()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.verified IS TRUE AND NEW.website IS NOT NULL THEN
+        INSERT INTO serp_priority_queue (
+            company_id, is_high_value, has_complete_profile,
+            priority, priority_expires_at, updated_at
+        ) VALUES (
+            NEW.id,
+            serp_is_high_value(NEW.parse_metadata),
+            NEW.name IS NOT NULL AND (NEW.parse_metadata->>'services_text') IS NOT NULL,
+            serp_priority(NULL, serp_is_high_value(NEW.parse_metadata)),
+            NULL,
+            NOW()
+        )
+        ON CONFLICT (company_id) DO UPDATE SET
+            is_high_value = EXCLUDED.is_high_value,
+            has_complete_profile = EXCLUDED.has_complete_profile,
+            priority = serp_priority(serp_priority_queue.last_scraped, EXCLUDED.is_high_value),
+            priority_expires_at = serp_priority_expires_at(serp_priority_queue.last_scraped),
+            updated_at = NOW();
+    ELSE
+        DELETE FROM serp_priority_queue WHERE company_id = NEW.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_serp_priority_queue_company ON companies;
+CREATE TRIGGER trg_serp_priority_queue_company
+    AFTER INSERT ON companies
+    FOR EACH ROW
+    EXECUTE FUNCTION serp_priority_queue_sync_company();
+
+-- parse_metadata is rewritten on every parse; only re-sync when a field the
+-- queue actually stores (or its eligibility) changed
+DROP TRIGGER IF EXISTS trg_serp_priority_queue_company_update ON companies;
+CREATE TRIGGER trg_serp_priority_queue_company_update
+    AFTER UPDATE OF verified, website, name, parse_metadata ON companies
+    FOR EACH ROW
+    WHEN (
+        OLD.verified IS DISTINCT FROM NEW.verified
+        OR (OLD.website IS NULL) IS DISTINCT FROM (NEW.website IS NULL)
+        OR (OLD.name IS NULL) IS DISTINCT FROM (NEW.name IS NULL)
+        OR (OLD.parse_metadata->>'services_text' IS NULL)
+            IS DISTINCT FROM (NEW.parse_metadata->>'services_text' IS NULL)
+        OR OLD.parse_metadata->'verification'->'llm_classification'->'services'
+            IS DISTINCT FROM NEW.parse_metadata->'verification'->'llm_classification'->'services'
+    )
+    EXECUTE FUNCTION serp_priority_queue_sync_company();
+
+-- New SERP snapshots (same company match as the original scoring query).
+-- Matching a query against company names is a scan of companies, so it is
+-- not done per inserted snapshot: the insert trigger only queues the snapshot
+-- in serp_priority_queue_pending, and serp_priority_queue_sync_snapshots()
+-- matches queued snapshots in batches. A queued row becomes visible exactly
+-- when its snapshot commits, so snapshots committing out of ID order are not
+-- skipped (a snapshot_id watermark would skip them). Only one caller syncs at
+-- a time; the others skip.
+CREATE TABLE IF NOT EXISTS serp_priority_queue_pending (
+    snapshot_id INTEGER PRIMARY KEY,
+    query_id INTEGER NOT NULL,
+    captured_at TIMESTAMP NOT NULL
+);
+
+COMMENT ON TABLE serp_priority_queue_pending IS 'serp_snapshots not yet applied to serp_priority_queue';
+
+-- Single row locked by the running sync
+CREATE TABLE IF NOT EXISTS serp_priority_queue_sync (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    synced_at TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+COMMENT ON TABLE serp_priority_queue_sync IS 'Lock row and last run of serp_priority_queue_sync_snapshots()';
+
+CREATE OR REPLACE FUNCTION serp_priority_queue_queue_snapshot()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO serp_priority_queue_pending (snapshot_id, query_id, captured_at)
+    VALUES (NEW.snapshot_id, NEW.query_id, NEW.captured_at)
+    ON CONFLICT (snapshot_id) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_serp_priority_queue_snapshot ON serp_snapshots;
+DROP FUNCTION IF EXISTS serp_priority_queue_on_snapshot();
+
+DROP TRIGGER IF EXISTS trg_serp_priority_queue_snapshot_pending ON serp_snapshots;
+CREATE TRIGGER trg_serp_priority_queue_snapshot_pending
+    AFTER INSERT ON serp_snapshots
+    FOR EACH ROW
+    WHEN (NEW.captured_at IS NOT NULL)
+    EXECUTE FUNCTION serp_priority_queue_queue_snapshot();
+
+-- Applies up to 5000 queued snapshots per call
+CREATE OR REPLACE FUNCTION serp_priority_queue_sync_snapshots()
+RETURNS INTEGER AS $$
+DECLARE
+    v_updated INTEGER;
+BEGIN
+    PERFORM 1
+    FROM serp_priority_queue_sync
+    WHERE id = 1
+    FOR UPDATE SKIP LOCKED;
+
+    IF NOT FOUND THEN
+        RETURN 0;
+    END IF;
+
+    WITH taken AS (
+        DELETE FROM serp_priority_queue_pending
+        WHERE snapshot_id IN (
+            SELECT snapshot_id
+            FROM serp_priority_queue_pending
+            ORDER BY snapshot_id
+            LIMIT 5000
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING query_id, captured_at
+    ), new_queries AS (
+        SELECT query_id, MAX(captured_at) AS captured_at
+        FROM taken
+        GROUP BY query_id
+    ), matched AS (
+        SELECT c.id AS company_id, MAX(nq.captured_at) AS captured_at
+        FROM new_queries nq
+        JOIN search_queries sq ON sq.query_id = nq.query_id
+        JOIN companies c ON sq.query_text LIKE '%' || c.name || '%'
+        GROUP BY c.id
+    )
+    UPDATE serp_priority_queue q
+    SET last_scraped = m.captured_at,
+        priority = serp_priority(m.captured_at, q.is_high_value),
+        priority_expires_at = serp_priority_expires_at(m.captured_at),
+        updated_at = NOW()
+    FROM matched m
+    WHERE q.company_id = m.company_id
+      AND (q.last_scraped IS NULL OR q.last_scraped < m.captured_at);
+
+    GET DIAGNOSTICS v_updated = ROW_COUNT;
+
+    UPDATE serp_priority_queue_sync
+    SET synced_at = NOW()
+    WHERE id = 1;
+
+    RETURN v_updated;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- BACKFILL
+-- ============================================================================
+
+INSERT INTO serp_priority_queue (
+    company_id, is_high_value, has_complete_profile, last_scraped,
+    priority, priority_expires_at
+)
+SELECT
+    s.company_id,
+    s.is_high_value,
+    s.has_complete_profile,
+    s.last_scraped,
+    serp_priority(s.last_scraped, s.is_high_value),
+    serp_priority_expires_at(s.last_scraped)
+FROM (
+    SELECT
+        c.id AS company_id,
+        serp_is_high_value(c.parse_metadata) AS is_high_value,
+        c.name IS NOT NULL AND (c.parse_metadata->>'services_text') IS NOT NULL AS has_complete_profile,
+        (
+            SELECT MAX(ss.captured_at)
+            FROM serp_snapshots ss
+            JOIN search_queries sq ON sq.query_id = ss.query_id
+            WHERE sq.query_text LIKE '%' || c.name || '%'
+        ) AS last_scraped
+    FROM companies c
+    WHERE c.verified = true
+      AND c.website IS NOT NULL
+) s
+ON CONFLICT (company_id) DO NOTHING;
+
+-- Snapshots up to now are covered by the backfill; later ones are queued
+INSERT INTO serp_priority_queue_sync (id) VALUES (1)
+ON CONFLICT (id) DO NOTHING;
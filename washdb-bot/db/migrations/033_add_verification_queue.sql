@@ -0,0 +1,99 @@
+-- ============================================================================
+-- Migration 033: Verification Work Queue
+-- ============================================================================
+-- Slim queue of companies awaiting website verification.
+--
+-- Verification workers previously claimed work straight from companies with
+--   parse_metadata->'verification'->>'status' IS NULL
+--   ORDER BY created_at DESC FOR UPDATE SKIP LOCKED LIMIT 1
+-- which no index can serve, so every claim scanned companies. Workers now
+-- claim batches from verification_queue via a partial index on pending rows.
+--
+-- - Rows are added by a trigger when a company with a website has no
+--   verification status (insert, re-discovery, or status reset); the db
+--   layer does not enqueue explicitly
+-- - Rows are removed by the same trigger once a final status is written
+-- - Claims carry a lease; expired in_progress claims are reaped back to
+--   pending (verification/verification_queue.reap_stale_claims)
+-- ============================================================================
+
+-- Track this migration
+INSERT INTO schema_migrations (version, name, applied_at)
+VALUES ('033', 'add_verification_queue', NOW())
+ON CONFLICT (version) DO NOTHING;
+
+-- ============================================================================
+-- QUEUE TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS verification_queue (
+    company_id INTEGER PRIMARY KEY REFERENCES companies(id) ON DELETE CASCADE,
+    created_at TIMESTAMP,                     -- companies.created_at (claim order)
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    worker_id INTEGER,
+    claimed_at TIMESTAMP,
+    lease_expires_at TIMESTAMP,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at TIMESTAMP DEFAULT NOW() NOT NULL,
+
+    CONSTRAINT verification_queue_status_check CHECK (status IN ('pending', 'in_progress'))
+);
+
+-- Claim order for pending work
+CREATE INDEX IF NOT EXISTS idx_verification_queue_pending
+    ON verification_queue(created_at DESC NULLS LAST)
+    WHERE status = 'pending';
+
+-- Reaper lookup for expired leases
+CREATE INDEX IF NOT EXISTS idx_verification_queue_lease
+    ON verification_queue(lease_expires_at)
+    WHERE status = 'in_progress';
+
+COMMENT ON TABLE verification_queue IS 'Companies awaiting website verification (claimed with FOR UPDATE SKIP LOCKED)';
+COMMENT ON COLUMN verification_queue.lease_expires_at IS 'in_progress claims past this time are returned to pending by the reaper';
+
+-- ============================================================================
+-- TRIGGER: keep queue in sync with companies
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION verification_queue_sync_company()
+RETURNS TRIGGER AS $$
+DECLARE
+    verification_status TEXT := NEW.parse_metadata->'verification'->>'status';
+BEGIN
+    IF NEW.website IS NOT NULL AND verification_status IS NULL THEN
+        INSERT INTO verification_queue (company_id, created_at)
+        VALUES (NEW.id, NEW.created_at)
+        ON CONFLICT (company_id) DO NOTHING;
+    ELSIF NEW.website IS NULL OR verification_status <> 'in_progress' THEN
+        DELETE FROM verification_queue WHERE company_id = NEW.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_verification_queue_company ON companies;
+CREATE TRIGGER trg_verification_queue_company
+    AFTER INSERT OR UPDATE OF parse_metadata, website ON companies
+    FOR EACH ROW
+    EXECUTE FUNCTION verification_queue_sync_company();
+
+-- ============================================================================
+-- BACKFILL
+-- ============================================================================
+
+-- Unverified companies
+INSERT INTO verification_queue (company_id, created_at)
+SELECT id, created_at
+FROM companies
+WHERE website IS NOT NULL
+  AND (parse_metadata->'verification'->>'status') IS NULL
+ON CONFLICT (company_id) DO NOTHING;
+
+-- Companies left in_progress by the previous claim logic (reclaimed by the reaper)
+INSERT INTO verification_queue (company_id, created_at, status, claimed_at, lease_expires_at)
+SELECT id, created_at, 'in_progress', NOW(), NOW()
+FROM companies
+WHERE website IS NOT NULL
+  AND (parse_metadata->'verification'->>'status') = 'in_progress'
+ON CONFLICT (company_id) DO NOTHING;
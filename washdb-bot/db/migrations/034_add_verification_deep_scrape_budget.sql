@@ -0,0 +1,22 @@
+-- ============================================================================
+-- Migration 034: Verification Deep Scrape Budget
+-- ============================================================================
+-- Hourly deep-scrape counter shared by all verification workers.
+--
+-- MAX_DEEP_SCRAPES_PER_HOUR was enforced with per-process globals, so a pool
+-- of N workers could run N times the intended number of multi-page scrapes.
+-- Workers now reserve a deep scrape with a single atomic upsert on the row
+-- for the current hour (verification_worker.reserve_deep_scrape).
+-- ============================================================================
+
+-- Track this migration
+INSERT INTO schema_migrations (version, name, applied_at)
+VALUES ('034', 'add_verification_deep_scrape_budget', NOW())
+ON CONFLICT (version) DO NOTHING;
+
+CREATE TABLE IF NOT EXISTS verification_deep_scrape_budget (
+    hour_start TIMESTAMP PRIMARY KEY,         -- date_trunc('hour', NOW())
+    used INTEGER NOT NULL DEFAULT 0
+);
+
+COMMENT ON TABLE verification_deep_scrape_budget IS 'Deep scrapes reserved per hour across all verification workers';
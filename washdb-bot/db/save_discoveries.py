@@ -12,10 +12,11 @@ import re
 from typing import Optional
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from db.models import Base, Company, BusinessSource, canonicalize_url, domain_from_url
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 
@@ -357,7 +358,7 @@ def create_session() -> Session:
     if not database_url:
         raise RuntimeError("DATABASE_URL not set in environment")
 
-    engine = create_engine(database_url, echo=False)
+    engine = get_engine(database_url)
     return Session(engine)
 
 
@@ -16,10 +16,12 @@ load_dotenv(Path(__file__).parent.parent / '.env')
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from nicegui import ui, app
+from starlette.responses import PlainTextResponse
 from niceui.theme import apply_theme
 from niceui.layout import layout
 from niceui.router import router
 from niceui import pages
+from runner.metrics import get_metrics_collector
 
 import logging
 
@@ -71,11 +73,22 @@ def create_app():
         3. Register all page routes
         4. Setup main layout (navbar + content area)
         5. Load default dashboard page
+
+    The dashboard process also runs the metrics collector that crawler
+    workers report stage timings to, and serves them at /metrics.
     """
     # Add static files directory
     static_dir = Path(__file__).parent / 'static'
     app.add_static_files('/static', str(static_dir))
 
+    # Collect worker metrics and expose them for Prometheus
+    collector = get_metrics_collector()
+    collector.start()
+
+    @app.get('/metrics')
+    def metrics_endpoint():
+        return PlainTextResponse(collector.render(), media_type='text/plain; version=0.0.4')
+
     # Apply theme
     apply_theme()
 
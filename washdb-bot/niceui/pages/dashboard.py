@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from nicegui import ui
 from ..backend_facade import backend
 from ..widgets.kpi import create_kpi_card
+from ..widgets.stage_metrics import stage_metrics_card
 from ..theme import COLORS
 from .verification import verification_state, get_verification_stats
 from ..utils.system_temps import get_system_temps, format_temp, get_temp_color
@@ -421,6 +422,26 @@ def build_discovery_status_cards(status_container):
                             ui.label('Browsers:').classes('text-xs text-gray-300')
                             ui.label(f'{browsers} (~{bp.get("estimated_memory_gb", 0):.1f} GB)').classes('text-sm font-bold text-blue-400')
 
+                    # UC driver pool (SEO scrapers)
+                    dp = comp_mem.get('uc_driver_pool', {})
+                    if 'error' not in dp and dp.get('active_drivers'):
+                        with ui.row().classes('items-center gap-2'):
+                            ui.label('UC drivers:').classes('text-xs text-gray-300')
+                            ui.label(
+                                f'{dp.get("active_drivers", 0)} ({dp.get("idle_drivers", 0)} idle, '
+                                f'{dp.get("reuse_rate_pct", 0):.0f}% reused)'
+                            ).classes('text-sm font-bold text-blue-400')
+
+                    # Shared DB engines (connection budget)
+                    dbp = comp_mem.get('db_pool', {})
+                    if 'error' not in dbp and dbp.get('engines'):
+                        with ui.row().classes('items-center gap-2'):
+                            ui.label('DB connections:').classes('text-xs text-gray-300')
+                            ui.label(
+                                f'{dbp.get("checked_out", 0)} in use / {dbp.get("allocated", 0)} '
+                                f'of {dbp.get("budget", 0)} budget'
+                            ).classes('text-sm font-bold text-blue-400')
+
                     # HTML cache
                     hc = comp_mem.get('html_cache', {})
                     if 'error' not in hc:
@@ -472,6 +493,9 @@ def dashboard_page():
                 create_kpi_card('Updated (30d)', kpis['updated_30d'], 'update', 'warning')
                 create_kpi_card('New (7d)', kpis['new_7d'], 'fiber_new', 'accent')
 
+            # Where crawler time goes (fetch / wait / parse / filter / db_write / llm_call)
+            stage_metrics_card(refresh_interval=5.0)
+
         # DISCOVERY TAB
         with ui.tab_panel(discovery_tab):
             ui.label('Discovery Metrics').classes('text-2xl font-bold mb-4')
@@ -33,7 +33,8 @@ diagnostics_state = DiagnosticsState()
 def check_database():
     """Check PostgreSQL database connectivity."""
     try:
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
+        from db.engine_registry import get_engine
 
         db_url = os.getenv('DATABASE_URL')
 
@@ -45,7 +46,7 @@ def check_database():
             }
 
         # Try to connect
-        engine = create_engine(db_url, pool_pre_ping=True)
+        engine = get_engine(db_url)
         with engine.connect() as conn:
             # Test query
             result = conn.execute(text("SELECT version()"))
@@ -62,8 +63,6 @@ def check_database():
             companies_result = conn.execute(text("SELECT COUNT(*) FROM companies"))
             companies_count = companies_result.scalar()
 
-        engine.dispose()
-
         return {
             'status': 'success',
             'message': 'Database connected successfully',
@@ -245,12 +245,12 @@ async def get_yp_target_stats(states):
     """Get statistics about Yellow Pages targets for the selected states."""
     try:
         from db.models import YPTarget
-        from sqlalchemy import create_engine
         from sqlalchemy.orm import sessionmaker
+        from db.engine_registry import get_engine
         from dotenv import load_dotenv
         load_dotenv()
 
-        engine = create_engine(os.getenv('DATABASE_URL'))
+        engine = get_engine(os.getenv('DATABASE_URL'))
         Session = sessionmaker(bind=engine)
         session = Session()
 
@@ -291,12 +291,12 @@ async def get_yelp_target_stats(states):
     """Get statistics about Yelp targets for the selected states."""
     try:
         from db.models import YelpTarget
-        from sqlalchemy import create_engine
         from sqlalchemy.orm import sessionmaker
+        from db.engine_registry import get_engine
         from dotenv import load_dotenv
         load_dotenv()
 
-        engine = create_engine(os.getenv('DATABASE_URL'))
+        engine = get_engine(os.getenv('DATABASE_URL'))
         Session = sessionmaker(bind=engine)
         session = Session()
 
@@ -30,15 +30,15 @@ run_history_state = RunHistoryState()
 def get_run_history(limit=100):
     """Fetch run history from job_execution_logs table."""
     try:
-        from sqlalchemy import create_engine
         from sqlalchemy.orm import sessionmaker
+        from db.engine_registry import get_engine
         import os
 
         db_url = os.getenv('DATABASE_URL')
         if not db_url:
             return []
 
-        engine = create_engine(db_url)
+        engine = get_engine(db_url)
         Session = sessionmaker(bind=engine)
         session = Session()
 
@@ -108,15 +108,16 @@ def get_run_history(limit=100):
 def get_summary_stats():
     """Get summary statistics for all runs."""
     try:
-        from sqlalchemy import create_engine, func
+        from sqlalchemy import func
         from sqlalchemy.orm import sessionmaker
+        from db.engine_registry import get_engine
         import os
 
         db_url = os.getenv('DATABASE_URL')
         if not db_url:
             return {}
 
-        engine = create_engine(db_url)
+        engine = get_engine(db_url)
         Session = sessionmaker(bind=engine)
         session = Session()
 
@@ -191,8 +192,8 @@ def apply_filters():
 def show_run_details(run_id):
     """Show detailed information for a specific run."""
     try:
-        from sqlalchemy import create_engine
         from sqlalchemy.orm import sessionmaker
+        from db.engine_registry import get_engine
         import os
 
         db_url = os.getenv('DATABASE_URL')
@@ -200,7 +201,7 @@ def show_run_details(run_id):
             ui.notify('Database not configured', type='warning')
             return
 
-        engine = create_engine(db_url)
+        engine = get_engine(db_url)
         Session = sessionmaker(bind=engine)
         session = Session()
 
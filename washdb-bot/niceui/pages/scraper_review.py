@@ -12,7 +12,8 @@ Reuses patterns from seo_intelligence.py for consistency.
 """
 
 from nicegui import ui
-from sqlalchemy import text, create_engine
+from sqlalchemy import text
+from db.engine_registry import get_engine
 from datetime import datetime, timedelta
 import os
 from typing import List, Dict, Optional
@@ -39,7 +40,7 @@ class ScraperReviewDashboard:
         """Get database connection."""
         if not DATABASE_URL:
             return None
-        engine = create_engine(DATABASE_URL)
+        engine = get_engine(DATABASE_URL)
         return engine.connect()
 
     # ========== Run History Queries ==========
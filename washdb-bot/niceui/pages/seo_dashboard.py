@@ -37,8 +37,9 @@ from niceui.widgets.citation_monitor import citation_monitor_widget
 
 # Database imports for SEO insights
 try:
-    from sqlalchemy import create_engine, text
+    from sqlalchemy import text
     from sqlalchemy.orm import Session
+    from db.engine_registry import get_engine
     DB_AVAILABLE = True
 except ImportError:
     DB_AVAILABLE = False
@@ -75,7 +76,7 @@ def get_db_engine():
     if _db_engine is None and DB_AVAILABLE:
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            _db_engine = create_engine(database_url, echo=False)
+            _db_engine = get_engine(database_url)
     return _db_engine
 
 
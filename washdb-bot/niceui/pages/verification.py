@@ -21,8 +21,9 @@ from pathlib import Path
 from ..backend_facade import backend
 from ..widgets.live_log_viewer import LiveLogViewer
 from ..utils.subprocess_runner import SubprocessRunner
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
+from db.engine_registry import get_engine
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -68,7 +69,7 @@ verification_state = VerificationState()
 
 def get_db_session():
     """Get database session for querying companies."""
-    engine = create_engine(os.getenv('DATABASE_URL'))
+    engine = get_engine(os.getenv('DATABASE_URL'))
     Session = sessionmaker(bind=engine)
     return Session()
 
@@ -475,20 +475,24 @@ class SEOBackend:
         try:
             manager = get_change_manager()
 
-            # Create change proposals for recommendations
-            for rec in result.recommendations[:3]:
-                change_id = manager.propose_change(
-                    change_type="seo_recommendation",
-                    entity_type="company",
-                    entity_id=result.source_id,
-                    proposed_value={"recommendation": rec},
-                    current_value={"score": result.score},
-                    reason=f"SEO {result.analysis_type} recommendation for {result.source_name}",
-                    priority="medium" if result.score >= 60 else "high",
-                    source="seo_intelligence",
-                )
+            # Create change proposals for recommendations (one batch)
+            recommendations = result.recommendations[:3]
+            change_ids = manager.propose_changes([
+                {
+                    "change_type": "seo_recommendation",
+                    "entity_type": "company",
+                    "entity_id": result.source_id,
+                    "proposed_value": {"recommendation": rec},
+                    "current_value": {"score": result.score},
+                    "reason": f"SEO {result.analysis_type} recommendation for {result.source_name}",
+                    "priority": "medium" if result.score >= 60 else "high",
+                    "source": "seo_intelligence",
+                }
+                for rec in recommendations
+            ])
 
-                if progress_callback and change_id:
+            if progress_callback:
+                for rec, _change_id in zip(recommendations, change_ids):
                     progress_callback(f"[CHANGE] Proposed: {rec[:50]}...")
 
             return True
@@ -17,8 +17,9 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 
 from nicegui import ui, app
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
+from db.engine_registry import get_engine
 
 
 class CitationMonitor:
@@ -34,7 +35,7 @@ class CitationMonitor:
 
         # Database
         database_url = os.getenv("DATABASE_URL")
-        self.engine = create_engine(database_url, echo=False) if database_url else None
+        self.engine = get_engine(database_url) if database_url else None
 
         # Directory definitions (should match citation_crawler_selenium.py)
         self.directories = {
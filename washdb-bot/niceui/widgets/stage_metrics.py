@@ -0,0 +1,120 @@
+"""
+Stage timing widget for NiceGUI dashboard.
+
+Shows where crawler time goes, per crawler and stage, from the metrics
+collector (runner.metrics) that the worker processes report to:
+- Calls and average / p50 / p95 latency
+- Share of the crawler's total time
+- Errors and items produced
+"""
+
+from nicegui import ui
+from typing import Dict, List
+
+from runner.metrics import get_metrics_collector
+
+
+COLUMNS = [
+    {'name': 'crawler', 'label': 'Crawler', 'field': 'crawler', 'align': 'left', 'sortable': True},
+    {'name': 'stage', 'label': 'Stage', 'field': 'stage', 'align': 'left', 'sortable': True},
+    {'name': 'calls', 'label': 'Calls', 'field': 'calls', 'sortable': True},
+    {'name': 'share', 'label': '% of Time', 'field': 'share', 'sortable': True},
+    {'name': 'avg_ms', 'label': 'Avg (ms)', 'field': 'avg_ms', 'sortable': True},
+    {'name': 'p50_ms', 'label': 'p50 (ms)', 'field': 'p50_ms', 'sortable': True},
+    {'name': 'p95_ms', 'label': 'p95 (ms)', 'field': 'p95_ms', 'sortable': True},
+    {'name': 'items', 'label': 'Items', 'field': 'items', 'sortable': True},
+    {'name': 'errors', 'label': 'Errors', 'field': 'errors', 'sortable': True},
+]
+
+
+def get_stage_rows() -> List[Dict]:
+    """
+    Get table rows for the stage timing panel.
+
+    Returns:
+        List of row dicts (see COLUMNS), slowest share first within each crawler
+    """
+    summary = get_metrics_collector().stage_summary()
+
+    crawler_totals: Dict[str, float] = {}
+    for row in summary:
+        crawler_totals[row['crawler']] = crawler_totals.get(row['crawler'], 0.0) + row['total_seconds']
+
+    rows = []
+    for row in summary:
+        total = crawler_totals[row['crawler']]
+        share = 100.0 * row['total_seconds'] / total if total else 0.0
+        rows.append({
+            'id': f"{row['crawler']}:{row['stage']}",
+            'crawler': row['crawler'],
+            'stage': row['stage'],
+            'calls': row['calls'],
+            'share': round(share, 1),
+            'avg_ms': row['avg_ms'],
+            'p50_ms': row['p50_ms'] if row['p50_ms'] is not None else '-',
+            'p95_ms': row['p95_ms'] if row['p95_ms'] is not None else '-',
+            'items': row['items'],
+            'errors': row['errors'],
+        })
+
+    rows.sort(key=lambda r: (r['crawler'], -r['share']))
+    return rows
+
+
+class StageMetricsWidget:
+    """Per-stage timing table with auto-refresh."""
+
+    def __init__(self, refresh_interval: float = 5.0):
+        self.refresh_interval = refresh_interval
+        self.table = None
+        self.status_label = None
+        self.timer = None
+
+    def render(self):
+        """Render the stage timing widget."""
+        with ui.card().classes('w-full'):
+            with ui.row().classes('w-full items-center mb-2'):
+                ui.icon('timer', size='md').classes('text-blue-400')
+                ui.label('Crawler Stage Timings').classes('text-lg font-bold')
+                ui.space()
+                self.status_label = ui.label('').classes('text-xs text-gray-400')
+                ui.link('/metrics', '/metrics', new_tab=True).classes('text-xs')
+
+            self.table = ui.table(columns=COLUMNS, rows=[], row_key='id').classes('w-full')
+            self.table.props('dense flat')
+
+        # Start auto-refresh timer
+        self.timer = ui.timer(self.refresh_interval, self._update_stats)
+
+        # Initial update
+        self._update_stats()
+
+    def _update_stats(self):
+        """Update the table from the collector."""
+        try:
+            rows = get_stage_rows()
+        except Exception as e:
+            if self.status_label:
+                self.status_label.set_text(f'Metrics unavailable: {e}')
+            return
+
+        if self.table:
+            self.table.rows = rows
+            self.table.update()
+        if self.status_label:
+            self.status_label.set_text('No stage timings reported yet' if not rows else f'{len(rows)} stages')
+
+
+def stage_metrics_card(refresh_interval: float = 5.0) -> StageMetricsWidget:
+    """
+    Create and render a stage timing card.
+
+    Args:
+        refresh_interval: Seconds between table updates
+
+    Returns:
+        StageMetricsWidget instance
+    """
+    widget = StageMetricsWidget(refresh_interval=refresh_interval)
+    widget.render()
+    return widget
@@ -0,0 +1,240 @@
+"""
+Shared CAPTCHA / block page detection for all scrapers.
+
+Each detector precompiles its indicator lists into a scan plan and checks
+only a bounded window at the start of the page (where <head>, <title> and
+the body of challenge/block pages live), lowercased once, instead of
+lowercasing the full page per check and scanning it once per indicator.
+
+The plan scans for "root" indicators only - those that contain no other
+indicator (e.g. 'captcha' covers 'recaptcha', 'g-recaptcha', 'hcaptcha').
+On a clean page, which is the common case, that is all the work done. Longer
+indicators are only checked when their root was found.
+
+Indicator lists are ordered by priority: when several indicators of the same
+kind appear, the label of the earliest-listed one wins, exactly as with the
+previous sequential `in` checks.
+
+Usage:
+    from runner.block_detector import YP_DETECTOR
+
+    result = YP_DETECTOR.scan(html, status_code=response.status)
+    if result.captcha:
+        print(result.captcha.label)
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Optional, Sequence, Tuple
+
+
+# Challenge and block pages are small; 32 KB covers <head>, <title> and the
+# visible body of every challenge page in tests/fixtures/block_pages.
+DEFAULT_WINDOW_CHARS = 32 * 1024
+
+
+class SignalType(str, Enum):
+    """Kind of anti-bot signal found on a page."""
+    NONE = "none"
+    CAPTCHA = "captcha"
+    BLOCKED = "blocked"
+
+
+@dataclass(frozen=True)
+class PageSignal:
+    """A single detected signal (falsy when nothing was detected)."""
+    type: SignalType = SignalType.NONE
+    label: str = ""
+    indicator: str = ""
+
+    def __bool__(self) -> bool:
+        return self.type is not SignalType.NONE
+
+
+NO_SIGNAL = PageSignal()
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    """CAPTCHA and block signals found on one page."""
+    captcha: PageSignal = NO_SIGNAL
+    blocked: PageSignal = NO_SIGNAL
+
+    @property
+    def signal(self) -> PageSignal:
+        """Most severe signal (CAPTCHA before block)."""
+        return self.captcha or self.blocked
+
+    def __bool__(self) -> bool:
+        return bool(self.captcha or self.blocked)
+
+
+class SignalDetector:
+    """
+    Precompiled CAPTCHA/block detector.
+
+    Rules are (indicator, label) pairs in priority order. Indicators are
+    matched case-insensitively as plain substrings.
+    """
+
+    def __init__(
+        self,
+        captcha_rules: Sequence[Tuple[str, str]] = (),
+        block_rules: Sequence[Tuple[str, str]] = (),
+        status_labels: Optional[Dict[int, str]] = None,
+        window_chars: int = DEFAULT_WINDOW_CHARS,
+    ):
+        """
+        Compile a detector.
+
+        Args:
+            captcha_rules: (indicator, label) pairs for CAPTCHA pages
+            block_rules: (indicator, label) pairs for block/rate-limit pages
+            status_labels: HTTP status codes that always mean blocked, with labels
+            window_chars: Number of leading characters of the page to scan
+        """
+        self.status_labels = dict(status_labels or {})
+        self.window_chars = window_chars
+
+        self._rules = {
+            SignalType.CAPTCHA: [
+                (ind.lower(), PageSignal(SignalType.CAPTCHA, label, ind.lower()))
+                for ind, label in captcha_rules
+            ],
+            SignalType.BLOCKED: [
+                (ind.lower(), PageSignal(SignalType.BLOCKED, label, ind.lower()))
+                for ind, label in block_rules
+            ],
+        }
+        indicators = {ind for rules in self._rules.values() for ind, _ in rules}
+
+        # An indicator can only be present if every indicator inside it is,
+        # so the shortest contained indicator acts as its root.
+        self._root_of: Dict[str, str] = {
+            ind: min((other for other in indicators if other in ind), key=len)
+            for ind in indicators
+        }
+        self._roots = sorted(set(self._root_of.values()))
+
+    def scan(self, html: Optional[str], status_code: Optional[int] = None) -> ScanResult:
+        """
+        Scan a page for CAPTCHA and block signals.
+
+        Args:
+            html: Page HTML (only the first window_chars characters are scanned)
+            status_code: HTTP status code, if known
+
+        Returns:
+            ScanResult with the highest-priority CAPTCHA and block signals
+        """
+        blocked = NO_SIGNAL
+        if status_code and status_code in self.status_labels:
+            blocked = PageSignal(SignalType.BLOCKED, self.status_labels[status_code], str(status_code))
+
+        if not html:
+            return ScanResult(blocked=blocked)
+
+        window = html[:self.window_chars].lower()
+        present = {root for root in self._roots if root in window}
+        if not present:
+            return ScanResult(blocked=blocked)
+
+        captcha = self._first_match(SignalType.CAPTCHA, window, present)
+        if not blocked:
+            blocked = self._first_match(SignalType.BLOCKED, window, present)
+
+        return ScanResult(captcha=captcha, blocked=blocked)
+
+    def _first_match(self, signal_type: SignalType, window: str, present: set) -> PageSignal:
+        """Highest-priority rule of signal_type found in the window."""
+        for ind, signal in self._rules[signal_type]:
+            root = self._root_of[ind]
+            if root in present and (ind == root or ind in window):
+                return signal
+        return NO_SIGNAL
+
+
+# ==============================================================================
+# SCRAPER PROFILES
+# ==============================================================================
+
+# Yellow Pages monitor (scrape_yp.yp_monitor.detect_captcha / detect_blocking)
+YP_CAPTCHA_RULES = [
+    # reCAPTCHA
+    ('recaptcha', 'reCAPTCHA'),
+    ('g-recaptcha', 'reCAPTCHA'),
+    ('grecaptcha', 'reCAPTCHA'),
+
+    # hCaptcha
+    ('hcaptcha', 'hCaptcha'),
+    ('h-captcha', 'hCaptcha'),
+
+    # Cloudflare
+    ('cf-challenge', 'Cloudflare Challenge'),
+    ('challenge-form', 'Cloudflare Challenge'),
+    ('cloudflare', 'Cloudflare'),
+
+    # Generic
+    ('captcha', 'Generic CAPTCHA'),
+    ('verify you are human', 'Human Verification'),
+    ('prove you are not a robot', 'Bot Check'),
+    ('security check', 'Security Check'),
+    ('unusual traffic', 'Rate Limit Warning'),
+]
+
+YP_BLOCK_RULES = [
+    (indicator, f"Content indicates: {indicator}")
+    for indicator in (
+        'access denied',
+        'blocked',
+        'banned',
+        'too many requests',
+        'rate limit',
+        'temporarily unavailable',
+    )
+]
+
+YP_STATUS_LABELS = {
+    403: "403 Forbidden",
+    429: "429 Too Many Requests",
+    503: "503 Service Unavailable",
+    504: "504 Service Unavailable",
+}
+
+# SEO intelligence scrapers (BaseScraper._validate_html_response)
+SEO_CAPTCHA_RULES = [
+    (indicator, "CAPTCHA_DETECTED")
+    for indicator in (
+        'captcha',
+        'recaptcha',
+        'g-recaptcha',
+        'hcaptcha',
+        'cf-challenge',  # Cloudflare challenge
+        'please verify you are human',
+        'security check',
+        'unusual traffic',
+    )
+]
+
+SEO_BLOCK_RULES = [
+    (indicator, "BOT_DETECTED")
+    for indicator in (
+        'access denied',
+        'blocked',
+        'forbidden',
+        'your access to this site has been limited',
+        'enable javascript',
+        'javascript is disabled',
+        'please enable cookies',
+    )
+]
+
+# Yelp DataDome challenge pages
+DATADOME_CAPTCHA_RULES = [
+    ('captcha-delivery.com', 'DataDome'),
+    ('datadome', 'DataDome'),
+]
+
+YP_DETECTOR = SignalDetector(YP_CAPTCHA_RULES, YP_BLOCK_RULES, YP_STATUS_LABELS)
+SEO_DETECTOR = SignalDetector(SEO_CAPTCHA_RULES, SEO_BLOCK_RULES)
+DATADOME_DETECTOR = SignalDetector(DATADOME_CAPTCHA_RULES)
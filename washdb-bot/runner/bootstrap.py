@@ -13,8 +13,9 @@ import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
+from db.engine_registry import get_engine
 
 
 def load_environment():
@@ -44,7 +45,7 @@ def verify_database():
 
     try:
         # Create engine and test connection
-        engine = create_engine(database_url, echo=False)
+        engine = get_engine(database_url)
         with engine.connect() as conn:
             result = conn.execute(text("SELECT version();"))
             version = result.scalar()
@@ -0,0 +1,254 @@
+"""
+Shared compiled keyword matching for the discovery filters.
+
+The YP, Google and Yelp filters test listings against keyword lists
+(anti-keywords, positive hints, e-commerce URL patterns). Checking each
+keyword with `keyword in text` costs one scan per keyword per field, so
+filter time grows with every keyword added to data/*.txt.
+
+KeywordMatcher compiles a list once into an Aho-Corasick automaton: a text
+is scanned once regardless of how many keywords there are, and all matches
+(including overlapping ones) are reported in keyword-list order. A whole
+page of listings can be scanned in one call with find_all_batch().
+
+The automaton steps through the text in Python, which costs more per
+character than a C-level `in` check; below LINEAR_SCAN_MAX_KEYWORDS the
+matcher keeps the plain per-keyword scan, which is faster for short lists.
+
+Keyword files are loaded and compiled once per process and shared by every
+filter instance; they are recompiled when the file changes on disk (e.g.
+after an edit from the keyword dashboard).
+
+Usage:
+    from runner.keyword_matcher import get_file_matcher
+
+    anti = get_file_matcher('data/anti_keywords.txt')
+    anti.find_all("Pressure Washer Supplies")      # ['supplies', ...]
+    anti.find_all_batch([name1, name2, name3])     # one list per text
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from runner.logging_setup import get_logger
+
+logger = get_logger("keyword_matcher")
+
+# Lists up to this size are matched with per-keyword `in` checks. Measured
+# crossover (scripts/benchmark_keyword_matcher.py): ~64 keywords on listing
+# names, ~128 on 300 character descriptions.
+LINEAR_SCAN_MAX_KEYWORDS = 64
+
+
+@dataclass(frozen=True)
+class RuleHit:
+    """One filter rule that matched a listing, for explanations."""
+    rule: str    # e.g. 'anti_keyword', 'positive_hint', 'category_block'
+    field: str   # Listing field the rule matched, e.g. 'name', 'website'
+    match: str   # Keyword, category or domain that matched
+
+    def __str__(self) -> str:
+        return f"{self.rule}:{self.field}:{self.match}"
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring matcher for a fixed keyword list.
+
+    Keywords keep their list order: find_all() returns matches ordered by
+    position in the list, so the first match is the highest-priority one.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile keywords into an Aho-Corasick automaton.
+
+        Args:
+            keywords: Keywords in priority order (blank entries and
+                duplicates are dropped; matching is case-insensitive)
+        """
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(
+            keyword.strip().lower() for keyword in keywords if keyword and keyword.strip()
+        ))
+
+        # Trie: goto[node][char] -> node; out[node] -> keyword indexes ending here
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[int, ...]] = [()]
+        for index, keyword in enumerate(self.keywords):
+            node = 0
+            for char in keyword:
+                child = goto[node].get(char)
+                if child is None:
+                    child = len(goto)
+                    goto.append({})
+                    out.append(())
+                    goto[node][char] = child
+                node = child
+            out[node] += (index,)
+
+        # Failure links (breadth-first). Each node's transitions are resolved
+        # through its failure chain up front, so a scan is one dict lookup
+        # per character with no backtracking.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                fail[child] = delta[fail[node]].get(char, 0)
+                out[child] += out[fail[child]]
+            delta[node] = {**delta[fail[node]], **goto[node]}
+
+        self._delta = [transitions.get for transitions in delta]
+        self._out = out
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _match(self, text: str) -> List[str]:
+        """Matches in an already lowercased text, in list order."""
+        if len(self.keywords) <= LINEAR_SCAN_MAX_KEYWORDS:
+            return [keyword for keyword in self.keywords if keyword in text]
+
+        delta, out = self._delta, self._out
+        found = set()
+        node = 0
+        for char in text:
+            node = delta[node](char, 0)
+            if out[node]:
+                found.update(out[node])
+        return [self.keywords[index] for index in sorted(found)]
+
+    def find_all(self, text: Optional[str]) -> List[str]:
+        """
+        Find every keyword contained in text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Matching keywords in list (priority) order
+        """
+        if not text or not self.keywords:
+            return []
+        return self._match(text.lower())
+
+    def first(self, text: Optional[str]) -> Optional[str]:
+        """Highest-priority keyword contained in text, or None."""
+        matches = self.find_all(text)
+        return matches[0] if matches else None
+
+    def find_all_batch(self, texts: Sequence[Optional[str]]) -> List[List[str]]:
+        """
+        Find keywords in many texts in one call.
+
+        Args:
+            texts: Texts to search (e.g. the names of every listing on a page)
+
+        Returns:
+            One list of matching keywords (priority order) per text
+        """
+        if not self.keywords:
+            return [[] for _ in texts]
+        return [self._match(text.lower()) if text else [] for text in texts]
+
+
+class DomainMatcher:
+    """
+    Matches hostnames against a domain list, including subdomains.
+
+    'amazon.com' matches 'amazon.com' and 'smile.amazon.com' but not
+    'notamazon.com'. Cost is one set lookup per label in the hostname.
+    """
+
+    def __init__(self, domains: Iterable[str]):
+        """
+        Args:
+            domains: Registrable domains (case-insensitive, 'www.' ignored)
+        """
+        self.domains = frozenset(
+            domain.strip().lower().removeprefix("www.") for domain in domains if domain and domain.strip()
+        )
+
+    def __len__(self) -> int:
+        return len(self.domains)
+
+    def match(self, host: Optional[str]) -> Optional[str]:
+        """
+        Find the listed domain that host belongs to.
+
+        Args:
+            host: Hostname (no scheme or path)
+
+        Returns:
+            Matching listed domain, or None
+        """
+        if not host:
+            return None
+
+        labels = host.lower().removeprefix("www.").split(".")
+        for start in range(len(labels) - 1):
+            candidate = ".".join(labels[start:])
+            if candidate in self.domains:
+                return candidate
+        return None
+
+
+def load_keywords(file_path: str) -> Tuple[str, ...]:
+    """
+    Load a keyword file (one keyword per line), lowercased, in file order.
+
+    Args:
+        file_path: Path to the keyword file
+
+    Returns:
+        Keywords (empty if the file does not exist)
+    """
+    return get_file_matcher(file_path).keywords
+
+
+# Compiled matchers shared by all filters: resolved path -> (mtime, matcher)
+_file_matchers: Dict[str, Tuple[Optional[float], KeywordMatcher]] = {}
+_file_matchers_lock = threading.Lock()
+
+
+def get_file_matcher(file_path: str) -> KeywordMatcher:
+    """
+    Get the compiled matcher for a keyword file.
+
+    Matchers are compiled once per process and shared; a file is
+    recompiled only when its modification time changes.
+
+    Args:
+        file_path: Path to the keyword file
+
+    Returns:
+        KeywordMatcher (empty if the file does not exist)
+    """
+    path = Path(file_path).resolve()
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        mtime = None
+
+    key = str(path)
+    with _file_matchers_lock:
+        cached = _file_matchers.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        if mtime is None:
+            logger.warning(f"{file_path} not found")
+            keywords: List[str] = []
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                keywords = [line.strip() for line in f if line.strip()]
+
+        matcher = KeywordMatcher(keywords)
+        _file_matchers[key] = (mtime, matcher)
+        logger.debug(f"Compiled {len(matcher)} keywords from {file_path}")
+        return matcher
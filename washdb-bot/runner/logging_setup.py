@@ -5,13 +5,33 @@ This module provides:
 - Centralized logging configuration
 - Console and file handlers with immediate flushing for real-time log viewing
 - Log rotation
+- Queued mode (default): the calling thread only enqueues records; one
+  listener thread per process writes every logger's records in batches and
+  flushes at least every LOG_FLUSH_INTERVAL seconds so live log tailing
+  stays current
+- Opt-in per-logger sampling and rate limiting for hot-path DEBUG/INFO
+  messages; suppressed records are counted and reported
+
+Environment:
+    LOG_LEVEL           Log level (default: INFO)
+    LOG_MODE            "queued" (default) or "sync" (write + flush per record)
+    LOG_FLUSH_INTERVAL  Max seconds between file flushes in queued mode (default: 0.25)
+    LOG_SAMPLING        Per-logger DEBUG/INFO sample rates, e.g. "site_parse=0.25"
+    LOG_RATE_LIMITS     Per-logger DEBUG/INFO records per second, e.g. "site_parse=20"
 """
 
+import atexit
 import logging
 import os
+import queue
+import random
 import sys
+import threading
+import time
+from multiprocessing import util as mp_util
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -19,6 +39,12 @@ from dotenv import load_dotenv
 # Load environment
 load_dotenv()
 
+LOG_MODE = os.getenv("LOG_MODE", "queued").lower()
+LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "0.25"))
+
+# Seconds between "suppressed N records" reports per sampled logger
+SUPPRESSION_REPORT_INTERVAL = 60.0
+
 
 class FlushingRotatingFileHandler(RotatingFileHandler):
     """
@@ -30,6 +56,395 @@ class FlushingRotatingFileHandler(RotatingFileHandler):
         self.flush()
 
 
+class StdoutHandler(logging.StreamHandler):
+    """
+    A StreamHandler that writes to whatever sys.stdout is at emit time.
+
+    In queued mode records are written later by the listener thread; by
+    then the sys.stdout seen at setup may have been swapped out and closed
+    (pytest capture, contextlib.redirect_stdout).
+    """
+    def __init__(self):
+        super().__init__()
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        # StreamHandler.__init__/setStream assign a fixed stream; ignore it
+        pass
+
+    def emit(self, record):
+        if sys.stdout is not None:
+            super().emit(record)
+
+
+class BatchingRotatingFileHandler(RotatingFileHandler):
+    """
+    A RotatingFileHandler for the queued mode's listener thread.
+
+    Writes without flushing (the listener flushes batches) and tracks the
+    file size itself instead of seeking to the end of the file per record.
+    The size is re-read from the file on every flush, so rotation stays
+    correct when several processes append to the same log.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._size: Optional[int] = None
+        # Set when the listener stops and the handler is written to directly
+        self.autoflush = False
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0:
+                if self._size is None:
+                    self._size = os.fstat(self.stream.fileno()).st_size
+                if self._size + len(msg) >= self.maxBytes and os.path.isfile(self.baseFilename):
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                    self._size = 0
+            self.stream.write(msg)
+            if self._size is not None:
+                self._size += len(msg)
+            if self.autoflush:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        super().flush()
+        if self.stream is not None and self.maxBytes > 0:
+            try:
+                self._size = os.fstat(self.stream.fileno()).st_size
+            except (OSError, ValueError):
+                self._size = None
+
+
+class RoutingQueueHandler(QueueHandler):
+    """
+    QueueHandler that tags each record with the logger it was set up for.
+
+    All queued-mode loggers share one queue; the listener uses the tag to
+    pick that logger's console/file handlers.
+    """
+    def __init__(self, queue_, route: str):
+        super().__init__(queue_)
+        self.route = route
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.log_route = self.route
+        return record
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    Process-wide QueueListener that batches handler writes.
+
+    Records are dispatched to the handlers registered for their route
+    (see RoutingQueueHandler). Handlers are flushed when the queue drains
+    or flush_interval seconds have passed since the last flush, whichever
+    comes first, so a record reaches the log file within flush_interval
+    even under sustained load.
+    """
+    def __init__(self, queue_, flush_interval: float = LOG_FLUSH_INTERVAL):
+        super().__init__(queue_, respect_handler_level=True)
+        self.flush_interval = flush_interval
+        self.routes: Dict[str, Tuple[logging.Handler, ...]] = {}
+        self._routes_lock = threading.Lock()
+
+    def set_route(self, name: str, handlers: Tuple[logging.Handler, ...]):
+        """Register (or replace) the handlers for a route; returns the old ones."""
+        with self._routes_lock:
+            old = self.routes.get(name, ())
+            self.routes[name] = tuple(handlers)
+        return old
+
+    def remove_route(self, name: str) -> Tuple[logging.Handler, ...]:
+        """Forget a route and return its handlers."""
+        with self._routes_lock:
+            return self.routes.pop(name, ())
+
+    @property
+    def all_handlers(self):
+        with self._routes_lock:
+            return [h for handlers in self.routes.values() for h in handlers]
+
+    def handle(self, record):
+        with self._routes_lock:
+            for handler in self.routes.get(getattr(record, "log_route", None), ()):
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+    def flush(self):
+        """Flush all handlers."""
+        for handler in self.all_handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+    def _monitor(self):
+        q = self.queue
+        last_flush = time.monotonic()
+        dirty = False
+
+        while True:
+            try:
+                record = q.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if dirty:
+                    self.flush()
+                    dirty = False
+                last_flush = time.monotonic()
+                continue
+
+            if record is self._sentinel:
+                self.flush()
+                break
+
+            self.handle(record)
+            dirty = True
+
+            now = time.monotonic()
+            if q.empty() or now - last_flush >= self.flush_interval:
+                self.flush()
+                dirty = False
+                last_flush = now
+
+
+class HotPathFilter(logging.Filter):
+    """
+    Sample and rate-limit DEBUG/INFO records of a logger.
+
+    WARNING and above always pass. Suppressed records are counted in
+    `suppressed` and reported on the logger at WARNING level at most every
+    report_interval seconds, so dropped lines never go unnoticed.
+    """
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        max_per_second: Optional[int] = None,
+        logger_name: Optional[str] = None,
+        report_interval: float = SUPPRESSION_REPORT_INTERVAL,
+    ):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+        self.logger_name = logger_name
+        self.report_interval = report_interval
+        self.suppressed = 0
+        self._unreported = 0
+        self._last_report = time.monotonic()
+        self._second = 0
+        self._count = 0
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+
+        keep = True
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            keep = False
+        elif self.max_per_second:
+            second = int(time.monotonic())
+            if second != self._second:
+                self._second = second
+                self._count = 0
+            if self._count >= self.max_per_second:
+                keep = False
+            else:
+                self._count += 1
+
+        if not keep:
+            self.suppressed += 1
+            self._unreported += 1
+        self._report_if_due()
+        return keep
+
+    def _report_if_due(self):
+        """Log how many records were suppressed since the last report."""
+        if not self._unreported or self.logger_name is None:
+            return
+        now = time.monotonic()
+        if now - self._last_report < self.report_interval:
+            return
+        count, self._unreported = self._unreported, 0
+        self._last_report = now
+        # WARNING passes this filter, so this does not recurse
+        logging.getLogger(self.logger_name).warning(
+            f"Log sampling suppressed {count} DEBUG/INFO records in the last {self.report_interval:.0f}s"
+        )
+
+
+# Shared queued-mode listener (one thread per process)
+_listener: Optional[BatchingQueueListener] = None
+_listener_lock = threading.Lock()
+
+# Set while the interpreter exits; loggers set up afterwards write directly
+_exiting = False
+
+
+def _parse_logger_map(value: Optional[str], cast) -> Dict[str, object]:
+    """Parse "name=value,name=value" environment settings."""
+    result = {}
+    for item in (value or "").split(","):
+        if "=" not in item:
+            continue
+        name, _, raw = item.partition("=")
+        try:
+            result[name.strip()] = cast(raw.strip())
+        except ValueError:
+            continue
+    return result
+
+
+def configure_sampling(
+    name: str,
+    sample_rate: float = 1.0,
+    max_per_second: Optional[int] = None,
+) -> Optional[HotPathFilter]:
+    """
+    Sample and/or rate-limit DEBUG/INFO records of a logger.
+
+    Replaces any previous HotPathFilter on the logger.
+
+    Args:
+        name: Logger name
+        sample_rate: Fraction of DEBUG/INFO records to keep (0.0 - 1.0)
+        max_per_second: Max DEBUG/INFO records per second (None = unlimited)
+
+    Returns:
+        The installed filter, or None if no limits apply
+    """
+    logger = logging.getLogger(name)
+    for existing in [f for f in logger.filters if isinstance(f, HotPathFilter)]:
+        logger.removeFilter(existing)
+
+    if sample_rate >= 1.0 and not max_per_second:
+        return None
+
+    hot_path_filter = HotPathFilter(sample_rate, max_per_second, logger_name=name)
+    logger.addFilter(hot_path_filter)
+    return hot_path_filter
+
+
+def _get_listener() -> BatchingQueueListener:
+    """Get (starting if needed) the process-wide listener."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = BatchingQueueListener(queue.SimpleQueue())
+            _listener.start()
+        return _listener
+
+
+def _remove_route(name: str):
+    """Detach a logger from the listener and close its handlers."""
+    listener = _listener
+    if listener is None:
+        return
+    for handler in listener.remove_route(name):
+        handler.close()
+
+
+def shutdown_logging():
+    """
+    Drain and stop the queued-mode listener.
+
+    Runs before logging.shutdown() closes handlers (atexit is LIFO and
+    logging registers first), so no record is written to a closed file.
+    Loggers keep working afterwards: their handlers are attached directly
+    and flush per record.
+    """
+    global _listener
+    with _listener_lock:
+        listener, _listener = _listener, None
+    if listener is None:
+        return
+
+    try:
+        listener.stop()
+    except Exception:
+        pass
+
+    for name, handlers in list(listener.routes.items()):
+        logger = logging.getLogger(name)
+        for handler in [h for h in logger.handlers if isinstance(h, RoutingQueueHandler)]:
+            logger.removeHandler(handler)
+        for handler in handlers:
+            if isinstance(handler, BatchingRotatingFileHandler):
+                handler.autoflush = True
+            logger.addHandler(handler)
+
+
+def _shutdown_at_exit():
+    """atexit hook: stop the listener and keep later loggers synchronous."""
+    global _exiting
+    _exiting = True
+    shutdown_logging()
+
+
+def _flush_before_fork():
+    """Flush buffered records so a forked child does not write them again."""
+    listener = _listener
+    if listener is not None:
+        listener.flush()
+
+
+def _restart_listener_in_child():
+    """
+    Recreate the listener thread after fork.
+
+    Threads do not survive fork(), so worker processes started with
+    multiprocessing would otherwise enqueue records nobody writes. The
+    child gets a fresh queue (the parent's may hold locked state).
+    """
+    global _listener, _listener_lock
+    _listener_lock = threading.Lock()
+
+    old = _listener
+    if old is None:
+        return
+
+    new_listener = BatchingQueueListener(queue.SimpleQueue(), flush_interval=old.flush_interval)
+    for name, handlers in old.routes.items():
+        new_listener.set_route(name, handlers)
+        for handler in logging.getLogger(name).handlers:
+            if isinstance(handler, RoutingQueueHandler):
+                handler.queue = new_listener.queue
+    new_listener.start()
+    _listener = new_listener
+
+
+def _register_process_exit_flush(callback=shutdown_logging):
+    """
+    Drain the listener when a multiprocessing child exits.
+
+    Children end with os._exit(), which skips atexit, but multiprocessing
+    runs its own finalizers first.
+    """
+    mp_util.Finalize(None, callback, exitpriority=0)
+
+
+atexit.register(_shutdown_at_exit)
+_register_process_exit_flush()
+mp_util.register_after_fork(shutdown_logging, _register_process_exit_flush)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_flush_before_fork,
+        after_in_child=_restart_listener_in_child,
+    )
+
+
 def setup_logging(
     name: str = "washdb-bot",
     log_level: str = None,
@@ -58,7 +473,13 @@ def setup_logging(
     logger.setLevel(numeric_level)
 
     # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
+    queued = LOG_MODE == "queued" and not _exiting
+    if not queued:
+        _remove_route(name)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        if not isinstance(handler, RoutingQueueHandler):
+            handler.close()
 
     # Create formatters
     console_formatter = logging.Formatter(
@@ -71,10 +492,9 @@ def setup_logging(
     )
 
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = StdoutHandler()
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
     # File handler (with rotation and immediate flushing for real-time log viewing)
     if log_file is None:
@@ -84,16 +504,37 @@ def setup_logging(
         logs_dir.mkdir(exist_ok=True)
         log_file = logs_dir / f"{name}.log"
 
-    file_handler = FlushingRotatingFileHandler(
+    file_handler_class = BatchingRotatingFileHandler if queued else FlushingRotatingFileHandler
+    file_handler = file_handler_class(
         log_file,
         maxBytes=10 * 1024 * 1024,  # 10 MB
         backupCount=5,
     )
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
 
-    logger.info(f"Logging initialized: level={log_level}, file={log_file}")
+    if queued:
+        # Calling thread only enqueues; the shared listener thread does all I/O.
+        # Records still queued under this name go to the new handlers.
+        listener = _get_listener()
+        for handler in listener.set_route(name, (console_handler, file_handler)):
+            handler.close()
+        logger.addHandler(RoutingQueueHandler(listener.queue, route=name))
+    else:
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+
+    # Hot-path sampling / rate limits (opt-in)
+    rate_limits = _parse_logger_map(os.getenv("LOG_RATE_LIMITS"), int)
+    sample_rates = _parse_logger_map(os.getenv("LOG_SAMPLING"), float)
+    if name in rate_limits or name in sample_rates:
+        configure_sampling(
+            name,
+            sample_rate=sample_rates.get(name, 1.0),
+            max_per_second=rate_limits.get(name),
+        )
+
+    logger.info(f"Logging initialized: level={log_level}, file={log_file}, mode={LOG_MODE}")
 
     return logger
 
@@ -17,11 +17,37 @@ import psutil
 import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from runner.logging_setup import get_logger
 
 logger = get_logger("memory_monitor")
 
+# Process names of Playwright's Chromium (full build and headless shell)
+BROWSER_PROCESS_NAMES = ("chrome", "chromium", "headless_shell")
+
+
+def _process_memory_mb(process: psutil.Process) -> Tuple[float, str]:
+    """
+    Memory of one process that can be summed over a process tree.
+
+    PSS (Linux) splits shared pages between the processes mapping them and
+    USS (macOS/Windows) leaves them out, so neither counts Chromium's shared
+    pages once per process like RSS does. Falls back to RSS when the full
+    memory info is not readable.
+
+    Returns:
+        (megabytes, metric) where metric is 'pss', 'uss' or 'rss'
+    """
+    try:
+        info = process.memory_full_info()
+    except psutil.AccessDenied:
+        return process.memory_info().rss / (1024 ** 2), 'rss'
+    for metric in ('pss', 'uss'):
+        value = getattr(info, metric, None)
+        if value is not None:
+            return value / (1024 ** 2), metric
+    return info.rss / (1024 ** 2), 'rss'
+
 
 class MemoryMonitor:
     """
@@ -113,6 +139,62 @@ class MemoryMonitor:
             'processes': processes,
         }
 
+    def get_process_tree_memory(self, pid: int) -> Optional[Dict]:
+        """
+        Get memory of a process and all its descendants.
+
+        A scraper worker's footprint is mostly outside its own RSS: the
+        Playwright driver and the Chromium browser/renderer processes are
+        children of the worker. Each process is measured by PSS (or USS)
+        so pages shared between Chromium processes are not counted once
+        per process; see _process_memory_mb.
+
+        Args:
+            pid: Root process ID (e.g. a worker process)
+
+        Returns:
+            dict: rss_mb (whole tree), own_mb, browser_mb (Chromium processes),
+            processes and browser_processes counts, and memory_metric (the
+            per-process measure: 'pss', 'uss', or 'rss' if any process could
+            only be read by RSS); None if pid is gone
+        """
+        try:
+            root = psutil.Process(pid)
+            own_mb, metric = _process_memory_mb(root)
+            children = root.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+        metrics = {metric}
+        total_mb = own_mb
+        browser_mb = 0.0
+        browser_processes = 0
+        processes = 1
+
+        for child in children:
+            try:
+                mem_mb, metric = _process_memory_mb(child)
+                name = child.name().lower()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+            metrics.add(metric)
+            total_mb += mem_mb
+            processes += 1
+            if any(browser in name for browser in BROWSER_PROCESS_NAMES):
+                browser_mb += mem_mb
+                browser_processes += 1
+
+        return {
+            'pid': pid,
+            'rss_mb': total_mb,
+            'own_mb': own_mb,
+            'browser_mb': browser_mb,
+            'processes': processes,
+            'browser_processes': browser_processes,
+            'memory_metric': 'rss' if 'rss' in metrics else metric,
+        }
+
     def get_component_memory(self) -> Dict:
         """
         Get memory usage for system components.
@@ -161,15 +243,60 @@ class MemoryMonitor:
             logger.debug(f"HTML cache stats unavailable: {e}")
             components['html_cache'] = {'error': str(e)}
 
-        # Database connection pools (if available)
+        # Listing-level parse cache
         try:
-            from db import engine
-            pool = engine.pool
+            from scrape_yp.listing_cache import get_listing_cache
+            listing_stats = get_listing_cache().get_stats()
+
+            # Estimate: ~2 KB per cached listing
+            listing_memory_mb = listing_stats['size'] * 2 / 1024
+
+            components['listing_cache'] = {
+                'size': listing_stats['size'],
+                'max_size': listing_stats['max_size'],
+                'hit_rate_pct': listing_stats['hit_rate_pct'],
+                'avg_stage_ms': listing_stats['avg_stage_ms'],
+                'estimated_memory_mb': listing_memory_mb,
+                'estimated_memory_gb': listing_memory_mb / 1024,
+            }
+        except Exception as e:
+            logger.debug(f"Listing cache stats unavailable: {e}")
+            components['listing_cache'] = {'error': str(e)}
+
+        # Warm UC driver pool (SEO scrapers)
+        try:
+            from seo_intelligence.drivers.driver_pool import get_driver_pool
+            driver_stats = get_driver_pool().get_stats()
+
+            # Estimate: ~300 MB per undetected Chrome
+            driver_memory_mb = driver_stats['active_drivers'] * 300
+
+            components['uc_driver_pool'] = {
+                'active_drivers': driver_stats['active_drivers'],
+                'idle_drivers': driver_stats['idle_drivers'],
+                'sites': driver_stats['sites'],
+                'reuse_rate_pct': driver_stats['reuse_rate_pct'],
+                'avg_create_seconds': driver_stats['avg_create_seconds'],
+                'recycled': driver_stats['recycled_age'] + driver_stats['recycled_uses'],
+                'health_check_failures': driver_stats['health_check_failures'],
+                'estimated_memory_mb': driver_memory_mb,
+                'estimated_memory_gb': driver_memory_mb / 1024,
+            }
+        except Exception as e:
+            logger.debug(f"UC driver pool stats unavailable: {e}")
+            components['uc_driver_pool'] = {'error': str(e)}
+
+        # Database connection pools (shared engine registry)
+        try:
+            from db.engine_registry import get_engine_registry
+            registry_stats = get_engine_registry().get_stats()
 
             components['db_pool'] = {
-                'pool_size': pool.size(),
-                'checked_out': pool.checkedout(),
-                'overflow': pool.overflow(),
+                'engines': len(registry_stats['engines']),
+                'budget': registry_stats['budget'],
+                'allocated': registry_stats['allocated'],
+                'checked_out': registry_stats['in_use'],
+                'pgbouncer': registry_stats['pgbouncer'],
             }
         except Exception as e:
             logger.debug(f"DB pool stats unavailable: {e}")
@@ -357,6 +484,13 @@ class MemoryMonitor:
             print(f"    Hit Rate:  {hc.get('hit_rate_pct', 0):.1f}%")
             print(f"    Memory:    ~{hc.get('estimated_memory_gb', 0):.2f} GB")
 
+        if 'listing_cache' in comp_stats and 'error' not in comp_stats['listing_cache']:
+            lc = comp_stats['listing_cache']
+            print(f"  Listing Cache:")
+            print(f"    Size:      {lc.get('size', 0)}/{lc.get('max_size', 0)}")
+            print(f"    Hit Rate:  {lc.get('hit_rate_pct', 0):.1f}%")
+            print(f"    Parse:     ~{lc.get('avg_stage_ms', {}).get('total', 0):.1f} ms/page")
+
         # Workers
         worker_stats = stats.get('workers', {})
         print(f"\nWorker Processes:")
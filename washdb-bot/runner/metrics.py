@@ -0,0 +1,680 @@
+#!/usr/bin/env python3
+"""
+Hot-path instrumentation: counters, gauges and histograms across processes.
+
+Each process records into an in-memory Metrics registry (a dict update
+under a lock per observation). Stage timings go through stage_timer():
+
+    from runner.metrics import stage_timer
+
+    with stage_timer("yp", "parse"):
+        results = parse_yp_results_enhanced(html)
+
+    @stage_timer("site", "fetch")
+    def fetch_page(url): ...
+
+which records washdb_stage_seconds{crawler,stage} (histogram) and
+washdb_stage_errors_total{crawler,stage} when the block raises.
+
+Worker processes flush cumulative snapshots every METRICS_FLUSH_INTERVAL
+seconds over UDP to a MetricsCollector (METRICS_COLLECTOR, default
+127.0.0.1:9125). The collector runs in the dashboard process, or
+standalone via `python -m runner.metrics`. It sums the series of all
+processes and renders them in the Prometheus text format (/metrics).
+Snapshots are cumulative, so a lost datagram only delays an update;
+processes that stop reporting are folded into a retired total, which
+keeps counters monotonic when workers are recycled.
+
+Environment:
+    METRICS_ENABLED         0 disables recording (timers become no-ops)
+    METRICS_COLLECTOR       host:port of the UDP collector (empty: don't send)
+    METRICS_FLUSH_INTERVAL  Seconds between snapshots (default 5)
+    METRICS_HTTP_PORT       Port of the standalone /metrics endpoint (default 9108)
+"""
+
+import argparse
+import asyncio
+import atexit
+import functools
+import json
+import os
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from runner.logging_setup import get_logger
+
+logger = get_logger("metrics")
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1").lower() not in ("0", "false", "no")
+METRICS_COLLECTOR = os.getenv("METRICS_COLLECTOR", "127.0.0.1:9125")
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+METRICS_HTTP_PORT = int(os.getenv("METRICS_HTTP_PORT", "9108"))
+
+# Seconds; covers a cached parse (ms) up to a slow page load or LLM call
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+STAGE_SECONDS = "washdb_stage_seconds"
+STAGE_ERRORS = "washdb_stage_errors_total"
+STAGE_ITEMS = "washdb_stage_items_total"
+
+HELP = {
+    STAGE_SECONDS: "Time spent per crawler stage",
+    STAGE_ERRORS: "Crawler stage executions that raised",
+    STAGE_ITEMS: "Items produced per crawler stage",
+}
+
+# Max UDP payload per datagram (series are split across datagrams)
+MAX_DATAGRAM_BYTES = 60000
+# A process that hasn't reported for this many flush intervals is retired
+RETIRE_AFTER_INTERVALS = 12
+
+SeriesKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def _labels_key(labels: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class _Histogram:
+    """Cumulative bucket counts, sum and count."""
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+
+class Timer:
+    """
+    Times a block or function into a histogram; usable as a context
+    manager or as a decorator (sync or async functions).
+    """
+
+    __slots__ = ("metrics", "name", "labels", "error_counter", "_start")
+
+    def __init__(self, metrics: "Metrics", name: str, labels: Dict[str, Any], error_counter: Optional[str] = None):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+        self.error_counter = error_counter
+        self._start = 0.0
+
+    def __enter__(self) -> "Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.name, time.perf_counter() - self._start, **self.labels)
+        if exc_type is not None and self.error_counter:
+            self.metrics.inc(self.error_counter, **self.labels)
+        return False
+
+    def __call__(self, func):
+        metrics, name, labels, error_counter = self.metrics, self.name, self.labels, self.error_counter
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with Timer(metrics, name, labels, error_counter):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Timer(metrics, name, labels, error_counter):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+class Metrics:
+    """
+    Per-process metrics registry.
+
+    Series are identified by name and labels. snapshot() returns every
+    series with cumulative values. With flush_to set, the first
+    observation starts a background thread sending snapshots to the
+    collector.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = METRICS_ENABLED,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        flush_to: Optional[str] = None,
+    ):
+        """
+        Args:
+            enabled: Record observations (False makes every call a no-op)
+            buckets: Histogram bucket upper bounds in seconds
+            flush_to: Collector host:port to send snapshots to
+        """
+        self.enabled = enabled
+        self.buckets = buckets
+        self.flush_to = flush_to
+        self._needs_flusher = bool(enabled and flush_to)
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple, float] = {}
+        self._gauges: Dict[Tuple, float] = {}
+        self._histograms: Dict[Tuple, _Histogram] = {}
+        self._flusher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._process_key = f"{socket.gethostname()}:{os.getpid()}:{time.time():.0f}"
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a counter."""
+        if not self.enabled:
+            return
+        key = (name, _labels_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        if self._needs_flusher:
+            self._ensure_flusher()
+
+    def set_gauge(self, name: str, value: float, **labels):
+        """Set a gauge (summed across processes by the collector)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges[(name, _labels_key(labels))] = value
+        if self._needs_flusher:
+            self._ensure_flusher()
+
+    def observe(self, name: str, value: float, **labels):
+        """Record a value (seconds) in a histogram."""
+        if not self.enabled:
+            return
+        key = (name, _labels_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+        if self._needs_flusher:
+            self._ensure_flusher()
+
+    def timer(self, name: str, error_counter: Optional[str] = None, **labels) -> Timer:
+        """Time a block/function into histogram `name`."""
+        return Timer(self, name, labels, error_counter)
+
+    def snapshot(self) -> List[list]:
+        """
+        Get all series with cumulative values.
+
+        Returns:
+            list: [kind, name, labels, value] rows; value is a number, or
+            [bucket bounds, bucket counts, sum, count] for histograms
+        """
+        with self._lock:
+            rows = [["counter", name, dict(labels), value] for (name, labels), value in self._counters.items()]
+            rows += [["gauge", name, dict(labels), value] for (name, labels), value in self._gauges.items()]
+            rows += [
+                ["histogram", name, dict(labels), [list(h.buckets), list(h.counts), h.sum, h.count]]
+                for (name, labels), h in self._histograms.items()
+            ]
+        return rows
+
+    def reset(self):
+        """Drop all series and the flusher (a forked child starts from zero)."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+        self._flusher = None
+        self._stop = threading.Event()
+        self._needs_flusher = bool(self.enabled and self.flush_to)
+        self._process_key = f"{socket.gethostname()}:{os.getpid()}:{time.time():.0f}"
+
+    def _ensure_flusher(self):
+        with self._lock:
+            if not self._needs_flusher:
+                return
+            self._needs_flusher = False
+        self.start_flusher(self.flush_to)
+        atexit.register(self.stop_flusher)
+
+    def start_flusher(self, address: str, interval: float = METRICS_FLUSH_INTERVAL):
+        """
+        Send snapshots to the collector every `interval` seconds.
+
+        Args:
+            address: Collector host:port
+            interval: Seconds between snapshots
+        """
+        if not (self.enabled and address) or (self._flusher and self._flusher.is_alive()):
+            return
+
+        host, port = address.rsplit(":", 1)
+        target = (host, int(port))
+        self._stop.clear()
+
+        def run():
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                while not self._stop.wait(interval):
+                    self.send(sock, target)
+                self.send(sock, target)
+            finally:
+                sock.close()
+
+        self._flusher = threading.Thread(target=run, name="metrics-flusher", daemon=True)
+        self._flusher.start()
+
+    def stop_flusher(self):
+        """Stop the flusher after a final snapshot (and don't start one again)."""
+        self._needs_flusher = False
+        self._stop.set()
+        if self._flusher and self._flusher.is_alive():
+            self._flusher.join(timeout=2)
+
+    def send(self, sock: socket.socket, target: Tuple[str, int]):
+        """Send the current snapshot, split into datagrams."""
+        for payload in self._datagrams():
+            try:
+                sock.sendto(payload, target)
+            except OSError as e:
+                logger.debug(f"Metrics send failed: {e}")
+                return
+
+    def _datagrams(self) -> Iterable[bytes]:
+        header = {"process": self._process_key, "sent_at": time.time()}
+        batch: List[list] = []
+        size = 0
+        for row in self.snapshot():
+            encoded = len(json.dumps(row))
+            if batch and size + encoded > MAX_DATAGRAM_BYTES:
+                yield json.dumps({**header, "series": batch}).encode()
+                batch, size = [], 0
+            batch.append(row)
+            size += encoded
+        if batch:
+            yield json.dumps({**header, "series": batch}).encode()
+
+
+def merge_series(snapshots: Iterable[List[list]]) -> Dict[SeriesKey, Any]:
+    """
+    Sum snapshot rows from several processes.
+
+    Args:
+        snapshots: Row lists from Metrics.snapshot()
+
+    Returns:
+        dict: (kind, name, labels) -> value (histograms as [bounds, counts, sum, count])
+    """
+    merged: Dict[SeriesKey, Any] = {}
+    for rows in snapshots:
+        for kind, name, labels, value in rows:
+            key = (kind, name, _labels_key(labels))
+            if kind != "histogram":
+                merged[key] = merged.get(key, 0) + value
+                continue
+            bounds, counts, total, count = value
+            current = merged.get(key)
+            if current is None or current[0] != bounds:
+                merged[key] = [list(bounds), list(counts), total, count]
+            else:
+                current[1] = [a + b for a, b in zip(current[1], counts)]
+                current[2] += total
+                current[3] += count
+    return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def render_prometheus(merged: Dict[SeriesKey, Any]) -> str:
+    """
+    Render merged series in the Prometheus text exposition format.
+
+    Args:
+        merged: Output of merge_series()
+
+    Returns:
+        Exposition text
+    """
+    lines = []
+    typed = set()
+    for kind, name, labels in sorted(merged):
+        value = merged[(kind, name, labels)]
+        if name not in typed:
+            typed.add(name)
+            if name in HELP:
+                lines.append(f"# HELP {name} {HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        if kind != "histogram":
+            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+            continue
+
+        bounds, counts, total, count = value
+        cumulative = 0
+        for bound, bucket_count in zip(bounds, counts):
+            cumulative += bucket_count
+            lines.append(f"{name}_bucket{_format_labels(labels, ('le', f'{bound:g}'))} {cumulative}")
+        lines.append(f"{name}_bucket{_format_labels(labels, ('le', '+Inf'))} {count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {total:g}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def histogram_quantile(quantile: float, bounds: List[float], counts: List[int], count: int) -> Optional[float]:
+    """Estimate a quantile from bucket counts (upper bound of the bucket)."""
+    if not count:
+        return None
+    rank = quantile * count
+    cumulative = 0
+    for bound, bucket_count in zip(bounds, counts):
+        cumulative += bucket_count
+        if cumulative >= rank:
+            return bound
+    return float("inf")
+
+
+class MetricsCollector:
+    """
+    Receives snapshots from worker processes over UDP and merges them
+    with this process's own registry.
+    """
+
+    def __init__(self, address: str = METRICS_COLLECTOR, interval: float = METRICS_FLUSH_INTERVAL):
+        """
+        Args:
+            address: host:port to listen on
+            interval: Workers' flush interval (for retiring silent processes)
+        """
+        self.address = address
+        self.retire_after = interval * RETIRE_AFTER_INTERVALS
+        self._lock = threading.Lock()
+        # process -> {(kind, name, labels): row}
+        self._processes: Dict[str, Dict[SeriesKey, list]] = {}
+        self._last_seen: Dict[str, float] = {}
+        self._retired: Dict[SeriesKey, Any] = {}
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        """
+        Start listening in a background thread.
+
+        Returns:
+            True if listening (False if the port is taken or no address)
+        """
+        if self._thread and self._thread.is_alive():
+            return True
+        if not self.address:
+            return False
+
+        host, port = self.address.rsplit(":", 1)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.bind((host, int(port)))
+        except OSError as e:
+            sock.close()
+            logger.warning(f"Metrics collector could not bind {self.address}: {e}")
+            return False
+
+        sock.settimeout(1.0)
+        self._sock = sock
+        self._thread = threading.Thread(target=self._receive_loop, name="metrics-collector", daemon=True)
+        self._thread.start()
+        logger.info(f"Metrics collector listening on udp://{self.address}")
+        return True
+
+    def stop(self):
+        """Stop listening."""
+        sock, self._sock = self._sock, None
+        if sock:
+            sock.close()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    @property
+    def port(self) -> Optional[int]:
+        """Bound UDP port (useful when started on port 0)."""
+        return self._sock.getsockname()[1] if self._sock else None
+
+    def _receive_loop(self):
+        while self._sock is not None:
+            try:
+                data, _ = self._sock.recvfrom(65535)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            try:
+                self.ingest(json.loads(data))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.debug(f"Bad metrics datagram: {e}")
+
+    def ingest(self, message: Dict[str, Any]):
+        """Store the series of one snapshot datagram."""
+        process = message["process"]
+        with self._lock:
+            series = self._processes.setdefault(process, {})
+            for row in message["series"]:
+                kind, name, labels, _ = row
+                series[(kind, name, _labels_key(labels))] = row
+            self._last_seen[process] = time.time()
+
+    def _retire_stale(self):
+        """Fold processes that stopped reporting into the retired totals (lock held)."""
+        now = time.time()
+        stale = [p for p, seen in self._last_seen.items() if now - seen > self.retire_after]
+        for process in stale:
+            rows = [list(row) for row in self._processes.pop(process).values()]
+            # Gauges describe live state; drop them with the process
+            rows = [row for row in rows if row[0] != "gauge"]
+            retired_rows = [[kind, name, dict(labels), value] for (kind, name, labels), value in self._retired.items()]
+            self._retired = merge_series([retired_rows, rows])
+            del self._last_seen[process]
+
+    def merged(self, include_local: bool = True) -> Dict[SeriesKey, Any]:
+        """
+        Sum of all processes' series.
+
+        Args:
+            include_local: Include this process's own registry
+
+        Returns:
+            dict: (kind, name, labels) -> value
+        """
+        with self._lock:
+            self._retire_stale()
+            snapshots = [list(series.values()) for series in self._processes.values()]
+            snapshots.append([[kind, name, dict(labels), value] for (kind, name, labels), value in self._retired.items()])
+            processes = len(self._processes)
+
+        if include_local:
+            snapshots.append(get_metrics().snapshot())
+        merged = merge_series(snapshots)
+        merged[("gauge", "washdb_metrics_processes", ())] = processes + (1 if include_local else 0)
+        return merged
+
+    def render(self) -> str:
+        """Prometheus text for all processes."""
+        return render_prometheus(self.merged())
+
+    def stage_summary(self, include_local: bool = True) -> List[Dict[str, Any]]:
+        """
+        Per crawler/stage timing summary (for the dashboard panel).
+
+        Args:
+            include_local: Include this process's own registry
+
+        Returns:
+            list: dicts with crawler, stage, calls, total_seconds, avg_ms,
+            p50_ms, p95_ms, errors and items, sorted by total time
+        """
+        merged = self.merged(include_local)
+        rows = []
+        for (kind, name, labels), value in merged.items():
+            if kind != "histogram" or name != STAGE_SECONDS:
+                continue
+            bounds, counts, total, count = value
+            label_dict = dict(labels)
+            p50 = histogram_quantile(0.5, bounds, counts, count)
+            p95 = histogram_quantile(0.95, bounds, counts, count)
+            rows.append({
+                'crawler': label_dict.get('crawler', ''),
+                'stage': label_dict.get('stage', ''),
+                'calls': count,
+                'total_seconds': round(total, 3),
+                'avg_ms': round(total / count * 1000, 1) if count else 0.0,
+                'p50_ms': p50 * 1000 if p50 is not None else None,
+                'p95_ms': p95 * 1000 if p95 is not None else None,
+                'errors': int(merged.get(("counter", STAGE_ERRORS, labels), 0)),
+                'items': int(merged.get(("counter", STAGE_ITEMS, labels), 0)),
+            })
+        return sorted(rows, key=lambda row: row['total_seconds'], reverse=True)
+
+
+# Global instances
+_metrics: Optional[Metrics] = None
+_metrics_lock = threading.Lock()
+_collector: Optional[MetricsCollector] = None
+
+
+def _after_fork_in_child():
+    global _collector
+    # Inherited values belong to the parent; the child reports its own
+    _collector = None
+    if _metrics is not None:
+        _metrics.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def get_metrics() -> Metrics:
+    """Get this process's Metrics registry."""
+    global _metrics
+
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                # The collector process merges its own registry directly
+                _metrics = Metrics(flush_to=METRICS_COLLECTOR if _collector is None else None)
+
+    return _metrics
+
+
+def get_metrics_collector() -> MetricsCollector:
+    """Get the global MetricsCollector (call start() in the serving process)."""
+    global _collector
+
+    if _collector is None:
+        with _metrics_lock:
+            if _collector is None:
+                _collector = MetricsCollector()
+                if _metrics is not None:
+                    _metrics.stop_flusher()
+                    _metrics.flush_to = None
+
+    return _collector
+
+
+def stage_timer(crawler: str, stage: str) -> Timer:
+    """
+    Time a crawler stage (context manager or decorator).
+
+    Stages: fetch, wait, parse, filter, dedup, db_write, llm_call.
+
+    Args:
+        crawler: Crawler name (yp, google, yelp, site, seo, verification, ...)
+        stage: Stage name
+
+    Returns:
+        Timer recording washdb_stage_seconds and washdb_stage_errors_total
+    """
+    return get_metrics().timer(STAGE_SECONDS, error_counter=STAGE_ERRORS, crawler=crawler, stage=stage)
+
+
+def record_stage(crawler: str, stage: str, seconds: float, items: int = 0):
+    """
+    Record a stage duration measured elsewhere (e.g. a sleep or queue wait).
+
+    Args:
+        crawler: Crawler name
+        stage: Stage name
+        seconds: Duration
+        items: Items produced by the stage
+    """
+    metrics = get_metrics()
+    metrics.observe(STAGE_SECONDS, seconds, crawler=crawler, stage=stage)
+    if items:
+        metrics.inc(STAGE_ITEMS, items, crawler=crawler, stage=stage)
+
+
+def record_items(crawler: str, stage: str, items: int):
+    """Count items produced by a stage (throughput = items / stage seconds)."""
+    if items:
+        get_metrics().inc(STAGE_ITEMS, items, crawler=crawler, stage=stage)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = get_metrics_collector().render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve_metrics(port: int = METRICS_HTTP_PORT, host: str = "127.0.0.1"):
+    """
+    Run the collector with a standalone /metrics HTTP endpoint (blocking).
+
+    Args:
+        port: HTTP port
+        host: Bind address
+    """
+    collector = get_metrics_collector()
+    if not collector.start():
+        raise RuntimeError(f"Could not start metrics collector on {collector.address}")
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        collector.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collect worker metrics and serve /metrics")
+    parser.add_argument("--port", type=int, default=METRICS_HTTP_PORT, help="HTTP port for /metrics")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP bind address")
+    args = parser.parse_args()
+    serve_metrics(args.port, args.host)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,684 @@
+#!/usr/bin/env python3
+"""
+On-demand sampling profiler for long-running workers.
+
+Nothing runs until a profile is requested; an idle process only carries a
+signal handler and a flag check per target. A request starts one sampler
+thread that reads every thread's stack (sys._current_frames()) each
+PROFILE_INTERVAL_MS:
+
+- wall profile: every sample of every thread counts, so time spent
+  sleeping, waiting on sockets, browsers or the database shows up
+- cpu profile: each sample is weighted by the CPU time (microseconds) the
+  thread used since its previous sample, so idle threads drop out
+
+When the window ends, both are written under logs/profiles/ in collapsed-
+stack format (one "frame;frame;frame count" line per stack), which
+flamegraph.pl, speedscope and inferno render as flame graphs.
+
+Slow-target tracing samples only the threads currently inside a
+trace_target() block and keeps a target's profile only when it ran longer
+than the threshold, so outliers can be inspected without profiling
+everything.
+
+Triggers:
+- SIGUSR2 (after install_profiler()): start a PROFILE_SECONDS window, or
+  stop the running one early. Processes that did not install the handler
+  are terminated by SIGUSR2, so only signal workers that call it.
+- status / service sockets: handle_profile_command({"command": "profile", "seconds": 60})
+  also "profile_stop", "profile_status" and "trace_slow" ({"threshold": 120})
+
+Usage:
+    from runner.profiler import install_profiler, trace_target
+
+    install_profiler(f"yp_worker_{worker_id}")
+    ...
+    with trace_target(f"target:{target.id}"):
+        crawl_single_target(...)
+
+    kill -USR2 <pid>
+    python -m runner.profiler --socket /tmp/seo_worker.sock profile --seconds 60
+"""
+
+import argparse
+import json
+import os
+import re
+import signal
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from runner.logging_setup import get_logger
+
+logger = get_logger("profiler")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+PROFILE_DIR = Path(os.getenv("PROFILE_DIR", str(PROJECT_ROOT / "logs" / "profiles")))
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "10"))
+PROFILE_SECONDS = float(os.getenv("PROFILE_SECONDS", "30"))
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "600"))
+PROFILE_SIGNAL = os.getenv("PROFILE_SIGNAL", "SIGUSR2")
+# Slow-target tracing is on from start-up when > 0
+PROFILE_SLOW_TARGET_SECONDS = float(os.getenv("PROFILE_SLOW_TARGET_SECONDS", "0"))
+# Slow-target profiles written per process (keeps logs/ bounded)
+PROFILE_MAX_SLOW_TRACES = int(os.getenv("PROFILE_MAX_SLOW_TRACES", "50"))
+
+PROFILE_COMMANDS = ("profile", "profile_stop", "profile_status", "trace_slow")
+
+MAX_STACK_DEPTH = 128
+TOP_FRAMES = 10
+
+# A stack is (thread name, code objects root first); labels are built on write
+StackKey = Tuple[str, Tuple[Any, ...]]
+
+_ROOT_PREFIX = str(PROJECT_ROOT) + os.sep
+_SITE_PACKAGES = "site-packages" + os.sep
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_frame_labels: Dict[Any, str] = {}
+
+
+def _safe_name(name: str) -> str:
+    """File-name-safe version of a label or target key."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("._") or "python"
+
+
+def _frame_label(code) -> str:
+    """Readable frame name: qualified function name and defining file:line."""
+    label = _frame_labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        if filename.startswith(_ROOT_PREFIX):
+            filename = filename[len(_ROOT_PREFIX):]
+        elif _SITE_PACKAGES in filename:
+            filename = filename[filename.rfind(_SITE_PACKAGES) + len(_SITE_PACKAGES):]
+        else:
+            filename = os.path.basename(filename)
+        label = f"{code.co_qualname} ({filename}:{code.co_firstlineno})".replace(";", ":")
+        _frame_labels[code] = label
+    return label
+
+
+def _stack_codes(frame) -> Tuple[Any, ...]:
+    """Code objects of a frame's stack, outermost first."""
+    codes = []
+    while frame is not None and len(codes) < MAX_STACK_DEPTH:
+        codes.append(frame.f_code)
+        frame = frame.f_back
+    codes.reverse()
+    return tuple(codes)
+
+
+def _thread_cpu_ns(native_id: int) -> Optional[int]:
+    """CPU time used by a thread of this process (Linux /proc), or None."""
+    task = f"/proc/self/task/{native_id}"
+    try:
+        with open(f"{task}/schedstat", "rb") as f:
+            return int(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        with open(f"{task}/stat", "rb") as f:
+            fields = f.read().rsplit(b")", 1)[1].split()
+        # utime, stime are fields 14 and 15 (clock ticks)
+        return (int(fields[11]) + int(fields[12])) * 1_000_000_000 // _CLK_TCK
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def write_collapsed(stacks: Dict[StackKey, int], path: Path, prefix: Optional[str] = None) -> int:
+    """
+    Write stacks in collapsed format (input for flamegraph.pl / speedscope).
+
+    Args:
+        stacks: Sample count (or weight) per stack
+        path: Output file
+        prefix: Optional root frame added to every stack
+
+    Returns:
+        Number of stack lines written
+    """
+    lines = []
+    for (thread_name, codes), count in sorted(stacks.items(), key=lambda item: -item[1]):
+        if count <= 0:
+            continue
+        frames = [f"thread:{thread_name}".replace(";", ":")] + [_frame_label(code) for code in codes]
+        if prefix:
+            frames.insert(0, prefix.replace(";", ":"))
+        lines.append(f"{';'.join(frames)} {int(count)}")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + ("\n" if lines else ""))
+    return len(lines)
+
+
+def top_frames(stacks: Dict[StackKey, int], limit: int = TOP_FRAMES) -> List[Tuple[str, float]]:
+    """
+    Functions with the most self time (innermost Python frame).
+
+    Args:
+        stacks: Sample count (or weight) per stack
+        limit: Number of functions to return
+
+    Returns:
+        List of (frame label, percent of total)
+    """
+    leaves: Counter = Counter()
+    total = 0
+    for (_, codes), count in stacks.items():
+        total += count
+        if codes:
+            leaves[codes[-1]] += count
+    if not total:
+        return []
+    return [(_frame_label(code), round(100.0 * count / total, 1)) for code, count in leaves.most_common(limit)]
+
+
+def _format_top(top: List[Tuple[str, float]], limit: int = 5) -> str:
+    return ", ".join(f"{label} {percent}%" for label, percent in top[:limit]) or "-"
+
+
+class _Window:
+    """One profiling window: wall and CPU stacks of every thread."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.started_at = datetime.now()
+        self.until = time.monotonic() + seconds
+        self.samples = 0
+        self.wall: Counter = Counter()
+        self.cpu: Counter = Counter()
+        self._cpu_last: Dict[int, int] = {}
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+
+    def sample(self, frames: Dict[int, Any], skip_ident: int):
+        threads = {thread.ident: thread for thread in threading.enumerate()}
+        self.samples += 1
+        for ident, frame in frames.items():
+            if ident == skip_ident:
+                continue
+            thread = threads.get(ident)
+            key = (thread.name if thread else f"thread-{ident}", _stack_codes(frame))
+            self.wall[key] += 1
+
+            native_id = getattr(thread, "native_id", None)
+            if native_id is None:
+                continue
+            used = _thread_cpu_ns(native_id)
+            if used is None:
+                continue
+            last = self._cpu_last.get(ident)
+            self._cpu_last[ident] = used
+            if last is not None and used > last:
+                self.cpu[key] += (used - last) // 1000
+
+
+class _TargetTrace:
+    """Stacks of one thread while it works on one target."""
+
+    def __init__(self, key: str, ident: int):
+        self.key = key
+        self.ident = ident
+        self.thread_name = threading.current_thread().name
+        self.started = time.monotonic()
+        self.stacks: Counter = Counter()
+
+
+class SamplingProfiler:
+    """
+    Per-process sampling profiler (see module docstring).
+
+    Usage:
+        profiler = get_profiler()
+        profiler.start(seconds=60)     # files written when the window ends
+        profiler.stop()                # or end it early
+        profiler.enable_slow_target_tracing(threshold=120)
+    """
+
+    def __init__(
+        self,
+        label: Optional[str] = None,
+        output_dir: Optional[Path] = None,
+        interval_ms: float = PROFILE_INTERVAL_MS,
+    ):
+        """
+        Args:
+            label: Name used in output file names (default: script name)
+            output_dir: Where profiles are written (default: PROFILE_DIR)
+            interval_ms: Sampling interval
+        """
+        self.label = label or Path(sys.argv[0] or "python").stem
+        self.output_dir = Path(output_dir) if output_dir else PROFILE_DIR
+        self.interval = max(interval_ms, 1.0) / 1000
+
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._window: Optional[_Window] = None
+        self._targets: Dict[int, _TargetTrace] = {}
+        self._slow_threshold: Optional[float] = None
+        self._slow_until: Optional[float] = None
+        self._slow_traces_written = 0
+        self._last_result: Optional[Dict[str, Any]] = None
+
+    # --- profiling windows -------------------------------------------------
+
+    @property
+    def is_profiling(self) -> bool:
+        return self._window is not None
+
+    def start(self, seconds: Optional[float] = None) -> bool:
+        """
+        Start a profiling window.
+
+        Args:
+            seconds: Window length (default PROFILE_SECONDS, capped at PROFILE_MAX_SECONDS)
+
+        Returns:
+            False if a window is already running
+        """
+        seconds = min(float(seconds or PROFILE_SECONDS), PROFILE_MAX_SECONDS)
+        with self._cond:
+            if self._window is not None:
+                return False
+            self._window = _Window(seconds)
+            self._ensure_thread()
+            self._cond.notify_all()
+        logger.info(f"Profiling {self.label} (pid {os.getpid()}) for {seconds:g}s")
+        return True
+
+    def stop(self, timeout: float = 10.0) -> Optional[Dict[str, Any]]:
+        """
+        End the running window early and wait for its files.
+
+        Args:
+            timeout: Seconds to wait for the files to be written
+
+        Returns:
+            Profile result (files, samples, top frames) or None if not profiling
+        """
+        with self._cond:
+            window = self._window
+            if window is None:
+                return None
+            window.until = 0.0
+            self._cond.notify_all()
+        window.done.wait(timeout)
+        return window.result
+
+    def toggle(self):
+        """Start a window, or stop the running one (signal handler action)."""
+        if self.stop() is None:
+            self.start()
+
+    # --- slow-target tracing -----------------------------------------------
+
+    def enable_slow_target_tracing(self, threshold: float, seconds: Optional[float] = None):
+        """
+        Keep profiles of targets that take longer than threshold.
+
+        Args:
+            threshold: Seconds a target must take to be written out
+            seconds: Turn tracing off again after this long (default: stays on)
+        """
+        with self._cond:
+            self._slow_threshold = float(threshold)
+            self._slow_until = time.monotonic() + seconds if seconds else None
+        logger.info(f"Slow-target tracing on for {self.label}: threshold {threshold:.0f}s")
+
+    def disable_slow_target_tracing(self):
+        """Stop tracing targets."""
+        with self._cond:
+            self._slow_threshold = None
+            self._slow_until = None
+            self._cond.notify_all()
+
+    @contextmanager
+    def trace_target(self, key: str) -> Iterator[None]:
+        """
+        Mark the current thread as working on a target.
+
+        Free when slow-target tracing is off. When on, the thread is sampled
+        while inside the block and the profile is written if the block took
+        longer than the threshold.
+
+        Args:
+            key: Target name used in the log and file name
+        """
+        threshold = self._slow_threshold
+        if threshold is None:
+            yield
+            return
+        if self._slow_until is not None and time.monotonic() > self._slow_until:
+            self.disable_slow_target_tracing()
+            yield
+            return
+
+        ident = threading.get_ident()
+        trace = _TargetTrace(key, ident)
+        with self._cond:
+            if ident in self._targets:
+                # Nested target: the outer one is already traced
+                trace = None
+            else:
+                self._targets[ident] = trace
+                self._ensure_thread()
+                self._cond.notify_all()
+        try:
+            yield
+        finally:
+            if trace is not None:
+                with self._cond:
+                    self._targets.pop(ident, None)
+                elapsed = time.monotonic() - trace.started
+                if elapsed >= threshold:
+                    self._write_slow_trace(trace, elapsed, threshold)
+
+    def _write_slow_trace(self, trace: _TargetTrace, elapsed: float, threshold: float):
+        # dict() copies atomically while the sampler may still be adding to it
+        stacks = dict(trace.stacks)
+        if not stacks or self._slow_traces_written >= PROFILE_MAX_SLOW_TRACES:
+            logger.warning(f"Slow target {trace.key}: {elapsed:.1f}s (threshold {threshold:.0f}s)")
+            return
+        self._slow_traces_written += 1
+
+        stem = f"{_safe_name(self.label)}-{os.getpid()}-slow-{datetime.now():%Y%m%d-%H%M%S}"
+        path = self.output_dir / f"{stem}-{_safe_name(trace.key)[:80]}.collapsed"
+        try:
+            write_collapsed(stacks, path, prefix=f"target:{trace.key}")
+        except OSError as e:
+            logger.warning(f"Could not write slow-target profile {path}: {e}")
+            return
+        logger.warning(
+            f"Slow target {trace.key}: {elapsed:.1f}s (threshold {threshold:.0f}s) -> {path} | "
+            f"top: {_format_top(top_frames(stacks))}"
+        )
+
+    # --- sampler -----------------------------------------------------------
+
+    def _ensure_thread(self):
+        """Start the sampler thread (caller holds self._cond)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        while True:
+            with self._cond:
+                while self._window is None and not self._targets:
+                    if self._slow_threshold is None:
+                        self._thread = None
+                        return
+                    # Tracing on but no target running: sleep until one starts
+                    self._cond.wait()
+                window = self._window
+                traces = list(self._targets.values())
+
+            if window is not None and time.monotonic() >= window.until:
+                self._finish_window(window)
+                continue
+
+            frames = sys._current_frames()
+            if window is not None:
+                window.sample(frames, own_ident)
+            for trace in traces:
+                frame = frames.get(trace.ident)
+                if frame is not None:
+                    trace.stacks[(trace.thread_name, _stack_codes(frame))] += 1
+            del frames
+
+            time.sleep(self.interval)
+
+    def _finish_window(self, window: _Window):
+        stem = f"{_safe_name(self.label)}-{os.getpid()}-{window.started_at:%Y%m%d-%H%M%S}"
+        files = []
+        try:
+            wall_path = self.output_dir / f"{stem}.wall.collapsed"
+            write_collapsed(window.wall, wall_path)
+            files.append(str(wall_path))
+            if window.cpu:
+                cpu_path = self.output_dir / f"{stem}.cpu.collapsed"
+                write_collapsed(window.cpu, cpu_path)
+                files.append(str(cpu_path))
+        except OSError as e:
+            logger.error(f"Could not write profile {stem}: {e}")
+
+        result = {
+            'label': self.label,
+            'pid': os.getpid(),
+            'started_at': window.started_at.isoformat(),
+            'seconds': round((datetime.now() - window.started_at).total_seconds(), 1),
+            'samples': window.samples,
+            'files': files,
+            'top_wall': top_frames(window.wall),
+            'top_cpu': top_frames(window.cpu),
+        }
+        logger.info(
+            f"Profile written ({window.samples} samples): {', '.join(files) or 'no files'} | "
+            f"top cpu: {_format_top(result['top_cpu'])}"
+        )
+
+        with self._cond:
+            self._window = None
+            self._last_result = result
+        window.result = result
+        window.done.set()
+
+    # --- commands ----------------------------------------------------------
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Profiler state.
+
+        Returns:
+            dict: label, pid, profiling, remaining_seconds, slow_target_seconds,
+            slow_traces_written, last_profile
+        """
+        window = self._window
+        return {
+            'label': self.label,
+            'pid': os.getpid(),
+            'profiling': window is not None,
+            'remaining_seconds': round(max(0.0, window.until - time.monotonic()), 1) if window else 0,
+            'slow_target_seconds': self._slow_threshold,
+            'slow_traces_written': self._slow_traces_written,
+            'last_profile': self._last_result,
+        }
+
+    def handle_command(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a profiler command received over a status/service socket.
+
+        Commands:
+            {"command": "profile", "seconds": 60}
+            {"command": "profile_stop"}
+            {"command": "profile_status"}
+            {"command": "trace_slow", "threshold": 120, "seconds": 3600}  (threshold 0 turns it off)
+
+        Args:
+            request: Decoded JSON request
+
+        Returns:
+            JSON-serialisable response with 'command' and 'success'
+        """
+        command = request.get('command')
+        response: Dict[str, Any] = {'command': command, 'success': True}
+        try:
+            if command == 'profile':
+                if not self.start(request.get('seconds')):
+                    response.update(success=False, error='Already profiling')
+            elif command == 'profile_stop':
+                result = self.stop()
+                if result is None:
+                    response.update(success=False, error='Not profiling')
+                else:
+                    response['result'] = result
+            elif command == 'trace_slow':
+                threshold = float(request.get('threshold') or 0)
+                if threshold > 0:
+                    self.enable_slow_target_tracing(threshold, request.get('seconds'))
+                else:
+                    self.disable_slow_target_tracing()
+            elif command != 'profile_status':
+                return {'command': command, 'success': False, 'error': f'Unknown command: {command}'}
+        except (TypeError, ValueError) as e:
+            return {'command': command, 'success': False, 'error': str(e)}
+
+        response['status'] = self.status()
+        return response
+
+
+# Global profiler instance
+_profiler: Optional[SamplingProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> SamplingProfiler:
+    """Get or create the process-wide profiler."""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = SamplingProfiler()
+    return _profiler
+
+
+def _after_fork_in_child():
+    # The sampler thread does not survive fork; keep name and tracing settings
+    global _profiler, _profiler_lock
+    _profiler_lock = threading.Lock()
+    if _profiler is not None:
+        parent = _profiler
+        _profiler = SamplingProfiler(parent.label, parent.output_dir, parent.interval * 1000)
+        if parent._slow_threshold is not None:
+            _profiler._slow_threshold = parent._slow_threshold
+            _profiler._slow_until = parent._slow_until
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _on_profile_signal(signum, frame):
+    # The interrupted code may hold the profiler lock; act from a thread
+    threading.Thread(target=get_profiler().toggle, name="profiler-toggle", daemon=True).start()
+
+
+def install_profiler(label: Optional[str] = None, slow_target_seconds: float = PROFILE_SLOW_TARGET_SECONDS) -> bool:
+    """
+    Name this process's profiler and let PROFILE_SIGNAL toggle it.
+
+    Call from the main thread of a worker process at start-up.
+
+    Args:
+        label: Name used in profile file names (e.g. "yp_worker_3")
+        slow_target_seconds: Enable slow-target tracing with this threshold (0: off)
+
+    Returns:
+        True if the signal handler was installed
+    """
+    profiler = get_profiler()
+    if label:
+        profiler.label = label
+    if slow_target_seconds > 0:
+        profiler.enable_slow_target_tracing(slow_target_seconds)
+
+    signum = getattr(signal, PROFILE_SIGNAL, None)
+    if signum is None:
+        logger.debug(f"Profiler signal {PROFILE_SIGNAL} not available on this platform")
+        return False
+    try:
+        signal.signal(signum, _on_profile_signal)
+    except ValueError:
+        # Not the main thread; socket commands still work
+        logger.debug(f"Profiler signal not installed for {profiler.label}: not in main thread")
+        return False
+
+    logger.info(f"Profiler ready: kill -{PROFILE_SIGNAL.replace('SIG', '')} {os.getpid()} profiles {profiler.label}")
+    return True
+
+
+def trace_target(key: str):
+    """Context manager marking the current thread as working on key (see SamplingProfiler.trace_target)."""
+    return get_profiler().trace_target(key)
+
+
+def is_profile_command(request: Any) -> bool:
+    """True if a decoded socket request is a profiler command."""
+    return isinstance(request, dict) and request.get('command') in PROFILE_COMMANDS
+
+
+def handle_profile_command(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a profiler command against this process's profiler."""
+    return get_profiler().handle_command(request)
+
+
+def send_command(socket_path: str, request: Dict[str, Any], timeout: float = 20.0) -> Dict[str, Any]:
+    """
+    Send a profiler command to a worker's Unix socket and wait for the reply.
+
+    Status sockets also stream heartbeats; lines until the reply are skipped.
+
+    Args:
+        socket_path: Worker status/service socket
+        request: Command dict
+        timeout: Seconds to wait for the reply
+
+    Returns:
+        Reply dict
+    """
+    deadline = time.monotonic() + timeout
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(socket_path)
+        conn.sendall((json.dumps(request) + "\n").encode('utf-8'))
+        buffer = b""
+        while time.monotonic() < deadline:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            buffer += chunk
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                try:
+                    reply = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(reply, dict) and reply.get('command') == request.get('command'):
+                    return reply
+    raise TimeoutError(f"No reply from {socket_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile a running worker")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--pid", type=int, help="Toggle a profile with the profiler signal")
+    target.add_argument("--socket", help="Worker status/service Unix socket")
+    parser.add_argument("command", nargs="?", default="profile", choices=PROFILE_COMMANDS)
+    parser.add_argument("--seconds", type=float, help="Window length (profile) or tracing duration (trace_slow)")
+    parser.add_argument("--threshold", type=float, help="Slow-target threshold in seconds (trace_slow)")
+    args = parser.parse_args()
+
+    if args.pid:
+        os.kill(args.pid, getattr(signal, PROFILE_SIGNAL))
+        print(f"Sent {PROFILE_SIGNAL} to {args.pid}; profiles go to {PROFILE_DIR}")
+        return
+
+    request: Dict[str, Any] = {'command': args.command}
+    if args.seconds:
+        request['seconds'] = args.seconds
+    if args.threshold is not None:
+        request['threshold'] = args.threshold
+    print(json.dumps(send_command(args.socket, request), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Memory-bounded worker recycling for the scraper worker pools.
+
+Playwright/Chromium leak slowly, so a long-running worker pool drifts
+into swap. The pool manager (parent process) runs a WorkerRecycler that
+samples every worker's process tree - the worker itself plus its
+Playwright driver and Chromium processes - every
+WORKER_MEMORY_CHECK_INTERVAL seconds, keeps a per-worker leak slope
+(least-squares MB/hour over the last WORKER_SLOPE_WINDOW samples) and
+posts an action into a shared per-worker slot:
+
+- recycle_browser: the Chromium processes are over BROWSER_RSS_BUDGET_MB,
+  or the tree is over WORKER_RSS_BUDGET_MB and a fresh browser would bring
+  it back under; the worker closes its browser, the pool relaunches it
+- drain: the tree is still over budget (browser already recycled, or the
+  worker itself is the problem), or the leak slope is above
+  WORKER_LEAK_SLOPE_MB_PER_HOUR; the worker finishes, flushes its writer
+  and exits, and the pool manager starts a fresh process with the same
+  assignment
+
+Workers only look at their slot between targets (RecycleSignal.take()),
+so a target is never interrupted; an action waits until the current one
+is done. A budget of 0 disables that check.
+
+Environment:
+    WORKER_RSS_BUDGET_MB           RSS budget per worker tree, incl. browsers (default 2048)
+    BROWSER_RSS_BUDGET_MB          RSS budget for a worker's Chromium processes (default 1024)
+    WORKER_LEAK_SLOPE_MB_PER_HOUR  Drain when the leak slope exceeds this (default 0: off)
+    WORKER_MEMORY_CHECK_INTERVAL   Seconds between samples (default 30)
+    WORKER_SLOPE_WINDOW            Samples in the slope window (default 20)
+
+Usage (pool manager):
+    recycler = WorkerRecycler("yp", num_workers)
+    recycler.start()
+    process = multiprocessing.Process(target=worker_main, args=(..., recycler.signal_for(worker_id)))
+    process.start()
+    recycler.register(worker_id, process.pid)
+    ...
+    # Block until every worker is done, replacing drained ones
+    recycler.wait_for_workers(processes, start_worker, shutdown_event)
+
+Usage (worker, between targets):
+    action = recycle_signal.take() if recycle_signal else ACTION_NONE
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from runner.logging_setup import get_logger
+from runner.memory_monitor import MemoryMonitor, get_memory_monitor
+from runner.metrics import get_metrics
+
+logger = get_logger("worker_recycler")
+
+WORKER_RSS_BUDGET_MB = float(os.getenv("WORKER_RSS_BUDGET_MB", "2048"))
+BROWSER_RSS_BUDGET_MB = float(os.getenv("BROWSER_RSS_BUDGET_MB", "1024"))
+WORKER_LEAK_SLOPE_MB_PER_HOUR = float(os.getenv("WORKER_LEAK_SLOPE_MB_PER_HOUR", "0"))
+WORKER_MEMORY_CHECK_INTERVAL = float(os.getenv("WORKER_MEMORY_CHECK_INTERVAL", "30"))
+WORKER_SLOPE_WINDOW = int(os.getenv("WORKER_SLOPE_WINDOW", "20"))
+
+# Slot values shared with the workers
+ACTION_NONE = 0
+ACTION_RECYCLE_BROWSER = 1
+ACTION_DRAIN = 2
+
+ACTION_NAMES = {
+    ACTION_NONE: "none",
+    ACTION_RECYCLE_BROWSER: "recycle_browser",
+    ACTION_DRAIN: "drain",
+}
+
+# Fewest samples a slope is computed from
+MIN_SLOPE_SAMPLES = 5
+
+
+def leak_slope(samples: List[Tuple[float, float]]) -> Optional[float]:
+    """
+    Least-squares slope of RSS over time.
+
+    Args:
+        samples: (monotonic seconds, RSS MB) pairs
+
+    Returns:
+        Slope in MB/hour, or None with fewer than MIN_SLOPE_SAMPLES samples
+    """
+    if len(samples) < MIN_SLOPE_SAMPLES:
+        return None
+
+    n = len(samples)
+    mean_t = sum(t for t, _ in samples) / n
+    mean_mb = sum(mb for _, mb in samples) / n
+    var_t = sum((t - mean_t) ** 2 for t, _ in samples)
+    if var_t == 0:
+        return None
+
+    cov = sum((t - mean_t) * (mb - mean_mb) for t, mb in samples)
+    return cov / var_t * 3600
+
+
+class RecycleSignal:
+    """Worker-side view of the worker's action slot."""
+
+    def __init__(self, actions, worker_id: int):
+        self.actions = actions
+        self.worker_id = worker_id
+
+    def take(self) -> int:
+        """
+        Read and clear the pending action (call between targets).
+
+        Returns:
+            ACTION_NONE, ACTION_RECYCLE_BROWSER or ACTION_DRAIN
+        """
+        with self.actions.get_lock():
+            action = self.actions[self.worker_id]
+            self.actions[self.worker_id] = ACTION_NONE
+        return action
+
+
+@dataclass
+class WorkerMemoryState:
+    """Supervisor-side memory state of one worker process."""
+
+    worker_id: int
+    pid: int
+    samples: Deque[Tuple[float, float]] = field(default_factory=deque)
+    last: Optional[Dict] = None
+    slope: Optional[float] = None
+    pending: int = ACTION_NONE
+    # Browser already recycled since the tree went over budget
+    browser_recycled: bool = False
+    draining: bool = False
+    browser_recycles: int = 0
+
+
+class WorkerRecycler:
+    """
+    Per-worker RSS budgets with graceful browser / worker recycling.
+
+    One instance per pool manager; the action slots are shared memory, so
+    create it before starting the workers.
+    """
+
+    def __init__(
+        self,
+        pool: str,
+        num_workers: int,
+        worker_budget_mb: float = WORKER_RSS_BUDGET_MB,
+        browser_budget_mb: float = BROWSER_RSS_BUDGET_MB,
+        leak_slope_mb_per_hour: float = WORKER_LEAK_SLOPE_MB_PER_HOUR,
+        interval: float = WORKER_MEMORY_CHECK_INTERVAL,
+        window: int = WORKER_SLOPE_WINDOW,
+        monitor: Optional[MemoryMonitor] = None,
+    ):
+        """
+        Initialize the recycler.
+
+        Args:
+            pool: Pool name for logs and metrics (yp, google, verification)
+            num_workers: Number of worker slots
+            worker_budget_mb: RSS budget per worker tree (0 disables)
+            browser_budget_mb: RSS budget for a worker's browsers (0 disables)
+            leak_slope_mb_per_hour: Drain above this slope (0 disables)
+            interval: Seconds between samples
+            window: Samples kept for the slope
+            monitor: MemoryMonitor to sample with (default: global monitor)
+        """
+        self.pool = pool
+        self.num_workers = num_workers
+        self.worker_budget_mb = worker_budget_mb
+        self.browser_budget_mb = browser_budget_mb
+        self.leak_slope_mb_per_hour = leak_slope_mb_per_hour
+        self.interval = interval
+        self.window = window
+        self.monitor = monitor or get_memory_monitor()
+
+        self.actions = multiprocessing.Array('i', num_workers)
+        self.workers: Dict[int, WorkerMemoryState] = {}
+        self.lock = threading.Lock()
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        logger.info(
+            f"WorkerRecycler initialized for {pool}: worker budget {worker_budget_mb:.0f} MB, "
+            f"browser budget {browser_budget_mb:.0f} MB, leak slope limit "
+            f"{leak_slope_mb_per_hour:.0f} MB/h, interval {interval}s"
+        )
+
+    def signal_for(self, worker_id: int) -> RecycleSignal:
+        """Get the RecycleSignal to pass to a worker process."""
+        return RecycleSignal(self.actions, worker_id)
+
+    def register(self, worker_id: int, pid: int):
+        """
+        Start supervising a (new) worker process.
+
+        Args:
+            worker_id: Worker slot
+            pid: Worker process ID
+        """
+        with self.lock:
+            self.workers[worker_id] = WorkerMemoryState(
+                worker_id=worker_id,
+                pid=pid,
+                samples=deque(maxlen=self.window),
+            )
+        with self.actions.get_lock():
+            self.actions[worker_id] = ACTION_NONE
+
+    def should_respawn(self, worker_id: int, process: multiprocessing.Process) -> bool:
+        """
+        Whether a worker exited because it was drained (and needs replacing).
+
+        Args:
+            worker_id: Worker slot
+            process: The worker's Process
+
+        Returns:
+            True if the process is gone after a drain request
+        """
+        state = self.workers.get(worker_id)
+        return bool(state and state.draining and not process.is_alive())
+
+    def respawn_drained(
+        self,
+        processes: List[multiprocessing.Process],
+        start_worker: Callable[[int], multiprocessing.Process],
+        shutdown_event: Optional[Any] = None,
+    ) -> int:
+        """
+        Replace workers that exited after a drain.
+
+        Args:
+            processes: Worker processes by worker slot (updated in place)
+            start_worker: Starts and register()s a worker for a slot
+            shutdown_event: Stop restarting once this is set
+
+        Returns:
+            Number of workers restarted
+        """
+        restarted = 0
+        for worker_id, process in enumerate(processes):
+            if shutdown_event is not None and shutdown_event.is_set():
+                break
+            if self.should_respawn(worker_id, process):
+                process.join()
+                logger.info(f"{self.pool} worker {worker_id} drained (exit code {process.exitcode}), restarting...")
+                processes[worker_id] = start_worker(worker_id)
+                restarted += 1
+        return restarted
+
+    def wait_for_workers(
+        self,
+        processes: List[multiprocessing.Process],
+        start_worker: Callable[[int], multiprocessing.Process],
+        shutdown_event: Any,
+        poll_interval: float = 5.0,
+    ):
+        """
+        Block until every worker has exited (or shutdown is set), restarting drained ones.
+
+        Liveness is checked before respawning: a worker that drains after
+        the check is still counted alive, so the loop goes round again and
+        respawns it instead of returning.
+
+        Args:
+            processes: Worker processes by worker slot (updated in place)
+            start_worker: Starts and register()s a worker for a slot
+            shutdown_event: Return once this is set
+            poll_interval: Seconds between checks
+        """
+        while not shutdown_event.is_set():
+            alive = any(process.is_alive() for process in processes)
+            if not self.respawn_drained(processes, start_worker, shutdown_event) and not alive:
+                break
+            time.sleep(poll_interval)
+
+    def decide(self, state: WorkerMemoryState, sample: Dict) -> int:
+        """
+        Choose the action for a worker from its latest sample.
+
+        Args:
+            state: Worker state (samples, slope, recycle history)
+            sample: MemoryMonitor.get_process_tree_memory() result
+
+        Returns:
+            ACTION_NONE, ACTION_RECYCLE_BROWSER or ACTION_DRAIN
+        """
+        rss_mb = sample['rss_mb']
+        browser_mb = sample['browser_mb']
+
+        if self.worker_budget_mb and rss_mb > self.worker_budget_mb:
+            # A fresh browser only helps if the rest of the tree fits
+            if browser_mb and not state.browser_recycled and rss_mb - browser_mb < self.worker_budget_mb:
+                return ACTION_RECYCLE_BROWSER
+            return ACTION_DRAIN
+
+        if self.browser_budget_mb and browser_mb > self.browser_budget_mb:
+            return ACTION_RECYCLE_BROWSER
+
+        if (
+            self.leak_slope_mb_per_hour
+            and state.slope is not None
+            and len(state.samples) >= self.window
+            and state.slope > self.leak_slope_mb_per_hour
+        ):
+            return ACTION_DRAIN
+
+        return ACTION_NONE
+
+    def check(self) -> Dict[int, int]:
+        """
+        Sample all workers once and post actions.
+
+        Returns:
+            Dict of worker_id -> action posted in this pass
+        """
+        posted = {}
+
+        with self.lock:
+            states = list(self.workers.values())
+
+        for state in states:
+            if state.draining:
+                continue
+
+            sample = self.monitor.get_process_tree_memory(state.pid)
+            if sample is None:
+                continue
+
+            with self.actions.get_lock():
+                slot = self.actions[state.worker_id]
+
+            if state.pending != ACTION_NONE and slot == ACTION_NONE:
+                # The worker acted on it; a recycled browser starts a new trend
+                if state.pending == ACTION_RECYCLE_BROWSER:
+                    state.browser_recycles += 1
+                    state.browser_recycled = True
+                    state.samples.clear()
+                state.pending = ACTION_NONE
+
+            if self.worker_budget_mb and sample['rss_mb'] <= self.worker_budget_mb:
+                state.browser_recycled = False
+
+            state.samples.append((time.monotonic(), sample['rss_mb']))
+            state.slope = leak_slope(list(state.samples))
+            state.last = sample
+            self._record_gauges(state)
+
+            if state.pending != ACTION_NONE:
+                continue  # still waiting for the worker's next target boundary
+
+            action = self.decide(state, sample)
+            if action == ACTION_NONE:
+                continue
+
+            with self.actions.get_lock():
+                self.actions[state.worker_id] = action
+            state.pending = action
+            state.draining = action == ACTION_DRAIN
+            posted[state.worker_id] = action
+
+            slope = f"{state.slope:+.0f} MB/h" if state.slope is not None else "n/a"
+            logger.warning(
+                f"{self.pool} worker {state.worker_id} (PID {state.pid}): "
+                f"{sample['rss_mb']:.0f} MB total, {sample['browser_mb']:.0f} MB browser "
+                f"({sample['browser_processes']} procs), slope {slope} -> {ACTION_NAMES[action]}"
+            )
+            get_metrics().inc(
+                "washdb_worker_recycles_total", pool=self.pool, action=ACTION_NAMES[action]
+            )
+
+        return posted
+
+    def _record_gauges(self, state: WorkerMemoryState):
+        """Export the worker's memory as gauges (/metrics)."""
+        metrics = get_metrics()
+        labels = {'pool': self.pool, 'worker': str(state.worker_id)}
+        metrics.set_gauge("washdb_worker_rss_mb", round(state.last['rss_mb'], 1), **labels)
+        metrics.set_gauge("washdb_worker_browser_rss_mb", round(state.last['browser_mb'], 1), **labels)
+        if state.slope is not None:
+            metrics.set_gauge("washdb_worker_rss_slope_mb_per_hour", round(state.slope, 1), **labels)
+
+    def start(self):
+        """Start the background sampling thread."""
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(self.interval):
+                try:
+                    self.check()
+                except Exception as e:
+                    logger.error(f"Worker memory check failed: {e}", exc_info=True)
+
+        self._thread = threading.Thread(target=run, name=f"{self.pool}-worker-recycler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background sampling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def get_stats(self) -> List[Dict]:
+        """
+        Get per-worker memory state.
+
+        Returns:
+            List of dicts with worker_id, pid, rss_mb, browser_mb,
+            slope_mb_per_hour, pending, browser_recycles and draining
+        """
+        with self.lock:
+            states = list(self.workers.values())
+
+        return [
+            {
+                'worker_id': state.worker_id,
+                'pid': state.pid,
+                'rss_mb': round(state.last['rss_mb'], 1) if state.last else None,
+                'browser_mb': round(state.last['browser_mb'], 1) if state.last else None,
+                'slope_mb_per_hour': round(state.slope, 1) if state.slope is not None else None,
+                'pending': ACTION_NAMES[state.pending],
+                'browser_recycles': state.browser_recycles,
+                'draining': state.draining,
+            }
+            for state in sorted(states, key=lambda s: s.worker_id)
+        ]
@@ -12,8 +12,9 @@ from typing import Dict, List, Optional, Any
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
-from sqlalchemy import create_engine, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from db.engine_registry import get_engine
 
 from db.models import ScheduledJob, JobExecutionLog
 
@@ -41,7 +42,7 @@ class CronSchedulerService:
             database_url: SQLAlchemy database URL
         """
         self.database_url = database_url
-        self.engine = create_engine(database_url)
+        self.engine = get_engine(database_url)
         self.scheduler = BackgroundScheduler()
 
         # Add event listeners
@@ -152,6 +152,19 @@ class AsyncBrowserPool:
 
         return page, context
 
+    async def recycle_browser(self, worker_id: int):
+        """
+        Close a worker's browser now; the next get_browser() launches a fresh one.
+
+        Used by the memory supervisor (runner.worker_recycler) between targets.
+
+        Args:
+            worker_id: Worker ID whose browser to recycle
+        """
+        async with self.lock:
+            logger.info(f"Recycling browser for worker {worker_id} (memory budget)")
+            await self._close_browser(worker_id)
+
     async def _close_browser(self, worker_id: int):
         """
         Close browser for worker (internal use only).
@@ -6,7 +6,8 @@ and progress tracking for Google Maps/Business scraping.
 
 Features:
 - Queue-based processing
-- Duplicate detection by place_id
+- Duplicate detection by place_id (one query per results page)
+- Batched, pipelined inserts/updates over a shared connection pool
 - Database integration (companies + scrape_logs tables)
 - Progress tracking and resumption
 - Error handling and retry logic
@@ -16,16 +17,44 @@ Date: 2025-11-10
 """
 
 import asyncio
+import os
 import time
-from typing import Dict, List, Optional, Callable
+from collections import defaultdict
+from typing import Dict, List, Optional, Callable, Set, Tuple
 from datetime import datetime
-import psycopg
-from psycopg.rows import dict_row
 
+from db.async_pool import close_async_pool, get_async_pool
+from db.batching import write_batch_async
 from .google_client import GoogleBusinessClient
 from .google_config import GoogleConfig
 from .google_logger import GoogleScraperLogger
 
+# Businesses saved per INSERT batch
+SAVE_BATCH_SIZE = int(os.getenv("GOOGLE_SAVE_BATCH_SIZE", "10"))
+
+# Business field -> companies column, saved when present
+INSERT_FIELDS = {
+    'address': 'address',
+    'phone': 'phone',
+    'website': 'website',
+    'rating': 'rating',
+    'category': 'category',
+    'place_id': 'place_id',
+    'google_business_url': 'google_business_url',
+    'data_completeness': 'data_completeness'
+}
+
+# Business field -> companies column, refreshed for existing records
+UPDATE_FIELDS = {
+    'name': 'name',
+    'address': 'address',
+    'phone': 'phone',
+    'website': 'website',
+    'rating': 'rating',
+    'category': 'category',
+    'data_completeness': 'data_completeness'
+}
+
 
 class GoogleCrawler:
     """
@@ -104,6 +133,21 @@ class GoogleCrawler:
         Returns:
             Dictionary with statistics and results
         """
+        try:
+            return await self._search_and_save(query, location, max_results, scrape_details)
+        finally:
+            # The crawl owns its connection pool; callers often run it in a
+            # fresh event loop (asyncio.run) that ends right after
+            await close_async_pool(self.db_connection_string)
+
+    async def _search_and_save(
+        self,
+        query: str,
+        location: Optional[str],
+        max_results: Optional[int],
+        scrape_details: bool,
+    ) -> Dict:
+        """Run search_and_save (the caller closes the connection pool)."""
         self.logger.operation_started("search_and_save", {
             "query": query,
             "location": location,
@@ -134,6 +178,14 @@ class GoogleCrawler:
                     f"Found {len(search_results)} businesses, processing..."
                 )
 
+                # One query for the whole page instead of one per listing
+                existing_ids = await self._existing_place_ids(
+                    [business.get('place_id') for business in search_results]
+                )
+                seen_ids = set()
+                pending_saves = []
+                pending_updates = []
+
                 # Process each business
                 for idx, business in enumerate(search_results, 1):
                     try:
@@ -142,21 +194,22 @@ class GoogleCrawler:
                             f"Processing business {idx}/{len(search_results)}: {business.get('name', 'Unknown')}"
                         )
 
-                        # Check for duplicate by place_id
+                        # Check for duplicate by place_id (in the database or earlier on this page)
                         place_id = business.get('place_id')
-                        if place_id and await self._is_duplicate(place_id):
+                        if place_id and (place_id in existing_ids or place_id in seen_ids):
                             self.logger.duplicate_detected(place_id, "place_id")
                             self.stats["duplicates_skipped"] += 1
 
                             # Still update existing record if scraping details
-                            if scrape_details and business.get('url'):
-                                await self._update_existing_business(
-                                    place_id,
-                                    business.get('url'),
-                                    client
-                                )
+                            if place_id in existing_ids and scrape_details and business.get('url'):
+                                details = await self._scrape_update(place_id, business['url'], client)
+                                if details:
+                                    pending_updates.append((place_id, details))
                             continue
 
+                        if place_id:
+                            seen_ids.add(place_id)
+
                         # Scrape detailed info if requested
                         business_data = business.copy()
                         if scrape_details and business.get('url'):
@@ -169,17 +222,11 @@ class GoogleCrawler:
                             business_data.update(details)
                             self.stats["businesses_scraped"] += 1
 
-                        # Save to database
-                        saved_id = await self._save_business(business_data, query, location)
-                        if saved_id:
-                            business_data['id'] = saved_id
-                            results.append(business_data)
-                            self.stats["businesses_saved"] += 1
-
-                            self._report_progress(
-                                "saved",
-                                f"Saved: {business_data.get('name', 'Unknown')} (ID: {saved_id})"
-                            )
+                        # Save to database in batches
+                        pending_saves.append(business_data)
+                        if len(pending_saves) >= SAVE_BATCH_SIZE:
+                            results.extend(await self._flush_saves(pending_saves, query, location))
+                            pending_saves = []
 
                     except Exception as e:
                         self.logger.error(
@@ -189,6 +236,9 @@ class GoogleCrawler:
                         )
                         self.stats["errors"] += 1
 
+                results.extend(await self._flush_saves(pending_saves, query, location))
+                await self._update_existing_businesses(pending_updates)
+
             duration = time.time() - start_time
 
             self.logger.operation_completed("search_and_save", "success")
@@ -221,251 +271,307 @@ class GoogleCrawler:
                 "stats": self.stats.copy()
             }
 
-    async def _is_duplicate(self, place_id: str) -> bool:
+    async def _existing_place_ids(self, place_ids: List[str]) -> Set[str]:
         """
-        Check if a business already exists by place_id.
+        Find which place_ids already exist in the companies table.
 
         Args:
-            place_id: Google Place ID
+            place_ids: Google Place IDs (None entries are ignored)
 
         Returns:
-            True if duplicate, False otherwise
+            Set of place_ids already saved
         """
+        place_ids = sorted({place_id for place_id in place_ids if place_id})
+        if not place_ids:
+            return set()
+
         try:
-            async with await psycopg.AsyncConnection.connect(
-                self.db_connection_string,
-                row_factory=dict_row
-            ) as conn:
+            pool = await get_async_pool(self.db_connection_string)
+            async with pool.connection() as conn:
                 async with conn.cursor() as cur:
                     await cur.execute(
-                        "SELECT id FROM companies WHERE place_id = %s LIMIT 1",
-                        (place_id,)
+                        "SELECT place_id FROM companies WHERE place_id = ANY(%s)",
+                        (place_ids,)
                     )
-                    result = await cur.fetchone()
-                    return result is not None
+                    return {row[0] for row in await cur.fetchall()}
 
         except Exception as e:
-            self.logger.error("Error checking duplicate", error=e, context={"place_id": place_id})
-            return False
+            self.logger.error("Error checking duplicates", error=e, context={"place_ids": len(place_ids)})
+            return set()
 
-    async def _update_existing_business(
+    async def _scrape_update(
         self,
         place_id: str,
         business_url: str,
         client: GoogleBusinessClient
-    ):
+    ) -> Optional[Dict]:
         """
-        Update existing business record with fresh data.
+        Scrape fresh data for a business that is already saved.
 
         Args:
             place_id: Google Place ID
             business_url: Google Maps URL
             client: GoogleBusinessClient instance
+
+        Returns:
+            Scraped details, or None if nothing was found
         """
         try:
-            # Scrape fresh data
-            details = await client.scrape_business_details(business_url)
+            return await client.scrape_business_details(business_url) or None
+        except Exception as e:
+            self.logger.error("Error updating existing business", error=e, context={"place_id": place_id})
+            return None
 
-            if not details:
-                return
+    async def _update_existing_businesses(self, updates: List[Tuple[str, Dict]]):
+        """
+        Update existing business records with fresh data.
 
-            # Update database
-            async with await psycopg.AsyncConnection.connect(
-                self.db_connection_string
-            ) as conn:
-                async with conn.cursor() as cur:
-                    # Build update query for available fields
-                    update_fields = []
-                    values = []
-
-                    field_mapping = {
-                        'name': 'name',
-                        'address': 'address',
-                        'phone': 'phone',
-                        'website': 'website',
-                        'rating': 'rating',
-                        'category': 'category',
-                        'data_completeness': 'data_completeness'
-                    }
-
-                    for field, col in field_mapping.items():
-                        if field in details and details[field]:
-                            update_fields.append(f"{col} = %s")
-                            values.append(details[field])
-
-                    # Always update scrape metadata
-                    update_fields.extend([
-                        "scrape_method = %s",
-                        "scrape_timestamp = %s",
-                        "last_scrape_attempt = %s",
-                        "updated_at = CURRENT_TIMESTAMP"
-                    ])
-                    values.extend([
-                        "playwright",
-                        datetime.now(),
-                        datetime.now()
-                    ])
-
-                    # Add place_id for WHERE clause
-                    values.append(place_id)
-
-                    query = f"""
-                        UPDATE companies
-                        SET {', '.join(update_fields)}
-                        WHERE place_id = %s
-                    """
-
-                    await cur.execute(query, values)
-                    await conn.commit()
-
-                    self.logger.database_update(
-                        "companies",
-                        0,  # Don't have ID, using place_id
-                        list(field_mapping.values())
-                    )
+        Rows updating the same set of columns share one statement, sent
+        with executemany in pipeline mode.
+
+        Args:
+            updates: (place_id, scraped details) pairs
+        """
+        if not updates:
+            return
+
+        now = datetime.now()
+        groups = defaultdict(list)
+        for place_id, details in updates:
+            columns = tuple(col for field, col in UPDATE_FIELDS.items() if details.get(field))
+            values = [details[field] for field, col in UPDATE_FIELDS.items() if details.get(field)]
+            # Always update scrape metadata, then place_id for the WHERE clause
+            groups[columns].append((*values, "playwright", now, now, place_id))
+
+        try:
+            pool = await get_async_pool(self.db_connection_string)
+            async with pool.connection() as conn:
+                async with conn.pipeline():
+                    async with conn.cursor() as cur:
+                        for columns, rows in groups.items():
+                            update_fields = [f"{col} = %s" for col in columns] + [
+                                "scrape_method = %s",
+                                "scrape_timestamp = %s",
+                                "last_scrape_attempt = %s",
+                                "updated_at = CURRENT_TIMESTAMP"
+                            ]
+                            await cur.executemany(
+                                f"""
+                                UPDATE companies
+                                SET {', '.join(update_fields)}
+                                WHERE place_id = %s
+                                """,
+                                rows
+                            )
+
+            for place_id, _ in updates:
+                self.logger.database_update(
+                    "companies",
+                    0,  # Don't have ID, using place_id
+                    list(UPDATE_FIELDS.values())
+                )
 
         except Exception as e:
-            self.logger.error("Error updating existing business", error=e, context={"place_id": place_id})
+            self.logger.error(
+                "Error updating existing businesses",
+                error=e,
+                context={"place_ids": [place_id for place_id, _ in updates]}
+            )
 
-    async def _save_business(
+    async def _flush_saves(
         self,
-        business_data: Dict,
+        businesses: List[Dict],
         search_query: str = None,
         search_location: str = None
-    ) -> Optional[int]:
+    ) -> List[Dict]:
         """
-        Save business to database.
+        Save a batch of businesses and update stats and progress.
 
         Args:
-            business_data: Business information dictionary
+            businesses: Business information dictionaries
             search_query: Original search query
             search_location: Original search location
 
         Returns:
-            Inserted company ID or None
+            Saved businesses, with their new 'id'
         """
-        try:
-            async with await psycopg.AsyncConnection.connect(
-                self.db_connection_string
-            ) as conn:
-                async with conn.cursor() as cur:
-                    # Prepare data
-                    query_parts = []
-                    values = []
-
-                    # Required fields
-                    query_parts.append("name")
-                    values.append(business_data.get('name', 'Unknown'))
-
-                    # Source
-                    query_parts.append("source")
-                    values.append("Google")
-
-                    # Optional fields
-                    optional_fields = {
-                        'address': 'address',
-                        'phone': 'phone',
-                        'website': 'website',
-                        'rating': 'rating',
-                        'category': 'category',
-                        'place_id': 'place_id',
-                        'google_business_url': 'google_business_url',
-                        'data_completeness': 'data_completeness'
-                    }
-
-                    for field, col in optional_fields.items():
-                        if field in business_data and business_data[field]:
-                            query_parts.append(col)
-                            values.append(business_data[field])
-
-                    # Scraping metadata
-                    query_parts.extend([
-                        "scrape_method",
-                        "scrape_timestamp",
-                        "last_scrape_attempt"
-                    ])
-                    values.extend([
-                        "playwright",
-                        datetime.now(),
-                        datetime.now()
-                    ])
-
-                    # Build INSERT query
-                    placeholders = ', '.join(['%s'] * len(values))
-                    query = f"""
-                        INSERT INTO companies ({', '.join(query_parts)})
-                        VALUES ({placeholders})
-                        RETURNING id
-                    """
+        if not businesses:
+            return []
+
+        saved = []
+        company_ids = await self._save_businesses(businesses, search_query, search_location)
+        for business_data, saved_id in zip(businesses, company_ids):
+            if not saved_id:
+                continue
+            business_data['id'] = saved_id
+            saved.append(business_data)
+            self.stats["businesses_saved"] += 1
 
-                    await cur.execute(query, values)
-                    result = await cur.fetchone()
-                    company_id = result[0] if result else None
+            self._report_progress(
+                "saved",
+                f"Saved: {business_data.get('name', 'Unknown')} (ID: {saved_id})"
+            )
 
-                    await conn.commit()
+        return saved
 
-                    # Log to scrape_logs table
-                    if company_id:
-                        await self._log_scrape(
-                            conn,
-                            company_id,
-                            "success",
-                            list(optional_fields.values())
-                        )
+    async def _save_businesses(
+        self,
+        businesses: List[Dict],
+        search_query: str = None,
+        search_location: str = None
+    ) -> List[Optional[int]]:
+        """
+        Save businesses to database in one transaction.
 
-                    self.logger.database_update("companies", company_id or 0, query_parts)
+        If the batch fails (e.g. one row violates a constraint), each
+        business is retried on its own so the rest are still saved.
 
-                    return company_id
+        Args:
+            businesses: Business information dictionaries
+            search_query: Original search query
+            search_location: Original search location
 
-        except Exception as e:
-            self.logger.database_error("insert", e, {"name": business_data.get('name')})
-            return None
+        Returns:
+            Inserted company IDs (None where a business was not saved),
+            in the order of businesses
+        """
+        rows = [self._company_row(business_data) for business_data in businesses]
+
+        async def insert(batch: List[Dict]) -> List[Optional[int]]:
+            pool = await get_async_pool(self.db_connection_string)
+            async with pool.connection() as conn:
+                return await self._insert_companies(conn, batch)
+
+        outcome = await write_batch_async(insert, rows)
+
+        if outcome.batch_error is not None:
+            self.logger.database_error("batch insert", outcome.batch_error, {"batch_size": len(rows)})
+        for index, error in outcome.errors.items():
+            self.logger.database_error("insert", error, {"name": businesses[index].get('name')})
+
+        for indexes, company_ids in outcome.calls:
+            for index, company_id in zip(indexes, company_ids):
+                self.logger.database_update("companies", company_id or 0, list(rows[index]))
+
+        return outcome.record_results()
+
+    def _company_row(self, business_data: Dict) -> Dict:
+        """
+        Build the companies column values for a business.
+
+        Args:
+            business_data: Business information dictionary
+
+        Returns:
+            Column -> value mapping (optional fields only when present)
+        """
+        row = {
+            # Required fields
+            "name": business_data.get('name', 'Unknown'),
+            "source": "Google",
+        }
+
+        for field, col in INSERT_FIELDS.items():
+            if business_data.get(field):
+                row[col] = business_data[field]
+
+        # Scraping metadata
+        now = datetime.now()
+        row.update({
+            "scrape_method": "playwright",
+            "scrape_timestamp": now,
+            "last_scrape_attempt": now,
+        })
+        return row
+
+    async def _insert_companies(self, conn, rows: List[Dict]) -> List[Optional[int]]:
+        """
+        Insert company rows and their scrape_logs entries (caller commits).
+
+        Rows with the same columns share one INSERT ... RETURNING id,
+        sent with executemany in pipeline mode.
+
+        Args:
+            conn: Database connection
+            rows: Column -> value mappings from _company_row
+
+        Returns:
+            Inserted company IDs in the order of rows
+        """
+        company_ids: List[Optional[int]] = [None] * len(rows)
+        groups = defaultdict(list)
+        for index, row in enumerate(rows):
+            groups[tuple(row)].append(index)
 
-    async def _log_scrape(
+        async with conn.pipeline():
+            async with conn.cursor() as cur:
+                for columns, indexes in groups.items():
+                    placeholders = ', '.join(['%s'] * len(columns))
+                    await cur.executemany(
+                        f"""
+                        INSERT INTO companies ({', '.join(columns)})
+                        VALUES ({placeholders})
+                        RETURNING id
+                        """,
+                        [tuple(rows[index][col] for col in columns) for index in indexes],
+                        returning=True
+                    )
+                    # One result set per inserted row
+                    for index in indexes:
+                        result = await cur.fetchone()
+                        company_ids[index] = result[0] if result else None
+                        cur.nextset()
+
+                # Log to scrape_logs table
+                await self._log_scrapes(
+                    cur,
+                    [company_id for company_id in company_ids if company_id],
+                    "success",
+                    list(INSERT_FIELDS.values())
+                )
+
+        return company_ids
+
+    async def _log_scrapes(
         self,
-        conn,
-        company_id: int,
+        cur,
+        company_ids: List[int],
         status: str,
         fields_updated: List[str],
         error_message: str = None,
         duration_ms: int = None
     ):
         """
-        Log scrape attempt to scrape_logs table.
+        Log scrape attempts to scrape_logs table.
 
         Args:
-            conn: Database connection
-            company_id: Company ID
+            cur: Database cursor
+            company_ids: Company IDs
             status: Scrape status (success, partial, failed)
             fields_updated: List of fields that were updated
             error_message: Error message if failed
             duration_ms: Scrape duration in milliseconds
         """
-        try:
-            async with conn.cursor() as cur:
-                await cur.execute(
-                    """
-                    INSERT INTO scrape_logs (
-                        company_id,
-                        scrape_method,
-                        status,
-                        fields_updated,
-                        error_message,
-                        scrape_duration_ms
-                    ) VALUES (%s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        company_id,
-                        "playwright",
-                        status,
-                        fields_updated,
-                        error_message,
-                        duration_ms
-                    )
-                )
-            # Note: Don't commit here, let the caller commit
-        except Exception as e:
-            self.logger.error("Error logging scrape", error=e)
+        if not company_ids:
+            return
+
+        await cur.executemany(
+            """
+            INSERT INTO scrape_logs (
+                company_id,
+                scrape_method,
+                status,
+                fields_updated,
+                error_message,
+                scrape_duration_ms
+            ) VALUES (%s, %s, %s, %s, %s, %s)
+            """,
+            [
+                (company_id, "playwright", status, fields_updated, error_message, duration_ms)
+                for company_id in company_ids
+            ]
+        )
+        # Note: Don't commit here, let the caller commit
 
     def _calculate_avg_quality(self, results: List[Dict]) -> float:
         """Calculate average quality score from results."""
@@ -15,13 +15,17 @@ Filtering logic:
 2. Check for ecommerce domains
 3. Check for marketplace/directory domains
 4. Calculate confidence score
+
+Keyword and domain lists are compiled once by runner.keyword_matcher and
+shared with the other discovery filters.
 """
 
 import re
 from pathlib import Path
-from typing import Dict, Set, Tuple, List
+from typing import Dict, Optional, Set, Tuple, List
 from urllib.parse import urlparse
 
+from runner.keyword_matcher import DomainMatcher, KeywordMatcher, RuleHit, get_file_matcher, load_keywords
 from runner.logging_setup import get_logger
 
 logger = get_logger("google_filter")
@@ -44,8 +48,10 @@ class GoogleFilter:
             anti_keywords_file: Path to shared anti-keywords file
             positive_hints_file: Path to positive hint phrases
         """
-        self.anti_keywords = self._load_set(anti_keywords_file)
-        self.positive_hints = self._load_set(positive_hints_file)
+        self.anti_matcher = get_file_matcher(anti_keywords_file)
+        self.hint_matcher = get_file_matcher(positive_hints_file)
+        self.anti_keywords = set(self.anti_matcher.keywords)
+        self.positive_hints = set(self.hint_matcher.keywords)
 
         # Ecommerce and marketplace domains to exclude
         self.blocked_domains = {
@@ -76,6 +82,9 @@ class GoogleFilter:
             'ecommerce', 'e-commerce', 'online-store', 'webstore'
         }
 
+        self.domain_matcher = DomainMatcher(self.blocked_domains)
+        self.indicator_matcher = KeywordMatcher(sorted(self.ecommerce_indicators))
+
         logger.info(f"✓ Google Filter initialized:")
         logger.info(f"  Anti-keywords: {len(self.anti_keywords)} terms")
         logger.info(f"  Positive hints: {len(self.positive_hints)} phrases")
@@ -83,15 +92,7 @@ class GoogleFilter:
 
     def _load_set(self, file_path: str) -> Set[str]:
         """Load a text file into a set (case-insensitive)."""
-        path = Path(file_path)
-        if not path.exists():
-            logger.warning(f"{file_path} not found")
-            return set()
-
-        with open(path, 'r', encoding='utf-8') as f:
-            items = {line.strip().lower() for line in f if line.strip()}
-
-        return items
+        return set(load_keywords(file_path))
 
     def _normalize(self, text: str) -> str:
         """Normalize text for comparison (lowercase, strip)."""
@@ -109,16 +110,7 @@ class GoogleFilter:
         Returns:
             Tuple of (has_keyword, list_of_matches)
         """
-        if not text:
-            return False, []
-
-        text_lower = self._normalize(text)
-        matches = []
-
-        for keyword in self.anti_keywords:
-            if keyword in text_lower:
-                matches.append(keyword)
-
+        matches = self.anti_matcher.find_all(text)
         return len(matches) > 0, matches
 
     def _has_positive_hint(self, text: str) -> Tuple[bool, List[str]]:
@@ -131,16 +123,7 @@ class GoogleFilter:
         Returns:
             Tuple of (has_hint, list_of_matches)
         """
-        if not text:
-            return False, []
-
-        text_lower = self._normalize(text)
-        matches = []
-
-        for hint in self.positive_hints:
-            if hint in text_lower:
-                matches.append(hint)
-
+        matches = self.hint_matcher.find_all(text)
         return len(matches) > 0, matches
 
     def _is_blocked_domain(self, url: str) -> Tuple[bool, str]:
@@ -164,20 +147,15 @@ class GoogleFilter:
             if domain.startswith('www.'):
                 domain = domain[4:]
 
-            # Check exact domain matches
-            if domain in self.blocked_domains:
+            # Check blocked domains and their subdomains (e.g., amazon.com matches smile.amazon.com)
+            if self.domain_matcher.match(domain):
                 return True, domain
 
-            # Check if any blocked domain is a suffix (e.g., amazon.com matches smile.amazon.com)
-            for blocked in self.blocked_domains:
-                if domain.endswith('.' + blocked) or domain == blocked:
-                    return True, domain
-
             # Check for ecommerce indicators in domain
-            for indicator in self.ecommerce_indicators:
-                if indicator in domain:
-                    logger.debug(f"Ecommerce indicator '{indicator}' found in domain: {domain}")
-                    return True, domain
+            indicator = self.indicator_matcher.first(domain)
+            if indicator:
+                logger.debug(f"Ecommerce indicator '{indicator}' found in domain: {domain}")
+                return True, domain
 
             return False, domain
 
@@ -185,12 +163,52 @@ class GoogleFilter:
             logger.warning(f"Failed to parse URL '{url}': {e}")
             return False, ""
 
-    def filter_business(self, business_data: Dict) -> Dict:
+    @staticmethod
+    def _combined_text(business_data: Dict) -> str:
+        """Name, description and categories of a business, as matched."""
+        categories = business_data.get('categories', [])
+        return ' '.join([
+            business_data.get('name', ''),
+            business_data.get('description', ''),
+            ' '.join(categories) if isinstance(categories, list) else str(categories)
+        ])
+
+    def explain(self, business_data: Dict, scan: Optional[Dict[str, List[str]]] = None) -> List[RuleHit]:
+        """
+        List every filter rule that matches a business.
+
+        Args:
+            business_data: Business dict
+            scan: Keyword matches (computed if not given)
+
+        Returns:
+            List of RuleHit
+        """
+        if scan is None:
+            scan = self._scan_batch([business_data])[0]
+
+        hits = [RuleHit('anti_keyword', 'text', kw) for kw in scan['anti_keywords']]
+        hits += [RuleHit('positive_hint', 'text', kw) for kw in scan['positive_hints']]
+
+        is_blocked, domain = self._is_blocked_domain(business_data.get('website', ''))
+        if is_blocked:
+            hits.append(RuleHit('blocked_domain', 'website', domain))
+        return hits
+
+    def _scan_batch(self, businesses: List[Dict]) -> List[Dict[str, List[str]]]:
+        """Match the keyword lists against many businesses in one call per list."""
+        texts = [self._combined_text(business) for business in businesses]
+        anti = self.anti_matcher.find_all_batch(texts)
+        hints = self.hint_matcher.find_all_batch(texts)
+        return [{'anti_keywords': a, 'positive_hints': h} for a, h in zip(anti, hints)]
+
+    def filter_business(self, business_data: Dict, scan: Optional[Dict[str, List[str]]] = None) -> Dict:
         """
         Filter a single Google Maps business.
 
         Args:
             business_data: Dict with keys: name, description, categories, url, website
+            scan: Keyword matches from _scan_batch() (computed if not given)
 
         Returns:
             Dict with:
@@ -198,19 +216,14 @@ class GoogleFilter:
             - confidence: Float 0-1 (confidence score)
             - filter_reason: String (reason for rejection if failed)
             - signals: Dict of positive/negative signals
+            - rule_hits: Every rule that matched, as 'rule:field:match' strings
         """
         name = business_data.get('name', '')
-        description = business_data.get('description', '')
-        categories = business_data.get('categories', [])
         url = business_data.get('url', '')  # Google Maps URL
         website = business_data.get('website', '')  # Business website
 
-        # Combine text for checking
-        combined_text = ' '.join([
-            name,
-            description,
-            ' '.join(categories) if isinstance(categories, list) else str(categories)
-        ])
+        if scan is None:
+            scan = self._scan_batch([business_data])[0]
 
         result = {
             'passed': True,
@@ -221,12 +234,13 @@ class GoogleFilter:
                 'positive_hints': [],
                 'blocked_domain': False,
                 'domain': ''
-            }
+            },
+            'rule_hits': [str(hit) for hit in self.explain(business_data, scan)],
         }
 
         # Check for anti-keywords in business name/description
-        has_anti, anti_matches = self._has_anti_keyword(combined_text)
-        if has_anti:
+        anti_matches = scan['anti_keywords']
+        if anti_matches:
             result['passed'] = False
             result['confidence'] = 0.2
             result['filter_reason'] = f"Anti-keywords in business info: {', '.join(anti_matches[:3])}"
@@ -246,8 +260,8 @@ class GoogleFilter:
             return result
 
         # Check for positive hints (boosts confidence)
-        has_positive, positive_matches = self._has_positive_hint(combined_text)
-        if has_positive:
+        positive_matches = scan['positive_hints']
+        if positive_matches:
             result['confidence'] = 0.8
             result['signals']['positive_hints'] = positive_matches
             logger.debug(f"BOOSTED: {name} - Positive hints: {positive_matches}")
@@ -271,8 +285,8 @@ class GoogleFilter:
         passed = []
         filtered = []
 
-        for business in businesses:
-            filter_result = self.filter_business(business)
+        for business, scan in zip(businesses, self._scan_batch(businesses)):
+            filter_result = self.filter_business(business, scan)
 
             # Add filter metadata to business
             business['filter_result'] = filter_result
@@ -29,6 +29,15 @@ from pathlib import Path
 from typing import List, Optional, Dict
 
 from runner.logging_setup import setup_logging
+from runner.profiler import install_profiler, trace_target
+from runner.worker_recycler import (
+    ACTION_DRAIN,
+    ACTION_NONE,
+    ACTION_RECYCLE_BROWSER,
+    RecycleSignal,
+    WorkerRecycler,
+)
+from scrape_google.browser_pool import get_browser_pool
 from scrape_google.google_crawl_city_first import crawl_single_target
 from scrape_google.google_filter import GoogleFilter
 from db.models import GoogleTarget, Company
@@ -51,7 +60,8 @@ async def async_worker_main(
     worker_id: int,
     state_ids: List[str],
     shutdown_event: multiprocessing.Event,
-    config: dict
+    config: dict,
+    recycle_signal: Optional[RecycleSignal] = None
 ):
     """
     Async main function for a single state worker process.
@@ -62,12 +72,15 @@ async def async_worker_main(
     3. Acquires targets from assigned states using row-level locking
     4. Processes targets using async Google crawl logic
     5. Random delay between targets (10-20 seconds)
+    6. Between targets, recycles its browser or drains (exits for a fresh
+       process) when the pool's memory supervisor asks it to
 
     Args:
         worker_id: Worker number (0-4)
         state_ids: List of assigned state codes (e.g., ["CA", "MT", "RI", "MS", "ND"])
         shutdown_event: Multiprocessing event to signal shutdown
         config: Configuration dictionary
+        recycle_signal: Action slot of the pool's WorkerRecycler (optional)
     """
     # Set up worker-specific logger
     worker_logger = setup_logging(f"google_worker_{worker_id}", log_file=f"logs/google_state_worker_{worker_id}.log")
@@ -100,6 +113,15 @@ async def async_worker_main(
 
         while not shutdown_event.is_set():
             try:
+                # Memory supervisor: act between targets, never mid-target
+                action = recycle_signal.take() if recycle_signal else ACTION_NONE
+                if action == ACTION_RECYCLE_BROWSER:
+                    await (await get_browser_pool()).recycle_browser(worker_id)
+                elif action == ACTION_DRAIN:
+                    worker_logger.info("Memory budget exceeded, draining worker for a fresh process...")
+                    await (await get_browser_pool()).cleanup()
+                    break
+
                 # Acquire next target ID from assigned states
                 target_id = acquire_target_for_worker(state_ids, worker_logger)
 
@@ -131,13 +153,14 @@ async def async_worker_main(
 
                     # Scrape the target using async Google crawl
                     # This will use browser pool internally
-                    accepted_results, stats = await crawl_single_target(
-                        target=target,
-                        session=session,
-                        scrape_details=config.get("scrape_details", True),
-                        save_to_db=True,
-                        worker_id=worker_id
-                    )
+                    with trace_target(f"target:{target.id}:{target.city}-{target.state_id}"):
+                        accepted_results, stats = await crawl_single_target(
+                            target=target,
+                            session=session,
+                            scrape_details=config.get("scrape_details", True),
+                            save_to_db=True,
+                            worker_id=worker_id
+                        )
 
                     # Log results
                     if accepted_results:
@@ -189,14 +212,23 @@ async def async_worker_main(
         worker_logger.info(f"Google Worker {worker_id} stopped")
 
 
-def worker_main(worker_id: int, state_ids: List[str], shutdown_event: multiprocessing.Event, config: dict):
+def worker_main(
+    worker_id: int,
+    state_ids: List[str],
+    shutdown_event: multiprocessing.Event,
+    config: dict,
+    recycle_signal: Optional[RecycleSignal] = None
+):
     """
     Synchronous wrapper for async worker main.
 
     This allows us to run async code in a multiprocessing context.
     """
+    # Sampling profiler: kill -USR2 <worker pid>
+    install_profiler(f"google_worker_{worker_id}")
+
     # Run the async worker main
-    asyncio.run(async_worker_main(worker_id, state_ids, shutdown_event, config))
+    asyncio.run(async_worker_main(worker_id, state_ids, shutdown_event, config, recycle_signal))
 
 
 def acquire_target_for_worker(state_ids: List[str], logger) -> Optional[int]:
@@ -312,30 +344,40 @@ def start_workers(worker_count: int = 5, config: Optional[Dict] = None):
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Start workers
-    processes = []
+    # Memory supervisor: per-worker RSS budgets, browser recycling, drains
+    recycler = WorkerRecycler("google", worker_count)
+    recycler.start()
 
-    for worker_id in range(worker_count):
+    def start_worker(worker_id: int) -> multiprocessing.Process:
         state_ids = WORKER_STATES[worker_id]
 
         logger.info(f"Starting worker {worker_id} with states: {state_ids}")
 
         process = multiprocessing.Process(
             target=worker_main,
-            args=(worker_id, state_ids, shutdown_event, config),
+            args=(worker_id, state_ids, shutdown_event, config, recycler.signal_for(worker_id)),
             name=f"google_worker_{worker_id}"
         )
 
         process.start()
-        processes.append(process)
+        recycler.register(worker_id, process.pid)
+        return process
+
+    # Start workers
+    processes = []
+
+    for worker_id in range(worker_count):
+        processes.append(start_worker(worker_id))
 
         # Small delay between worker starts
         time.sleep(1)
 
     logger.info(f"All {worker_count} workers started")
 
-    # Wait for all workers to complete
+    # Wait for all workers to complete, restarting drained ones
     try:
+        recycler.wait_for_workers(processes, start_worker, shutdown_event)
+
         for process in processes:
             process.join()
     except KeyboardInterrupt:
@@ -352,6 +394,7 @@ def start_workers(worker_count: int = 5, config: Optional[Dict] = None):
                 logger.warning(f"Force terminating worker {process.name}")
                 process.terminate()
 
+    recycler.stop()
     logger.info("All workers stopped")
 
 
@@ -12,6 +12,8 @@ from typing import Dict, Optional
 import anthropic
 from dotenv import load_dotenv
 
+from runner.metrics import stage_timer
+
 load_dotenv()
 
 
@@ -65,15 +67,16 @@ class ClaudeVerifier:
 
         try:
             # Call Claude API
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=1000,
-                temperature=0.0,  # Deterministic
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
+            with stage_timer("claude", "llm_call"):
+                message = self.client.messages.create(
+                    model=self.model,
+                    max_tokens=1000,
+                    temperature=0.0,  # Deterministic
+                    messages=[{
+                        "role": "user",
+                        "content": prompt
+                    }]
+                )
 
             response = message.content[0].text
 
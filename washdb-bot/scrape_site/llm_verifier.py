@@ -23,6 +23,7 @@ import re
 import requests
 from typing import Dict, List, Optional, Tuple
 
+from runner.metrics import stage_timer
 from verification.config_verifier import (
     LLM_SERVICES_TEXT_LIMIT,
     LLM_ABOUT_TEXT_LIMIT,
@@ -455,12 +456,13 @@ Answer (Yes/No):"""
                 }
             }
 
-            response = requests.post(
-                self.api_url,
-                json=payload,
-                timeout=15.0  # Slightly longer timeout for deep verification
-            )
-            response.raise_for_status()
+            with stage_timer("verification", "llm_call"):
+                response = requests.post(
+                    self.api_url,
+                    json=payload,
+                    timeout=15.0  # Slightly longer timeout for deep verification
+                )
+                response.raise_for_status()
 
             result = response.json()
             return result.get("response", "").strip()
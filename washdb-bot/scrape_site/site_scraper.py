@@ -19,6 +19,7 @@ from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
 from runner.logging_setup import get_logger
+from runner.metrics import stage_timer
 from scrape_site.site_parse import parse_site_content
 
 
@@ -71,19 +72,21 @@ def fetch_page(url: str, delay: float = None) -> Optional[str]:
 
     # Apply rate limiting
     if delay > 0:
-        time.sleep(delay)
+        with stage_timer("site", "wait"):
+            time.sleep(delay)
 
     logger.debug(f"Fetching: {url}")
 
     try:
-        response = requests.get(
-            url,
-            headers=HEADERS,
-            timeout=REQUEST_TIMEOUT,
-            allow_redirects=True,
-        )
-
-        response.raise_for_status()
+        with stage_timer("site", "fetch"):
+            response = requests.get(
+                url,
+                headers=HEADERS,
+                timeout=REQUEST_TIMEOUT,
+                allow_redirects=True,
+            )
+
+            response.raise_for_status()
         logger.debug(f"✓ Fetched {url} ({len(response.text)} bytes)")
         return response.text
 
@@ -282,7 +285,8 @@ def scrape_website(url: str) -> dict:
             return minimal_result
 
         # Parse homepage
-        homepage_result = parse_site_content(homepage_html, url)
+        with stage_timer("site", "parse"):
+            homepage_result = parse_site_content(homepage_html, url)
 
         # Check if we need to fetch additional pages
         needs_contact = not (homepage_result.get("phones") and homepage_result.get("emails"))
@@ -323,7 +327,8 @@ def scrape_website(url: str) -> dict:
 
             if page_html:
                 try:
-                    page_result = parse_site_content(page_html, url)
+                    with stage_timer("site", "parse"):
+                        page_result = parse_site_content(page_html, url)
                     additional_results.append(page_result)
                     logger.debug(f"Parsed {page_type} page successfully")
                 except Exception as e:
@@ -27,8 +27,10 @@ from datetime import datetime, timedelta, timezone
 from typing import Generator, Optional, Dict, List
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
-from db.models import YelpTarget, Company, canonicalize_url, domain_from_url
+from db.models import YelpTarget, canonicalize_url, domain_from_url
+from db.async_writer import AsyncBatchWriter, upsert_companies
 from runner.logging_setup import get_logger
+from runner.metrics import record_items, stage_timer
 from scrape_yelp.yelp_parse import YelpParser
 from scrape_yelp.yelp_filter import YelpFilter
 from scrape_yelp.yelp_stealth import (
@@ -80,7 +82,8 @@ async def fetch_yelp_search(
     url = f"https://www.yelp.com/search?find_desc={encoded_query}&find_loc={encoded_location}"
 
     # Add human-like random delay before starting
-    await asyncio.sleep(random.uniform(2.0, 5.0))
+    with stage_timer("yelp", "wait"):
+        await asyncio.sleep(random.uniform(2.0, 5.0))
 
     last_exception = None
 
@@ -122,7 +125,8 @@ async def fetch_yelp_search(
                 try:
                     # Navigate to Yelp search
                     logger.info(f"Navigating to Yelp: {url}")
-                    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                    with stage_timer("yelp", "fetch"):
+                        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
 
                     # Simulate human-like page load behavior
                     await DataDomeBypass.simulate_human_page_load(page)
@@ -184,7 +188,8 @@ async def fetch_yelp_search(
                             await page.evaluate('window.scrollBy(0, window.innerHeight)')
 
                             # Wait for new results to load
-                            await asyncio.sleep(scroll_delay)
+                            with stage_timer("yelp", "wait"):
+                                await asyncio.sleep(scroll_delay)
 
                             # Occasional mouse movement while waiting
                             if random.random() < 0.3:  # 30% chance
@@ -205,13 +210,17 @@ async def fetch_yelp_search(
                             break
 
                     # Simulate reading the page with realistic behavior
-                    await DataDomeBypass.simulate_reading_page(page, duration=random.uniform(2.0, 4.0))
+                    with stage_timer("yelp", "wait"):
+                        await DataDomeBypass.simulate_reading_page(page, duration=random.uniform(2.0, 4.0))
 
                     # Extract business cards from search results
-                    results = await YelpParser.extract_search_results(page, max_results)
+                    with stage_timer("yelp", "parse"):
+                        results = await YelpParser.extract_search_results(page, max_results)
+                    record_items("yelp", "parse", len(results))
 
                     # Get final HTML
-                    html = await page.content()
+                    with stage_timer("yelp", "fetch"):
+                        html = await page.content()
 
                     logger.info(f"Extracted {len(results)} business cards from search")
 
@@ -244,7 +253,8 @@ async def fetch_yelp_search(
                 # Calculate exponential backoff delay
                 backoff_delay = get_exponential_backoff_delay(attempt, base_delay=3.0, max_delay=30.0)
                 logger.info(f"Retrying in {backoff_delay:.1f} seconds...")
-                await asyncio.sleep(backoff_delay)
+                with stage_timer("yelp", "wait"):
+                    await asyncio.sleep(backoff_delay)
             else:
                 # Last attempt failed
                 logger.error(f"All {max_retries} fetch attempts failed")
@@ -290,13 +300,16 @@ async def scrape_business_details(business_url: str, max_retries: int = 2) -> di
                 page = await context.new_page()
 
                 try:
-                    await page.goto(business_url, wait_until="domcontentloaded", timeout=20000)
+                    with stage_timer("yelp", "fetch"):
+                        await page.goto(business_url, wait_until="domcontentloaded", timeout=20000)
 
                     # Wait for business info to load
-                    await asyncio.sleep(random.uniform(2.0, 4.0))
+                    with stage_timer("yelp", "wait"):
+                        await asyncio.sleep(random.uniform(2.0, 4.0))
 
                     # Use YelpParser to extract all fields
-                    details = await YelpParser.extract_all_fields(page)
+                    with stage_timer("yelp", "parse"):
+                        details = await YelpParser.extract_all_fields(page)
 
                     return details
 
@@ -331,49 +344,34 @@ async def scrape_business_details(business_url: str, max_retries: int = 2) -> di
                 return {}
 
 
-def save_business_to_db(business_data: dict, session) -> Optional[int]:
+def company_row(business_data: dict) -> dict:
     """
-    Save business to companies table.
+    Build the companies row for a business (saved by the DB writer).
+
+    companies has no Yelp rating columns, so the Yelp rating and review
+    count are kept in parse_metadata.
 
     Args:
         business_data: Business information dictionary
-        session: SQLAlchemy session
 
     Returns:
-        Company ID if saved successfully, None otherwise
+        Column -> value mapping for upsert_companies
     """
-    try:
-        # Check if business already exists by website
-        website = business_data.get('website')
-        if website:
-            existing = session.query(Company).filter_by(website=website).first()
-            if existing:
-                logger.debug(f"Business already exists in DB: {business_data.get('name')} ({website})")
-                return existing.id
-
-        # Create new company record
-        company = Company(
-            name=business_data.get('name', 'Unknown'),
-            website=website,
-            domain=business_data.get('domain'),
-            phone=business_data.get('phone'),
-            address=business_data.get('address'),
-            source='Yelp',
-            rating_yelp=business_data.get('rating'),
-            reviews_yelp=business_data.get('reviews_count'),
-            active=True,
-        )
-
-        session.add(company)
-        session.commit()
-
-        logger.debug(f"Saved business to DB: {company.name} (ID: {company.id})")
-        return company.id
-
-    except Exception as e:
-        logger.error(f"Failed to save business to database: {e}")
-        session.rollback()
-        return None
+    return {
+        'name': business_data.get('name', 'Unknown'),
+        'website': business_data.get('website'),
+        'domain': business_data.get('domain'),
+        'phone': business_data.get('phone'),
+        'address': business_data.get('address'),
+        'source': 'Yelp',
+        'parse_metadata': {
+            'yelp': {
+                'rating': business_data.get('rating'),
+                'reviews_count': business_data.get('reviews_count'),
+            }
+        },
+        'active': True,
+    }
 
 
 async def crawl_single_target(
@@ -381,6 +379,7 @@ async def crawl_single_target(
     session,
     scrape_details: bool = True,
     save_to_db: bool = True,
+    writer: Optional[AsyncBatchWriter] = None,
 ) -> tuple[list[dict], dict]:
     """
     Crawl a single target (city × category).
@@ -391,14 +390,15 @@ async def crawl_single_target(
     3. Extract business cards
     4. Optionally scrape detailed info for each business
     5. Check for duplicates by domain
-    6. Save to companies table
-    7. Update target status to DONE
+    6. Queue accepted businesses for the companies table (write-behind)
+    7. Wait for the writes, then update target status to DONE
 
     Args:
         target: YelpTarget database object
         session: SQLAlchemy session
         scrape_details: Whether to scrape detailed info for each business
         save_to_db: Whether to save results to database
+        writer: Shared DB writer (one is created for this target if None)
 
     Returns:
         Tuple of (accepted_results, stats_dict)
@@ -425,6 +425,12 @@ async def crawl_single_target(
     # Initialize filter
     business_filter = YelpFilter()
 
+    # Businesses are written behind the crawl; their ids are collected at the end
+    own_writer = save_to_db and writer is None
+    if own_writer:
+        writer = AsyncBatchWriter(upsert_companies, name="yelp")
+    pending_saves = []
+
     try:
         # Fetch search results
         html, search_results = await fetch_yelp_search(
@@ -500,7 +506,8 @@ async def crawl_single_target(
                     continue
 
                 # Apply quality filter
-                filter_result = business_filter.filter_business(business_data)
+                with stage_timer("yelp", "filter"):
+                    filter_result = business_filter.filter_business(business_data)
                 if not filter_result['passed']:
                     logger.info(f"FILTERED: {business_data.get('name')} - {filter_result['filter_reason']}")
                     filtered_out += 1
@@ -509,18 +516,9 @@ async def crawl_single_target(
                 # Add confidence score to metadata
                 business_data['confidence_score'] = filter_result['confidence']
 
-                # Save to database if requested
+                # Queue for the database if requested (does not wait for the write)
                 if save_to_db:
-                    try:
-                        company_id = save_business_to_db(business_data, session)
-                        if company_id:
-                            business_data['company_id'] = company_id
-                            all_results.append(business_data)
-                            total_saved += 1
-                        else:
-                            logger.warning(f"Failed to save {business_data.get('name')} to database")
-                    except Exception as e:
-                        logger.error(f"Failed to save business: {e}")
+                    pending_saves.append((business_data, await writer.put(company_row(business_data))))
                 else:
                     all_results.append(business_data)
                     total_saved += 1
@@ -529,6 +527,18 @@ async def crawl_single_target(
                 logger.error(f"Error processing business {idx}: {e}")
                 continue
 
+        # Flush barrier: every business of this target is written before it is DONE
+        if save_to_db:
+            await writer.flush()
+            for business_data, saved in pending_saves:
+                company_id = saved.result()
+                if company_id:
+                    business_data['company_id'] = company_id
+                    all_results.append(business_data)
+                    total_saved += 1
+                else:
+                    logger.warning(f"Failed to save {business_data.get('name')} to database")
+
         # Update target status to DONE
         target.status = "DONE"
         target.note = f"completed_{total_saved}_saved"
@@ -545,6 +555,8 @@ async def crawl_single_target(
             'filtered_out': filtered_out,
             'captcha_detected': captcha_detected,
         }
+        if save_to_db:
+            stats['db_writer'] = writer.get_stats()
 
         logger.info(
             f"Target complete: {target.city}, {target.state_id} - {target.category_label} | "
@@ -561,6 +573,10 @@ async def crawl_single_target(
         session.commit()
         raise
 
+    finally:
+        if own_writer:
+            await writer.close()
+
 
 async def crawl_city_targets(
     state_ids: list[str],
@@ -684,79 +700,94 @@ async def crawl_city_targets(
     total_errors = 0
     total_captchas = 0
 
-    for idx, target in enumerate(targets, 1):
-        logger.info(f"\n{'='*80}")
-        logger.info(f"Target {idx}/{total_targets_to_process}")
-
-        try:
-            # Crawl single target
-            results, stats = await crawl_single_target(
-                target,
-                session,
-                scrape_details=scrape_details,
-                save_to_db=save_to_db
-            )
-
-            total_results += len(results)
-            if stats.get('captcha_detected'):
-                total_captchas += 1
-
-            # Yield batch
-            yield {
-                'target': target,
-                'results': results,
-                'stats': stats,
-            }
+    # One write-behind DB writer for the whole run
+    writer = AsyncBatchWriter(upsert_companies, name="yelp") if save_to_db else None
 
-            # Check if we should take a session break
-            if session_break_mgr:
-                took_break = await session_break_mgr.increment()
-                if took_break:
-                    logger.info(f"✓ Session break complete (break #{session_break_mgr.total_breaks})")
+    try:
+        for idx, target in enumerate(targets, 1):
+            logger.info(f"\n{'='*80}")
+            logger.info(f"Target {idx}/{total_targets_to_process}")
 
-        except Exception as e:
-            logger.error(f"Failed to crawl target {idx}/{total_targets_to_process}: {e}")
-            total_errors += 1
-            # Rollback session to recover from errors
-            session.rollback()
-            # Refresh target to get latest state from DB
             try:
-                session.refresh(target)
-            except Exception:
-                pass
-            continue
-
-        # Rate limiting: delay between targets
-        if idx < total_targets_to_process:
-            delay = random.uniform(10, 20)
-            logger.info(f"Waiting {delay:.1f}s before next target...")
-            await asyncio.sleep(delay)
-
-        # Periodic checkpoint
-        if idx % checkpoint_interval == 0:
-            logger.info(f"\n{'='*80}")
-            logger.info(f"CHECKPOINT #{idx//checkpoint_interval}")
-            logger.info(f"{'='*80}")
-            logger.info(f"Progress: {idx}/{total_targets_to_process} targets processed")
-            logger.info(f"Results collected: {total_results}")
-            logger.info(f"Errors: {total_errors}")
-            logger.info(f"CAPTCHAs detected: {total_captchas}")
+                # Crawl single target
+                results, stats = await crawl_single_target(
+                    target,
+                    session,
+                    scrape_details=scrape_details,
+                    save_to_db=save_to_db,
+                    writer=writer
+                )
 
-            if total_captchas > 0:
-                captcha_rate = (total_captchas / idx * 100)
-                logger.warning(f"CAPTCHA rate: {captcha_rate:.1f}%")
+                total_results += len(results)
+                if stats.get('captcha_detected'):
+                    total_captchas += 1
 
-                if captcha_rate > 10:
-                    logger.error("⚠️  High CAPTCHA rate! Consider increasing delays or using proxies")
+                # Yield batch
+                yield {
+                    'target': target,
+                    'results': results,
+                    'stats': stats,
+                }
 
-            logger.info(f"{'='*80}\n")
+                # Check if we should take a session break
+                if session_break_mgr:
+                    took_break = await session_break_mgr.increment()
+                    if took_break:
+                        logger.info(f"✓ Session break complete (break #{session_break_mgr.total_breaks})")
 
-    # Final summary
-    logger.info(f"\n{'='*80}")
-    logger.info(f"City-first crawl complete!")
-    logger.info(f"  States: {', '.join(state_ids)}")
-    logger.info(f"  Targets processed: {total_targets_to_process}")
-    logger.info(f"  Total results: {total_results}")
-    logger.info(f"  Errors: {total_errors}")
-    logger.info(f"  CAPTCHAs: {total_captchas}")
-    logger.info(f"{'='*80}\n")
+            except Exception as e:
+                logger.error(f"Failed to crawl target {idx}/{total_targets_to_process}: {e}")
+                total_errors += 1
+                # Rollback session to recover from errors
+                session.rollback()
+                # Refresh target to get latest state from DB
+                try:
+                    session.refresh(target)
+                except Exception:
+                    pass
+                continue
+
+            # Rate limiting: delay between targets
+            if idx < total_targets_to_process:
+                delay = random.uniform(10, 20)
+                logger.info(f"Waiting {delay:.1f}s before next target...")
+                await asyncio.sleep(delay)
+
+            # Periodic checkpoint
+            if idx % checkpoint_interval == 0:
+                logger.info(f"\n{'='*80}")
+                logger.info(f"CHECKPOINT #{idx//checkpoint_interval}")
+                logger.info(f"{'='*80}")
+                logger.info(f"Progress: {idx}/{total_targets_to_process} targets processed")
+                logger.info(f"Results collected: {total_results}")
+                logger.info(f"Errors: {total_errors}")
+                logger.info(f"CAPTCHAs detected: {total_captchas}")
+                if writer:
+                    writer_stats = writer.get_stats()
+                    logger.info(
+                        f"DB writer: {writer_stats['written']} written, queue depth "
+                        f"{writer_stats['queue_depth']} (peak {writer_stats['max_queue_depth']})"
+                    )
+
+                if total_captchas > 0:
+                    captcha_rate = (total_captchas / idx * 100)
+                    logger.warning(f"CAPTCHA rate: {captcha_rate:.1f}%")
+
+                    if captcha_rate > 10:
+                        logger.error("⚠️  High CAPTCHA rate! Consider increasing delays or using proxies")
+
+                logger.info(f"{'='*80}\n")
+
+        # Final summary
+        logger.info(f"\n{'='*80}")
+        logger.info(f"City-first crawl complete!")
+        logger.info(f"  States: {', '.join(state_ids)}")
+        logger.info(f"  Targets processed: {total_targets_to_process}")
+        logger.info(f"  Total results: {total_results}")
+        logger.info(f"  Errors: {total_errors}")
+        logger.info(f"  CAPTCHAs: {total_captchas}")
+        logger.info(f"{'='*80}\n")
+
+    finally:
+        if writer:
+            await writer.close()
@@ -12,6 +12,7 @@ import math
 from typing import Optional
 from playwright.async_api import Page
 
+from runner.block_detector import DATADOME_DETECTOR
 from runner.logging_setup import get_logger
 
 logger = get_logger("yelp_datadome_bypass")
@@ -229,7 +230,7 @@ class DataDomeBypass:
             # Check if we're on a DataDome challenge page
             html = await page.content()
 
-            if 'datadome' in html.lower() or 'captcha-delivery.com' in html:
+            if DATADOME_DETECTOR.scan(html).captcha:
                 logger.warning("DataDome challenge detected! Waiting for resolution...")
 
                 # Simulate human-like waiting behavior
@@ -242,7 +243,7 @@ class DataDomeBypass:
 
                     # Check if we've moved past the challenge
                     current_html = await page.content()
-                    if 'datadome' not in current_html.lower() and 'captcha-delivery.com' not in current_html:
+                    if not DATADOME_DETECTOR.scan(current_html).captcha:
                         logger.info("DataDome challenge appears to be resolved!")
                         return True
 
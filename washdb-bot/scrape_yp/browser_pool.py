@@ -114,7 +114,7 @@ class BrowserPool:
 
             return self.browsers[worker_id]
 
-    def get_page(self, worker_id: int) -> Tuple[Page, BrowserContext]:
+    def get_page(self, worker_id: int, proxy: Optional[Dict[str, str]] = None) -> Tuple[Page, BrowserContext]:
         """
         Get a new page with fresh context for worker.
 
@@ -124,6 +124,7 @@ class BrowserPool:
 
         Args:
             worker_id: Worker ID (0-based index)
+            proxy: Playwright proxy config for this context (optional)
 
         Returns:
             Tuple[Page, BrowserContext]: New page and its context
@@ -133,6 +134,8 @@ class BrowserPool:
 
         # Create fresh context with YP anti-detection parameters
         context_params = get_playwright_context_params()
+        if proxy:
+            context_params["proxy"] = proxy
         context = browser.new_context(**context_params)
 
         # Add YP anti-detection scripts
@@ -152,6 +155,19 @@ class BrowserPool:
 
         return page, context
 
+    def recycle_browser(self, worker_id: int):
+        """
+        Close a worker's browser now; the next get_browser() launches a fresh one.
+
+        Used by the memory supervisor (runner.worker_recycler) between targets.
+
+        Args:
+            worker_id: Worker ID whose browser to recycle
+        """
+        with self.lock:
+            logger.info(f"Recycling browser for worker {worker_id} (memory budget)")
+            self._close_browser(worker_id)
+
     def _close_browser(self, worker_id: int):
         """
         Close browser for worker (internal use only).
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Listing-level parse cache for the Yellow Pages results parser.
+
+HTMLCache keys whole pages, so a changed ad slot, nonce or timestamp
+anywhere on the page makes every listing on it a miss. This cache keys each
+listing block by a hash of its own (cleaned) HTML, so listings that repeat
+across pagination, overlapping searches and re-crawls are parsed once.
+
+Features:
+- LRU in-memory layer (per process)
+- Optional SQLite (WAL) layer shared by all processes and kept across runs
+- One store round trip per page (get_many / put_many)
+- TTL-based expiration
+- Per-stage parse timings accumulated for monitoring
+
+Usage:
+    from scrape_yp.listing_cache import get_listing_cache
+
+    cache = get_listing_cache()
+    found = cache.get_many(keys)          # {key: parsed listing dict}
+    cache.put_many({key: parsed, ...})
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from runner.logging_setup import get_logger
+
+logger = get_logger("listing_cache")
+
+# Default shared store location (data/ is not tracked)
+DEFAULT_STORE_PATH = Path(__file__).resolve().parents[1] / "data" / "yp_listing_cache.db"
+
+
+def copy_listing(listing: Dict) -> Dict:
+    """Copy a parsed listing, including its list fields."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in listing.items()}
+
+
+class ListingStore:
+    """
+    SQLite (WAL mode) store for parsed listings shared across processes.
+
+    Timestamps are stored as Unix epoch seconds. Each process opens its own
+    connection (re-opened after fork); writes are serialized by SQLite.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS listings (
+            key TEXT PRIMARY KEY,
+            result TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_listings_updated ON listings(updated_at);
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize store.
+
+        Args:
+            path: SQLite database file path (created if missing)
+        """
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+        with self._lock:
+            self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this process's connection (caller holds the lock)."""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def load_many(self, keys: List[str], min_updated_at: float) -> Dict[str, Dict]:
+        """Load parsed listings updated after min_updated_at."""
+        if not keys:
+            return {}
+
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT key, result FROM listings WHERE key IN ({placeholders}) AND updated_at >= ?",
+                (*keys, min_updated_at),
+            ).fetchall()
+        return {key: json.loads(result) for key, result in rows}
+
+    def save_many(self, items: Dict[str, Dict]):
+        """Insert or replace parsed listings in one transaction."""
+        if not items:
+            return
+
+        now = time.time()
+        rows = [(key, json.dumps(result), now) for key, result in items.items()]
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO listings (key, result, updated_at) VALUES (?, ?, ?)", rows
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def purge(self, older_than: float) -> int:
+        """Delete listings last written before older_than."""
+        with self._lock:
+            return self._connection().execute(
+                "DELETE FROM listings WHERE updated_at < ?", (older_than,)
+            ).rowcount
+
+    def count(self) -> int:
+        """Number of stored listings."""
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+
+
+class ListingCache:
+    """
+    Thread-safe LRU cache of parsed listings keyed by listing block hash.
+
+    Cached dicts are never handed out directly: callers mutate parsed
+    listings (filter scores, canonical websites), so get_many() returns
+    copies.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 20000,
+        ttl_hours: float = 168.0,
+        store: Optional[ListingStore] = None,
+    ):
+        """
+        Initialize listing cache.
+
+        Args:
+            max_size: Maximum number of listings kept in memory (LRU eviction)
+            ttl_hours: Time-to-live for cached listings (hours)
+            store: Shared store (None = in-memory only)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_hours * 3600
+        self.store = store
+        self.lock = threading.Lock()
+
+        # LRU cache: {listing_hash: (parsed_listing, timestamp)}
+        self.cache: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+
+        # Statistics
+        self.stats = {
+            'hits': 0,
+            'store_hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'pages': 0,
+        }
+        self.stage_seconds: Dict[str, float] = {}
+
+        if self.store:
+            try:
+                purged = self.store.purge(time.time() - self.ttl_seconds)
+                if purged:
+                    logger.info(f"Purged {purged} expired listings from {self.store.path}")
+            except sqlite3.Error as e:
+                logger.warning(f"Listing store purge failed: {e}")
+
+        logger.info(
+            f"ListingCache initialized: max_size={max_size}, ttl={ttl_hours}h, "
+            f"shared={'yes: ' + store.path if store else 'no'}"
+        )
+
+    def _remember(self, key: str, listing: Dict, timestamp: float):
+        """Add to the in-memory LRU (caller holds the lock)."""
+        if key not in self.cache and len(self.cache) >= self.max_size:
+            self.cache.popitem(last=False)
+            self.stats['evictions'] += 1
+        self.cache[key] = (listing, timestamp)
+        self.cache.move_to_end(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Get cached parsed listings.
+
+        Args:
+            keys: Listing block hashes
+
+        Returns:
+            Dict of hash -> copy of the parsed listing, for cached keys only
+        """
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+        found: Dict[str, Dict] = {}
+        missing: List[str] = []
+
+        with self.lock:
+            for key in keys:
+                entry = self.cache.get(key)
+                if entry and now - entry[1] <= self.ttl_seconds:
+                    self.cache.move_to_end(key)
+                    found[key] = entry[0]
+                else:
+                    if entry:
+                        del self.cache[key]
+                    missing.append(key)
+
+        if missing and self.store:
+            try:
+                stored = self.store.load_many(missing, now - self.ttl_seconds)
+            except sqlite3.Error as e:
+                logger.warning(f"Listing store read failed: {e}")
+                stored = {}
+
+            if stored:
+                with self.lock:
+                    for key, listing in stored.items():
+                        self._remember(key, listing, now)
+                found.update(stored)
+
+        with self.lock:
+            self.stats['hits'] += len(found)
+            self.stats['store_hits'] += len([key for key in missing if key in found])
+            self.stats['misses'] += len(keys) - len(found)
+
+        return {key: copy_listing(listing) for key, listing in found.items()}
+
+    def put_many(self, items: Dict[str, Dict]):
+        """
+        Store parsed listings.
+
+        Args:
+            items: Dict of listing block hash -> parsed listing
+        """
+        if not items:
+            return
+
+        now = time.time()
+        with self.lock:
+            for key, listing in items.items():
+                self._remember(key, copy_listing(listing), now)
+
+        if self.store:
+            try:
+                self.store.save_many(items)
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.warning(f"Listing store write failed: {e}")
+
+    def record_timings(self, timings: Dict[str, float]):
+        """Accumulate one page's per-stage parse timings."""
+        with self.lock:
+            self.stats['pages'] += 1
+            for stage, seconds in timings.items():
+                self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def clear(self) -> None:
+        """Clear in-memory entries (the shared store is left for other processes)."""
+        with self.lock:
+            cache_size = len(self.cache)
+            self.cache.clear()
+            logger.info(f"Listing cache cleared: {cache_size} entries removed")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Statistics including hit rate, size and per-stage timings
+        """
+        with self.lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            pages = self.stats['pages']
+            return {
+                'size': len(self.cache),
+                'max_size': self.max_size,
+                'ttl_hours': self.ttl_seconds / 3600,
+                'hits': self.stats['hits'],
+                'store_hits': self.stats['store_hits'],
+                'misses': self.stats['misses'],
+                'hit_rate_pct': (self.stats['hits'] / lookups * 100) if lookups else 0.0,
+                'evictions': self.stats['evictions'],
+                'pages': pages,
+                'avg_stage_ms': {
+                    stage: seconds / pages * 1000 for stage, seconds in self.stage_seconds.items()
+                } if pages else {},
+                'shared_store': self.store.path if self.store else None,
+            }
+
+
+# Global singleton instance
+_listing_cache: Optional[ListingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_listing_cache() -> ListingCache:
+    """
+    Get or create global listing cache singleton.
+
+    The singleton uses the shared store at YP_LISTING_CACHE_DB (default
+    data/yp_listing_cache.db); set it to "off" for an in-memory cache only.
+
+    Returns:
+        ListingCache: Global cache instance
+    """
+    global _listing_cache
+
+    if _listing_cache is None:
+        with _cache_lock:
+            if _listing_cache is None:
+                max_size = int(os.getenv("YP_LISTING_CACHE_MAX_SIZE", "20000"))
+                ttl_hours = float(os.getenv("YP_LISTING_CACHE_TTL_HOURS", "168"))
+
+                store = None
+                store_path = os.getenv("YP_LISTING_CACHE_DB", str(DEFAULT_STORE_PATH))
+                if store_path and store_path.lower() not in ("off", "none", "memory", ":memory:"):
+                    try:
+                        store = ListingStore(store_path)
+                    except Exception as e:
+                        logger.warning(f"Shared listing store unavailable ({e}); using in-memory cache")
+
+                _listing_cache = ListingCache(max_size=max_size, ttl_hours=ttl_hours, store=store)
+
+    return _listing_cache
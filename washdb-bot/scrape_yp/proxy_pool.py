@@ -6,22 +6,29 @@ This module provides:
 - Health tracking and automatic rotation
 - Thread-safe proxy acquisition
 - Blacklisting of bad proxies
+- Latency-aware scored selection (scrape_yp.proxy_scoring)
 """
 
+import asyncio
 import os
 import random
 import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
+from urllib.parse import urlparse
 
 from runner.logging_setup import get_logger
+from scrape_yp.proxy_scoring import ProxyScorer, classify_error, get_proxy_scorer
 
 
 logger = get_logger("proxy_pool")
 
+# Selection strategy used when a caller does not pass one
+DEFAULT_STRATEGY = os.getenv("PROXY_SELECTION_STRATEGY", "scored")
+
 
 @dataclass
 class ProxyInfo:
@@ -66,6 +73,15 @@ class ProxyInfo:
 
         return True
 
+    @property
+    def key(self) -> str:
+        """Identifier used for proxy scoring."""
+        return f"{self.host}:{self.port}"
+
+    def to_requests_url(self) -> str:
+        """Convert to a requests/httpx proxy URL."""
+        return f"http://{self.username}:{self.password}@{self.host}:{self.port}"
+
     def to_playwright_format(self) -> Dict[str, str]:
         """Convert to Playwright proxy format."""
         return {
@@ -86,13 +102,19 @@ class ProxyPool:
 
     Features:
     - Load proxies from Webshare format file
-    - Round-robin or health-based selection
+    - Scored (latency-aware, default), round-robin or health-based selection
     - Automatic blacklisting of bad proxies
     - Success/failure tracking
     - Thread-safe acquisition
     """
 
-    def __init__(self, proxy_file: str, blacklist_threshold: int = 10, blacklist_duration_minutes: int = 60):
+    def __init__(
+        self,
+        proxy_file: str,
+        blacklist_threshold: int = 10,
+        blacklist_duration_minutes: int = 60,
+        scorer: Optional[ProxyScorer] = None,
+    ):
         """
         Initialize proxy pool.
 
@@ -100,10 +122,12 @@ class ProxyPool:
             proxy_file: Path to proxy file (Webshare format: host:port:user:pass)
             blacklist_threshold: Number of consecutive failures before blacklisting
             blacklist_duration_minutes: How long to blacklist a proxy
+            scorer: Proxy scorer (default: shared get_proxy_scorer())
         """
         self.proxy_file = proxy_file
         self.blacklist_threshold = blacklist_threshold
         self.blacklist_duration = timedelta(minutes=blacklist_duration_minutes)
+        self.scorer = scorer if scorer is not None else get_proxy_scorer()
 
         self.proxies: List[ProxyInfo] = []
         self.current_index = 0
@@ -156,21 +180,29 @@ class ProxyPool:
 
         logger.info(f"Loaded {len(self.proxies)} proxies")
 
-    def get_proxy(self, strategy: str = "round_robin") -> Optional[ProxyInfo]:
+    def get_proxy(self, strategy: Optional[str] = None, domain: Optional[str] = None) -> Optional[ProxyInfo]:
         """
         Get next healthy proxy.
 
         Args:
-            strategy: Selection strategy ('round_robin' or 'health_based')
+            strategy: Selection strategy ('scored', 'round_robin' or
+                'health_based'; default: DEFAULT_STRATEGY)
+            domain: Target domain of the request (used by 'scored')
 
         Returns:
             ProxyInfo object or None if no healthy proxies available
         """
+        strategy = strategy or DEFAULT_STRATEGY
         with self.lock:
             if strategy == "round_robin":
                 return self._get_proxy_round_robin()
             elif strategy == "health_based":
                 return self._get_proxy_health_based()
+            elif strategy == "scored":
+                proxy = _get_proxy_scored(self.proxies, self.scorer, domain)
+                if proxy is None:
+                    logger.error("No healthy proxies available!")
+                return proxy
             else:
                 raise ValueError(f"Unknown strategy: {strategy}")
 
@@ -207,8 +239,17 @@ class ProxyPool:
         proxy.last_used = datetime.now()
         return proxy
 
-    def report_success(self, proxy: ProxyInfo) -> None:
-        """Report successful use of proxy."""
+    def report_success(self, proxy: ProxyInfo, latency: Optional[float] = None, domain: Optional[str] = None) -> None:
+        """
+        Report successful use of proxy.
+
+        Args:
+            proxy: ProxyInfo object
+            latency: Request time in seconds, if measured
+            domain: Target domain of the request
+        """
+        self.scorer.record(proxy.key, domain, "success", latency=latency)
+
         with self.lock:
             proxy.success_count += 1
 
@@ -216,14 +257,24 @@ class ProxyPool:
             if proxy.success_count in [1, 10, 50, 100, 500, 1000]:
                 logger.info(f"Proxy {proxy.host}:{proxy.port} reached {proxy.success_count} successes (rate: {proxy.success_rate:.1%})")
 
-    def report_failure(self, proxy: ProxyInfo, error_type: str = "unknown") -> None:
+    def report_failure(
+        self,
+        proxy: ProxyInfo,
+        error_type: str = "unknown",
+        latency: Optional[float] = None,
+        domain: Optional[str] = None,
+    ) -> None:
         """
         Report failed use of proxy.
 
         Args:
             proxy: ProxyInfo object
             error_type: Type of error (timeout, 403, 429, captcha, etc.)
+            latency: Request time in seconds, if measured
+            domain: Target domain of the request
         """
+        self.scorer.record(proxy.key, domain, classify_error(error_type), latency=latency)
+
         with self.lock:
             proxy.failure_count += 1
 
@@ -275,6 +326,16 @@ class ProxyPool:
             else:
                 return [p for p in self.proxies if p.is_healthy]
 
+    def get_proxy_scores(self) -> Dict[str, Dict]:
+        """
+        Get scoring stats (latency percentiles, success/CAPTCHA rates per
+        rolling window and domain) for every proxy in the pool.
+
+        Returns:
+            Dict of proxy key -> stats from ProxyScorer.get_proxy_stats()
+        """
+        return {proxy.key: self.scorer.get_proxy_stats(proxy.key) for proxy in self.proxies}
+
     def reset_proxy(self, proxy: ProxyInfo) -> None:
         """Reset proxy stats (for manual intervention)."""
         with self.lock:
@@ -317,37 +378,105 @@ class ProxyPool:
             logger.warning(f"Proxy test failed for {proxy.host}:{proxy.port}: {e}")
             return False
 
-    def test_all_proxies(self, max_concurrent: int = 5) -> Dict[str, int]:
+    def probe_proxy(
+        self,
+        proxy: ProxyInfo,
+        test_url: str = "https://www.yellowpages.com",
+        timeout: float = 15.0,
+    ) -> Tuple[bool, Optional[float]]:
         """
-        Test all proxies (use before starting workers).
+        Check a proxy with a plain HTTP request (no browser).
 
         Args:
-            max_concurrent: Maximum concurrent tests
+            proxy: ProxyInfo to test
+            test_url: URL to request through the proxy
+            timeout: Request timeout in seconds
 
         Returns:
-            Dict with passed/failed counts
+            Tuple of (success, latency in seconds or None on error)
+        """
+        import requests
+
+        proxy_url = proxy.to_requests_url()
+        start = time.perf_counter()
+        try:
+            response = requests.get(
+                test_url,
+                proxies={"http": proxy_url, "https": proxy_url},
+                timeout=timeout,
+            )
+        except requests.RequestException as e:
+            logger.warning(f"Proxy probe failed for {proxy.host}:{proxy.port}: {e}")
+            return False, None
+
+        return response.status_code == 200, time.perf_counter() - start
+
+    async def test_all_proxies_async(
+        self,
+        max_concurrent: int = 5,
+        test_url: str = "https://www.yellowpages.com",
+        timeout: float = 15.0,
+    ) -> Dict[str, int]:
         """
-        logger.info(f"Testing {len(self.proxies)} proxies...")
+        Probe all proxies concurrently and record the results for scoring.
 
-        passed = 0
-        failed = 0
+        Args:
+            max_concurrent: Maximum concurrent probes
+            test_url: URL to request through each proxy
+            timeout: Request timeout in seconds
+
+        Returns:
+            Dict with passed/failed counts
+        """
+        logger.info(f"Testing {len(self.proxies)} proxies ({max_concurrent} at a time)...")
+        semaphore = asyncio.Semaphore(max_concurrent)
+        domain = urlparse(test_url).hostname
 
-        for idx, proxy in enumerate(self.proxies, 1):
-            logger.info(f"Testing proxy {idx}/{len(self.proxies)}: {proxy.host}:{proxy.port}")
+        async def probe(proxy: ProxyInfo) -> bool:
+            async with semaphore:
+                ok, latency = await asyncio.to_thread(self.probe_proxy, proxy, test_url, timeout)
 
-            if self.test_proxy(proxy):
-                passed += 1
-                logger.info(f"  ✓ PASSED")
+            if ok:
+                logger.info(f"  ✓ PASSED {proxy.host}:{proxy.port} ({latency:.2f}s)")
+                self.scorer.record(proxy.key, domain, "success", latency=latency)
             else:
-                failed += 1
-                logger.warning(f"  ✗ FAILED")
-                # Mark as unhealthy but don't blacklist yet
-                proxy.failure_count = 5
+                logger.warning(f"  ✗ FAILED {proxy.host}:{proxy.port}")
+                self.scorer.record(proxy.key, domain, "failure", latency=latency)
+                with self.lock:
+                    # Mark as unhealthy but don't blacklist yet
+                    proxy.failure_count = 5
+            return ok
+
+        results = await asyncio.gather(*(probe(proxy) for proxy in self.proxies))
+        passed = sum(results)
+        failed = len(results) - passed
 
         logger.info(f"Proxy test complete: {passed} passed, {failed} failed")
 
         return {"passed": passed, "failed": failed}
 
+    def test_all_proxies(
+        self,
+        max_concurrent: int = 5,
+        test_url: str = "https://www.yellowpages.com",
+        timeout: float = 15.0,
+    ) -> Dict[str, int]:
+        """
+        Test all proxies (use before starting workers).
+
+        Runs test_all_proxies_async() in a new event loop; from async code,
+        await test_all_proxies_async() instead.
+
+        Args:
+            max_concurrent: Maximum concurrent tests
+            test_url: URL to request through each proxy
+            timeout: Request timeout in seconds
+
+        Returns:
+            Dict with passed/failed counts
+        """
+        return asyncio.run(self.test_all_proxies_async(max_concurrent, test_url, timeout))
+
 
 class WorkerProxyPool:
     """
@@ -359,6 +488,7 @@ class WorkerProxyPool:
     Features:
     - Load only assigned proxies by index
     - Per-request rotation (faster failover)
+    - Scored selection shared with the other workers' stats (default)
     - Same health tracking and blacklisting as ProxyPool
     - Thread-safe for worker's internal use
     """
@@ -369,7 +499,9 @@ class WorkerProxyPool:
         proxy_indices: List[int],
         worker_id: int,
         blacklist_threshold: int = 10,
-        blacklist_duration_minutes: int = 60
+        blacklist_duration_minutes: int = 60,
+        strategy: Optional[str] = None,
+        scorer: Optional[ProxyScorer] = None,
     ):
         """
         Initialize worker-specific proxy pool.
@@ -380,12 +512,19 @@ class WorkerProxyPool:
             worker_id: Worker ID for logging
             blacklist_threshold: Number of consecutive failures before blacklisting
             blacklist_duration_minutes: How long to blacklist a proxy
+            strategy: 'scored' or 'round_robin' (default: DEFAULT_STRATEGY)
+            scorer: Proxy scorer (default: shared get_proxy_scorer())
         """
         self.proxy_file = proxy_file
         self.proxy_indices = proxy_indices
         self.worker_id = worker_id
         self.blacklist_threshold = blacklist_threshold
         self.blacklist_duration = timedelta(minutes=blacklist_duration_minutes)
+        self.strategy = strategy or DEFAULT_STRATEGY
+        self.scorer = scorer if scorer is not None else get_proxy_scorer()
+
+        if self.strategy not in ("scored", "round_robin"):
+            raise ValueError(f"Unknown strategy: {self.strategy}")
 
         self.proxies: List[ProxyInfo] = []
         self.current_index = 0
@@ -440,17 +579,27 @@ class WorkerProxyPool:
 
         logger.info(f"Worker {self.worker_id}: Loaded {len(self.proxies)} proxies (indices: {self.proxy_indices})")
 
-    def get_proxy_for_request(self) -> Optional[ProxyInfo]:
+    def get_proxy_for_request(self, domain: Optional[str] = None) -> Optional[ProxyInfo]:
         """
         Get next healthy proxy for a single request.
 
-        This rotates through proxies on EVERY call, not just browser restart.
-        This provides faster failover and better load distribution.
+        This picks a proxy on EVERY call, not just browser restart. With the
+        'scored' strategy, faster and more successful proxies (for domain)
+        get proportionally more requests; 'round_robin' rotates evenly.
+
+        Args:
+            domain: Target domain of the request (used by 'scored')
 
         Returns:
             ProxyInfo object or None if no healthy proxies available
         """
         with self.lock:
+            if self.strategy == "scored":
+                proxy = _get_proxy_scored(self.proxies, self.scorer, domain)
+                if proxy is None:
+                    logger.error(f"Worker {self.worker_id}: No healthy proxies available!")
+                return proxy
+
             attempts = 0
             max_attempts = len(self.proxies)
 
@@ -467,8 +616,17 @@ class WorkerProxyPool:
             logger.error(f"Worker {self.worker_id}: No healthy proxies available!")
             return None
 
-    def report_success(self, proxy: ProxyInfo) -> None:
-        """Report successful use of proxy."""
+    def report_success(self, proxy: ProxyInfo, latency: Optional[float] = None, domain: Optional[str] = None) -> None:
+        """
+        Report successful use of proxy.
+
+        Args:
+            proxy: ProxyInfo object
+            latency: Request time in seconds, if measured
+            domain: Target domain of the request
+        """
+        self.scorer.record(proxy.key, domain, "success", latency=latency)
+
         with self.lock:
             proxy.success_count += 1
 
@@ -479,14 +637,24 @@ class WorkerProxyPool:
                     f"reached {proxy.success_count} successes (rate: {proxy.success_rate:.1%})"
                 )
 
-    def report_failure(self, proxy: ProxyInfo, error_type: str = "unknown") -> None:
+    def report_failure(
+        self,
+        proxy: ProxyInfo,
+        error_type: str = "unknown",
+        latency: Optional[float] = None,
+        domain: Optional[str] = None,
+    ) -> None:
         """
         Report failed use of proxy.
 
         Args:
             proxy: ProxyInfo object
             error_type: Type of error (timeout, 403, 429, captcha, etc.)
+            latency: Request time in seconds, if measured
+            domain: Target domain of the request
         """
+        self.scorer.record(proxy.key, domain, classify_error(error_type), latency=latency)
+
         with self.lock:
             proxy.failure_count += 1
 
@@ -544,6 +712,21 @@ class WorkerProxyPool:
                 return [p for p in self.proxies if p.is_healthy]
 
 
+def _get_proxy_scored(
+    proxies: List[ProxyInfo],
+    scorer: ProxyScorer,
+    domain: Optional[str],
+) -> Optional[ProxyInfo]:
+    """Pick a healthy proxy with the scorer (caller holds the pool lock)."""
+    healthy = {proxy.key: proxy for proxy in proxies if proxy.is_healthy}
+    if not healthy:
+        return None
+
+    proxy = healthy[scorer.choose(list(healthy), domain=domain)]
+    proxy.last_used = datetime.now()
+    return proxy
+
+
 def main():
     """Demo: Test proxy pool."""
     logger.info("=" * 60)
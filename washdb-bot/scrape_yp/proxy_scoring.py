@@ -0,0 +1,497 @@
+"""
+Proxy scoring for latency-aware proxy selection.
+
+Round robin and success-rate selection give a slow proxy as much traffic as
+a fast one. ProxyScorer records every proxy use (outcome, latency, target
+domain) and picks proxies with Thompson sampling:
+
+- success probability per proxy is drawn from Beta(successes, failures +
+  CAPTCHAs) for the target domain, with the proxy's all-domain record as a
+  weak prior, so a proxy that is good on Yelp but CAPTCHA'd on YP is
+  avoided for YP only
+- a latency is drawn from the proxy's recent latency samples
+- the proxy with the highest sampled successes per second wins
+
+Sampling keeps some traffic on proxies with little or uncertain data, so
+recovered proxies are rediscovered without a fixed exploration rate.
+
+Only events inside the rolling scoring window count. Events are persisted in
+a shared SQLite (WAL) store, so stats survive restarts and every worker
+process scores with the events of all workers (refreshed every few seconds).
+
+Usage:
+    from scrape_yp.proxy_scoring import get_proxy_scorer
+
+    scorer = get_proxy_scorer()
+    key = scorer.choose(["1.2.3.4:8000", "5.6.7.8:8000"], domain="yellowpages.com")
+    scorer.record(key, "yellowpages.com", "success", latency=1.8)
+    scorer.get_proxy_stats(key)  # latency percentiles, success/CAPTCHA rates
+"""
+
+import math
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence
+
+from runner.logging_setup import get_logger
+
+logger = get_logger("proxy_scoring")
+
+# Default shared store location (data/ is not tracked)
+DEFAULT_STORE_PATH = Path(__file__).resolve().parents[1] / "data" / "proxy_stats.db"
+
+OUTCOMES = ("success", "failure", "captcha")
+
+# Events older than this are ignored when scoring
+SCORING_WINDOW_SECONDS = 3600
+
+# Events are kept this long for reporting
+RETENTION_SECONDS = 7 * 24 * 3600
+
+# How often a process reloads events recorded by other processes
+REFRESH_SECONDS = 15
+
+# Weight of a proxy's all-domain record in the prior for one domain
+DOMAIN_PRIOR_WEIGHT = 0.25
+
+# Recent latency samples kept per proxy
+LATENCY_SAMPLES = 200
+
+# Windows reported by get_proxy_stats()
+STATS_WINDOWS = {"5m": 300, "1h": 3600, "24h": 86400}
+
+
+def classify_error(error_type: Optional[str]) -> str:
+    """Map a report_failure() error type to an outcome."""
+    if error_type and "captcha" in error_type.lower():
+        return "captcha"
+    return "failure"
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of values (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(pct / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+class ProxyStatsStore:
+    """
+    SQLite (WAL mode) event store shared by all scraper processes.
+
+    One row per proxy use. Timestamps are Unix epoch seconds. Each process
+    opens its own connection (re-opened after fork).
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS proxy_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            proxy TEXT NOT NULL,
+            domain TEXT NOT NULL,
+            outcome TEXT NOT NULL,
+            latency_ms REAL,
+            ts REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_proxy_events_ts ON proxy_events(ts);
+        CREATE INDEX IF NOT EXISTS idx_proxy_events_proxy_ts ON proxy_events(proxy, ts);
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize store.
+
+        Args:
+            path: SQLite database file path (created if missing)
+        """
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+        with self._lock:
+            self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this process's connection (caller holds the lock)."""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def add(self, proxy: str, domain: str, outcome: str, latency_ms: Optional[float], ts: float) -> int:
+        """Append one event and return its id."""
+        with self._lock:
+            return self._connection().execute(
+                "INSERT INTO proxy_events (proxy, domain, outcome, latency_ms, ts) VALUES (?, ?, ?, ?, ?)",
+                (proxy, domain, outcome, latency_ms, ts),
+            ).lastrowid
+
+    def load(self, since: float, after_id: int = 0, proxy: Optional[str] = None) -> List[tuple]:
+        """
+        Load events newer than since.
+
+        Args:
+            since: Minimum timestamp
+            after_id: Only events with a larger id (incremental refresh)
+            proxy: Only events of this proxy
+
+        Returns:
+            List of (id, proxy, domain, outcome, latency_ms, ts) tuples, oldest first
+        """
+        sql = "SELECT id, proxy, domain, outcome, latency_ms, ts FROM proxy_events WHERE ts >= ? AND id > ?"
+        params: List[Any] = [since, after_id]
+        if proxy is not None:
+            sql += " AND proxy = ?"
+            params.append(proxy)
+        with self._lock:
+            return self._connection().execute(sql + " ORDER BY id", params).fetchall()
+
+    def purge(self, older_than: float) -> int:
+        """Delete events recorded before older_than."""
+        with self._lock:
+            return self._connection().execute(
+                "DELETE FROM proxy_events WHERE ts < ?", (older_than,)
+            ).rowcount
+
+
+_NO_COUNTS = dict.fromkeys(OUTCOMES, 0)
+
+
+@dataclass
+class _ProxyRecord:
+    """
+    Events of one proxy inside the scoring window.
+
+    Outcome counts (overall and per domain) are kept up to date as events
+    are added and expired, so selection never rescans the window.
+    """
+    events: Deque[tuple] = field(default_factory=deque)  # (ts, domain, outcome, latency_ms)
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    totals: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(OUTCOMES, 0))
+    by_domain: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def add(self, ts: float, domain: str, outcome: str, latency_ms: Optional[float]):
+        """Append an event and count it."""
+        self.events.append((ts, domain, outcome, latency_ms))
+        self.totals[outcome] += 1
+        self.by_domain.setdefault(domain, dict.fromkeys(OUTCOMES, 0))[outcome] += 1
+        if latency_ms is not None:
+            self.latencies.append(latency_ms)
+
+    def expire(self, cutoff: float):
+        """Drop events recorded before cutoff and uncount them."""
+        while self.events and self.events[0][0] < cutoff:
+            _, domain, outcome, _ = self.events.popleft()
+            self.totals[outcome] -= 1
+            domain_counts = self.by_domain[domain]
+            domain_counts[outcome] -= 1
+            if not any(domain_counts.values()):
+                del self.by_domain[domain]
+
+    def counts(self, domain: Optional[str] = None) -> Dict[str, int]:
+        """Outcome counts, optionally for one domain (live dict, do not modify)."""
+        if domain is None:
+            return self.totals
+        return self.by_domain.get(domain, _NO_COUNTS)
+
+
+class ProxyScorer:
+    """
+    Records proxy outcomes and selects proxies with Thompson sampling.
+
+    Thread-safe. Proxies are identified by "host:port" keys.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ProxyStatsStore] = None,
+        window_seconds: float = SCORING_WINDOW_SECONDS,
+        refresh_seconds: float = REFRESH_SECONDS,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize scorer.
+
+        Args:
+            store: Shared event store (None = in-memory only, this process)
+            window_seconds: Rolling window of events used for scoring
+            refresh_seconds: How often to load other processes' events
+            rng: Random generator (for reproducible selection in tests)
+        """
+        self.store = store
+        self.window_seconds = window_seconds
+        self.refresh_seconds = refresh_seconds
+        self.rng = rng or random.Random()
+
+        self.lock = threading.Lock()
+        self._records: Dict[str, _ProxyRecord] = {}
+        self._own_ids: set = set()  # Stored events already added locally
+        self._last_id = 0
+        self._last_refresh = 0.0
+        self._last_purge = 0.0
+
+        self._refresh(force=True)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        proxy: str,
+        domain: Optional[str],
+        outcome: str,
+        latency: Optional[float] = None,
+    ):
+        """
+        Record one use of a proxy.
+
+        Args:
+            proxy: Proxy key ("host:port")
+            domain: Target domain ('' or None if unknown)
+            outcome: 'success', 'failure' or 'captcha'
+            latency: Request time in seconds, if measured
+        """
+        if outcome not in OUTCOMES:
+            raise ValueError(f"Unknown outcome: {outcome}")
+
+        domain = (domain or "").lower()
+        latency_ms = latency * 1000 if latency is not None else None
+        now = time.time()
+
+        # Held across the insert so a concurrent refresh cannot load the
+        # event before it is marked as ours
+        with self.lock:
+            if self.store:
+                try:
+                    self._own_ids.add(self.store.add(proxy, domain, outcome, latency_ms, now))
+                except sqlite3.Error as e:
+                    logger.warning(f"Proxy stats store write failed: {e}")
+            self._add_event(proxy, now, domain, outcome, latency_ms)
+
+    def _add_event(self, proxy: str, ts: float, domain: str, outcome: str, latency_ms: Optional[float]):
+        """Add an event to the in-memory window (caller holds the lock)."""
+        self._records.setdefault(proxy, _ProxyRecord()).add(ts, domain, outcome, latency_ms)
+
+    def _refresh(self, force: bool = False):
+        """Load new shared events and drop events outside the window."""
+        now = time.time()
+        if not force and now - self._last_refresh < self.refresh_seconds:
+            return
+        self._last_refresh = now
+        cutoff = now - self.window_seconds
+
+        if self.store:
+            try:
+                if now - self._last_purge > 3600:
+                    self._last_purge = now
+                    self.store.purge(now - RETENTION_SECONDS)
+                rows = self.store.load(cutoff, after_id=self._last_id)
+            except sqlite3.Error as e:
+                logger.warning(f"Proxy stats store read failed: {e}")
+                rows = None
+
+            if rows is not None:
+                with self.lock:
+                    for row_id, proxy, domain, outcome, latency_ms, ts in rows:
+                        self._last_id = max(self._last_id, row_id)
+                        if row_id in self._own_ids:
+                            self._own_ids.discard(row_id)
+                        else:
+                            self._add_event(proxy, ts, domain, outcome, latency_ms)
+                    # Own events that fell out of the window are never loaded
+                    self._own_ids = {event_id for event_id in self._own_ids if event_id > self._last_id}
+
+        with self.lock:
+            for record in self._records.values():
+                record.expire(cutoff)
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+
+    def choose(self, proxies: Sequence[str], domain: Optional[str] = None) -> Optional[str]:
+        """
+        Pick a proxy by Thompson sampling on successes per second.
+
+        Args:
+            proxies: Candidate proxy keys (already filtered for health)
+            domain: Target domain the request goes to
+
+        Returns:
+            Chosen proxy key, or None if there are no candidates
+        """
+        if not proxies:
+            return None
+        if len(proxies) == 1:
+            return proxies[0]
+
+        self._refresh()
+        domain = (domain or "").lower()
+
+        with self.lock:
+            # Proxies without latency samples are assumed as fast as the median proxy
+            medians = [
+                percentile(self._records[p].latencies, 50)
+                for p in proxies if p in self._records and self._records[p].latencies
+            ]
+            default_latency = percentile(medians, 50) or 1000.0
+
+            best, best_score = None, -1.0
+            for proxy in proxies:
+                record = self._records.get(proxy)
+                if record is None:
+                    successes = failures = 0.0
+                    latency_ms = default_latency
+                else:
+                    overall = record.counts()
+                    local = record.counts(domain) if domain else overall
+                    weight = DOMAIN_PRIOR_WEIGHT if domain else 0.0
+                    successes = local["success"] + weight * overall["success"]
+                    failures = (
+                        local["failure"] + local["captcha"]
+                        + weight * (overall["failure"] + overall["captcha"])
+                    )
+                    latency_ms = (
+                        self.rng.choice(record.latencies) if record.latencies else default_latency
+                    )
+
+                p_success = self.rng.betavariate(1 + successes, 1 + failures)
+                score = p_success / max(latency_ms, 1.0)
+                if score > best_score:
+                    best, best_score = proxy, score
+
+        return best
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def get_proxy_stats(self, proxy: str, windows: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Get stats for one proxy over rolling windows.
+
+        Reads from the shared store when there is one (all processes,
+        survives restarts), otherwise from this process's scoring window.
+
+        Args:
+            proxy: Proxy key
+            windows: Window name -> seconds (default: 5m, 1h, 24h)
+
+        Returns:
+            Dict of window name -> requests, success/CAPTCHA rates, latency
+            p50/p90/p99 (ms) and per-domain success/CAPTCHA rates
+        """
+        windows = windows or STATS_WINDOWS
+        now = time.time()
+
+        if self.store:
+            try:
+                rows = [
+                    (ts, domain, outcome, latency_ms)
+                    for _, _, domain, outcome, latency_ms, ts
+                    in self.store.load(now - max(windows.values()), proxy=proxy)
+                ]
+            except sqlite3.Error as e:
+                logger.warning(f"Proxy stats store read failed: {e}")
+                rows = []
+        else:
+            with self.lock:
+                record = self._records.get(proxy)
+                rows = list(record.events) if record else []
+
+        return {name: self._summarize([row for row in rows if row[0] >= now - seconds])
+                for name, seconds in windows.items()}
+
+    @staticmethod
+    def _summarize(events: Iterable[tuple]) -> Dict[str, Any]:
+        """Summarize (ts, domain, outcome, latency_ms) events."""
+        counts = dict.fromkeys(OUTCOMES, 0)
+        domains: Dict[str, Dict[str, int]] = {}
+        latencies = []
+        for _, domain, outcome, latency_ms in events:
+            counts[outcome] += 1
+            domains.setdefault(domain, dict.fromkeys(OUTCOMES, 0))[outcome] += 1
+            if latency_ms is not None:
+                latencies.append(latency_ms)
+
+        def rates(c: Dict[str, int]) -> Dict[str, Any]:
+            total = sum(c.values())
+            return {
+                'requests': total,
+                'success_rate': c['success'] / total if total else None,
+                'captcha_rate': c['captcha'] / total if total else None,
+            }
+
+        return {
+            **rates(counts),
+            'latency_p50_ms': percentile(latencies, 50),
+            'latency_p90_ms': percentile(latencies, 90),
+            'latency_p99_ms': percentile(latencies, 99),
+            'domains': {domain: rates(c) for domain, c in domains.items() if domain},
+        }
+
+    def get_window_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-proxy summary of the scoring window (for pool stats)."""
+        self._refresh()
+        with self.lock:
+            return {
+                proxy: {
+                    **record.counts(),
+                    'latency_p50_ms': percentile(record.latencies, 50),
+                }
+                for proxy, record in self._records.items()
+            }
+
+
+# Global singleton instance
+_proxy_scorer: Optional[ProxyScorer] = None
+_scorer_lock = threading.Lock()
+
+
+def get_proxy_scorer() -> ProxyScorer:
+    """
+    Get or create global proxy scorer singleton.
+
+    The singleton uses the shared store at PROXY_STATS_DB (default
+    data/proxy_stats.db); set it to "off" to keep stats in memory only.
+    PROXY_SCORING_WINDOW_SECONDS sets the scoring window.
+
+    Returns:
+        ProxyScorer: Global scorer instance
+    """
+    global _proxy_scorer
+
+    if _proxy_scorer is None:
+        with _scorer_lock:
+            if _proxy_scorer is None:
+                window = float(os.getenv("PROXY_SCORING_WINDOW_SECONDS", str(SCORING_WINDOW_SECONDS)))
+
+                store = None
+                store_path = os.getenv("PROXY_STATS_DB", str(DEFAULT_STORE_PATH))
+                if store_path and store_path.lower() not in ("off", "none", "memory", ":memory:"):
+                    try:
+                        store = ProxyStatsStore(store_path)
+                    except Exception as e:
+                        logger.warning(f"Shared proxy stats store unavailable ({e}); using in-memory stats")
+
+                _proxy_scorer = ProxyScorer(store=store, window_seconds=window)
+                logger.info(
+                    f"ProxyScorer initialized: window={window:.0f}s, "
+                    f"shared={'yes: ' + store.path if store else 'no'}"
+                )
+
+    return _proxy_scorer
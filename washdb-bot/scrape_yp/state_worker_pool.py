@@ -26,6 +26,15 @@ from pathlib import Path
 from typing import List, Optional
 
 from runner.logging_setup import setup_logging
+from runner.profiler import install_profiler, trace_target
+from runner.worker_recycler import (
+    ACTION_DRAIN,
+    ACTION_NONE,
+    ACTION_RECYCLE_BROWSER,
+    RecycleSignal,
+    WorkerRecycler,
+)
+from scrape_yp.browser_pool import get_browser_pool
 from scrape_yp.proxy_pool import WorkerProxyPool
 from scrape_yp.state_assignments_5worker import get_states_for_worker, get_proxy_assignments
 from scrape_yp.yp_crawl_city_first import crawl_single_target
@@ -33,6 +42,7 @@ from scrape_yp.yp_filter import YPFilter
 from scrape_yp.yp_monitor import ScraperMonitor
 from db.models import YPTarget, Company
 from db import create_session
+from db.batch_writer import BatchWriter
 
 # Setup logger for pool manager
 logger = setup_logging("state_worker_pool")
@@ -43,7 +53,8 @@ def worker_main(
     state_ids: List[str],
     proxy_indices: List[int],
     shutdown_event: multiprocessing.Event,
-    config: dict
+    config: dict,
+    recycle_signal: Optional[RecycleSignal] = None
 ):
     """
     Main function for a single state worker process.
@@ -55,6 +66,8 @@ def worker_main(
     4. Rotates proxy on every request (not just browser restart)
     5. Processes targets using the same logic as single worker
     6. Random delay between targets (10-20 seconds)
+    7. Between targets, recycles its browser or drains (exits for a fresh
+       process) when the pool's memory supervisor asks it to
 
     Args:
         worker_id: Worker number (0-9)
@@ -62,6 +75,7 @@ def worker_main(
         proxy_indices: List of assigned proxy indices (e.g., [0, 1, 2, 3, 4])
         shutdown_event: Multiprocessing event to signal shutdown
         config: Configuration dictionary
+        recycle_signal: Action slot of the pool's WorkerRecycler (optional)
     """
     # Set up worker-specific logger
     worker_logger = setup_logging(f"worker_{worker_id}", log_file=f"logs/state_worker_{worker_id}.log")
@@ -69,6 +83,9 @@ def worker_main(
     # Set WORKER_ID environment variable for browser pool isolation
     os.environ["WORKER_ID"] = str(worker_id)
 
+    # Sampling profiler: kill -USR2 <worker pid>
+    install_profiler(f"yp_worker_{worker_id}")
+
     worker_logger.info("="*70)
     worker_logger.info(f"WORKER {worker_id} STARTING")
     worker_logger.info("="*70)
@@ -77,6 +94,8 @@ def worker_main(
     worker_logger.info(f"Configuration: {config}")
     worker_logger.info("="*70)
 
+    writer = None
+
     try:
         # Initialize YPFilter for this worker
         worker_logger.info("Initializing YP filter...")
@@ -85,6 +104,36 @@ def worker_main(
         # Initialize monitor (optional)
         monitor = ScraperMonitor() if config.get("enable_monitor", False) else None
 
+        # Requests go through this worker's proxies, picked by the shared scorer
+        proxy_pool = None
+        if config.get("use_proxies", False):
+            proxy_pool = WorkerProxyPool(
+                config["proxy_file"],
+                proxy_indices,
+                worker_id,
+                blacklist_threshold=config.get("blacklist_threshold", 10),
+                blacklist_duration_minutes=config.get("blacklist_duration_minutes", 60),
+            )
+            worker_logger.info(
+                f"Proxy pool ready: {len(proxy_pool.proxies)} proxies ({proxy_pool.strategy} selection)"
+            )
+
+        # Accepted results are saved from a background thread in batches,
+        # each batch in its own session, so fetching never waits on the DB
+        def save_batch(results: list) -> tuple[int, int]:
+            batch_session = create_session()
+            try:
+                return save_companies_to_db(results, batch_session, worker_logger)
+            finally:
+                batch_session.close()
+
+        writer = BatchWriter(
+            save_batch,
+            name=f"yp-worker-{worker_id}",
+            batch_size=config.get("db_batch_size", 50),
+            count_names=("new", "updated"),
+        )
+
         # Main processing loop
         targets_processed = 0
         delay_min = config.get("min_delay_seconds", 10.0)
@@ -98,6 +147,15 @@ def worker_main(
 
         while not shutdown_event.is_set():
             try:
+                # Memory supervisor: act between targets, never mid-target
+                action = recycle_signal.take() if recycle_signal else ACTION_NONE
+                if action == ACTION_RECYCLE_BROWSER:
+                    get_browser_pool().recycle_browser(worker_id)
+                elif action == ACTION_DRAIN:
+                    worker_logger.info("Memory budget exceeded, draining worker for a fresh process...")
+                    get_browser_pool().cleanup()
+                    break
+
                 # Acquire next target ID from assigned states
                 target_id = acquire_target_for_worker(state_ids, worker_logger)
 
@@ -129,25 +187,29 @@ def worker_main(
 
                     # Scrape the target using existing logic
                     # This will handle its own Playwright browser internally
-                    accepted_results, stats = crawl_single_target(
-                        target=target,
-                        session=session,
-                        yp_filter=yp_filter,
-                        min_score=config.get("min_confidence_score", 40.0),
-                        include_sponsored=config.get("include_sponsored", False),
-                        use_fallback_on_404=True,
-                        monitor=monitor,
-                        worker_id=worker_id
-                    )
+                    with trace_target(f"target:{target.id}:{target.city}-{target.state_id}"):
+                        accepted_results, stats = crawl_single_target(
+                            target=target,
+                            session=session,
+                            yp_filter=yp_filter,
+                            min_score=config.get("min_confidence_score", 40.0),
+                            include_sponsored=config.get("include_sponsored", False),
+                            use_fallback_on_404=True,
+                            monitor=monitor,
+                            worker_id=worker_id,
+                            writer=writer,
+                            proxy_pool=proxy_pool,
+                        )
 
-                    # Save results to database
-                    if accepted_results:
-                        new_count, updated_count = save_companies_to_db(accepted_results, session, worker_logger)
+                    # Results were streamed to the writer
+                    if stats.get('total_accepted'):
+                        writer_stats = writer.get_stats()
                         worker_logger.info(
                             f"✓ Target {target.id} completed: "
-                            f"{len(accepted_results)} accepted, "
+                            f"{stats['total_accepted']} accepted, "
                             f"{stats.get('total_filtered_out', 0)} filtered out | "
-                            f"DB: {new_count} new, {updated_count} updated"
+                            f"DB (worker total): {writer_stats['new']} new, {writer_stats['updated']} updated, "
+                            f"{writer_stats['pending']} pending"
                         )
                     else:
                         worker_logger.info(
@@ -181,6 +243,10 @@ def worker_main(
     except Exception as e:
         worker_logger.error(f"Fatal error in worker {worker_id}: {e}", exc_info=True)
     finally:
+        # Save remaining results
+        if writer:
+            writer.close()
+
         # Print final stats
         worker_logger.info("="*70)
         worker_logger.info(f"WORKER {worker_id} FINAL STATS")
@@ -353,6 +419,8 @@ class StateWorkerPoolManager:
     - Each worker uses 5 dedicated proxies
     - Graceful shutdown handling
     - Per-worker monitoring
+    - Per-worker memory budgets: browsers recycled and workers drained and
+      restarted by a WorkerRecycler (runner.worker_recycler)
     """
 
     def __init__(self, config: dict):
@@ -362,6 +430,7 @@ class StateWorkerPoolManager:
         Args:
             config: Configuration dictionary with keys:
                 - proxy_file: Path to proxy file
+                - use_proxies: Send requests through the worker proxy pools
                 - num_workers: Number of workers (default 10)
                 - min_delay_seconds: Min delay between targets
                 - max_delay_seconds: Max delay between targets
@@ -376,6 +445,7 @@ class StateWorkerPoolManager:
         self.num_workers = config.get("num_workers", 10)
         self.workers: List[multiprocessing.Process] = []
         self.shutdown_event = multiprocessing.Event()
+        self.recycler = WorkerRecycler("yp", self.num_workers)
 
         # Validate configuration
         self._validate_config()
@@ -411,24 +481,10 @@ class StateWorkerPoolManager:
         logger.info(f"STARTING {self.num_workers}-WORKER STATE-PARTITIONED POOL")
         logger.info("="*70)
 
-        for worker_id in range(self.num_workers):
-            # Get state and proxy assignments
-            state_ids = get_states_for_worker(worker_id)
-            proxy_indices = get_proxy_assignments(worker_id)
-
-            logger.info(f"Worker {worker_id}: States {state_ids}, Proxies {proxy_indices}")
+        self.recycler.start()
 
-            # Create worker process
-            worker = multiprocessing.Process(
-                target=worker_main,
-                args=(worker_id, state_ids, proxy_indices, self.shutdown_event, self.config),
-                name=f"StateWorker-{worker_id}"
-            )
-
-            worker.start()
-            self.workers.append(worker)
-
-            logger.info(f"Worker {worker_id} started (PID: {worker.pid})")
+        for worker_id in range(self.num_workers):
+            self.workers.append(self._start_worker(worker_id))
 
             # Stagger startup to avoid simultaneous requests
             if worker_id < self.num_workers - 1:
@@ -440,12 +496,45 @@ class StateWorkerPoolManager:
         logger.info(f"All {self.num_workers} workers started successfully")
         logger.info("="*70)
 
+    def _start_worker(self, worker_id: int) -> multiprocessing.Process:
+        """
+        Start one worker process and register it with the memory supervisor.
+
+        Args:
+            worker_id: Worker number
+
+        Returns:
+            The started process
+        """
+        # Get state and proxy assignments
+        state_ids = get_states_for_worker(worker_id)
+        proxy_indices = get_proxy_assignments(worker_id)
+
+        logger.info(f"Worker {worker_id}: States {state_ids}, Proxies {proxy_indices}")
+
+        # Create worker process
+        worker = multiprocessing.Process(
+            target=worker_main,
+            args=(
+                worker_id, state_ids, proxy_indices, self.shutdown_event, self.config,
+                self.recycler.signal_for(worker_id),
+            ),
+            name=f"StateWorker-{worker_id}"
+        )
+
+        worker.start()
+        self.recycler.register(worker_id, worker.pid)
+
+        logger.info(f"Worker {worker_id} started (PID: {worker.pid})")
+        return worker
+
     def stop(self):
         """Stop all worker processes gracefully."""
         logger.info("Stopping all workers...")
 
         # Signal shutdown
         self.shutdown_event.set()
+        self.recycler.stop()
 
         # Wait for workers to finish (max 30 seconds each)
         for idx, worker in enumerate(self.workers):
@@ -464,10 +553,12 @@ class StateWorkerPoolManager:
         logger.info("All workers stopped")
 
     def wait(self):
-        """Wait for all workers to complete."""
+        """Wait for all workers to complete, restarting drained ones."""
         logger.info("Waiting for workers to complete...")
 
         try:
+            self.recycler.wait_for_workers(self.workers, self._start_worker, self.shutdown_event)
+
             for worker in self.workers:
                 worker.join()
         except KeyboardInterrupt:
@@ -485,6 +576,7 @@ def main():
 
     config = {
         "proxy_file": os.getenv("PROXY_FILE", "data/webshare_proxies.txt"),
+        "use_proxies": os.getenv("YP_USE_PROXIES", "false").lower() == "true",
         "num_workers": int(os.getenv("WORKER_COUNT", "5")),  # 5-worker system only (10-worker removed 2025-12-05)
         "min_delay_seconds": float(os.getenv("MIN_DELAY_SECONDS", "10.0")),
         "max_delay_seconds": float(os.getenv("MAX_DELAY_SECONDS", "20.0")),
@@ -42,8 +42,8 @@ class WorkerConfig:
     # Enable proxy rotation on failures (only if USE_PROXIES=true)
     PROXY_ROTATION_ENABLED = os.getenv("PROXY_ROTATION_ENABLED", "true").lower() == "true"
 
-    # Proxy selection strategy: 'round_robin' or 'health_based'
-    PROXY_SELECTION_STRATEGY = os.getenv("PROXY_SELECTION_STRATEGY", "round_robin")
+    # Proxy selection strategy: 'scored' (latency-aware), 'round_robin' or 'health_based'
+    PROXY_SELECTION_STRATEGY = os.getenv("PROXY_SELECTION_STRATEGY", "scored")
 
     # Number of consecutive failures before blacklisting proxy
     PROXY_BLACKLIST_THRESHOLD = int(os.getenv("PROXY_BLACKLIST_THRESHOLD", "10"))
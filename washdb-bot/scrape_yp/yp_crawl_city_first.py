@@ -10,17 +10,21 @@ This module implements the city-first scraping strategy:
 
 Usage:
     from scrape_yp.yp_crawl_city_first import crawl_city_targets
-    results, stats = crawl_city_targets(state_ids=['RI'], min_score=50.0)
+    for batch in crawl_city_targets(state_ids=['RI'], session=session, min_score=50.0):
+        ...
 """
 
 import time
 import random
 from datetime import datetime, timezone
-from typing import Generator, Optional
+import os
+from typing import Callable, Generator, Optional
 from urllib.parse import urlparse
 
 from db.models import YPTarget, canonicalize_url, domain_from_url
+from runner.block_detector import YP_DETECTOR
 from runner.logging_setup import get_logger
+from runner.metrics import record_items, stage_timer
 # City-first has its own fetch functions (fetch_city_category_page, _fetch_url_playwright)
 # No need to import from old yp_client
 from scrape_yp.yp_parser_enhanced import parse_yp_results_enhanced
@@ -42,12 +46,29 @@ from scrape_yp.yp_checkpoint import (
     load_progress_checkpoint,
 )
 from scrape_yp.browser_pool import get_browser_pool
+from scrape_yp.proxy_pool import WorkerProxyPool
+from scrape_yp.yp_pipeline import PageVerdict, PageVerdicts, StagePipeline
+from db.batch_writer import BatchWriter
 
 # Initialize logger
 logger = get_logger("yp_crawl_city_first")
 
+# Pages held between pipeline stages (parse -> filter -> dedup)
+PIPELINE_QUEUE_SIZE = int(os.getenv("YP_PIPELINE_QUEUE_SIZE", "2"))
 
-def fetch_city_category_page(url: str, page: int = 1, use_playwright: bool = True, max_retries: int = 3, worker_id: int = 0) -> str:
+# Domain proxy outcomes are scored under
+YP_DOMAIN = "yellowpages.com"
+
+
+def fetch_city_category_page(
+    url: str,
+    page: int = 1,
+    use_playwright: bool = True,
+    max_retries: int = 3,
+    worker_id: int = 0,
+    gate: Optional[Callable[[], bool]] = None,
+    proxy_pool: Optional[WorkerProxyPool] = None,
+) -> Optional[str]:
     """
     Fetch a city-category page from Yellow Pages with retry logic.
 
@@ -57,9 +78,13 @@ def fetch_city_category_page(url: str, page: int = 1, use_playwright: bool = Tru
         use_playwright: Use Playwright for fetching (default: True)
         max_retries: Maximum number of retry attempts (default: 3)
         worker_id: Worker ID for browser pool isolation (default: 0)
+        gate: Optional check run right before the request is sent (after
+            the human-like delay); returning False cancels the fetch
+        proxy_pool: Worker proxy pool; each attempt goes through a proxy
+            picked from it (Playwright only)
 
     Returns:
-        HTML content as string
+        HTML content as string, or None if the gate cancelled the fetch
 
     Raises:
         Exception: If all retry attempts fail
@@ -79,11 +104,14 @@ def fetch_city_category_page(url: str, page: int = 1, use_playwright: bool = Tru
         try:
             # Use Playwright if enabled
             if use_playwright:
-                return _fetch_url_playwright(url, worker_id=worker_id)
+                return _fetch_url_playwright(url, worker_id=worker_id, gate=gate, proxy_pool=proxy_pool)
             else:
                 # Fallback: Use requests library
                 import requests
 
+                if gate and not gate():
+                    return None
+
                 headers = {
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
                     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -93,8 +121,9 @@ def fetch_city_category_page(url: str, page: int = 1, use_playwright: bool = Tru
                     "Upgrade-Insecure-Requests": "1",
                 }
 
-                response = requests.get(url, headers=headers, timeout=30)
-                response.raise_for_status()
+                with stage_timer("yp", "fetch"):
+                    response = requests.get(url, headers=headers, timeout=30)
+                    response.raise_for_status()
 
                 return response.text
 
@@ -106,70 +135,107 @@ def fetch_city_category_page(url: str, page: int = 1, use_playwright: bool = Tru
                 # Calculate exponential backoff delay
                 backoff_delay = get_exponential_backoff_delay(attempt, base_delay=2.0, max_delay=30.0)
                 logger.info(f"Retrying in {backoff_delay:.1f} seconds...")
-                time.sleep(backoff_delay)
+                with stage_timer("yp", "wait"):
+                    time.sleep(backoff_delay)
             else:
                 # Last attempt failed
                 logger.error(f"All {max_retries} fetch attempts failed for {url}")
                 raise last_exception
 
 
-def _fetch_url_playwright(url: str, worker_id: int = 0) -> str:
+def _fetch_url_playwright(
+    url: str,
+    worker_id: int = 0,
+    gate: Optional[Callable[[], bool]] = None,
+    proxy_pool: Optional[WorkerProxyPool] = None,
+) -> Optional[str]:
     """
     Fetch a URL using persistent Playwright browser pool with anti-detection measures.
 
     Uses the global browser pool to eliminate browser startup overhead.
     Creates a fresh context for each request but reuses the persistent browser.
+    With a proxy pool, the context goes through a proxy picked for this
+    request, and the outcome (navigation latency, CAPTCHA/block page or
+    error) is reported back for scoring.
 
     Args:
         url: Full URL to fetch
         worker_id: Worker ID for browser pool isolation (default: 0)
+        gate: Optional check run after the delay; returning False cancels
+        proxy_pool: Worker proxy pool (optional)
 
     Returns:
-        HTML content as string
+        HTML content as string, or None if the gate cancelled the fetch
     """
     from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
     # Add human-like random delay with jitter (2-5 seconds + jitter)
-    human_delay(min_seconds=2.0, max_seconds=5.0, jitter=0.5)
+    with stage_timer("yp", "wait"):
+        human_delay(min_seconds=2.0, max_seconds=5.0, jitter=0.5)
+
+    # The delay overlaps processing of the previous page; only navigate
+    # once that page says pagination continues
+    if gate and not gate():
+        return None
+
+    proxy = proxy_pool.get_proxy_for_request(domain=YP_DOMAIN) if proxy_pool else None
 
     # Get page from browser pool (persistent browser, fresh context)
     pool = get_browser_pool()
-    page, context = pool.get_page(worker_id)
+    page, context = pool.get_page(worker_id, proxy=proxy.to_playwright_format() if proxy else None)
 
+    latency = None
     try:
-        # Navigate to URL with timeout
-        page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        with stage_timer("yp", "fetch"):
+            # Navigate to URL with timeout
+            start = time.perf_counter()
+            page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            latency = time.perf_counter() - start
 
-        # Wait for results to load
-        try:
-            page.wait_for_selector("div.result, div.srp-listing, div.organic", timeout=5000)
-        except PlaywrightTimeoutError:
-            # No results found, but page loaded
-            pass
-
-        # Simulate human behavior: scroll through page
-        scroll_delays = get_scroll_delays()
-        for i, scroll_delay in enumerate(scroll_delays):
-            # Scroll down in increments (simulate reading)
-            scroll_amount = random.randint(200, 600)
-            page.evaluate(f"window.scrollBy(0, {scroll_amount})")
-            time.sleep(scroll_delay)
-
-        # Simulate human reading the page
-        # Estimate content length for reading delay
-        html_preview = page.content()
-        content_length = len(html_preview) // 2  # Rough estimate of visible content
-        reading_delay = get_human_reading_delay(min(content_length, 2000))
-
-        # Take a portion of the reading delay (we already scrolled)
-        remaining_delay = reading_delay * random.uniform(0.3, 0.6)
-        time.sleep(remaining_delay)
+            # Wait for results to load
+            try:
+                page.wait_for_selector("div.result, div.srp-listing, div.organic", timeout=5000)
+            except PlaywrightTimeoutError:
+                # No results found, but page loaded
+                pass
+
+        with stage_timer("yp", "wait"):
+            # Simulate human behavior: scroll through page
+            scroll_delays = get_scroll_delays()
+            for i, scroll_delay in enumerate(scroll_delays):
+                # Scroll down in increments (simulate reading)
+                scroll_amount = random.randint(200, 600)
+                page.evaluate(f"window.scrollBy(0, {scroll_amount})")
+                time.sleep(scroll_delay)
+
+            # Simulate human reading the page
+            # Estimate content length for reading delay
+            html_preview = page.content()
+            content_length = len(html_preview) // 2  # Rough estimate of visible content
+            reading_delay = get_human_reading_delay(min(content_length, 2000))
+
+            # Take a portion of the reading delay (we already scrolled)
+            remaining_delay = reading_delay * random.uniform(0.3, 0.6)
+            time.sleep(remaining_delay)
 
         # Get HTML content
-        html = page.content()
+        with stage_timer("yp", "fetch"):
+            html = page.content()
+
+        if proxy:
+            signal = YP_DETECTOR.scan(html).signal
+            if signal:
+                proxy_pool.report_failure(proxy, error_type=signal.type.value, latency=latency, domain=YP_DOMAIN)
+            else:
+                proxy_pool.report_success(proxy, latency=latency, domain=YP_DOMAIN)
 
         return html
 
+    except Exception as e:
+        if proxy:
+            proxy_pool.report_failure(proxy, error_type=type(e).__name__, latency=latency, domain=YP_DOMAIN)
+        raise
+
     finally:
         # Close context (but keep browser alive in pool)
         try:
@@ -187,6 +253,8 @@ def crawl_single_target(
     use_fallback_on_404: bool = True,
     monitor: Optional[ScraperMonitor] = None,
     worker_id: int = 0,
+    writer: Optional[BatchWriter] = None,
+    proxy_pool: Optional[WorkerProxyPool] = None,
 ) -> tuple[list[dict], dict]:
     """
     Crawl a single target (city × category).
@@ -197,6 +265,13 @@ def crawl_single_target(
     - Stops if page has all duplicate results (domain dedup)
     - Updates target status in database
 
+    Pages are fetched in this thread and processed by a staged pipeline
+    (parse -> filter -> dedup) running in background threads. The
+    human-like delay before each fetch overlaps processing of the previous
+    page; the request itself is only sent once that page's outcome says
+    pagination continues, so no page is fetched that the serial crawl
+    would have skipped.
+
     Args:
         target: YPTarget database object
         session: SQLAlchemy session
@@ -206,9 +281,14 @@ def crawl_single_target(
         use_fallback_on_404: Use fallback URL if primary fails
         monitor: Optional monitor for tracking
         worker_id: Worker ID for browser pool isolation (default: 0)
+        writer: Optional BatchWriter; accepted results are streamed to it
+            as they are found instead of being collected and returned
+        proxy_pool: Optional worker proxy pool requests are sent through
 
     Returns:
-        Tuple of (accepted_results, stats_dict)
+        Tuple of (accepted_results, stats_dict). accepted_results is empty
+        when a writer is given; stats_dict['total_accepted'] has the count
+        and stats_dict['stages'] the per-stage throughput.
     """
     logger.info(
         f"Crawling target: {target.city}, {target.state_id} - {target.category_label} "
@@ -221,176 +301,249 @@ def crawl_single_target(
     target.attempts += 1
     session.commit()
 
+    # Read once: stage threads must not touch the ORM object
+    city = target.city
+    state_id = target.state_id
+    max_pages = target.max_pages
+
     all_results = []
+    sink = writer.put if writer else all_results.append
     seen_domains = set()
     seen_websites = set()
-    total_parsed = 0
-    total_filtered_out = 0
+    counts = {'parsed': 0, 'filtered_out': 0, 'accepted': 0}
+    verdicts = PageVerdicts()
     url_to_use = target.primary_url
     used_fallback = False
+    page = 0
+
+    @stage_timer("yp", "parse")
+    def parse_stage(work: dict):
+        results = parse_yp_results_enhanced(work.pop('html'))
+        counts['parsed'] += len(results)
+        record_items("yp", "parse", len(results))
+
+        if not results:
+            logger.info(f"  No results found on page {work['page']}")
+            verdicts.post(work['page'], PageVerdict(parsed=0))
+            return ()
+
+        logger.info(f"  Parsed {len(results)} results from page {work['page']}")
+        work['results'] = results
+        return (work,)
+
+    @stage_timer("yp", "filter")
+    def filter_stage(work: dict):
+        results = work['results']
+        filtered_results, filter_stats = yp_filter.filter_listings(
+            results,
+            min_score=min_score,
+            include_sponsored=include_sponsored
+        )
 
-    try:
-        for page in range(1, target.max_pages + 1):
-            logger.info(f"  Fetching page {page}/{target.max_pages}...")
-
-            try:
-                # Fetch page HTML
-                html = fetch_city_category_page(url_to_use, page, worker_id=worker_id)
-
-                # Record successful request
-                if monitor:
-                    monitor.record_request(success=True, html=html)
+        logger.info(
+            f"  Filter: {filter_stats['accepted']} accepted, "
+            f"{filter_stats['rejected']} rejected"
+        )
+        counts['filtered_out'] += filter_stats['rejected']
+
+        # Record results for monitoring
+        if monitor:
+            monitor.record_results(
+                found=len(results),
+                accepted=filter_stats['accepted'],
+                filtered=filter_stats['rejected']
+            )
 
-                # Parse results with enhanced parser
-                results = parse_yp_results_enhanced(html)
-                total_parsed += len(results)
+        work['parsed'] = len(results)
+        work['results'] = filtered_results
+        return (work,)
+
+    @stage_timer("yp", "dedup")
+    def dedup_stage(work: dict):
+        # Note: Early-exit logic removed to allow pagination even when filters reject all results
+        # This ensures we don't stop pagination just because our filters are strict
+        # We only stop when YP actually has no more results (handled by empty page check)
+        accepted = []
+        for result in work['results']:
+            # Add source and location metadata
+            result["source"] = "YP"
+            result["city"] = city
+            result["state"] = state_id
+
+            # Normalize and add domain if website exists
+            if result.get("website"):
+                try:
+                    # Canonicalize URL
+                    canonical = canonicalize_url(result["website"])
+                    result["website"] = canonical
 
-                if not results:
-                    logger.info(f"  No results found on page {page}")
-                    if page == 1 and use_fallback_on_404 and not used_fallback:
-                        # Try fallback URL
-                        logger.info(f"  Trying fallback URL...")
-                        url_to_use = target.fallback_url
-                        used_fallback = True
-                        html = fetch_city_category_page(url_to_use, page, worker_id=worker_id)
+                    # Extract domain
+                    result["domain"] = domain_from_url(canonical)
 
-                        # Record fallback request
-                        if monitor:
-                            monitor.record_request(success=True, html=html)
+                    # Check for duplicates
+                    if result["domain"] in seen_domains:
+                        logger.debug(f"  Skipping duplicate domain: {result['domain']}")
+                        continue
 
-                        results = parse_yp_results_enhanced(html)
-                        total_parsed += len(results)
+                    if result["website"] in seen_websites:
+                        logger.debug(f"  Skipping duplicate website: {result['website']}")
+                        continue
 
-                        if not results:
-                            logger.info(f"  Fallback URL also returned no results")
-                            break
-                    else:
-                        break
+                    # Mark as seen
+                    seen_domains.add(result["domain"])
+                    seen_websites.add(result["website"])
 
-                logger.info(f"  Parsed {len(results)} results from page {page}")
+                except Exception as e:
+                    logger.warning(f"  Failed to normalize URL '{result['website']}': {e}")
+                    continue
+            else:
+                # No website - skip
+                logger.debug(f"  Skipping business without website: {result.get('name')}")
+                continue
+
+            accepted.append(result)
+
+        counts['accepted'] += len(accepted)
+        record_items("yp", "dedup", len(accepted))
+        logger.info(f"  Added {len(accepted)} new unique results from page {work['page']}")
+        if not accepted:
+            # If no new results were added, end pagination
+            logger.info(f"  No new unique results found. Ending pagination.")
+
+        verdicts.post(work['page'], PageVerdict(parsed=work['parsed'], accepted=len(accepted)))
+        return accepted
+
+    def on_stage_error(stage_name: str, work, error: Exception):
+        if isinstance(work, dict) and 'page' in work:
+            verdicts.post(work['page'], PageVerdict(error=error))
+
+    def handle_page1_error(error: Exception) -> bool:
+        """Switch to the fallback URL after a page 1 error, or fail the target."""
+        nonlocal url_to_use, used_fallback
+        if use_fallback_on_404 and not used_fallback:
+            logger.info(f"  Trying fallback URL after error...")
+            url_to_use = target.fallback_url
+            used_fallback = True
+            verdicts.reset(1)
+            return True
+
+        # Can't proceed
+        target.status = "failed"
+        target.note = f"error_page1: {str(error)[:200]}"
+        session.commit()
+        raise error
+
+    pipeline = StagePipeline(
+        [("parse", parse_stage), ("filter", filter_stage), ("dedup", dedup_stage)],
+        sink=sink,
+        queue_size=PIPELINE_QUEUE_SIZE,
+        name=f"yp-target-{target.id}",
+        on_error=on_stage_error,
+    )
 
-                # Apply filter
-                filtered_results, filter_stats = yp_filter.filter_listings(
-                    results,
-                    min_score=min_score,
-                    include_sponsored=include_sponsored
-                )
+    try:
+        with pipeline:
+            page = 1
+            while page <= max_pages:
+                logger.info(f"  Fetching page {page}/{max_pages}...")
 
-                logger.info(
-                    f"  Filter: {filter_stats['accepted']} accepted, "
-                    f"{filter_stats['rejected']} rejected"
-                )
-                total_filtered_out += filter_stats['rejected']
+                # Pages after the first wait for the previous page's outcome
+                gate = None
+                if page > 1:
+                    gate = lambda previous=page - 1: verdicts.wait(previous).proceed
 
-                # Record results for monitoring
-                if monitor:
-                    monitor.record_results(
-                        found=len(results),
-                        accepted=filter_stats['accepted'],
-                        filtered=filter_stats['rejected']
+                try:
+                    html = fetch_city_category_page(
+                        url_to_use, page, worker_id=worker_id, gate=gate, proxy_pool=proxy_pool
                     )
+                except Exception as e:
+                    logger.error(f"  Error fetching page {page}: {e}")
 
-                # Note: Early-exit logic removed to allow pagination even when filters reject all results
-                # This ensures we don't stop pagination just because our filters are strict
-                # We only stop when YP actually has no more results (handled by empty page check above)
-
-                # Process filtered results
-                new_results = 0
-                for result in filtered_results:
-                    # Add source and location metadata
-                    result["source"] = "YP"
-                    result["city"] = target.city
-                    result["state"] = target.state_id
-
-                    # Normalize and add domain if website exists
-                    if result.get("website"):
-                        try:
-                            # Canonicalize URL
-                            canonical = canonicalize_url(result["website"])
-                            result["website"] = canonical
-
-                            # Extract domain
-                            result["domain"] = domain_from_url(canonical)
-
-                            # Check for duplicates
-                            if result["domain"] in seen_domains:
-                                logger.debug(f"  Skipping duplicate domain: {result['domain']}")
-                                continue
-
-                            if result["website"] in seen_websites:
-                                logger.debug(f"  Skipping duplicate website: {result['website']}")
-                                continue
-
-                            # Mark as seen
-                            seen_domains.add(result["domain"])
-                            seen_websites.add(result["website"])
-
-                        except Exception as e:
-                            logger.warning(f"  Failed to normalize URL '{result['website']}': {e}")
-                            continue
-                    else:
-                        # No website - skip
-                        logger.debug(f"  Skipping business without website: {result.get('name')}")
-                        continue
-
-                    # Add to results
-                    all_results.append(result)
-                    new_results += 1
+                    # Record failed request
+                    if monitor:
+                        monitor.record_request(success=False, html="")
 
-                logger.info(f"  Added {new_results} new unique results from page {page}")
+                    if page == 1 and handle_page1_error(e):
+                        continue
 
-                # If no new results were added, end pagination
-                if new_results == 0:
-                    logger.info(f"  No new unique results found. Ending pagination.")
+                    # Later page failed - just stop pagination
+                    logger.warning(f"  Stopping pagination due to error on page {page}")
                     break
 
-            except Exception as e:
-                logger.error(f"  Error fetching page {page}: {e}")
+                if html is None:
+                    # Previous page ended pagination
+                    page -= 1
+                    break
 
-                # Record failed request
+                # Record successful request
                 if monitor:
-                    monitor.record_request(success=False, html="")
+                    monitor.record_request(success=True, html=html)
+
+                pipeline.put({'page': page, 'html': html})
 
-                # Continue to next page or end
                 if page == 1:
-                    # First page failed - try fallback if available
-                    if use_fallback_on_404 and not used_fallback:
-                        logger.info(f"  Trying fallback URL after error...")
-                        url_to_use = target.fallback_url
-                        used_fallback = True
-                        continue
-                    else:
-                        # Can't proceed
-                        target.status = "failed"
-                        target.note = f"error_page1: {str(e)[:200]}"
-                        session.commit()
-                        raise
-                else:
-                    # Later page failed - just stop pagination
-                    logger.warning(f"  Stopping pagination due to error on page {page}")
-                    break
+                    # Page 1 decides whether the fallback URL is needed
+                    verdict = verdicts.wait(1)
+                    if verdict.error is not None:
+                        logger.error(f"  Error processing page 1: {verdict.error}")
+                        if handle_page1_error(verdict.error):
+                            continue
+                    if verdict.parsed == 0:
+                        if use_fallback_on_404 and not used_fallback:
+                            # Try fallback URL
+                            logger.info(f"  Trying fallback URL...")
+                            url_to_use = target.fallback_url
+                            used_fallback = True
+                            verdicts.reset(1)
+                            continue
+                        if used_fallback:
+                            logger.info(f"  Fallback URL also returned no results")
+                        break
+                    if not verdict.proceed:
+                        break
+
+                page += 1
+
+            page = min(page, max_pages)
+
+        # Streamed results must be saved before the target counts as done;
+        # a kill or drain would otherwise lose rows still in the writer
+        if writer is not None:
+            failed_writes = writer.flush()
+            if failed_writes:
+                raise RuntimeError(f"{failed_writes} accepted results could not be saved")
 
         # Mark target as done
+        total_accepted = counts['accepted']
         target.status = "done"
-        target.note = f"completed_{len(all_results)}_results" if all_results else "completed_no_results"
+        target.note = f"completed_{total_accepted}_results" if total_accepted else "completed_no_results"
         session.commit()
 
         # Summary stats
+        total_parsed = counts['parsed']
         stats = {
             'total_parsed': total_parsed,
-            'total_filtered_out': total_filtered_out,
-            'total_accepted': len(all_results),
-            'acceptance_rate': (len(all_results) / total_parsed * 100) if total_parsed > 0 else 0,
+            'total_filtered_out': counts['filtered_out'],
+            'total_accepted': total_accepted,
+            'acceptance_rate': (total_accepted / total_parsed * 100) if total_parsed > 0 else 0,
             'early_exit': False,
             'pages_fetched': page,
             'used_fallback': used_fallback,
+            'stages': pipeline.get_stats(),
         }
 
         logger.info(
             f"Target complete: {target.city}, {target.state_id} - {target.category_label} | "
-            f"pages={page}, parsed={total_parsed}, accepted={len(all_results)} "
+            f"pages={page}, parsed={total_parsed}, accepted={total_accepted} "
             f"({stats['acceptance_rate']:.1f}%)"
         )
+        logger.info(
+            "  Stages: " + ", ".join(
+                f"{stage['stage']}={stage['items_in']} in {stage['busy_seconds']:.2f}s "
+                f"(blocked {stage['blocked_seconds']:.2f}s)"
+                for stage in stats['stages'][1:]
+            )
+        )
 
         return all_results, stats
 
@@ -416,6 +569,7 @@ def crawl_city_targets(
     checkpoint_interval: int = 10,
     recover_orphans: bool = True,
     orphan_timeout_minutes: int = 60,
+    writer: Optional[BatchWriter] = None,
 ) -> Generator[dict, None, None]:
     """
     Crawl all targets for specified states.
@@ -436,11 +590,14 @@ def crawl_city_targets(
         checkpoint_interval: Save checkpoint every N targets (default: 10)
         recover_orphans: Recover orphaned targets on startup (default: True)
         orphan_timeout_minutes: Minutes before marking target as orphaned (default: 60)
+        writer: Optional BatchWriter that accepted results are streamed to
+            while targets are crawled (results in the yielded batches are
+            then empty)
 
     Yields:
         Dict with keys:
         - target: YPTarget object
-        - results: List of accepted business dicts
+        - results: List of accepted business dicts (empty with a writer)
         - stats: Dict with parsing/filtering stats
     """
     logger.info(f"Starting city-first crawl for states: {', '.join(state_ids)}")
@@ -536,9 +693,10 @@ def crawl_city_targets(
                 min_score=min_score,
                 include_sponsored=include_sponsored,
                 monitor=monitor,
+                writer=writer,
             )
 
-            total_results += len(results)
+            total_results += stats['total_accepted']
             if stats.get('early_exit'):
                 total_early_exits += 1
 
@@ -15,17 +15,60 @@ Filtering logic:
 3. Must NOT have anti-keywords in business name/description
 4. Special handling for "Equipment & Services" category
 5. Confidence scoring based on positive/negative signals
+
+Keyword lists are compiled once per process by runner.keyword_matcher and
+shared by all filter instances; filter_listings() scans a whole page of
+listings per keyword list in one batched call.
 """
 
 import re
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from urllib.parse import urlparse
 
+from runner.keyword_matcher import KeywordMatcher, RuleHit, get_file_matcher, load_keywords
 from runner.logging_setup import get_logger
 
 logger = get_logger("yp_filter")
 
+# E-commerce URL patterns in priority order (pattern, reason prefix)
+ECOMMERCE_URL_RULES = [
+    # E-commerce platform subdomains (100% confidence)
+    ('.myshopify.com', 'e-commerce platform'),      # Shopify stores
+    ('.bigcartel.com', 'e-commerce platform'),      # Big Cartel
+    ('.square.site', 'e-commerce platform'),        # Square online stores
+    ('.ecwid.com', 'e-commerce platform'),          # Ecwid stores
+    ('.shoplightspeed.com', 'e-commerce platform'), # Lightspeed
+    ('.shoplo.com', 'e-commerce platform'),         # Shoplo
+    ('.3dcart.com', 'e-commerce platform'),         # 3dcart
+    ('.squarespace.com/commerce', 'e-commerce platform'),  # Squarespace commerce
+    ('.wixsite.com/shop', 'e-commerce platform'),   # Wix commerce (with /shop)
+
+    # E-commerce URL paths (95%+ confidence)
+    ('/shop/', 'e-commerce path'),
+    ('/shop', 'e-commerce path'),
+    ('/store/', 'e-commerce path'),
+    ('/store', 'e-commerce path'),
+    ('/products/', 'e-commerce path'),
+    ('/product/', 'e-commerce path'),
+    ('/cart/', 'e-commerce path'),
+    ('/cart', 'e-commerce path'),
+    ('/checkout/', 'e-commerce path'),
+    ('/checkout', 'e-commerce path'),
+    ('/collections/', 'e-commerce path'),           # Shopify pattern
+    ('/buy-now', 'e-commerce path'),
+    ('/order-online', 'e-commerce path'),
+    ('/merchandise', 'e-commerce path'),
+    ('/merch', 'e-commerce path'),
+    ('/add-to-cart', 'e-commerce path'),
+]
+ECOMMERCE_URL_REASONS = dict(ECOMMERCE_URL_RULES)
+ECOMMERCE_URL_MATCHER = KeywordMatcher(pattern for pattern, _ in ECOMMERCE_URL_RULES)
+
+# Be conservative - only flag obvious e-commerce domain names
+# Don't flag "Joe's Pressure Wash Shop" type business names
+ECOMMERCE_DOMAIN_MATCHER = KeywordMatcher(['onlinestore', 'webstore', 'webshop', 'eshop', 'e-shop'])
+
 
 class YPFilter:
     """
@@ -50,8 +93,12 @@ class YPFilter:
         """
         self.allowlist = self._load_set(allowlist_file)
         self.blocklist = self._load_set(blocklist_file)
-        self.anti_keywords = self._load_set(anti_keywords_file)
-        self.positive_hints = self._load_set(positive_hints_file)
+
+        # Compiled matchers shared with every other filter using these files
+        self.anti_matcher = get_file_matcher(anti_keywords_file)
+        self.hint_matcher = get_file_matcher(positive_hints_file)
+        self.anti_keywords = set(self.anti_matcher.keywords)
+        self.positive_hints = set(self.hint_matcher.keywords)
 
         # Special category that needs extra filtering
         self.equipment_category = "Pressure Washing Equipment & Services"
@@ -64,15 +111,9 @@ class YPFilter:
 
     def _load_set(self, file_path: str) -> Set[str]:
         """Load a text file into a set (case-insensitive)."""
-        path = Path(file_path)
-        if not path.exists():
+        if not Path(file_path).exists():
             print(f"Warning: {file_path} not found")
-            return set()
-
-        with open(path, 'r', encoding='utf-8') as f:
-            items = {line.strip().lower() for line in f if line.strip()}
-
-        return items
+        return set(load_keywords(file_path))
 
     def _normalize(self, text: str) -> str:
         """Normalize text for comparison (lowercase, strip)."""
@@ -90,18 +131,7 @@ class YPFilter:
         Returns:
             Tuple of (has_keyword, list_of_matches)
         """
-        if not text:
-            return False, []
-
-        text_lower = self._normalize(text)
-        matches = []
-
-        for keyword in self.anti_keywords:
-            # Use word boundary matching to avoid false positives
-            # e.g., "supplies" should match but "supplier cleaning" should also match
-            if keyword in text_lower:
-                matches.append(keyword)
-
+        matches = self.anti_matcher.find_all(text)
         return len(matches) > 0, matches
 
     def _has_positive_hint(self, text: str) -> Tuple[bool, List[str]]:
@@ -114,16 +144,7 @@ class YPFilter:
         Returns:
             Tuple of (has_hint, list_of_matches)
         """
-        if not text:
-            return False, []
-
-        text_lower = self._normalize(text)
-        matches = []
-
-        for hint in self.positive_hints:
-            if hint in text_lower:
-                matches.append(hint)
-
+        matches = self.hint_matcher.find_all(text)
         return len(matches) > 0, matches
 
     def _check_category_tags(self, tags: List[str]) -> Dict[str, any]:
@@ -185,61 +206,17 @@ class YPFilter:
         if not url:
             return False, ""
 
-        url_lower = url.lower()
-
-        # E-commerce platform subdomains (100% confidence)
-        ecommerce_domains = [
-            '.myshopify.com',      # Shopify stores
-            '.bigcartel.com',      # Big Cartel
-            '.square.site',        # Square online stores
-            '.ecwid.com',          # Ecwid stores
-            '.shoplightspeed.com', # Lightspeed
-            '.shoplo.com',         # Shoplo
-            '.3dcart.com',         # 3dcart
-            '.squarespace.com/commerce',  # Squarespace commerce
-            '.wixsite.com/shop',   # Wix commerce (with /shop)
-        ]
-
-        for domain in ecommerce_domains:
-            if domain in url_lower:
-                return True, f"e-commerce platform: {domain}"
-
-        # E-commerce URL paths (95%+ confidence)
-        ecommerce_paths = [
-            '/shop/',
-            '/shop',
-            '/store/',
-            '/store',
-            '/products/',
-            '/product/',
-            '/cart/',
-            '/cart',
-            '/checkout/',
-            '/checkout',
-            '/collections/',      # Shopify pattern
-            '/buy-now',
-            '/order-online',
-            '/merchandise',
-            '/merch',
-            '/add-to-cart',
-        ]
-
-        for path in ecommerce_paths:
-            if path in url_lower:
-                return True, f"e-commerce path: {path}"
+        pattern = ECOMMERCE_URL_MATCHER.first(url)
+        if pattern:
+            return True, f"{ECOMMERCE_URL_REASONS[pattern]}: {pattern}"
 
         # Check domain for shop/store keywords (conservative)
         # Only flag if it's clearly an online store in the domain itself
         try:
-            parsed = urlparse(url_lower)
-            domain = parsed.netloc.replace('www.', '')
-
-            # Be conservative - only flag obvious e-commerce domain names
-            # Don't flag "Joe's Pressure Wash Shop" type business names
-            ecommerce_domain_keywords = ['onlinestore', 'webstore', 'webshop', 'eshop', 'e-shop']
-            for kw in ecommerce_domain_keywords:
-                if kw in domain.replace('-', '').replace('_', ''):
-                    return True, f"e-commerce domain keyword: {kw}"
+            domain = urlparse(url.lower()).netloc.replace('www.', '')
+            keyword = ECOMMERCE_DOMAIN_MATCHER.first(domain.replace('-', '').replace('_', ''))
+            if keyword:
+                return True, f"e-commerce domain keyword: {keyword}"
 
         except Exception:
             # If URL parsing fails, don't block
@@ -247,7 +224,66 @@ class YPFilter:
 
         return False, ""
 
-    def should_include(self, listing: Dict) -> Tuple[bool, str, float]:
+    @staticmethod
+    def _text_fields(listing: Dict) -> Tuple[str, str, str]:
+        """Name, combined text and description text of a listing, as matched."""
+        name = listing.get('name', '')
+        combined_text = f"{name} {listing.get('description', '')} {listing.get('services', '')}".lower()
+
+        services = listing.get('services', [])
+        services_text = ' '.join(services) if isinstance(services, list) else str(services) if services else ''
+        description = (listing.get('description') or '') + ' ' + services_text
+
+        return name, combined_text, description
+
+    def _scan_page(self, listings: List[Dict]) -> List[Dict[str, List[str]]]:
+        """
+        Match every keyword list against a page of listings.
+
+        Returns:
+            Per listing: anti-keywords in the name, positive hints in the
+            combined text, and anti-keywords in the description/services
+        """
+        fields = [self._text_fields(listing) for listing in listings]
+        name_anti = self.anti_matcher.find_all_batch([name for name, _, _ in fields])
+        text_hints = self.hint_matcher.find_all_batch([text for _, text, _ in fields])
+        description_anti = self.anti_matcher.find_all_batch([desc for _, _, desc in fields])
+
+        return [
+            {'name_anti': name_anti[i], 'text_hints': text_hints[i], 'description_anti': description_anti[i]}
+            for i in range(len(listings))
+        ]
+
+    def explain_listings(self, listings: List[Dict]) -> List[List[RuleHit]]:
+        """
+        List every filter rule that matches each listing.
+
+        Unlike should_include(), which stops at the first rejecting rule,
+        this reports all matches, e.g. for the filter preview or debugging.
+
+        Args:
+            listings: Listing dicts
+
+        Returns:
+            One list of RuleHit per listing
+        """
+        explanations = []
+        for listing, scan in zip(listings, self._scan_page(listings)):
+            tag_check = self._check_category_tags(listing.get('category_tags', []))
+            hits = [RuleHit('category_allow', 'category_tags', tag) for tag in tag_check['allowed_tags']]
+            hits += [RuleHit('category_block', 'category_tags', tag) for tag in tag_check['blocked_tags']]
+            hits += [RuleHit('anti_keyword', 'name', kw) for kw in scan['name_anti']]
+            hits += [RuleHit('anti_keyword', 'description', kw) for kw in scan['description_anti']]
+            hits += [RuleHit('positive_hint', 'text', kw) for kw in scan['text_hints']]
+
+            is_ecommerce, ecommerce_reason = self._is_ecommerce_url(listing.get('website', ''))
+            if is_ecommerce:
+                hits.append(RuleHit('ecommerce_url', 'website', ecommerce_reason))
+
+            explanations.append(hits)
+        return explanations
+
+    def should_include(self, listing: Dict, scan: Optional[Dict[str, List[str]]] = None) -> Tuple[bool, str, float]:
         """
         Determine if a listing should be included based on filtering rules.
 
@@ -259,6 +295,7 @@ class YPFilter:
 
         Args:
             listing: Listing dict with keys: name, category_tags, description (optional)
+            scan: Keyword matches from _scan_page() (computed if not given)
 
         Returns:
             Tuple of (should_include, reason_code, confidence_score)
@@ -268,11 +305,9 @@ class YPFilter:
         """
         name = listing.get('name', '')
         category_tags = listing.get('category_tags', [])
-        description = listing.get('description', '')
-        services = listing.get('services', '')
 
-        # Combine text fields for keyword checking
-        combined_text = f"{name} {description} {services}".lower()
+        if scan is None:
+            scan = self._scan_page([listing])[0]
 
         # Check category tags
         tag_check = self._check_category_tags(category_tags)
@@ -296,8 +331,8 @@ class YPFilter:
             return False, f"blocked_category:{blocked_tags[0][:20]}", 0.0
 
         # Rule 3: Check for anti-keywords in name
-        has_anti, anti_matches = self._has_anti_keyword(name)
-        if has_anti:
+        anti_matches = scan['name_anti']
+        if anti_matches:
             # Return first anti-keyword match
             return False, f"anti_keyword:{anti_matches[0][:20]}", 0.0
 
@@ -308,7 +343,7 @@ class YPFilter:
             # b) Has positive hints in description/services
             has_other_positive = len(allowed_tags) > 1  # More than just equipment tag
 
-            has_positive_hint, hint_matches = self._has_positive_hint(combined_text)
+            has_positive_hint = bool(scan['text_hints'])
 
             if not has_other_positive and not has_positive_hint:
                 return False, "equipment_only", 0.0
@@ -325,7 +360,7 @@ class YPFilter:
             return False, "no_website", 0.0
 
         # Calculate confidence score
-        score = self._calculate_score(listing, allowed_tags, combined_text)
+        score = self._calculate_score(listing, allowed_tags, scan)
 
         return True, "accepted", score
 
@@ -333,7 +368,7 @@ class YPFilter:
         self,
         listing: Dict,
         allowed_tags: List[str],
-        combined_text: str
+        scan: Dict[str, List[str]]
     ) -> float:
         """
         Calculate confidence score for a listing (0-100).
@@ -349,7 +384,7 @@ class YPFilter:
         Args:
             listing: Listing dict
             allowed_tags: List of allowed category tags
-            combined_text: Combined text for keyword checking
+            scan: Keyword matches from _scan_page()
 
         Returns:
             Confidence score (0-100)
@@ -360,8 +395,7 @@ class YPFilter:
         score += min(len(allowed_tags) * 10, 50)
 
         # Positive hints (max +25)
-        has_positive, hint_matches = self._has_positive_hint(combined_text)
-        score += min(len(hint_matches) * 5, 25)
+        score += min(len(scan['text_hints']) * 5, 25)
 
         # Penalize if only equipment tag (reduced from -20 to -10 to be less aggressive)
         if "equipment" in " ".join(allowed_tags).lower() and len(allowed_tags) == 1:
@@ -376,13 +410,9 @@ class YPFilter:
             score += 3
 
         # Check for anti-keywords in description (less harsh than in name)
-        services = listing.get('services', [])
-        services_text = ' '.join(services) if isinstance(services, list) else str(services) if services else ''
-        description = listing.get('description', '') + ' ' + services_text
-        if description:
-            has_anti, anti_matches = self._has_anti_keyword(description)
-            if has_anti:
-                score -= min(len(anti_matches) * 10, 30)
+        anti_matches = scan['description_anti']
+        if anti_matches:
+            score -= min(len(anti_matches) * 10, 30)
 
         # Clamp to 0-100
         score = max(0.0, min(100.0, score))
@@ -421,7 +451,10 @@ class YPFilter:
         accepted = []
         scores = []
 
-        for listing in listings:
+        # One batched keyword scan per list for the whole page
+        scans = self._scan_page(listings)
+
+        for listing, scan in zip(listings, scans):
             # Skip sponsored if requested
             if not include_sponsored and listing.get('is_sponsored', False):
                 stats['rejected'] += 1
@@ -430,7 +463,7 @@ class YPFilter:
                 continue
 
             # Apply filtering rules
-            should_include, reason, score = self.should_include(listing)
+            should_include, reason, score = self.should_include(listing, scan)
 
             if should_include and score >= min_score:
                 # Add filter metadata
@@ -16,6 +16,8 @@ from typing import Dict, List, Optional, Tuple
 from collections import deque
 from dataclasses import dataclass, field
 
+from runner.block_detector import YP_DETECTOR
+
 
 @dataclass
 class ScraperMetrics:
@@ -96,40 +98,8 @@ def detect_captcha(html: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_captcha, captcha_type)
     """
-    if not html:
-        return False, ""
-
-    html_lower = html.lower()
-
-    # Common CAPTCHA indicators
-    captcha_indicators = [
-        # reCAPTCHA
-        ('recaptcha', 'reCAPTCHA'),
-        ('g-recaptcha', 'reCAPTCHA'),
-        ('grecaptcha', 'reCAPTCHA'),
-
-        # hCaptcha
-        ('hcaptcha', 'hCaptcha'),
-        ('h-captcha', 'hCaptcha'),
-
-        # Cloudflare
-        ('cf-challenge', 'Cloudflare Challenge'),
-        ('challenge-form', 'Cloudflare Challenge'),
-        ('cloudflare', 'Cloudflare'),
-
-        # Generic
-        ('captcha', 'Generic CAPTCHA'),
-        ('verify you are human', 'Human Verification'),
-        ('prove you are not a robot', 'Bot Check'),
-        ('security check', 'Security Check'),
-        ('unusual traffic', 'Rate Limit Warning'),
-    ]
-
-    for indicator, captcha_type in captcha_indicators:
-        if indicator in html_lower:
-            return True, captcha_type
-
-    return False, ""
+    signal = YP_DETECTOR.scan(html).captcha
+    return bool(signal), signal.label
 
 
 def detect_blocking(html: str, status_code: Optional[int] = None) -> Tuple[bool, str]:
@@ -143,33 +113,8 @@ def detect_blocking(html: str, status_code: Optional[int] = None) -> Tuple[bool,
     Returns:
         Tuple of (is_blocked, block_reason)
     """
-    # Check status codes
-    if status_code:
-        if status_code == 403:
-            return True, "403 Forbidden"
-        elif status_code == 429:
-            return True, "429 Too Many Requests"
-        elif status_code in (503, 504):
-            return True, f"{status_code} Service Unavailable"
-
-    # Check HTML content
-    if html:
-        html_lower = html.lower()
-
-        blocking_indicators = [
-            'access denied',
-            'blocked',
-            'banned',
-            'too many requests',
-            'rate limit',
-            'temporarily unavailable',
-        ]
-
-        for indicator in blocking_indicators:
-            if indicator in html_lower:
-                return True, f"Content indicates: {indicator}"
-
-    return False, ""
+    signal = YP_DETECTOR.scan(html, status_code).blocked
+    return bool(signal), signal.label
 
 
 class AdaptiveRateLimiter:
@@ -444,18 +389,16 @@ class ScraperMonitor:
             self.metrics.failed_requests += 1
             self.metrics.recent_failures.append(datetime.now())
 
-        # Check for CAPTCHA
-        is_captcha, captcha_type = detect_captcha(html)
-        if is_captcha:
+        # Check for CAPTCHA and blocking in one pass
+        signals = YP_DETECTOR.scan(html, status_code)
+        if signals.captcha:
             self.metrics.captcha_detected += 1
             self.metrics.recent_captchas.append(datetime.now())
-            self._send_alert(f"CAPTCHA detected: {captcha_type}")
+            self._send_alert(f"CAPTCHA detected: {signals.captcha.label}")
 
-        # Check for blocking
-        is_blocked, block_reason = detect_blocking(html, status_code)
-        if is_blocked:
+        if signals.blocked:
             self.metrics.blocked_requests += 1
-            self._send_alert(f"Request blocked: {block_reason}")
+            self._send_alert(f"Request blocked: {signals.blocked.label}")
 
     def record_results(self, found: int, accepted: int, filtered: int):
         """
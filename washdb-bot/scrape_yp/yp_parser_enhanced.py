@@ -7,13 +7,27 @@ This module extends the basic YP parser to:
 - Capture YP profile URLs for fallback
 - Detect sponsored/ad listings
 - Provide better field extraction
+
+Parser modes (YP_PARSER_MODE):
+- listing (default): the page is parsed with lxml only to find listing
+  blocks; each block is hashed and only blocks not in the listing cache
+  (scrape_yp.listing_cache) are parsed with BeautifulSoup
+- soup: the whole page is parsed with BeautifulSoup, cached per page
 """
 
+import hashlib
+import os
 import re
+import time
 from typing import List, Dict, Optional
 from urllib.parse import unquote
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+
+from runner.logging_setup import get_logger
 
+from scrape_yp import yp_data_utils
 from scrape_yp.yp_data_utils import (
     normalize_phone,
     validate_url,
@@ -23,6 +37,56 @@ from scrape_yp.yp_data_utils import (
     extract_email_from_text,
 )
 
+logger = get_logger("yp_parser")
+
+PARSER_MODE = os.getenv("YP_PARSER_MODE", "listing").lower()
+
+
+def parser_source_version(paths: List[str]) -> str:
+    """
+    Hash of the listing parser's source files.
+
+    Cached listings are keyed with it, so any edit to the parser or its
+    helpers invalidates them. If a source file cannot be read, a random
+    version is used: listings are then only reused within this process.
+
+    Args:
+        paths: Source files whose code shapes the parsed listings
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            return os.urandom(8).hex()
+    return digest.hexdigest()
+
+
+# parse_single_listing_enhanced lives here and uses the yp_data_utils helpers
+LISTING_PARSER_VERSION = parser_source_version([__file__, yp_data_utils.__file__])
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """XPath step equivalent to the CSS selector tag.class_name."""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Listing block selectors, tried in order (same cascade as the soup mode)
+LISTING_XPATHS = [
+    etree.XPath("//" + _class_xpath("div", "result")),
+    etree.XPath("//" + _class_xpath("div", "search-results") + "//" + _class_xpath("div", "srp-listing")),
+    etree.XPath("//" + _class_xpath("div", "organic")),
+    etree.XPath("//div[@data-business-name]"),
+]
+
+# Elements the listing parser never reads. They are removed before hashing so
+# rotating images, inline scripts and tracking pixels do not change the key.
+VOLATILE_TAGS = ("script", "style", "noscript", "img", "picture", "source", "svg", "iframe")
+
 
 def clean_text(text: str) -> str:
     """
@@ -515,19 +579,111 @@ def parse_single_listing_enhanced(listing, source_page_url: Optional[str] = None
     return result
 
 
-def parse_yp_results_enhanced(html: str, source_page_url: Optional[str] = None) -> List[Dict]:
+def _listing_blocks(html: str, timings: Dict[str, float]) -> List[str]:
     """
-    Parse Yellow Pages search results with enhanced extraction.
-
-    Uses LRU cache to avoid redundant parsing of identical HTML.
+    Find listing blocks with lxml and return their cleaned HTML.
 
     Args:
-        html: HTML content from Yellow Pages search page
-        source_page_url: URL of the page being parsed (for traceability)
+        html: Search results page HTML
+        timings: Stage timings to fill ('tree', 'select', 'serialize')
 
     Returns:
-        List of dicts with enhanced business information
+        HTML of each listing block, in page order
     """
+    start = time.perf_counter()
+    tree = lxml.html.document_fromstring(html)
+    timings['tree'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    listings = []
+    for xpath in LISTING_XPATHS:
+        listings = xpath(tree)
+        if listings:
+            break
+    timings['select'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    blocks = []
+    for listing in listings:
+        etree.strip_elements(listing, etree.Comment, *VOLATILE_TAGS, with_tail=False)
+        blocks.append(lxml.html.tostring(listing, encoding="unicode", with_tail=False))
+    timings['serialize'] = time.perf_counter() - start
+
+    return blocks
+
+
+def _listing_key(block_html: str) -> str:
+    """Cache key for a listing block."""
+    digest = hashlib.blake2b(block_html.encode("utf-8"), digest_size=16)
+    digest.update(LISTING_PARSER_VERSION.encode())
+    return digest.hexdigest()
+
+
+def _parse_listing_block(block_html: str) -> Dict:
+    """Parse one cleaned listing block with BeautifulSoup."""
+    soup = BeautifulSoup(block_html, "lxml")
+    listing = soup.body.find(True) if soup.body else soup.find(True)
+    return parse_single_listing_enhanced(listing)
+
+
+def _parse_yp_results_listings(
+    html: str,
+    source_page_url: Optional[str],
+    timings: Dict[str, float],
+) -> List[Dict]:
+    """Listing mode: reuse cached listings, parse only new blocks."""
+    from scrape_yp.listing_cache import copy_listing, get_listing_cache
+    cache = get_listing_cache()
+
+    blocks = _listing_blocks(html, timings)
+    print(f"Found {len(blocks)} potential listings")
+
+    start = time.perf_counter()
+    keys = [_listing_key(block) for block in blocks]
+    timings['hash'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cached = cache.get_many(keys)
+    timings['lookup'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parsed: Dict[str, Dict] = {}
+    for key, block in zip(keys, blocks):
+        if key in cached or key in parsed:
+            continue
+        try:
+            parsed[key] = _parse_listing_block(block)
+        except Exception as e:
+            # Skip individual listing errors
+            print(f"Warning: Failed to parse listing: {e}")
+    timings['parse'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cache.put_many(parsed)
+    timings['store'] = time.perf_counter() - start
+
+    results = []
+    seen_keys = set()
+    for key in keys:
+        result = cached.get(key) or parsed.get(key)
+        if not result:
+            continue
+        # A block repeated on the page gets its own copy
+        if key in seen_keys:
+            result = copy_listing(result)
+        seen_keys.add(key)
+        result["source_page_url"] = source_page_url
+        # Only include if has a name
+        if result.get("name"):
+            results.append(result)
+
+    timings['cached'] = len(cached)
+    timings['parsed'] = len(parsed)
+    return results
+
+
+def _parse_yp_results_soup(html: str, source_page_url: Optional[str], timings: Dict[str, float]) -> List[Dict]:
+    """Soup mode: parse the whole page with BeautifulSoup, cached per page."""
     # Check cache first (avoid redundant lxml parsing)
     from scrape_yp.html_cache import get_html_cache
     cache = get_html_cache()
@@ -538,11 +694,13 @@ def parse_yp_results_enhanced(html: str, source_page_url: Optional[str] = None)
         return cached_results
 
     # Cache miss - parse HTML
+    start = time.perf_counter()
     soup = BeautifulSoup(html, "lxml")
-    results = []
+    timings['tree'] = time.perf_counter() - start
 
     # Find all business listings
     # YP uses various classes, try multiple selectors
+    start = time.perf_counter()
     listings = (
         soup.select("div.result") or
         soup.select("div.search-results div.srp-listing") or
@@ -550,9 +708,12 @@ def parse_yp_results_enhanced(html: str, source_page_url: Optional[str] = None)
         soup.select("div[data-business-name]") or
         []
     )
+    timings['select'] = time.perf_counter() - start
 
     print(f"Found {len(listings)} potential listings")
 
+    start = time.perf_counter()
+    results = []
     for listing in listings:
         try:
             result = parse_single_listing_enhanced(listing, source_page_url=source_page_url)
@@ -563,6 +724,7 @@ def parse_yp_results_enhanced(html: str, source_page_url: Optional[str] = None)
             # Skip individual listing errors
             print(f"Warning: Failed to parse listing: {e}")
             continue
+    timings['parse'] = time.perf_counter() - start
 
     # Store results in cache before returning
     cache.put(html, results)
@@ -570,6 +732,52 @@ def parse_yp_results_enhanced(html: str, source_page_url: Optional[str] = None)
     return results
 
 
+def parse_yp_results_enhanced(
+    html: str,
+    source_page_url: Optional[str] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> List[Dict]:
+    """
+    Parse Yellow Pages search results with enhanced extraction.
+
+    In listing mode (default) unchanged listings are served from the
+    listing-level cache; in soup mode identical pages are served from the
+    page-level LRU cache.
+
+    Args:
+        html: HTML content from Yellow Pages search page
+        source_page_url: URL of the page being parsed (for traceability)
+        timings: Optional dict filled with per-stage timings in seconds
+            (tree, select, serialize, hash, lookup, parse, store, total) and,
+            in listing mode, the 'cached' and 'parsed' listing counts
+
+    Returns:
+        List of dicts with enhanced business information
+    """
+    if timings is None:
+        timings = {}
+
+    start = time.perf_counter()
+    if PARSER_MODE == "soup":
+        results = _parse_yp_results_soup(html, source_page_url, timings)
+    else:
+        results = _parse_yp_results_listings(html, source_page_url, timings)
+    timings['total'] = time.perf_counter() - start
+
+    stage_timings = {stage: value for stage, value in timings.items() if stage not in ('cached', 'parsed')}
+    if PARSER_MODE != "soup":
+        from scrape_yp.listing_cache import get_listing_cache
+        get_listing_cache().record_timings(stage_timings)
+
+    logger.debug(
+        f"Parsed {len(results)} listings ({PARSER_MODE} mode, "
+        f"cached={timings.get('cached', '-')}, parsed={timings.get('parsed', '-')}): "
+        + ", ".join(f"{stage}={seconds * 1000:.1f}ms" for stage, seconds in stage_timings.items())
+    )
+
+    return results
+
+
 # Backward compatibility: if called as standalone parser
 def parse_yp_results(html: str) -> List[Dict]:
     """Alias for backward compatibility."""
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Staged page-processing pipeline for the Yellow Pages crawler.
+
+Each stage (parse, filter, dedup, ...) runs in its own thread and hands
+its output to the next stage through a bounded queue, so the crawler can
+fetch the next page while earlier pages are still being processed. When a
+stage falls behind, the queue in front of it fills up and the stages before
+it block (backpressure) - at most queue_size pages are held between any two
+stages, however many pages a target has.
+
+The crawler decides whether to fetch page N+1 from the outcome of page N.
+PageVerdicts carries that outcome from the last stage back to the fetcher.
+
+Usage:
+    from scrape_yp.yp_pipeline import StagePipeline
+
+    with StagePipeline([("parse", parse), ("filter", filter_)], sink=writer.put) as pipeline:
+        for page in pages:
+            pipeline.put(page)
+    pipeline.get_stats()  # per-stage throughput
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from runner.logging_setup import get_logger
+
+logger = get_logger("yp_pipeline")
+
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Counters for one pipeline stage."""
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0     # Time spent in the stage function
+    blocked_seconds: float = 0.0  # Time spent waiting on the next stage (backpressure)
+
+    def as_dict(self, elapsed: float) -> Dict[str, Any]:
+        """Counters plus throughput, for stats and logs."""
+        return {
+            'stage': self.name,
+            'items_in': self.items_in,
+            'items_out': self.items_out,
+            'errors': self.errors,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'blocked_seconds': round(self.blocked_seconds, 3),
+            # Capacity of the stage vs. what it actually achieved
+            'items_per_busy_sec': self.items_in / self.busy_seconds if self.busy_seconds else 0.0,
+            'items_per_sec': self.items_in / elapsed if elapsed else 0.0,
+        }
+
+
+class StagePipeline:
+    """
+    Chain of stage threads connected by bounded queues.
+
+    A stage function takes one item and returns an iterable of items for
+    the next stage (empty to drop it). Items leaving the last stage are
+    passed to sink. If a stage function raises, the item is dropped, the
+    error is counted and on_error(stage_name, item, exc) is called.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Tuple[str, Callable[[Any], Optional[Iterable[Any]]]]],
+        sink: Callable[[Any], None],
+        queue_size: int = 2,
+        name: str = "pipeline",
+        on_error: Optional[Callable[[str, Any, Exception], None]] = None,
+    ):
+        """
+        Start the stage threads.
+
+        Args:
+            stages: (name, function) pairs in processing order
+            sink: Receives every item produced by the last stage (called
+                from the last stage's thread; may block for backpressure)
+            queue_size: Maximum items waiting in front of each stage
+            name: Pipeline name for thread names and logs
+            on_error: Called when a stage function raises
+        """
+        if not stages:
+            raise ValueError("StagePipeline needs at least one stage")
+
+        self.name = name
+        self.sink = sink
+        self.on_error = on_error
+        self.stage_stats = [StageStats(stage_name) for stage_name, _ in stages]
+        self.source_stats = StageStats("submit")
+
+        self._queues: List[queue.Queue] = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self._threads: List[threading.Thread] = []
+        self._started = time.perf_counter()
+        self._elapsed: Optional[float] = None
+
+        for index, (stage_name, fn) in enumerate(stages):
+            thread = threading.Thread(
+                target=self._run_stage,
+                args=(index, stage_name, fn),
+                name=f"{name}-{stage_name}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, item: Any):
+        """Submit an item to the first stage (blocks while its queue is full)."""
+        start = time.perf_counter()
+        self._queues[0].put(item)
+        self.source_stats.blocked_seconds += time.perf_counter() - start
+        self.source_stats.items_out += 1
+
+    def close(self):
+        """Let every submitted item through all stages, then stop the threads."""
+        if self._elapsed is not None:
+            return
+        self._queues[0].put(_DONE)
+        for thread in self._threads:
+            thread.join()
+        self._elapsed = time.perf_counter() - self._started
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _run_stage(self, index: int, stage_name: str, fn: Callable):
+        """Stage thread: process items until the end marker arrives."""
+        stats = self.stage_stats[index]
+        inbox = self._queues[index]
+        outbox = self._queues[index + 1] if index + 1 < len(self._queues) else None
+        emit = outbox.put if outbox is not None else self.sink
+
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                if outbox is not None:
+                    outbox.put(_DONE)
+                return
+
+            stats.items_in += 1
+            start = time.perf_counter()
+            try:
+                outputs = list(fn(item) or ())
+            except Exception as e:
+                stats.errors += 1
+                logger.warning(f"{self.name}: stage '{stage_name}' failed: {e}")
+                if self.on_error:
+                    self.on_error(stage_name, item, e)
+                continue
+            finally:
+                stats.busy_seconds += time.perf_counter() - start
+
+            for output in outputs:
+                start = time.perf_counter()
+                try:
+                    emit(output)
+                except Exception as e:
+                    stats.errors += 1
+                    logger.warning(f"{self.name}: stage '{stage_name}' could not emit: {e}")
+                    if self.on_error:
+                        self.on_error(stage_name, output, e)
+                    continue
+                finally:
+                    stats.blocked_seconds += time.perf_counter() - start
+                stats.items_out += 1
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-stage statistics.
+
+        Returns:
+            List of per-stage dicts (items, errors, busy/blocked time and
+            throughput), starting with the submitting thread
+        """
+        elapsed = self._elapsed if self._elapsed is not None else time.perf_counter() - self._started
+        return [self.source_stats.as_dict(elapsed)] + [stats.as_dict(elapsed) for stats in self.stage_stats]
+
+
+@dataclass(frozen=True)
+class PageVerdict:
+    """Outcome of processing one results page."""
+    parsed: int = 0
+    accepted: int = 0
+    error: Optional[Exception] = None
+
+    @property
+    def proceed(self) -> bool:
+        """Whether pagination should continue past this page."""
+        return self.error is None and self.accepted > 0
+
+
+class PageVerdicts:
+    """Page outcomes posted by the pipeline and awaited by the fetcher."""
+
+    def __init__(self):
+        self._verdicts: Dict[int, PageVerdict] = {}
+        self._cond = threading.Condition()
+
+    def post(self, page: int, verdict: PageVerdict):
+        """Record the outcome of a page (the first one posted wins)."""
+        with self._cond:
+            self._verdicts.setdefault(page, verdict)
+            self._cond.notify_all()
+
+    def wait(self, page: int, timeout: Optional[float] = None) -> Optional[PageVerdict]:
+        """
+        Wait for the outcome of a page.
+
+        Args:
+            page: Page number
+            timeout: Maximum seconds to wait (None = until posted)
+
+        Returns:
+            PageVerdict, or None on timeout
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: page in self._verdicts, timeout=timeout)
+            return self._verdicts.get(page)
+
+    def reset(self, page: int):
+        """Forget a page's outcome (before it is fetched again)."""
+        with self._cond:
+            self._verdicts.pop(page, None)
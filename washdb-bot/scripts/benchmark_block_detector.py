@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared CAPTCHA/block detector against the sequential scans.
+
+Runs every page in the labeled fixture corpus (tests/fixtures/block_pages)
+through the old per-indicator `in html.lower()` checks and through
+runner.block_detector, and reports per-page timings.
+
+Usage:
+    python scripts/benchmark_block_detector.py [--iterations N] [--fixtures DIR]
+
+Options:
+    --iterations N   Scans per page and method (default: 2000)
+    --fixtures DIR   Directory of .html pages (default: tests/fixtures/block_pages)
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from runner.block_detector import (
+    YP_DETECTOR,
+    YP_CAPTCHA_RULES,
+    YP_BLOCK_RULES,
+)
+
+DEFAULT_FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures" / "block_pages"
+
+
+def sequential_scan(html: str):
+    """The previous detect_captcha + detect_blocking: two lower() calls, ~20 scans."""
+    captcha = ""
+    html_lower = html.lower()
+    for indicator, label in YP_CAPTCHA_RULES:
+        if indicator in html_lower:
+            captcha = label
+            break
+
+    blocked = ""
+    html_lower = html.lower()
+    for indicator, label in YP_BLOCK_RULES:
+        if indicator in html_lower:
+            blocked = label
+            break
+
+    return captcha, blocked
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CAPTCHA/block detection")
+    parser.add_argument("--iterations", type=int, default=2000, help="Scans per page and method")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES, help="Fixture directory")
+    args = parser.parse_args()
+
+    pages = sorted(args.fixtures.glob("*.html"))
+    if not pages:
+        print(f"No .html fixtures found in {args.fixtures}")
+        return 1
+
+    print(f"{'page':<40} {'size':>8} {'sequential':>12} {'compiled':>12} {'speedup':>8}")
+    print("-" * 84)
+
+    total_old = total_new = 0.0
+    for path in pages:
+        html = path.read_text()
+        old = timeit.timeit(lambda: sequential_scan(html), number=args.iterations)
+        new = timeit.timeit(lambda: YP_DETECTOR.scan(html), number=args.iterations)
+        total_old += old
+        total_new += new
+
+        per_old = old / args.iterations * 1e6
+        per_new = new / args.iterations * 1e6
+        print(
+            f"{path.name:<40} {len(html):>8} {per_old:>10.1f}us {per_new:>10.1f}us "
+            f"{old / new:>7.1f}x"
+        )
+
+    print("-" * 84)
+    print(f"{'total':<40} {'':>8} {total_old:>11.3f}s {total_new:>11.3f}s {total_old / total_new:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
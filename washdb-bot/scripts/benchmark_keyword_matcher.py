@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared keyword matcher against per-keyword substring checks.
+
+Generates keyword lists of increasing size and times matching listing names
+and descriptions with the old `keyword in text` loop, the Aho-Corasick
+automaton and the linear scan the matcher uses for short lists.
+
+Usage:
+    python scripts/benchmark_keyword_matcher.py [--iterations N] [--keywords FILE]
+
+Options:
+    --iterations N   Matches per text and method (default: 2000)
+    --keywords FILE  Real keyword file to include (e.g. data/anti_keywords.txt)
+"""
+
+import argparse
+import random
+import string
+import sys
+import timeit
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import runner.keyword_matcher as keyword_matcher
+from runner.keyword_matcher import KeywordMatcher, load_keywords
+
+TEXTS = {
+    'name (~30 chars)': "ABC Pressure Washing & Sealing",
+    'description (~300 chars)': (
+        "Family owned pressure washing and soft wash company serving homes and "
+        "businesses. House washing, roof cleaning, deck and fence restoration, "
+        "concrete and driveway cleaning, gutter brightening and commercial "
+        "fleet washing. Fully insured, free estimates, satisfaction guaranteed. "
+        "Call today for same week service."
+    ),
+}
+
+
+def random_keywords(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choices(string.ascii_lowercase + " ", k=rng.randint(4, 14))).strip()
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyword matching")
+    parser.add_argument("--iterations", type=int, default=2000, help="Matches per text and method")
+    parser.add_argument("--keywords", type=Path, help="Keyword file to benchmark as well")
+    args = parser.parse_args()
+
+    lists = {f"random x{n}": random_keywords(n) for n in (32, 64, 128, 256, 1024, 4096)}
+    if args.keywords:
+        lists[args.keywords.name] = list(load_keywords(str(args.keywords)))
+
+    print(f"{'keywords':<22} {'text':<26} {'sequential':>12} {'automaton':>12} {'linear':>10} {'speedup':>8}")
+    print("-" * 95)
+
+    for list_name, keywords in lists.items():
+        for text_name, text in TEXTS.items():
+            keyword_matcher.LINEAR_SCAN_MAX_KEYWORDS = 0
+            matcher = KeywordMatcher(keywords)
+            lowered = text.lower()
+
+            def sequential():
+                text_lower = text.lower()
+                return [keyword for keyword in matcher.keywords if keyword in text_lower]
+
+            old = timeit.timeit(sequential, number=args.iterations)
+            automaton = timeit.timeit(lambda: matcher._match(lowered), number=args.iterations)
+            linear = timeit.timeit(
+                lambda: [keyword for keyword in matcher.keywords if keyword in lowered],
+                number=args.iterations,
+            )
+
+            per = lambda total: total / args.iterations * 1e6
+            print(
+                f"{list_name + f' ({len(matcher)})':<22} {text_name:<26} {per(old):>10.1f}us "
+                f"{per(automaton):>10.1f}us {per(linear):>8.1f}us {old / min(automaton, linear):>7.1f}x"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
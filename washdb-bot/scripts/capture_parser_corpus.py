@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Add pages to the offline parser benchmark corpus (tests/fixtures/parser_corpus).
+
+Pages come from a live fetch or from HTML saved during a live run (e.g. a
+SERP or YP page dumped by the scraper). Each page is stored under
+<corpus>/<kind>/<slug>.html and recorded in manifest.json with its sha1;
+the corpus version is bumped once per run that adds pages, which makes the
+benchmark baseline stale until it is re-recorded:
+
+    python -m tests.benchmarks.parser_bench --update-baseline
+
+Usage:
+    python scripts/capture_parser_corpus.py --kind web https://example.com/ https://example.org/services
+    python scripts/capture_parser_corpus.py --kind serp --query "pressure washing" --location "Austin, TX" \\
+        --from-file /tmp/serp.html --url "https://www.google.com/search?q=pressure+washing"
+    python scripts/capture_parser_corpus.py --kind yp --from-dir /tmp/yp_pages --url https://www.yellowpages.com/
+
+Options:
+    --kind {serp,yp,web}  Which parsers the pages are for
+    --from-file FILE      Saved HTML file (use --url for its source URL)
+    --from-dir DIR        Directory of saved .html files
+    --url URL             Source URL for saved HTML
+    --query / --location  Search query and location (required for serp pages)
+    --corpus DIR          Corpus directory (default: tests/fixtures/parser_corpus)
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+
+DEFAULT_CORPUS = Path(__file__).parent.parent / "tests" / "fixtures" / "parser_corpus"
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def slugify(text: str) -> str:
+    """Lowercase, dash-separated file name stem."""
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")[:80] or "page"
+
+
+def fetch(url: str) -> str:
+    """Fetch a page live."""
+    response = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=30)
+    response.raise_for_status()
+    return response.text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add pages to the parser benchmark corpus")
+    parser.add_argument("urls", nargs="*", help="URLs to fetch live")
+    parser.add_argument("--kind", required=True, choices=["serp", "yp", "web"], help="Page kind")
+    parser.add_argument("--from-file", type=Path, help="Saved HTML file")
+    parser.add_argument("--from-dir", type=Path, help="Directory of saved .html files")
+    parser.add_argument("--url", help="Source URL for saved HTML")
+    parser.add_argument("--query", help="Search query (serp pages)")
+    parser.add_argument("--location", help="Search location (serp pages)")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="Corpus directory")
+    args = parser.parse_args()
+
+    if args.kind == "serp" and not args.query:
+        parser.error("--query is required for serp pages")
+
+    # (html, source url, file stem, source)
+    pages = []
+    saved = [args.from_file] if args.from_file else []
+    if args.from_dir:
+        saved.extend(sorted(args.from_dir.glob("*.html")))
+    for path in saved:
+        pages.append((path.read_text(encoding="utf-8", errors="replace"), args.url or "", path.stem, "saved"))
+    for url in args.urls:
+        try:
+            html = fetch(url)
+        except requests.RequestException as e:
+            print(f"Skipping {url}: {e}")
+            continue
+        parsed = urlparse(url)
+        pages.append((html, url, f"{parsed.netloc}{parsed.path}", "live"))
+
+    if not pages:
+        parser.error("Nothing to add: give URLs, --from-file or --from-dir")
+
+    manifest_path = args.corpus / "manifest.json"
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {"version": 0, "pages": []}
+    known = {entry["sha1"] for entry in manifest["pages"]}
+    (args.corpus / args.kind).mkdir(parents=True, exist_ok=True)
+
+    added = 0
+    for html, url, stem, source in pages:
+        data = html.encode("utf-8")
+        sha1 = hashlib.sha1(data).hexdigest()
+        if sha1 in known:
+            print(f"Already in corpus: {stem}")
+            continue
+
+        stem = slugify(f"{args.query} {args.location or ''}" if args.kind == "serp" and len(pages) == 1 else stem)
+        path = args.corpus / args.kind / f"{stem}.html"
+        n = 2
+        while path.exists():
+            path = args.corpus / args.kind / f"{stem}-{n}.html"
+            n += 1
+        path.write_bytes(data)
+
+        entry = {
+            "path": str(path.relative_to(args.corpus)),
+            "kind": args.kind,
+            "url": url,
+            "source": source,
+            "captured_at": datetime.now().strftime("%Y-%m-%d"),
+            "sha1": sha1,
+        }
+        if args.kind == "serp":
+            entry["query"] = args.query
+            entry["location"] = args.location
+        manifest["pages"].append(entry)
+        known.add(sha1)
+        added += 1
+        print(f"Added {entry['path']} ({len(data) / 1024:.1f} KB)")
+
+    if added:
+        manifest["version"] += 1
+        manifest_path.write_text(json.dumps(manifest, indent=2) + "\n")
+        print(f"Corpus v{manifest['version']}: {len(manifest['pages'])} pages")
+        print("Re-record the baseline: python -m tests.benchmarks.parser_bench --update-baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,8 @@ Features:
 - Ultra-slow rate limits (30-60 minutes between requests) to avoid detection
 - CAPTCHA cooldown: pauses if too many consecutive CAPTCHAs detected
 - Auto-resumes on restart (tracks last scraped company)
+- Window mode claims companies from the shared SERP priority queue, so
+  multiple instances can run without scraping the same company
 - Systemd service compatible for auto-restart on reboot
 - Comprehensive logging and progress tracking
 
@@ -109,6 +111,11 @@ class ContinuousSerpScraper:
         from seo_intelligence.services import get_domain_quarantine
         self.quarantine = get_domain_quarantine()
 
+        # Shared priority queue: window mode claims batches from it so
+        # several scraper instances can run without overlapping
+        from seo_intelligence.services import get_serp_priority_queue
+        self.priority_queue = get_serp_priority_queue()
+
         # Stats tracking
         self.cycle_num = 0
         self.total_scraped = 0
@@ -210,6 +217,33 @@ class ContinuousSerpScraper:
 
             return companies
 
+    def _claim_companies(self, limit: int) -> List[Dict]:
+        """
+        Claim the next companies from the shared SERP priority queue.
+
+        Claims are atomic and leased, so concurrent scraper instances
+        never receive the same company.
+
+        Args:
+            limit: Maximum number of companies to claim
+
+        Returns:
+            Company dicts in priority order
+        """
+        # Lease covers the whole window (max delay per query plus slack)
+        lease_minutes = limit * (self.MAX_DELAY_MINUTES + 5)
+
+        claimed = self.priority_queue.claim_batch(limit=limit, lease_minutes=lease_minutes)
+        return [
+            {
+                'id': company.company_id,
+                'name': company.name,
+                'website': company.website,
+                'address': company.address,
+            }
+            for company in claimed
+        ]
+
     def _build_search_query(self, company: Dict) -> str:
         """
         Build Google search query for company.
@@ -446,23 +480,25 @@ class ContinuousSerpScraper:
         logger.info(f"Target queries: {queries_this_window}")
         logger.info("")
 
-        # Get companies to scrape
-        companies = self._get_verified_companies()
+        # Claim companies to scrape (highest priority first)
+        companies = self._claim_companies(queries_this_window)
 
         if not companies:
             logger.info("No companies to scrape (all caught up!)")
             self._reset_progress()
             return 0
 
-        # Scrape up to queries_this_window companies
+        # Scrape claimed companies
         scraped = 0
         failed = 0
 
-        for i, company in enumerate(companies[:queries_this_window], 1):
+        for i, company in enumerate(companies, 1):
             # Check if Google is quarantined
             if self.quarantine.is_quarantined('google.com'):
                 entry = self.quarantine.get_quarantine_entry('google.com')
                 logger.warning(f"Google quarantined until {entry.expires_at}. Skipping window.")
+                # Hand unprocessed claims back to the queue
+                self.priority_queue.release([c['id'] for c in companies[i - 1:]])
                 break
 
             logger.info(f"\nQuery {i}/{queries_this_window} in {window['name']} window")
@@ -480,11 +516,17 @@ class ContinuousSerpScraper:
                     reason='CAPTCHA_DETECTED'
                 )
 
+            # Record the result and release the claim
+            if not self.dry_run:
+                self.priority_queue.complete(company['id'], success=success)
+            else:
+                self.priority_queue.release([company['id']])
+
             # Save progress
             self._save_progress(company['id'])
 
             # Delay before next query (unless last one)
-            if i < queries_this_window and i < len(companies):
+            if i < len(companies):
                 self._window_delay()
 
         logger.info("")
@@ -183,8 +183,9 @@ def cmd_embed(args):
     """Manage vector embeddings and semantic search."""
     from seo_intelligence.services import get_content_embedder, get_qdrant_manager
     import os
-    from sqlalchemy import create_engine, text
+    from sqlalchemy import text
     from sqlalchemy.orm import Session
+    from db.engine_registry import get_engine
 
     # Initialize services
     try:
@@ -197,7 +198,7 @@ def cmd_embed(args):
             print("ERROR: DATABASE_URL not set")
             return
 
-        engine = create_engine(database_url, echo=False)
+        engine = get_engine(database_url)
 
     except Exception as e:
         print(f"ERROR: Failed to initialize embedding services: {e}")
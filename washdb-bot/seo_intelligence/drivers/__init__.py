@@ -1,7 +1,8 @@
 """
 SeleniumBase UC Drivers for SEO Intelligence.
 
-This module provides undetected Chrome drivers for various SEO scraping tasks.
+This module provides undetected Chrome drivers for various SEO scraping tasks,
+and a pool that keeps warm drivers per site for reuse.
 """
 
 from .seleniumbase_drivers import (
@@ -14,6 +15,7 @@ from .seleniumbase_drivers import (
     get_driver_for_site,
     click_element_human_like,
 )
+from .driver_pool import UCDriverPool, get_driver_pool
 
 __all__ = [
     "get_uc_driver",
@@ -24,4 +26,6 @@ __all__ = [
     "get_gbp_driver",
     "get_driver_for_site",
     "click_element_human_like",
+    "UCDriverPool",
+    "get_driver_pool",
 ]
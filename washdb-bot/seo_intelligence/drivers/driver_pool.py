@@ -0,0 +1,490 @@
+"""
+Warm SeleniumBase UC driver pool.
+
+Starting an undetected-Chrome driver (and running the site factory's
+warm-up navigation) takes 5-10 s, which dominates short SERP and citation
+lookups when every browser_session creates and quits its own driver.
+UCDriverPool keeps up to K warm drivers per site type and hands them out
+again:
+
+- Each pool slot keeps its proxy (proxy affinity): a recycled driver is
+  recreated on the same proxy unless that proxy was the problem.
+- A driver is health-checked before it is handed out.
+- Cookies (browser-wide) and the storage of every origin the driver
+  visited are cleared when a driver is returned; a driver that cannot be
+  cleared is quit instead of reused.
+- Drivers are only shared between callers asking for the same site,
+  headless mode, proxy use and factory options.
+- Drivers are recycled after max_age_seconds or max_uses sessions.
+
+When all K drivers of a site are busy, an overflow driver is created for
+the caller and quit when it is returned.
+
+Usage:
+    from seo_intelligence.drivers.driver_pool import get_driver_pool
+
+    with get_driver_pool().driver("google", headless=True) as driver:
+        driver.get("https://www.google.com/search?q=...")
+
+    get_driver_pool().get_stats()   # pool metrics for the dashboard
+"""
+
+import atexit
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from runner.logging_setup import get_logger
+
+logger = get_logger("driver_pool")
+
+# Site aliases accepted by get_driver_for_site -> pool site type
+SITE_ALIASES = {
+    "google_serp": "google",
+    "yp": "yellowpages",
+    "maps": "gbp",
+}
+
+# Pool key: (site, headless, use_proxy, sorted factory kwargs)
+PoolKey = Tuple[str, bool, bool, Tuple[Tuple[str, Any], ...]]
+
+
+@dataclass
+class PooledDriver:
+    """A driver owned by the pool, with its proxy and usage."""
+    driver: Any
+    site: str
+    headless: bool
+    proxy: Optional[str]
+    slot: Optional[int]                 # None for overflow drivers
+    created_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+    id: int = 0
+    key: Optional[PoolKey] = None
+
+
+def _site_key(site: str) -> str:
+    site = (site or "generic").lower()
+    return SITE_ALIASES.get(site, site)
+
+
+def _pool_key(site: str, headless: bool, use_proxy: bool, factory_kwargs: Dict[str, Any]) -> PoolKey:
+    """Drivers are only shared between callers asking for the same driver."""
+    return (_site_key(site), headless, use_proxy, tuple(sorted(factory_kwargs.items())))
+
+
+def _origin(url: Optional[str]) -> Optional[str]:
+    """scheme://host[:port] of an http(s) URL, else None."""
+    parsed = urlparse(url or "")
+    if parsed.scheme in ("http", "https") and parsed.netloc:
+        return f"{parsed.scheme}://{parsed.netloc}"
+    return None
+
+
+def _visited_origins(driver) -> Set[str]:
+    """
+    Origins a driver may hold storage for: every entry in its tab history,
+    the pages open in its targets, and the domains of its cookies.
+    """
+    urls = [entry.get("url") for entry in
+            driver.execute_cdp_cmd("Page.getNavigationHistory", {}).get("entries", [])]
+    try:
+        urls += [info.get("url") for info in
+                 driver.execute_cdp_cmd("Target.getTargets", {}).get("targetInfos", [])]
+    except Exception:
+        pass
+
+    origins = {origin for origin in map(_origin, urls) if origin}
+    for cookie in driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", []):
+        domain = (cookie.get("domain") or "").lstrip(".")
+        if domain:
+            origins.update((f"https://{domain}", f"http://{domain}"))
+    return origins
+
+
+def _default_factory(site: str, headless: bool, use_proxy: bool, proxy: Optional[str], **kwargs):
+    """Create a driver with the site-specific factory."""
+    from seo_intelligence.drivers.seleniumbase_drivers import get_driver_for_site
+    return get_driver_for_site(site, headless=headless, use_proxy=use_proxy, proxy=proxy, **kwargs)
+
+
+def _default_proxy_picker(site: str) -> Optional[str]:
+    """Pick a proxy for a new pool slot (scored for the site's domain)."""
+    from seo_intelligence.drivers.seleniumbase_drivers import SITE_DOMAINS, _get_proxy_string
+    return _get_proxy_string(SITE_DOMAINS.get(site))
+
+
+class UCDriverPool:
+    """
+    Pool of warm UC drivers, K per (site, headless, use_proxy, factory options).
+
+    Thread-safe: drivers are created and quit outside the pool lock, so a
+    slow driver start for one site never holds up another.
+    """
+
+    def __init__(
+        self,
+        size_per_site: int = 2,
+        max_age_seconds: float = 1800,
+        max_uses: int = 50,
+        factory: Optional[Callable[..., Any]] = None,
+        proxy_picker: Optional[Callable[[str], Optional[str]]] = None,
+    ):
+        """
+        Initialize the pool (drivers are created on demand).
+
+        Args:
+            size_per_site: Warm drivers kept per site type
+            max_age_seconds: Recycle drivers older than this
+            max_uses: Recycle drivers after this many sessions
+            factory: Creates a driver: factory(site, headless, use_proxy, proxy, **kwargs)
+            proxy_picker: Picks a proxy string for a new slot
+        """
+        self.size_per_site = size_per_site
+        self.max_age_seconds = max_age_seconds
+        self.max_uses = max_uses
+        self.factory = factory or _default_factory
+        self.proxy_picker = proxy_picker or _default_proxy_picker
+
+        self._lock = threading.Lock()
+        self._idle: Dict[PoolKey, List[PooledDriver]] = {}
+        # slot -> proxy affinity, and slots currently holding a driver (idle or in use)
+        self._slot_proxies: Dict[PoolKey, Dict[int, Optional[str]]] = {}
+        self._busy_slots: Dict[PoolKey, set] = {}
+        self._ids = itertools.count(1)
+        self._closed = False
+
+        self._stats = {
+            'acquired': 0,
+            'reused': 0,
+            'created': 0,
+            'overflow': 0,
+            'create_failures': 0,
+            'health_check_failures': 0,
+            'recycled_age': 0,
+            'recycled_uses': 0,
+            'discarded': 0,
+            'create_seconds': 0.0,
+            'wait_saved_seconds': 0.0,
+        }
+
+        logger.info(
+            f"UCDriverPool initialized: {size_per_site} per site, "
+            f"max age {max_age_seconds:.0f}s, max {max_uses} uses"
+        )
+
+    def acquire(self, site: str, headless: bool = True, use_proxy: bool = True, **factory_kwargs) -> PooledDriver:
+        """
+        Get a healthy driver for a site.
+
+        Args:
+            site: Site type (google, yelp, bbb, yellowpages, gbp, generic)
+            headless: Run in headless mode
+            use_proxy: Whether drivers for this site use a proxy
+            **factory_kwargs: Passed to the driver factory (retry_attempts, wait_time)
+
+        Returns:
+            PooledDriver (return it with release())
+
+        Raises:
+            RuntimeError: If no driver could be created
+        """
+        key = _pool_key(site, headless, use_proxy, factory_kwargs)
+
+        with self._lock:
+            self._stats['acquired'] += 1
+            idle = self._idle.setdefault(key, [])
+            pooled = idle.pop() if idle else None
+            slot = self._claim_slot(key) if pooled is None else pooled.slot
+
+        if pooled is not None:
+            expired = self._expired(pooled)
+            if not expired and self._healthy(pooled):
+                pooled.uses += 1
+                with self._lock:
+                    self._stats['reused'] += 1
+                    self._stats['wait_saved_seconds'] += self._avg_create_seconds()
+                return pooled
+
+            if not expired:
+                # Dead browser: the slot gets a fresh driver on a new proxy
+                with self._lock:
+                    self._stats['health_check_failures'] += 1
+                self._forget_proxy(key, slot)
+            self._quit(pooled)
+
+        return self._create(key, slot)
+
+    def release(self, pooled: PooledDriver, discard: bool = False):
+        """
+        Return a driver to the pool.
+
+        Args:
+            pooled: Driver from acquire()
+            discard: Quit the driver instead of reusing it (e.g. after a
+                WebDriverException or a block); its slot gets a new proxy
+        """
+        key = pooled.key
+
+        if pooled.slot is None or self._closed:
+            self._quit(pooled)
+            return
+
+        if discard:
+            with self._lock:
+                self._stats['discarded'] += 1
+            self._quit(pooled)
+            self._forget_proxy(key, pooled.slot)
+            self._free_slot(key, pooled.slot)
+            return
+
+        if self._expired(pooled) or not self._reset(pooled):
+            self._quit(pooled)
+            self._free_slot(key, pooled.slot)
+            return
+
+        with self._lock:
+            self._idle.setdefault(key, []).append(pooled)
+
+    @contextmanager
+    def driver(self, site: str, headless: bool = True, use_proxy: bool = True, **factory_kwargs):
+        """
+        Borrow a driver for a block of work.
+
+        The driver is discarded (not reused) if the block raises a
+        WebDriverException.
+
+        Yields:
+            SeleniumBase Driver
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        pooled = self.acquire(site, headless=headless, use_proxy=use_proxy, **factory_kwargs)
+        discard = False
+        try:
+            yield pooled.driver
+        except WebDriverException:
+            discard = True
+            raise
+        finally:
+            self.release(pooled, discard=discard)
+
+    def prewarm(self, site: str, count: Optional[int] = None, headless: bool = True, use_proxy: bool = True,
+                **factory_kwargs) -> int:
+        """
+        Start drivers for a site ahead of the first session.
+
+        Args:
+            site: Site type
+            count: Drivers to start (default: size_per_site)
+
+        Returns:
+            Number of warm idle drivers for the site
+        """
+        key = _pool_key(site, headless, use_proxy, factory_kwargs)
+        for _ in range(count or self.size_per_site):
+            with self._lock:
+                slot = self._claim_slot(key)
+            if slot is None:
+                break
+            pooled = self._create(key, slot)
+            pooled.uses = 0
+            self.release(pooled)
+
+        with self._lock:
+            return len(self._idle.get(key, []))
+
+    def close_all(self):
+        """Quit every idle driver (drivers in use are quit when released)."""
+        with self._lock:
+            self._closed = True
+            drivers = [pooled for idle in self._idle.values() for pooled in idle]
+            self._idle.clear()
+            self._busy_slots.clear()
+        for pooled in drivers:
+            self._quit(pooled)
+        if drivers:
+            logger.info(f"UCDriverPool closed {len(drivers)} drivers")
+
+    # ------------------------------------------------------------------ internals
+
+    def _claim_slot(self, key) -> Optional[int]:
+        """Reserve a free slot for a new driver (None = overflow). Lock held."""
+        busy = self._busy_slots.setdefault(key, set())
+        for slot in range(self.size_per_site):
+            if slot not in busy:
+                busy.add(slot)
+                return slot
+        return None
+
+    def _free_slot(self, key, slot: Optional[int]):
+        with self._lock:
+            self._busy_slots.get(key, set()).discard(slot)
+
+    def _forget_proxy(self, key, slot: Optional[int]):
+        with self._lock:
+            self._slot_proxies.get(key, {}).pop(slot, None)
+
+    def _create(self, key: PoolKey, slot: Optional[int]) -> PooledDriver:
+        """Create a driver for a slot, keeping the slot's proxy if it has one."""
+        site, headless, use_proxy, options = key
+        factory_kwargs = dict(options)
+        proxy = None
+        if use_proxy:
+            with self._lock:
+                proxy = self._slot_proxies.get(key, {}).get(slot)
+            if proxy is None:
+                proxy = self.proxy_picker(site)
+
+        start = time.perf_counter()
+        try:
+            driver = self.factory(site, headless=headless, use_proxy=use_proxy, proxy=proxy, **factory_kwargs)
+        except Exception as e:
+            logger.warning(f"UCDriverPool: driver creation for {site} raised: {e}")
+            driver = None
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            if driver is None:
+                self._stats['create_failures'] += 1
+                self._slot_proxies.get(key, {}).pop(slot, None)
+                if slot is not None:
+                    self._busy_slots.get(key, set()).discard(slot)
+            else:
+                self._stats['created'] += 1
+                self._stats['create_seconds'] += elapsed
+                if slot is None:
+                    self._stats['overflow'] += 1
+                else:
+                    self._slot_proxies.setdefault(key, {})[slot] = proxy
+
+        if driver is None:
+            raise RuntimeError(f"Could not create driver for {site}")
+
+        logger.debug(f"UCDriverPool: created {site} driver (slot={slot}) in {elapsed:.1f}s")
+        return PooledDriver(driver=driver, site=site, headless=headless, proxy=proxy,
+                            slot=slot, uses=1, id=next(self._ids), key=key)
+
+    def _expired(self, pooled: PooledDriver) -> bool:
+        """Whether a driver is due for recycling (counts the reason)."""
+        if time.monotonic() - pooled.created_at > self.max_age_seconds:
+            reason = 'recycled_age'
+        elif pooled.uses >= self.max_uses:
+            reason = 'recycled_uses'
+        else:
+            return False
+        with self._lock:
+            self._stats[reason] += 1
+        return True
+
+    def _healthy(self, pooled: PooledDriver) -> bool:
+        """Check that the browser still answers."""
+        try:
+            return bool(pooled.driver.window_handles) and pooled.driver.execute_script("return 1") == 1
+        except Exception as e:
+            logger.debug(f"UCDriverPool: health check failed for {pooled.site} driver: {e}")
+            return False
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """
+        Clear cookies and storage before the driver is reused.
+
+        Cookies are cleared browser-wide, storage (local/session storage,
+        IndexedDB, cache storage, service workers) for each visited origin.
+        Needs CDP: without it the next caller could see this session's
+        state, so the driver is not reused.
+        """
+        driver = pooled.driver
+        try:
+            origins = _visited_origins(driver)
+            driver.get("about:blank")
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            return True
+        except Exception as e:
+            logger.debug(f"UCDriverPool: reset failed for {pooled.site} driver: {e}")
+            return False
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"UCDriverPool: driver quit error: {e}")
+
+    def _avg_create_seconds(self) -> float:
+        """Average driver start time (lock held)."""
+        created = self._stats['created']
+        return self._stats['create_seconds'] / created if created else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            dict: Reuse/creation/recycle counters, reuse rate, average
+            driver start time, and idle/in-use drivers per site
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['avg_create_seconds'] = self._avg_create_seconds()
+            stats['reuse_rate_pct'] = (
+                stats['reused'] / stats['acquired'] * 100 if stats['acquired'] else 0.0
+            )
+            sites = {}
+            for key in set(self._idle) | set(self._busy_slots):
+                site = key[0]
+                idle = len(self._idle.get(key, []))
+                entry = sites.setdefault(site, {'idle': 0, 'in_use': 0})
+                entry['idle'] += idle
+                entry['in_use'] += len(self._busy_slots.get(key, set())) - idle
+            stats['sites'] = sites
+            stats['idle_drivers'] = sum(entry['idle'] for entry in sites.values())
+            stats['active_drivers'] = sum(entry['idle'] + entry['in_use'] for entry in sites.values())
+            stats['size_per_site'] = self.size_per_site
+        return stats
+
+
+# Global singleton instance
+_driver_pool: Optional[UCDriverPool] = None
+_pool_lock = threading.Lock()
+
+
+def is_driver_pool_enabled() -> bool:
+    """Whether browser sessions should borrow drivers from the pool (UC_DRIVER_POOL)."""
+    return os.getenv("UC_DRIVER_POOL", "true").lower() not in ("0", "false", "off", "no")
+
+
+def get_driver_pool() -> UCDriverPool:
+    """
+    Get or create the global UC driver pool.
+
+    Returns:
+        UCDriverPool: Global pool instance
+    """
+    global _driver_pool
+
+    if _driver_pool is None:
+        with _pool_lock:
+            if _driver_pool is None:
+                _driver_pool = UCDriverPool(
+                    size_per_site=int(os.getenv("UC_DRIVER_POOL_SIZE", "2")),
+                    max_age_seconds=float(os.getenv("UC_DRIVER_MAX_AGE_SECONDS", "1800")),
+                    max_uses=int(os.getenv("UC_DRIVER_MAX_USES", "50")),
+                )
+
+    return _driver_pool
+
+
+def _cleanup_on_exit():
+    """Quit pooled drivers on program exit."""
+    if _driver_pool is not None:
+        _driver_pool.close_all()
+
+
+atexit.register(_cleanup_on_exit)
@@ -22,6 +22,7 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from scrape_yp.proxy_pool import ProxyInfo
 from seo_intelligence.services.proxy_manager import get_proxy_manager
 from runner.logging_setup import get_logger
 
@@ -36,6 +37,12 @@ DEFAULT_WAIT_TIME = 10
 # Virtual display configuration
 USE_VIRTUAL_DISPLAY = True  # Use Xvfb virtual display for headed mode
 VIRTUAL_DISPLAY_NUM = 99    # Display number for Xvfb (:99)
+
+# Domains proxy outcomes are scored under
+GOOGLE_DOMAIN = "google.com"
+YELP_DOMAIN = "yelp.com"
+BBB_DOMAIN = "bbb.org"
+YELLOWPAGES_DOMAIN = "yellowpages.com"
 _xvfb_process = None        # Global Xvfb process
 _virtual_display_initialized = False  # Track if we've set up the display
 
@@ -129,28 +136,93 @@ def click_element_human_like(driver, element, scroll_first: bool = True):
             driver.execute_script("arguments[0].click();", element)
 
 
-def _get_proxy_string() -> Optional[str]:
+def _pick_proxy(domain: Optional[str] = None) -> Optional[ProxyInfo]:
     """
-    Get proxy string for SeleniumBase from existing ProxyManager.
+    Pick a proxy for domain from the existing ProxyManager (scored selection).
+
+    Args:
+        domain: Target domain the driver will be used for
 
     Returns:
-        Proxy string in format 'user:pass@host:port' or None
+        ProxyInfo or None if proxies are disabled or unavailable
     """
     try:
         manager = get_proxy_manager()
         if not manager.is_enabled():
             return None
+        return manager.get_proxy(domain=domain)
+
+    except Exception as e:
+        logger.warning(f"Error getting proxy: {e}")
+        return None
+
+
+def _proxy_string(proxy_info: Optional[ProxyInfo]) -> Optional[str]:
+    """Format a proxy for SeleniumBase ('user:pass@host:port')."""
+    if proxy_info is None:
+        return None
+    return f"{proxy_info.username}:{proxy_info.password}@{proxy_info.host}:{proxy_info.port}"
 
-        proxy_info = manager.get_proxy(strategy="round_robin")
-        if proxy_info is None:
+
+def _lookup_proxy(proxy: Optional[str]) -> Optional[ProxyInfo]:
+    """Find the ProxyManager entry for a 'user:pass@host:port' string (None if unknown)."""
+    if not proxy:
+        return None
+    try:
+        manager = get_proxy_manager()
+        if not manager.is_enabled():
             return None
+        key = proxy.rsplit("@", 1)[-1]
+        return next((p for p in manager.pool.proxies if p.key == key), None)
+    except Exception:
+        return None
 
-        # SeleniumBase expects format: user:pass@host:port
-        return f"{proxy_info.username}:{proxy_info.password}@{proxy_info.host}:{proxy_info.port}"
 
+def _get_proxy_string(domain: Optional[str] = None) -> Optional[str]:
+    """
+    Get proxy string for SeleniumBase from existing ProxyManager.
+
+    Args:
+        domain: Target domain the driver will be used for
+
+    Returns:
+        Proxy string in format 'user:pass@host:port' or None
+    """
+    return _proxy_string(_pick_proxy(domain))
+
+
+def _timed_get(driver, url: str) -> float:
+    """Navigate to url and return the navigation time in seconds."""
+    start = time.perf_counter()
+    driver.get(url)
+    return time.perf_counter() - start
+
+
+def _report_proxy(
+    proxy_info: Optional[ProxyInfo],
+    domain: str,
+    error: Optional[str],
+    latency: Optional[float] = None,
+):
+    """
+    Report a driver setup attempt's outcome for proxy scoring.
+
+    Args:
+        proxy_info: Proxy the driver used (no-op if None)
+        domain: Target domain
+        error: Page check result ("OK" for success) or error type
+        latency: Navigation time in seconds, if measured
+    """
+    if proxy_info is None:
+        return
+    try:
+        manager = get_proxy_manager()
+        if error == "OK":
+            manager.report_success(proxy_info, latency=latency, domain=domain)
+        else:
+            manager.report_failure(proxy_info, error_type=error, latency=latency, domain=domain)
     except Exception as e:
-        logger.warning(f"Error getting proxy: {e}")
-        return None
+        logger.debug(f"Error reporting proxy outcome: {e}")
 
 
 def get_uc_driver(
@@ -158,6 +230,7 @@ def get_uc_driver(
     use_proxy: bool = True,
     locale: str = "en",
     use_virtual_display: bool = True,
+    proxy: Optional[str] = None,
     **kwargs  # Accept extra args for compatibility with get_driver_for_site
 ) -> Optional[Driver]:
     """
@@ -168,6 +241,7 @@ def get_uc_driver(
         use_proxy: Whether to use proxy from ProxyManager
         locale: Browser locale
         use_virtual_display: Use Xvfb virtual display for headed mode (no visible window)
+        proxy: Proxy to use (user:pass@host:port); picked from ProxyManager if None
         **kwargs: Additional arguments (ignored, for compatibility)
 
     Returns:
@@ -178,7 +252,10 @@ def get_uc_driver(
         if not headless and use_virtual_display and USE_VIRTUAL_DISPLAY:
             _ensure_virtual_display()
 
-        proxy = _get_proxy_string() if use_proxy else None
+        if not use_proxy:
+            proxy = None
+        elif proxy is None:
+            proxy = _get_proxy_string()
 
         if proxy:
             driver = Driver(
@@ -307,7 +384,8 @@ def get_google_serp_driver(
     headless: bool = DEFAULT_HEADLESS,
     use_proxy: bool = True,
     retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
-    wait_time: int = DEFAULT_WAIT_TIME
+    wait_time: int = DEFAULT_WAIT_TIME,
+    proxy: Optional[str] = None
 ) -> Optional[Driver]:
     """
     Get a driver configured for Google SERP scraping.
@@ -323,14 +401,17 @@ def get_google_serp_driver(
         use_proxy: Whether to use proxy
         retry_attempts: Number of retry attempts
         wait_time: Selenium wait time
+        proxy: Proxy to use (user:pass@host:port); picked from ProxyManager if None
 
     Returns:
         Configured Driver or None on failure
     """
     for attempt in range(retry_attempts):
         driver = None
+        error = None
+        proxy_info = (_pick_proxy(GOOGLE_DOMAIN) if proxy is None else _lookup_proxy(proxy)) if use_proxy else None
         try:
-            driver = get_uc_driver(headless=headless, use_proxy=use_proxy)
+            driver = get_uc_driver(headless=headless, use_proxy=use_proxy, proxy=proxy or _proxy_string(proxy_info))
             if driver is None:
                 continue
 
@@ -338,10 +419,11 @@ def get_google_serp_driver(
             wait = WebDriverWait(driver, wait_time)
 
             # Navigate to Google and check page
-            driver.get("https://www.google.com/search?q=whats+happening+today")
+            latency = _timed_get(driver, "https://www.google.com/search?q=whats+happening+today")
             time.sleep(random.uniform(1, 2))
 
             success, error = _check_google_page_ready(driver, wait)
+            _report_proxy(proxy_info, GOOGLE_DOMAIN, error, latency)
 
             if success:
                 # Double-check with another query
@@ -358,6 +440,8 @@ def get_google_serp_driver(
 
         except Exception as e:
             logger.warning(f"Google driver setup error: {e} (attempt {attempt + 1})")
+            if error is None:
+                _report_proxy(proxy_info, GOOGLE_DOMAIN, type(e).__name__)
             if driver:
                 try:
                     driver.quit()
@@ -433,7 +517,8 @@ def get_yelp_driver(
     headless: bool = DEFAULT_HEADLESS,
     use_proxy: bool = True,
     retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
-    wait_time: int = DEFAULT_WAIT_TIME
+    wait_time: int = DEFAULT_WAIT_TIME,
+    proxy: Optional[str] = None
 ) -> Optional[Driver]:
     """
     Get a driver configured for Yelp scraping.
@@ -449,14 +534,17 @@ def get_yelp_driver(
         use_proxy: Whether to use proxy
         retry_attempts: Number of retry attempts
         wait_time: Selenium wait time
+        proxy: Proxy to use (user:pass@host:port); picked from ProxyManager if None
 
     Returns:
         Configured Driver or None on failure
     """
     for attempt in range(retry_attempts):
         driver = None
+        error = None
+        proxy_info = (_pick_proxy(YELP_DOMAIN) if proxy is None else _lookup_proxy(proxy)) if use_proxy else None
         try:
-            driver = get_uc_driver(headless=headless, use_proxy=use_proxy)
+            driver = get_uc_driver(headless=headless, use_proxy=use_proxy, proxy=proxy or _proxy_string(proxy_info))
             if driver is None:
                 continue
 
@@ -464,10 +552,11 @@ def get_yelp_driver(
             wait = WebDriverWait(driver, wait_time)
 
             # Navigate to Yelp
-            driver.get("https://www.yelp.com/")
+            latency = _timed_get(driver, "https://www.yelp.com/")
             time.sleep(random.uniform(2, 3))
 
             success, error = _check_yelp_page_ready(driver, wait)
+            _report_proxy(proxy_info, YELP_DOMAIN, error, latency)
 
             if success:
                 logger.info(f"Yelp driver ready (attempt {attempt + 1})")
@@ -478,6 +567,8 @@ def get_yelp_driver(
 
         except Exception as e:
             logger.warning(f"Yelp driver setup error: {e} (attempt {attempt + 1})")
+            if error is None:
+                _report_proxy(proxy_info, YELP_DOMAIN, type(e).__name__)
             if driver:
                 try:
                     driver.quit()
@@ -524,7 +615,8 @@ def get_bbb_driver(
     headless: bool = DEFAULT_HEADLESS,
     use_proxy: bool = True,
     retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
-    wait_time: int = DEFAULT_WAIT_TIME
+    wait_time: int = DEFAULT_WAIT_TIME,
+    proxy: Optional[str] = None
 ) -> Optional[Driver]:
     """
     Get a driver configured for BBB (Better Business Bureau) scraping.
@@ -539,14 +631,17 @@ def get_bbb_driver(
         use_proxy: Whether to use proxy
         retry_attempts: Number of retry attempts
         wait_time: Selenium wait time
+        proxy: Proxy to use (user:pass@host:port); picked from ProxyManager if None
 
     Returns:
         Configured Driver or None on failure
     """
     for attempt in range(retry_attempts):
         driver = None
+        error = None
+        proxy_info = (_pick_proxy(BBB_DOMAIN) if proxy is None else _lookup_proxy(proxy)) if use_proxy else None
         try:
-            driver = get_uc_driver(headless=headless, use_proxy=use_proxy)
+            driver = get_uc_driver(headless=headless, use_proxy=use_proxy, proxy=proxy or _proxy_string(proxy_info))
             if driver is None:
                 continue
 
@@ -554,10 +649,11 @@ def get_bbb_driver(
             wait = WebDriverWait(driver, wait_time)
 
             # Navigate to BBB
-            driver.get("https://www.bbb.org/")
+            latency = _timed_get(driver, "https://www.bbb.org/")
             time.sleep(random.uniform(1, 2))
 
             success, error = _check_bbb_page_ready(driver, wait)
+            _report_proxy(proxy_info, BBB_DOMAIN, error, latency)
 
             if success:
                 logger.info(f"BBB driver ready (attempt {attempt + 1})")
@@ -568,6 +664,8 @@ def get_bbb_driver(
 
         except Exception as e:
             logger.warning(f"BBB driver setup error: {e} (attempt {attempt + 1})")
+            if error is None:
+                _report_proxy(proxy_info, BBB_DOMAIN, type(e).__name__)
             if driver:
                 try:
                     driver.quit()
@@ -617,7 +715,8 @@ def get_yellowpages_driver(
     headless: bool = DEFAULT_HEADLESS,
     use_proxy: bool = True,
     retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
-    wait_time: int = DEFAULT_WAIT_TIME
+    wait_time: int = DEFAULT_WAIT_TIME,
+    proxy: Optional[str] = None
 ) -> Optional[Driver]:
     """
     Get a driver configured for YellowPages scraping.
@@ -627,14 +726,17 @@ def get_yellowpages_driver(
         use_proxy: Whether to use proxy
         retry_attempts: Number of retry attempts
         wait_time: Selenium wait time
+        proxy: Proxy to use (user:pass@host:port); picked from ProxyManager if None
 
     Returns:
         Configured Driver or None on failure
     """
     for attempt in range(retry_attempts):
         driver = None
+        error = None
+        proxy_info = (_pick_proxy(YELLOWPAGES_DOMAIN) if proxy is None else _lookup_proxy(proxy)) if use_proxy else None
         try:
-            driver = get_uc_driver(headless=headless, use_proxy=use_proxy)
+            driver = get_uc_driver(headless=headless, use_proxy=use_proxy, proxy=proxy or _proxy_string(proxy_info))
             if driver is None:
                 continue
 
@@ -642,10 +744,11 @@ def get_yellowpages_driver(
             wait = WebDriverWait(driver, wait_time)
 
             # Navigate to YellowPages
-            driver.get("https://www.yellowpages.com/")
+            latency = _timed_get(driver, "https://www.yellowpages.com/")
             time.sleep(random.uniform(2, 3))
 
             success, error = _check_yellowpages_page_ready(driver, wait)
+            _report_proxy(proxy_info, YELLOWPAGES_DOMAIN, error, latency)
 
             if success:
                 logger.info(f"YellowPages driver ready (attempt {attempt + 1})")
@@ -656,6 +759,8 @@ def get_yellowpages_driver(
 
         except Exception as e:
             logger.warning(f"YellowPages driver setup error: {e} (attempt {attempt + 1})")
+            if error is None:
+                _report_proxy(proxy_info, YELLOWPAGES_DOMAIN, type(e).__name__)
             if driver:
                 try:
                     driver.quit()
@@ -726,7 +831,8 @@ def get_gbp_driver(
     headless: bool = DEFAULT_HEADLESS,
     use_proxy: bool = True,
     retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
-    wait_time: int = DEFAULT_WAIT_TIME
+    wait_time: int = DEFAULT_WAIT_TIME,
+    proxy: Optional[str] = None
 ) -> Optional[Driver]:
     """
     Get a driver configured for Google Business Profile (Maps) scraping.
@@ -741,14 +847,17 @@ def get_gbp_driver(
         use_proxy: Whether to use proxy
         retry_attempts: Number of retry attempts
         wait_time: Selenium wait time
+        proxy: Proxy to use (user:pass@host:port); picked from ProxyManager if None
 
     Returns:
         Configured Driver or None on failure
     """
     for attempt in range(retry_attempts):
         driver = None
+        error = None
+        proxy_info = (_pick_proxy(GOOGLE_DOMAIN) if proxy is None else _lookup_proxy(proxy)) if use_proxy else None
         try:
-            driver = get_uc_driver(headless=headless, use_proxy=use_proxy)
+            driver = get_uc_driver(headless=headless, use_proxy=use_proxy, proxy=proxy or _proxy_string(proxy_info))
             if driver is None:
                 continue
 
@@ -763,10 +872,11 @@ def get_gbp_driver(
             _check_google_page_ready(driver, wait)
 
             # Now go to Maps
-            driver.get("https://www.google.com/maps")
+            latency = _timed_get(driver, "https://www.google.com/maps")
             time.sleep(random.uniform(1, 2))
 
             success, error = _check_gbp_page_ready(driver, wait)
+            _report_proxy(proxy_info, GOOGLE_DOMAIN, error, latency)
 
             if success:
                 logger.info(f"GBP/Maps driver ready (attempt {attempt + 1})")
@@ -777,6 +887,8 @@ def get_gbp_driver(
 
         except Exception as e:
             logger.warning(f"GBP driver setup error: {e} (attempt {attempt + 1})")
+            if error is None:
+                _report_proxy(proxy_info, GOOGLE_DOMAIN, type(e).__name__)
             if driver:
                 try:
                     driver.quit()
@@ -801,6 +913,19 @@ DRIVER_FACTORY = {
 }
 
 
+# Target domain of each driver type (for proxy scoring)
+SITE_DOMAINS = {
+    "google": GOOGLE_DOMAIN,
+    "google_serp": GOOGLE_DOMAIN,
+    "yelp": YELP_DOMAIN,
+    "bbb": BBB_DOMAIN,
+    "yellowpages": YELLOWPAGES_DOMAIN,
+    "yp": YELLOWPAGES_DOMAIN,
+    "gbp": GOOGLE_DOMAIN,
+    "maps": GOOGLE_DOMAIN,
+}
+
+
 def get_driver_for_site(
     site: str,
     headless: bool = DEFAULT_HEADLESS,
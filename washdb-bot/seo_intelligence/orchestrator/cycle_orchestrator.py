@@ -19,6 +19,7 @@ from .health_monitor import HealthMonitor
 from .module_worker import BaseModuleWorker, WorkerStats
 
 from runner.logging_setup import get_logger
+from runner.profiler import install_profiler
 
 
 logger = get_logger("SEOCycleOrchestrator")
@@ -134,6 +135,9 @@ class SEOCycleOrchestrator:
         # Start health monitoring
         self.health_monitor.start_monitoring()
 
+        # Sampling profiler (signal only when started from the main thread)
+        install_profiler("seo_orchestrator")
+
         # Start main loop in background thread
         self._main_thread = threading.Thread(
             target=self._main_loop,
@@ -14,6 +14,7 @@ from typing import Optional, List, Dict, Any, Callable
 from pathlib import Path
 
 from runner.logging_setup import get_logger
+from runner.profiler import trace_target
 
 
 @dataclass
@@ -196,7 +197,8 @@ class BaseModuleWorker(ABC):
                             self._heartbeat_callback()
 
                         # Process company
-                        result = self.process_company(company_id)
+                        with trace_target(f"{self.name}:company:{company_id}"):
+                            result = self.process_company(company_id)
                         result.duration_seconds = time.time() - start_time
 
                         # Update stats
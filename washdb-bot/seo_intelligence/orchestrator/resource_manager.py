@@ -11,10 +11,9 @@ import threading
 from contextlib import contextmanager
 from typing import Optional, Tuple, Dict, Any
 
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
 
+from db.engine_registry import get_engine, get_engine_registry
 from runner.logging_setup import get_logger
 
 
@@ -67,17 +66,9 @@ class ResourceManager:
         return database_url
 
     def _init_connection_pool(self):
-        """Initialize SQLAlchemy connection pool."""
+        """Get the shared engine (and its pool) from the engine registry."""
         try:
-            self._engine = create_engine(
-                self._db_url,
-                poolclass=QueuePool,
-                pool_size=5,
-                max_overflow=10,
-                pool_timeout=30,
-                pool_recycle=1800,  # Recycle connections after 30 min
-                pool_pre_ping=True   # Verify connections before use
-            )
+            self._engine = get_engine(self._db_url)
             self._Session = sessionmaker(bind=self._engine)
             logger.info("Connection pool initialized")
 
@@ -205,10 +196,9 @@ class ResourceManager:
         gc.collect()
         gc.collect()
 
-        # Recycle connection pool
+        # Recycle connection pool (the shared engine stays usable)
         if self._engine:
             self._engine.dispose()
-            self._init_connection_pool()
 
         logger.info("Between-cycle cleanup complete")
 
@@ -226,10 +216,9 @@ class ResourceManager:
         for _ in range(3):
             gc.collect()
 
-        # Dispose and recreate connection pool
+        # Drop idle pooled connections
         if self._engine:
             self._engine.dispose()
-            self._init_connection_pool()
 
     def get_pool_status(self) -> Dict[str, Any]:
         """
@@ -248,7 +237,8 @@ class ResourceManager:
             "checked_in": pool.checkedin(),
             "checked_out": pool.checkedout(),
             "overflow": pool.overflow(),
-            "active_sessions": list(self._active_sessions.keys())
+            "active_sessions": list(self._active_sessions.keys()),
+            "registry": get_engine_registry().get_stats(),
         }
 
     def shutdown(self):
@@ -263,11 +253,9 @@ class ResourceManager:
                 pass
         self._active_sessions.clear()
 
-        # Dispose connection pool
-        if self._engine:
-            self._engine.dispose()
-            self._engine = None
-            self._Session = None
+        # Release the shared engine (other services may still use it)
+        self._engine = None
+        self._Session = None
 
         logger.info("Resource manager shutdown complete")
 
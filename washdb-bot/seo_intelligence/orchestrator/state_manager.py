@@ -13,9 +13,10 @@ from typing import Optional, Dict, List, Any
 from dataclasses import dataclass, asdict
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 
@@ -97,7 +98,7 @@ class CycleStateManager:
     def _init_database(self):
         """Initialize database connection and create tables if needed."""
         try:
-            self._engine = create_engine(self.db_url, pool_pre_ping=True)
+            self._engine = get_engine(self.db_url)
             self._Session = sessionmaker(bind=self._engine)
 
             # Create tables if not exist
@@ -0,0 +1,237 @@
+"""
+Concurrent audit engine for the technical auditor and CWV collector.
+
+Audits used to run one URL at a time, each launching its own browser.
+run_by_domain() spreads URLs over a bounded pool of worker threads:
+
+- Each worker owns one Playwright browser for the whole run (launched once)
+  and opens a fresh context per URL, so at most max_workers contexts are
+  alive at any time.
+- URLs are grouped by domain; a domain has at most one URL in flight, so
+  a client site never sees more than one concurrent audit request.
+- HTTP-only checks go through one shared, pooled requests session
+  (get_http_session) instead of a new connection per request.
+
+Usage:
+    from seo_intelligence.scrapers.audit_engine import close_browser, launch_browser, run_by_domain
+
+    results = run_by_domain(
+        urls,
+        process=lambda handle, url: audit(handle, url),
+        max_workers=4,
+        worker_setup=launch_browser,
+        worker_teardown=close_browser,
+    )
+"""
+
+import os
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, List, Optional, Sequence
+from urllib.parse import urlparse
+
+import requests
+from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+
+from runner.logging_setup import get_logger
+
+logger = get_logger("audit_engine")
+
+# Worker threads (= browsers / concurrent contexts) per audit run
+AUDIT_WORKERS = int(os.getenv("AUDIT_WORKERS", "4"))
+
+BROWSER_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+]
+
+HTTP_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+def domain_of(url: str) -> str:
+    """Host part of a URL, used to group audits by site."""
+    return urlparse(url).netloc.lower()
+
+
+class DomainScheduler:
+    """
+    Hands out items so that each domain has at most one in flight.
+
+    Domains take turns (round robin), so one large site does not hold up
+    the rest of the batch.
+    """
+
+    def __init__(self, items: Sequence[Any], key_fn: Callable[[Any], str]):
+        """
+        Args:
+            items: Items to schedule
+            key_fn: Maps an item to its domain
+        """
+        self._key_fn = key_fn
+        self._pending: "OrderedDict[str, Deque[Any]]" = OrderedDict()
+        for item in items:
+            self._pending.setdefault(key_fn(item), deque()).append(item)
+        self._active: set = set()
+        self._cond = threading.Condition()
+
+    def next(self) -> Optional[Any]:
+        """
+        Get the next item whose domain is idle (blocks until one is).
+
+        Returns:
+            Item, or None when every item has been handed out
+        """
+        with self._cond:
+            while True:
+                if not self._pending:
+                    return None
+                for domain in self._pending:
+                    if domain not in self._active:
+                        queue = self._pending[domain]
+                        item = queue.popleft()
+                        if queue:
+                            # Domain goes to the back of the line
+                            self._pending.move_to_end(domain)
+                        else:
+                            del self._pending[domain]
+                        self._active.add(domain)
+                        return item
+                self._cond.wait()
+
+    def done(self, item: Any):
+        """Mark an item finished, freeing its domain."""
+        with self._cond:
+            self._active.discard(self._key_fn(item))
+            self._cond.notify_all()
+
+
+def run_by_domain(
+    urls: Sequence[str],
+    process: Callable[[Any, str], Any],
+    max_workers: int = AUDIT_WORKERS,
+    worker_setup: Optional[Callable[[], Any]] = None,
+    worker_teardown: Optional[Callable[[Any], None]] = None,
+) -> List[Any]:
+    """
+    Process URLs on a bounded pool of workers, one URL per domain at a time.
+
+    Args:
+        urls: URLs to process
+        process: process(worker_state, url) -> result; runs on a worker thread
+        max_workers: Worker threads
+        worker_setup: Creates per-worker state (e.g. a browser) on the worker
+            thread; its return value is passed to process
+        worker_teardown: Releases the worker state
+
+    Returns:
+        Results in the order of urls (None where process raised)
+    """
+    results: List[Any] = [None] * len(urls)
+    scheduler = DomainScheduler(list(enumerate(urls)), key_fn=lambda item: domain_of(item[1]))
+
+    def worker():
+        state = worker_setup() if worker_setup else None
+        try:
+            while True:
+                item = scheduler.next()
+                if item is None:
+                    return
+                index, url = item
+                try:
+                    results[index] = process(state, url)
+                except Exception as e:
+                    logger.error(f"Processing {url} failed: {e}")
+                finally:
+                    scheduler.done(item)
+        finally:
+            if worker_teardown:
+                worker_teardown(state)
+
+    workers = max(1, min(max_workers, len({domain_of(url) for url in urls})))
+    threads = [
+        threading.Thread(target=worker, name=f"audit-worker-{n}", daemon=True)
+        for n in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+@dataclass
+class BrowserHandle:
+    """A Playwright browser owned by one worker thread."""
+    playwright: Any
+    browser: Any
+
+    def close(self):
+        """Close the browser and stop Playwright."""
+        for closer in (self.browser.close, self.playwright.stop):
+            try:
+                closer()
+            except Exception as e:
+                logger.debug(f"Browser shutdown error: {e}")
+
+
+def launch_browser(headless: bool = True, extra_args: Sequence[str] = ()) -> Optional[BrowserHandle]:
+    """
+    Launch a Chromium browser for the calling thread.
+
+    Args:
+        headless: Run in headless mode
+        extra_args: Chromium flags added to BROWSER_ARGS
+
+    Returns:
+        BrowserHandle, or None if Playwright cannot start here (e.g. inside
+        a running asyncio loop) - callers fall back to HTTP-only audits
+    """
+    playwright = None
+    try:
+        playwright = sync_playwright().start()
+        browser = playwright.chromium.launch(headless=headless, args=BROWSER_ARGS + list(extra_args))
+        return BrowserHandle(playwright=playwright, browser=browser)
+    except Exception as e:
+        logger.warning(f"Browser unavailable, using HTTP-only audits: {e}")
+        if playwright is not None:
+            try:
+                playwright.stop()
+            except Exception:
+                pass
+        return None
+
+
+def close_browser(handle: Optional[BrowserHandle]):
+    """Teardown for launch_browser()."""
+    if handle is not None:
+        handle.close()
+
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the shared HTTP session for HTTP-only audit checks.
+
+    Returns:
+        requests.Session with a connection pool sized for the audit workers
+    """
+    global _http_session
+
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=max(AUDIT_WORKERS * 2, 10))
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = HTTP_USER_AGENT
+                _http_session = session
+
+    return _http_session
@@ -452,7 +452,8 @@ class AutocompleteScraper(BaseScraper):
         if not suggestions:
             return
 
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
+        from db.engine_registry import get_engine
         from dotenv import load_dotenv
         import os
 
@@ -463,7 +464,7 @@ class AutocompleteScraper(BaseScraper):
             self.logger.warning("DATABASE_URL not set, skipping save")
             return
 
-        engine = create_engine(db_url)
+        engine = get_engine(db_url)
 
         insert_sql = text("""
             INSERT INTO keyword_suggestions (
@@ -449,7 +449,8 @@ class AutocompleteScraperSelenium(BaseSeleniumScraper):
         if not suggestions:
             return
 
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
+        from db.engine_registry import get_engine
         from dotenv import load_dotenv
         import os
 
@@ -460,7 +461,7 @@ class AutocompleteScraperSelenium(BaseSeleniumScraper):
             self.logger.warning("DATABASE_URL not set, skipping save")
             return
 
-        engine = create_engine(db_url)
+        engine = get_engine(db_url)
 
         insert_sql = text("""
             INSERT INTO keyword_suggestions (
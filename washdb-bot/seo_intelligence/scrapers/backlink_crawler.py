@@ -27,11 +27,12 @@ from urllib.parse import urlparse, urljoin, quote
 from pathlib import Path
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from seo_intelligence.scrapers.base_scraper import BaseScraper
 from seo_intelligence.services import get_task_logger
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Import YP stealth features for anti-detection
@@ -85,7 +86,7 @@ class BacklinkCrawler(BaseScraper):
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database storage disabled")
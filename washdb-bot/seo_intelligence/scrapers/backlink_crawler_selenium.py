@@ -31,11 +31,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from seo_intelligence.scrapers.base_selenium_scraper import BaseSeleniumScraper
 from seo_intelligence.services import get_task_logger
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Import YP stealth features for timing delays
@@ -86,7 +87,7 @@ class BacklinkCrawlerSelenium(BaseSeleniumScraper):
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database storage disabled")
@@ -14,6 +14,7 @@ All scrapers (SERP, competitor, backlinks, citations) inherit from this class.
 """
 
 import os
+import re
 import time
 import random
 import math
@@ -36,6 +37,12 @@ from seo_intelligence.services import (
     get_browser_profile_manager,
 )
 from runner.logging_setup import get_logger
+from runner.metrics import stage_timer
+from runner.block_detector import SEO_DETECTOR
+
+# Structural sanity checks (stop at the first match instead of lowercasing the page)
+_TITLE_TAG_RE = re.compile(r'<title[ >]', re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r'<html|<!doctype html', re.IGNORECASE)
 
 
 class BaseScraper(ABC):
@@ -98,6 +105,9 @@ class BaseScraper(ABC):
         self._current_domain = None
         self._current_headed_mode = False
 
+        # Proxy of the current browser session (outcomes reported for scoring)
+        self._current_proxy = None
+
         # Browser state
         self._playwright = None
         self._browser: Optional[Browser] = None
@@ -144,7 +154,8 @@ class BaseScraper(ABC):
         final_delay = max(2.0, base_delay + jitter)  # Ensure minimum 2s
 
         self.logger.debug(f"Base delay: {base_delay:.2f}s + jitter {jitter:.2f}s = {final_delay:.2f}s")
-        time.sleep(final_delay)
+        with stage_timer("seo", "wait"):
+            time.sleep(final_delay)
 
     def _check_robots(self, url: str) -> bool:
         """
@@ -197,7 +208,9 @@ class BaseScraper(ABC):
 
         try:
             # Acquire rate limit token
-            if not self.rate_limiter.acquire(domain, wait=True, max_wait=60.0):
+            with stage_timer("seo", "wait"):
+                acquired = self.rate_limiter.acquire(domain, wait=True, max_wait=60.0)
+            if not acquired:
                 self.logger.warning(f"Rate limit timeout for {domain}")
                 self.stats["rate_limited"] += 1
                 raise RuntimeError(f"Failed to acquire rate limit token for {domain}")
@@ -1041,10 +1054,12 @@ class BaseScraper(ABC):
             # Start Playwright
             playwright = sync_playwright().start()
 
-            # Get proxy if enabled
+            # Get proxy if enabled (scored for the session's domain)
             proxy_config = None
             if self.use_proxy:
-                proxy_config = self.proxy_manager.get_proxy_for_playwright()
+                self._current_proxy = self.proxy_manager.get_proxy(domain=domain)
+                if self._current_proxy:
+                    proxy_config = self._current_proxy.to_playwright_format()
 
             # Get random user agent
             user_agent = self.ua_rotator.get_random()
@@ -1418,9 +1433,28 @@ class BaseScraper(ABC):
             # Reset current session tracking
             self._current_domain = None
             self._current_headed_mode = False
+            self._current_proxy = None
 
             self.logger.debug("Browser session closed")
 
+    def _report_proxy(self, domain: str, error_type: Optional[str] = None, latency: Optional[float] = None):
+        """
+        Report the session proxy's outcome for one request (no-op without a proxy).
+
+        Args:
+            domain: Target domain of the request
+            error_type: Failure type (403, 429, CAPTCHA_DETECTED, timeout, ...); None for success
+            latency: Navigation time in seconds, if measured
+        """
+        if self._current_proxy is None:
+            return
+        if error_type is None:
+            self.proxy_manager.report_success(self._current_proxy, latency=latency, domain=domain)
+        else:
+            self.proxy_manager.report_failure(
+                self._current_proxy, error_type=error_type, latency=latency, domain=domain
+            )
+
     def _validate_html_response(
         self,
         html: str,
@@ -1455,48 +1489,23 @@ class BaseScraper(ABC):
                 self.logger.warning(f"Non-HTML content type: {content_type} for {url}")
                 return False, "NON_HTML_MIME"
 
-        html_lower = html.lower()
-
-        # Check for CAPTCHA indicators
-        captcha_indicators = [
-            'captcha',
-            'recaptcha',
-            'g-recaptcha',
-            'hcaptcha',
-            'cf-challenge',  # Cloudflare challenge
-            'please verify you are human',
-            'security check',
-            'unusual traffic',
-        ]
-
-        for indicator in captcha_indicators:
-            if indicator in html_lower:
-                self.logger.warning(f"CAPTCHA detected on {url}: {indicator}")
-                return False, "CAPTCHA_DETECTED"
-
-        # Check for bot detection / anti-scraping
-        bot_detection_indicators = [
-            'access denied',
-            'blocked',
-            'forbidden',
-            'your access to this site has been limited',
-            'enable javascript',
-            'javascript is disabled',
-            'please enable cookies',
-        ]
+        # Check for CAPTCHA and bot detection / anti-scraping pages
+        signals = SEO_DETECTOR.scan(html)
+        if signals.captcha:
+            self.logger.warning(f"CAPTCHA detected on {url}: {signals.captcha.indicator}")
+            return False, signals.captcha.label
 
-        for indicator in bot_detection_indicators:
-            if indicator in html_lower:
-                self.logger.warning(f"Bot detection page on {url}: {indicator}")
-                return False, "BOT_DETECTED"
+        if signals.blocked:
+            self.logger.warning(f"Bot detection page on {url}: {signals.blocked.indicator}")
+            return False, signals.blocked.label
 
         # Check for essential HTML elements
-        if '<title>' not in html_lower and '<title ' not in html_lower:
+        if not _TITLE_TAG_RE.search(html):
             self.logger.warning(f"Missing <title> tag on {url}")
             return False, "NO_TITLE_TAG"
 
         # Check for minimal HTML structure
-        if '<html' not in html_lower and '<!doctype html' not in html_lower:
+        if not _HTML_TAG_RE.search(html):
             self.logger.warning(f"Invalid HTML structure on {url}")
             return False, "INVALID_HTML"
 
@@ -1561,15 +1570,20 @@ class BaseScraper(ABC):
                     f"Exponential backoff for {domain}: waiting {backoff_delay}s "
                     f"(retry attempt {retry_attempt})"
                 )
-                time.sleep(backoff_delay)
+                with stage_timer("seo", "wait"):
+                    time.sleep(backoff_delay)
 
             try:
                 self.logger.debug(f"Fetching {url} (attempt {attempt + 1}/{self.max_retries})")
 
-                response = page.goto(url, wait_until=wait_for)
+                with stage_timer("seo", "fetch"):
+                    start = time.perf_counter()
+                    response = page.goto(url, wait_until=wait_for)
+                    latency = time.perf_counter() - start
 
                 if response is None:
                     self.logger.warning(f"No response from {url}")
+                    self._report_proxy(domain, "no_response", latency)
                     continue
 
                 # Handle HTTP errors
@@ -1578,6 +1592,7 @@ class BaseScraper(ABC):
 
                     # 403 Forbidden - Quarantine domain and flag for headed mode
                     if response.status == 403:
+                        self._report_proxy(domain, "403", latency)
                         self.logger.error(f"403 Forbidden from {domain} - quarantining")
                         self.domain_quarantine.quarantine_domain(
                             domain=domain,
@@ -1592,6 +1607,7 @@ class BaseScraper(ABC):
 
                     # 429 Rate Limited - Record event (auto-quarantines after 3) (Task 11)
                     if response.status == 429:
+                        self._report_proxy(domain, "429", latency)
                         self.domain_quarantine.record_error_event(domain, "429")
 
                         # Check for Retry-After header
@@ -1614,7 +1630,8 @@ class BaseScraper(ABC):
                         )
 
                         self.logger.info(f"Rate limited, waiting {wait_time:.1f}s...")
-                        time.sleep(wait_time)
+                        with stage_timer("seo", "wait"):
+                            time.sleep(wait_time)
                         continue
 
                     # 5xx Server Errors - Record event (auto-quarantines after 3) (Task 11)
@@ -1628,19 +1645,22 @@ class BaseScraper(ABC):
                         )
                         continue
 
-                    # Other client errors - don't retry
+                    # Other client errors - don't retry (the proxy itself worked)
+                    self._report_proxy(domain, latency=latency)
                     self.stats["pages_failed"] += 1
                     return None
 
-                # Extra wait for JavaScript rendering
-                if extra_wait > 0:
-                    time.sleep(extra_wait)
+                with stage_timer("seo", "wait"):
+                    # Extra wait for JavaScript rendering
+                    if extra_wait > 0:
+                        time.sleep(extra_wait)
 
-                # Simulate human behavior after page load (looks more natural)
-                self._simulate_human_behavior(page, intensity="normal")
+                    # Simulate human behavior after page load (looks more natural)
+                    self._simulate_human_behavior(page, intensity="normal")
 
                 # Get page content
-                content = page.content()
+                with stage_timer("seo", "fetch"):
+                    content = page.content()
 
                 # Validate HTML response
                 content_type = response.headers.get('content-type')
@@ -1648,6 +1668,7 @@ class BaseScraper(ABC):
 
                 if not is_valid:
                     self.logger.warning(f"HTML validation failed for {url}: {reason_code}")
+                    self._report_proxy(domain, reason_code, latency)
 
                     # Quarantine domain on CAPTCHA or bot detection (Task 11)
                     if reason_code in ("CAPTCHA_DETECTED", "BOT_DETECTED"):
@@ -1669,6 +1690,7 @@ class BaseScraper(ABC):
 
                 # SUCCESS - Reset retry attempts (Task 11)
                 self.domain_quarantine.reset_retry_attempts(domain)
+                self._report_proxy(domain, latency=latency)
 
                 # Record success for hybrid mode statistics
                 self.browser_profile_manager.record_success(domain, self._current_headed_mode)
@@ -1684,12 +1706,14 @@ class BaseScraper(ABC):
 
             except PlaywrightTimeout as e:
                 self.logger.warning(f"Timeout fetching {url}: {e}")
+                self._report_proxy(domain, "timeout")
                 if attempt < self.max_retries - 1:
                     time.sleep(self._get_random_delay())
                 continue
 
             except Exception as e:
                 self.logger.error(f"Error fetching {url}: {e}")
+                self._report_proxy(domain, type(e).__name__)
                 if attempt < self.max_retries - 1:
                     time.sleep(self._get_random_delay())
                 continue
@@ -48,6 +48,7 @@ from seo_intelligence.drivers import (
     get_uc_driver,
     click_element_human_like,
 )
+from seo_intelligence.drivers.driver_pool import get_driver_pool, is_driver_pool_enabled
 from runner.logging_setup import get_logger
 
 
@@ -276,7 +277,8 @@ class BaseSeleniumScraper(ABC):
         """
         Context manager for SeleniumBase browser session.
 
-        Gets appropriate driver for the target site with:
+        Gets appropriate driver for the target site (a warm one from the
+        UC driver pool unless UC_DRIVER_POOL=false) with:
         - Undetected Chrome mode (uc=True)
         - Proxy rotation from existing ProxyManager
         - CAPTCHA/block detection with retry
@@ -293,6 +295,11 @@ class BaseSeleniumScraper(ABC):
         Yields:
             Configured SeleniumBase Driver
         """
+        if is_driver_pool_enabled():
+            with self._pooled_session(site) as driver:
+                yield driver
+            return
+
         driver = None
 
         try:
@@ -332,6 +339,56 @@ class BaseSeleniumScraper(ABC):
             self._driver = None
             self._current_domain = None
 
+    @contextmanager
+    def _pooled_session(self, site: str):
+        """
+        Browser session on a warm driver borrowed from the UC driver pool.
+
+        The driver goes back to the pool (cookies and storage cleared)
+        afterwards; it is discarded instead after a WebDriverException.
+
+        Args:
+            site: Target site name
+
+        Yields:
+            Configured SeleniumBase Driver
+        """
+        pool = get_driver_pool()
+        pooled = None
+        discard = False
+
+        try:
+            self.logger.info(f"Starting Selenium session for {site} (pooled)")
+            pooled = pool.acquire(
+                site,
+                headless=self.headless,
+                use_proxy=self.use_proxy,
+                retry_attempts=self.max_retries,
+                wait_time=self.page_timeout,
+            )
+
+            self._driver = pooled.driver
+            self._current_domain = site
+
+            yield pooled.driver
+
+        except WebDriverException as e:
+            discard = True
+            self.logger.error(f"Browser session error: {e}")
+            raise
+
+        except Exception as e:
+            self.logger.error(f"Browser session error: {e}")
+            raise
+
+        finally:
+            if pooled:
+                pool.release(pooled, discard=discard)
+                self.logger.debug("Driver returned to pool")
+
+            self._driver = None
+            self._current_domain = None
+
     def _validate_page_response(
         self,
         driver,
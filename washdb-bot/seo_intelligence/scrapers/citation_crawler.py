@@ -26,12 +26,13 @@ from urllib.parse import urlparse, quote_plus
 from dataclasses import dataclass, field, asdict
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text, select
+from sqlalchemy import text, select
 from sqlalchemy.orm import Session
 
 from seo_intelligence.scrapers.base_scraper import BaseScraper
 from seo_intelligence.services import get_task_logger, get_change_manager, get_domain_quarantine
 from seo_intelligence.services.browser_profile_manager import get_browser_profile_manager
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 from db.models import Company, BusinessSource
 from scrape_yp.yp_stealth import (
@@ -94,6 +95,9 @@ PRIORITY_TIERS = {
     "tier_4": ["google_business", "facebook", "angies_list", "thumbtack", "homeadvisor"],  # Hardest/login required
 }
 
+# Queued NAP proposals are written once this many accumulate (and at the end of a run)
+CHANGE_BATCH_SIZE = 100
+
 # Directories to skip (require login or too aggressive)
 SKIP_DIRECTORIES = {"facebook"}  # Requires login for search
 
@@ -202,7 +206,7 @@ class CitationCrawler(BaseScraper):
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database storage disabled")
@@ -222,6 +226,9 @@ class CitationCrawler(BaseScraper):
         # Per-directory CAPTCHA tracking for progressive backoff
         self.directory_captcha_counts = {}
 
+        # NAP mismatch proposals, written in batches
+        self._pending_changes: List[Dict[str, Any]] = []
+
         # Directory success/failure tracking
         self.directory_stats = {
             d: {"success": 0, "fail": 0, "skip": 0}
@@ -621,6 +628,75 @@ class CitationCrawler(BaseScraper):
                 session.add(business_source)
                 logger.debug(f"Created BusinessSource for company_id={company_id}, source={source_type}, quality={quality_score}")
 
+    def _queue_nap_change(self, business: BusinessInfo, result: CitationResult, citation_id: int):
+        """
+        Queue a governance proposal for a NAP mismatch.
+
+        Proposals are written in batches by flush_proposed_changes().
+
+        Args:
+            business: Business information
+            result: Citation check result
+            citation_id: Saved citation ID
+        """
+        if not (result.nap_score < 0.5 and result.is_listed):
+            return
+
+        self._pending_changes.append({
+            'change_type': 'citation_update',
+            'entity_type': 'directory',
+            'entity_id': f"{result.directory}:{business.name}",
+            'proposed_value': {
+                'listing_url': result.listing_url,
+                'directory': result.directory,
+            },
+            'current_value': {
+                'nap_score': result.nap_score,
+                'name_match': result.name_match,
+                'address_match': result.address_match,
+                'phone_match': result.phone_match,
+            },
+            'reason': f"NAP inconsistency detected on {result.directory} (score: {result.nap_score:.2f})",
+            'priority': 'medium',
+            'source': 'citation_crawler',
+            'metadata': {
+                'citation_id': citation_id,
+                'business_name': business.name,
+                'directory_name': result.directory,
+                'listing_url': result.listing_url,
+                'nap_score': result.nap_score,
+                'mismatches': {
+                    'name': not result.name_match,
+                    'address': not result.address_match,
+                    'phone': not result.phone_match,
+                }
+            },
+        })
+        logger.info(f"Queued NAP fix for {business.name} on {result.directory} (score: {result.nap_score:.2f})")
+
+        if len(self._pending_changes) >= CHANGE_BATCH_SIZE:
+            self.flush_proposed_changes()
+
+    def flush_proposed_changes(self) -> int:
+        """
+        Propose all queued NAP changes in one batch.
+
+        Returns:
+            int: Number of changes proposed
+        """
+        if not self._pending_changes:
+            return 0
+
+        changes, self._pending_changes = self._pending_changes, []
+        try:
+            change_ids = get_change_manager().propose_changes(changes)
+        except Exception as e:
+            logger.error(f"Error proposing {len(changes)} citation changes: {e}")
+            return 0
+
+        logger.info(f"Proposed {len(change_ids)} NAP fixes")
+        return len(change_ids)
+
     def _save_citation(
         self,
         session: Session,
@@ -710,43 +786,8 @@ class CitationCrawler(BaseScraper):
                 except Exception as bs_error:
                     logger.warning(f"Failed to create BusinessSource for {business.name}: {bs_error}")
 
-            # Propose change for NAP mismatches (governance integration)
-            if result.nap_score < 0.5 and result.is_listed:
-                try:
-                    change_manager = get_change_manager()
-                    change_manager.propose_change(
-                        change_type='citation_update',
-                        entity_type='directory',
-                        entity_id=f"{result.directory}:{business.name}",
-                        proposed_value={
-                            'listing_url': result.listing_url,
-                            'directory': result.directory,
-                        },
-                        current_value={
-                            'nap_score': result.nap_score,
-                            'name_match': result.name_match,
-                            'address_match': result.address_match,
-                            'phone_match': result.phone_match,
-                        },
-                        reason=f"NAP inconsistency detected on {result.directory} (score: {result.nap_score:.2f})",
-                        priority='medium',
-                        source='citation_crawler',
-                        metadata={
-                            'citation_id': row[0],
-                            'business_name': business.name,
-                            'directory_name': result.directory,
-                            'listing_url': result.listing_url,
-                            'nap_score': result.nap_score,
-                            'mismatches': {
-                                'name': not result.name_match,
-                                'address': not result.address_match,
-                                'phone': not result.phone_match,
-                            }
-                        }
-                    )
-                    logger.info(f"Proposed NAP fix for {business.name} on {result.directory} (score: {result.nap_score:.2f})")
-                except Exception as e:
-                    logger.error(f"Error proposing citation change for {business.name}: {e}")
+            # Queue change for NAP mismatches (governance integration)
+            self._queue_nap_change(business, result, row[0])
 
             session.commit()
             return row[0]
@@ -805,43 +846,8 @@ class CitationCrawler(BaseScraper):
         # Get the new citation_id before commit (for change proposal)
         citation_id = new_result.fetchone()[0]
 
-        # Propose change for NAP mismatches (governance integration)
-        if result.nap_score < 0.5 and result.is_listed:
-            try:
-                change_manager = get_change_manager()
-                change_manager.propose_change(
-                    change_type='citation_update',
-                    entity_type='directory',
-                    entity_id=f"{result.directory}:{business.name}",
-                    proposed_value={
-                        'listing_url': result.listing_url,
-                        'directory': result.directory,
-                    },
-                    current_value={
-                        'nap_score': result.nap_score,
-                        'name_match': result.name_match,
-                        'address_match': result.address_match,
-                        'phone_match': result.phone_match,
-                    },
-                    reason=f"NAP inconsistency detected on {result.directory} (score: {result.nap_score:.2f})",
-                    priority='medium',
-                    source='citation_crawler',
-                    metadata={
-                        'citation_id': citation_id,
-                        'business_name': business.name,
-                        'directory_name': result.directory,
-                        'listing_url': result.listing_url,
-                        'nap_score': result.nap_score,
-                        'mismatches': {
-                            'name': not result.name_match,
-                            'address': not result.address_match,
-                            'phone': not result.phone_match,
-                        }
-                    }
-                )
-                logger.info(f"Proposed NAP fix for {business.name} on {result.directory} (score: {result.nap_score:.2f})")
-            except Exception as e:
-                logger.error(f"Error proposing citation change for {business.name}: {e}")
+        # Queue change for NAP mismatches (governance integration)
+        self._queue_nap_change(business, result, citation_id)
 
         session.commit()
 
@@ -1083,10 +1089,13 @@ class CitationCrawler(BaseScraper):
         directories = directories or list(CITATION_DIRECTORIES.keys())
         results = {}
 
-        for directory in directories:
-            result = self.check_directory(business, directory)
-            if result:
-                results[directory] = result
+        try:
+            for directory in directories:
+                result = self.check_directory(business, directory)
+                if result:
+                    results[directory] = result
+        finally:
+            self.flush_proposed_changes()
 
         return results
 
@@ -1120,23 +1129,26 @@ class CitationCrawler(BaseScraper):
         nap_scores = []
 
         with task_logger.log_task("citation_crawler", "scraper", {"business_count": len(businesses)}) as task:
-            for business in businesses:
-                for directory in directories:
-                    task.increment_processed()
+            try:
+                for business in businesses:
+                    for directory in directories:
+                        task.increment_processed()
 
-                    # YP-style delays are now handled in check_directory()
-                    # via SessionBreakManager and human_delay()
-                    result = self.check_directory(business, directory)
+                        # YP-style delays are now handled in check_directory()
+                        # via SessionBreakManager and human_delay()
+                        result = self.check_directory(business, directory)
 
-                    if result:
-                        if result.is_listed:
-                            results["citations_found"] += 1
-                            task.increment_created()
+                        if result:
+                            if result.is_listed:
+                                results["citations_found"] += 1
+                                task.increment_created()
 
-                            if result.nap_score >= 0.7:
-                                results["nap_accurate"] += 1
+                                if result.nap_score >= 0.7:
+                                    results["nap_accurate"] += 1
 
-                            nap_scores.append(result.nap_score)
+                                nap_scores.append(result.nap_score)
+            finally:
+                self.flush_proposed_changes()
 
         if nap_scores:
             results["average_nap_score"] = sum(nap_scores) / len(nap_scores)
@@ -1209,6 +1221,7 @@ def main():
 
     if args.directory:
         result = crawler.check_directory(business, args.directory)
+        crawler.flush_proposed_changes()
         if result:
             logger.info(f"Listed: {result.is_listed}")
             logger.info(f"NAP Score: {result.nap_score:.2f}")
@@ -33,11 +33,12 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text, select
+from sqlalchemy import text, select
 from sqlalchemy.orm import Session
 
 from seo_intelligence.scrapers.base_selenium_scraper import BaseSeleniumScraper
 from seo_intelligence.services import get_task_logger, get_change_manager, get_domain_quarantine
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 from db.models import Company, BusinessSource
 
@@ -184,7 +185,7 @@ class CitationCrawlerSelenium(BaseSeleniumScraper):
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database storage disabled")
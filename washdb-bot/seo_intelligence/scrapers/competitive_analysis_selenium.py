@@ -40,6 +40,7 @@ from seo_intelligence.services import (
     get_keyword_gap_analyzer,
     TopicCluster,
     ContentGap,
+    ContentPage,
     GapType,
     BacklinkOpportunity,
     KeywordGap,
@@ -342,22 +343,25 @@ class CompetitiveAnalysisSelenium(BaseSeleniumScraper):
         )
 
         # 5. Analyze content gaps
+        # Competitor topics come from the topic index kept by the competitor
+        # crawler; your side is built from your keyword rankings
         self.logger.info("Analyzing content gaps...")
-        # Build content data from keyword rankings
+        your_topics = list(your_keywords.keys())
         your_content = [
-            {"url": your_domain, "topics": list(your_keywords.keys())}
+            ContentPage(
+                url=your_domain,
+                title=your_domain,
+                content=" ".join(your_topics),
+                word_count=len(your_topics),
+                keywords=your_topics,
+                topics=your_topics,
+            )
         ]
-        competitor_content = []
-        for domain, keywords in all_competitor_keywords.items():
-            competitor_content.append({
-                "url": domain,
-                "topics": list(keywords.keys()),
-            })
 
-        content_gaps = self.content_gap_analyzer.analyze_content_gaps(
+        content_gaps = self.content_gap_analyzer.analyze_gaps_from_index(
             your_content=your_content,
-            competitor_content=competitor_content,
-            min_coverage=1,
+            competitors=competitor_domains,
+            min_competitor_coverage=1,
         )
         self.ca_stats["content_gaps_found"] = len(content_gaps)
 
@@ -27,7 +27,7 @@ from datetime import datetime
 from urllib.parse import urlparse, urljoin
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from seo_intelligence.scrapers.base_selenium_scraper import BaseSeleniumScraper
@@ -40,6 +40,8 @@ from seo_intelligence.services import (
     extract_main_content
 )
 from seo_intelligence.services.section_embedder import get_section_embedder
+from seo_intelligence.services.topic_index import get_topic_index
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Load environment
@@ -85,6 +87,7 @@ class CompetitorCrawlerSelenium(BaseSeleniumScraper):
         self.max_pages_per_site = max_pages_per_site
         self.parser = get_competitor_parser()
         self.hasher = get_content_hasher()
+        self.topic_index = get_topic_index()
         self.enable_embeddings = enable_embeddings
 
         # Initialize embedding services if enabled
@@ -101,7 +104,7 @@ class CompetitorCrawlerSelenium(BaseSeleniumScraper):
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database storage disabled")
@@ -247,6 +250,15 @@ class CompetitorCrawlerSelenium(BaseSeleniumScraper):
 
         page_id = result.fetchone()[0]
 
+        # Keep the content gap topic index current (no-op for unchanged content)
+        try:
+            self.topic_index.index_competitor_page(
+                session, competitor_id, metrics.url, html, content_hash, page_id
+            )
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"Failed to update topic index for {metrics.url}: {e}")
+
         # Generate and store embeddings (per SCRAPER BOT.pdf)
         if self.enable_embeddings:
             try:
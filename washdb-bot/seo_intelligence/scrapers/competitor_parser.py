@@ -24,6 +24,7 @@ from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
 
 from runner.logging_setup import get_logger
+from seo_intelligence.services.text_profile import get_text_profiler
 
 logger = get_logger("competitor_parser")
 
@@ -226,9 +227,8 @@ class CompetitorParser:
         # Get text
         text = soup.get_text(separator=' ', strip=True)
 
-        # Count words
-        words = re.findall(r'\b\w+\b', text)
-        return len(words)
+        # Count words (tokenized once per page via the shared text profile)
+        return len(get_text_profiler().profile_text(text).word_tokens)
 
     def _analyze_links(self, soup: BeautifulSoup, base_url: str) -> Dict[str, Any]:
         """Analyze internal and external links."""
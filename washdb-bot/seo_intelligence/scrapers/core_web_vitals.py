@@ -47,9 +47,10 @@ from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse
 from dataclasses import dataclass
 
-from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
+from playwright.sync_api import Page, Browser, BrowserContext
 from playwright_stealth import Stealth
 
+from seo_intelligence.scrapers.audit_engine import AUDIT_WORKERS, close_browser, launch_browser, run_by_domain
 from seo_intelligence.services.cwv_metrics import get_cwv_metrics_service, CWVRating
 from runner.logging_setup import get_logger
 
@@ -330,11 +331,99 @@ class CoreWebVitalsCollector:
             logger.debug(f"FID trigger failed: {e}")
             return False
 
-    def measure_url(self, url: str) -> CWVResult:
+    def prepare_page(self, context: BrowserContext) -> Page:
         """
-        Measure Core Web Vitals for a URL.
+        Open a page with stealth applied and CWV observers injected.
+
+        Navigate the returned page, then call measure_page().
 
         Args:
+            context: Browser context to open the page in
+
+        Returns:
+            Page ready for navigation
+        """
+        page = context.new_page()
+
+        # Apply stealth
+        stealth = Stealth()
+        stealth.apply_stealth_sync(page)
+
+        # Inject CWV measurement observers
+        self._inject_cwv_observers(page)
+        return page
+
+    def measure_page(self, page: Page, result: CWVResult) -> CWVResult:
+        """
+        Collect Core Web Vitals from a page that has finished loading.
+
+        The page must have been opened with prepare_page(), so this can
+        reuse a navigation done by another caller (e.g. the technical audit).
+
+        Args:
+            page: Loaded page with CWV observers
+            result: CWVResult to fill in
+
+        Returns:
+            The same CWVResult with metrics, ratings and score
+        """
+        # Wait for page to stabilize and CWV to be measured
+        logger.debug(f"Waiting {self.cwv_wait_time}s for CWV metrics")
+        time.sleep(self.cwv_wait_time)
+
+        # Trigger interaction for FID measurement
+        self._trigger_fid(page)
+        time.sleep(0.5)  # Brief wait for FID to register
+
+        # Collect all metrics
+        raw_metrics = self._collect_metrics(page)
+        logger.debug(f"Raw metrics: {raw_metrics}")
+
+        # Extract metrics
+        result.lcp_ms = raw_metrics.get("lcp")
+        result.cls_value = raw_metrics.get("cls", 0)
+        result.fid_ms = raw_metrics.get("fid")
+        result.fcp_ms = raw_metrics.get("fcp")
+        result.tti_ms = raw_metrics.get("tti")
+        result.ttfb_ms = raw_metrics.get("ttfb")
+        result.lcp_element = raw_metrics.get("lcp_element")
+
+        # Calculate ratings
+        if result.lcp_ms is not None:
+            result.lcp_rating = self.cwv_service.rate_lcp(result.lcp_ms).value
+
+        if result.cls_value is not None:
+            result.cls_rating = self.cwv_service.rate_cls(result.cls_value).value
+
+        if result.fid_ms is not None:
+            result.fid_rating = self.cwv_service.rate_fid(result.fid_ms).value
+
+        # Calculate composite score
+        result.cwv_score = self.cwv_service.calculate_cwv_score(
+            lcp_ms=result.lcp_ms,
+            cls_value=result.cls_value,
+            fid_ms=result.fid_ms,
+            fcp_ms=result.fcp_ms,
+            tti_ms=result.tti_ms,
+            ttfb_ms=result.ttfb_ms,
+        )
+
+        # Get assessment
+        assessment, _ = self.cwv_service.get_cwv_assessment(
+            lcp_ms=result.lcp_ms,
+            cls_value=result.cls_value,
+            fid_ms=result.fid_ms,
+        )
+        result.cwv_assessment = assessment
+
+        return result
+
+    def measure_with_browser(self, browser: Browser, url: str) -> CWVResult:
+        """
+        Measure Core Web Vitals for a URL in a fresh context of a running browser.
+
+        Args:
+            browser: Browser to open the context in
             url: URL to measure
 
         Returns:
@@ -343,100 +432,31 @@ class CoreWebVitalsCollector:
         start_time = time.time()
         result = CWVResult(url=url)
 
+        context = None
         try:
-            with sync_playwright() as p:
-                # Launch browser
-                browser = p.chromium.launch(
-                    headless=self.headless,
-                    args=[
-                        "--disable-blink-features=AutomationControlled",
-                        "--disable-dev-shm-usage",
-                        "--no-sandbox",
-                    ],
-                )
+            context = self._create_browser_context(browser)
+            page = self.prepare_page(context)
 
-                try:
-                    # Create context
-                    context = self._create_browser_context(browser)
-
-                    # Create page with CWV observers
-                    page = context.new_page()
-
-                    # Apply stealth
-                    stealth = Stealth()
-                    stealth.apply_stealth_sync(page)
-
-                    # Inject CWV measurement observers
-                    self._inject_cwv_observers(page)
-
-                    # Navigate to URL
-                    logger.debug(f"Navigating to {url}")
-                    response = page.goto(url, wait_until="load")
-
-                    if response is None or response.status >= 400:
-                        result.error = f"HTTP {response.status if response else 'no response'}"
-                        return result
-
-                    # Wait for page to stabilize and CWV to be measured
-                    logger.debug(f"Waiting {self.cwv_wait_time}s for CWV metrics")
-                    time.sleep(self.cwv_wait_time)
-
-                    # Trigger interaction for FID measurement
-                    self._trigger_fid(page)
-                    time.sleep(0.5)  # Brief wait for FID to register
-
-                    # Collect all metrics
-                    raw_metrics = self._collect_metrics(page)
-                    logger.debug(f"Raw metrics: {raw_metrics}")
-
-                    # Extract metrics
-                    result.lcp_ms = raw_metrics.get("lcp")
-                    result.cls_value = raw_metrics.get("cls", 0)
-                    result.fid_ms = raw_metrics.get("fid")
-                    result.fcp_ms = raw_metrics.get("fcp")
-                    result.tti_ms = raw_metrics.get("tti")
-                    result.ttfb_ms = raw_metrics.get("ttfb")
-                    result.lcp_element = raw_metrics.get("lcp_element")
-
-                    # Calculate ratings
-                    if result.lcp_ms is not None:
-                        result.lcp_rating = self.cwv_service.rate_lcp(result.lcp_ms).value
-
-                    if result.cls_value is not None:
-                        result.cls_rating = self.cwv_service.rate_cls(result.cls_value).value
-
-                    if result.fid_ms is not None:
-                        result.fid_rating = self.cwv_service.rate_fid(result.fid_ms).value
-
-                    # Calculate composite score
-                    result.cwv_score = self.cwv_service.calculate_cwv_score(
-                        lcp_ms=result.lcp_ms,
-                        cls_value=result.cls_value,
-                        fid_ms=result.fid_ms,
-                        fcp_ms=result.fcp_ms,
-                        tti_ms=result.tti_ms,
-                        ttfb_ms=result.ttfb_ms,
-                    )
-
-                    # Get assessment
-                    assessment, _ = self.cwv_service.get_cwv_assessment(
-                        lcp_ms=result.lcp_ms,
-                        cls_value=result.cls_value,
-                        fid_ms=result.fid_ms,
-                    )
-                    result.cwv_assessment = assessment
-
-                    # Close page and context
-                    page.close()
-                    context.close()
+            # Navigate to URL
+            logger.debug(f"Navigating to {url}")
+            response = page.goto(url, wait_until="load")
 
-                finally:
-                    browser.close()
+            if response is None or response.status >= 400:
+                result.error = f"HTTP {response.status if response else 'no response'}"
+            else:
+                self.measure_page(page, result)
 
         except Exception as e:
             logger.error(f"Error measuring CWV for {url}: {e}")
             result.error = str(e)
 
+        finally:
+            if context is not None:
+                try:
+                    context.close()
+                except Exception:
+                    pass
+
         # Record measurement time
         result.measurement_time_ms = (time.time() - start_time) * 1000
 
@@ -450,25 +470,55 @@ class CoreWebVitalsCollector:
 
         return result
 
-    def measure_urls(self, urls: List[str]) -> List[CWVResult]:
+    def measure_url(self, url: str) -> CWVResult:
         """
-        Measure Core Web Vitals for multiple URLs.
+        Measure Core Web Vitals for a URL.
 
         Args:
-            urls: List of URLs to measure
+            url: URL to measure
 
         Returns:
-            List of CWVResult objects
+            CWVResult with all metrics and ratings
+        """
+        handle = launch_browser(headless=self.headless)
+        if handle is None:
+            return CWVResult(url=url, error="Browser unavailable")
+
+        try:
+            return self.measure_with_browser(handle.browser, url)
+        finally:
+            handle.close()
+
+    def measure_urls(self, urls: List[str], max_workers: Optional[int] = None) -> List[CWVResult]:
         """
-        results = []
-        for url in urls:
-            result = self.measure_url(url)
-            results.append(result)
+        Measure Core Web Vitals for multiple URLs concurrently.
 
-            # Small delay between measurements
-            time.sleep(1.0)
+        URLs are spread over max_workers browsers (one context per URL),
+        with at most one URL per domain measured at a time.
 
-        return results
+        Args:
+            urls: List of URLs to measure
+            max_workers: Concurrent browsers (default AUDIT_WORKERS)
+
+        Returns:
+            List of CWVResult objects, in the order of urls
+        """
+        def measure(handle, url):
+            if handle is None:
+                return CWVResult(url=url, error="Browser unavailable")
+            return self.measure_with_browser(handle.browser, url)
+
+        results = run_by_domain(
+            urls,
+            measure,
+            max_workers=max_workers or AUDIT_WORKERS,
+            worker_setup=lambda: launch_browser(headless=self.headless),
+            worker_teardown=close_browser,
+        )
+        return [
+            result if result is not None else CWVResult(url=url, error="Measurement failed")
+            for url, result in zip(urls, results)
+        ]
 
 
 # Module-level singleton
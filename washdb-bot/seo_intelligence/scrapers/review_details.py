@@ -21,11 +21,12 @@ from urllib.parse import urlparse, quote_plus
 from bs4 import BeautifulSoup
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from seo_intelligence.services import get_task_logger
-from seo_intelligence.services.governance import propose_change, ChangeType
+from seo_intelligence.services.governance import propose_changes, ChangeType
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Load environment
@@ -105,7 +106,7 @@ class ReviewDetailScraper:
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database operations disabled")
@@ -515,16 +516,18 @@ class ReviewDetailScraper:
             logger.error(f"Error parsing {directory} listing: {e}", exc_info=True)
             return None
 
-    def _update_citation(self, session: Session, review_data: ReviewData) -> Optional[int]:
+    def _update_citation(self, session: Session, review_data: ReviewData) -> Optional[Dict[str, Any]]:
         """
-        Propose citation update through governance workflow.
+        Prepare a citation update for the governance workflow.
+
+        scrape_reviews() proposes a run's updates with one propose_changes().
 
         Args:
             session: Database session
             review_data: Scraped review data
 
         Returns:
-            change_id if proposed successfully
+            Change dict for propose_changes(), or None on error
         """
         try:
             # Build update metadata
@@ -553,29 +556,26 @@ class ReviewDetailScraper:
             proposed_data['metadata'] = update_metadata
             proposed_data['last_verified'] = datetime.now().isoformat()
 
-            # Propose change through governance
-            change_id = propose_change(
-                table_name='citations',
-                operation='update',
-                record_id=review_data.citation_id,
-                proposed_data=proposed_data,
-                change_type=ChangeType.REVIEWS,
-                source='review_detail_scraper',
-                reason=f"Fresh review data scraped from {review_data.directory_name}",
-                metadata={
+            # Change for the governance batch
+            return {
+                'table_name': 'citations',
+                'operation': 'update',
+                'record_id': review_data.citation_id,
+                'proposed_data': proposed_data,
+                'change_type': ChangeType.REVIEWS,
+                'source': 'review_detail_scraper',
+                'reason': f"Fresh review data scraped from {review_data.directory_name}",
+                'metadata': {
                     'directory_name': review_data.directory_name,
                     'listing_url': review_data.listing_url,
                     'rating_value': review_data.rating_value,
                     'rating_count': review_data.rating_count,
                     'has_snippets': bool(review_data.recent_review_snippets)
-                }
-            )
-
-            logger.debug(f"Proposed citation update {review_data.citation_id} (change_id={change_id})")
-            return change_id
+                },
+            }
 
         except Exception as e:
-            logger.error(f"Error proposing citation update {review_data.citation_id}: {e}", exc_info=True)
+            logger.error(f"Error preparing citation update {review_data.citation_id}: {e}", exc_info=True)
             return None
 
     def scrape_reviews(
@@ -601,6 +601,7 @@ class ReviewDetailScraper:
 
         limit = limit or self.max_listings_per_run
         results = []
+        proposals: List[Dict[str, Any]] = []
 
         # Start task logging
         task_id = None
@@ -632,10 +633,11 @@ class ReviewDetailScraper:
                     review_data = self._scrape_listing(citation)
 
                     if review_data:
-                        # Update database
-                        success = self._update_citation(session, review_data)
+                        # Queue the update for governance review
+                        change = self._update_citation(session, review_data)
 
-                        if success:
+                        if change:
+                            proposals.append(change)
                             results.append(review_data)
                             logger.info(
                                 f"Scraped {citation['directory_name']}: "
@@ -644,6 +646,15 @@ class ReviewDetailScraper:
                                 f"snippets={len(review_data.recent_review_snippets or [])}"
                             )
 
+                # Propose all updates from this run in one batch
+                if proposals:
+                    change_ids = propose_changes(proposals)
+                    if not change_ids:
+                        logger.error(f"Failed to propose {len(proposals)} citation updates")
+                        results = []
+                    else:
+                        logger.info(f"Proposed {len(change_ids)} citation updates for review")
+
                 # Complete task logging
                 if self.task_logger and task_id:
                     self.task_logger.complete_task(
@@ -24,7 +24,7 @@ from datetime import datetime
 from urllib.parse import quote_plus
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from seo_intelligence.scrapers.base_scraper import BaseScraper
@@ -35,6 +35,7 @@ from seo_intelligence.services import (
     get_content_embedder,
     get_qdrant_manager
 )
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Load environment
@@ -109,7 +110,7 @@ class SerpScraper(BaseScraper):
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database storage disabled")
@@ -22,6 +22,7 @@ import json
 import time
 import ssl
 import socket
+import threading
 import requests
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
@@ -30,12 +31,22 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
-
+from playwright_stealth import Stealth
+
+from db.batch_writer import BatchWriter
+from db.engine_registry import get_engine
+from seo_intelligence.scrapers.audit_engine import (
+    AUDIT_WORKERS,
+    close_browser,
+    get_http_session,
+    launch_browser,
+    run_by_domain,
+)
 from seo_intelligence.scrapers.base_scraper import BaseScraper
 from seo_intelligence.services import get_task_logger, get_change_manager, get_cwv_metrics_service
-from seo_intelligence.scrapers.core_web_vitals import CoreWebVitalsCollector, get_cwv_collector
+from seo_intelligence.scrapers.core_web_vitals import CoreWebVitalsCollector, CWVResult, get_cwv_collector
 from runner.logging_setup import get_logger
 
 # Load environment
@@ -43,6 +54,12 @@ load_dotenv()
 
 logger = get_logger("technical_auditor")
 
+# Audits saved per database transaction by run()
+AUDIT_SAVE_BATCH_SIZE = int(os.getenv("AUDIT_SAVE_BATCH_SIZE", "10"))
+
+# Audit pages may have broken certificates; the HTTP phase reports those
+AUDIT_BROWSER_ARGS = ["--ignore-certificate-errors", "--ignore-certificate-errors-spki-list"]
+
 
 class IssueSeverity(Enum):
     """Severity levels for audit issues."""
@@ -151,29 +168,36 @@ class TechnicalAuditor(BaseScraper):
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database storage disabled")
 
+        # CWV is measured on the audit's own page load
+        self.cwv_collector = CoreWebVitalsCollector(
+            headless=headless,
+            page_timeout=self.page_timeout,
+            cwv_wait_time=5.0,
+        )
+
         logger.info("TechnicalAuditor initialized (tier=D)")
 
     def _http_fallback_audit(self, url: str) -> Optional[Tuple[str, Dict[str, Any], List[AuditIssue]]]:
         """
-        Simple HTTP fallback when Playwright fails.
-        Returns (html_content, metrics, issues) or None if also fails.
+        Fetch the raw (unrendered) page over the shared HTTP session.
+
+        Used as the fallback when Playwright fails, and as the raw HTML for
+        the JS rendering comparison. Returns (html_content, metrics, issues);
+        html_content is None if the request failed.
         """
         issues = []
         metrics = {"fallback_mode": True}
 
         try:
             start_time = time.time()
-            response = requests.get(
+            response = get_http_session().get(
                 url,
                 timeout=15,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                },
                 verify=True,
                 allow_redirects=True,
             )
@@ -214,7 +238,7 @@ class TechnicalAuditor(BaseScraper):
                     recommendation="Minimize redirect chains"
                 ))
 
-            logger.info(f"HTTP fallback succeeded for {url} (status={response.status_code})")
+            logger.debug(f"HTTP fetch succeeded for {url} (status={response.status_code})")
             return response.text, metrics, issues
 
         except requests.exceptions.SSLError as e:
@@ -733,90 +757,102 @@ class TechnicalAuditor(BaseScraper):
         Returns:
             Tuple of (issues, metrics) with CWV data
         """
-        issues = []
-        metrics = {}
-
         if not measure_cwv:
-            return issues, metrics
+            return [], {}
 
         try:
-            # Use dedicated CWV collector
-            cwv_collector = CoreWebVitalsCollector(
-                headless=self.headless,
-                page_timeout=self.page_timeout,
-                cwv_wait_time=5.0,
-            )
+            return self._cwv_findings(url, self.cwv_collector.measure_url(url))
+        except Exception as e:
+            logger.error(f"CWV measurement failed for {url}: {e}")
+            return [], {}
 
-            result = cwv_collector.measure_url(url)
+    def _collect_core_web_vitals(self, page, url: str) -> Tuple[List[AuditIssue], Dict[str, Any]]:
+        """
+        Collect Core Web Vitals from the audit's own page load.
 
-            if result.error:
-                logger.warning(f"CWV measurement error for {url}: {result.error}")
-                return issues, metrics
+        Args:
+            page: Loaded page opened with the CWV observers injected
+            url: Audited URL
 
-            # Store metrics
-            if result.lcp_ms is not None:
-                metrics["lcp_ms"] = round(result.lcp_ms, 2)
-                metrics["lcp_rating"] = result.lcp_rating
+        Returns:
+            Tuple of (issues, metrics) with CWV data
+        """
+        try:
+            return self._cwv_findings(url, self.cwv_collector.measure_page(page, CWVResult(url=url)))
+        except Exception as e:
+            logger.error(f"CWV measurement failed for {url}: {e}")
+            return [], {}
 
-            if result.cls_value is not None:
-                metrics["cls_value"] = round(result.cls_value, 4)
-                metrics["cls_rating"] = result.cls_rating
+    def _cwv_findings(self, url: str, result: CWVResult) -> Tuple[List[AuditIssue], Dict[str, Any]]:
+        """Convert a CWV measurement into audit issues and metrics."""
+        issues = []
+        metrics = {}
 
-            if result.fid_ms is not None:
-                metrics["fid_ms"] = round(result.fid_ms, 2)
-                metrics["fid_rating"] = result.fid_rating
+        if result.error:
+            logger.warning(f"CWV measurement error for {url}: {result.error}")
+            return issues, metrics
 
-            if result.fcp_ms is not None:
-                metrics["fcp_ms"] = round(result.fcp_ms, 2)
+        # Store metrics
+        if result.lcp_ms is not None:
+            metrics["lcp_ms"] = round(result.lcp_ms, 2)
+            metrics["lcp_rating"] = result.lcp_rating
 
-            if result.tti_ms is not None:
-                metrics["tti_ms"] = round(result.tti_ms, 2)
+        if result.cls_value is not None:
+            metrics["cls_value"] = round(result.cls_value, 4)
+            metrics["cls_rating"] = result.cls_rating
 
-            if result.ttfb_ms is not None:
-                metrics["ttfb_ms"] = round(result.ttfb_ms, 2)
+        if result.fid_ms is not None:
+            metrics["fid_ms"] = round(result.fid_ms, 2)
+            metrics["fid_rating"] = result.fid_rating
 
-            if result.lcp_element:
-                metrics["lcp_element"] = result.lcp_element
+        if result.fcp_ms is not None:
+            metrics["fcp_ms"] = round(result.fcp_ms, 2)
 
-            if result.cwv_score is not None:
-                metrics["cwv_score"] = result.cwv_score
+        if result.tti_ms is not None:
+            metrics["tti_ms"] = round(result.tti_ms, 2)
 
-            if result.cwv_assessment:
-                metrics["cwv_assessment"] = result.cwv_assessment
+        if result.ttfb_ms is not None:
+            metrics["ttfb_ms"] = round(result.ttfb_ms, 2)
 
-            # Generate issues from CWV metrics service
-            cwv_service = get_cwv_metrics_service()
-            cwv_issues = cwv_service.generate_issues(
-                lcp_ms=result.lcp_ms,
-                cls_value=result.cls_value,
-                fid_ms=result.fid_ms,
-                fcp_ms=result.fcp_ms,
-                tti_ms=result.tti_ms,
-                ttfb_ms=result.ttfb_ms,
-                lcp_element=result.lcp_element,
-            )
+        if result.lcp_element:
+            metrics["lcp_element"] = result.lcp_element
 
-            # Convert CWV issues to AuditIssue format
-            for cwv_issue in cwv_issues:
-                issues.append(AuditIssue(
-                    category=cwv_issue["category"],
-                    severity=cwv_issue["severity"],
-                    issue_type=cwv_issue["issue_type"],
-                    description=cwv_issue["description"],
-                    affected_element=cwv_issue.get("element", ""),
-                    recommendation=cwv_issue["recommendation"],
-                    metadata=cwv_issue.get("metadata", {}),
-                ))
+        if result.cwv_score is not None:
+            metrics["cwv_score"] = result.cwv_score
 
-            logger.info(
-                f"CWV measured for {url}: "
-                f"LCP={result.lcp_ms}ms ({result.lcp_rating}), "
-                f"CLS={result.cls_value} ({result.cls_rating}), "
-                f"Score={result.cwv_score}"
-            )
+        if result.cwv_assessment:
+            metrics["cwv_assessment"] = result.cwv_assessment
 
-        except Exception as e:
-            logger.error(f"CWV measurement failed for {url}: {e}")
+        # Generate issues from CWV metrics service
+        cwv_service = get_cwv_metrics_service()
+        cwv_issues = cwv_service.generate_issues(
+            lcp_ms=result.lcp_ms,
+            cls_value=result.cls_value,
+            fid_ms=result.fid_ms,
+            fcp_ms=result.fcp_ms,
+            tti_ms=result.tti_ms,
+            ttfb_ms=result.ttfb_ms,
+            lcp_element=result.lcp_element,
+        )
+
+        # Convert CWV issues to AuditIssue format
+        for cwv_issue in cwv_issues:
+            issues.append(AuditIssue(
+                category=cwv_issue["category"],
+                severity=cwv_issue["severity"],
+                issue_type=cwv_issue["issue_type"],
+                description=cwv_issue["description"],
+                affected_element=cwv_issue.get("element", ""),
+                recommendation=cwv_issue["recommendation"],
+                metadata=cwv_issue.get("metadata", {}),
+            ))
+
+        logger.info(
+            f"CWV measured for {url}: "
+            f"LCP={result.lcp_ms}ms ({result.lcp_rating}), "
+            f"CLS={result.cls_value} ({result.cls_rating}), "
+            f"Score={result.cwv_score}"
+        )
 
         return issues, metrics
 
@@ -871,8 +907,19 @@ class TechnicalAuditor(BaseScraper):
         self,
         session: Session,
         result: AuditResult,
+        commit: bool = True,
     ) -> int:
-        """Save audit result to database."""
+        """
+        Save audit result to database.
+
+        Args:
+            session: Database session
+            result: Audit to save
+            commit: Commit the session (False when saving a batch)
+
+        Returns:
+            audit_id of the new page_audits row
+        """
         # Prepare extended metadata with all scores
         extended_metadata = {
             **result.metrics,
@@ -926,8 +973,8 @@ class TechnicalAuditor(BaseScraper):
         )
         audit_id = audit_result.fetchone()[0]
 
-        # Insert individual issues
-        for issue in result.issues:
+        # Insert individual issues (one executemany)
+        if result.issues:
             session.execute(
                 text("""
                     INSERT INTO audit_issues (
@@ -938,16 +985,19 @@ class TechnicalAuditor(BaseScraper):
                         :description, :element, :recommendation, CAST(:issue_metadata AS jsonb)
                     )
                 """),
-                {
-                    "audit_id": audit_id,
-                    "category": issue.category,
-                    "severity": issue.severity,
-                    "issue_type": issue.issue_type,
-                    "description": issue.description,
-                    "element": issue.affected_element[:500] if issue.affected_element else "",
-                    "recommendation": issue.recommendation,
-                    "issue_metadata": json.dumps(issue.metadata),
-                }
+                [
+                    {
+                        "audit_id": audit_id,
+                        "category": issue.category,
+                        "severity": issue.severity,
+                        "issue_type": issue.issue_type,
+                        "description": issue.description,
+                        "element": issue.affected_element[:500] if issue.affected_element else "",
+                        "recommendation": issue.recommendation,
+                        "issue_metadata": json.dumps(issue.metadata),
+                    }
+                    for issue in result.issues
+                ]
             )
 
         # Propose fixes for critical/high severity actionable issues
@@ -970,50 +1020,138 @@ class TechnicalAuditor(BaseScraper):
 
         if critical_high_issues:
             try:
-                change_manager = get_change_manager()
-                for issue in critical_high_issues:
-                    # Propose change for each actionable issue
-                    change_manager.propose_change(
-                        change_type='audit_fix',
-                        entity_type='page',
-                        entity_id=result.url,
-                        proposed_value={
+                # One batch per audit instead of one insert per issue
+                change_ids = get_change_manager().propose_changes([
+                    {
+                        'change_type': 'audit_fix',
+                        'entity_type': 'page',
+                        'entity_id': result.url,
+                        'proposed_value': {
                             'fix': issue.issue_type,
                             'element': issue.affected_element[:200] if issue.affected_element else None,
                             'recommendation': issue.recommendation
                         },
-                        current_value={
+                        'current_value': {
                             'issue': issue.description,
                             'severity': issue.severity,
                             'category': issue.category
                         },
-                        reason=f"{issue.severity.upper()}: {issue.description}",
-                        priority='high' if issue.severity == 'critical' else 'medium',
-                        source='technical_auditor',
-                        metadata={
+                        'reason': f"{issue.severity.upper()}: {issue.description}",
+                        'priority': 'high' if issue.severity == 'critical' else 'medium',
+                        'source': 'technical_auditor',
+                        'metadata': {
                             'audit_id': audit_id,
                             'issue_type': issue.issue_type,
                             'category': issue.category,
                             'url': result.url
-                        }
-                    )
-                    logger.info(f"Proposed change for {issue.issue_type} on {result.url}")
+                        },
+                    }
+                    for issue in critical_high_issues
+                ])
+                logger.info(f"Proposed {len(change_ids)} changes for {result.url}")
             except Exception as e:
                 logger.error(f"Error proposing changes for audit {audit_id}: {e}")
 
-        session.commit()
+        if commit:
+            session.commit()
         return audit_id
 
-    def audit_page(self, url: str, measure_cwv: bool = True) -> AuditResult:
+    def _save_audits(self, results: List[AuditResult]) -> List[Optional[int]]:
         """
-        Perform technical audit on a single page.
+        Save a batch of audits in one transaction.
+
+        Each audit gets a savepoint, so one bad row does not lose the batch.
+
+        Args:
+            results: Audits to save
+
+        Returns:
+            audit_id per result (None where saving failed)
+        """
+        audit_ids = []
+        with Session(self.engine) as session:
+            for result in results:
+                try:
+                    with session.begin_nested():
+                        audit_ids.append(self._save_audit(session, result, commit=False))
+                except Exception as e:
+                    logger.error(f"Error saving audit for {result.url}: {e}")
+                    audit_ids.append(None)
+            session.commit()
+        return audit_ids
+
+    def _launch_browser(self):
+        """Worker setup for run_by_domain(): one browser per audit worker."""
+        return launch_browser(headless=self.headless, extra_args=AUDIT_BROWSER_ARGS)
+
+    def _open_audit_page(self, browser, measure_cwv: bool):
+        """
+        Open a fresh stealth context and page for one audit.
+
+        Args:
+            browser: Worker's browser
+            measure_cwv: Inject the CWV observers before navigation
+
+        Returns:
+            Tuple of (context, page)
+        """
+        context_options = self._get_stealth_context_options()
+        context_options["user_agent"] = self.ua_rotator.get_random()
+
+        context = browser.new_context(**context_options)
+        context.set_default_timeout(self.page_timeout)
+
+        if measure_cwv:
+            page = self.cwv_collector.prepare_page(context)
+        else:
+            page = context.new_page()
+            Stealth().apply_stealth_sync(page)
+
+        return context, page
+
+    def _failed_result(
+        self,
+        url: str,
+        issue: AuditIssue,
+        issues: Optional[List[AuditIssue]] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+    ) -> AuditResult:
+        """Zero-score result for a page that could not be audited."""
+        return AuditResult(
+            url=url,
+            audit_date=datetime.now(),
+            overall_score=0,
+            performance_score=0,
+            seo_score=0,
+            accessibility_score=0,
+            security_score=0,
+            issues=(issues or []) + [issue],
+            metrics=metrics or {},
+        )
+
+    def _audit_url(
+        self,
+        url: str,
+        measure_cwv: bool = True,
+        browser=None,
+    ) -> Tuple[AuditResult, bool]:
+        """
+        Audit one page without saving it.
+
+        HTTP-only work (SSL check, raw fetch) runs on the shared HTTP
+        session; the raw response is reused for the fallback metrics and
+        the JS rendering comparison. The browser phase is a single
+        navigation in a fresh context: the DOM checks and Core Web Vitals
+        both come from that one page load.
 
         Args:
             url: URL to audit
-            measure_cwv: Whether to measure Core Web Vitals (adds ~5s to audit)
+            measure_cwv: Whether to measure Core Web Vitals
+            browser: Browser to render with (None = HTTP-only audit)
 
         Returns:
-            AuditResult with findings
+            Tuple of (AuditResult, completed); completed is False when the
+            page could not be audited and the result should not be saved
         """
         from bs4 import BeautifulSoup
 
@@ -1031,122 +1169,94 @@ class TechnicalAuditor(BaseScraper):
             if not ssl_issues:
                 passed_checks.append("SSL/HTTPS configured")
 
-            # Fetch page - try Playwright first, fall back to HTTP if in asyncio loop
-            html = None
-            page = None
-            use_http_fallback = False
+            # HTTP phase: raw HTML for the JS comparison, or the fallback page
+            raw_html, http_metrics, http_issues = self._http_fallback_audit(url)
 
+            html = None
+            context = None
             try:
-                with self.browser_session() as (browser, context, page):
-                    start_time = time.time()
-
-                    html = self.fetch_page(
-                        url=url,
-                        page=page,
-                        wait_for="domcontentloaded",  # Changed from networkidle - faster
-                        extra_wait=0.5,
-                    )
-
-                    load_time = time.time() - start_time
-                    all_metrics["load_time_seconds"] = round(load_time, 2)
-
-                    if load_time > 5:
-                        all_issues.append(AuditIssue(
-                            category=IssueCategory.PERFORMANCE.value,
-                            severity=IssueSeverity.HIGH.value,
-                            issue_type="slow_page_load",
-                            description=f"Page load time: {load_time:.1f}s",
-                            recommendation="Optimize page load time to under 3 seconds"
-                        ))
-                    elif load_time < 3:
-                        passed_checks.append(f"Fast page load ({load_time:.1f}s)")
-            except Exception as pw_error:
-                # Playwright can't run in asyncio loop (NiceGUI dashboard)
-                if "asyncio" in str(pw_error).lower():
-                    logger.info(f"Playwright unavailable in async context, using HTTP for {url}")
-                    use_http_fallback = True
-                else:
-                    logger.warning(f"Playwright error for {url}: {pw_error}")
-                    use_http_fallback = True
-
-            if use_http_fallback or not html:
-                # Use HTTP fallback
-                logger.info(f"Using HTTP fallback for {url}")
-                fallback_result = self._http_fallback_audit(url)
-                if fallback_result and fallback_result[0]:
-                    html, fb_metrics, fb_issues = fallback_result
-                    all_metrics.update(fb_metrics)
-                    all_issues.extend(fb_issues)
-                else:
-                    # HTTP fallback failed
-                    if fallback_result:
-                        _, fb_metrics, fb_issues = fallback_result
-                        all_metrics.update(fb_metrics)
-                        all_issues.extend(fb_issues)
-                    return AuditResult(
-                        url=url,
-                        audit_date=datetime.now(),
-                        overall_score=0,
-                        performance_score=0,
-                        seo_score=0,
-                        accessibility_score=0,
-                        security_score=0,
-                        issues=all_issues + [AuditIssue(
-                            category=IssueCategory.TECHNICAL.value,
-                            severity=IssueSeverity.CRITICAL.value,
-                            issue_type="page_unreachable",
-                            description="Could not load page (HTTP fallback failed)",
-                            recommendation="Check if URL is accessible"
-                        )],
-                        metrics=all_metrics,
-                    )
-
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Run all checks (skip page-dependent checks if using HTTP fallback)
-            checks = [
-                self._check_meta_tags(soup, url),
-                self._check_headings(soup),
-                self._check_images(soup, url),
-                self._check_links(soup, url),
-                self._check_schema(soup),
-            ]
-
-            # Only run performance check if we have a Playwright page
-            if page and not use_http_fallback:
-                checks.append(self._check_performance(page, soup))
-
-            for issues, metrics in checks:
-                all_issues.extend(issues)
-                all_metrics.update(metrics)
-
-            # Measure Core Web Vitals (separate browser session)
-            if measure_cwv and not use_http_fallback:
-                cwv_issues, cwv_metrics = self._measure_core_web_vitals(url, measure_cwv=True)
-                all_issues.extend(cwv_issues)
-                all_metrics.update(cwv_metrics)
-
-            # JS Rendering Analysis: Compare raw HTML vs rendered HTML
-            # Only run if we have rendered HTML from Playwright (not HTTP fallback)
-            if not use_http_fallback and html:
-                try:
-                    # Fetch raw HTML without JavaScript execution
-                    raw_response = requests.get(
-                        url,
-                        timeout=10,
-                        headers={
-                            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                        },
-                        verify=True,
-                        allow_redirects=True,
-                    )
-                    if raw_response.status_code == 200:
-                        raw_html = raw_response.text
-                        js_issues, js_metrics = self._check_js_rendering(raw_html, html)
-                        all_issues.extend(js_issues)
-                        all_metrics.update(js_metrics)
-                except Exception as js_err:
-                    logger.debug(f"JS rendering analysis skipped for {url}: {js_err}")
+                if browser is not None:
+                    try:
+                        context, page = self._open_audit_page(browser, measure_cwv)
+                        start_time = time.time()
+
+                        html = self.fetch_page(
+                            url=url,
+                            page=page,
+                            # CWV needs the load event; plain audits stop at DOM ready
+                            wait_for="load" if measure_cwv else "domcontentloaded",
+                            extra_wait=0 if measure_cwv else 0.5,
+                        )
+
+                        load_time = time.time() - start_time
+                        all_metrics["load_time_seconds"] = round(load_time, 2)
+
+                        if load_time > 5:
+                            all_issues.append(AuditIssue(
+                                category=IssueCategory.PERFORMANCE.value,
+                                severity=IssueSeverity.HIGH.value,
+                                issue_type="slow_page_load",
+                                description=f"Page load time: {load_time:.1f}s",
+                                recommendation="Optimize page load time to under 3 seconds"
+                            ))
+                        elif load_time < 3:
+                            passed_checks.append(f"Fast page load ({load_time:.1f}s)")
+                    except Exception as pw_error:
+                        logger.warning(f"Playwright error for {url}: {pw_error}")
+                        html = None
+
+                rendered = html is not None
+                if not rendered:
+                    # Use HTTP fallback
+                    logger.info(f"Using HTTP fallback for {url}")
+                    all_metrics.update(http_metrics)
+                    all_issues.extend(http_issues)
+                    if not raw_html:
+                        return self._failed_result(
+                            url,
+                            AuditIssue(
+                                category=IssueCategory.TECHNICAL.value,
+                                severity=IssueSeverity.CRITICAL.value,
+                                issue_type="page_unreachable",
+                                description="Could not load page (HTTP fallback failed)",
+                                recommendation="Check if URL is accessible"
+                            ),
+                            issues=all_issues,
+                            metrics=all_metrics,
+                        ), False
+                    html = raw_html
+
+                soup = BeautifulSoup(html, 'html.parser')
+
+                # Run all checks (skip page-dependent checks if using HTTP fallback)
+                checks = [
+                    self._check_meta_tags(soup, url),
+                    self._check_headings(soup),
+                    self._check_images(soup, url),
+                    self._check_links(soup, url),
+                    self._check_schema(soup),
+                ]
+
+                if rendered:
+                    checks.append(self._check_performance(page, soup))
+
+                    # Core Web Vitals from the same page load
+                    if measure_cwv:
+                        checks.append(self._collect_core_web_vitals(page, url))
+
+                    # JS Rendering Analysis: Compare raw HTML vs rendered HTML
+                    if raw_html and http_metrics.get("http_status") == 200:
+                        checks.append(self._check_js_rendering(raw_html, html))
+
+                for issues, metrics in checks:
+                    all_issues.extend(issues)
+                    all_metrics.update(metrics)
+            finally:
+                if context is not None:
+                    try:
+                        context.close()
+                    except Exception:
+                        pass
 
             # Calculate scores
             overall, perf, seo, access, security = self._calculate_scores(
@@ -1166,44 +1276,75 @@ class TechnicalAuditor(BaseScraper):
                 passed_checks=passed_checks,
             )
 
-            # Save to database
-            if self.engine:
-                with Session(self.engine) as session:
-                    self._save_audit(session, result)
-
             logger.info(
                 f"Audit complete: {url} - Score: {overall:.0f} "
                 f"({len(all_issues)} issues found)"
             )
 
-            return result
+            return result, True
 
         except Exception as e:
             logger.error(f"Error auditing {url}: {e}", exc_info=True)
-            return AuditResult(
-                url=url,
-                audit_date=datetime.now(),
-                overall_score=0,
-                performance_score=0,
-                seo_score=0,
-                accessibility_score=0,
-                security_score=0,
-                issues=[AuditIssue(
+            return self._failed_result(
+                url,
+                AuditIssue(
                     category=IssueCategory.TECHNICAL.value,
                     severity=IssueSeverity.CRITICAL.value,
                     issue_type="audit_error",
                     description=str(e),
                     recommendation="Check URL and try again"
-                )],
+                ),
                 metrics=all_metrics,
+            ), False
+
+    def audit_page(self, url: str, measure_cwv: bool = True) -> AuditResult:
+        """
+        Perform technical audit on a single page.
+
+        Args:
+            url: URL to audit
+            measure_cwv: Whether to measure Core Web Vitals (adds ~5s to audit)
+
+        Returns:
+            AuditResult with findings
+        """
+        # Playwright can't run in an asyncio loop (NiceGUI dashboard): no
+        # browser means an HTTP-only audit
+        handle = self._launch_browser()
+        try:
+            result, completed = self._audit_url(
+                url, measure_cwv, browser=handle.browser if handle else None
             )
+        finally:
+            close_browser(handle)
+
+        # Save to database
+        if completed and self.engine:
+            try:
+                with Session(self.engine) as session:
+                    self._save_audit(session, result)
+            except Exception as e:
+                logger.error(f"Error saving audit for {url}: {e}")
+
+        return result
 
-    def run(self, urls: List[str]) -> Dict[str, Any]:
+    def run(
+        self,
+        urls: List[str],
+        max_workers: Optional[int] = None,
+        measure_cwv: bool = True,
+    ) -> Dict[str, Any]:
         """
         Run technical audit for multiple URLs.
 
+        URLs are audited concurrently on max_workers browsers (one context
+        per URL, at most one URL per domain in flight); finished audits are
+        saved in batches by a background writer.
+
         Args:
             urls: List of URLs to audit
+            max_workers: Concurrent audits (default AUDIT_WORKERS)
+            measure_cwv: Whether to measure Core Web Vitals
 
         Returns:
             dict: Results summary
@@ -1220,14 +1361,37 @@ class TechnicalAuditor(BaseScraper):
         }
 
         scores = []
+        task_lock = threading.Lock()
+        writer = None
+        if self.engine:
+            writer = BatchWriter(self._save_audits, name="technical_audits", batch_size=AUDIT_SAVE_BATCH_SIZE)
 
         with task_logger.log_task("technical_auditor", "audit", {"url_count": len(urls)}) as task:
-            for url in urls:
-                task.increment_processed()
+            def audit(handle, url):
+                with task_lock:
+                    task.increment_processed()
 
-                result = self.audit_page(url)
+                result, completed = self._audit_url(
+                    url, measure_cwv, browser=handle.browser if handle else None
+                )
+                if completed and writer is not None:
+                    writer.put(result)
+                return result
+
+            try:
+                audit_results = run_by_domain(
+                    urls,
+                    audit,
+                    max_workers=max_workers or AUDIT_WORKERS,
+                    worker_setup=self._launch_browser,
+                    worker_teardown=close_browser,
+                )
+            finally:
+                if writer is not None:
+                    writer.close()
 
-                if result.overall_score > 0:
+            for result in audit_results:
+                if result is not None and result.overall_score > 0:
                     results["successful"] += 1
                     scores.append(result.overall_score)
                     results["critical_issues"] += len(result.critical_issues)
@@ -1238,6 +1402,8 @@ class TechnicalAuditor(BaseScraper):
 
         if scores:
             results["average_score"] = sum(scores) / len(scores)
+        if writer is not None:
+            results["db_writer"] = writer.get_stats()
 
         logger.info(
             f"Audit run complete: {results['successful']}/{results['total_urls']} "
@@ -32,11 +32,12 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from seo_intelligence.scrapers.base_selenium_scraper import BaseSeleniumScraper
 from seo_intelligence.services import get_task_logger, get_change_manager, get_cwv_metrics_service
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Load environment
@@ -151,7 +152,7 @@ class TechnicalAuditorSelenium(BaseSeleniumScraper):
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database storage disabled")
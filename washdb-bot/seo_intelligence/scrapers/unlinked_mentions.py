@@ -14,17 +14,18 @@ Usage:
 import os
 import re
 import json
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from bs4 import BeautifulSoup
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from seo_intelligence.services import get_task_logger
-from seo_intelligence.services.governance import propose_change, ChangeType
+from seo_intelligence.services.governance import propose_changes, ChangeType
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Load environment
@@ -100,7 +101,7 @@ class UnlinkedMentionsFinder:
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database operations disabled")
@@ -324,18 +325,19 @@ class UnlinkedMentionsFinder:
         self,
         session: Session,
         mention: UnlinkedMention
-    ) -> Optional[int]:
+    ) -> Dict[str, Any]:
         """
-        Propose unlinked mention for governance review.
+        Prepare an unlinked mention for governance review.
 
-        Uses change_log governance workflow instead of direct insertion.
+        Uses change_log governance workflow instead of direct insertion;
+        find_mentions() proposes a scan's mentions with one propose_changes().
 
         Args:
             session: Database session
             mention: Unlinked mention data
 
         Returns:
-            change_id if proposed successfully
+            Change dict for propose_changes()
         """
         # First, ensure page_audits entry exists
         audit_result = session.execute(
@@ -404,22 +406,19 @@ class UnlinkedMentionsFinder:
             'metadata': issue_metadata
         }
 
-        # Propose change through governance
-        change_id = propose_change(
-            table_name='audit_issues',
-            operation='insert',
-            proposed_data=proposed_data,
-            change_type=ChangeType.UNLINKED_MENTIONS,
-            source='unlinked_mentions_finder',
-            reason=f"Unlinked mention discovered: '{mention.brand_term}' on {mention.source_domain}",
-            metadata={
+        # Change for the governance batch
+        return {
+            'table_name': 'audit_issues',
+            'operation': 'insert',
+            'proposed_data': proposed_data,
+            'change_type': ChangeType.UNLINKED_MENTIONS,
+            'source': 'unlinked_mentions_finder',
+            'reason': f"Unlinked mention discovered: '{mention.brand_term}' on {mention.source_domain}",
+            'metadata': {
                 'page_url': mention.page_url,
                 'mention_count': mention.mention_count
-            }
-        )
-
-        logger.debug(f"Proposed mention: {mention.brand_term} on {mention.source_domain} (change_id={change_id})")
-        return change_id
+            },
+        }
 
     def find_mentions(
         self,
@@ -442,6 +441,7 @@ class UnlinkedMentionsFinder:
 
         limit = limit or self.max_pages_per_run
         all_mentions = []
+        proposals: List[Dict[str, Any]] = []
 
         # Start task logging
         task_id = None
@@ -513,8 +513,8 @@ class UnlinkedMentionsFinder:
                                     page_id=page.get('page_id')
                                 )
 
-                                # Save to database
-                                self._save_mention(session, mention)
+                                # Queue for governance review
+                                proposals.append(self._save_mention(session, mention))
                                 all_mentions.append(mention)
 
                                 logger.info(
@@ -522,6 +522,11 @@ class UnlinkedMentionsFinder:
                                     f"({mention.mention_count} times)"
                                 )
 
+                # Propose all mentions from this scan in one batch
+                if proposals:
+                    change_ids = propose_changes(proposals)
+                    logger.info(f"Proposed {len(change_ids)} unlinked mentions for review")
+
                 # Complete task logging
                 if self.task_logger and task_id:
                     self.task_logger.complete_task(
@@ -11,6 +11,7 @@ Features:
 - Prefetch buffer for steady throughput
 - Rate limiting and error handling
 - Live status updates for dashboard
+- Profiler commands over the status socket (runner.profiler)
 
 Usage:
     python seo_intelligence/seo_worker_service.py
@@ -30,13 +31,15 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
+from runner.profiler import handle_profile_command, install_profiler, is_profile_command, trace_target
 
 load_dotenv()
 
@@ -121,7 +124,7 @@ class SEOWorkerService:
         if not database_url:
             raise RuntimeError("DATABASE_URL not set")
 
-        self.engine = create_engine(database_url, echo=False)
+        self.engine = get_engine(database_url)
         self.Session = sessionmaker(bind=self.engine)
 
         # Audit queue
@@ -130,6 +133,7 @@ class SEOWorkerService:
         # Status socket
         self.status_socket: Optional[socket.socket] = None
         self.status_connections: List[socket.socket] = []
+        self._status_buffers: Dict[socket.socket, bytes] = {}
 
         # Threads
         self._prefetch_thread: Optional[threading.Thread] = None
@@ -166,6 +170,9 @@ class SEOWorkerService:
         # Setup status socket
         self._setup_status_socket()
 
+        # Sampling profiler: SIGUSR2 or {"command": "profile"} on the status socket
+        install_profiler("seo_worker")
+
         # Save PID
         with open(PID_FILE, 'w') as f:
             f.write(str(os.getpid()))
@@ -255,9 +262,11 @@ class SEOWorkerService:
 
                 status_json = json.dumps(asdict(status)) + "\n"
 
-                # Broadcast to all connections
-                dead_conns = []
+                # Answer profiler commands, then broadcast to all connections
+                dead_conns = [conn for conn in self.status_connections if not self._handle_status_commands(conn)]
                 for conn in self.status_connections:
+                    if conn in dead_conns:
+                        continue
                     try:
                         conn.sendall(status_json.encode('utf-8'))
                     except:
@@ -266,6 +275,7 @@ class SEOWorkerService:
                 # Remove dead connections
                 for conn in dead_conns:
                     self.status_connections.remove(conn)
+                    self._status_buffers.pop(conn, None)
                     try:
                         conn.close()
                     except:
@@ -277,6 +287,38 @@ class SEOWorkerService:
                 logger.error(f"Status loop error: {e}")
                 time.sleep(1.0)
 
+    def _handle_status_commands(self, conn: socket.socket) -> bool:
+        """
+        Answer profiler commands sent by a status client (one JSON object per line).
+
+        Args:
+            conn: Non-blocking client connection
+
+        Returns:
+            False if the client has disconnected
+        """
+        try:
+            data = conn.recv(4096)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+        if not data:
+            return False
+
+        *lines, self._status_buffers[conn] = (self._status_buffers.get(conn, b"") + data).split(b"\n")
+        for line in lines:
+            try:
+                request = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if is_profile_command(request):
+                try:
+                    conn.sendall((json.dumps(handle_profile_command(request)) + "\n").encode('utf-8'))
+                except OSError:
+                    return False
+        return True
+
     def _prefetch_loop(self):
         """Continuously prefetch companies from database."""
         global service_stats
@@ -373,18 +415,19 @@ class SEOWorkerService:
 
                 # Run audit
                 try:
-                    if self.auditor:
-                        result = self._run_audit(company)
-                        if result:
-                            self._save_audit_result(company, result)
-                            service_stats['audits_completed'] += 1
-                            logger.info(f"Audit complete: {company.name} - Score: {result.get('overall_score', 'N/A')}")
-                    else:
-                        # Fallback: simple audit without full auditor
-                        result = self._simple_audit(company)
-                        if result:
-                            self._save_simple_audit(company, result)
-                            service_stats['audits_completed'] += 1
+                    with trace_target(f"company:{company.id}:{company.domain or company.name}"):
+                        if self.auditor:
+                            result = self._run_audit(company)
+                            if result:
+                                self._save_audit_result(company, result)
+                                service_stats['audits_completed'] += 1
+                                logger.info(f"Audit complete: {company.name} - Score: {result.get('overall_score', 'N/A')}")
+                        else:
+                            # Fallback: simple audit without full auditor
+                            result = self._simple_audit(company)
+                            if result:
+                                self._save_simple_audit(company, result)
+                                service_stats['audits_completed'] += 1
 
                 except Exception as e:
                     logger.error(f"Audit error for {company.name}: {e}")
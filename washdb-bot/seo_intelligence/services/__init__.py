@@ -17,12 +17,14 @@ This module contains core services:
 - entity_matcher: Entity deduplication and matching
 - url_canonicalizer: URL normalization and tracking parameter removal
 - cwv_metrics: Core Web Vitals thresholds and scoring
+- text_profile: Shared per-page tokenization and text statistics cache
 - readability_analyzer: Text readability scoring (Flesch-Kincaid, etc.)
 - volume_estimator: SERP-based search volume estimation
 - difficulty_calculator: Keyword difficulty from competition analysis
 - opportunity_analyzer: Keyword opportunity prioritization
 - topic_clusterer: Semantic keyword grouping and content pillar generation
 - content_gap_analyzer: Content opportunity detection vs competitors
+- topic_index: Incremental inverted topic index for content gap analysis
 - backlink_gap_analyzer: Backlink opportunity identification
 - keyword_gap_analyzer: Competitor keyword gap analysis
 - engagement_analyzer: Page engagement metrics and UX signals
@@ -33,8 +35,8 @@ All services support ethical scraping with rate limiting and robots.txt complian
 """
 
 from .task_logger import TaskLogger, get_task_logger
-from .rate_limiter import RateLimiter, get_rate_limiter, TIER_CONFIGS
-from .robots_checker import RobotsChecker, get_robots_checker
+from .rate_limiter import RateLimiter, RateLimitStore, get_rate_limiter, TIER_CONFIGS
+from .robots_checker import RobotsChecker, RobotsStore, get_robots_checker
 from .content_hasher import ContentHasher, get_content_hasher
 from .user_agent_rotator import UserAgentRotator, get_user_agent_rotator, DeviceType
 from .proxy_manager import ProxyManager, get_proxy_manager
@@ -70,6 +72,11 @@ from .cwv_metrics import (
     CWV_THRESHOLDS,
     get_cwv_metrics_service
 )
+from .text_profile import (
+    TextProfile,
+    TextProfiler,
+    get_text_profiler
+)
 from .readability_analyzer import (
     ReadabilityAnalyzer,
     ReadabilityResult,
@@ -102,9 +109,15 @@ from .topic_clusterer import (
 from .content_gap_analyzer import (
     ContentGapAnalyzer,
     ContentGap,
+    ContentPage,
     GapType,
     get_content_gap_analyzer
 )
+from .topic_index import (
+    TopicIndex,
+    IndexedPage,
+    get_topic_index
+)
 from .backlink_gap_analyzer import (
     BacklinkGapAnalyzer,
     BacklinkOpportunity,
@@ -151,9 +164,11 @@ __all__ = [
     "TaskLogger",
     "get_task_logger",
     "RateLimiter",
+    "RateLimitStore",
     "get_rate_limiter",
     "TIER_CONFIGS",
     "RobotsChecker",
+    "RobotsStore",
     "get_robots_checker",
     "ContentHasher",
     "get_content_hasher",
@@ -202,6 +217,9 @@ __all__ = [
     "CWVRating",
     "CWV_THRESHOLDS",
     "get_cwv_metrics_service",
+    "TextProfile",
+    "TextProfiler",
+    "get_text_profiler",
     "ReadabilityAnalyzer",
     "ReadabilityResult",
     "get_readability_analyzer",
@@ -224,8 +242,12 @@ __all__ = [
     "get_topic_clusterer",
     "ContentGapAnalyzer",
     "ContentGap",
+    "ContentPage",
     "GapType",
     "get_content_gap_analyzer",
+    "TopicIndex",
+    "IndexedPage",
+    "get_topic_index",
     "BacklinkGapAnalyzer",
     "BacklinkOpportunity",
     "LinkType",
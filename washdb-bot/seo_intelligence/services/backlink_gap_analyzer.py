@@ -578,7 +578,8 @@ class BacklinkGapAnalyzer:
         if not opportunities:
             return
 
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
+        from db.engine_registry import get_engine
         from dotenv import load_dotenv
         import os
 
@@ -589,7 +590,7 @@ class BacklinkGapAnalyzer:
             self.logger.warning("DATABASE_URL not set, skipping save")
             return
 
-        engine = create_engine(db_url)
+        engine = get_engine(db_url)
 
         insert_sql = text("""
             INSERT INTO backlink_gaps (
@@ -16,9 +16,10 @@ from datetime import datetime
 from enum import Enum
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Load environment
@@ -26,6 +27,9 @@ load_dotenv()
 
 logger = get_logger("change_manager")
 
+# Rows per multi-row INSERT / ANY(...) statement in batch operations
+BATCH_SIZE = 1000
+
 
 class ChangeStatus(Enum):
     """Status of a proposed change."""
@@ -61,7 +65,7 @@ class ChangeManager:
         """Initialize change manager."""
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - database operations disabled")
@@ -142,6 +146,77 @@ class ChangeManager:
             logger.error(f"Error proposing change: {e}")
             return None
 
+    def propose_changes(self, changes: List[Dict[str, Any]]) -> List[int]:
+        """
+        Propose many changes using multi-row inserts.
+
+        Each change dict takes the same keys as propose_change(); missing
+        optional keys use the same defaults. Every change still gets its own
+        change_log row.
+
+        Args:
+            changes: Change dictionaries
+
+        Returns:
+            list: Change log IDs in input order (empty on failure)
+        """
+        if not self.engine:
+            logger.warning("Cannot propose changes - database not configured")
+            return []
+
+        if not changes:
+            return []
+
+        change_ids: List[int] = []
+
+        try:
+            with Session(self.engine) as session:
+                for start in range(0, len(changes), BATCH_SIZE):
+                    batch = changes[start:start + BATCH_SIZE]
+                    values = []
+                    params: Dict[str, Any] = {}
+
+                    for i, change in enumerate(batch):
+                        values.append(
+                            f"(:change_type_{i}, :entity_type_{i}, :entity_id_{i}, "
+                            f"CAST(:proposed_value_{i} AS jsonb), CAST(:current_value_{i} AS jsonb), "
+                            f":reason_{i}, :priority_{i}, :source_{i}, 'pending', "
+                            f"CAST(:metadata_{i} AS jsonb))"
+                        )
+                        params.update({
+                            f"change_type_{i}": change["change_type"],
+                            f"entity_type_{i}": change["entity_type"],
+                            f"entity_id_{i}": change.get("entity_id"),
+                            f"proposed_value_{i}": json.dumps(change.get("proposed_value") or {}),
+                            f"current_value_{i}": json.dumps(change.get("current_value") or {}),
+                            f"reason_{i}": change.get("reason", ""),
+                            f"priority_{i}": change.get("priority", "medium"),
+                            f"source_{i}": change.get("source", "seo_intelligence"),
+                            f"metadata_{i}": json.dumps(change.get("metadata") or {}),
+                        })
+
+                    result = session.execute(
+                        text(f"""
+                            INSERT INTO change_log (
+                                change_type, entity_type, entity_id,
+                                proposed_value, current_value, reason,
+                                priority, source, status, metadata
+                            ) VALUES {', '.join(values)}
+                            RETURNING change_id
+                        """),
+                        params
+                    )
+                    change_ids.extend(row[0] for row in result)
+
+                session.commit()
+
+            logger.info(f"Proposed {len(change_ids)} changes")
+            return change_ids
+
+        except Exception as e:
+            logger.error(f"Error proposing {len(changes)} changes: {e}")
+            return []
+
     def get_pending_changes(
         self,
         change_type: Optional[str] = None,
@@ -262,6 +337,103 @@ class ChangeManager:
             logger.error(f"Error approving change {change_id}: {e}")
             return False
 
+    def approve_changes(
+        self,
+        change_ids: List[int],
+        reviewer: str = "admin",
+        notes: str = "",
+    ) -> List[int]:
+        """
+        Approve many pending changes in set-based statements.
+
+        Args:
+            change_ids: IDs of the changes to approve
+            reviewer: Name/ID of the reviewer
+            notes: Optional reviewer notes
+
+        Returns:
+            list: IDs that were pending and are now approved
+        """
+        return self._transition_many(
+            change_ids,
+            """
+                UPDATE change_log
+                SET status = 'approved',
+                    reviewed_at = NOW(),
+                    reviewed_by = :reviewer,
+                    review_notes = :notes
+                WHERE change_id = ANY(:change_ids)
+                AND status = 'pending'
+                RETURNING change_id
+            """,
+            {"reviewer": reviewer, "notes": notes},
+            "approved",
+        )
+
+    def mark_applied_many(
+        self,
+        change_ids: List[int],
+        result_notes: str = "",
+    ) -> List[int]:
+        """
+        Mark many approved changes as applied.
+
+        Args:
+            change_ids: IDs of the changes
+            result_notes: Notes about the application result
+
+        Returns:
+            list: IDs that were approved and are now applied
+        """
+        return self._transition_many(
+            change_ids,
+            """
+                UPDATE change_log
+                SET status = 'applied',
+                    applied_at = NOW(),
+                    result_notes = :notes
+                WHERE change_id = ANY(:change_ids)
+                AND status = 'approved'
+                RETURNING change_id
+            """,
+            {"notes": result_notes},
+            "applied",
+        )
+
+    def _transition_many(
+        self,
+        change_ids: List[int],
+        sql: str,
+        params: Dict[str, Any],
+        label: str,
+    ) -> List[int]:
+        """Run a status transition over change_ids in chunks; return updated IDs."""
+        if not self.engine or not change_ids:
+            return []
+
+        updated: List[int] = []
+
+        try:
+            with Session(self.engine) as session:
+                for start in range(0, len(change_ids), BATCH_SIZE):
+                    result = session.execute(
+                        text(sql),
+                        {**params, "change_ids": list(change_ids[start:start + BATCH_SIZE])}
+                    )
+                    updated.extend(row[0] for row in result)
+                session.commit()
+
+        except Exception as e:
+            logger.error(f"Error marking {len(change_ids)} changes as {label}: {e}")
+            return []
+
+        skipped = len(change_ids) - len(updated)
+        logger.info(
+            f"{len(updated)} changes {label}"
+            + (f" ({skipped} not found or in wrong status)" if skipped else "")
+        )
+        return updated
+
     def reject_change(
         self,
         change_id: int,
@@ -23,7 +23,6 @@ Usage:
 Results stored in content_analysis database table.
 """
 
-import re
 import json
 from collections import Counter, defaultdict
 from typing import Dict, Any, Optional, List, Set, Tuple
@@ -32,6 +31,7 @@ from datetime import datetime
 from enum import Enum
 
 from runner.logging_setup import get_logger
+from seo_intelligence.services.text_profile import STOP_WORDS, get_text_profiler
 
 
 class GapType(Enum):
@@ -106,15 +106,7 @@ class ContentGapAnalyzer:
     """
 
     # Stop words for topic extraction
-    STOP_WORDS = {
-        "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
-        "it", "its", "this", "that", "these", "those", "i", "you", "he", "she",
-        "we", "they", "what", "which", "who", "whom", "all", "each", "every",
-        "no", "not", "only", "own", "same", "so", "than", "too", "very",
-        "can", "will", "just", "don", "should", "now", "your", "our", "my",
-        "their", "his", "her", "have", "has", "had", "do", "does", "did",
-    }
+    STOP_WORDS = STOP_WORDS
 
     # Content format indicators
     FORMAT_INDICATORS = {
@@ -129,6 +121,7 @@ class ContentGapAnalyzer:
     def __init__(self):
         """Initialize content gap analyzer."""
         self.logger = get_logger("content_gap_analyzer")
+        self.profiler = get_text_profiler()
 
     def _tokenize(self, text: str) -> List[str]:
         """
@@ -140,8 +133,7 @@ class ContentGapAnalyzer:
         Returns:
             list: Words
         """
-        words = re.findall(r'\b[a-z]+\b', text.lower())
-        return [w for w in words if w not in self.STOP_WORDS and len(w) > 2]
+        return list(self.profiler.profile_text(text).terms)
 
     def _extract_topics(self, content: str, n_topics: int = 20) -> List[str]:
         """
@@ -154,18 +146,11 @@ class ContentGapAnalyzer:
         Returns:
             list: Top topics
         """
-        words = self._tokenize(content)
-
-        # Get word frequencies
-        word_counts = Counter(words)
-
-        # Also extract 2-grams
-        bigrams = []
-        for i in range(len(words) - 1):
-            bigram = f"{words[i]} {words[i+1]}"
-            bigrams.append(bigram)
+        profile = self.profiler.profile_text(content)
 
-        bigram_counts = Counter(bigrams)
+        # Word and 2-gram frequencies from the shared page profile
+        word_counts = profile.term_counts
+        bigram_counts = profile.bigram_counts
 
         # Combine with bigrams weighted higher
         all_topics = []
@@ -205,29 +190,7 @@ class ContentGapAnalyzer:
         Returns:
             list: Heading texts
         """
-        headings = []
-
-        # Look for markdown-style headings
-        md_headings = re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
-        headings.extend(md_headings)
-
-        # Look for HTML headings
-        html_headings = re.findall(r'<h[1-6][^>]*>([^<]+)</h[1-6]>', content, re.IGNORECASE)
-        headings.extend(html_headings)
-
-        # Look for title-case lines that might be headings
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if (10 < len(line) < 100 and
-                line[0].isupper() and
-                not line.endswith('.') and
-                line.count(' ') < 10):
-                # Might be a heading
-                if not any(h.lower() == line.lower() for h in headings):
-                    headings.append(line)
-
-        return headings[:30]  # Limit to top 30
+        return list(self.profiler.profile_text(content).headings)
 
     def _detect_content_formats(self, content: str) -> List[str]:
         """
@@ -239,7 +202,7 @@ class ContentGapAnalyzer:
         Returns:
             list: Detected formats
         """
-        content_lower = content.lower()
+        content_lower = self.profiler.profile_text(content).lower
         detected_formats = []
 
         for format_type, indicators in self.FORMAT_INDICATORS.items():
@@ -265,7 +228,9 @@ class ContentGapAnalyzer:
         Returns:
             dict: Topic -> coverage score (0-100)
         """
-        content_lower = content.lower()
+        profile = self.profiler.profile_text(content)
+        content_lower = profile.lower
+        headings_lower = profile.headings_lower
         coverage = {}
 
         for topic in topics:
@@ -275,9 +240,8 @@ class ContentGapAnalyzer:
             count = content_lower.count(topic_lower)
 
             # Check in headings (weighted higher)
-            headings = self._extract_headings(content)
             heading_mentions = sum(
-                1 for h in headings if topic_lower in h.lower()
+                1 for h in headings_lower if topic_lower in h
             )
 
             # Calculate coverage score
@@ -331,15 +295,16 @@ class ContentGapAnalyzer:
         Returns:
             ContentPage: Analyzed page
         """
+        profile = self.profiler.profile_text(content)
         topics = self._extract_topics(content)
         headings = self._extract_headings(content)
-        keywords = self._tokenize(content)[:50]
+        keywords = profile.terms[:50]
 
         return ContentPage(
             url=url,
             title=title,
             content=content,
-            word_count=len(content.split()),
+            word_count=len(profile.raw_words),
             headings=headings,
             keywords=keywords,
             topics=topics,
@@ -367,10 +332,89 @@ class ContentGapAnalyzer:
             f"{len(competitor_content)} competitors"
         )
 
-        gaps = []
-        gap_num = 0
+        your_topics, your_formats, your_coverage = self._collect_your_content(your_content)
+
+        # Collect competitor topics, inverted to topic -> competitors
+        topic_owners: Dict[str, List[str]] = defaultdict(list)
+        format_owners: Dict[str, List[str]] = defaultdict(list)
+
+        for comp_name, pages in competitor_content.items():
+            comp_topics = set()
+            comp_formats = set()
+
+            for page in pages:
+                comp_topics.update(page.topics)
+                comp_formats.update(self._detect_content_formats(page.content))
+
+            for topic in comp_topics:
+                topic_owners[topic].append(comp_name)
+            for format_type in comp_formats:
+                format_owners[format_type].append(comp_name)
+
+        return self._build_gaps(
+            your_topics, your_formats, your_coverage,
+            topic_owners, format_owners, min_competitor_coverage,
+        )
+
+    def analyze_gaps_from_index(
+        self,
+        your_content: List[ContentPage],
+        topic_index=None,
+        competitors: Optional[List[str]] = None,
+        min_competitor_coverage: int = 2,
+    ) -> List[ContentGap]:
+        """
+        Analyze content gaps using the persistent topic index.
+
+        Competitor topics and formats come from the inverted index kept
+        up to date by the competitor crawler, so competitor pages are not
+        re-read or re-analyzed.
+
+        Args:
+            your_content: Your content pages
+            topic_index: TopicIndex to query (default: shared instance; the
+                requested competitors, or the whole index, are loaded lazily)
+            competitors: Restrict to these competitor domains (default: all indexed)
+            min_competitor_coverage: Minimum competitors needed to flag gap
+
+        Returns:
+            list: ContentGap opportunities
+        """
+        if topic_index is None:
+            from seo_intelligence.services.topic_index import get_topic_index
+            topic_index = get_topic_index()
+            if competitors is not None:
+                topic_index.ensure_owners(competitors)
+            elif not topic_index.loaded:
+                topic_index.load()
+
+        self.logger.info(
+            f"Analyzing gaps from index: {len(your_content)} your pages vs "
+            f"{len(competitors) if competitors is not None else 'all'} competitors"
+        )
+
+        your_topics, your_formats, your_coverage = self._collect_your_content(your_content)
 
-        # Collect your topics
+        return self._build_gaps(
+            your_topics, your_formats, your_coverage,
+            topic_index.topic_owner_map(competitors),
+            topic_index.format_owner_map(competitors),
+            min_competitor_coverage,
+        )
+
+    def _collect_your_content(
+        self,
+        your_content: List[ContentPage],
+    ) -> Tuple[Set[str], Set[str], Dict[str, float]]:
+        """
+        Collect topics, formats and best topic coverage for your pages.
+
+        Args:
+            your_content: Your content pages
+
+        Returns:
+            tuple: (topics, formats, topic -> coverage)
+        """
         your_topics = set()
         your_formats = set()
         your_coverage = defaultdict(float)
@@ -378,43 +422,51 @@ class ContentGapAnalyzer:
         for page in your_content:
             your_topics.update(page.topics)
             your_formats.update(self._detect_content_formats(page.content))
+            coverage = self._calculate_topic_coverage(page.topics, page.content)
             for topic in page.topics:
-                coverage = self._calculate_topic_coverage([topic], page.content)
                 your_coverage[topic] = max(your_coverage[topic], coverage.get(topic, 0))
 
-        # Collect competitor topics
-        competitor_topics = {}
-        competitor_formats = {}
-        all_competitor_topics = Counter()
+        return your_topics, your_formats, your_coverage
 
-        for comp_name, pages in competitor_content.items():
-            comp_topics = set()
-            comp_formats = set()
+    def _build_gaps(
+        self,
+        your_topics: Set[str],
+        your_formats: Set[str],
+        your_coverage: Dict[str, float],
+        topic_owners: Dict[str, List[str]],
+        format_owners: Dict[str, List[str]],
+        min_competitor_coverage: int,
+    ) -> List[ContentGap]:
+        """
+        Build gap list from your coverage and topic/format -> competitors maps.
 
-            for page in pages:
-                comp_topics.update(page.topics)
-                comp_formats.update(self._detect_content_formats(page.content))
+        Args:
+            your_topics: Topics you cover
+            your_formats: Formats you use
+            your_coverage: Your best coverage per topic
+            topic_owners: Topic -> competitors covering it
+            format_owners: Format -> competitors using it
+            min_competitor_coverage: Minimum competitors needed to flag gap
 
-            competitor_topics[comp_name] = comp_topics
-            competitor_formats[comp_name] = comp_formats
+        Returns:
+            list: ContentGap opportunities sorted by opportunity score
+        """
+        gaps = []
+        gap_num = 0
 
-            for topic in comp_topics:
-                all_competitor_topics[topic] += 1
+        # Find missing topics (most widely covered first)
+        ranked_topics = sorted(
+            topic_owners.items(), key=lambda item: len(item[1]), reverse=True
+        )
 
-        # Find missing topics
-        for topic, comp_count in all_competitor_topics.most_common():
+        for topic, comps_with_topic in ranked_topics:
+            comp_count = len(comps_with_topic)
             if comp_count < min_competitor_coverage:
                 continue
 
             if topic not in your_topics:
                 gap_num += 1
 
-                # Identify which competitors have this topic
-                comps_with_topic = [
-                    comp for comp, topics in competitor_topics.items()
-                    if topic in topics
-                ]
-
                 # Calculate opportunity score
                 # More competitors + you don't have it = higher opportunity
                 opportunity = min(100, comp_count * 25)
@@ -439,7 +491,7 @@ class ContentGapAnalyzer:
                     your_coverage=0,
                     opportunity_score=opportunity,
                     keywords=[topic],
-                    competitors_with_content=comps_with_topic,
+                    competitors_with_content=list(comps_with_topic),
                     recommendations=[
                         f"Create comprehensive content about '{topic}'",
                         f"Analyze competitor content for structure ideas",
@@ -452,11 +504,6 @@ class ContentGapAnalyzer:
                 # Shallow coverage gap
                 gap_num += 1
 
-                comps_with_topic = [
-                    comp for comp, topics in competitor_topics.items()
-                    if topic in topics
-                ]
-
                 opportunity = min(100, (100 - your_coverage[topic]) * 0.5 + comp_count * 15)
 
                 gap = ContentGap(
@@ -469,7 +516,7 @@ class ContentGapAnalyzer:
                     your_coverage=int(your_coverage[topic]),
                     opportunity_score=opportunity,
                     keywords=[topic],
-                    competitors_with_content=comps_with_topic,
+                    competitors_with_content=list(comps_with_topic),
                     recommendations=[
                         f"Expand content depth for '{topic}'",
                         f"Add more detailed sections and examples",
@@ -479,15 +526,9 @@ class ContentGapAnalyzer:
                 gaps.append(gap)
 
         # Check for missing content formats
-        all_competitor_formats = set()
-        for formats in competitor_formats.values():
-            all_competitor_formats.update(formats)
-
-        for format_type in all_competitor_formats:
+        for format_type, comps_with_format in format_owners.items():
             if format_type not in your_formats:
-                format_count = sum(
-                    1 for f in competitor_formats.values() if format_type in f
-                )
+                format_count = len(comps_with_format)
 
                 if format_count >= min_competitor_coverage:
                     gap_num += 1
@@ -502,10 +543,7 @@ class ContentGapAnalyzer:
                         your_coverage=0,
                         opportunity_score=min(100, format_count * 20),
                         keywords=[],
-                        competitors_with_content=[
-                            comp for comp, f in competitor_formats.items()
-                            if format_type in f
-                        ],
+                        competitors_with_content=list(comps_with_format),
                         recommendations=[
                             f"Create {format_type.replace('_', ' ')} content",
                             f"This format may improve user engagement",
@@ -688,7 +726,8 @@ class ContentGapAnalyzer:
         if not gaps:
             return
 
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
+        from db.engine_registry import get_engine
         from dotenv import load_dotenv
         import os
 
@@ -699,7 +738,7 @@ class ContentGapAnalyzer:
             self.logger.warning("DATABASE_URL not set, skipping save")
             return
 
-        engine = create_engine(db_url)
+        engine = get_engine(db_url)
 
         insert_sql = text("""
             INSERT INTO content_analysis (
@@ -43,11 +43,26 @@ Usage:
     attempt = quarantine.get_retry_attempt("example.com")
     backoff_seconds = quarantine.get_backoff_delay(attempt)
     time.sleep(backoff_seconds)
+
+Shared state:
+    get_domain_quarantine() backs the in-process state with a SQLite (WAL)
+    store shared by every worker process on the host and surviving
+    restarts (DOMAIN_QUARANTINE_DB, default data/domain_quarantine.db; set
+    to "off" for process-local state). The in-process dicts act as a
+    read-through cache refreshed every sync_interval seconds, so
+    is_quarantined() stays a local dict lookup; its refresh only reads.
+    Quarantines are written through; error events are buffered and written
+    in batches, and writers expire stale rows.
 """
 
+import json
+import os
+import socket
+import sqlite3
 import time
 import threading
-from typing import Optional, Dict, Any, List
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
@@ -58,6 +73,9 @@ from runner.logging_setup import get_logger
 # Singleton instance
 _domain_quarantine = None
 
+# Default shared store location (data/ is not tracked)
+DEFAULT_STORE_PATH = Path(__file__).resolve().parents[2] / "data" / "domain_quarantine.db"
+
 
 class QuarantineReason(Enum):
     """Reasons for domain quarantine."""
@@ -129,6 +147,211 @@ class BackoffSchedule:
     captcha_reset_hours: int = 24
 
 
+class QuarantineStore:
+    """
+    SQLite (WAL mode) store for quarantine state shared across processes.
+
+    Timestamps are stored as Unix epoch seconds. Each process opens its own
+    connection (re-opened after fork); writes are serialized by SQLite.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS quarantines (
+            domain TEXT PRIMARY KEY,
+            reason TEXT NOT NULL,
+            quarantined_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            retry_attempt INTEGER NOT NULL DEFAULT 0,
+            retry_after_seconds INTEGER,
+            metadata TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_quarantines_expires ON quarantines(expires_at);
+
+        CREATE TABLE IF NOT EXISTS domain_state (
+            domain TEXT PRIMARY KEY,
+            retry_attempts INTEGER NOT NULL DEFAULT 0,
+            captcha_count INTEGER NOT NULL DEFAULT 0,
+            last_captcha REAL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_domain_state_updated ON domain_state(updated_at);
+
+        CREATE TABLE IF NOT EXISTS error_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            domain TEXT NOT NULL,
+            ts REAL NOT NULL,
+            reason TEXT NOT NULL,
+            source TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_error_events_ts ON error_events(ts);
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize store.
+
+        Args:
+            path: SQLite database file path (created if missing)
+        """
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+        with self._lock:
+            self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this process's connection (caller holds the lock)."""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _execute(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """Execute one statement and return all rows."""
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def save_quarantine(self, entry: "QuarantineEntry"):
+        """Insert or replace a quarantine entry."""
+        self._execute(
+            """
+            INSERT OR REPLACE INTO quarantines (
+                domain, reason, quarantined_at, expires_at,
+                retry_attempt, retry_after_seconds, metadata
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                entry.domain,
+                entry.reason.value,
+                entry.quarantined_at.timestamp(),
+                entry.expires_at.timestamp(),
+                entry.retry_attempt,
+                entry.retry_after_seconds,
+                json.dumps(entry.metadata, default=str),
+            ),
+        )
+
+    def delete_quarantine(self, domain: str):
+        """Remove a quarantine entry."""
+        self._execute("DELETE FROM quarantines WHERE domain = ?", (domain,))
+
+    def load_active_quarantines(self, now: float) -> List[Tuple]:
+        """Load unexpired quarantines."""
+        return self._execute(
+            """
+            SELECT domain, reason, quarantined_at, expires_at,
+                   retry_attempt, retry_after_seconds, metadata
+            FROM quarantines WHERE expires_at > ?
+            """,
+            (now,),
+        )
+
+    def save_domain_state(
+        self,
+        domain: str,
+        retry_attempts: int,
+        captcha_count: int,
+        last_captcha: Optional[datetime],
+    ):
+        """Insert or replace retry/CAPTCHA state for a domain."""
+        self._execute(
+            """
+            INSERT OR REPLACE INTO domain_state (
+                domain, retry_attempts, captcha_count, last_captcha, updated_at
+            ) VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                domain,
+                retry_attempts,
+                captcha_count,
+                last_captcha.timestamp() if last_captcha else None,
+                time.time(),
+            ),
+        )
+
+    def load_domain_state(self, since: float) -> List[Tuple]:
+        """Load domain state rows updated at or after since."""
+        return self._execute(
+            """
+            SELECT domain, retry_attempts, captcha_count, last_captcha, updated_at
+            FROM domain_state WHERE updated_at >= ?
+            """,
+            (since,),
+        )
+
+    def add_error_events(self, events: List[Tuple[str, float, str, str]]):
+        """Insert (domain, ts, reason, source) error events in one transaction."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT INTO error_events (domain, ts, reason, source) VALUES (?, ?, ?, ?)",
+                    events,
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def load_error_events(self, after_id: int, since: float, exclude_source: str) -> List[Tuple]:
+        """Load other processes' error events newer than after_id."""
+        return self._execute(
+            """
+            SELECT id, domain, ts, reason FROM error_events
+            WHERE id > ? AND ts >= ? AND source != ?
+            ORDER BY id
+            """,
+            (after_id, since, exclude_source),
+        )
+
+    def expire(self, now: float, event_window_seconds: int = 3600):
+        """
+        Expire quarantines (resetting their retry counters) and old events.
+
+        Args:
+            now: Current epoch time
+            event_window_seconds: Error events older than this are deleted
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                conn.execute(
+                    """
+                    UPDATE domain_state SET retry_attempts = 0, updated_at = ?
+                    WHERE domain IN (SELECT domain FROM quarantines WHERE expires_at <= ?)
+                    """,
+                    (now, now),
+                )
+                conn.execute("DELETE FROM quarantines WHERE expires_at <= ?", (now,))
+                conn.execute("DELETE FROM error_events WHERE ts < ?", (now - event_window_seconds,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def clear(self):
+        """Delete all stored state."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                for table in ("quarantines", "domain_state", "error_events"):
+                    conn.execute(f"DELETE FROM {table}")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+
 class DomainQuarantine:
     """
     Domain quarantine service for ethical crawling.
@@ -136,14 +359,28 @@ class DomainQuarantine:
     Tracks problematic domains and enforces exponential backoff.
 
     Thread-safe: Uses threading.Lock for concurrent access.
+
+    With a QuarantineStore, state is shared with other processes: local
+    dicts are refreshed from the store every sync_interval seconds,
+    quarantines and retry/CAPTCHA state are written through, and error
+    events are written in batches.
     """
 
-    def __init__(self, backoff_schedule: Optional[BackoffSchedule] = None):
+    def __init__(
+        self,
+        backoff_schedule: Optional[BackoffSchedule] = None,
+        store: Optional[QuarantineStore] = None,
+        sync_interval: float = 5.0,
+        event_batch_size: int = 20,
+    ):
         """
         Initialize domain quarantine service.
 
         Args:
             backoff_schedule: Custom backoff schedule (uses default if None)
+            store: Shared state store (process-local state if None)
+            sync_interval: Seconds between refreshes from the store
+            event_batch_size: Buffered error events that force a flush
         """
         self.backoff_schedule = backoff_schedule or BackoffSchedule()
         self.logger = get_logger("domain_quarantine")
@@ -151,6 +388,9 @@ class DomainQuarantine:
         # Quarantine storage: domain -> QuarantineEntry
         self._quarantined: Dict[str, QuarantineEntry] = {}
 
+        # Hot-path mirror of expirations: domain -> expires_at (epoch seconds)
+        self._expiry: Dict[str, float] = {}
+
         # Retry attempt tracking: domain -> attempt_count
         self._retry_attempts: Dict[str, int] = {}
 
@@ -164,7 +404,146 @@ class DomainQuarantine:
         # Thread lock for concurrent access (reentrant to allow nested calls)
         self._lock = threading.RLock()
 
-        self.logger.info("DomainQuarantine initialized with progressive backoff")
+        # Shared store state
+        self._store = store
+        self.sync_interval = sync_interval
+        self.event_batch_size = event_batch_size
+        self._pending_events: List[Tuple[str, float, str]] = []
+        self._pending_since = 0.0
+        self._last_event_id = 0
+        self._last_state_sync = 0.0
+        self._next_sync = 0.0
+        self._hostname = socket.gethostname()
+
+        if self._store is not None:
+            self.sync()
+
+        self.logger.info(
+            "DomainQuarantine initialized with progressive backoff"
+            + (f" (shared store: {self._store.path})" if self._store is not None else "")
+        )
+
+    @property
+    def _source(self) -> str:
+        """Identifier for events written by this instance."""
+        return f"{self._hostname}:{os.getpid()}:{id(self)}"
+
+    def _persist(self, method: str, *args):
+        """Call a store method, logging (not raising) failures."""
+        if self._store is None:
+            return
+        try:
+            getattr(self._store, method)(*args)
+        except Exception as e:
+            self.logger.warning(f"Quarantine store {method} failed: {e}")
+
+    def _persist_domain_state(self, domain: str):
+        """Write retry/CAPTCHA state for a domain (caller holds the lock)."""
+        if self._store is None:
+            return
+        history = self._captcha_history.get(domain, {})
+        self._persist(
+            "save_domain_state",
+            domain,
+            self._retry_attempts.get(domain, 0),
+            history.get('count', 0),
+            history.get('last_captcha'),
+        )
+
+    def _flush_events(self):
+        """Write buffered error events (caller holds the lock)."""
+        if self._store is None or not self._pending_events:
+            return
+        source = self._source
+        events = [(domain, ts, reason, source) for domain, ts, reason in self._pending_events]
+        self._pending_events = []
+        self._persist("add_error_events", events)
+
+    def sync(self, write: bool = True):
+        """
+        Refresh local state from the shared store.
+
+        Flushes buffered events, expires stale rows, then reloads active
+        quarantines, changed retry/CAPTCHA state and other processes'
+        recent error events. No-op without a store.
+
+        Args:
+            write: Flush and expire before reloading. The periodic refresh
+                from is_quarantined() passes False so fetch threads only
+                read (and skip the refresh if another thread holds the lock).
+        """
+        if self._store is None:
+            return
+
+        if write:
+            with self._lock:
+                self._sync(write=True)
+        elif self._lock.acquire(blocking=False):
+            try:
+                self._sync(write=False)
+            finally:
+                self._lock.release()
+
+    def _sync(self, write: bool):
+        """Body of sync() (caller holds the lock)."""
+        now = time.time()
+
+        self._next_sync = time.monotonic() + self.sync_interval
+
+        try:
+            if write:
+                self._flush_events()
+                self._store.expire(now)
+            quarantine_rows = self._store.load_active_quarantines(now)
+            state_rows = self._store.load_domain_state(self._last_state_sync - 1.0)
+            event_rows = self._store.load_error_events(
+                self._last_event_id, now - 3600, self._source
+            )
+        except Exception as e:
+            self.logger.warning(f"Quarantine store sync failed: {e}")
+            return
+
+        self._last_state_sync = now
+
+        quarantined = {}
+        for domain, reason, q_at, expires_at, attempt, retry_after, metadata in quarantine_rows:
+            try:
+                reason_enum = QuarantineReason(reason)
+            except ValueError:
+                reason_enum = QuarantineReason.MANUAL
+            quarantined[domain] = QuarantineEntry(
+                domain=domain,
+                reason=reason_enum,
+                quarantined_at=datetime.fromtimestamp(q_at),
+                expires_at=datetime.fromtimestamp(expires_at),
+                retry_attempt=attempt,
+                retry_after_seconds=retry_after,
+                metadata=json.loads(metadata) if metadata else {},
+            )
+        self._quarantined = quarantined
+        self._expiry = {
+            domain: entry.expires_at.timestamp() for domain, entry in quarantined.items()
+        }
+
+        for domain, retry_attempts, captcha_count, last_captcha, _updated in state_rows:
+            if retry_attempts:
+                self._retry_attempts[domain] = retry_attempts
+            else:
+                self._retry_attempts.pop(domain, None)
+
+            if captcha_count:
+                self._captcha_history[domain] = {
+                    'count': captcha_count,
+                    'last_captcha': datetime.fromtimestamp(last_captcha) if last_captcha else None,
+                }
+            else:
+                self._captcha_history.pop(domain, None)
+
+        for event_id, domain, ts, reason in event_rows:
+            self._error_events.setdefault(domain, []).append(
+                (datetime.fromtimestamp(ts), reason)
+            )
+            self._last_event_id = max(self._last_event_id, event_id)
 
     def _normalize_domain(self, domain: str) -> str:
         """Normalize domain (lowercase, strip www)."""
@@ -183,6 +562,7 @@ class DomainQuarantine:
 
         for domain in expired:
             del self._quarantined[domain]
+            self._expiry.pop(domain, None)
             # Reset retry attempt counter on expiration
             self._retry_attempts.pop(domain, None)
             self.logger.info(f"Quarantine expired for {domain}")
@@ -317,9 +697,19 @@ class DomainQuarantine:
         """
         domain = self._normalize_domain(domain)
 
+        if self._store is not None and time.monotonic() >= self._next_sync:
+            self.sync(write=False)
+
+        # Hot path: lock-free dict lookup
+        expires_at = self._expiry.get(domain)
+        if expires_at is None:
+            return False
+        if expires_at > time.time():
+            return True
+
         with self._lock:
             self._cleanup_expired_quarantines()
-            return domain in self._quarantined
+        return False
 
     def get_quarantine_entry(self, domain: str) -> Optional[QuarantineEntry]:
         """
@@ -406,6 +796,9 @@ class DomainQuarantine:
         """
         domain = self._normalize_domain(domain)
 
+        # Pick up other processes' CAPTCHA history/retry state first
+        self.sync()
+
         # Parse reason
         try:
             reason_enum = QuarantineReason(reason)
@@ -474,10 +867,15 @@ class DomainQuarantine:
             )
 
             self._quarantined[domain] = entry
+            self._expiry[domain] = expires_at.timestamp()
 
             # Increment retry attempt
             self._retry_attempts[domain] = attempt + 1
 
+            # Share with other processes
+            self._persist("save_quarantine", entry)
+            self._persist_domain_state(domain)
+
             # Build log message
             duration_str = f"{duration_minutes}m"
             if duration_minutes >= 60:
@@ -517,6 +915,17 @@ class DomainQuarantine:
 
             self._error_events[domain].append((datetime.now(), reason))
 
+            # Buffer for the shared store
+            if self._store is not None:
+                now = time.time()
+                if not self._pending_events:
+                    self._pending_since = now
+                self._pending_events.append((domain, now, reason))
+                if (len(self._pending_events) >= self.event_batch_size
+                        or now - self._pending_since >= self.sync_interval):
+                    self._flush_events()
+                    self._persist("expire", now)
+
             # Check for repeated 429s (3+ in 1 hour)
             if reason == "429":
                 recent_429s = [
@@ -567,7 +976,10 @@ class DomainQuarantine:
         with self._lock:
             if domain in self._quarantined:
                 del self._quarantined[domain]
+                self._expiry.pop(domain, None)
                 self._retry_attempts.pop(domain, None)
+                self._persist("delete_quarantine", domain)
+                self._persist_domain_state(domain)
                 self.logger.info(f"Released quarantine for {domain}")
             else:
                 self.logger.warning(f"Domain not quarantined: {domain}")
@@ -586,6 +998,7 @@ class DomainQuarantine:
         with self._lock:
             if domain in self._retry_attempts:
                 del self._retry_attempts[domain]
+                self._persist_domain_state(domain)
                 self.logger.debug(f"Reset retry attempts for {domain}")
 
     def get_quarantined_domains(self) -> List[QuarantineEntry]:
@@ -640,9 +1053,12 @@ class DomainQuarantine:
         """Clear all quarantine data (for testing/reset)."""
         with self._lock:
             self._quarantined.clear()
+            self._expiry.clear()
             self._retry_attempts.clear()
             self._error_events.clear()
             self._captcha_history.clear()
+            self._pending_events = []
+            self._persist("clear")
             self.logger.info("Cleared all quarantine data")
 
     def reset_captcha_history(self, domain: Optional[str] = None):
@@ -657,9 +1073,13 @@ class DomainQuarantine:
                 domain = self._normalize_domain(domain)
                 if domain in self._captcha_history:
                     del self._captcha_history[domain]
+                    self._persist_domain_state(domain)
                     self.logger.info(f"Reset CAPTCHA history for {domain}")
             else:
+                domains = list(self._captcha_history)
                 self._captcha_history.clear()
+                for name in domains:
+                    self._persist_domain_state(name)
                 self.logger.info("Reset CAPTCHA history for all domains")
 
 
@@ -667,12 +1087,24 @@ def get_domain_quarantine() -> DomainQuarantine:
     """
     Get singleton DomainQuarantine instance.
 
+    The singleton uses the shared store at DOMAIN_QUARANTINE_DB (default
+    data/domain_quarantine.db); set it to "off" for process-local state.
+
     Returns:
         DomainQuarantine instance
     """
     global _domain_quarantine
 
     if _domain_quarantine is None:
-        _domain_quarantine = DomainQuarantine()
+        store = None
+        store_path = os.getenv("DOMAIN_QUARANTINE_DB", str(DEFAULT_STORE_PATH))
+        if store_path and store_path.lower() not in ("off", "none", "memory", ":memory:"):
+            try:
+                store = QuarantineStore(store_path)
+            except Exception as e:
+                get_logger("domain_quarantine").warning(
+                    f"Shared quarantine store unavailable ({e}); using process-local state"
+                )
+        _domain_quarantine = DomainQuarantine(store=store)
 
     return _domain_quarantine
@@ -29,6 +29,7 @@ from datetime import datetime
 
 from runner.logging_setup import get_logger
 from db.database_manager import get_db_manager
+from seo_intelligence.services.text_profile import get_text_profiler
 
 
 class EngagementLevel(Enum):
@@ -171,6 +172,7 @@ class EngagementAnalyzer:
         """Initialize the engagement analyzer."""
         self.logger = get_logger("engagement_analyzer")
         self.db = get_db_manager()
+        self.profiler = get_text_profiler()
 
         # Compile CTA patterns
         self.cta_regex = re.compile(
@@ -197,9 +199,9 @@ class EngagementAnalyzer:
         """
         signals = EngagementSignals()
 
-        # Word count
-        words = text_content.split()
-        signals.word_count = len(words)
+        # Word count (shared page tokenization)
+        profile = self.profiler.profile_text(text_content)
+        signals.word_count = len(profile.raw_words)
 
         # Paragraph count
         paragraphs = re.findall(r'<p[^>]*>', html_content, re.IGNORECASE)
@@ -280,7 +282,7 @@ class EngagementAnalyzer:
             ContentType: Detected type
         """
         url_lower = url.lower()
-        text_lower = text_content.lower()
+        text_lower = self.profiler.profile_text(text_content).lower
 
         # URL-based detection
         if '/blog/' in url_lower or '/post/' in url_lower or '/article/' in url_lower:
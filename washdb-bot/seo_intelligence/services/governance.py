@@ -26,14 +26,16 @@ Usage:
 
 import os
 import json
-from typing import Dict, List, Optional, Any
+from itertools import groupby
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Load environment
@@ -41,6 +43,27 @@ load_dotenv()
 
 logger = get_logger("seo_governance")
 
+# Rows per multi-row INSERT / ANY(...) statement in batch operations
+BATCH_SIZE = 1000
+
+# Standard primary key naming convention (fallback when the catalog lookup
+# is unavailable)
+PRIMARY_KEY_COLUMNS = {
+    'search_queries': 'query_id',
+    'serp_snapshots': 'snapshot_id',
+    'serp_results': 'result_id',
+    'serp_paa': 'paa_id',
+    'competitors': 'competitor_id',
+    'competitor_pages': 'page_id',
+    'backlinks': 'backlink_id',
+    'referring_domains': 'domain_id',
+    'citations': 'citation_id',
+    'page_audits': 'audit_id',
+    'audit_issues': 'issue_id',
+    'change_log': 'change_id',
+    'task_logs': 'task_id'
+}
+
 
 class ChangeType(str, Enum):
     """Standard change type vocabulary for SEO intelligence."""
@@ -79,11 +102,14 @@ class SEOGovernanceService:
         # Database connection
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - governance operations disabled")
 
+        # Table name -> primary key column (resolved once per table)
+        self._pk_cache: Dict[str, str] = {}
+
         logger.info("SEOGovernanceService initialized")
 
     def propose_change(
@@ -178,6 +204,84 @@ class SEOGovernanceService:
             logger.error(f"Error proposing change: {e}", exc_info=True)
             return None
 
+    def propose_changes(self, changes: List[Dict[str, Any]]) -> List[int]:
+        """
+        Propose many changes using multi-row inserts.
+
+        Each change dict takes the same keys as propose_change() (table_name,
+        operation, proposed_data, change_type, source and optionally
+        record_id, metadata, reason). Every change still gets its own
+        change_log row.
+
+        Args:
+            changes: Change dictionaries
+
+        Returns:
+            List of change_ids in input order (empty on failure)
+        """
+        if not self.engine:
+            logger.error("Cannot propose changes - database not configured")
+            return []
+
+        if not changes:
+            return []
+
+        change_ids: List[int] = []
+
+        try:
+            with Session(self.engine) as session:
+                for start in range(0, len(changes), BATCH_SIZE):
+                    batch = changes[start:start + BATCH_SIZE]
+                    values = []
+                    params: Dict[str, Any] = {"status": ChangeStatus.PENDING.value}
+
+                    for i, change in enumerate(batch):
+                        change_type = change['change_type']
+                        values.append(
+                            f"(:table_name_{i}, :operation_{i}, :record_id_{i}, "
+                            f":proposed_data_{i}, :change_type_{i}, :source_{i}, "
+                            f":status, NOW(), :metadata_{i}, :reason_{i})"
+                        )
+                        params.update({
+                            f"table_name_{i}": change['table_name'],
+                            f"operation_{i}": change['operation'],
+                            f"record_id_{i}": change.get('record_id'),
+                            f"proposed_data_{i}": json.dumps(change['proposed_data']),
+                            f"change_type_{i}": getattr(change_type, 'value', change_type),
+                            f"source_{i}": change['source'],
+                            f"metadata_{i}": json.dumps(change.get('metadata') or {}),
+                            f"reason_{i}": change.get('reason'),
+                        })
+
+                    result = session.execute(
+                        text(f"""
+                            INSERT INTO change_log (
+                                table_name,
+                                operation,
+                                record_id,
+                                proposed_data,
+                                change_type,
+                                source,
+                                status,
+                                proposed_at,
+                                metadata,
+                                reason
+                            ) VALUES {', '.join(values)}
+                            RETURNING change_id
+                        """),
+                        params
+                    )
+                    change_ids.extend(row[0] for row in result)
+
+                session.commit()
+
+            logger.info(f"Proposed {len(change_ids)} changes")
+            return change_ids
+
+        except Exception as e:
+            logger.error(f"Error proposing {len(changes)} changes: {e}", exc_info=True)
+            return []
+
     def get_pending_changes(
         self,
         change_type: Optional[ChangeType] = None,
@@ -420,7 +524,7 @@ class SEOGovernanceService:
                 elif operation == 'update':
                     # Build UPDATE statement dynamically
                     set_clause = ', '.join([f"{k} = :{k}" for k in proposed_data.keys()])
-                    primary_key_col = self._get_primary_key_column(table_name)
+                    primary_key_col = self._get_primary_key_column(table_name, session)
 
                     session.execute(
                         text(f"""
@@ -432,7 +536,7 @@ class SEOGovernanceService:
                     )
 
                 elif operation == 'delete':
-                    primary_key_col = self._get_primary_key_column(table_name)
+                    primary_key_col = self._get_primary_key_column(table_name, session)
 
                     session.execute(
                         text(f"""
@@ -466,34 +570,223 @@ class SEOGovernanceService:
             logger.error(f"Error applying change {change_id}: {e}", exc_info=True)
             return False
 
-    def _get_primary_key_column(self, table_name: str) -> str:
+    def _get_primary_key_column(self, table_name: str, session: Optional[Session] = None) -> str:
         """
         Get primary key column name for a table.
 
+        Known tables use the standard naming convention; other tables are
+        looked up in the catalog when a session is available. Results are
+        cached per table.
+
         Args:
             table_name: Table name
+            session: Optional session for the catalog lookup
 
         Returns:
             Primary key column name
         """
-        # Standard primary key naming convention
-        pk_map = {
-            'search_queries': 'query_id',
-            'serp_snapshots': 'snapshot_id',
-            'serp_results': 'result_id',
-            'serp_paa': 'paa_id',
-            'competitors': 'competitor_id',
-            'competitor_pages': 'page_id',
-            'backlinks': 'backlink_id',
-            'referring_domains': 'domain_id',
-            'citations': 'citation_id',
-            'page_audits': 'audit_id',
-            'audit_issues': 'issue_id',
-            'change_log': 'change_id',
-            'task_logs': 'task_id'
-        }
-
-        return pk_map.get(table_name, 'id')
+        cached = self._pk_cache.get(table_name)
+        if cached:
+            return cached
+
+        pk_col = PRIMARY_KEY_COLUMNS.get(table_name)
+
+        if pk_col is None and session is not None:
+            try:
+                with session.begin_nested():
+                    pk_col = session.execute(
+                        text("""
+                            SELECT a.attname
+                            FROM pg_index i
+                            JOIN pg_attribute a
+                              ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                            WHERE i.indrelid = CAST(:table_name AS regclass)
+                              AND i.indisprimary
+                            LIMIT 1
+                        """),
+                        {"table_name": table_name}
+                    ).scalar()
+            except Exception as e:
+                logger.warning(f"Primary key lookup failed for {table_name}: {e}")
+
+        if pk_col is None and session is None:
+            return 'id'
+
+        pk_col = pk_col or 'id'
+        self._pk_cache[table_name] = pk_col
+        return pk_col
+
+    def _apply_group(
+        self,
+        session: Session,
+        table_name: str,
+        operation: str,
+        columns: Tuple[str, ...],
+        changes: List[Tuple[int, Optional[int], Dict[str, Any]]]
+    ) -> None:
+        """
+        Apply a run of changes sharing table, operation and columns.
+
+        Args:
+            session: Open session (caller handles savepoints/commit)
+            table_name: Target table
+            operation: 'insert', 'update', or 'delete'
+            columns: Proposed data columns shared by the run
+            changes: (change_id, record_id, proposed_data) tuples
+        """
+        if operation == 'insert':
+            placeholders = ', '.join([f':{k}' for k in columns])
+            session.execute(
+                text(f"""
+                    INSERT INTO {table_name} ({', '.join(columns)})
+                    VALUES ({placeholders})
+                """),
+                [proposed_data for _, _, proposed_data in changes]
+            )
+
+        elif operation == 'update':
+            set_clause = ', '.join([f"{k} = :{k}" for k in columns])
+            primary_key_col = self._get_primary_key_column(table_name, session)
+            session.execute(
+                text(f"""
+                    UPDATE {table_name}
+                    SET {set_clause}
+                    WHERE {primary_key_col} = :record_id
+                """),
+                [
+                    {**proposed_data, 'record_id': record_id}
+                    for _, record_id, proposed_data in changes
+                ]
+            )
+
+        elif operation == 'delete':
+            primary_key_col = self._get_primary_key_column(table_name, session)
+            session.execute(
+                text(f"""
+                    DELETE FROM {table_name}
+                    WHERE {primary_key_col} = ANY(:record_ids)
+                """),
+                {'record_ids': [record_id for _, record_id, _ in changes]}
+            )
+
+        else:
+            raise ValueError(f"Unknown operation: {operation}")
+
+    def apply_changes(self, change_ids: List[int]) -> Dict[str, int]:
+        """
+        Apply many approved changes with set-based statements.
+
+        Changes are applied in change_id order. Consecutive changes with the
+        same table, operation and column set are applied as one executemany
+        (or one DELETE ... ANY) inside a savepoint; if a run fails, its
+        changes are retried individually so one bad row does not block the
+        rest. Each applied change is marked 'applied' in change_log; failures
+        stay 'approved' with the error recorded in metadata.
+
+        Args:
+            change_ids: Change IDs to apply
+
+        Returns:
+            Dictionary with counts: {'applied': N, 'failed': K}
+        """
+        counts = {'applied': 0, 'failed': 0}
+
+        if not self.engine:
+            logger.error("Cannot apply changes - database not configured")
+            counts['failed'] = len(change_ids)
+            return counts
+
+        if not change_ids:
+            return counts
+
+        applied_ids: List[int] = []
+        errors: Dict[int, str] = {}
+
+        try:
+            with Session(self.engine) as session:
+                rows = session.execute(
+                    text("""
+                        SELECT change_id, table_name, operation, record_id, proposed_data
+                        FROM change_log
+                        WHERE change_id = ANY(:change_ids)
+                          AND status = :status
+                        ORDER BY change_id
+                    """),
+                    {"change_ids": list(change_ids), "status": ChangeStatus.APPROVED.value}
+                ).fetchall()
+
+                def run_key(row):
+                    return (row[1], row[2], tuple((row[4] or {}).keys()))
+
+                for (table_name, operation, columns), run in groupby(rows, key=run_key):
+                    run_changes = [(row[0], row[3], row[4] or {}) for row in run]
+
+                    try:
+                        with session.begin_nested():
+                            self._apply_group(session, table_name, operation, columns, run_changes)
+                        applied_ids.extend(change_id for change_id, _, _ in run_changes)
+                        continue
+                    except Exception as e:
+                        if len(run_changes) == 1:
+                            errors[run_changes[0][0]] = str(e)
+                            continue
+                        logger.warning(
+                            f"Batch {operation} on {table_name} failed "
+                            f"({len(run_changes)} changes), retrying individually: {e}"
+                        )
+
+                    for change in run_changes:
+                        try:
+                            with session.begin_nested():
+                                self._apply_group(session, table_name, operation, columns, [change])
+                            applied_ids.append(change[0])
+                        except Exception as e:
+                            errors[change[0]] = str(e)
+
+                # Per-change audit trail
+                for start in range(0, len(applied_ids), BATCH_SIZE):
+                    session.execute(
+                        text("""
+                            UPDATE change_log
+                            SET
+                                status = :status,
+                                applied_at = NOW()
+                            WHERE change_id = ANY(:change_ids)
+                        """),
+                        {
+                            "change_ids": applied_ids[start:start + BATCH_SIZE],
+                            "status": ChangeStatus.APPLIED.value
+                        }
+                    )
+
+                if errors:
+                    session.execute(
+                        text("""
+                            UPDATE change_log
+                            SET metadata = COALESCE(metadata, '{}') || :metadata_update
+                            WHERE change_id = :change_id
+                        """),
+                        [
+                            {
+                                "change_id": change_id,
+                                "metadata_update": json.dumps({'apply_error': error})
+                            }
+                            for change_id, error in errors.items()
+                        ]
+                    )
+
+                session.commit()
+
+        except Exception as e:
+            logger.error(f"Error applying {len(change_ids)} changes: {e}", exc_info=True)
+            counts['failed'] = len(change_ids)
+            return counts
+
+        counts['applied'] = len(applied_ids)
+        counts['failed'] = len(change_ids) - len(applied_ids)
+
+        logger.info(f"Applied {counts['applied']} changes ({counts['failed']} failed)")
+        return counts
 
     def bulk_approve_changes(
         self,
@@ -504,6 +797,9 @@ class SEOGovernanceService:
         """
         Approve multiple changes in bulk.
 
+        Approval is a single UPDATE over all IDs; applying uses
+        apply_changes(). Already-applied changes are not re-approved.
+
         Args:
             change_ids: List of change IDs to approve
             reviewed_by: Identifier of reviewer
@@ -514,14 +810,53 @@ class SEOGovernanceService:
         """
         counts = {'approved': 0, 'applied': 0, 'failed': 0}
 
-        for change_id in change_ids:
-            success = self.approve_change(change_id, reviewed_by, apply_immediately)
-            if success:
-                counts['approved'] += 1
-                if apply_immediately:
-                    counts['applied'] += 1
-            else:
-                counts['failed'] += 1
+        if not self.engine:
+            logger.error("Cannot approve changes - database not configured")
+            counts['failed'] = len(change_ids)
+            return counts
+
+        approved_ids: List[int] = []
+
+        try:
+            with Session(self.engine) as session:
+                for start in range(0, len(change_ids), BATCH_SIZE):
+                    result = session.execute(
+                        text("""
+                            UPDATE change_log
+                            SET
+                                status = :status,
+                                reviewed_at = NOW(),
+                                reviewed_by = :reviewed_by
+                            WHERE change_id = ANY(:change_ids)
+                              AND status != :applied_status
+                            RETURNING change_id
+                        """),
+                        {
+                            "change_ids": list(change_ids[start:start + BATCH_SIZE]),
+                            "status": ChangeStatus.APPROVED.value,
+                            "applied_status": ChangeStatus.APPLIED.value,
+                            "reviewed_by": reviewed_by
+                        }
+                    )
+                    approved_ids.extend(row[0] for row in result)
+
+                session.commit()
+
+        except Exception as e:
+            logger.error(f"Error approving {len(change_ids)} changes: {e}", exc_info=True)
+            counts['failed'] = len(change_ids)
+            return counts
+
+        logger.info(f"Approved {len(approved_ids)} changes")
+
+        if apply_immediately and approved_ids:
+            apply_counts = self.apply_changes(approved_ids)
+            counts['applied'] = apply_counts['applied']
+            counts['approved'] = apply_counts['applied']
+        else:
+            counts['approved'] = len(approved_ids)
+
+        counts['failed'] = len(change_ids) - counts['approved']
 
         logger.info(f"Bulk approval complete: {counts}")
         return counts
@@ -569,6 +904,16 @@ def propose_change(
     )
 
 
+def propose_changes(changes: List[Dict[str, Any]]) -> List[int]:
+    """
+    Propose many changes in bulk (convenience wrapper).
+
+    See SEOGovernanceService.propose_changes for full documentation.
+    """
+    service = get_governance_service()
+    return service.propose_changes(changes)
+
+
 def get_pending_changes(change_type: Optional[ChangeType] = None, limit: int = 100) -> List[Dict]:
     """
     Get pending changes (convenience wrapper).
@@ -593,7 +593,8 @@ class KeywordGapAnalyzer:
         if not gaps:
             return
 
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
+        from db.engine_registry import get_engine
         from dotenv import load_dotenv
         import os
 
@@ -604,7 +605,7 @@ class KeywordGapAnalyzer:
             self.logger.warning("DATABASE_URL not set, skipping save")
             return
 
-        engine = create_engine(db_url)
+        engine = get_engine(db_url)
 
         insert_sql = text("""
             INSERT INTO keyword_gaps (
@@ -531,7 +531,8 @@ class OpportunityAnalyzer:
         if not opportunities:
             return
 
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
+        from db.engine_registry import get_engine
         from dotenv import load_dotenv
         import os
 
@@ -542,7 +543,7 @@ class OpportunityAnalyzer:
             self.logger.warning("DATABASE_URL not set, skipping save")
             return
 
-        engine = create_engine(db_url)
+        engine = get_engine(db_url)
 
         insert_sql = text("""
             INSERT INTO keyword_metrics (
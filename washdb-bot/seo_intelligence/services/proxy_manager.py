@@ -94,15 +94,18 @@ class ProxyManager:
 
     def get_proxy(
         self,
-        strategy: str = "round_robin",
-        tier: Optional[str] = None
+        strategy: Optional[str] = None,
+        tier: Optional[str] = None,
+        domain: Optional[str] = None,
     ) -> Optional[ProxyInfo]:
         """
         Get a proxy for scraping.
 
         Args:
-            strategy: Selection strategy ('round_robin' or 'health_based')
+            strategy: Selection strategy ('scored', 'round_robin' or
+                'health_based'; default: PROXY_SELECTION_STRATEGY, else 'scored')
             tier: Rate limit tier (A-G) - reserved for future tier-based allocation
+            domain: Target domain of the request (used by 'scored')
 
         Returns:
             ProxyInfo or None if proxies disabled or unavailable
@@ -111,9 +114,9 @@ class ProxyManager:
             return None
 
         # Future: Could allocate dedicated proxies to high-value tiers (A, B)
-        # For now, use shared pool with round-robin/health-based selection
+        # For now, use the shared pool with scored selection
 
-        proxy = self.pool.get_proxy(strategy=strategy)
+        proxy = self.pool.get_proxy(strategy=strategy, domain=domain)
 
         if proxy:
             logger.debug(f"Acquired proxy: {proxy.host}:{proxy.port}")
@@ -124,44 +127,56 @@ class ProxyManager:
 
     def get_proxy_for_playwright(
         self,
-        strategy: str = "round_robin"
+        strategy: Optional[str] = None,
+        domain: Optional[str] = None,
     ) -> Optional[Dict[str, str]]:
         """
         Get proxy in Playwright format.
 
         Args:
-            strategy: Selection strategy
+            strategy: Selection strategy (default: scored)
+            domain: Target domain of the request
 
         Returns:
             dict: Playwright proxy config or None
         """
-        proxy = self.get_proxy(strategy=strategy)
+        proxy = self.get_proxy(strategy=strategy, domain=domain)
 
         if proxy:
             return proxy.to_playwright_format()
 
         return None
 
-    def report_success(self, proxy: ProxyInfo):
+    def report_success(self, proxy: ProxyInfo, latency: Optional[float] = None, domain: Optional[str] = None):
         """
         Report successful use of proxy.
 
         Args:
             proxy: ProxyInfo that was used successfully
+            latency: Request time in seconds, if measured
+            domain: Target domain of the request
         """
         if self.pool:
-            self.pool.report_success(proxy)
+            self.pool.report_success(proxy, latency=latency, domain=domain)
 
-    def report_failure(self, proxy: ProxyInfo, error_type: str = "unknown"):
+    def report_failure(
+        self,
+        proxy: ProxyInfo,
+        error_type: str = "unknown",
+        latency: Optional[float] = None,
+        domain: Optional[str] = None,
+    ):
         """
         Report failed use of proxy.
 
         Args:
             proxy: ProxyInfo that failed
             error_type: Type of error (timeout, 403, 429, captcha, etc.)
+            latency: Request time in seconds, if measured
+            domain: Target domain of the request
         """
         if self.pool:
-            self.pool.report_failure(proxy, error_type=error_type)
+            self.pool.report_failure(proxy, error_type=error_type, latency=latency, domain=domain)
 
     def get_stats(self) -> Dict:
         """
@@ -232,6 +247,9 @@ def main():
 
     # Test getting proxies
     logger.info("Test 1: Get proxies with different strategies")
+    proxy_scored = manager.get_proxy(domain="yellowpages.com")
+    logger.info(f"  Scored: {proxy_scored}")
+
     proxy_rr = manager.get_proxy(strategy="round_robin")
     logger.info(f"  Round-robin: {proxy_rr}")
 
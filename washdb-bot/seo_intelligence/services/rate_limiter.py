@@ -23,11 +23,21 @@ Features:
 - Tier-based configuration matching specification
 - Thread-safe implementation
 - Automatic token refill
+- Reservation-based waits: a blocked caller is granted a future slot and
+  sleeps exactly once, instead of polling the bucket
+- Optional shared store (SQLite WAL) so buckets and concurrency limits are
+  enforced across all scraper processes on the host
+- Per-domain utilization stats
 """
 
+import os
+import sqlite3
 import time
 import threading
-from typing import Dict, Optional, Tuple
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -36,6 +46,19 @@ from runner.logging_setup import get_logger
 # Initialize logger
 logger = get_logger("rate_limiter")
 
+# Default shared store location (data/ is not tracked)
+DEFAULT_STORE_PATH = Path(__file__).resolve().parents[2] / "data" / "rate_limiter.db"
+
+# Concurrency limits (SCRAPING_NOTES.md §3)
+GLOBAL_MAX_CONCURRENCY = 5
+DOMAIN_MAX_CONCURRENCY = 1
+
+# Shared concurrency permits expire so a crashed process cannot hold them forever
+PERMIT_LEASE_SECONDS = 600
+
+# Window for utilization stats
+UTILIZATION_WINDOW_SECONDS = 60
+
 
 @dataclass
 class TierConfig:
@@ -95,6 +118,7 @@ class TokenBucket:
         self.tokens = float(tier_config.bucket_size)  # Start with full bucket
         self.last_refill = time.time()
         self.lock = threading.Lock()
+        self._grants: Deque[float] = deque()  # Grant times for utilization
 
         logger.debug(f"Initialized TokenBucket: {tier_config}")
 
@@ -130,12 +154,12 @@ class TokenBucket:
 
             if self.tokens >= tokens:
                 self.tokens -= tokens
+                self._grants.append(time.time())
                 logger.debug(f"Consumed {tokens} token(s), {self.tokens:.2f} remaining")
                 return True, 0.0
             else:
                 # Calculate wait time until enough tokens are available
-                tokens_needed = tokens - self.tokens
-                wait_time = (tokens_needed / self.config.tokens_per_minute) * 60.0
+                wait_time = self._wait_for(tokens)
 
                 logger.debug(
                     f"Insufficient tokens ({self.tokens:.2f}/{tokens}), "
@@ -143,6 +167,37 @@ class TokenBucket:
                 )
                 return False, wait_time
 
+    def _wait_for(self, tokens: int) -> float:
+        """Seconds until `tokens` are available (caller holds the lock)."""
+        tokens_needed = tokens - self.tokens
+        return max(0.0, (tokens_needed / self.config.tokens_per_minute) * 60.0)
+
+    def reserve(self, tokens: int = 1, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve tokens, possibly from future refills.
+
+        The bucket may go negative; later callers queue behind the reserved
+        tokens, so reservations are granted in arrival order.
+
+        Args:
+            tokens: Number of tokens to reserve
+            max_wait: Maximum acceptable wait (seconds). If None, no limit.
+
+        Returns:
+            Seconds to wait before using the tokens, or None if the wait
+            would exceed max_wait (nothing is reserved)
+        """
+        with self.lock:
+            self._refill()
+            wait_time = self._wait_for(tokens)
+
+            if max_wait is not None and wait_time > max_wait:
+                return None
+
+            self.tokens -= tokens
+            self._grants.append(time.time() + wait_time)
+            return wait_time
+
     def wait_and_consume(self, tokens: int = 1, max_wait: Optional[float] = None) -> bool:
         """
         Wait for tokens to be available and consume them.
@@ -154,30 +209,307 @@ class TokenBucket:
         Returns:
             bool: True if tokens were consumed, False if max_wait exceeded
         """
-        start_time = time.time()
-
-        while True:
-            success, wait_time = self.consume(tokens)
+        wait_time = self.reserve(tokens, max_wait)
 
-            if success:
-                return True
-
-            # Check max_wait constraint
-            if max_wait is not None:
-                elapsed = time.time() - start_time
-                if elapsed + wait_time > max_wait:
-                    logger.warning(f"Max wait time ({max_wait}s) would be exceeded")
-                    return False
+        if wait_time is None:
+            logger.warning(f"Max wait time ({max_wait}s) would be exceeded")
+            return False
 
-            # Wait for tokens to refill
-            logger.debug(f"Waiting {wait_time:.2f}s for tokens to refill...")
+        if wait_time > 0:
+            logger.debug(f"Waiting {wait_time:.2f}s for reserved tokens...")
             time.sleep(wait_time)
+        return True
 
     def get_available_tokens(self) -> float:
         """Get current number of available tokens."""
         with self.lock:
             self._refill()
-            return self.tokens
+            return max(0.0, self.tokens)
+
+    def get_utilization(self) -> Dict:
+        """Tokens reserved ahead and grants in the last UTILIZATION_WINDOW_SECONDS."""
+        with self.lock:
+            self._refill()
+            cutoff = time.time() - UTILIZATION_WINDOW_SECONDS
+            while self._grants and self._grants[0] < cutoff:
+                self._grants.popleft()
+            return {
+                'available_tokens': max(0.0, self.tokens),
+                'reserved_tokens': max(0.0, -self.tokens),
+                'granted_last_window': len(self._grants),
+            }
+
+
+class RateLimitStore:
+    """
+    SQLite (WAL mode) store for token buckets and concurrency permits
+    shared across processes.
+
+    Every reservation is one short IMMEDIATE transaction, so processes
+    serialize on the database rather than on in-process locks. Each
+    process opens its own connection (re-opened after fork).
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS buckets (
+            domain TEXT PRIMARY KEY,
+            tier TEXT NOT NULL,
+            tokens REAL NOT NULL,
+            last_refill REAL NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS grants (
+            domain TEXT NOT NULL,
+            granted_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_grants_domain_time ON grants(domain, granted_at);
+
+        CREATE TABLE IF NOT EXISTS permits (
+            permit_id TEXT PRIMARY KEY,
+            domain TEXT NOT NULL,
+            pid INTEGER NOT NULL,
+            acquired_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_permits_domain ON permits(domain);
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize store.
+
+        Args:
+            path: SQLite database file path (created if missing)
+        """
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+        with self._lock:
+            self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this process's connection (caller holds the lock)."""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _transaction(self, fn):
+        """Run fn(conn) inside BEGIN IMMEDIATE ... COMMIT."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(conn)
+                conn.execute("COMMIT")
+                return result
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _load_bucket(conn, domain: str, tier: str, now: float) -> Tuple[str, float]:
+        """Fetch (tier, refilled tokens) for a domain, creating a full bucket."""
+        row = conn.execute(
+            "SELECT tier, tokens, last_refill FROM buckets WHERE domain = ?", (domain,)
+        ).fetchone()
+        if row is None:
+            return tier, float(TIER_CONFIGS[tier].bucket_size)
+
+        stored_tier, tokens, last_refill = row
+        config = TIER_CONFIGS.get(stored_tier, TIER_CONFIGS['C'])
+        elapsed = max(0.0, now - last_refill)
+        tokens = min(config.bucket_size, tokens + (elapsed / 60.0) * config.tokens_per_minute)
+        return stored_tier, tokens
+
+    def set_tier(self, domain: str, tier: str) -> bool:
+        """
+        Set a domain's tier; the bucket is refilled only when the tier changes.
+
+        Returns:
+            True if the tier changed (or the domain was new)
+        """
+        def _set(conn):
+            row = conn.execute("SELECT tier FROM buckets WHERE domain = ?", (domain,)).fetchone()
+            if row is not None and row[0] == tier:
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (domain, tier, tokens, last_refill) VALUES (?, ?, ?, ?)",
+                (domain, tier, float(TIER_CONFIGS[tier].bucket_size), time.time()),
+            )
+            return True
+
+        return self._transaction(_set)
+
+    def get_tier(self, domain: str) -> Optional[str]:
+        """Get a domain's stored tier."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT tier FROM buckets WHERE domain = ?", (domain,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def reserve(
+        self,
+        domain: str,
+        default_tier: str,
+        tokens: int = 1,
+        max_wait: Optional[float] = None,
+        allow_wait: bool = True,
+    ) -> Optional[float]:
+        """
+        Reserve tokens from a domain's shared bucket.
+
+        Args:
+            domain: Domain name
+            default_tier: Tier used if the domain has no bucket yet
+            tokens: Number of tokens
+            max_wait: Maximum acceptable wait (seconds). If None, no limit.
+            allow_wait: If False, only succeed when tokens are available now
+
+        Returns:
+            Seconds to wait before using the tokens, or None if not granted
+        """
+        def _reserve(conn):
+            now = time.time()
+            tier, available = self._load_bucket(conn, domain, default_tier, now)
+            config = TIER_CONFIGS[tier]
+            wait_time = max(0.0, (tokens - available) / config.tokens_per_minute * 60.0)
+
+            granted = (wait_time == 0.0) or (allow_wait and (max_wait is None or wait_time <= max_wait))
+            if granted:
+                available -= tokens
+                conn.execute(
+                    "INSERT INTO grants (domain, granted_at) VALUES (?, ?)",
+                    (domain, now + wait_time),
+                )
+                # Keep grants bounded to the stats window (index range delete)
+                conn.execute(
+                    "DELETE FROM grants WHERE domain = ? AND granted_at < ?",
+                    (domain, now - UTILIZATION_WINDOW_SECONDS),
+                )
+
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (domain, tier, tokens, last_refill) VALUES (?, ?, ?, ?)",
+                (domain, tier, available, now),
+            )
+            return wait_time if granted else None
+
+        return self._transaction(_reserve)
+
+    def reset(self, domain: str):
+        """Refill a domain's bucket to full."""
+        def _reset(conn):
+            row = conn.execute("SELECT tier FROM buckets WHERE domain = ?", (domain,)).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE buckets SET tokens = ?, last_refill = ? WHERE domain = ?",
+                    (float(TIER_CONFIGS[row[0]].bucket_size), time.time(), domain),
+                )
+
+        self._transaction(_reset)
+
+    def try_acquire_permit(self, domain: str, global_max: int, domain_max: int) -> Optional[str]:
+        """
+        Take a concurrency permit if the global and per-domain limits allow.
+
+        Expired permits and permits of dead local processes are purged first.
+
+        Returns:
+            Permit ID, or None if a limit is reached
+        """
+        def _acquire(conn):
+            now = time.time()
+            conn.execute("DELETE FROM permits WHERE expires_at < ?", (now,))
+
+            total = conn.execute("SELECT COUNT(*) FROM permits").fetchone()[0]
+            for_domain = conn.execute(
+                "SELECT COUNT(*) FROM permits WHERE domain = ?", (domain,)
+            ).fetchone()[0]
+
+            if total >= global_max or for_domain >= domain_max:
+                dead = [
+                    pid for (pid,) in conn.execute("SELECT DISTINCT pid FROM permits")
+                    if not _pid_alive(pid)
+                ]
+                if not dead:
+                    return None
+                conn.executemany("DELETE FROM permits WHERE pid = ?", [(pid,) for pid in dead])
+                return _acquire(conn)
+
+            permit_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO permits (permit_id, domain, pid, acquired_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (permit_id, domain, os.getpid(), now, now + PERMIT_LEASE_SECONDS),
+            )
+            return permit_id
+
+        return self._transaction(_acquire)
+
+    def release_permit(self, permit_id: str):
+        """Return a concurrency permit."""
+        with self._lock:
+            self._connection().execute("DELETE FROM permits WHERE permit_id = ?", (permit_id,))
+
+    def utilization(self, domain: Optional[str] = None) -> List[Dict]:
+        """
+        Per-domain bucket state, recent grants and active permits.
+
+        Args:
+            domain: Limit to one domain (default: all domains)
+
+        Returns:
+            List of dicts with domain, tier, available_tokens,
+            reserved_tokens, granted_last_window and active_permits
+        """
+        now = time.time()
+        cutoff = now - UTILIZATION_WINDOW_SECONDS
+
+        def _collect(conn):
+            conn.execute("DELETE FROM grants WHERE granted_at < ?", (cutoff,))
+            if domain is None:
+                domains = [row[0] for row in conn.execute("SELECT domain FROM buckets ORDER BY domain")]
+            else:
+                domains = [domain]
+
+            rows = []
+            for name in domains:
+                tier, tokens = self._load_bucket(conn, name, 'C', now)
+                granted = conn.execute(
+                    "SELECT COUNT(*) FROM grants WHERE domain = ? AND granted_at >= ?", (name, cutoff)
+                ).fetchone()[0]
+                permits = conn.execute(
+                    "SELECT COUNT(*) FROM permits WHERE domain = ? AND expires_at >= ?", (name, now)
+                ).fetchone()[0]
+                rows.append({
+                    'domain': name,
+                    'tier': tier,
+                    'available_tokens': max(0.0, tokens),
+                    'reserved_tokens': max(0.0, -tokens),
+                    'granted_last_window': granted,
+                    'active_permits': permits,
+                })
+            return rows
+
+        return self._transaction(_collect)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a local process ID is still running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
 
 
 class RateLimiter:
@@ -190,27 +522,47 @@ class RateLimiter:
     Also enforces global and per-domain concurrency limits per SCRAPING_NOTES.md:
     - Global: max 5 concurrent requests across all domains
     - Per-domain: max 1 concurrent request per domain
+
+    With a RateLimitStore, buckets and concurrency permits are shared by every
+    process using the same store, so the limits hold for the whole host rather
+    than per process. In-process semaphores/locks still gate threads first.
     """
 
-    def __init__(self):
-        """Initialize the rate limiter with concurrency controls."""
+    def __init__(self, store: Optional[RateLimitStore] = None):
+        """
+        Initialize the rate limiter with concurrency controls.
+
+        Args:
+            store: Shared store for cross-process limits (None = process-local)
+        """
+        self.store = store
         self.buckets: Dict[str, TokenBucket] = {}
         self.domain_tiers: Dict[str, str] = {}  # domain -> tier mapping
         self.lock = threading.Lock()
 
         # Global concurrency limit: max 5 concurrent requests (SCRAPING_NOTES.md §3)
-        self.global_semaphore = threading.Semaphore(5)
+        self.global_semaphore = threading.Semaphore(GLOBAL_MAX_CONCURRENCY)
 
         # Per-domain concurrency: max 1 concurrent request per domain (SCRAPING_NOTES.md §3)
         self.domain_locks: Dict[str, threading.Lock] = {}
         self.domain_locks_lock = threading.Lock()  # Protects domain_locks dict
 
-        logger.info("RateLimiter initialized (global_max=5, per_domain_max=1)")
+        # Shared permits held by this process (domain -> permit IDs)
+        self.permits: Dict[str, List[str]] = {}
+
+        logger.info(
+            f"RateLimiter initialized (global_max={GLOBAL_MAX_CONCURRENCY}, "
+            f"per_domain_max={DOMAIN_MAX_CONCURRENCY}, "
+            f"shared={'yes: ' + store.path if store else 'no'})"
+        )
 
     def set_domain_tier(self, domain: str, tier: str):
         """
         Set the tier for a specific domain.
 
+        The bucket is only replaced when the tier changes, so scrapers can
+        call this before every request without refilling the bucket.
+
         Args:
             domain: Domain name (e.g., 'google.com')
             tier: Tier letter ('A'-'G')
@@ -221,13 +573,17 @@ class RateLimiter:
         if tier not in TIER_CONFIGS:
             raise ValueError(f"Invalid tier '{tier}'. Must be one of: {list(TIER_CONFIGS.keys())}")
 
+        tier_config = TIER_CONFIGS[tier]
         with self.lock:
+            changed = self.domain_tiers.get(domain) != tier or domain not in self.buckets
             self.domain_tiers[domain] = tier
+            if changed:
+                self.buckets[domain] = TokenBucket(tier_config)
 
-            # Create or replace bucket for this domain
-            tier_config = TIER_CONFIGS[tier]
-            self.buckets[domain] = TokenBucket(tier_config)
+        if self.store:
+            changed = self.store.set_tier(domain, tier)
 
+        if changed:
             logger.info(f"Set domain '{domain}' to tier {tier}: {tier_config}")
 
     def get_domain_tier(self, domain: str) -> str:
@@ -258,6 +614,9 @@ class RateLimiter:
         """
         Acquire tokens for a domain.
 
+        Waiting callers reserve a future slot and sleep once until it comes
+        up, rather than polling the bucket.
+
         Args:
             domain: Domain name
             tokens: Number of tokens to acquire (default: 1)
@@ -267,6 +626,18 @@ class RateLimiter:
         Returns:
             bool: True if tokens acquired, False otherwise
         """
+        if self.store:
+            wait_time = self.store.reserve(
+                domain, self.get_domain_tier(domain), tokens, max_wait=max_wait, allow_wait=wait
+            )
+            if wait_time is None:
+                logger.debug(f"Rate limit for '{domain}' not granted (wait={wait}, max_wait={max_wait})")
+                return False
+            if wait_time > 0:
+                logger.debug(f"Waiting {wait_time:.2f}s for reserved tokens on '{domain}'")
+                time.sleep(wait_time)
+            return True
+
         bucket = self._get_bucket(domain)
 
         if wait:
@@ -301,20 +672,60 @@ class RateLimiter:
         Returns:
             dict: Statistics including tier, available tokens, config
         """
-        bucket = self._get_bucket(domain)
-        tier = self.get_domain_tier(domain)
-        config = TIER_CONFIGS[tier]
+        usage = self.get_utilization(domain)[0]
+        config = TIER_CONFIGS[usage['tier']]
 
         return {
             'domain': domain,
-            'tier': tier,
-            'available_tokens': bucket.get_available_tokens(),
+            'tier': usage['tier'],
+            'available_tokens': usage['available_tokens'],
             'bucket_size': config.bucket_size,
             'tokens_per_minute': config.tokens_per_minute,
             'min_delay_seconds': config.min_delay_seconds,
             'max_delay_seconds': config.max_delay_seconds,
         }
 
+    def get_utilization(self, domain: Optional[str] = None) -> List[Dict]:
+        """
+        Get per-domain utilization.
+
+        With a shared store the figures cover every process using it.
+
+        Args:
+            domain: Domain name (default: all known domains)
+
+        Returns:
+            List of dicts with domain, tier, tokens_per_minute,
+            available_tokens, reserved_tokens (granted ahead of refill),
+            granted_last_minute, utilization (granted / tier rate) and
+            active_permits
+        """
+        if self.store:
+            rows = self.store.utilization(domain)
+        else:
+            with self.lock:
+                domains = [domain] if domain else sorted(self.buckets)
+            with self.domain_locks_lock:
+                held = {name: lock.locked() for name, lock in self.domain_locks.items()}
+            rows = []
+            for name in domains:
+                row = {'domain': name, 'tier': self.get_domain_tier(name)}
+                row.update(self._get_bucket(name).get_utilization())
+                row['active_permits'] = int(held.get(name, False))
+                rows.append(row)
+
+        results = []
+        for row in rows:
+            config = TIER_CONFIGS[row['tier']]
+            granted = row.pop('granted_last_window')
+            results.append({
+                **row,
+                'tokens_per_minute': config.tokens_per_minute,
+                'granted_last_minute': granted,
+                'utilization': granted / (config.tokens_per_minute * UTILIZATION_WINDOW_SECONDS / 60.0),
+            })
+        return results
+
     def reset_domain(self, domain: str):
         """
         Reset rate limiting for a domain (refill bucket to full).
@@ -329,6 +740,9 @@ class RateLimiter:
                 self.buckets[domain] = TokenBucket(config)
                 logger.info(f"Reset rate limiter for domain '{domain}'")
 
+        if self.store:
+            self.store.reset(domain)
+
     def _get_domain_lock(self, domain: str) -> threading.Lock:
         """
         Get or create a lock for a specific domain.
@@ -345,6 +759,25 @@ class RateLimiter:
                 logger.debug(f"Created concurrency lock for domain '{domain}'")
             return self.domain_locks[domain]
 
+    def _acquire_shared_permit(self, domain: str, deadline: Optional[float]) -> bool:
+        """Take a shared permit, backing off while other processes hold them."""
+        backoff = 0.05
+        while True:
+            permit_id = self.store.try_acquire_permit(
+                domain, GLOBAL_MAX_CONCURRENCY, DOMAIN_MAX_CONCURRENCY
+            )
+            if permit_id:
+                with self.lock:
+                    self.permits.setdefault(domain, []).append(permit_id)
+                return True
+
+            if deadline is not None and time.time() >= deadline:
+                return False
+
+            sleep_for = backoff if deadline is None else min(backoff, max(0.0, deadline - time.time()))
+            time.sleep(sleep_for)
+            backoff = min(backoff * 2, 1.0)
+
     def acquire_concurrency(self, domain: str, timeout: Optional[float] = None) -> bool:
         """
         Acquire both global and per-domain concurrency permits.
@@ -362,6 +795,8 @@ class RateLimiter:
         Returns:
             bool: True if permits acquired, False if timeout
         """
+        deadline = None if timeout is None else time.time() + timeout
+
         # Try to acquire global semaphore first
         if not self.global_semaphore.acquire(blocking=True, timeout=timeout):
             logger.debug("Global concurrency limit reached (5 concurrent requests)")
@@ -369,12 +804,20 @@ class RateLimiter:
 
         # Try to acquire per-domain lock
         domain_lock = self._get_domain_lock(domain)
-        if not domain_lock.acquire(blocking=True, timeout=timeout):
+        remaining = None if deadline is None else max(0.0, deadline - time.time())
+        if not domain_lock.acquire(blocking=True, timeout=-1 if remaining is None else remaining):
             # Release global semaphore since we couldn't get domain lock
             self.global_semaphore.release()
             logger.debug(f"Per-domain concurrency limit reached for '{domain}' (1 concurrent request)")
             return False
 
+        # Then the host-wide permit shared with other processes
+        if self.store and not self._acquire_shared_permit(domain, deadline):
+            domain_lock.release()
+            self.global_semaphore.release()
+            logger.debug(f"Shared concurrency limit reached for '{domain}'")
+            return False
+
         logger.debug(f"Acquired concurrency permits for '{domain}'")
         return True
 
@@ -385,6 +828,13 @@ class RateLimiter:
         Args:
             domain: Domain name
         """
+        if self.store:
+            with self.lock:
+                held = self.permits.get(domain)
+                permit_id = held.pop() if held else None
+            if permit_id:
+                self.store.release_permit(permit_id)
+
         # Release per-domain lock
         domain_lock = self._get_domain_lock(domain)
         try:
@@ -407,12 +857,27 @@ class RateLimiter:
 _rate_limiter_instance = None
 
 
+def _store_path() -> Optional[str]:
+    """Shared store path from RATE_LIMITER_DB (None = process-local limits)."""
+    path = os.getenv("RATE_LIMITER_DB", str(DEFAULT_STORE_PATH))
+    if path.strip().lower() in ("", "off", "none", "memory", ":memory:"):
+        return None
+    return path
+
+
 def get_rate_limiter() -> RateLimiter:
     """Get or create the singleton RateLimiter instance."""
     global _rate_limiter_instance
 
     if _rate_limiter_instance is None:
-        _rate_limiter_instance = RateLimiter()
+        store = None
+        path = _store_path()
+        if path:
+            try:
+                store = RateLimitStore(path)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Shared rate limit store unavailable ({e}), using process-local limits")
+        _rate_limiter_instance = RateLimiter(store=store)
 
     return _rate_limiter_instance
 
@@ -39,28 +39,22 @@ Usage:
     # }
 """
 
-import re
-import string
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
-from bs4 import BeautifulSoup
 
 from runner.logging_setup import get_logger
+from seo_intelligence.services.text_profile import (
+    SYLLABLE_EXCEPTIONS,
+    TextProfile,
+    count_syllables,
+    get_text_profiler,
+    tokenize_sentences,
+    tokenize_words,
+)
 
 logger = get_logger("readability_analyzer")
 
 
-# Common syllable patterns for syllable counting
-# Based on English phonology rules
-SYLLABLE_EXCEPTIONS = {
-    "area": 3, "idea": 3, "real": 2, "ruin": 2, "science": 2,
-    "create": 2, "creature": 2, "feature": 2, "measure": 2,
-    "employee": 3, "every": 3, "evening": 3, "everything": 4,
-    "business": 2, "different": 3, "family": 3, "interest": 3,
-    "favorite": 3, "separate": 3, "chocolate": 3, "comfortable": 4,
-    "temperature": 4, "vegetable": 4, "literature": 4, "dictionary": 4,
-}
-
 # Prefixes/suffixes that don't add syllables
 SILENT_SUFFIXES = ["es", "ed", "e"]
 ADD_SYLLABLE_SUFFIXES = ["le", "les", "tion", "sion", "ious", "eous"]
@@ -115,69 +109,22 @@ class ReadabilityAnalyzer:
             words_per_minute: Average reading speed for time estimation
         """
         self.words_per_minute = words_per_minute
+        self.profiler = get_text_profiler()
         logger.info("ReadabilityAnalyzer initialized")
 
     def _count_syllables(self, word: str) -> int:
         """
         Count syllables in a word using English phonology rules.
 
+        Delegates to the shared, memoized counter in text_profile.
+
         Args:
             word: Word to count syllables for
 
         Returns:
             int: Number of syllables
         """
-        word = word.lower().strip()
-
-        # Remove punctuation
-        word = word.strip(string.punctuation)
-
-        if not word:
-            return 0
-
-        # Check exception list
-        if word in SYLLABLE_EXCEPTIONS:
-            return SYLLABLE_EXCEPTIONS[word]
-
-        # Count vowel groups
-        vowels = "aeiouy"
-        count = 0
-        prev_is_vowel = False
-
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not prev_is_vowel:
-                count += 1
-            prev_is_vowel = is_vowel
-
-        # Handle silent e at end
-        if word.endswith('e') and count > 1:
-            # But not words ending in -le
-            if not word.endswith('le'):
-                count -= 1
-
-        # Handle -ed endings
-        if word.endswith('ed') and count > 1:
-            if not word.endswith('ted') and not word.endswith('ded'):
-                count -= 1
-
-        # Handle -es endings
-        if word.endswith('es') and count > 1:
-            if word.endswith('ses') or word.endswith('xes') or word.endswith('zes'):
-                pass  # Keep syllable
-            elif word.endswith('ches') or word.endswith('shes'):
-                pass  # Keep syllable
-            else:
-                count -= 1
-
-        # Handle special suffixes that add syllables
-        for suffix in ['-tion', '-sion', '-cial', '-tial']:
-            if word.endswith(suffix.replace('-', '')):
-                # These are already counted correctly by vowel groups
-                pass
-
-        # Ensure at least one syllable
-        return max(1, count)
+        return count_syllables(word)
 
     def _is_complex_word(self, word: str) -> bool:
         """
@@ -230,26 +177,7 @@ class ReadabilityAnalyzer:
         Returns:
             List of sentences
         """
-        # Protect common abbreviations
-        abbrevs = [
-            'Mr.', 'Mrs.', 'Ms.', 'Dr.', 'Prof.', 'Jr.', 'Sr.',
-            'Inc.', 'Ltd.', 'Corp.', 'Co.',
-            'vs.', 'etc.', 'e.g.', 'i.e.',
-            'a.m.', 'p.m.', 'A.M.', 'P.M.',
-            'U.S.', 'U.K.', 'U.N.',
-        ]
-
-        protected_text = text
-        for abbrev in abbrevs:
-            protected_text = protected_text.replace(abbrev, abbrev.replace('.', '<DOT>'))
-
-        # Split on sentence-ending punctuation
-        sentences = re.split(r'[.!?]+\s+', protected_text)
-
-        # Restore dots
-        sentences = [s.replace('<DOT>', '.').strip() for s in sentences if s.strip()]
-
-        return sentences
+        return tokenize_sentences(text)
 
     def _tokenize_words(self, text: str) -> List[str]:
         """
@@ -261,16 +189,7 @@ class ReadabilityAnalyzer:
         Returns:
             List of words
         """
-        # Remove punctuation except apostrophes and hyphens within words
-        text = re.sub(r"[^\w\s'-]", ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-
-        words = text.split()
-
-        # Filter out non-words (numbers, single characters)
-        words = [w for w in words if len(w) > 1 and not w.isdigit()]
-
-        return words
+        return tokenize_words(text)
 
     def _extract_text_from_html(self, html: str) -> Tuple[str, int]:
         """
@@ -282,23 +201,8 @@ class ReadabilityAnalyzer:
         Returns:
             Tuple of (text, paragraph_count)
         """
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Remove scripts and styles
-        for element in soup(['script', 'style', 'header', 'footer', 'nav', 'aside']):
-            element.decompose()
-
-        # Count paragraphs
-        paragraphs = soup.find_all(['p', 'li', 'dd', 'blockquote'])
-        paragraph_count = len(paragraphs)
-
-        # Get text
-        text = soup.get_text(separator=' ')
-
-        # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        return text, max(1, paragraph_count)
+        profile = self.profiler.profile_html(html)
+        return profile.text, profile.paragraph_count
 
     def _calculate_flesch_kincaid_grade(
         self,
@@ -480,17 +384,35 @@ class ReadabilityAnalyzer:
         Returns:
             ReadabilityResult with all metrics
         """
-        # Tokenize
-        sentences = self._tokenize_sentences(text)
-        words = self._tokenize_words(text)
+        return self.analyze_profile(self.profiler.profile_text(text), paragraph_count=1)
+
+    def analyze_profile(
+        self,
+        profile: TextProfile,
+        paragraph_count: Optional[int] = None,
+    ) -> ReadabilityResult:
+        """
+        Analyze readability from a shared TextProfile.
+
+        Tokens, sentences and syllable counts come from the profile, so
+        they are computed once per page across all analyzers.
+
+        Args:
+            profile: Text profile of the page
+            paragraph_count: Override for the profile's paragraph count
+
+        Returns:
+            ReadabilityResult with all metrics
+        """
+        words = profile.words
 
         # Count statistics
-        sentence_count = len(sentences)
+        sentence_count = len(profile.sentences)
         word_count = len(words)
-        character_count = sum(len(w) for w in words)
+        character_count = profile.character_count
 
         # Count syllables and complex words
-        syllable_count = sum(self._count_syllables(w) for w in words)
+        syllable_count = profile.syllable_count
         complex_words = [w for w in words if self._is_complex_word(w)]
         complex_word_count = len(complex_words)
 
@@ -533,7 +455,9 @@ class ReadabilityAnalyzer:
             ari=ari,
             word_count=word_count,
             sentence_count=sentence_count,
-            paragraph_count=1,  # Plain text counts as 1 paragraph
+            paragraph_count=(
+                profile.paragraph_count if paragraph_count is None else paragraph_count
+            ),
             character_count=character_count,
             syllable_count=syllable_count,
             avg_sentence_length=round(avg_sentence_length, 1),
@@ -557,16 +481,8 @@ class ReadabilityAnalyzer:
         Returns:
             ReadabilityResult with all metrics
         """
-        # Extract text and count paragraphs
-        text, paragraph_count = self._extract_text_from_html(html)
-
-        # Analyze the extracted text
-        result = self.analyze_text(text)
-
-        # Update paragraph count from HTML structure
-        result.paragraph_count = paragraph_count
-
-        return result
+        # Paragraph count comes from the HTML structure
+        return self.analyze_profile(self.profiler.profile_html(html))
 
 
 # Module-level singleton
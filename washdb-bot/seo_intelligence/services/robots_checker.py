@@ -6,7 +6,13 @@ Ensures ethical scraping by respecting robots.txt rules.
 Features:
 - Fetch and parse robots.txt files
 - Check if URLs are allowed for specific user agents
-- Cache robots.txt files with TTL
+- Cache robots.txt files with TTL, in memory and in a SQLite (WAL) store
+  shared by all processes on the host
+- Negative caching: failed fetches are cached with a shorter TTL, so a slow
+  or broken host costs one timeout per TTL instead of one per URL
+- Single-flight fetches: concurrent checks for the same domain wait for the
+  one fetch in progress
+- Rules precompiled per user agent (longest match wins, '*' and '$' wildcards)
 - Support for crawl-delay directives
 - Thread-safe implementation
 
@@ -16,79 +22,373 @@ Per SCRAPING_NOTES.md:
 - "If robots.txt fetch fails, assume disallowed"
 """
 
+import os
+import re
+import sqlite3
 import time
 import requests
 import threading
-from typing import Dict, Optional, Tuple
-from urllib.parse import urlparse, urljoin
-from urllib.robotparser import RobotFileParser
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, quote, unquote
+from urllib.robotparser import RequestRate
 
 from runner.logging_setup import get_logger
 
 # Initialize logger
 logger = get_logger("robots_checker")
 
+# Default shared store location (data/ is not tracked)
+DEFAULT_STORE_PATH = Path(__file__).resolve().parents[2] / "data" / "robots_cache.db"
+
+# Failed fetches (timeouts, 5xx, 401/403) are retried after this long
+NEGATIVE_CACHE_TTL = 900
+
+# Robots.txt bodies beyond this size are truncated (RFC 9309 minimum is 500 KiB)
+MAX_ROBOTS_BYTES = 500 * 1024
+
+# Entry statuses
+STATUS_OK = "ok"                # 200 - rules parsed from body
+STATUS_MISSING = "missing"      # 404/410 - everything allowed
+STATUS_UNAVAILABLE = "unavailable"  # fetch failed - everything disallowed
+
+
+# Characters left unescaped when normalizing paths and rule patterns
+_PATH_SAFE = "/?=&;:@!,+"
+
+
+def _normalize_path(path: str, safe: str = _PATH_SAFE) -> str:
+    """Percent-encode a path consistently for matching."""
+    return quote(unquote(path), safe=safe)
+
+
+class RobotsRules:
+    """
+    Parsed robots.txt with precompiled allow/disallow matchers.
+
+    Drop-in for the parts of urllib.robotparser.RobotFileParser used here
+    (can_fetch, crawl_delay, request_rate). Unlike RobotFileParser, the
+    longest matching rule wins (RFC 9309) and '*' / '$' wildcards work.
+    """
+
+    def __init__(self, lines: List[str]):
+        """
+        Parse robots.txt.
+
+        Args:
+            lines: robots.txt lines
+        """
+        # Each group: (agents, rules, crawl_delay, request_rate)
+        self._groups: List[Tuple[List[str], List[Tuple[str, bool]], Optional[float], Optional[RequestRate]]] = []
+        self._compiled: Dict[str, list] = {}  # product token -> sorted matchers
+        self._lock = threading.Lock()
+        self._parse(lines)
+
+    @classmethod
+    def allow_all(cls) -> "RobotsRules":
+        """Rules for a site without robots.txt."""
+        return cls([])
+
+    def _parse(self, lines: List[str]):
+        """Split lines into user-agent groups."""
+        agents: List[str] = []
+        rules: List[Tuple[str, bool]] = []
+        delay: Optional[float] = None
+        rate: Optional[RequestRate] = None
+        in_rules = False
+
+        def flush():
+            if agents:
+                self._groups.append((agents, rules, delay, rate))
+
+        for raw in lines:
+            line = raw.split("#", 1)[0].strip()
+            if ":" not in line:
+                continue
+            field, value = line.split(":", 1)
+            field = field.strip().lower()
+            value = value.strip()
+
+            if field == "user-agent":
+                if in_rules:
+                    # A user-agent after rules starts a new group
+                    flush()
+                    agents, rules, delay, rate, in_rules = [], [], None, None, False
+                agents.append(value.lower())
+            elif field in ("allow", "disallow"):
+                in_rules = True
+                if value:  # An empty Disallow allows everything
+                    rules.append((value, field == "allow"))
+            elif field == "crawl-delay":
+                in_rules = True
+                try:
+                    delay = float(value)
+                except ValueError:
+                    pass
+            elif field == "request-rate":
+                in_rules = True
+                parts = value.split("/")
+                if len(parts) == 2 and parts[0].strip().isdigit() and parts[1].strip().isdigit():
+                    rate = RequestRate(int(parts[0]), int(parts[1]))
+
+        flush()
+
+    def _groups_for(self, user_agent: str) -> list:
+        """Groups that apply to a user agent (specific agents before '*')."""
+        token = user_agent.split("/")[0].lower()
+        specific = [g for g in self._groups if any(a != "*" and a in token for a in g[0])]
+        if specific:
+            return specific
+        return [g for g in self._groups if "*" in g[0]]
+
+    @staticmethod
+    def _compile_rule(pattern: str, allow: bool):
+        """Compile one rule into (length, allow, matcher)."""
+        pattern = _normalize_path(pattern, safe=_PATH_SAFE + "*$")
+        if "*" not in pattern and not pattern.endswith("$"):
+            return (len(pattern), allow, lambda path, p=pattern: path.startswith(p))
+
+        anchored = pattern.endswith("$")
+        body = pattern[:-1] if anchored else pattern
+        regex = ".*".join(re.escape(part) for part in body.split("*"))
+        compiled = re.compile(regex + ("$" if anchored else ""))
+        return (len(pattern), allow, lambda path, r=compiled: r.match(path) is not None)
+
+    def _matchers(self, user_agent: str) -> list:
+        """Sorted matchers for a user agent, compiled on first use."""
+        token = user_agent.split("/")[0].lower()
+        with self._lock:
+            matchers = self._compiled.get(token)
+            if matchers is None:
+                matchers = [
+                    self._compile_rule(pattern, allow)
+                    for group in self._groups_for(user_agent)
+                    for pattern, allow in group[1]
+                ]
+                # Longest pattern first; on equal length Allow wins
+                matchers.sort(key=lambda m: (-m[0], not m[1]))
+                self._compiled[token] = matchers
+            return matchers
+
+    def can_fetch(self, user_agent: str, url: str) -> bool:
+        """
+        Check if a user agent may fetch a URL.
+
+        Args:
+            user_agent: User agent string
+            url: Absolute URL or path
+
+        Returns:
+            bool: True if allowed
+        """
+        parsed = urlparse(url)
+        path = parsed.path or "/"
+        if parsed.params:
+            path += ";" + parsed.params
+        if parsed.query:
+            path += "?" + parsed.query
+        path = _normalize_path(path)
+
+        if path == "/robots.txt":
+            return True
+
+        for _, allow, matches in self._matchers(user_agent):
+            if matches(path):
+                return allow
+        return True
+
+    def crawl_delay(self, user_agent: str) -> Optional[float]:
+        """Crawl-delay for a user agent, if specified."""
+        for group in self._groups_for(user_agent):
+            if group[2] is not None:
+                return group[2]
+        return None
+
+    def request_rate(self, user_agent: str) -> Optional[RequestRate]:
+        """Request-rate for a user agent, if specified."""
+        for group in self._groups_for(user_agent):
+            if group[3] is not None:
+                return group[3]
+        return None
+
+
+@dataclass
+class RobotsEntry:
+    """Cached robots.txt fetch result for one domain."""
+    status: str
+    body: str
+    fetched_at: float
+    expires_at: float
+    rules: Optional[RobotsRules] = None
+
+    def __post_init__(self):
+        if self.rules is None:
+            if self.status == STATUS_OK:
+                self.rules = RobotsRules(self.body.splitlines())
+            elif self.status == STATUS_MISSING:
+                self.rules = RobotsRules.allow_all()
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+
+class RobotsStore:
+    """
+    SQLite (WAL mode) store for robots.txt fetch results shared across processes.
+
+    Timestamps are stored as Unix epoch seconds. Each process opens its own
+    connection (re-opened after fork); writes are serialized by SQLite.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS robots (
+            domain TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            body TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize store.
+
+        Args:
+            path: SQLite database file path (created if missing)
+        """
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+        with self._lock:
+            self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this process's connection (caller holds the lock)."""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _execute(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """Execute one statement and return all rows."""
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def load(self, domain: str) -> Optional[RobotsEntry]:
+        """Load a domain's entry (possibly expired)."""
+        rows = self._execute(
+            "SELECT status, body, fetched_at, expires_at FROM robots WHERE domain = ?", (domain,)
+        )
+        if not rows:
+            return None
+        status, body, fetched_at, expires_at = rows[0]
+        return RobotsEntry(status, body, fetched_at, expires_at)
+
+    def save(self, domain: str, entry: RobotsEntry):
+        """Insert or replace a domain's entry."""
+        self._execute(
+            "INSERT OR REPLACE INTO robots (domain, status, body, fetched_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+            (domain, entry.status, entry.body, entry.fetched_at, entry.expires_at),
+        )
+
+    def delete_all(self) -> int:
+        """Delete all entries."""
+        with self._lock:
+            return self._connection().execute("DELETE FROM robots").rowcount
+
 
 class RobotsTxtCache:
-    """Cache for robots.txt files with TTL."""
+    """Cache for robots.txt fetch results with TTL, backed by an optional shared store."""
 
-    def __init__(self, ttl_seconds: int = 86400):  # 24 hours default
+    def __init__(self, ttl_seconds: int = 86400, store: Optional[RobotsStore] = None):  # 24 hours default
         """
         Initialize robots.txt cache.
 
         Args:
             ttl_seconds: Time-to-live for cached entries (default: 86400 = 24 hours)
+            store: Shared store (None = in-process only)
         """
-        self.cache: Dict[str, Tuple[RobotFileParser, datetime]] = {}
+        self.cache: Dict[str, RobotsEntry] = {}
         self.lock = threading.Lock()
-        self.ttl = timedelta(seconds=ttl_seconds)
+        self.ttl = ttl_seconds
+        self.store = store
 
-        logger.info(f"RobotsTxtCache initialized with TTL={ttl_seconds}s")
+        logger.info(f"RobotsTxtCache initialized with TTL={ttl_seconds}s, shared={'yes' if store else 'no'}")
 
-    def get(self, domain: str) -> Optional[RobotFileParser]:
+    def get(self, domain: str, include_expired: bool = False) -> Optional[RobotsEntry]:
         """
-        Get cached robots.txt parser for a domain.
+        Get the cached entry for a domain.
 
         Args:
             domain: Domain name
+            include_expired: Also return expired entries (for stale fallback)
 
         Returns:
-            RobotFileParser if cached and not expired, None otherwise
+            RobotsEntry if cached (and not expired, unless include_expired)
         """
         with self.lock:
-            if domain in self.cache:
-                parser, cached_at = self.cache[domain]
-                age = datetime.now() - cached_at
-
-                if age < self.ttl:
-                    logger.debug(f"Cache HIT for {domain} (age: {age.total_seconds():.0f}s)")
-                    return parser
-                else:
-                    logger.debug(f"Cache EXPIRED for {domain} (age: {age.total_seconds():.0f}s)")
-                    del self.cache[domain]
-
+            entry = self.cache.get(domain)
+
+        if (entry is None or entry.expired) and self.store:
+            # Another process may have fetched it
+            try:
+                stored = self.store.load(domain)
+            except sqlite3.Error as e:
+                logger.warning(f"Robots store read failed for {domain}: {e}")
+                stored = None
+            if stored and (entry is None or stored.fetched_at > entry.fetched_at):
+                entry = stored
+                with self.lock:
+                    self.cache[domain] = entry
+
+        if entry is None:
             logger.debug(f"Cache MISS for {domain}")
             return None
 
-    def set(self, domain: str, parser: RobotFileParser):
+        if entry.expired and not include_expired:
+            logger.debug(f"Cache EXPIRED for {domain}")
+            return None
+
+        logger.debug(f"Cache HIT for {domain} ({entry.status})")
+        return entry
+
+    def set(self, domain: str, entry: RobotsEntry):
         """
-        Cache robots.txt parser for a domain.
+        Cache a fetch result for a domain.
 
         Args:
             domain: Domain name
-            parser: RobotFileParser instance
+            entry: RobotsEntry
         """
         with self.lock:
-            self.cache[domain] = (parser, datetime.now())
-            logger.debug(f"Cached robots.txt for {domain}")
+            self.cache[domain] = entry
+
+        if self.store:
+            try:
+                self.store.save(domain, entry)
+            except sqlite3.Error as e:
+                logger.warning(f"Robots store write failed for {domain}: {e}")
+
+        logger.debug(f"Cached robots.txt for {domain} ({entry.status})")
 
     def clear(self):
         """Clear all cached entries."""
         with self.lock:
             count = len(self.cache)
             self.cache.clear()
-            logger.info(f"Cleared {count} cached robots.txt entries")
+        if self.store:
+            count = max(count, self.store.delete_all())
+        logger.info(f"Cleared {count} cached robots.txt entries")
 
 
 class RobotsChecker:
@@ -103,7 +403,9 @@ class RobotsChecker:
         self,
         user_agent: str = "WashbotSEO/1.0",
         cache_ttl: int = 86400,
-        request_timeout: int = 10
+        request_timeout: int = 10,
+        negative_ttl: int = NEGATIVE_CACHE_TTL,
+        store: Optional[RobotsStore] = None,
     ):
         """
         Initialize robots checker.
@@ -112,10 +414,17 @@ class RobotsChecker:
             user_agent: User agent string to identify our crawler
             cache_ttl: Cache TTL in seconds (default: 86400 = 24 hours)
             request_timeout: Timeout for robots.txt fetch in seconds
+            negative_ttl: Cache TTL for failed fetches in seconds
+            store: Shared store for fetch results (None = in-process only)
         """
         self.user_agent = user_agent
         self.request_timeout = request_timeout
-        self.cache = RobotsTxtCache(ttl_seconds=cache_ttl)
+        self.negative_ttl = negative_ttl
+        self.cache = RobotsTxtCache(ttl_seconds=cache_ttl, store=store)
+
+        # Single-flight: domain -> event set when its fetch finishes
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
 
         logger.info(f"RobotsChecker initialized with user_agent='{user_agent}'")
 
@@ -132,7 +441,13 @@ class RobotsChecker:
         parsed = urlparse(url)
         return f"{parsed.scheme}://{parsed.netloc}/robots.txt"
 
-    def _fetch_robots_txt(self, domain: str, robots_url: str) -> Optional[RobotFileParser]:
+    def _entry(self, status: str, body: str = "") -> RobotsEntry:
+        """Build a cache entry with the TTL for its status."""
+        now = time.time()
+        ttl = self.negative_ttl if status == STATUS_UNAVAILABLE else self.cache.ttl
+        return RobotsEntry(status, body, now, now + ttl)
+
+    def _fetch_robots_txt(self, domain: str, robots_url: str) -> RobotsEntry:
         """
         Fetch and parse robots.txt file.
 
@@ -141,7 +456,7 @@ class RobotsChecker:
             robots_url: URL to robots.txt file
 
         Returns:
-            RobotFileParser if successful, None otherwise
+            RobotsEntry (status unavailable if the fetch failed)
         """
         try:
             logger.debug(f"Fetching robots.txt from {robots_url}")
@@ -155,64 +470,83 @@ class RobotsChecker:
             )
 
             # Handle different status codes
-            if response.status_code == 404:
-                logger.info(f"No robots.txt found for {domain} (404) - assuming allowed")
-                # Create empty parser (allows all)
-                parser = RobotFileParser()
-                parser.parse([])
-                return parser
+            if response.status_code in (404, 410):
+                logger.info(f"No robots.txt found for {domain} ({response.status_code}) - assuming allowed")
+                return self._entry(STATUS_MISSING)
 
             elif response.status_code == 200:
                 logger.debug(f"Successfully fetched robots.txt for {domain}")
-
-                # Parse robots.txt content
-                parser = RobotFileParser()
-                parser.parse(response.text.splitlines())
-                return parser
+                return self._entry(STATUS_OK, response.text[:MAX_ROBOTS_BYTES])
 
             else:
                 logger.warning(
                     f"Unexpected status {response.status_code} for {robots_url} - assuming disallowed"
                 )
-                return None
 
         except requests.Timeout:
             logger.warning(f"Timeout fetching robots.txt from {robots_url} - assuming disallowed")
-            return None
 
         except requests.RequestException as e:
             logger.error(f"Error fetching robots.txt from {robots_url}: {e} - assuming disallowed")
-            return None
 
         except Exception as e:
             logger.error(f"Unexpected error parsing robots.txt from {robots_url}: {e}", exc_info=True)
-            return None
 
-    def _get_parser(self, url: str) -> Optional[RobotFileParser]:
+        return self._entry(STATUS_UNAVAILABLE)
+
+    def _refresh(self, domain: str, robots_url: str) -> RobotsEntry:
+        """Fetch and cache a domain's robots.txt, keeping stale rules if the fetch fails."""
+        entry = self._fetch_robots_txt(domain, robots_url)
+
+        if entry.status == STATUS_UNAVAILABLE:
+            stale = self.cache.get(domain, include_expired=True)
+            if stale and stale.rules is not None:
+                logger.info(f"Using stale robots.txt for {domain} until {self.negative_ttl}s retry")
+                entry = RobotsEntry(stale.status, stale.body, stale.fetched_at, entry.expires_at, stale.rules)
+
+        self.cache.set(domain, entry)
+        return entry
+
+    def _get_parser(self, url: str) -> Optional[RobotsRules]:
         """
-        Get RobotFileParser for a URL (cached or fetched).
+        Get RobotsRules for a URL (cached or fetched).
+
+        Only one thread fetches a given domain at a time; the others wait
+        for its result.
 
         Args:
             url: URL to check
 
         Returns:
-            RobotFileParser if available, None otherwise
+            RobotsRules if available, None if robots.txt could not be fetched
         """
         parsed = urlparse(url)
         domain = parsed.netloc
-        robots_url = self._get_robots_url(url)
 
         # Check cache first
-        parser = self.cache.get(domain)
-        if parser:
-            return parser
+        entry = self.cache.get(domain)
+        if entry:
+            return entry.rules
 
-        # Fetch and cache
-        parser = self._fetch_robots_txt(domain, robots_url)
-        if parser:
-            self.cache.set(domain, parser)
+        with self._inflight_lock:
+            event = self._inflight.get(domain)
+            leader = event is None
+            if leader:
+                event = self._inflight[domain] = threading.Event()
 
-        return parser
+        if not leader:
+            event.wait(self.request_timeout * 2)
+            entry = self.cache.get(domain, include_expired=True)
+            return entry.rules if entry else None
+
+        try:
+            # Re-check: a fetch may have finished since the first lookup
+            entry = self.cache.get(domain) or self._refresh(domain, self._get_robots_url(url))
+            return entry.rules
+        finally:
+            with self._inflight_lock:
+                del self._inflight[domain]
+            event.set()
 
     def is_allowed(self, url: str, user_agent: Optional[str] = None) -> bool:
         """
@@ -313,12 +647,21 @@ class RobotsChecker:
             dict: Statistics including cache size, user agent, etc.
         """
         with self.cache.lock:
-            return {
-                'user_agent': self.user_agent,
-                'cache_size': len(self.cache.cache),
-                'cache_ttl_seconds': self.cache.ttl.total_seconds(),
-                'request_timeout': self.request_timeout,
-            }
+            entries = list(self.cache.cache.values())
+        with self._inflight_lock:
+            inflight = len(self._inflight)
+
+        return {
+            'user_agent': self.user_agent,
+            'cache_size': len(entries),
+            'negative_entries': sum(1 for e in entries if e.status == STATUS_UNAVAILABLE),
+            'expired_entries': sum(1 for e in entries if e.expired),
+            'inflight_fetches': inflight,
+            'cache_ttl_seconds': self.cache.ttl,
+            'negative_ttl_seconds': self.negative_ttl,
+            'request_timeout': self.request_timeout,
+            'shared_store': self.cache.store.path if self.cache.store else None,
+        }
 
 
 # Module-level singleton
@@ -326,11 +669,23 @@ _robots_checker_instance = None
 
 
 def get_robots_checker(user_agent: str = "WashbotSEO/1.0") -> RobotsChecker:
-    """Get or create the singleton RobotsChecker instance."""
+    """
+    Get or create the singleton RobotsChecker instance.
+
+    The singleton uses the shared store at ROBOTS_CACHE_DB (default
+    data/robots_cache.db); set it to "off" for an in-process cache only.
+    """
     global _robots_checker_instance
 
     if _robots_checker_instance is None:
-        _robots_checker_instance = RobotsChecker(user_agent=user_agent)
+        store = None
+        store_path = os.getenv("ROBOTS_CACHE_DB", str(DEFAULT_STORE_PATH))
+        if store_path and store_path.lower() not in ("off", "none", "memory", ":memory:"):
+            try:
+                store = RobotsStore(store_path)
+            except Exception as e:
+                logger.warning(f"Shared robots store unavailable ({e}); using in-process cache")
+        _robots_checker_instance = RobotsChecker(user_agent=user_agent, store=store)
 
     return _robots_checker_instance
 
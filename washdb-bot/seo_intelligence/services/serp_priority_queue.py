@@ -9,17 +9,27 @@ Prioritizes companies for SERP scraping based on:
 
 This ensures efficient use of limited scraping capacity by focusing on
 the most important companies first.
+
+Priorities are materialized in the serp_priority_queue table (migration 032).
+Scoring lives in SQL only (serp_priority() and friends); triggers on companies
+keep the table current, and new serp_snapshots are applied in batches before
+each claim (in their own short transactions, so claims never wait on them).
+Workers claim
+batches atomically (FOR UPDATE SKIP LOCKED with a lease), so several SERP
+scrapers can run without overlapping.
 """
 
 import os
+import socket
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import IntEnum
 
-from sqlalchemy import text, create_engine
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 logger = get_logger("serp_priority_queue")
@@ -46,6 +56,7 @@ class QueuedCompany:
     is_high_value: bool
     services: List[str]
     score_factors: Dict[str, float]
+    address: Optional[str] = None
 
 
 class SerpPriorityQueue:
@@ -57,85 +68,126 @@ class SerpPriorityQueue:
     """
 
     # High-value services that indicate important companies
+    # (mirrored by serp_is_high_value() in migration 032)
     HIGH_VALUE_SERVICES = [
         'pressure_washing', 'power_washing',
         'window_cleaning', 'commercial_cleaning',
         'soft_washing', 'roof_cleaning',
     ]
 
-    # Freshness thresholds (days)
+    # Freshness thresholds (days) applied by serp_priority() in migration 032
     STALE_THRESHOLD = 30     # Consider stale after 30 days
     VERY_STALE_THRESHOLD = 60  # Very stale after 60 days
     FRESH_THRESHOLD = 14     # Fresh if scraped within 14 days
 
+    # Default claim lease (minutes) before a claimed company is reclaimable
+    DEFAULT_LEASE_MINUTES = 60
+
+    # Most expired rows re-scored per refresh (the rest on later refreshes)
+    REFRESH_BATCH_SIZE = 1000
+
+    # Columns selected for QueuedCompany rows (q = serp_priority_queue, c = companies)
+    QUEUE_COLUMNS = """
+        q.company_id, c.name, c.website, c.address, c.parse_metadata,
+        q.last_scraped, q.has_complete_profile, q.is_high_value, q.priority,
+        EXTRACT(DAY FROM (NOW() - q.last_scraped)) AS days_since_scrape
+    """
+
     def __init__(self):
         """Initialize the priority queue service."""
         database_url = os.getenv("DATABASE_URL")
         if database_url:
-            self.engine = create_engine(database_url, echo=False)
+            self.engine = get_engine(database_url)
         else:
             self.engine = None
             logger.warning("DATABASE_URL not set - queue disabled")
 
-    def _calculate_priority(
-        self,
-        last_scraped: Optional[datetime],
-        is_high_value: bool,
-        has_complete_profile: bool
-    ) -> Priority:
-        """
-        Calculate priority based on scrape history and company value.
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    def _row_to_queued(self, row) -> QueuedCompany:
+        """Build a QueuedCompany from a QUEUE_COLUMNS row."""
+        parse_metadata = row[4] or {}
+        last_scraped = row[5]
+        has_complete_profile = row[6]
+        is_high_value = row[7]
+        days_since_scrape = int(row[9]) if row[9] is not None else None
+
+        # Extract services from metadata
+        services = []
+        llm_class = parse_metadata.get('verification', {}).get('llm_classification', {})
+        if llm_class:
+            services = llm_class.get('services', [])
+
+        # Score factors for transparency
+        score_factors = {
+            'never_scraped': 1.0 if last_scraped is None else 0.0,
+            'high_value': 1.0 if is_high_value else 0.0,
+            'complete_profile': 1.0 if has_complete_profile else 0.5,
+            'staleness': min(1.0, (days_since_scrape or 365) / 90),
+        }
 
-        Args:
-            last_scraped: When the company was last scraped (None if never)
-            is_high_value: True if company has high-value services
-            has_complete_profile: True if company has complete info
+        return QueuedCompany(
+            company_id=row[0],
+            name=row[1],
+            website=row[2],
+            priority=Priority(row[8]),
+            last_scraped=last_scraped,
+            days_since_scrape=days_since_scrape,
+            is_high_value=is_high_value,
+            services=services,
+            score_factors=score_factors,
+            address=row[3],
+        )
 
-        Returns:
-            Priority level
+    @staticmethod
+    def _sort_key(company: QueuedCompany):
+        """Queue order: tier, never scraped first, oldest scrape, ID."""
+        return (
+            company.priority.value,
+            company.last_scraped is not None,
+            company.last_scraped or datetime.min,
+            company.company_id,
+        )
+
+    def _refresh_expired(self) -> int:
         """
-        if last_scraped is None:
-            # Never scraped - highest priority
-            if is_high_value:
-                return Priority.CRITICAL
-            else:
-                return Priority.HIGH
-
-        days_since_scrape = (datetime.now() - last_scraped).days
-
-        if days_since_scrape < self.FRESH_THRESHOLD:
-            # Recently scraped - skip unless critical
-            return Priority.SKIP
-
-        if days_since_scrape > self.VERY_STALE_THRESHOLD:
-            # Very stale
-            if is_high_value:
-                return Priority.HIGH
-            else:
-                return Priority.MEDIUM
-
-        if days_since_scrape > self.STALE_THRESHOLD:
-            # Stale
-            if is_high_value:
-                return Priority.MEDIUM
-            else:
-                return Priority.LOW
-
-        # Moderately fresh
-        return Priority.LOW
-
-    def _is_high_value(self, services: List[str]) -> bool:
-        """Check if company has high-value services."""
-        if not services:
-            return False
+        Apply new SERP snapshots, then re-score rows whose staleness tier has
+        changed since they were scored.
 
-        for service in services:
-            service_lower = service.lower()
-            for high_value in self.HIGH_VALUE_SERVICES:
-                if high_value in service_lower:
-                    return True
+        Each step commits on its own, before the caller's claim transaction.
+        Expired rows are re-scored in batches of REFRESH_BATCH_SIZE, skipping
+        rows another worker holds, so concurrent claims do not serialize on
+        the refresh.
 
-        return False
+        Returns:
+            Number of rows re-scored
+        """
+        with Session(self.engine) as session:
+            session.execute(text("SELECT serp_priority_queue_sync_snapshots()"))
+            session.commit()
+
+        with Session(self.engine) as session:
+            result = session.execute(
+                text("""
+                    WITH expired AS (
+                        SELECT company_id
+                        FROM serp_priority_queue
+                        WHERE priority_expires_at <= NOW()
+                        ORDER BY priority_expires_at
+                        LIMIT :limit
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    UPDATE serp_priority_queue q
+                    SET priority = serp_priority(q.last_scraped, q.is_high_value),
+                        priority_expires_at = serp_priority_expires_at(q.last_scraped),
+                        updated_at = NOW()
+                    FROM expired
+                    WHERE q.company_id = expired.company_id
+                """),
+                {'limit': self.REFRESH_BATCH_SIZE}
+            )
+            session.commit()
+            return result.rowcount or 0
 
     def get_next_batch(
         self,
@@ -146,6 +198,9 @@ class SerpPriorityQueue:
         """
         Get the next batch of companies to scrape, ordered by priority.
 
+        This is a read-only preview; workers should use claim_batch() so
+        concurrent scrapers do not pick the same companies.
+
         Args:
             limit: Maximum number of companies to return
             priority_filter: Only return companies with this priority or higher
@@ -157,124 +212,260 @@ class SerpPriorityQueue:
         if not self.engine:
             return []
 
-        exclude_ids = exclude_ids or []
-        exclude_clause = ""
-        if exclude_ids:
-            exclude_clause = f"AND c.id NOT IN ({','.join(map(str, exclude_ids))})"
-
-        # Query companies with their SERP scrape history
-        # Uses standardized schema: verified=true for verified companies
-        query = f"""
-            WITH company_serp_status AS (
-                SELECT
-                    c.id as company_id,
-                    c.name,
-                    c.website,
-                    c.parse_metadata,
-                    -- Get last SERP scrape time
-                    (
-                        SELECT MAX(ss.scraped_at)
-                        FROM serp_snapshots ss
-                        JOIN search_queries sq ON sq.query_id = ss.query_id
-                        WHERE sq.query_text LIKE '%' || c.name || '%'
-                    ) as last_scraped,
-                    -- Check for complete profile
-                    CASE
-                        WHEN c.website IS NOT NULL
-                            AND c.name IS NOT NULL
-                            AND (c.parse_metadata->>'services_text') IS NOT NULL
-                        THEN true
-                        ELSE false
-                    END as has_complete_profile
-                FROM companies c
-                WHERE c.verified = true
-                  AND c.website IS NOT NULL
-                  {exclude_clause}
-            )
-            SELECT
-                company_id,
-                name,
-                website,
-                parse_metadata,
-                last_scraped,
-                has_complete_profile,
-                EXTRACT(DAY FROM (NOW() - last_scraped)) as days_since_scrape
-            FROM company_serp_status
-            ORDER BY
-                -- Never scraped first
-                CASE WHEN last_scraped IS NULL THEN 0 ELSE 1 END,
-                -- Then by days since last scrape (oldest first)
-                COALESCE(EXTRACT(DAY FROM (NOW() - last_scraped)), 9999) DESC,
-                -- Then by ID (consistent ordering)
-                company_id
-            LIMIT :limit
+        max_priority = priority_filter.value if priority_filter else Priority.LOW.value
+
+        try:
+            self._refresh_expired()
+
+            with Session(self.engine) as session:
+                result = session.execute(
+                    text(f"""
+                        SELECT {self.QUEUE_COLUMNS}
+                        FROM serp_priority_queue q
+                        JOIN companies c ON c.id = q.company_id
+                        WHERE q.priority <= :max_priority
+                          AND NOT (q.company_id = ANY(:exclude_ids))
+                        ORDER BY q.priority, q.last_scraped NULLS FIRST, q.company_id
+                        LIMIT :limit
+                    """),
+                    {
+                        'max_priority': min(max_priority, Priority.LOW.value),
+                        'exclude_ids': list(exclude_ids or []),
+                        'limit': limit,
+                    }
+                )
+                return [self._row_to_queued(row) for row in result]
+
+        except Exception as e:
+            logger.error(f"Error fetching priority queue: {e}", exc_info=True)
+            return []
+
+    def claim_batch(
+        self,
+        limit: int = 10,
+        priority_filter: Optional[Priority] = None,
+        exclude_ids: Optional[List[int]] = None,
+        worker_id: Optional[str] = None,
+        lease_minutes: Optional[int] = None
+    ) -> List[QueuedCompany]:
         """
+        Atomically claim the next batch of companies for this worker.
+
+        Uses FOR UPDATE SKIP LOCKED so concurrent workers never receive the
+        same company. Claims expire after the lease so crashed workers do
+        not strand companies.
+
+        Args:
+            limit: Maximum number of companies to claim
+            priority_filter: Only claim companies with this priority or higher
+            exclude_ids: Company IDs to exclude
+            worker_id: Claim owner (default: hostname:pid)
+            lease_minutes: Claim lease (default: DEFAULT_LEASE_MINUTES)
+
+        Returns:
+            Claimed QueuedCompany objects in queue order
+        """
+        if not self.engine:
+            return []
 
-        queued = []
+        max_priority = priority_filter.value if priority_filter else Priority.LOW.value
 
         try:
+            self._refresh_expired()
+
             with Session(self.engine) as session:
                 result = session.execute(
-                    text(query),
-                    {'limit': limit * 2}  # Fetch extra to filter by priority
+                    text(f"""
+                        WITH next AS (
+                            SELECT company_id
+                            FROM serp_priority_queue
+                            WHERE priority <= :max_priority
+                              AND (claimed_until IS NULL OR claimed_until < NOW())
+                              AND NOT (company_id = ANY(:exclude_ids))
+                            ORDER BY priority, last_scraped NULLS FIRST, company_id
+                            LIMIT :limit
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        UPDATE serp_priority_queue q
+                        SET claimed_by = :worker_id,
+                            claimed_until = NOW() + make_interval(mins => :lease_minutes)
+                        FROM next, companies c
+                        WHERE q.company_id = next.company_id
+                          AND c.id = q.company_id
+                        RETURNING {self.QUEUE_COLUMNS}
+                    """),
+                    {
+                        'max_priority': min(max_priority, Priority.LOW.value),
+                        'exclude_ids': list(exclude_ids or []),
+                        'limit': limit,
+                        'worker_id': worker_id or self.worker_id,
+                        'lease_minutes': lease_minutes or self.DEFAULT_LEASE_MINUTES,
+                    }
                 )
+                claimed = [self._row_to_queued(row) for row in result]
+                session.commit()
 
-                for row in result:
-                    company_id = row[0]
-                    name = row[1]
-                    website = row[2]
-                    parse_metadata = row[3] or {}
-                    last_scraped = row[4]
-                    has_complete_profile = row[5]
-                    days_since_scrape = int(row[6]) if row[6] else None
-
-                    # Extract services from metadata
-                    services = []
-                    llm_class = parse_metadata.get('verification', {}).get('llm_classification', {})
-                    if llm_class:
-                        services = llm_class.get('services', [])
-
-                    # Calculate priority
-                    is_high_value = self._is_high_value(services)
-                    priority = self._calculate_priority(
-                        last_scraped, is_high_value, has_complete_profile
-                    )
+        except Exception as e:
+            logger.error(f"Error claiming from priority queue: {e}", exc_info=True)
+            return []
 
-                    # Apply priority filter
-                    if priority_filter and priority.value > priority_filter.value:
-                        continue
+        claimed.sort(key=self._sort_key)
+        logger.debug(f"Claimed {len(claimed)} companies for {worker_id or self.worker_id}")
+        return claimed
 
-                    # Skip low priority unless we need them
-                    if priority == Priority.SKIP:
-                        continue
+    def complete(self, company_id: int, success: bool = True) -> bool:
+        """
+        Finish a claimed company.
 
-                    # Score factors for transparency
-                    score_factors = {
-                        'never_scraped': 1.0 if last_scraped is None else 0.0,
-                        'high_value': 1.0 if is_high_value else 0.0,
-                        'complete_profile': 1.0 if has_complete_profile else 0.5,
-                        'staleness': min(1.0, (days_since_scrape or 365) / 90),
-                    }
+        On success the company is marked scraped now and re-scored (snapshot
+        syncing also records scrapes, but only for queries whose text contains
+        the company name). Either way the claim is released.
 
-                    queued.append(QueuedCompany(
-                        company_id=company_id,
-                        name=name,
-                        website=website,
-                        priority=priority,
-                        last_scraped=last_scraped,
-                        days_since_scrape=days_since_scrape,
-                        is_high_value=is_high_value,
-                        services=services,
-                        score_factors=score_factors
-                    ))
-
-                    if len(queued) >= limit:
-                        break
+        Args:
+            company_id: Company ID
+            success: True if the SERP scrape succeeded
 
+        Returns:
+            True if the queue row was updated
+        """
+        if not self.engine:
+            return False
+
+        if success:
+            query = """
+                UPDATE serp_priority_queue
+                SET last_scraped = NOW(),
+                    priority = serp_priority(NOW()::timestamp, is_high_value),
+                    priority_expires_at = serp_priority_expires_at(NOW()::timestamp),
+                    claimed_by = NULL,
+                    claimed_until = NULL,
+                    updated_at = NOW()
+                WHERE company_id = :company_id
+            """
+        else:
+            query = """
+                UPDATE serp_priority_queue
+                SET claimed_by = NULL,
+                    claimed_until = NULL
+                WHERE company_id = :company_id
+            """
+
+        try:
+            with Session(self.engine) as session:
+                result = session.execute(text(query), {'company_id': company_id})
+                session.commit()
+                return (result.rowcount or 0) > 0
         except Exception as e:
-            logger.error(f"Error fetching priority queue: {e}", exc_info=True)
+            logger.error(f"Error completing company {company_id}: {e}", exc_info=True)
+            return False
+
+    def release(self, company_ids: List[int]) -> int:
+        """
+        Release claims without recording a scrape.
+
+        Args:
+            company_ids: Company IDs to release
 
-        return queued
+        Returns:
+            Number of claims released
+        """
+        if not self.engine or not company_ids:
+            return 0
+
+        try:
+            with Session(self.engine) as session:
+                result = session.execute(
+                    text("""
+                        UPDATE serp_priority_queue
+                        SET claimed_by = NULL,
+                            claimed_until = NULL
+                        WHERE company_id = ANY(:company_ids)
+                    """),
+                    {'company_ids': list(company_ids)}
+                )
+                session.commit()
+                return result.rowcount or 0
+        except Exception as e:
+            logger.error(f"Error releasing claims: {e}", exc_info=True)
+            return 0
+
+    def rebuild(self) -> int:
+        """
+        Resynchronize the queue from companies and serp_snapshots.
+
+        This is the full (slow) scoring query; the triggers and snapshot sync
+        keep the table current, so this is only needed for maintenance or
+        after bulk loads that bypassed them.
+
+        Returns:
+            Number of queue rows after the rebuild
+        """
+        if not self.engine:
+            return 0
+
+        try:
+            with Session(self.engine) as session:
+                session.execute(text("""
+                    DELETE FROM serp_priority_queue q
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM companies c
+                        WHERE c.id = q.company_id
+                          AND c.verified = true
+                          AND c.website IS NOT NULL
+                    )
+                """))
+                session.execute(text("""
+                    INSERT INTO serp_priority_queue (
+                        company_id, is_high_value, has_complete_profile, last_scraped,
+                        priority, priority_expires_at, updated_at
+                    )
+                    SELECT
+                        s.company_id,
+                        s.is_high_value,
+                        s.has_complete_profile,
+                        s.last_scraped,
+                        serp_priority(s.last_scraped, s.is_high_value),
+                        serp_priority_expires_at(s.last_scraped),
+                        NOW()
+                    FROM (
+                        SELECT
+                            c.id AS company_id,
+                            serp_is_high_value(c.parse_metadata) AS is_high_value,
+                            c.name IS NOT NULL
+                                AND (c.parse_metadata->>'services_text') IS NOT NULL
+                                AS has_complete_profile,
+                            (
+                                SELECT MAX(ss.captured_at)
+                                FROM serp_snapshots ss
+                                JOIN search_queries sq ON sq.query_id = ss.query_id
+                                WHERE sq.query_text LIKE '%' || c.name || '%'
+                            ) AS last_scraped
+                        FROM companies c
+                        WHERE c.verified = true
+                          AND c.website IS NOT NULL
+                    ) s
+                    ON CONFLICT (company_id) DO UPDATE SET
+                        is_high_value = EXCLUDED.is_high_value,
+                        has_complete_profile = EXCLUDED.has_complete_profile,
+                        last_scraped = GREATEST(serp_priority_queue.last_scraped, EXCLUDED.last_scraped),
+                        priority = serp_priority(
+                            GREATEST(serp_priority_queue.last_scraped, EXCLUDED.last_scraped),
+                            EXCLUDED.is_high_value
+                        ),
+                        priority_expires_at = serp_priority_expires_at(
+                            GREATEST(serp_priority_queue.last_scraped, EXCLUDED.last_scraped)
+                        ),
+                        updated_at = NOW()
+                """))
+                total = session.execute(text("SELECT COUNT(*) FROM serp_priority_queue")).scalar() or 0
+                session.commit()
+
+            logger.info(f"Rebuilt SERP priority queue: {total} companies")
+            return total
+
+        except Exception as e:
+            logger.error(f"Error rebuilding priority queue: {e}", exc_info=True)
+            return 0
 
     def get_tier_counts(self) -> Dict[str, int]:
         """
@@ -286,22 +477,7 @@ class SerpPriorityQueue:
         if not self.engine:
             return {}
 
-        # Uses standardized schema: verified=true for verified companies
         query = """
-            WITH company_status AS (
-                SELECT
-                    c.id,
-                    c.parse_metadata,
-                    (
-                        SELECT MAX(ss.scraped_at)
-                        FROM serp_snapshots ss
-                        JOIN search_queries sq ON sq.query_id = ss.query_id
-                        WHERE sq.query_text LIKE '%' || c.name || '%'
-                    ) as last_scraped
-                FROM companies c
-                WHERE c.verified = true
-                  AND c.website IS NOT NULL
-            )
             SELECT
                 CASE
                     WHEN last_scraped IS NULL THEN 'never_scraped'
@@ -311,7 +487,7 @@ class SerpPriorityQueue:
                     ELSE 'fresh'
                 END as status,
                 COUNT(*) as count
-            FROM company_status
+            FROM serp_priority_queue
             GROUP BY status
         """
 
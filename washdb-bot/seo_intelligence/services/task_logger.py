@@ -18,9 +18,10 @@ from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 # Load environment
@@ -56,7 +57,7 @@ class TaskLogger:
         if not database_url:
             raise RuntimeError("DATABASE_URL not set in environment")
 
-        self.engine = create_engine(database_url, echo=False)
+        self.engine = get_engine(database_url)
         logger.info("TaskLogger initialized")
 
     def start_task(
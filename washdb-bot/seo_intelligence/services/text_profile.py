@@ -0,0 +1,473 @@
+"""
+Text Profile Service
+
+Computes page text statistics once and shares them across the SEO analyzers.
+
+ReadabilityAnalyzer, EngagementAnalyzer, ContentGapAnalyzer and CompetitorParser
+all tokenize the same page text. A TextProfile wraps that text and computes each
+statistic lazily on first access, so a page is tokenized at most once per
+tokenization style no matter how many analyzers consume it.
+
+Features:
+- Profiles keyed by SHA-256 content hash (thread-safe LRU)
+- Lazy fields: tokens, sentences, syllables, n-grams and headings
+- Memoized per-word syllable counting (LRU word cache)
+- HTML profiles share one BeautifulSoup parse for text, paragraphs and headings
+
+Usage:
+    from seo_intelligence.services.text_profile import get_text_profiler
+
+    profiler = get_text_profiler()
+    profile = profiler.profile_html(html)
+
+    profile.words            # Readability word tokens
+    profile.sentences        # Sentences
+    profile.syllable_count   # Total syllables
+    profile.term_counts      # Counter of content terms (stop words removed)
+    profile.bigram_counts    # Counter of adjacent term pairs
+    profile.headings         # Heading lines
+"""
+
+import hashlib
+import re
+import string
+import threading
+from collections import Counter, OrderedDict
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from runner.logging_setup import get_logger
+
+logger = get_logger("text_profile")
+
+
+# Words whose syllable count the vowel-group heuristic gets wrong
+SYLLABLE_EXCEPTIONS = {
+    "area": 3, "idea": 3, "real": 2, "ruin": 2, "science": 2,
+    "create": 2, "creature": 2, "feature": 2, "measure": 2,
+    "employee": 3, "every": 3, "evening": 3, "everything": 4,
+    "business": 2, "different": 3, "family": 3, "interest": 3,
+    "favorite": 3, "separate": 3, "chocolate": 3, "comfortable": 4,
+    "temperature": 4, "vegetable": 4, "literature": 4, "dictionary": 4,
+}
+
+# Stop words excluded from topic terms
+STOP_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
+    "it", "its", "this", "that", "these", "those", "i", "you", "he", "she",
+    "we", "they", "what", "which", "who", "whom", "all", "each", "every",
+    "no", "not", "only", "own", "same", "so", "than", "too", "very",
+    "can", "will", "just", "don", "should", "now", "your", "our", "my",
+    "their", "his", "her", "have", "has", "had", "do", "does", "did",
+})
+
+# Abbreviations that must not end a sentence
+ABBREVIATIONS = [
+    'Mr.', 'Mrs.', 'Ms.', 'Dr.', 'Prof.', 'Jr.', 'Sr.',
+    'Inc.', 'Ltd.', 'Corp.', 'Co.',
+    'vs.', 'etc.', 'e.g.', 'i.e.',
+    'a.m.', 'p.m.', 'A.M.', 'P.M.',
+    'U.S.', 'U.K.', 'U.N.',
+]
+
+# Elements that never contain readable body text
+NON_CONTENT_TAGS = ['script', 'style', 'header', 'footer', 'nav', 'aside']
+
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+\s+')
+_NON_WORD_RE = re.compile(r"[^\w\s'-]")
+_WHITESPACE_RE = re.compile(r'\s+')
+_WORD_TOKEN_RE = re.compile(r'\b\w+\b')
+_TERM_RE = re.compile(r'\b[a-z]+\b')
+_MD_HEADING_RE = re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE)
+_HTML_HEADING_RE = re.compile(r'<h[1-6][^>]*>([^<]+)</h[1-6]>', re.IGNORECASE)
+
+
+@lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """
+    Count syllables in a word using English phonology rules.
+
+    Results are memoized per word; page vocabularies overlap heavily,
+    so most lookups after the first few pages are cache hits.
+
+    Args:
+        word: Word to count syllables for
+
+    Returns:
+        int: Number of syllables (0 for empty input)
+    """
+    word = word.lower().strip()
+
+    # Remove punctuation
+    word = word.strip(string.punctuation)
+
+    if not word:
+        return 0
+
+    # Check exception list
+    if word in SYLLABLE_EXCEPTIONS:
+        return SYLLABLE_EXCEPTIONS[word]
+
+    # Count vowel groups
+    vowels = "aeiouy"
+    count = 0
+    prev_is_vowel = False
+
+    for char in word:
+        is_vowel = char in vowels
+        if is_vowel and not prev_is_vowel:
+            count += 1
+        prev_is_vowel = is_vowel
+
+    # Handle silent e at end (but not words ending in -le)
+    if word.endswith('e') and count > 1 and not word.endswith('le'):
+        count -= 1
+
+    # Handle -ed endings
+    if word.endswith('ed') and count > 1:
+        if not word.endswith('ted') and not word.endswith('ded'):
+            count -= 1
+
+    # Handle -es endings (-ses, -xes, -zes, -ches, -shes keep the syllable)
+    if word.endswith('es') and count > 1:
+        if not word.endswith(('ses', 'xes', 'zes', 'ches', 'shes')):
+            count -= 1
+
+    # Ensure at least one syllable
+    return max(1, count)
+
+
+def tokenize_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences, protecting common abbreviations.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of sentences
+    """
+    protected_text = text
+    for abbrev in ABBREVIATIONS:
+        if abbrev in protected_text:
+            protected_text = protected_text.replace(abbrev, abbrev.replace('.', '<DOT>'))
+
+    sentences = _SENTENCE_SPLIT_RE.split(protected_text)
+
+    return [s.replace('<DOT>', '.').strip() for s in sentences if s.strip()]
+
+
+def tokenize_words(text: str) -> List[str]:
+    """
+    Split text into words for readability scoring.
+
+    Punctuation is dropped except apostrophes and hyphens within words;
+    numbers and single characters are filtered out.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of words
+    """
+    text = _NON_WORD_RE.sub(' ', text)
+    words = text.split()
+
+    return [w for w in words if len(w) > 1 and not w.isdigit()]
+
+
+def extract_text_headings(content: str) -> List[str]:
+    """
+    Extract heading-like lines from text, markdown or HTML content.
+
+    Args:
+        content: HTML or text content
+
+    Returns:
+        list: Heading texts (max 30)
+    """
+    headings = []
+    seen_lower = set()
+
+    # Markdown-style and HTML headings
+    for heading in _MD_HEADING_RE.findall(content) + _HTML_HEADING_RE.findall(content):
+        headings.append(heading)
+        seen_lower.add(heading.lower())
+
+    # Title-case lines that might be headings
+    for line in content.split('\n'):
+        line = line.strip()
+        if (10 < len(line) < 100 and
+                line[0].isupper() and
+                not line.endswith('.') and
+                line.count(' ') < 10):
+            line_lower = line.lower()
+            if line_lower not in seen_lower:
+                headings.append(line)
+                seen_lower.add(line_lower)
+
+    return headings[:30]
+
+
+class TextProfile:
+    """
+    Lazily computed text statistics for a single page.
+
+    Every attribute below is computed on first access and then cached on the
+    instance, so analyzers sharing a profile never repeat a tokenization.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        content_hash: str,
+        paragraph_count: int = 1,
+        html_headings: Optional[List[Tuple[int, str]]] = None,
+    ):
+        """
+        Initialize a profile.
+
+        Args:
+            text: Plain text of the page
+            content_hash: SHA-256 of the profiled content
+            paragraph_count: Paragraph count (from HTML structure when available)
+            html_headings: (level, text) pairs when profiled from HTML
+        """
+        self.text = text
+        self.content_hash = content_hash
+        self.paragraph_count = paragraph_count
+        self.html_headings = html_headings or []
+
+    @cached_property
+    def lower(self) -> str:
+        """Lower-cased text."""
+        return self.text.lower()
+
+    @cached_property
+    def raw_words(self) -> List[str]:
+        """Whitespace-separated tokens."""
+        return self.text.split()
+
+    @cached_property
+    def word_tokens(self) -> List[str]:
+        r"""Regex word tokens (``\b\w+\b``), including numbers."""
+        return _WORD_TOKEN_RE.findall(self.text)
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Readability word tokens (see tokenize_words)."""
+        return tokenize_words(self.text)
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Sentences (see tokenize_sentences)."""
+        return tokenize_sentences(self.text)
+
+    @cached_property
+    def syllable_counts(self) -> List[int]:
+        """Syllable count per readability word."""
+        return [count_syllables(w) for w in self.words]
+
+    @cached_property
+    def syllable_count(self) -> int:
+        """Total syllables across readability words."""
+        return sum(self.syllable_counts)
+
+    @cached_property
+    def character_count(self) -> int:
+        """Total characters across readability words."""
+        return sum(len(w) for w in self.words)
+
+    @cached_property
+    def terms(self) -> List[str]:
+        """Lower-case alphabetic terms with stop words and short words removed."""
+        return [
+            w for w in _TERM_RE.findall(self.lower)
+            if w not in STOP_WORDS and len(w) > 2
+        ]
+
+    @cached_property
+    def term_counts(self) -> Counter:
+        """Term frequencies."""
+        return Counter(self.terms)
+
+    @cached_property
+    def bigram_counts(self) -> Counter:
+        """Frequencies of adjacent term pairs ("a b")."""
+        terms = self.terms
+        return Counter(f"{a} {b}" for a, b in zip(terms, terms[1:]))
+
+    @cached_property
+    def headings(self) -> List[str]:
+        """Heading lines found in the text (see extract_text_headings)."""
+        return extract_text_headings(self.text)
+
+    @cached_property
+    def headings_lower(self) -> List[str]:
+        """Lower-cased heading lines."""
+        return [h.lower() for h in self.headings]
+
+
+class TextProfiler:
+    """
+    Builds and caches TextProfiles keyed by content hash.
+
+    Profiles are held in a thread-safe LRU so that analyzers running
+    back-to-back on the same page (or the same text re-analyzed on a
+    later call) reuse the already-computed statistics.
+    """
+
+    def __init__(self, max_size: int = 128):
+        """
+        Initialize the profiler.
+
+        Args:
+            max_size: Maximum number of cached profiles (LRU eviction)
+        """
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.cache: OrderedDict[str, TextProfile] = OrderedDict()
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        }
+
+        logger.info(f"TextProfiler initialized: max_size={max_size}")
+
+    @staticmethod
+    def _hash(content: str, kind: str) -> str:
+        """Hash content, namespaced by kind so text and HTML never collide."""
+        digest = hashlib.sha256(content.encode('utf-8', errors='replace')).hexdigest()
+        return f"{kind}:{digest}"
+
+    def _get(self, key: str) -> Optional[TextProfile]:
+        with self.lock:
+            profile = self.cache.get(key)
+            if profile is not None:
+                self.cache.move_to_end(key)
+                self.stats['hits'] += 1
+            else:
+                self.stats['misses'] += 1
+            return profile
+
+    def _put(self, key: str, profile: TextProfile, replace: bool = True) -> None:
+        with self.lock:
+            if key in self.cache:
+                if not replace:
+                    return
+            else:
+                while self.cache and len(self.cache) >= self.max_size:
+                    self.cache.popitem(last=False)
+                    self.stats['evictions'] += 1
+            self.cache[key] = profile
+
+    def profile_text(self, text: str) -> TextProfile:
+        """
+        Get the profile for plain text.
+
+        Args:
+            text: Plain text
+
+        Returns:
+            TextProfile: Cached or newly created profile
+        """
+        key = self._hash(text, "text")
+        profile = self._get(key)
+        if profile is None:
+            profile = TextProfile(text, content_hash=key)
+            self._put(key, profile)
+        return profile
+
+    def profile_html(self, html: str) -> TextProfile:
+        """
+        Get the profile for an HTML page.
+
+        The page is parsed once to extract readable text (scripts, styles
+        and page chrome removed), paragraph count and H1-H6 headings. The
+        profile is also registered under its extracted text, so a later
+        profile_text() call with that text reuses it.
+
+        Args:
+            html: HTML content
+
+        Returns:
+            TextProfile: Cached or newly created profile
+        """
+        key = self._hash(html, "html")
+        profile = self._get(key)
+        if profile is not None:
+            return profile
+
+        soup = BeautifulSoup(html, 'html.parser')
+
+        for element in soup(NON_CONTENT_TAGS):
+            element.decompose()
+
+        paragraph_count = len(soup.find_all(['p', 'li', 'dd', 'blockquote']))
+
+        html_headings = []
+        for tag in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+            heading_text = tag.get_text(strip=True)
+            if heading_text:
+                html_headings.append((int(tag.name[1]), heading_text))
+
+        text = _WHITESPACE_RE.sub(' ', soup.get_text(separator=' ')).strip()
+
+        profile = TextProfile(
+            text,
+            content_hash=key,
+            paragraph_count=max(1, paragraph_count),
+            html_headings=html_headings,
+        )
+        self._put(key, profile)
+
+        # Also register under the extracted text (keeps an existing entry)
+        self._put(self._hash(text, "text"), profile, replace=False)
+
+        return profile
+
+    def clear(self) -> None:
+        """Clear all cached profiles."""
+        with self.lock:
+            self.cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Profile cache and syllable cache statistics
+        """
+        with self.lock:
+            total = self.stats['hits'] + self.stats['misses']
+            syllable_info = count_syllables.cache_info()
+            return {
+                'size': len(self.cache),
+                'max_size': self.max_size,
+                'hits': self.stats['hits'],
+                'misses': self.stats['misses'],
+                'hit_rate_pct': (self.stats['hits'] / total * 100) if total else 0.0,
+                'evictions': self.stats['evictions'],
+                'syllable_cache_size': syllable_info.currsize,
+                'syllable_cache_hits': syllable_info.hits,
+                'syllable_cache_misses': syllable_info.misses,
+            }
+
+
+# Module-level singleton
+_text_profiler_instance = None
+
+
+def get_text_profiler(**kwargs) -> TextProfiler:
+    """Get or create the singleton TextProfiler instance."""
+    global _text_profiler_instance
+
+    if _text_profiler_instance is None:
+        _text_profiler_instance = TextProfiler(**kwargs)
+
+    return _text_profiler_instance
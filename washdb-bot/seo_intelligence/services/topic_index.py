@@ -0,0 +1,631 @@
+"""
+Topic Index Service
+
+Inverted topic index for incremental content gap analysis.
+
+Content gap analysis needs, for every topic, the set of competitors that
+cover it. Instead of re-extracting topics from every competitor page on
+every run, pages are indexed once when they are stored (or when their
+content hash changes) and gap analysis becomes an index lookup.
+
+Features:
+- topic -> {(competitor, url): coverage score} postings
+- format -> {(competitor, url)} postings (faq, how_to, ...)
+- Incremental updates keyed by content hash (unchanged pages are skipped)
+- Persistence in content_index_pages / content_topic_index (migration 031)
+- Lazy load of the persisted index for gap analysis, per competitor,
+  reloaded after TOPIC_INDEX_OWNER_TTL_SECONDS (pages are indexed by
+  crawlers in other processes)
+- In-memory index bounded to TOPIC_INDEX_MAX_PAGES pages (least recently
+  indexed/loaded pages are evicted; they stay in the database)
+
+Usage:
+    from seo_intelligence.services.topic_index import get_topic_index
+
+    index = get_topic_index()
+
+    # Called by CompetitorCrawler._save_page
+    index.index_competitor_page(session, competitor_id, url, html, content_hash, page_id)
+
+    # Gap analysis as an index query
+    gaps = get_content_gap_analyzer().analyze_gaps_from_index(your_pages, index)
+"""
+
+import os
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from db.engine_registry import get_engine
+from runner.logging_setup import get_logger
+from seo_intelligence.services.content_gap_analyzer import (
+    ContentGapAnalyzer,
+    get_content_gap_analyzer,
+)
+from seo_intelligence.services.text_profile import get_text_profiler
+
+logger = get_logger("topic_index")
+
+PageKey = Tuple[str, str]  # (owner, url)
+
+# Pages kept in memory; older ones are evicted (and reloaded on demand)
+TOPIC_INDEX_MAX_PAGES = int(os.getenv("TOPIC_INDEX_MAX_PAGES", "20000"))
+
+# Seconds a competitor's lazily loaded pages are served before being reloaded
+TOPIC_INDEX_OWNER_TTL_SECONDS = float(os.getenv("TOPIC_INDEX_OWNER_TTL_SECONDS", "300"))
+
+
+@dataclass
+class IndexedPage:
+    """Index entry for a single page."""
+    owner: str
+    url: str
+    content_hash: str
+    topics: Dict[str, float] = field(default_factory=dict)  # topic -> coverage (0-100)
+    formats: List[str] = field(default_factory=list)
+    word_count: int = 0
+
+
+class TopicIndex:
+    """
+    Thread-safe inverted index of topics and content formats.
+
+    Owners are competitor names/domains; pages are identified by
+    (owner, url) so a re-crawled URL replaces its previous snapshot.
+    """
+
+    def __init__(
+        self,
+        analyzer: Optional[ContentGapAnalyzer] = None,
+        database_url: Optional[str] = None,
+        max_pages: int = TOPIC_INDEX_MAX_PAGES,
+        owner_ttl_seconds: float = TOPIC_INDEX_OWNER_TTL_SECONDS,
+    ):
+        """
+        Initialize topic index.
+
+        Args:
+            analyzer: Analyzer used to extract topics/formats/coverage
+            database_url: Database URL for persistence (default: DATABASE_URL)
+            max_pages: Pages kept in memory before the oldest are evicted
+            owner_ttl_seconds: Reload a competitor's persisted pages after this long
+        """
+        self.analyzer = analyzer or get_content_gap_analyzer()
+        self.profiler = get_text_profiler()
+        self.database_url = database_url or os.getenv("DATABASE_URL")
+        self._engine = None
+
+        self.max_pages = max_pages
+        self.owner_ttl_seconds = owner_ttl_seconds
+
+        self.lock = threading.RLock()
+        self.pages: "OrderedDict[PageKey, IndexedPage]" = OrderedDict()
+        self.owner_pages: Dict[str, Set[PageKey]] = defaultdict(set)
+        self.topic_postings: Dict[str, Dict[PageKey, float]] = defaultdict(dict)
+        self.format_postings: Dict[str, Set[PageKey]] = defaultdict(set)
+        self._competitor_domains: Dict[int, str] = {}
+        # Owners whose persisted pages are all in memory -> when they were loaded
+        self._loaded_owners: Dict[str, float] = {}
+        self.loaded = False
+
+        self.stats = {
+            "pages_indexed": 0,
+            "pages_unchanged": 0,
+            "pages_removed": 0,
+            "pages_evicted": 0,
+        }
+
+        logger.info(f"TopicIndex initialized: max_pages={max_pages}")
+
+    def _get_engine(self):
+        """Get or create the database engine."""
+        if self._engine is None and self.database_url:
+            self._engine = get_engine(self.database_url)
+        return self._engine
+
+    # ------------------------------------------------------------------
+    # In-memory index maintenance
+    # ------------------------------------------------------------------
+
+    def _analyze(self, owner: str, url: str, content: str, content_hash: str) -> IndexedPage:
+        """Extract topics, coverage and formats for page content."""
+        profile = self.profiler.profile_text(content)
+        topics = self.analyzer._extract_topics(content)
+        coverage = self.analyzer._calculate_topic_coverage(topics, content)
+
+        return IndexedPage(
+            owner=owner,
+            url=url,
+            content_hash=content_hash,
+            topics={topic: coverage.get(topic, 0) for topic in topics},
+            formats=self.analyzer._detect_content_formats(content),
+            word_count=len(profile.raw_words),
+        )
+
+    def _remove_postings(self, key: PageKey) -> Optional[IndexedPage]:
+        """Remove a page's postings. Caller holds the lock."""
+        old = self.pages.pop(key, None)
+        if old is None:
+            return None
+
+        owner_keys = self.owner_pages.get(old.owner)
+        if owner_keys is not None:
+            owner_keys.discard(key)
+            if not owner_keys:
+                del self.owner_pages[old.owner]
+
+        for topic in old.topics:
+            postings = self.topic_postings.get(topic)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self.topic_postings[topic]
+
+        for fmt in old.formats:
+            postings = self.format_postings.get(fmt)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self.format_postings[fmt]
+
+        return old
+
+    def _add_postings(self, entry: IndexedPage) -> None:
+        """Add a page's postings. Caller holds the lock."""
+        key = (entry.owner, entry.url)
+        self.pages[key] = entry
+        self.pages.move_to_end(key)
+        self.owner_pages[entry.owner].add(key)
+        for topic, score in entry.topics.items():
+            self.topic_postings[topic][key] = score
+        for fmt in entry.formats:
+            self.format_postings[fmt].add(key)
+
+        while len(self.pages) > self.max_pages:
+            oldest = next(iter(self.pages))
+            self._remove_postings(oldest)
+            # The owner is no longer complete in memory
+            self._loaded_owners.pop(oldest[0], None)
+            self.stats["pages_evicted"] += 1
+
+    def index_page(
+        self,
+        owner: str,
+        url: str,
+        content: str,
+        content_hash: Optional[str] = None,
+    ) -> Optional[IndexedPage]:
+        """
+        Index (or re-index) a page in memory.
+
+        Args:
+            owner: Competitor name/domain
+            url: Page URL
+            content: Page text content
+            content_hash: Content hash (default: hash of content)
+
+        Returns:
+            IndexedPage if the page was (re)indexed, None if unchanged
+        """
+        content_hash = content_hash or self.profiler.profile_text(content).content_hash
+        key = (owner, url)
+
+        with self.lock:
+            existing = self.pages.get(key)
+            if existing is not None and existing.content_hash == content_hash:
+                self.stats["pages_unchanged"] += 1
+                return None
+
+        entry = self._analyze(owner, url, content, content_hash)
+
+        with self.lock:
+            self._remove_postings(key)
+            self._add_postings(entry)
+            self.stats["pages_indexed"] += 1
+
+        return entry
+
+    def remove_page(self, owner: str, url: str) -> bool:
+        """
+        Remove a page from the index.
+
+        Args:
+            owner: Competitor name/domain
+            url: Page URL
+
+        Returns:
+            bool: True if the page was indexed
+        """
+        with self.lock:
+            removed = self._remove_postings((owner, url)) is not None
+            if removed:
+                self.stats["pages_removed"] += 1
+            return removed
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def owners_with_topic(
+        self,
+        topic: str,
+        owners: Optional[Iterable[str]] = None,
+    ) -> Dict[str, float]:
+        """
+        Get competitors covering a topic.
+
+        Args:
+            topic: Topic to look up
+            owners: Restrict to these competitors (default: all)
+
+        Returns:
+            dict: owner -> best coverage score across their pages
+        """
+        allowed = set(owners) if owners is not None else None
+        result: Dict[str, float] = {}
+
+        with self.lock:
+            for (owner, _url), score in self.topic_postings.get(topic, {}).items():
+                if allowed is not None and owner not in allowed:
+                    continue
+                if score > result.get(owner, -1):
+                    result[owner] = score
+
+        return result
+
+    def topic_owner_map(
+        self,
+        owners: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Get topic -> competitors covering it.
+
+        Args:
+            owners: Restrict to these competitors (default: all)
+
+        Returns:
+            dict: topic -> list of owners
+        """
+        allowed = set(owners) if owners is not None else None
+        result: Dict[str, List[str]] = {}
+
+        with self.lock:
+            for topic, postings in self.topic_postings.items():
+                topic_owners = list(dict.fromkeys(
+                    owner for owner, _url in postings
+                    if allowed is None or owner in allowed
+                ))
+                if topic_owners:
+                    result[topic] = topic_owners
+
+        return result
+
+    def format_owner_map(
+        self,
+        owners: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Get content format -> competitors using it.
+
+        Args:
+            owners: Restrict to these competitors (default: all)
+
+        Returns:
+            dict: format -> list of owners
+        """
+        allowed = set(owners) if owners is not None else None
+        result: Dict[str, List[str]] = {}
+
+        with self.lock:
+            for fmt, postings in self.format_postings.items():
+                fmt_owners = list(dict.fromkeys(
+                    owner for owner, _url in postings
+                    if allowed is None or owner in allowed
+                ))
+                if fmt_owners:
+                    result[fmt] = fmt_owners
+
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        with self.lock:
+            return {
+                "pages": len(self.pages),
+                "topics": len(self.topic_postings),
+                "formats": len(self.format_postings),
+                "owners": len(self.owner_pages),
+                "max_pages": self.max_pages,
+                "loaded": self.loaded,
+                **self.stats,
+            }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _competitor_domain(self, session: Session, competitor_id: int) -> str:
+        """Resolve (and cache) the owner key for a competitor ID."""
+        with self.lock:
+            domain = self._competitor_domains.get(competitor_id)
+        if domain is None:
+            row = session.execute(
+                text("SELECT domain FROM competitors WHERE competitor_id = :id"),
+                {"id": competitor_id},
+            ).fetchone()
+            domain = row[0] if row else str(competitor_id)
+            with self.lock:
+                self._competitor_domains[competitor_id] = domain
+        return domain
+
+    def index_competitor_page(
+        self,
+        session: Session,
+        competitor_id: int,
+        url: str,
+        html: str,
+        content_hash: str,
+        page_id: Optional[int] = None,
+    ) -> bool:
+        """
+        Incrementally index a stored competitor page and persist its postings.
+
+        Skips analysis entirely when the stored hash for (competitor, url)
+        matches; only the page_id pointer is refreshed.
+
+        Args:
+            session: Database session (committed by this method)
+            competitor_id: Competitor ID
+            url: Page URL
+            html: Raw HTML
+            content_hash: Normalized content hash from ContentHasher
+            page_id: competitor_pages row for this snapshot
+
+        Returns:
+            bool: True if the page was (re)indexed
+        """
+        row = session.execute(
+            text("""
+                SELECT content_hash FROM content_index_pages
+                WHERE competitor_id = :competitor_id AND url = :url
+            """),
+            {"competitor_id": competitor_id, "url": url},
+        ).fetchone()
+
+        if row and row[0] == content_hash:
+            session.execute(
+                text("""
+                    UPDATE content_index_pages SET page_id = :page_id
+                    WHERE competitor_id = :competitor_id AND url = :url
+                """),
+                {"page_id": page_id, "competitor_id": competitor_id, "url": url},
+            )
+            session.commit()
+            with self.lock:
+                self.stats["pages_unchanged"] += 1
+            return False
+
+        owner = self._competitor_domain(session, competitor_id)
+        content = self.profiler.profile_html(html).text
+        entry = self._analyze(owner, url, content, content_hash)
+
+        session.execute(
+            text("""
+                INSERT INTO content_index_pages (
+                    competitor_id, url, page_id, content_hash, word_count, formats, indexed_at
+                ) VALUES (
+                    :competitor_id, :url, :page_id, :content_hash, :word_count, :formats, NOW()
+                )
+                ON CONFLICT (competitor_id, url) DO UPDATE SET
+                    page_id = EXCLUDED.page_id,
+                    content_hash = EXCLUDED.content_hash,
+                    word_count = EXCLUDED.word_count,
+                    formats = EXCLUDED.formats,
+                    indexed_at = NOW()
+            """),
+            {
+                "competitor_id": competitor_id,
+                "url": url,
+                "page_id": page_id,
+                "content_hash": content_hash,
+                "word_count": entry.word_count,
+                "formats": entry.formats,
+            },
+        )
+        session.execute(
+            text("""
+                DELETE FROM content_topic_index
+                WHERE competitor_id = :competitor_id AND url = :url
+            """),
+            {"competitor_id": competitor_id, "url": url},
+        )
+        if entry.topics:
+            session.execute(
+                text("""
+                    INSERT INTO content_topic_index (topic, competitor_id, url, coverage_score)
+                    VALUES (:topic, :competitor_id, :url, :coverage_score)
+                """),
+                [
+                    {
+                        "topic": topic[:255],
+                        "competitor_id": competitor_id,
+                        "url": url,
+                        "coverage_score": score,
+                    }
+                    for topic, score in entry.topics.items()
+                ],
+            )
+        session.commit()
+
+        with self.lock:
+            key = (owner, url)
+            self._remove_postings(key)
+            self._add_postings(entry)
+            self.stats["pages_indexed"] += 1
+
+        logger.debug(f"Indexed {url}: {len(entry.topics)} topics, formats={entry.formats}")
+        return True
+
+    def _load_pages(
+        self,
+        filter_sql: str,
+        params: Dict[str, Any],
+    ) -> Tuple[Dict[PageKey, IndexedPage], Dict[str, int]]:
+        """
+        Read persisted pages and their topics, most recently indexed first.
+
+        At most max_pages pages (and only their postings) are read.
+
+        Args:
+            filter_sql: WHERE clause on competitors (alias c)
+            params: Query parameters
+
+        Returns:
+            tuple: ((owner, url) -> IndexedPage, owner -> number of persisted
+            pages matching the filter, for owners with at least one page read)
+        """
+        engine = self._get_engine()
+        pages: Dict[PageKey, IndexedPage] = {}
+        totals: Dict[str, int] = {}
+        params = {**params, "max_pages": self.max_pages}
+
+        selected = f"""
+            SELECT p.competitor_id, p.url, c.domain, p.content_hash, p.word_count, p.formats,
+                   COUNT(*) OVER (PARTITION BY c.domain) AS owner_total
+            FROM content_index_pages p
+            JOIN competitors c ON c.competitor_id = p.competitor_id
+            {filter_sql}
+            ORDER BY p.indexed_at DESC
+            LIMIT :max_pages
+        """
+
+        with engine.connect() as conn:
+            page_rows = conn.execute(text(selected), params)
+            for _competitor_id, url, domain, content_hash, word_count, formats, owner_total in page_rows:
+                totals[domain] = owner_total
+                pages[(domain, url)] = IndexedPage(
+                    owner=domain,
+                    url=url,
+                    content_hash=content_hash,
+                    formats=list(formats or []),
+                    word_count=word_count or 0,
+                )
+
+            topic_rows = conn.execute(text(f"""
+                WITH selected AS ({selected})
+                SELECT s.domain, t.url, t.topic, t.coverage_score
+                FROM content_topic_index t
+                JOIN selected s ON s.competitor_id = t.competitor_id AND s.url = t.url
+            """), params)
+            for domain, url, topic, score in topic_rows:
+                entry = pages.get((domain, url))
+                if entry is not None:
+                    entry.topics[topic] = float(score or 0)
+
+        return pages, totals
+
+    def load(self, competitor_ids: Optional[List[int]] = None) -> int:
+        """
+        Load the persisted index into memory, replacing current contents.
+
+        Only the max_pages most recently indexed pages are loaded.
+
+        Args:
+            competitor_ids: Restrict to these competitors (default: all active)
+
+        Returns:
+            int: Number of pages loaded
+        """
+        if self._get_engine() is None:
+            logger.warning("DATABASE_URL not set, topic index not loaded")
+            return 0
+
+        filter_sql = "WHERE c.is_active = TRUE"
+        params: Dict[str, Any] = {}
+        if competitor_ids is not None:
+            filter_sql = "WHERE c.competitor_id = ANY(:competitor_ids)"
+            params["competitor_ids"] = list(competitor_ids)
+
+        pages, _totals = self._load_pages(filter_sql, params)
+
+        with self.lock:
+            self.pages.clear()
+            self.owner_pages.clear()
+            self.topic_postings.clear()
+            self.format_postings.clear()
+            self._loaded_owners.clear()
+            # Oldest first, so eviction order follows indexed_at
+            for entry in reversed(list(pages.values())):
+                self._add_postings(entry)
+            self.loaded = True
+
+        logger.info(f"Loaded topic index: {len(pages)} pages, {len(self.topic_postings)} topics")
+        return len(pages)
+
+    def ensure_owners(self, owners: Iterable[str]) -> int:
+        """
+        Load the persisted pages of competitors not yet complete in memory.
+
+        Gap analysis for a handful of competitors only reads their postings
+        instead of the whole index. A competitor's pages are reloaded once
+        they have been served for owner_ttl_seconds, and a competitor is only
+        marked complete if all its pages fit in the max_pages read.
+
+        Args:
+            owners: Competitor domains
+
+        Returns:
+            int: Number of pages loaded
+        """
+        now = time.monotonic()
+        with self.lock:
+            missing = [
+                owner for owner in dict.fromkeys(owners)
+                if now - self._loaded_owners.get(owner, float("-inf")) > self.owner_ttl_seconds
+            ]
+        if not missing or self._get_engine() is None:
+            return 0
+
+        pages, totals = self._load_pages("WHERE c.domain = ANY(:domains)", {"domains": missing})
+
+        # A full read has every page of every owner; after a truncated read
+        # only owners whose page count matches their total are complete
+        truncated = len(pages) >= self.max_pages
+        read = Counter(owner for owner, _url in pages)
+        complete = [owner for owner in missing if not truncated or read[owner] >= totals.get(owner, 1)]
+
+        with self.lock:
+            for owner in missing:
+                for key in list(self.owner_pages.get(owner, ())):
+                    self._remove_postings(key)
+            # Before adding, so an owner evicted while adding is not marked complete
+            self._loaded_owners.update((owner, now) for owner in complete)
+            for entry in reversed(list(pages.values())):
+                self._add_postings(entry)
+
+        logger.debug(
+            f"Loaded {len(pages)} indexed pages for {len(missing)} competitors "
+            f"({len(missing) - len(complete)} incomplete)"
+        )
+        return len(pages)
+
+
+# Module-level singleton
+_topic_index_instance = None
+_topic_index_lock = threading.Lock()
+
+
+def get_topic_index(**kwargs) -> TopicIndex:
+    """Get or create the singleton TopicIndex instance."""
+    global _topic_index_instance
+
+    with _topic_index_lock:
+        if _topic_index_instance is None:
+            _topic_index_instance = TopicIndex(**kwargs)
+
+    return _topic_index_instance
@@ -0,0 +1,193 @@
+"""
+Tests for the concurrent audit engine
+
+Tests that:
+1. At most one URL per domain is in flight, while domains run in parallel
+2. Each worker sets up (and tears down) its browser state once
+3. HTTP-only audits use the shared session and still run the DOM checks
+4. TechnicalAuditor.run() audits concurrently and saves in batches
+
+Run with: python -m pytest seo_intelligence/tests/test_audit_engine.py -v
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from seo_intelligence.scrapers import audit_engine
+from seo_intelligence.scrapers.audit_engine import DomainScheduler, domain_of, run_by_domain
+from seo_intelligence.scrapers.technical_auditor import TechnicalAuditor
+
+
+PAGE = (
+    b"<html><head><title>Pressure Washing in Providence RI</title>"
+    b"<meta name='description' content='Pressure washing and soft washing for homes in Providence.'>"
+    b"</head><body><h1>Pressure Washing</h1><img src='a.jpg'></body></html>"
+)
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeTask:
+    def __init__(self):
+        self.processed = 0
+        self.created = 0
+
+    def increment_processed(self):
+        self.processed += 1
+
+    def increment_created(self):
+        self.created += 1
+
+
+class FakeTaskLogger:
+    def __init__(self):
+        self.task = FakeTask()
+
+    @contextmanager
+    def log_task(self, name, task_type, metadata=None):
+        yield self.task
+
+
+@pytest.fixture
+def site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_one_url_per_domain_in_flight():
+    urls = [f"https://site{n % 3}.com/page{n}" for n in range(9)]
+    lock = threading.Lock()
+    active = {}
+    peak = {'total': 0, 'per_domain': 0}
+
+    def process(state, url):
+        domain = domain_of(url)
+        with lock:
+            active[domain] = active.get(domain, 0) + 1
+            peak['per_domain'] = max(peak['per_domain'], active[domain])
+            peak['total'] = max(peak['total'], sum(active.values()))
+        time.sleep(0.02)
+        with lock:
+            active[domain] -= 1
+        return url.upper()
+
+    results = run_by_domain(urls, process, max_workers=4)
+
+    assert results == [url.upper() for url in urls]
+    assert peak['per_domain'] == 1
+    assert peak['total'] > 1
+
+
+def test_scheduler_rotates_domains():
+    items = ["https://a.com/1", "https://a.com/2", "https://b.com/1"]
+    scheduler = DomainScheduler(items, key_fn=domain_of)
+
+    first = scheduler.next()
+    second = scheduler.next()
+    assert (first, second) == ("https://a.com/1", "https://b.com/1")
+
+    scheduler.done(first)
+    assert scheduler.next() == "https://a.com/2"
+    assert scheduler.next() is None
+
+
+def test_worker_state_created_once_per_worker():
+    setups, teardowns = [], []
+
+    def setup():
+        state = object()
+        setups.append(state)
+        return state
+
+    seen = []
+    run_by_domain(
+        [f"https://site{n}.com/" for n in range(6)],
+        lambda state, url: seen.append(state),
+        max_workers=2,
+        worker_setup=setup,
+        worker_teardown=teardowns.append,
+    )
+
+    assert len(setups) == 2
+    assert sorted(map(id, teardowns)) == sorted(map(id, setups))
+    assert set(map(id, seen)) <= set(map(id, setups))
+
+
+def test_failed_item_does_not_stop_run():
+    def process(state, url):
+        if "bad" in url:
+            raise RuntimeError("boom")
+        return url
+
+    results = run_by_domain(["https://bad.com/", "https://good.com/"], process, max_workers=2)
+    assert results == [None, "https://good.com/"]
+
+
+def test_http_only_audit_runs_dom_checks(site, monkeypatch):
+    calls = []
+    session = audit_engine.get_http_session()
+    original_get = session.get
+    monkeypatch.setattr(session, "get", lambda *a, **kw: calls.append(a[0]) or original_get(*a, **kw))
+
+    auditor = TechnicalAuditor()
+    result, completed = auditor._audit_url(f"{site}/", measure_cwv=True, browser=None)
+
+    assert completed
+    assert calls == [f"{site}/"]
+    assert result.metrics["fallback_mode"] is True
+    assert result.metrics["http_status"] == 200
+    assert result.metrics["h1_count"] == 1
+    assert result.overall_score > 0
+
+
+def test_unreachable_page_is_not_saved():
+    auditor = TechnicalAuditor()
+    result, completed = auditor._audit_url("http://127.0.0.1:1/", browser=None)
+
+    assert not completed
+    assert result.overall_score == 0
+    assert result.issues[-1].issue_type == "page_unreachable"
+
+
+def test_run_saves_in_batches(site, monkeypatch):
+    monkeypatch.setattr("seo_intelligence.scrapers.technical_auditor.AUDIT_SAVE_BATCH_SIZE", 2)
+    auditor = TechnicalAuditor()
+    monkeypatch.setattr(auditor, "_launch_browser", lambda: None)
+
+    batches = []
+
+    def save(results):
+        batches.append([result.url for result in results])
+        return list(range(len(results)))
+
+    monkeypatch.setattr(auditor, "_save_audits", save)
+    task_logger = FakeTaskLogger()
+    monkeypatch.setattr("seo_intelligence.scrapers.technical_auditor.get_task_logger", lambda: task_logger)
+
+    # Different hosts for the same server: localhost and 127.0.0.1
+    port = site.rsplit(":", 1)[1]
+    urls = [f"http://127.0.0.1:{port}/a", f"http://localhost:{port}/b", f"http://127.0.0.1:{port}/c"]
+    summary = auditor.run(urls, max_workers=2)
+
+    assert summary["successful"] == 3
+    assert task_logger.task.processed == 3
+    assert sorted(url for batch in batches for url in batch) == sorted(urls)
+    assert summary["db_writer"]["written"] == 3
+    assert all(len(batch) <= 2 for batch in batches)
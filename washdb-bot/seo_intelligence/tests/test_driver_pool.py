@@ -0,0 +1,207 @@
+"""
+Tests for the warm UC driver pool
+
+Tests that the pool:
+1. Reuses warm drivers per site and clears cookies/storage on return
+   (only between callers asking for the same proxy use and options)
+2. Keeps each slot on its proxy across recycles (proxy affinity)
+3. Health-checks drivers and replaces dead ones on a new proxy
+4. Recycles drivers by age and use count
+5. Creates overflow drivers when all slots are busy
+
+Run with: python -m pytest seo_intelligence/tests/test_driver_pool.py -v
+"""
+
+import itertools
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from seo_intelligence.drivers.driver_pool import UCDriverPool
+
+
+class FakeDriver:
+    def __init__(self, site, proxy):
+        self.site = site
+        self.proxy = proxy
+        self.alive = True
+        self.quit_called = False
+        self.cookies_cleared = 0
+        self.cleared_origins = set()
+        self.history = []
+        self.cdp_available = True
+        self.window_handles = ["main"]
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise WebDriverException("chrome not reachable")
+        return 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        if not self.cdp_available:
+            raise WebDriverException("CDP not available")
+        if cmd == "Page.getNavigationHistory":
+            return {"entries": [{"url": url} for url in self.history]}
+        if cmd == "Network.getAllCookies":
+            return {"cookies": [{"domain": ".cookies.example"}]}
+        if cmd == "Network.clearBrowserCookies":
+            self.cookies_cleared += 1
+        if cmd == "Storage.clearDataForOrigin":
+            self.cleared_origins.add(params["origin"])
+        return {}
+
+    def get(self, url):
+        self.history.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def make_pool():
+    created = []
+    proxies = (f"user:pass@10.0.0.{n}:8080" for n in itertools.count(1))
+
+    def factory(site, headless, use_proxy, proxy, **kwargs):
+        driver = FakeDriver(site, proxy)
+        created.append(driver)
+        return driver
+
+    def build(**kwargs):
+        pool = UCDriverPool(factory=factory, proxy_picker=lambda site: next(proxies), **kwargs)
+        pool.created = created
+        return pool
+
+    return build
+
+
+def test_reuses_warm_driver_and_resets_it(make_pool):
+    pool = make_pool(size_per_site=2)
+
+    with pool.driver("google") as first:
+        first.get("https://www.google.com/search?q=a")
+        first.get("https://consent.google.com/ml?continue=x")
+    assert first.cleared_origins == {
+        "https://www.google.com", "https://consent.google.com",
+        "https://cookies.example", "http://cookies.example",
+    }
+
+    with pool.driver("google_serp") as second:
+        pass
+
+    assert second is first
+    assert len(pool.created) == 1
+    assert first.cookies_cleared == 2
+
+    stats = pool.get_stats()
+    assert stats['reused'] == 1
+    assert stats['sites'] == {"google": {'idle': 1, 'in_use': 0}}
+
+
+def test_sites_have_separate_drivers(make_pool):
+    pool = make_pool(size_per_site=1)
+    with pool.driver("yelp") as yelp, pool.driver("bbb") as bbb:
+        assert yelp is not bbb
+    assert pool.get_stats()['idle_drivers'] == 2
+
+
+def test_driver_without_cdp_is_not_reused(make_pool):
+    pool = make_pool(size_per_site=1)
+    with pool.driver("yelp") as first:
+        first.cdp_available = False
+    with pool.driver("yelp") as second:
+        pass
+    assert second is not first
+    assert first.quit_called
+
+
+def test_proxy_use_and_options_have_separate_drivers(make_pool):
+    pool = make_pool(size_per_site=1)
+    with pool.driver("bbb") as proxied:
+        pass
+    with pool.driver("bbb", use_proxy=False) as direct:
+        pass
+    with pool.driver("bbb", wait_time=30) as slow:
+        pass
+    with pool.driver("bbb") as again:
+        pass
+
+    assert direct is not proxied and direct.proxy is None
+    assert slow is not proxied and slow is not direct
+    assert again is proxied
+    assert pool.get_stats()['sites'] == {"bbb": {'idle': 3, 'in_use': 0}}
+
+
+def test_recycle_by_uses_keeps_proxy(make_pool):
+    pool = make_pool(size_per_site=1, max_uses=2)
+
+    drivers = []
+    for _ in range(3):
+        with pool.driver("yelp") as driver:
+            drivers.append(driver)
+
+    assert drivers[0] is drivers[1]
+    assert drivers[2] is not drivers[0]
+    assert drivers[0].quit_called
+    # Same slot, same proxy
+    assert drivers[2].proxy == drivers[0].proxy
+    assert pool.get_stats()['recycled_uses'] == 1
+
+
+def test_recycle_by_age(make_pool):
+    pool = make_pool(size_per_site=1, max_age_seconds=0)
+    with pool.driver("bbb") as first:
+        pass
+    with pool.driver("bbb") as second:
+        pass
+    assert second is not first
+    assert pool.get_stats()['recycled_age'] >= 1
+
+
+def test_dead_driver_replaced_on_new_proxy(make_pool):
+    pool = make_pool(size_per_site=1)
+    with pool.driver("gbp") as first:
+        pass
+    first.alive = False
+
+    with pool.driver("maps") as second:
+        pass
+
+    assert second is not first
+    assert second.proxy != first.proxy
+    assert pool.get_stats()['health_check_failures'] == 1
+
+
+def test_webdriver_error_discards_driver(make_pool):
+    pool = make_pool(size_per_site=1)
+    with pytest.raises(WebDriverException):
+        with pool.driver("yellowpages") as first:
+            raise WebDriverException("tab crashed")
+
+    assert first.quit_called
+    with pool.driver("yp") as second:
+        assert second is not first
+    assert pool.get_stats()['discarded'] == 1
+
+
+def test_overflow_driver_is_not_kept(make_pool):
+    pool = make_pool(size_per_site=1)
+    with pool.driver("google") as pooled, pool.driver("google") as overflow:
+        assert overflow is not pooled
+
+    assert overflow.quit_called and not pooled.quit_called
+    stats = pool.get_stats()
+    assert stats['overflow'] == 1
+    assert stats['idle_drivers'] == 1
+
+
+def test_prewarm_and_close_all(make_pool):
+    pool = make_pool(size_per_site=2)
+    assert pool.prewarm("yelp") == 2
+
+    with pool.driver("yelp"):
+        pass
+    assert len(pool.created) == 2
+
+    pool.close_all()
+    assert all(driver.quit_called for driver in pool.created)
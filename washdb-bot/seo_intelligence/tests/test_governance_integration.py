@@ -20,6 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from seo_intelligence.services.governance import (
     get_governance_service,
     propose_change,
+    propose_changes,
     get_pending_changes,
     approve_change,
     reject_change,
@@ -171,6 +172,48 @@ def test_bulk_operations():
     print(f"✓ Bulk operations working correctly")
 
 
+def test_batch_propose():
+    """Test batch proposal and bulk approval."""
+    print("\n" + "="*70)
+    print("TEST 7: Batch Propose")
+    print("="*70)
+
+    # Propose multiple test changes in one batch
+    change_ids = propose_changes([
+        {
+            'table_name': 'audit_issues',
+            'operation': 'insert',
+            'proposed_data': {
+                'audit_id': 1,
+                'severity': 'info',
+                'category': 'test',
+                'issue_type': f'test_batch_issue_{i}',
+                'description': f'Test batch issue {i}',
+                'recommendation': 'Test recommendation'
+            },
+            'change_type': ChangeType.TECHNICAL_SEO,
+            'source': 'test_script',
+            'reason': f'Batch test #{i+1}'
+        }
+        for i in range(3)
+    ])
+    assert len(change_ids) == 3
+
+    print(f"Proposed {len(change_ids)} changes in one batch")
+
+    # Test bulk approval
+    service = get_governance_service()
+    results = service.bulk_approve_changes(
+        change_ids=change_ids,
+        reviewed_by='test_script',
+        apply_immediately=False  # Don't apply test data
+    )
+    assert results['approved'] == len(change_ids)
+
+    print(f"Bulk approval results: {results}")
+    print(f"✓ Batch propose working correctly")
+
+
 def run_all_tests():
     """Run all governance integration tests."""
     print("\n" + "█"*70)
@@ -206,6 +249,9 @@ def run_all_tests():
         # Test 6: Bulk operations
         test_bulk_operations()
 
+        # Test 7: Batch propose
+        test_batch_propose()
+
         # Summary
         print("\n" + "█"*70)
         print("GOVERNANCE INTEGRATION TEST COMPLETE")
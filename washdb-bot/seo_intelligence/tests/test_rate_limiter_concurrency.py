@@ -13,7 +13,13 @@ import pytest
 import time
 import threading
 from typing import List
-from seo_intelligence.services.rate_limiter import get_rate_limiter, TIER_CONFIGS
+from seo_intelligence.services.rate_limiter import (
+    get_rate_limiter,
+    RateLimiter,
+    RateLimitStore,
+    TIER_CONFIGS,
+    UTILIZATION_WINDOW_SECONDS,
+)
 
 
 class TestGlobalConcurrency:
@@ -329,6 +335,84 @@ class TestRateLimiterIntegration:
         print(f"\n✓ Rate limiting enforced: 3 Tier B requests took {elapsed:.1f}s (expected ≥15s)")
 
 
+class TestSharedRateLimits:
+    """Limits shared through a RateLimitStore hold across limiter instances (processes)."""
+
+    def test_bucket_shared_between_limiters(self, tmp_path):
+        path = tmp_path / "rate_limiter.db"
+        first = RateLimiter(store=RateLimitStore(path))
+        second = RateLimiter(store=RateLimitStore(path))
+        bucket_size = TIER_CONFIGS["A"].bucket_size
+
+        # One process drains the bucket; the other must not get a token
+        first.set_domain_tier("google.com", "A")
+        second.set_domain_tier("google.com", "A")
+        assert first.acquire("google.com", tokens=bucket_size, wait=False)
+        assert not second.acquire("google.com", wait=False)
+
+        # Re-setting the same tier must not refill the bucket
+        second.set_domain_tier("google.com", "A")
+        assert not first.acquire("google.com", wait=False)
+
+        usage = second.get_utilization("google.com")[0]
+        assert usage['tier'] == "A"
+        assert usage['granted_last_minute'] == 1
+        assert usage['available_tokens'] < 1.0
+
+    def test_reservations_queue_in_arrival_order(self, tmp_path):
+        store = RateLimitStore(tmp_path / "rate_limiter.db")
+        config = TIER_CONFIGS["G"]
+        interval = 60.0 / config.tokens_per_minute
+        store.set_tier("own-site.com", "G")
+
+        assert store.reserve("own-site.com", "G", tokens=config.bucket_size) == 0.0
+
+        # Each waiter is granted the next free slot instead of polling for it
+        assert store.reserve("own-site.com", "G", max_wait=interval / 2) is None
+        first = store.reserve("own-site.com", "G")
+        second = store.reserve("own-site.com", "G")
+        assert first == pytest.approx(interval, abs=0.5)
+        assert second == pytest.approx(2 * interval, abs=0.5)
+
+        usage = store.utilization("own-site.com")[0]
+        assert usage['reserved_tokens'] == pytest.approx(2.0, abs=0.1)
+
+    def test_grants_pruned_on_insert(self, tmp_path):
+        store = RateLimitStore(tmp_path / "rate_limiter.db")
+        stale = time.time() - 2 * UTILIZATION_WINDOW_SECONDS
+        with store._lock:
+            store._connection().executemany(
+                "INSERT INTO grants (domain, granted_at) VALUES (?, ?)",
+                [("busy.com", stale)] * 50 + [("other.com", stale)],
+            )
+
+        assert store.reserve("busy.com", "G") == 0.0
+
+        with store._lock:
+            counts = dict(store._connection().execute(
+                "SELECT domain, COUNT(*) FROM grants GROUP BY domain"
+            ).fetchall())
+        # Only the granting domain's expired rows are pruned on the write path
+        assert counts == {"busy.com": 1, "other.com": 1}
+
+    def test_singleton_store_is_isolated(self, tmp_path):
+        """The root conftest points the shared store at tmp_path."""
+        assert get_rate_limiter().store.path == str(tmp_path / "rate_limiter.db")
+
+    def test_concurrency_permits_shared_between_limiters(self, tmp_path):
+        path = tmp_path / "rate_limiter.db"
+        first = RateLimiter(store=RateLimitStore(path))
+        second = RateLimiter(store=RateLimitStore(path))
+
+        assert first.acquire_concurrency("example.com", timeout=1.0)
+        assert not second.acquire_concurrency("example.com", timeout=0.3)
+        assert second.get_utilization("example.com")[0]['active_permits'] == 1
+
+        first.release_concurrency("example.com")
+        assert second.acquire_concurrency("example.com", timeout=1.0)
+        second.release_concurrency("example.com")
+
+
 def main():
     """Run all tests manually."""
     print("=" * 70)
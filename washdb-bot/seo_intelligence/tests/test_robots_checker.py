@@ -0,0 +1,141 @@
+"""
+Tests for Robots.txt Checker
+
+Tests that the robots checker:
+1. Matches rules like RFC 9309 (longest match, wildcards, agent groups)
+2. Caches failed fetches with the negative TTL
+3. Fetches each domain once for concurrent checks
+4. Shares fetch results across checkers through the store
+
+Run with: python -m pytest seo_intelligence/tests/test_robots_checker.py -v
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from seo_intelligence.services import robots_checker as rc
+from seo_intelligence.services.robots_checker import RobotsChecker, RobotsRules, RobotsStore
+
+
+ROBOTS_TXT = """
+User-agent: *
+Disallow: /admin/
+Allow: /admin/public/
+Disallow: /*.pdf$
+Disallow: /search?
+Crawl-delay: 5
+
+User-agent: BadBot
+User-agent: WorseBot
+Disallow: /
+"""
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, text: str = ""):
+        self.status_code = status_code
+        self.text = text
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Record robots.txt fetches and answer with a configurable response."""
+    calls = []
+    state = {'response': FakeResponse(200, ROBOTS_TXT), 'delay': 0.0}
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        time.sleep(state['delay'])
+        response = state['response']
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(rc.requests, "get", fake_get)
+    return calls, state
+
+
+class TestRobotsRules:
+    """Rule matching."""
+
+    def test_longest_match_and_wildcards(self):
+        rules = RobotsRules(ROBOTS_TXT.splitlines())
+        ua = "WashbotSEO/1.0"
+
+        assert rules.can_fetch(ua, "https://example.com/")
+        assert not rules.can_fetch(ua, "https://example.com/admin/settings")
+        assert rules.can_fetch(ua, "https://example.com/admin/public/page")
+        assert not rules.can_fetch(ua, "https://example.com/files/report.pdf")
+        assert rules.can_fetch(ua, "https://example.com/files/report.pdf.html")
+        assert not rules.can_fetch(ua, "https://example.com/search?q=wash")
+        assert rules.can_fetch(ua, "https://example.com/robots.txt")
+        assert rules.crawl_delay(ua) == 5.0
+
+    def test_agent_groups(self):
+        rules = RobotsRules(ROBOTS_TXT.splitlines())
+
+        assert not rules.can_fetch("WorseBot/2.0", "https://example.com/")
+        assert not rules.can_fetch("BadBot", "https://example.com/page")
+        assert rules.crawl_delay("BadBot") is None
+        assert RobotsRules.allow_all().can_fetch("AnyBot", "https://example.com/admin/")
+
+
+class TestRobotsChecker:
+    """Caching and fetch behaviour."""
+
+    def test_failed_fetch_is_negatively_cached(self, fetches):
+        calls, state = fetches
+        state['response'] = requests.Timeout()
+        checker = RobotsChecker(negative_ttl=60)
+
+        for i in range(20):
+            assert not checker.is_allowed(f"https://slow.example.com/page/{i}")
+        assert len(calls) == 1
+        assert checker.get_stats()['negative_entries'] == 1
+
+    def test_stale_rules_used_when_refresh_fails(self, fetches):
+        calls, state = fetches
+        checker = RobotsChecker(cache_ttl=0, negative_ttl=60)
+
+        assert checker.is_allowed("https://example.com/page")
+        state['response'] = FakeResponse(503)
+        assert checker.is_allowed("https://example.com/page")
+        assert not checker.is_allowed("https://example.com/admin/")
+        assert len(calls) == 2
+
+    def test_concurrent_checks_fetch_once(self, fetches):
+        calls, state = fetches
+        state['delay'] = 0.3
+        checker = RobotsChecker()
+        results = []
+
+        def check(i):
+            results.append(checker.is_allowed(f"https://example.com/page/{i}"))
+
+        threads = [threading.Thread(target=check, args=(i,)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 10
+        assert len(calls) == 1
+
+    def test_store_shared_between_checkers(self, fetches, tmp_path):
+        calls, _ = fetches
+        path = tmp_path / "robots_cache.db"
+        first = RobotsChecker(store=RobotsStore(path))
+        second = RobotsChecker(store=RobotsStore(path))
+
+        assert not first.is_allowed("https://example.com/admin/")
+        assert not second.is_allowed("https://example.com/admin/")
+        assert second.is_allowed("https://example.com/about")
+        assert len(calls) == 1
+
+        second.clear_cache()
+        first.cache.cache.clear()
+        assert first.is_allowed("https://example.com/about")
+        assert len(calls) == 2
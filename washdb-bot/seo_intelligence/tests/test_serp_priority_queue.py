@@ -0,0 +1,143 @@
+"""
+Tests for the materialized SERP priority queue
+
+Verifies that:
+1. Queue rows map to QueuedCompany objects in claim order
+2. New snapshots are synced in one batch before expired rows are re-scored,
+   each in its own transaction
+3. Migration 032 only re-syncs companies on relevant changes, keeps the
+   company-name match off the serp_snapshots insert path, and queues
+   snapshots per row instead of by an ID watermark
+
+Run with: python -m pytest seo_intelligence/tests/test_serp_priority_queue.py -v
+"""
+
+import re
+from datetime import datetime
+from pathlib import Path
+
+from seo_intelligence.services.serp_priority_queue import Priority, SerpPriorityQueue
+
+
+MIGRATION = Path(__file__).resolve().parents[2] / "db" / "migrations" / "032_add_serp_priority_queue.sql"
+
+
+class FakeResult:
+    def __init__(self, rowcount=0):
+        self.rowcount = rowcount
+
+
+class FakeSession:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement, params=None):
+        self.log.append(" ".join(str(statement).split()))
+        return FakeResult(rowcount=2)
+
+    def commit(self):
+        self.log.append("COMMIT")
+
+
+def make_queue():
+    queue = SerpPriorityQueue.__new__(SerpPriorityQueue)
+    queue.engine = None
+    queue.worker_id = "test:1"
+    return queue
+
+
+def queue_row(company_id, priority, last_scraped=None, high_value=False):
+    metadata = {'verification': {'llm_classification': {'services': ['Roof Cleaning']}}}
+    days = (datetime.now() - last_scraped).days if last_scraped else None
+    return (
+        company_id, f"Company {company_id}", f"https://c{company_id}.com", "1 Main St",
+        metadata, last_scraped, True, high_value, priority, days,
+    )
+
+
+def test_row_to_queued():
+    queued = make_queue()._row_to_queued(queue_row(7, 1, high_value=True))
+
+    assert queued.company_id == 7
+    assert queued.priority == Priority.CRITICAL
+    assert queued.services == ['Roof Cleaning']
+    assert queued.days_since_scrape is None
+    assert queued.score_factors['never_scraped'] == 1.0
+    assert queued.address == "1 Main St"
+
+
+def test_sort_key_orders_tier_then_never_scraped_then_oldest():
+    queue = make_queue()
+    rows = [
+        queue_row(1, 3, last_scraped=datetime(2024, 3, 1)),
+        queue_row(2, 2, last_scraped=datetime(2024, 1, 1)),
+        queue_row(3, 3, last_scraped=datetime(2024, 2, 1)),
+        queue_row(4, 2),
+    ]
+    ordered = sorted((queue._row_to_queued(r) for r in rows), key=queue._sort_key)
+
+    assert [c.company_id for c in ordered] == [4, 2, 3, 1]
+
+
+def test_refresh_syncs_snapshots_before_rescoring(monkeypatch):
+    log = []
+    monkeypatch.setattr(
+        "seo_intelligence.services.serp_priority_queue.Session", lambda engine: FakeSession(log)
+    )
+
+    assert make_queue()._refresh_expired() == 2
+    assert log[0] == "SELECT serp_priority_queue_sync_snapshots()"
+    assert log[1] == "COMMIT"
+    assert "FOR UPDATE SKIP LOCKED" in log[2] and "LIMIT :limit" in log[2]
+    assert log[3] == "COMMIT"
+
+
+def test_disabled_without_database():
+    queue = make_queue()
+
+    assert queue.claim_batch(limit=5) == []
+    assert queue.get_next_batch(limit=5) == []
+    assert queue.complete(1) is False
+    assert queue.release([1]) == 0
+
+
+def test_migration_restricts_company_trigger():
+    sql = MIGRATION.read_text()
+    update_trigger = sql[sql.index("CREATE TRIGGER trg_serp_priority_queue_company_update"):]
+    update_trigger = update_trigger[:update_trigger.index("EXECUTE FUNCTION")]
+
+    assert "WHEN (" in update_trigger
+    assert "OLD.verified IS DISTINCT FROM NEW.verified" in update_trigger
+    assert "'services'" in update_trigger
+
+
+def test_migration_drops_per_row_snapshot_matching():
+    sql = MIGRATION.read_text()
+
+    assert "DROP TRIGGER IF EXISTS trg_serp_priority_queue_snapshot ON serp_snapshots" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql[sql.index("FUNCTION serp_priority_queue_sync_snapshots"):]
+
+
+def test_migration_queues_snapshots_per_row():
+    sql = MIGRATION.read_text()
+    queue_fn = sql[sql.index("FUNCTION serp_priority_queue_queue_snapshot"):]
+    queue_fn = queue_fn[:queue_fn.index("LANGUAGE plpgsql")]
+
+    # The insert trigger only queues the snapshot; matching stays in the sync
+    assert "INSERT INTO serp_priority_queue_pending" in queue_fn
+    assert "companies" not in queue_fn
+    assert re.search(r"AFTER INSERT ON serp_snapshots\s+FOR EACH ROW", sql)
+    assert "last_snapshot_id" not in sql
+
+
+def test_migration_high_value_services_match():
+    sql = MIGRATION.read_text()
+    body = sql[sql.index("FUNCTION serp_is_high_value"):sql.index("LANGUAGE sql IMMUTABLE")]
+
+    assert set(re.findall(r"'%(\w+)%'", body)) == set(SerpPriorityQueue.HIGH_VALUE_SERVICES)
@@ -0,0 +1,144 @@
+"""
+Tests for the shared TextProfile stage
+
+Verifies that:
+1. Profiles are cached by content hash and reused across analyzers
+2. Lazy statistics match the analyzers' own tokenization rules
+3. HTML profiles are reachable through their extracted text
+
+Run with: python -m pytest seo_intelligence/tests/test_text_profile.py -v
+"""
+
+from seo_intelligence.services.text_profile import (
+    TextProfiler,
+    count_syllables,
+    tokenize_sentences,
+    tokenize_words,
+)
+from seo_intelligence.services.readability_analyzer import ReadabilityAnalyzer
+from seo_intelligence.services.content_gap_analyzer import ContentGapAnalyzer
+
+
+SAMPLE_TEXT = (
+    "Pressure Washing Services in Austin\n"
+    "We offer professional pressure washing and roof cleaning. "
+    "Dr. Smith recommends soft washing for shingles! "
+    "Is it safe for vinyl siding? Yes, e.g. at low pressure.\n"
+)
+
+SAMPLE_HTML = (
+    "<html><head><title>T</title><script>var x = 1;</script></head><body>"
+    "<nav>Home About</nav>"
+    "<h1>Roof Cleaning</h1><p>Soft washing removes algae safely.</p>"
+    "<h2>Driveways</h2><p>We clean concrete driveways.</p><ul><li>Sealing</li></ul>"
+    "<footer>Copyright</footer></body></html>"
+)
+
+
+class TestSyllables:
+    """Test the memoized syllable counter."""
+
+    def test_exception_words(self):
+        assert count_syllables("business") == 2
+        assert count_syllables("Everything") == 4
+
+    def test_heuristics(self):
+        assert count_syllables("cleaning") == 2
+        assert count_syllables("table") == 2
+        assert count_syllables("washes") == 2
+        assert count_syllables("...") == 0
+
+    def test_results_are_cached(self):
+        count_syllables.cache_clear()
+        count_syllables("pressure")
+        count_syllables("pressure")
+        info = count_syllables.cache_info()
+        assert info.hits >= 1
+
+
+class TestTokenization:
+    """Test shared tokenizers."""
+
+    def test_sentences_protect_abbreviations(self):
+        sentences = tokenize_sentences("Dr. Smith came. He left! Why?")
+        assert sentences == ["Dr. Smith came", "He left", "Why?"]
+
+    def test_words_drop_numbers_and_single_chars(self):
+        assert tokenize_words("A roof, 42 shingles & e-mail's") == ["roof", "shingles", "e-mail's"]
+
+
+class TestTextProfiler:
+    """Test profile caching and lazy statistics."""
+
+    def test_same_text_returns_same_profile(self):
+        profiler = TextProfiler(max_size=4)
+        first = profiler.profile_text(SAMPLE_TEXT)
+        second = profiler.profile_text(SAMPLE_TEXT)
+
+        assert first is second
+        assert profiler.get_stats()["hits"] == 1
+
+    def test_lru_eviction(self):
+        profiler = TextProfiler(max_size=2)
+        profiler.profile_text("one")
+        profiler.profile_text("two")
+        profiler.profile_text("three")
+
+        stats = profiler.get_stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+
+    def test_html_profiles_respect_max_size(self):
+        profiler = TextProfiler(max_size=3)
+        for i in range(5):
+            profiler.profile_html(f"<html><body><p>page {i}</p></body></html>")
+
+        stats = profiler.get_stats()
+        assert stats["size"] == 3
+        assert stats["evictions"] == 7
+
+    def test_terms_and_ngrams(self):
+        profile = TextProfiler().profile_text("the roof cleaning and roof cleaning")
+
+        assert profile.terms == ["roof", "cleaning", "roof", "cleaning"]
+        assert profile.term_counts["roof"] == 2
+        assert profile.bigram_counts["roof cleaning"] == 2
+
+    def test_html_profile(self):
+        profiler = TextProfiler()
+        profile = profiler.profile_html(SAMPLE_HTML)
+
+        assert "var x" not in profile.text
+        assert "Home About" not in profile.text
+        assert profile.paragraph_count == 3
+        assert profile.html_headings == [(1, "Roof Cleaning"), (2, "Driveways")]
+
+        # The extracted text resolves to the same profile
+        assert profiler.profile_text(profile.text) is profile
+
+
+class TestAnalyzersShareProfile:
+    """Test that analyzers consume the shared profile."""
+
+    def test_readability_html_matches_text(self):
+        analyzer = ReadabilityAnalyzer()
+        html_result = analyzer.analyze_html(SAMPLE_HTML)
+        text, paragraphs = analyzer._extract_text_from_html(SAMPLE_HTML)
+        text_result = analyzer.analyze_text(text)
+
+        assert html_result.word_count == text_result.word_count
+        assert html_result.syllable_count == text_result.syllable_count
+        assert html_result.paragraph_count == paragraphs == 3
+        assert text_result.paragraph_count == 1
+
+    def test_content_gap_page_analysis(self):
+        analyzer = ContentGapAnalyzer()
+        page = analyzer.analyze_page("https://example.com", "Example", SAMPLE_TEXT)
+
+        assert page.word_count == len(SAMPLE_TEXT.split())
+        assert "pressure" in page.topics
+        assert "Pressure Washing Services in Austin" in page.headings
+        assert "the" not in page.keywords
+
+        coverage = analyzer._calculate_topic_coverage(["pressure washing"], SAMPLE_TEXT)
+        assert coverage["pressure washing"] == 40
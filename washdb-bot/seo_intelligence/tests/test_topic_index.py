@@ -0,0 +1,174 @@
+"""
+Tests for the incremental TopicIndex
+
+Verifies that:
+1. Pages are indexed once per content hash and re-indexed on change
+2. Removing a page drops its postings
+3. Index-backed gap analysis matches the full re-analysis path
+4. Lazily loaded competitors are reloaded after a TTL and only marked
+   complete when all their pages were read
+
+Run with: python -m pytest seo_intelligence/tests/test_topic_index.py -v
+"""
+
+from seo_intelligence.services.content_gap_analyzer import ContentGapAnalyzer
+from seo_intelligence.services.topic_index import IndexedPage, TopicIndex
+
+
+COMPETITOR_PAGES = {
+    "alpha.com": [
+        "Roof cleaning guide. How to clean roof shingles safely. "
+        "Step 1: soft washing. Roof cleaning removes algae. FAQ: Is roof cleaning safe?",
+        "Driveway sealing services. Driveway sealing protects concrete driveways.",
+    ],
+    "beta.com": [
+        "Roof cleaning and gutter cleaning. Frequently asked questions about roof cleaning. "
+        "Gutter cleaning prevents water damage.",
+    ],
+    "gamma.com": [
+        "Gutter cleaning vs roof cleaning comparison. Roof cleaning pricing and "
+        "gutter cleaning pricing. Driveway sealing also available.",
+    ],
+}
+
+YOUR_TEXT = "Pressure washing for homes and decks."
+
+
+def build_index(analyzer):
+    index = TopicIndex(analyzer=analyzer, database_url="")
+    for owner, pages in COMPETITOR_PAGES.items():
+        for i, content in enumerate(pages):
+            index.index_page(owner, f"https://{owner}/{i}", content)
+    index.loaded = True
+    return index
+
+
+class TestIncrementalIndexing:
+    """Test index maintenance."""
+
+    def test_unchanged_content_is_skipped(self):
+        index = TopicIndex(analyzer=ContentGapAnalyzer(), database_url="")
+        content = COMPETITOR_PAGES["beta.com"][0]
+
+        assert index.index_page("beta.com", "https://beta.com/0", content) is not None
+        assert index.index_page("beta.com", "https://beta.com/0", content) is None
+        assert index.get_stats()["pages_unchanged"] == 1
+
+    def test_changed_content_replaces_postings(self):
+        index = TopicIndex(analyzer=ContentGapAnalyzer(), database_url="")
+        index.index_page("beta.com", "https://beta.com/0", "Gutter cleaning gutter cleaning gutter guards.")
+        assert "beta.com" in index.owners_with_topic("gutter")
+
+        index.index_page("beta.com", "https://beta.com/0", "Deck staining deck staining deck sealing.")
+        assert index.owners_with_topic("gutter") == {}
+        assert "beta.com" in index.owners_with_topic("deck")
+        assert index.get_stats()["pages"] == 1
+
+    def test_remove_page(self):
+        index = build_index(ContentGapAnalyzer())
+        assert index.remove_page("beta.com", "https://beta.com/0")
+        assert not index.remove_page("beta.com", "https://beta.com/0")
+        assert "beta.com" not in index.topic_owner_map().get("gutter cleaning", [])
+
+    def test_max_pages_evicts_oldest(self):
+        index = TopicIndex(analyzer=ContentGapAnalyzer(), database_url="", max_pages=2)
+        index.index_page("alpha.com", "https://alpha.com/0", COMPETITOR_PAGES["alpha.com"][0])
+        index.index_page("beta.com", "https://beta.com/0", COMPETITOR_PAGES["beta.com"][0])
+        index.index_page("gamma.com", "https://gamma.com/0", COMPETITOR_PAGES["gamma.com"][0])
+
+        stats = index.get_stats()
+        assert stats["pages"] == 2 and stats["pages_evicted"] == 1
+        assert "alpha.com" not in index.owners_with_topic("roof cleaning")
+        assert set(index.owners_with_topic("roof cleaning")) == {"beta.com", "gamma.com"}
+        assert all(
+            owner != "alpha.com"
+            for postings in index.topic_postings.values()
+            for owner, _url in postings
+        )
+
+
+class TestIndexedGapAnalysis:
+    """Test that index lookups reproduce full gap analysis."""
+
+    def test_matches_full_analysis(self):
+        analyzer = ContentGapAnalyzer()
+        your_content = [analyzer.analyze_page("https://you.com", "Home", YOUR_TEXT)]
+        competitor_content = {
+            owner: [
+                analyzer.analyze_page(f"https://{owner}/{i}", "", content)
+                for i, content in enumerate(pages)
+            ]
+            for owner, pages in COMPETITOR_PAGES.items()
+        }
+
+        full = analyzer.analyze_content_gaps(your_content, competitor_content)
+        indexed = analyzer.analyze_gaps_from_index(your_content, build_index(analyzer))
+
+        def key(gap):
+            return (gap.topic, gap.gap_type, sorted(gap.competitors_with_content))
+
+        assert full
+        assert sorted(map(key, full)) == sorted(map(key, indexed))
+        assert [g.opportunity_score for g in full] == [g.opportunity_score for g in indexed]
+
+    def test_restrict_to_competitors(self):
+        analyzer = ContentGapAnalyzer()
+        your_content = [analyzer.analyze_page("https://you.com", "Home", YOUR_TEXT)]
+        index = build_index(analyzer)
+
+        gaps = analyzer.analyze_gaps_from_index(
+            your_content, index, competitors=["beta.com"], min_competitor_coverage=1,
+        )
+
+        assert gaps
+        assert all(gap.competitors_with_content == ["beta.com"] for gap in gaps)
+
+
+class TestLazyLoad:
+    """Test per-competitor loading of the persisted index."""
+
+    def make_index(self, monkeypatch, persisted, **kwargs):
+        """Index whose database holds persisted: owner -> list of urls (newest first)."""
+        index = TopicIndex(analyzer=ContentGapAnalyzer(), database_url="", **kwargs)
+        index.reads = []
+
+        def load_pages(filter_sql, params):
+            index.reads.append(list(params["domains"]))
+            rows = [(owner, url) for owner in params["domains"] for url in persisted.get(owner, [])]
+            pages = {
+                (owner, url): IndexedPage(owner=owner, url=url, content_hash=url, topics={"roof": 50.0})
+                for owner, url in rows[:index.max_pages]
+            }
+            totals = {owner: len(persisted[owner]) for owner, _url in pages}
+            return pages, totals
+
+        monkeypatch.setattr(index, "_get_engine", lambda: object())
+        monkeypatch.setattr(index, "_load_pages", load_pages)
+        return index
+
+    def test_owner_is_reloaded_after_ttl(self, monkeypatch):
+        persisted = {"alpha.com": ["https://alpha.com/0"]}
+        index = self.make_index(monkeypatch, persisted, owner_ttl_seconds=60)
+        clock = [1000.0]
+        monkeypatch.setattr("seo_intelligence.services.topic_index.time.monotonic", lambda: clock[0])
+
+        assert index.ensure_owners(["alpha.com"]) == 1
+        assert index.ensure_owners(["alpha.com"]) == 0
+
+        # Another process indexes a new page
+        persisted["alpha.com"].append("https://alpha.com/1")
+        clock[0] += 61
+        assert index.ensure_owners(["alpha.com"]) == 2
+        assert index.get_stats()["pages"] == 2
+
+    def test_truncated_owner_is_not_marked_complete(self, monkeypatch):
+        persisted = {
+            "alpha.com": ["https://alpha.com/0"],
+            "beta.com": ["https://beta.com/0", "https://beta.com/1"],
+        }
+        index = self.make_index(monkeypatch, persisted, max_pages=2)
+
+        index.ensure_owners(["alpha.com", "beta.com"])
+        index.ensure_owners(["alpha.com", "beta.com"])
+
+        assert index.reads == [["alpha.com", "beta.com"], ["beta.com"]]
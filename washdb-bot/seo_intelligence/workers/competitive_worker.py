@@ -14,13 +14,14 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
 # Ensure environment is loaded
 load_dotenv(Path(__file__).parent.parent.parent / '.env')
 
 from seo_intelligence.orchestrator.module_worker import BaseModuleWorker, WorkerResult
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
 
 
@@ -45,7 +46,7 @@ class CompetitiveAnalysisWorker(BaseModuleWorker):
         database_url = os.environ.get('DATABASE_URL', '')
         if 'postgresql+psycopg' in database_url:
             database_url = database_url.replace('postgresql+psycopg', 'postgresql')
-        self.engine = create_engine(database_url, pool_pre_ping=True)
+        self.engine = get_engine(database_url)
         self.Session = sessionmaker(bind=self.engine)
 
         # Services (lazy initialization)
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Offline parser benchmarks over the captured page corpus.
+
+Every parser runs over the pages of its kind in tests/fixtures/parser_corpus
+(see manifest.json; pages are added with scripts/capture_parser_corpus.py).
+Each parser runs in a forked child process, so its imports, caches and
+memory don't leak into the next one, and reports:
+
+- pages_per_sec      parse throughput
+- p50_ms / p99_ms    per-page latency
+- peak_rss_mb        peak RSS of the child
+- setup_rss_mb       RSS added by importing/constructing the parser
+- rss_growth_mb      RSS added while parsing (caches, leaks) after setup
+
+Results are compared with parser_baseline.json. Timings are scaled by a
+calibration run (a fixed BeautifulSoup workload) so a baseline recorded on
+one machine is usable on another.
+
+Usage:
+    python -m tests.benchmarks.parser_bench                     # report + compare
+    python -m tests.benchmarks.parser_bench --update-baseline   # record baseline
+    python -m tests.benchmarks.parser_bench --parsers serp,yp_results --iterations 20
+"""
+
+import argparse
+import gc
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import traceback
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+CORPUS_DIR = Path(__file__).parent.parent / "fixtures" / "parser_corpus"
+BASELINE_PATH = Path(__file__).parent / "parser_baseline.json"
+
+# Allowed slowdown/growth relative to the baseline (0.35 = 35%)
+REGRESSION_THRESHOLD = float(os.getenv("PARSER_BENCH_THRESHOLD", "0.35"))
+# Passes over the corpus per parser
+BENCH_ITERATIONS = int(os.getenv("PARSER_BENCH_ITERATIONS", "5"))
+# RSS noise allowance on top of the relative threshold
+RSS_SLACK_MB = 10.0
+
+
+@dataclass
+class CorpusPage:
+    """One captured page from the corpus manifest."""
+    path: str
+    kind: str
+    url: str
+    html: str
+    query: Optional[str] = None
+    location: Optional[str] = None
+
+
+def load_corpus(corpus_dir: Path = CORPUS_DIR) -> Tuple[int, List[CorpusPage]]:
+    """
+    Load the corpus manifest and pages.
+
+    Args:
+        corpus_dir: Corpus directory containing manifest.json
+
+    Returns:
+        Tuple of (corpus version, pages)
+    """
+    manifest = json.loads((corpus_dir / "manifest.json").read_text())
+    pages = [
+        CorpusPage(
+            path=entry["path"],
+            kind=entry["kind"],
+            url=entry["url"],
+            html=(corpus_dir / entry["path"]).read_text(encoding="utf-8", errors="replace"),
+            query=entry.get("query"),
+            location=entry.get("location"),
+        )
+        for entry in manifest["pages"]
+    ]
+    return manifest["version"], pages
+
+
+# Parser setups run inside the benchmark child and return page -> result.
+
+def _site_parse() -> Callable[[CorpusPage], Any]:
+    from scrape_site.site_parse import parse_site_content
+    return lambda page: parse_site_content(page.html, page.url)
+
+
+def _yp_results() -> Callable[[CorpusPage], Any]:
+    # In-memory cache only, cleared per page: measure a cold parse
+    os.environ["YP_LISTING_CACHE_DB"] = "off"
+    from scrape_yp.listing_cache import get_listing_cache
+    from scrape_yp.yp_parser_enhanced import parse_yp_results_enhanced
+    cache = get_listing_cache()
+
+    def parse(page):
+        cache.clear()
+        return parse_yp_results_enhanced(page.html, page.url)
+    return parse
+
+
+def _serp() -> Callable[[CorpusPage], Any]:
+    from seo_intelligence.scrapers.serp_parser import SerpParser
+    parser = SerpParser()
+    return lambda page: parser.parse(page.html, page.query or "", page.location)
+
+
+def _competitor() -> Callable[[CorpusPage], Any]:
+    from seo_intelligence.scrapers.competitor_parser import CompetitorParser
+    parser = CompetitorParser()
+    return lambda page: parser.parse(page.html, page.url)
+
+
+def _readability() -> Callable[[CorpusPage], Any]:
+    from seo_intelligence.services.readability_analyzer import ReadabilityAnalyzer
+    analyzer = ReadabilityAnalyzer()
+    return lambda page: analyzer.analyze_html(page.html)
+
+
+def _technical_checks() -> Callable[[CorpusPage], Any]:
+    from bs4 import BeautifulSoup
+    from seo_intelligence.scrapers.technical_auditor import TechnicalAuditor
+    auditor = TechnicalAuditor()
+
+    def check(page):
+        soup = BeautifulSoup(page.html, "html.parser")
+        return [
+            auditor._check_meta_tags(soup, page.url),
+            auditor._check_headings(soup),
+            auditor._check_images(soup, page.url),
+            auditor._check_links(soup, page.url),
+            auditor._check_schema(soup),
+            auditor._check_performance(None, soup),
+        ]
+    return check
+
+
+# name -> (corpus page kind, setup)
+PARSERS: Dict[str, Tuple[str, Callable[[], Callable[[CorpusPage], Any]]]] = {
+    "site_parse": ("web", _site_parse),
+    "yp_results": ("yp", _yp_results),
+    "serp": ("serp", _serp),
+    "competitor": ("web", _competitor),
+    "readability": ("web", _readability),
+    "technical_checks": ("web", _technical_checks),
+}
+
+
+def _rss_mb() -> float:
+    """Current RSS of this process in MB."""
+    import psutil
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def _measure(name: str, pages: List[CorpusPage], iterations: int) -> Dict[str, Any]:
+    """Run one parser over its pages (in the benchmark child)."""
+    logging.disable(logging.INFO)
+    rss_before = _rss_mb()
+
+    parse = PARSERS[name][1]()
+    rss_setup = _rss_mb()
+    # Warm-up pass: imports, compiled patterns, lazy tables
+    for page in pages:
+        parse(page)
+    gc.collect()
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for page in pages:
+            page_start = time.perf_counter()
+            parse(page)
+            latencies.append(time.perf_counter() - page_start)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    rss_after = _rss_mb()
+
+    # ru_maxrss is KB on Linux, bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+
+    return {
+        'pages': len(pages),
+        'iterations': iterations,
+        'pages_per_sec': round(len(latencies) / elapsed, 2),
+        'p50_ms': round(statistics.median(latencies) * 1000, 3),
+        'p99_ms': round(_percentile(latencies, 99) * 1000, 3),
+        'peak_rss_mb': round(peak_rss_mb, 1),
+        'setup_rss_mb': round(max(0.0, rss_setup - rss_before), 1),
+        'rss_growth_mb': round(max(0.0, rss_after - rss_setup), 1),
+    }
+
+
+def _child(name, pages, iterations, conn):
+    """Benchmark child entry point: send back stats or an error."""
+    try:
+        conn.send(_measure(name, pages, iterations))
+    except Exception:
+        conn.send({'error': traceback.format_exc()})
+    finally:
+        conn.close()
+
+
+def run_parser(
+    name: str,
+    pages: Optional[List[CorpusPage]] = None,
+    iterations: int = BENCH_ITERATIONS,
+) -> Dict[str, Any]:
+    """
+    Benchmark one parser over its corpus pages.
+
+    Args:
+        name: Parser name (key of PARSERS)
+        pages: Corpus pages (default: load the corpus)
+        iterations: Passes over the pages
+
+    Returns:
+        dict: pages, iterations, pages_per_sec, p50_ms, p99_ms,
+        peak_rss_mb, setup_rss_mb, rss_growth_mb - or {'error': traceback}
+    """
+    kind = PARSERS[name][0]
+    if pages is None:
+        _, pages = load_corpus()
+    pages = [page for page in pages if page.kind == kind]
+    if not pages:
+        return {'error': f"No '{kind}' pages in the corpus"}
+
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        # No fork (Windows): measure in-process; RSS includes earlier parsers
+        try:
+            return _measure(name, pages, iterations)
+        except Exception:
+            return {'error': traceback.format_exc()}
+
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(target=_child, args=(name, pages, iterations, child_conn))
+    process.start()
+    child_conn.close()
+    try:
+        result = parent_conn.recv()
+    except EOFError:
+        result = {'error': f"Benchmark process exited with code {process.exitcode}"}
+    process.join()
+    return result
+
+
+def calibrate(rounds: int = 7) -> float:
+    """
+    Time a fixed BeautifulSoup workload (fastest run, ms) to scale baselines.
+
+    Returns:
+        Milliseconds per calibration run on this machine
+    """
+    from bs4 import BeautifulSoup
+
+    html = "<html><body>" + "".join(
+        f"<div class='item' id='i{n}'><a href='/p/{n}'>Item {n}</a><p>Text {n} " + "word " * 20 + "</p></div>"
+        for n in range(300)
+    ) + "</body></html>"
+
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        soup = BeautifulSoup(html, "html.parser")
+        soup.select("div.item a[href]")
+        soup.get_text(" ")
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(min(timings), 3)
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[Dict[str, Any]]:
+    """Load the stored baseline (None if there is none yet)."""
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def save_baseline(
+    results: Dict[str, Dict[str, Any]],
+    corpus_version: int,
+    calibration_ms: float,
+    path: Path = BASELINE_PATH,
+):
+    """Record results as the new baseline."""
+    baseline = {
+        'corpus_version': corpus_version,
+        'calibration_ms': calibration_ms,
+        'recorded_at': datetime.now().strftime("%Y-%m-%d"),
+        'python': platform.python_version(),
+        'parsers': results,
+    }
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def compare(
+    name: str,
+    result: Dict[str, Any],
+    baseline: Dict[str, Any],
+    calibration_ms: float,
+    threshold: float = REGRESSION_THRESHOLD,
+) -> List[str]:
+    """
+    Compare one parser's result with the baseline.
+
+    Throughput and latency are scaled by the calibration ratio when this
+    machine is slower (never tightened on a faster one, so calibration noise
+    can't fail a run); p99 gets twice the threshold (few samples), RSS
+    growth gets RSS_SLACK_MB extra.
+
+    Args:
+        name: Parser name
+        result: Fresh benchmark result
+        baseline: Stored baseline (load_baseline())
+        calibration_ms: calibrate() on this machine
+        threshold: Allowed relative regression
+
+    Returns:
+        Regression messages (empty if within the threshold or no baseline)
+    """
+    expected = baseline['parsers'].get(name)
+    if not expected:
+        return []
+
+    # >1 when this machine is slower than the baseline machine
+    speed = 1.0
+    if baseline.get('calibration_ms'):
+        speed = max(1.0, calibration_ms / baseline['calibration_ms'])
+    regressions = []
+
+    min_rate = expected['pages_per_sec'] / speed * (1 - threshold)
+    if result['pages_per_sec'] < min_rate:
+        regressions.append(
+            f"{name}: {result['pages_per_sec']:.1f} pages/sec < {min_rate:.1f} "
+            f"(baseline {expected['pages_per_sec']:.1f})"
+        )
+
+    for metric, allowed in (('p50_ms', threshold), ('p99_ms', 2 * threshold)):
+        limit = expected[metric] * speed * (1 + allowed)
+        if result[metric] > limit:
+            regressions.append(
+                f"{name}: {metric} {result[metric]:.2f} > {limit:.2f} (baseline {expected[metric]:.2f})"
+            )
+
+    rss_limit = expected['rss_growth_mb'] * (1 + threshold) + RSS_SLACK_MB
+    if result['rss_growth_mb'] > rss_limit:
+        regressions.append(
+            f"{name}: RSS growth {result['rss_growth_mb']:.1f}MB > {rss_limit:.1f}MB "
+            f"(baseline {expected['rss_growth_mb']:.1f}MB)"
+        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsers over the offline page corpus")
+    parser.add_argument("--parsers", help=f"Comma-separated parsers (default: all of {', '.join(PARSERS)})")
+    parser.add_argument("--iterations", type=int, default=BENCH_ITERATIONS, help="Passes over the corpus")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Allowed regression (0.35 = 35%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="Record the results as the new baseline")
+    args = parser.parse_args()
+
+    names = args.parsers.split(",") if args.parsers else list(PARSERS)
+    corpus_version, pages = load_corpus()
+    calibration_ms = calibrate()
+    baseline = load_baseline()
+
+    print(f"Corpus v{corpus_version}: {len(pages)} pages, calibration {calibration_ms:.2f}ms")
+    print(
+        f"{'parser':<18} {'pages/s':>9} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'peak MB':>9} {'setup MB':>9} {'+RSS MB':>9}"
+    )
+
+    results = {}
+    regressions = []
+    for name in names:
+        result = run_parser(name, pages, args.iterations)
+        if 'error' in result:
+            print(f"{name:<18} ERROR\n{result['error']}")
+            regressions.append(f"{name}: failed")
+            continue
+        results[name] = result
+        print(
+            f"{name:<18} {result['pages_per_sec']:>9.1f} {result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+            f"{result['peak_rss_mb']:>9.1f} {result['setup_rss_mb']:>9.1f} {result['rss_growth_mb']:>9.1f}"
+        )
+        if baseline and baseline['corpus_version'] == corpus_version and not args.update_baseline:
+            regressions.extend(compare(name, result, baseline, calibration_ms, args.threshold))
+
+    if args.update_baseline:
+        if baseline and baseline['corpus_version'] == corpus_version:
+            # Keep entries for parsers that were not re-run
+            results = {**baseline['parsers'], **results}
+        save_baseline(results, corpus_version, calibration_ms)
+        print(f"Baseline written to {BASELINE_PATH}")
+    elif baseline is None or baseline['corpus_version'] != corpus_version:
+        print("No baseline for this corpus version; run with --update-baseline")
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Parser benchmark regression tests over the offline page corpus.
+
+Each parser is benchmarked in its own process (tests/benchmarks/parser_bench.py)
+and compared with parser_baseline.json. The wall-clock checks are marked
+benchmark and deselected by default; run them with:
+    pytest -m benchmark tests/benchmarks
+
+Refresh the baseline after an intended change or a corpus update:
+    python -m tests.benchmarks.parser_bench --update-baseline
+"""
+
+import hashlib
+
+import pytest
+
+from tests.benchmarks import parser_bench
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return parser_bench.load_corpus()
+
+
+@pytest.fixture(scope="module")
+def calibration_ms():
+    return parser_bench.calibrate()
+
+
+def test_corpus_manifest_is_consistent(corpus):
+    version, pages = corpus
+    manifest = parser_bench.json.loads((parser_bench.CORPUS_DIR / "manifest.json").read_text())
+
+    assert version >= 1
+    for entry in manifest["pages"]:
+        data = (parser_bench.CORPUS_DIR / entry["path"]).read_bytes()
+        assert hashlib.sha1(data).hexdigest() == entry["sha1"], entry["path"]
+
+    kinds = {page.kind for page in pages}
+    assert kinds == {kind for kind, _ in parser_bench.PARSERS.values()}
+    assert all(page.query for page in pages if page.kind == "serp")
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        'calibration_ms': 10.0,
+        'parsers': {'serp': {'pages_per_sec': 100.0, 'p50_ms': 10.0, 'p99_ms': 20.0, 'rss_growth_mb': 2.0}},
+    }
+    ok = {'pages_per_sec': 90.0, 'p50_ms': 11.0, 'p99_ms': 30.0, 'rss_growth_mb': 5.0}
+    slow = {'pages_per_sec': 40.0, 'p50_ms': 25.0, 'p99_ms': 60.0, 'rss_growth_mb': 40.0}
+
+    assert parser_bench.compare('serp', ok, baseline, 10.0, threshold=0.35) == []
+    assert len(parser_bench.compare('serp', slow, baseline, 10.0, threshold=0.35)) == 4
+    # Same numbers on a machine half as fast are fine
+    assert parser_bench.compare('serp', slow, baseline, 25.0, threshold=0.35)[-1].startswith("serp: RSS")
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+@pytest.mark.parametrize("name", list(parser_bench.PARSERS))
+def test_parser_within_baseline(name, corpus, calibration_ms):
+    version, pages = corpus
+    result = parser_bench.run_parser(name, pages, iterations=3)
+    assert 'error' not in result, result.get('error')
+    assert result['pages_per_sec'] > 0
+
+    baseline = parser_bench.load_baseline()
+    if baseline is None or baseline['corpus_version'] != version:
+        pytest.skip("No baseline for this corpus version (run parser_bench --update-baseline)")
+
+    regressions = parser_bench.compare(name, result, baseline, calibration_ms)
+    assert not regressions, "\n".join(regressions)
@@ -23,6 +23,8 @@ from seo_intelligence.services.url_canonicalizer import (
 # Domain Quarantine tests
 from seo_intelligence.services.domain_quarantine import (
     get_domain_quarantine,
+    DomainQuarantine,
+    QuarantineStore,
     QuarantineReason
 )
 
@@ -242,6 +244,71 @@ class TestDomainQuarantine:
         assert stats["by_reason"]["CAPTCHA_DETECTED"] == 2
 
 
+class TestSharedQuarantineStore:
+    """Test quarantine state shared through the SQLite store."""
+
+    def test_quarantine_visible_to_other_instance(self, tmp_path):
+        """A quarantine set by one worker is seen by another on sync."""
+        path = tmp_path / "quarantine.db"
+        worker_a = DomainQuarantine(store=QuarantineStore(path))
+        worker_b = DomainQuarantine(store=QuarantineStore(path))
+
+        worker_a.quarantine_domain("example.com", "403_FORBIDDEN")
+        worker_b.sync()
+
+        assert worker_b.is_quarantined("example.com")
+        assert worker_b.get_retry_attempt("example.com") == 1
+
+        worker_b.release_quarantine("example.com")
+        worker_a.sync()
+        assert not worker_a.is_quarantined("example.com")
+
+    def test_state_survives_restart(self, tmp_path):
+        """CAPTCHA tiers and quarantines are restored by a new instance."""
+        path = tmp_path / "quarantine.db"
+        first = DomainQuarantine(store=QuarantineStore(path))
+        first.quarantine_domain("google.com", "CAPTCHA_DETECTED")
+
+        restarted = DomainQuarantine(store=QuarantineStore(path))
+
+        assert restarted.is_quarantined("google.com")
+        assert restarted.get_captcha_stats("google.com")["captcha_count"] == 1
+        assert restarted.get_captcha_stats("google.com")["current_tier"] == 2
+
+    def test_error_events_shared_in_batches(self, tmp_path):
+        """Repeated 429s across workers trigger quarantine."""
+        path = tmp_path / "quarantine.db"
+        worker_a = DomainQuarantine(store=QuarantineStore(path), event_batch_size=2)
+        worker_b = DomainQuarantine(store=QuarantineStore(path))
+
+        worker_a.record_error_event("example.com", "429")
+        worker_a.record_error_event("example.com", "429")  # flushes the batch
+        worker_b.sync()
+
+        worker_b.record_error_event("example.com", "429")
+        assert worker_b.is_quarantined("example.com")
+        assert worker_b.get_quarantine_entry("example.com").reason == QuarantineReason.TOO_MANY_REQUESTS_429
+
+    def test_hot_path_refresh_only_reads(self, tmp_path, monkeypatch):
+        """is_quarantined() refreshes without flushing or expiring."""
+        store = QuarantineStore(tmp_path / "quarantine.db")
+        quarantine = DomainQuarantine(store=store, sync_interval=0)
+
+        def no_writes(*args):
+            raise AssertionError("hot path wrote to the store")
+
+        monkeypatch.setattr(store, "expire", no_writes)
+        monkeypatch.setattr(store, "add_error_events", no_writes)
+
+        assert not quarantine.is_quarantined("example.com")
+
+    def test_singleton_store_is_isolated(self, tmp_path):
+        """The conftest points the shared store at tmp_path."""
+        quarantine = get_domain_quarantine()
+
+        assert quarantine._store.path == str(tmp_path / "domain_quarantine.db")
+
+
 def test_migration_025_tables_exist():
     """Test that Migration 025 restored required tables."""
     from db.models import Base, engine
@@ -0,0 +1,19 @@
+"""
+Record/replay HTTP and browser fixtures for end-to-end throughput tests.
+"""
+
+from tests.replay.hooks import live_session, patch_httpx, patch_playwright, patch_requests, replay
+from tests.replay.server import FaultProfile, ReplayServer
+from tests.replay.store import RecordedResponse, ReplayStore
+
+__all__ = [
+    "FaultProfile",
+    "RecordedResponse",
+    "ReplayServer",
+    "ReplayStore",
+    "live_session",
+    "patch_httpx",
+    "patch_playwright",
+    "patch_requests",
+    "replay",
+]
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Route the scrapers' HTTP clients to a ReplayServer.
+
+- requests: HTTPAdapter.send is patched, so requests.get() and every
+  Session (including pooled ones created before the patch) hit the
+  server; configured proxies are bypassed.
+- httpx: HTTPTransport/AsyncHTTPTransport are patched the same way.
+- Playwright: every context created through Browser.new_context,
+  Browser.new_page or BrowserType.launch_persistent_context (sync and
+  async APIs) gets a "**/*" route that fetches each request from the
+  server and fulfils it (a dropped connection aborts the request).
+
+Usage:
+    from tests.replay import FaultProfile, ReplayStore, replay
+
+    with replay(store, FaultProfile(latency_ms=100)) as server:
+        scrape_website("https://example.com/")
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from contextlib import ExitStack, contextmanager
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tests.replay.server import TARGET_HEADER, FaultProfile, ReplayServer
+from tests.replay.store import DROP_HEADERS, ReplayStore
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    from playwright import async_api as playwright_async
+    from playwright import sync_api as playwright_sync
+    HAS_PLAYWRIGHT = True
+except ImportError:
+    HAS_PLAYWRIGHT = False
+
+# Unpatched originals: the live session and the hooks themselves call these
+_ORIGINAL_SEND = HTTPAdapter.send
+
+
+def _path_of(url: str) -> str:
+    parts = urlsplit(url)
+    return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+
+class _LiveAdapter(HTTPAdapter):
+    """HTTPAdapter that always goes to the network, even while patched."""
+
+    def send(self, request, *args, **kwargs):
+        return _ORIGINAL_SEND(self, request, *args, **kwargs)
+
+
+def live_session() -> requests.Session:
+    """requests session that bypasses patch_requests (used for recording)."""
+    session = requests.Session()
+    session.mount("http://", _LiveAdapter())
+    session.mount("https://", _LiveAdapter())
+    return session
+
+
+@contextmanager
+def patch_requests(server: ReplayServer):
+    """Send all requests-library traffic to the replay server."""
+
+    def send(self, request, *args, **kwargs):
+        target = request.url
+        request.headers[TARGET_HEADER] = target
+        request.url = server.url + _path_of(target)
+        kwargs['proxies'] = {}
+        try:
+            response = _ORIGINAL_SEND(self, request, *args, **kwargs)
+        finally:
+            request.url = target
+            request.headers.pop(TARGET_HEADER, None)
+        response.url = target
+        return response
+
+    HTTPAdapter.send = send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = _ORIGINAL_SEND
+
+
+@contextmanager
+def patch_httpx(server: ReplayServer):
+    """Send all httpx traffic (sync and async) to the replay server."""
+    if not HAS_HTTPX:
+        yield
+        return
+
+    original_sync = httpx.HTTPTransport.handle_request
+    original_async = httpx.AsyncHTTPTransport.handle_async_request
+    # Direct transports: the patched ones may be configured with proxies
+    direct = httpx.HTTPTransport()
+    direct_async = weakref.WeakKeyDictionary()
+
+    def rewrite(request):
+        target = request.url
+        request.headers[TARGET_HEADER] = str(target)
+        request.url = httpx.URL(server.url + _path_of(str(target)))
+        return target
+
+    def handle_request(self, request):
+        target = rewrite(request)
+        try:
+            return original_sync(direct, request)
+        finally:
+            request.url = target
+
+    async def handle_async_request(self, request):
+        # Async connection pools are tied to the loop they were created on
+        loop = asyncio.get_running_loop()
+        transport = direct_async.get(loop)
+        if transport is None:
+            transport = direct_async[loop] = httpx.AsyncHTTPTransport()
+        target = rewrite(request)
+        try:
+            return await original_async(transport, request)
+        finally:
+            request.url = target
+
+    httpx.HTTPTransport.handle_request = handle_request
+    httpx.AsyncHTTPTransport.handle_async_request = handle_async_request
+    try:
+        yield
+    finally:
+        httpx.HTTPTransport.handle_request = original_sync
+        httpx.AsyncHTTPTransport.handle_async_request = original_async
+        direct.close()
+
+
+@contextmanager
+def patch_playwright(server: ReplayServer):
+    """Fulfil every Playwright request (sync and async API) from the replay server."""
+    if not HAS_PLAYWRIGHT:
+        yield
+        return
+
+    # Requests go over HTTP to the server, so forked worker processes share
+    # its counters; one live session per thread and process
+    local = threading.local()
+
+    def fetch(method: str, url: str, body: Optional[bytes]):
+        session = getattr(local, "session", None)
+        if session is None or local.pid != os.getpid():
+            session = local.session = live_session()
+            session.trust_env = False
+            local.pid = os.getpid()
+        try:
+            response = session.request(
+                method, server.url + _path_of(url), headers={TARGET_HEADER: url},
+                data=body, allow_redirects=False, timeout=120,
+            )
+        except requests.ConnectionError:
+            return None
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in DROP_HEADERS}
+        return response.status_code, headers, response.content
+
+    def handle(route):
+        request = route.request
+        result = fetch(request.method, request.url, request.post_data_buffer)
+        if result is None:
+            route.abort("connectionreset")
+        else:
+            status, headers, body = result
+            route.fulfill(status=status, headers=headers, body=body)
+
+    async def handle_async(route):
+        request = route.request
+        result = await asyncio.to_thread(fetch, request.method, request.url, request.post_data_buffer)
+        if result is None:
+            await route.abort("connectionreset")
+        else:
+            status, headers, body = result
+            await route.fulfill(status=status, headers=headers, body=body)
+
+    def wrap_sync(original, page_result=False):
+        def wrapper(*args, **kwargs):
+            result = original(*args, **kwargs)
+            context = result.context if page_result else result
+            context.route("**/*", handle)
+            return result
+        return wrapper
+
+    def wrap_async(original, page_result=False):
+        async def wrapper(*args, **kwargs):
+            result = await original(*args, **kwargs)
+            context = result.context if page_result else result
+            await context.route("**/*", handle_async)
+            return result
+        return wrapper
+
+    patches = [
+        (playwright_sync.Browser, "new_context", wrap_sync, False),
+        (playwright_sync.Browser, "new_page", wrap_sync, True),
+        (playwright_sync.BrowserType, "launch_persistent_context", wrap_sync, False),
+        (playwright_async.Browser, "new_context", wrap_async, False),
+        (playwright_async.Browser, "new_page", wrap_async, True),
+        (playwright_async.BrowserType, "launch_persistent_context", wrap_async, False),
+    ]
+    originals = []
+    for cls, name, wrap, page_result in patches:
+        original = getattr(cls, name)
+        originals.append((cls, name, original))
+        setattr(cls, name, wrap(original, page_result))
+    try:
+        yield
+    finally:
+        for cls, name, original in originals:
+            setattr(cls, name, original)
+
+
+@contextmanager
+def replay(
+    store: ReplayStore,
+    profile: Optional[FaultProfile] = None,
+    record: bool = False,
+    use_requests: bool = True,
+    use_httpx: bool = True,
+    use_playwright: bool = True,
+):
+    """
+    Start a ReplayServer and route the HTTP clients to it.
+
+    Args:
+        store: Recorded responses
+        profile: Latency/failure injection
+        record: Fetch and store unrecorded URLs live (call store.save() after)
+        use_requests: Patch the requests library
+        use_httpx: Patch httpx
+        use_playwright: Route Playwright contexts
+
+    Yields:
+        The running ReplayServer (get_stats() for hit/miss/error counts)
+    """
+    server = ReplayServer(store, profile, record=record, live_session=live_session() if record else None)
+    with ExitStack() as stack:
+        stack.enter_context(server)
+        if use_requests:
+            stack.enter_context(patch_requests(server))
+        if use_httpx:
+            stack.enter_context(patch_httpx(server))
+        if use_playwright:
+            stack.enter_context(patch_playwright(server))
+        yield server
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Throughput load test of the crawl pipelines against the replay stand-in.
+
+Runs N workers through M targets of one pipeline with every HTTP client
+routed to a ReplayServer, and reports targets/hour, per-target latency
+and the server's hit/miss/error counters:
+
+- site    scrape_site.site_scraper.scrape_website (requests)
+- yp      scrape_yp.yp_crawl_city_first.crawl_single_target (Playwright)
+- google  scrape_google.google_crawl_city_first.crawl_single_target (async Playwright)
+- yelp    scrape_yelp.yelp_crawl_city_first.crawl_single_target (async Playwright)
+- seo     BaseScraper.fetch_page (Playwright)
+
+Responses come from the parser corpus (tests/fixtures/parser_corpus) via
+URL routes, plus any recordings in --store. Run with --record against
+live sites to fill a store with real pages first. Nothing is written to
+the database: targets are unsaved ORM objects and save_to_db is off.
+
+The crawlers' human-like delays are scaled by --delay-scale (default 0:
+measure the pipeline, not the politeness delays); injected latency is
+always applied in full.
+
+Usage:
+    python -m tests.replay.load_test --pipeline site --workers 8 --targets 200 --latency-ms 150
+    python -m tests.replay.load_test --pipeline yp --workers 4 --targets 20 --error-rate 0.05
+    python -m tests.replay.load_test --pipeline site --targets 5 --store /tmp/cassette --record
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import queue
+import statistics
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from tests.replay.hooks import replay
+from tests.replay.server import FaultProfile
+from tests.replay.store import ReplayStore
+
+CORPUS_DIR = Path(__file__).parent.parent / "fixtures" / "parser_corpus"
+SITE_DOMAIN = "replay.test"
+PIPELINES = ("site", "yp", "google", "yelp", "seo")
+
+EMPTY_RESULTS_PAGE = "<html><head><title>No results</title></head><body><div class='search-results organic'></div></body></html>"
+ROBOTS_TXT = "User-agent: *\nAllow: /\n"
+
+
+def corpus_store(store: Optional[ReplayStore] = None, corpus_dir: Path = CORPUS_DIR) -> ReplayStore:
+    """
+    Add URL routes that serve the parser corpus for every pipeline.
+
+    Recordings already in the store take precedence over these routes.
+
+    Args:
+        store: Store to extend (default: a new in-memory one)
+        corpus_dir: Parser corpus directory
+
+    Returns:
+        The store
+    """
+    store = store or ReplayStore()
+    text = {"Content-Type": "text/plain"}
+
+    store.add_route("*/robots.txt", ROBOTS_TXT, headers=text)
+    # YP: page 1 and 2 recorded, later pages empty (ends pagination)
+    store.add_route("https://www.yellowpages.com/*page=2*", corpus_dir / "yp" / "power-washing-austin-tx-page2.html")
+    store.add_route("https://www.yellowpages.com/*page=*", EMPTY_RESULTS_PAGE)
+    store.add_route("https://www.yellowpages.com/*", corpus_dir / "yp" / "power-washing-austin-tx.html")
+    # Business sites: homepage, then any internal page
+    store.add_route(f"https://*.{SITE_DOMAIN}/", corpus_dir / "web" / "sparkle-exterior-cleaning.html")
+    store.add_route(f"https://*.{SITE_DOMAIN}/*", corpus_dir / "web" / "lone-star-pressure-washing.html")
+    # No Maps/Yelp pages in the corpus: the SERP page stands in (record real ones with --record)
+    store.add_route("https://www.google.com/*", corpus_dir / "serp" / "pressure-washing-austin-tx.html")
+    store.add_route("https://www.yelp.com/*", corpus_dir / "serp" / "soft-washing-dallas-tx.html")
+    return store
+
+
+@contextmanager
+def scaled_delays(scale: float):
+    """Scale time.sleep and asyncio.sleep (the crawlers' human-like delays)."""
+    if scale == 1.0:
+        yield
+        return
+
+    original_sleep = time.sleep
+    original_async_sleep = asyncio.sleep
+
+    def sleep(seconds):
+        original_sleep(seconds * scale)
+
+    async def async_sleep(delay, *args, **kwargs):
+        return await original_async_sleep(delay * scale, *args, **kwargs)
+
+    time.sleep = sleep
+    asyncio.sleep = async_sleep
+    try:
+        yield
+    finally:
+        time.sleep = original_sleep
+        asyncio.sleep = original_async_sleep
+
+
+CITIES = [("Austin", "TX"), ("Dallas", "TX"), ("Denver", "CO"), ("Tampa", "FL"), ("Phoenix", "AZ")]
+
+
+def _site_targets(count: int) -> List[str]:
+    return [f"https://site-{n}.{SITE_DOMAIN}/" for n in range(count)]
+
+
+def _yp_targets(count: int) -> list:
+    from db.models import YPTarget
+
+    targets = []
+    for n in range(count):
+        city, state = CITIES[n % len(CITIES)]
+        slug = f"{city.lower()}-{state.lower()}"
+        targets.append(YPTarget(
+            id=n, provider="YP", state_id=state, city=city, city_slug=slug, yp_geo=f"{city}, {state}",
+            category_label="Power Washing", category_slug="power-washing",
+            primary_url=f"https://www.yellowpages.com/{slug}/power-washing?t={n}",
+            fallback_url=f"https://www.yellowpages.com/search?search_terms=power+washing&geo_location_terms={slug}&t={n}",
+            max_pages=3, priority=1, status="planned", attempts=0,
+        ))
+    return targets
+
+
+def _maps_targets(model, count: int) -> list:
+    targets = []
+    for n in range(count):
+        city, state = CITIES[n % len(CITIES)]
+        fields = dict(
+            id=n, provider=model.__name__.replace("Target", "").upper(), state_id=state, city=city,
+            city_slug=f"{city.lower()}-{state.lower()}", category_label="Pressure Washing",
+            category_keyword="pressure washing", max_results=20, priority=1, status="PLANNED", attempts=0,
+        )
+        if hasattr(model, "search_query"):
+            fields['search_query'] = f"pressure washing near {city}, {state} {n}"
+        targets.append(model(**fields))
+    return targets
+
+
+def _timed(process: Callable[[int, Any], Any], worker_id: int, item) -> Dict[str, Any]:
+    """Run one target and time it."""
+    start = time.perf_counter()
+    try:
+        process(worker_id, item)
+        ok, error = True, None
+    except Exception as e:
+        ok, error = False, f"{type(e).__name__}: {e}"
+    return {'ok': ok, 'error': error, 'seconds': time.perf_counter() - start}
+
+
+def _run_threads(items: list, workers: int, process: Callable[[int, Any], Any]) -> List[Dict[str, Any]]:
+    """Process items with N threads; returns per-item outcomes."""
+    outcomes: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    next_index = iter(range(len(items)))
+    lock = threading.Lock()
+
+    def worker(worker_id: int):
+        while True:
+            with lock:
+                index = next(next_index, None)
+            if index is None:
+                return
+            outcomes[index] = _timed(process, worker_id, items[index])
+
+    threads = [threading.Thread(target=worker, args=(n,), name=f"load-worker-{n}") for n in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def _run_processes(items: list, workers: int, process: Callable[[int, Any], Any]) -> List[Dict[str, Any]]:
+    """
+    Process items with N forked worker processes.
+
+    For crawlers whose sync Playwright instance is bound to one thread
+    (the YP browser pool); production runs those workers as processes too.
+    """
+    import multiprocessing
+    context = multiprocessing.get_context("fork")
+    tasks, results = context.Queue(), context.Queue()
+    for index in range(len(items)):
+        tasks.put(index)
+    for _ in range(workers):
+        tasks.put(None)
+
+    def worker(worker_id: int):
+        try:
+            while True:
+                index = tasks.get()
+                if index is None:
+                    return
+                results.put((index, _timed(process, worker_id, items[index])))
+        finally:
+            _close_sync_pools()
+
+    processes = [context.Process(target=worker, args=(n,), name=f"load-worker-{n}") for n in range(workers)]
+    for proc in processes:
+        proc.start()
+
+    outcomes: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    pending = len(items)
+    while pending:
+        try:
+            index, outcome = results.get(timeout=1)
+        except queue.Empty:
+            if not any(proc.is_alive() for proc in processes):
+                break
+            continue
+        outcomes[index] = outcome
+        pending -= 1
+    for proc in processes:
+        proc.join()
+
+    # Targets lost with a crashed worker process
+    lost = {'ok': False, 'error': "Worker process exited", 'seconds': 0.0}
+    return [outcome or lost for outcome in outcomes]
+
+
+def _close_sync_pools():
+    try:
+        from scrape_yp.browser_pool import get_browser_pool
+        get_browser_pool().cleanup()
+    except Exception:
+        pass
+
+
+def _run_async(items: list, workers: int, process) -> List[Dict[str, Any]]:
+    """Process items with N coroutines on one event loop."""
+    outcomes: List[Optional[Dict[str, Any]]] = [None] * len(items)
+
+    async def main():
+        queue = asyncio.Queue()
+        for index in range(len(items)):
+            queue.put_nowait(index)
+
+        async def worker(worker_id: int):
+            while not queue.empty():
+                index = queue.get_nowait()
+                start = time.perf_counter()
+                try:
+                    await process(worker_id, items[index])
+                    ok, error = True, None
+                except Exception as e:
+                    ok, error = False, f"{type(e).__name__}: {e}"
+                outcomes[index] = {'ok': ok, 'error': error, 'seconds': time.perf_counter() - start}
+
+        try:
+            await asyncio.gather(*(worker(n) for n in range(workers)))
+        finally:
+            await _close_async_pools()
+
+    asyncio.run(main())
+    return outcomes
+
+
+async def _close_async_pools():
+    try:
+        from scrape_google.browser_pool import get_browser_pool
+        await (await get_browser_pool()).cleanup()
+    except Exception:
+        pass
+
+
+def _pipeline(name: str, count: int):
+    """Return (targets, runner, process) for a pipeline."""
+    from sqlalchemy.orm import Session
+
+    if name == "site":
+        from scrape_site.site_scraper import scrape_website
+        return _site_targets(count), _run_threads, lambda worker_id, url: scrape_website(url)
+
+    if name == "yp":
+        from scrape_yp.yp_crawl_city_first import crawl_single_target
+        from scrape_yp.yp_filter import YPFilter
+        yp_filter = YPFilter()
+
+        def process(worker_id, target):
+            with Session() as session:
+                crawl_single_target(target, session, yp_filter, worker_id=worker_id)
+        return _yp_targets(count), _run_processes, process
+
+    if name == "google":
+        from db.models import GoogleTarget
+        from scrape_google.google_crawl_city_first import crawl_single_target
+
+        async def process(worker_id, target):
+            with Session() as session:
+                await crawl_single_target(target, session, scrape_details=False, save_to_db=False, worker_id=worker_id)
+        return _maps_targets(GoogleTarget, count), _run_async, process
+
+    if name == "yelp":
+        from db.models import YelpTarget
+        from scrape_yelp.yelp_crawl_city_first import crawl_single_target
+
+        async def process(worker_id, target):
+            with Session() as session:
+                await crawl_single_target(target, session, scrape_details=False, save_to_db=False)
+        return _maps_targets(YelpTarget, count), _run_async, process
+
+    if name == "seo":
+        from urllib.parse import urlparse
+        from seo_intelligence.scrapers.base_scraper import BaseScraper
+
+        class PageFetcher(BaseScraper):
+            def run(self, url):
+                with self.browser_session(urlparse(url).netloc) as (browser, context, page):
+                    if self.fetch_page(url, page) is None:
+                        raise RuntimeError(f"fetch_page failed for {url}")
+
+        local = threading.local()
+
+        def process(worker_id, url):
+            if not hasattr(local, "fetcher"):
+                local.fetcher = PageFetcher("replay_load_test", tier="G", max_retries=1)
+            local.fetcher.run(url)
+        return _site_targets(count), _run_threads, process
+
+    raise ValueError(f"Unknown pipeline: {name}")
+
+
+def run_load_test(
+    pipeline: str,
+    workers: int = 4,
+    targets: int = 20,
+    profile: Optional[FaultProfile] = None,
+    store: Optional[ReplayStore] = None,
+    record: bool = False,
+    delay_scale: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Run one pipeline against the replay stand-in.
+
+    Args:
+        pipeline: One of PIPELINES
+        workers: Concurrent workers (threads; processes for yp, coroutines
+            for google/yelp)
+        targets: Number of targets to crawl
+        profile: Latency/failure injection
+        store: Recordings (corpus routes are added after them)
+        record: Record unrecorded URLs live into the store
+        delay_scale: Multiplier for the crawlers' own sleeps
+
+    Returns:
+        dict: pipeline, workers, targets, succeeded, failed, elapsed_seconds,
+        targets_per_hour, p50/p95 seconds per target, first errors and the
+        replay server stats
+    """
+    store = corpus_store(store)
+    items, runner, process = _pipeline(pipeline, targets)
+
+    with replay(store, profile, record=record) as server, scaled_delays(delay_scale):
+        start = time.perf_counter()
+        outcomes = runner(items, workers, process)
+        elapsed = time.perf_counter() - start
+        server_stats = server.get_stats()
+
+    durations = sorted(outcome['seconds'] for outcome in outcomes)
+    succeeded = sum(1 for outcome in outcomes if outcome['ok'])
+    return {
+        'pipeline': pipeline,
+        'workers': workers,
+        'targets': len(outcomes),
+        'succeeded': succeeded,
+        'failed': len(outcomes) - succeeded,
+        'elapsed_seconds': round(elapsed, 2),
+        'targets_per_hour': round(len(outcomes) / elapsed * 3600, 1) if elapsed else 0.0,
+        'p50_target_seconds': round(statistics.median(durations), 3) if durations else 0.0,
+        'p95_target_seconds': round(durations[int(0.95 * (len(durations) - 1))], 3) if durations else 0.0,
+        'errors': [outcome['error'] for outcome in outcomes if outcome['error']][:5],
+        'server': server_stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test a crawl pipeline against the replay stand-in")
+    parser.add_argument("--pipeline", choices=PIPELINES, default="site", help="Pipeline to run")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent workers")
+    parser.add_argument("--targets", type=int, default=20, help="Targets to crawl")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Injected latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Latency jitter (+/-)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an error")
+    parser.add_argument("--error-status", type=int, action="append", help="Injected error status (repeatable, default 503)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of connections dropped")
+    parser.add_argument("--seed", type=int, help="Random seed for the injected faults")
+    parser.add_argument("--delay-scale", type=float, default=0.0, help="Multiplier for the crawlers' sleeps (1 = real)")
+    parser.add_argument("--store", type=Path, help="Recording directory")
+    parser.add_argument("--record", action="store_true", help="Record unrecorded URLs live into --store")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Keep the crawlers' INFO logging")
+    args = parser.parse_args()
+
+    if args.record and not args.store:
+        parser.error("--record needs --store")
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    profile = FaultProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_statuses=tuple(args.error_status or (503,)),
+        drop_rate=args.drop_rate,
+        seed=args.seed,
+    )
+    store = ReplayStore(args.store) if args.store else None
+    report = run_load_test(
+        args.pipeline, args.workers, args.targets, profile,
+        store=store, record=args.record, delay_scale=args.delay_scale,
+    )
+    if args.record:
+        store.save()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        server = report['server']
+        print(
+            f"{report['pipeline']}: {report['targets']} targets, {report['workers']} workers, "
+            f"{report['elapsed_seconds']:.1f}s -> {report['targets_per_hour']:.0f} targets/hour"
+        )
+        print(f"  succeeded={report['succeeded']} failed={report['failed']} "
+              f"p50={report['p50_target_seconds']:.2f}s p95={report['p95_target_seconds']:.2f}s")
+        print(f"  requests={server['requests']} hits={server['hits']} misses={server['misses']} "
+              f"errors={server['errors']} drops={server['drops']} recorded={server['recorded']}")
+        for error in report['errors']:
+            print(f"  error: {error}")
+    return 0 if report['succeeded'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
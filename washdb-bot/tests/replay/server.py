@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Local stand-in server for recorded responses, with latency and error injection.
+
+ReplayServer serves a ReplayStore over HTTP on 127.0.0.1. The original
+URL travels in the X-Replay-Url header (set by the requests/httpx hooks
+and the Playwright route handlers), or as an absolute request path when
+the server is used as a plain HTTP proxy. Every transport, and every
+forked worker process, shares one store, fault profile and set of counters.
+
+A FaultProfile adds per-request latency (latency_ms +/- jitter_ms) and
+injects failures: error_rate answers with one of error_statuses, drop_rate
+closes the connection without a response.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from tests.replay.store import RecordedResponse, ReplayStore
+
+TARGET_HEADER = "X-Replay-Url"
+
+# Latency uses the real sleep even when the load test scales time.sleep
+_sleep = time.sleep
+
+# Kept in stats so a run shows which URLs still need recording
+MAX_MISSED_URLS = 50
+
+
+@dataclass
+class FaultProfile:
+    """Latency and failure injection for replayed requests."""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: Tuple[int, ...] = (503,)
+    drop_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class ReplayOutcome:
+    """What to do with one request: action is 'ok', 'miss', 'error' or 'drop'."""
+    action: str
+    delay: float
+    response: Optional[RecordedResponse] = None
+
+
+class ReplayServer:
+    """
+    Serve a ReplayStore on a local port.
+
+    Usage:
+        with ReplayServer(store, FaultProfile(latency_ms=150, error_rate=0.02)) as server:
+            ...  # install hooks (tests.replay.hooks) pointing at server
+            print(server.get_stats())
+    """
+
+    def __init__(
+        self,
+        store: ReplayStore,
+        profile: Optional[FaultProfile] = None,
+        record: bool = False,
+        live_session=None,
+    ):
+        """
+        Args:
+            store: Recorded responses to serve
+            profile: Latency/failure injection (default: none)
+            record: Fetch and store responses that are not recorded yet
+            live_session: requests session that bypasses the hooks (record mode)
+        """
+        self.store = store
+        self.profile = profile or FaultProfile()
+        self.record = record
+        self.live_session = live_session
+
+        self._rng = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {}
+        self._missed: List[str] = []
+        self.reset_stats()
+
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._httpd is None:
+            raise RuntimeError("ReplayServer is not running")
+        return f"http://127.0.0.1:{self._httpd.server_port}"
+
+    def start(self) -> "ReplayServer":
+        """Start serving in a background thread."""
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def resolve(self, method: str, url: str) -> ReplayOutcome:
+        """
+        Decide the outcome of one request and count it.
+
+        The caller applies outcome.delay.
+
+        Args:
+            method: Request method
+            url: Original request URL
+
+        Returns:
+            ReplayOutcome; response is set for 'ok', 'miss' and 'error'
+        """
+        profile = self.profile
+        with self._lock:
+            delay = max(0.0, profile.latency_ms + self._rng.uniform(-1, 1) * profile.jitter_ms) / 1000
+            roll = self._rng.random()
+            status = self._rng.choice(profile.error_statuses) if profile.error_statuses else 503
+            self._stats['requests'] += 1
+
+        if not self.record:
+            if roll < profile.drop_rate:
+                self._count('drops')
+                return ReplayOutcome('drop', delay)
+            if roll < profile.drop_rate + profile.error_rate:
+                self._count('errors')
+                headers = {"Content-Type": "text/plain", "Retry-After": "1"}
+                return ReplayOutcome('error', delay, RecordedResponse(status, b"Injected error\n", headers))
+
+        response = self.store.lookup(method, url)
+        if response is None and self.record and method.upper() in ("GET", "HEAD"):
+            try:
+                response = self.store.record(url, session=self.live_session)
+                self._count('recorded')
+            except Exception as e:
+                response = RecordedResponse(502, f"Recording failed: {e}\n".encode(), {"Content-Type": "text/plain"})
+                self._count('errors')
+                return ReplayOutcome('error', 0.0, response)
+
+        if response is None:
+            with self._lock:
+                self._stats['misses'] += 1
+                if len(self._missed) < MAX_MISSED_URLS:
+                    self._missed.append(url)
+            return ReplayOutcome('miss', delay, RecordedResponse(404, b"Not recorded\n", {"Content-Type": "text/plain"}))
+
+        self._count('hits')
+        return ReplayOutcome('ok', delay, response)
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get request counters.
+
+        Returns:
+            dict: requests, hits, misses, errors, drops, recorded and up to
+            MAX_MISSED_URLS of the unrecorded URLs
+        """
+        with self._lock:
+            return {**self._stats, 'missed_urls': list(self._missed)}
+
+    def reset_stats(self):
+        """Zero the counters."""
+        with self._lock:
+            self._stats = {'requests': 0, 'hits': 0, 'misses': 0, 'errors': 0, 'drops': 0, 'recorded': 0}
+            self._missed = []
+
+
+def _handler_for(server: ReplayServer):
+    """Build the request handler class bound to a ReplayServer."""
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _target_url(self) -> str:
+            target = self.headers.get(TARGET_HEADER)
+            if target:
+                return target
+            if urlsplit(self.path).scheme:
+                # Absolute form: used as an HTTP proxy
+                return self.path
+            return f"http://{self.headers.get('Host', 'localhost')}{self.path}"
+
+        def _serve(self, send_body: bool = True):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+
+            outcome = server.resolve(self.command, self._target_url())
+            if outcome.delay:
+                _sleep(outcome.delay)
+
+            if outcome.action == 'drop':
+                self.close_connection = True
+                return
+
+            response = outcome.response
+            self.send_response(response.status)
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(response.body)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(response.body)
+
+        def do_GET(self):
+            self._serve()
+
+        def do_POST(self):
+            self._serve()
+
+        def do_HEAD(self):
+            self._serve(send_body=False)
+
+        def log_message(self, *args):
+            pass
+
+    return ReplayHandler
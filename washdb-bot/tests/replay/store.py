@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Recorded HTTP responses for the replay layer.
+
+A store is a directory with an index.json and one body file per response:
+
+    index.json          {"version": 1, "responses": [...], "routes": [...]}
+    bodies/<sha1>.html  response bodies
+
+"responses" are exact recordings keyed by method + URL (query parameters
+sorted). "routes" are fnmatch patterns over the full URL that serve a
+body for every matching URL, e.g. one recorded YP results page for all
+"https://www.yellowpages.com/*" searches. Exact recordings win over
+routes; routes are tried in the order they were added.
+"""
+
+import fnmatch
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+# Headers not replayed: the body is stored decoded and re-framed by the server
+DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+RECORD_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def normalize_url(url: str) -> str:
+    """Lowercase scheme/host, drop the fragment and sort query parameters."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+@dataclass
+class RecordedResponse:
+    """One response to replay."""
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=lambda: {"Content-Type": "text/html; charset=utf-8"})
+
+
+class ReplayStore:
+    """
+    Exact recordings and URL pattern routes, optionally backed by a directory.
+
+    Thread-safe: the replay server looks responses up from many threads.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: Store directory to load (and save() to); None for in-memory
+        """
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._responses: Dict[Tuple[str, str], RecordedResponse] = {}
+        self._routes: List[Tuple[str, str, RecordedResponse]] = []
+
+        if self.path and (self.path / "index.json").exists():
+            self._load()
+
+    def add(
+        self,
+        url: str,
+        body,
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        method: str = "GET",
+    ):
+        """
+        Add an exact recording.
+
+        Args:
+            url: Request URL
+            body: Response body (str or bytes)
+            status: HTTP status
+            headers: Response headers (default text/html)
+            method: Request method
+        """
+        response = self._response(body, status, headers)
+        with self._lock:
+            self._responses[(method.upper(), normalize_url(url))] = response
+
+    def add_route(
+        self,
+        pattern: str,
+        body,
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        method: str = "*",
+    ):
+        """
+        Serve a response for every URL matching an fnmatch pattern.
+
+        Args:
+            pattern: Pattern over the full URL, e.g. "https://www.yellowpages.com/*page=2*"
+            body: Response body (str, bytes or a Path to read)
+            status: HTTP status
+            headers: Response headers (default text/html)
+            method: Request method, or "*" for any
+        """
+        if isinstance(body, Path):
+            body = body.read_bytes()
+        response = self._response(body, status, headers)
+        with self._lock:
+            self._routes.append((method.upper(), pattern, response))
+
+    def lookup(self, method: str, url: str) -> Optional[RecordedResponse]:
+        """
+        Find the response for a request.
+
+        Args:
+            method: Request method
+            url: Full request URL
+
+        Returns:
+            RecordedResponse, or None if nothing was recorded for it
+        """
+        method = method.upper()
+        with self._lock:
+            response = self._responses.get((method, normalize_url(url)))
+            if response is None and method == "HEAD":
+                response = self._responses.get(("GET", normalize_url(url)))
+            if response is not None:
+                return response
+            for route_method, pattern, route_response in self._routes:
+                if route_method in ("*", method) and fnmatch.fnmatchcase(url, pattern):
+                    return route_response
+        return None
+
+    def record(self, url: str, session: Optional[requests.Session] = None, timeout: int = 30) -> RecordedResponse:
+        """
+        Fetch a URL live and store the response (redirects followed).
+
+        Args:
+            url: URL to fetch
+            session: requests session to use (default: a plain one)
+            timeout: Request timeout in seconds
+
+        Returns:
+            The recorded response
+        """
+        getter = session.get if session else requests.get
+        live = getter(url, headers={"User-Agent": RECORD_USER_AGENT}, timeout=timeout)
+        headers = {k: v for k, v in live.headers.items() if k.lower() not in DROP_HEADERS}
+        self.add(url, live.content, status=live.status_code, headers=headers)
+        if live.url != url:
+            self.add(live.url, live.content, status=live.status_code, headers=headers)
+        return self.lookup("GET", url)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._responses) + len(self._routes)
+
+    @staticmethod
+    def _response(body, status: int, headers: Optional[Dict[str, str]]) -> RecordedResponse:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if headers is None:
+            return RecordedResponse(status=status, body=body)
+        return RecordedResponse(status=status, body=body, headers=dict(headers))
+
+    def _entry(self, response: RecordedResponse) -> dict:
+        """Write a response body and return its index fields (lock held)."""
+        digest = hashlib.sha1(response.body).hexdigest()
+        body_path = self.path / "bodies" / f"{digest}.html"
+        if not body_path.exists():
+            body_path.write_bytes(response.body)
+        return {"status": response.status, "headers": response.headers, "body": body_path.name}
+
+    def save(self):
+        """Write the store to its directory."""
+        if self.path is None:
+            raise ValueError("In-memory store has no path to save to")
+
+        (self.path / "bodies").mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            index = {
+                "version": 1,
+                "responses": [
+                    {"method": method, "url": url, **self._entry(response)}
+                    for (method, url), response in self._responses.items()
+                ],
+                "routes": [
+                    {"method": method, "pattern": pattern, **self._entry(response)}
+                    for method, pattern, response in self._routes
+                ],
+            }
+        (self.path / "index.json").write_text(json.dumps(index, indent=2) + "\n")
+
+    def _load(self):
+        index = json.loads((self.path / "index.json").read_text())
+        for entry in index.get("responses", []):
+            body = (self.path / "bodies" / entry["body"]).read_bytes()
+            self.add(entry["url"], body, entry["status"], entry["headers"], entry["method"])
+        for entry in index.get("routes", []):
+            body = (self.path / "bodies" / entry["body"]).read_bytes()
+            self.add_route(entry["pattern"], body, entry["status"], entry["headers"], entry["method"])
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the write-behind DB writer (db/async_writer.py) and its use in
+the Google city-first crawler.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from db.async_writer import AsyncBatchWriter
+from scrape_google import google_crawl_city_first as google_crawler
+
+
+def _ids_writer(batches, delay=0.0):
+    def write(batch):
+        time.sleep(delay)
+        batches.append(list(batch))
+        return [record * 10 for record in batch]
+    return write
+
+
+def test_batches_and_flush_barrier():
+    batches = []
+
+    async def run():
+        writer = AsyncBatchWriter(_ids_writer(batches), batch_size=3, flush_interval=60)
+        futures = [await writer.put(i) for i in range(7)]
+        await writer.flush()
+        assert all(future.done() for future in futures)
+        await writer.close()
+        return [future.result() for future in futures], writer.get_stats()
+
+    results, stats = asyncio.run(run())
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert results == [0, 10, 20, 30, 40, 50, 60]
+    assert stats['written'] == 7
+    assert stats['queue_depth'] == 0
+    assert stats['max_queue_depth'] >= 1
+
+
+def test_slow_database_does_not_block_event_loop():
+    ticks = []
+
+    async def ticker(stop):
+        while not stop.is_set():
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def run():
+        stop = asyncio.Event()
+        tick_task = asyncio.create_task(ticker(stop))
+        writer = AsyncBatchWriter(_ids_writer([], delay=0.3), batch_size=1)
+        await writer.put(1)
+        await writer.flush()
+        stop.set()
+        await tick_task
+        await writer.close()
+
+    asyncio.run(run())
+    # The loop kept running while the write slept in its thread
+    assert len(ticks) > 10
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.2
+
+
+def test_interval_flush_and_failures():
+    calls = []
+
+    def write(batch):
+        calls.append(list(batch))
+        if len(calls) == 1:
+            raise RuntimeError("db down")
+        return list(batch)
+
+    async def run():
+        writer = AsyncBatchWriter(write, batch_size=100, flush_interval=0.05)
+        first = await writer.put("a")
+        await asyncio.sleep(0.3)
+        second = await writer.put("b")
+        await writer.close()
+        return first.result(), second.result(), writer.get_stats()
+
+    first, second, stats = asyncio.run(run())
+    assert calls == [["a"], ["b"]]
+    assert (first, second) == (None, "b")
+    assert stats['failed'] == 1
+    assert "db down" in stats['last_error']
+
+    async def put_after_close():
+        writer = AsyncBatchWriter(write)
+        await writer.close()
+        await writer.put("c")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(put_after_close())
+
+
+def test_failed_batch_retries_records_individually():
+    calls = []
+
+    def write(batch):
+        calls.append(list(batch))
+        if "bad" in batch:
+            raise RuntimeError("duplicate key")
+        return [record.upper() for record in batch]
+
+    async def run():
+        writer = AsyncBatchWriter(write, batch_size=3, flush_interval=60)
+        futures = [await writer.put(record) for record in ("a", "bad", "c")]
+        await writer.flush()
+        results = [future.result() for future in futures]
+        await writer.close()
+        return results, writer.get_stats()
+
+    results, stats = asyncio.run(run())
+    assert results == ["A", None, "C"]
+    assert calls == [["a", "bad", "c"], ["a"], ["bad"], ["c"]]
+    assert stats['written'] == 2
+    assert stats['failed'] == 1
+    assert "duplicate key" in stats['last_error']
+
+
+class PassFilter:
+    def filter_business(self, business):
+        return {'passed': True, 'confidence': 1.0, 'filter_reason': None}
+
+
+class FakeSession:
+    def commit(self):
+        pass
+
+
+def test_google_target_saves_through_writer(monkeypatch):
+    businesses = [
+        {'name': f"Wash {n}", 'place_id': f"p{n}", 'website': f"https://wash{n}.com"}
+        for n in range(4)
+    ]
+    businesses.append({'name': "No site", 'place_id': "p9"})
+    saved_rows = []
+
+    async def fake_search(search_query, max_results, worker_id=0):
+        return "<html></html>", businesses
+
+    def fake_upsert(rows):
+        saved_rows.extend(rows)
+        return [100 + i for i in range(len(rows))]
+
+    monkeypatch.setattr(google_crawler, "fetch_google_maps_search", fake_search)
+    monkeypatch.setattr(google_crawler, "GoogleFilter", PassFilter)
+    monkeypatch.setattr(google_crawler, "upsert_companies", fake_upsert)
+
+    target = SimpleNamespace(
+        city="Providence", state_id="RI", category_label="Car Wash", category_keyword="car wash",
+        search_query="car wash Providence RI", max_results=10, priority=1,
+    )
+    results, stats = asyncio.run(
+        google_crawler.crawl_single_target(target, FakeSession(), scrape_details=False)
+    )
+
+    assert [r['company_id'] for r in results] == [100, 101, 102, 103]
+    assert {row['source'] for row in saved_rows} == {"Google"}
+    assert stats['total_saved'] == 4
+    assert stats['db_writer']['written'] == 4
+    assert target.status == "DONE"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared CAPTCHA/block detector (runner/block_detector.py).
+
+Checks the labeled fixture corpus in tests/fixtures/block_pages and parity
+with the sequential `indicator in html.lower()` scans the detector replaced.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from runner.block_detector import (
+    DATADOME_DETECTOR,
+    SEO_DETECTOR,
+    YP_DETECTOR,
+    SignalDetector,
+    SignalType,
+)
+
+FIXTURE_DIR = Path(__file__).parent.parent / "fixtures" / "block_pages"
+LABELS = json.loads((FIXTURE_DIR / "labels.json").read_text())
+
+
+def _load(name: str) -> str:
+    return (FIXTURE_DIR / name).read_text()
+
+
+def _sequential(rules, html: str) -> str:
+    """Reference: first rule (in priority order) found in the page."""
+    html_lower = html.lower()
+    for indicator, label in rules:
+        if indicator in html_lower:
+            return label
+    return ""
+
+
+@pytest.mark.parametrize("name", sorted(LABELS))
+def test_fixture_labels(name):
+    html = _load(name)
+    expected = LABELS[name]
+
+    result = YP_DETECTOR.scan(html)
+    assert (result.captcha.label or None) == expected["yp_captcha"]
+    assert (result.blocked.label or None) == expected["yp_blocked"]
+    assert bool(DATADOME_DETECTOR.scan(html).captcha) is expected["datadome"]
+
+
+@pytest.mark.parametrize("name", sorted(LABELS))
+@pytest.mark.parametrize("detector", [YP_DETECTOR, SEO_DETECTOR, DATADOME_DETECTOR])
+def test_parity_with_sequential_scan(name, detector):
+    # Within the scan window the detector must agree with the old checks
+    html = _load(name)[:detector.window_chars]
+    result = detector.scan(html)
+
+    captcha_rules = [(i, l) for i, l in _rules(detector, SignalType.CAPTCHA)]
+    block_rules = [(i, l) for i, l in _rules(detector, SignalType.BLOCKED)]
+    assert result.captcha.label == _sequential(captcha_rules, html)
+    assert result.blocked.label == _sequential(block_rules, html)
+
+
+def _rules(detector, signal_type):
+    from runner import block_detector as bd
+    profiles = {
+        id(bd.YP_DETECTOR): (bd.YP_CAPTCHA_RULES, bd.YP_BLOCK_RULES),
+        id(bd.SEO_DETECTOR): (bd.SEO_CAPTCHA_RULES, bd.SEO_BLOCK_RULES),
+        id(bd.DATADOME_DETECTOR): (bd.DATADOME_CAPTCHA_RULES, []),
+    }
+    captcha_rules, block_rules = profiles[id(detector)]
+    return captcha_rules if signal_type is SignalType.CAPTCHA else block_rules
+
+
+def test_priority_resolves_overlapping_indicators():
+    # 'captcha' is a substring of 'hcaptcha'; the earlier rule wins either way
+    detector = SignalDetector(captcha_rules=[("captcha", "generic"), ("hcaptcha", "hcaptcha")])
+    assert detector.scan("<div class='hcaptcha'></div>").captcha.label == "generic"
+
+    detector = SignalDetector(captcha_rules=[("hcaptcha", "hcaptcha"), ("captcha", "generic")])
+    assert detector.scan("<div class='hcaptcha'></div>").captcha.label == "hcaptcha"
+    assert detector.scan("<div>CAPTCHA</div>").captcha.label == "generic"
+
+
+def test_status_code_and_window():
+    result = YP_DETECTOR.scan("", status_code=429)
+    assert result.blocked.label == "429 Too Many Requests"
+    assert not result.captcha
+    assert result.signal.type is SignalType.BLOCKED
+
+    assert not YP_DETECTOR.scan(None, status_code=200)
+
+    detector = SignalDetector(block_rules=[("blocked", "blocked")], window_chars=100)
+    assert not detector.scan("x" * 100 + "blocked")
+    assert detector.scan("x" * 50 + "blocked").blocked.indicator == "blocked"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared engine registry (db/engine_registry.py).
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from db.engine_registry import EngineRegistry
+
+
+@pytest.fixture
+def urls(tmp_path, monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    return [f"sqlite:///{tmp_path}/db{n}.sqlite" for n in range(3)]
+
+
+def test_one_shared_engine_per_url(urls):
+    registry = EngineRegistry(budget=40, pool_size=2, max_overflow=3)
+
+    first = registry.get_engine(urls[0])
+    assert registry.get_engine(urls[0]) is first
+    assert registry.get_engine(urls[1]) is not first
+
+    assert isinstance(first.pool, QueuePool)
+    assert first.pool.size() == 2
+    assert registry.get_stats()['allocated'] == 10
+
+
+def test_budget_limits_later_engines(urls):
+    registry = EngineRegistry(budget=8, pool_size=2, max_overflow=3)
+
+    engines = [registry.get_engine(url) for url in urls]
+    capacities = [engine['capacity'] for engine in registry.get_stats()['engines']]
+
+    # 5 + 3, then the budget is spent: the last engine still gets one connection
+    assert capacities == [5, 3, 1]
+    assert engines[1].pool.size() == 2
+    assert engines[2].pool.size() == 1
+
+
+def test_primary_engine_keeps_its_size(urls, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", urls[0])
+    registry = EngineRegistry(budget=50, pool_size=5, max_overflow=10,
+                              primary_pool_size=10, primary_max_overflow=20)
+
+    # Other engines cannot take the primary engine's share of the budget
+    registry.get_engine(urls[1])
+    registry.get_engine(urls[2])
+    primary = registry.get_engine(urls[0])
+    capacities = [engine['capacity'] for engine in registry.get_stats()['engines']]
+
+    assert capacities == [15, 5, 30]
+    assert primary.pool.size() == 10
+
+
+def test_utilization_metrics(urls):
+    registry = EngineRegistry(budget=10, pool_size=2, max_overflow=2)
+    engine = registry.get_engine(urls[0])
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with engine.connect():
+            stats = registry.get_stats()
+            assert stats['in_use'] == 2
+            assert stats['engines'][0]['utilization'] == 0.5
+
+    stats = registry.get_stats()['engines'][0]
+    assert stats['checked_out'] == 0
+    assert stats['peak_checked_out'] == 2
+    assert stats['checkouts'] == 2
+    assert stats['connects'] == 2
+    assert "sqlite" in stats['name']
+
+
+def test_pgbouncer_mode_uses_null_pool(urls):
+    registry = EngineRegistry(budget=5, pgbouncer=True)
+    engine = registry.get_engine(urls[0])
+
+    assert isinstance(engine.pool, NullPool)
+    stats = registry.get_stats()
+    assert stats['allocated'] == 0
+    assert stats['engines'][0]['mode'] == 'pgbouncer'
+
+
+def test_default_url_from_environment(urls, monkeypatch):
+    registry = EngineRegistry()
+    monkeypatch.setenv("DATABASE_URL", urls[2])
+    assert registry.get_engine() is registry.get_engine(urls[2])
+
+    monkeypatch.delenv("DATABASE_URL")
+    with pytest.raises(RuntimeError):
+        EngineRegistry().get_engine()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Tests for GoogleCrawler's pooled, batched database access
+(scrape_google/google_crawl.py and db/async_pool.py).
+
+The pool is replaced by an in-memory stand-in that records statements.
+"""
+
+import asyncio
+import itertools
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from db import async_pool
+from db.async_pool import to_conninfo
+from scrape_google import google_crawl
+from scrape_google.google_crawl import GoogleCrawler
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self._pending = []
+        self._rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def execute(self, sql, params=None):
+        self.db.statements.append(("execute", sql, params))
+        if "place_id = ANY" in sql:
+            self._rows = [(place_id,) for place_id in params[0] if place_id in self.db.existing]
+
+    async def fetchall(self):
+        return self._rows
+
+    async def executemany(self, sql, rows, returning=False):
+        rows = list(rows)
+        self.db.statements.append(("executemany", sql, rows))
+        if any("BAD" in str(value) for row in rows for value in row):
+            raise RuntimeError("duplicate key value violates unique constraint")
+        if "INSERT INTO companies" in sql:
+            self._pending = [(next(self.db.ids),) for _ in rows]
+
+    async def fetchone(self):
+        return self._pending[0] if self._pending else None
+
+    def nextset(self):
+        self._pending = self._pending[1:]
+        return True if self._pending else None
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    @asynccontextmanager
+    async def pipeline(self):
+        yield
+
+
+class FakePool:
+    def __init__(self):
+        self.existing = set()
+        self.statements = []
+        self.ids = itertools.count(100)
+        self.connections = 0
+        self.rollbacks = 0
+
+    @asynccontextmanager
+    async def connection(self):
+        self.connections += 1
+        try:
+            yield FakeConnection(self)
+        except Exception:
+            self.rollbacks += 1
+            raise
+
+    def sql(self, fragment):
+        return [s for s in self.statements if fragment in s[1]]
+
+
+class FakeClient:
+    def __init__(self, results):
+        self.results = results
+        self.detail_calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def search_google_maps(self, query, location=None, max_results=None):
+        return self.results
+
+    async def scrape_business_details(self, url):
+        self.detail_calls.append(url)
+        return {'phone': '555-0100', 'data_completeness': 0.5}
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    pool = FakePool()
+    pool.closed_urls = []
+
+    async def get_pool(url, **kwargs):
+        return pool
+
+    async def close_pool(url):
+        pool.closed_urls.append(url)
+
+    monkeypatch.setattr(google_crawl, "get_async_pool", get_pool)
+    monkeypatch.setattr(google_crawl, "close_async_pool", close_pool)
+    return pool
+
+
+def _run_crawl(monkeypatch, results, **kwargs):
+    client = FakeClient(results)
+    monkeypatch.setattr(google_crawl, "GoogleBusinessClient", lambda **kw: client)
+    crawler = GoogleCrawler(config=MagicMock(), logger=MagicMock(), db_connection_string="postgresql://x")
+    return asyncio.run(crawler.search_and_save("car wash", "Seattle, WA", **kwargs)), client
+
+
+def _business(n, name=None):
+    return {'name': name or f"Biz {n}", 'place_id': f"place-{n}", 'url': f"https://maps.test/{n}"}
+
+
+def test_to_conninfo_strips_driver():
+    assert to_conninfo("postgresql+psycopg://u:p@h:5432/db") == "postgresql://u:p@h:5432/db"
+    assert to_conninfo("postgresql://u:p@h/db") == "postgresql://u:p@h/db"
+
+
+def test_page_dedup_uses_one_query_and_batched_writes(monkeypatch, fake_pool):
+    fake_pool.existing = {"place-2", "place-4"}
+    results = [_business(n) for n in range(1, 6)] + [_business(1, name="Biz 1 again")]
+
+    outcome, client = _run_crawl(monkeypatch, results)
+
+    assert outcome['success']
+    lookups = fake_pool.sql("place_id = ANY")
+    assert len(lookups) == 1
+    assert lookups[0][2] == (["place-1", "place-2", "place-3", "place-4", "place-5"],)
+
+    inserts = fake_pool.sql("INSERT INTO companies")
+    assert len(inserts) == 1
+    assert [row[0] for row in inserts[0][2]] == ["Biz 1", "Biz 3", "Biz 5"]
+    assert [r['id'] for r in outcome['results']] == [100, 101, 102]
+    assert len(fake_pool.sql("INSERT INTO scrape_logs")[0][2]) == 3
+
+    updates = fake_pool.sql("UPDATE companies")
+    assert len(updates) == 1
+    assert [row[-1] for row in updates[0][2]] == ["place-2", "place-4"]
+
+    stats = outcome['stats']
+    assert stats['businesses_saved'] == 3
+    assert stats['duplicates_skipped'] == 3
+    # Details for the 3 new businesses and the 2 existing ones, not the repeat
+    assert len(client.detail_calls) == 5
+    # Lookup, one insert batch and one update batch
+    assert fake_pool.connections == 3
+
+
+def test_failed_batch_retries_rows_individually(monkeypatch, fake_pool):
+    results = [_business(1), _business(2, name="BAD"), _business(3)]
+
+    outcome, _ = _run_crawl(monkeypatch, results, scrape_details=False)
+
+    assert [r['name'] for r in outcome['results']] == ["Biz 1", "Biz 3"]
+    assert outcome['stats']['businesses_saved'] == 2
+    # The batch and the bad row were rolled back
+    assert fake_pool.rollbacks == 2
+
+
+def test_save_batch_size(monkeypatch, fake_pool):
+    monkeypatch.setattr(google_crawl, "SAVE_BATCH_SIZE", 2)
+    results = [_business(n) for n in range(1, 6)]
+
+    outcome, _ = _run_crawl(monkeypatch, results, scrape_details=False)
+
+    assert [len(s[2]) for s in fake_pool.sql("INSERT INTO companies")] == [2, 2, 1]
+    assert outcome['stats']['businesses_saved'] == 5
+
+
+def test_crawl_closes_its_pool(monkeypatch, fake_pool):
+    outcome, _ = _run_crawl(monkeypatch, [_business(1)], scrape_details=False)
+    assert outcome['success']
+    assert fake_pool.closed_urls == ["postgresql://x"]
+
+    monkeypatch.setattr(google_crawl, "GoogleBusinessClient", MagicMock(side_effect=RuntimeError("boom")))
+    crawler = GoogleCrawler(config=MagicMock(), logger=MagicMock(), db_connection_string="postgresql://x")
+    assert not asyncio.run(crawler.search_and_save("car wash"))['success']
+    assert fake_pool.closed_urls == ["postgresql://x"] * 2
+
+
+# Nothing listens here: pools open without waiting for a connection
+UNREACHABLE_DB = "postgresql+psycopg://u:p@127.0.0.1:1/x"
+
+
+@pytest.mark.skipif(not async_pool.HAS_PSYCOPG_POOL, reason="psycopg_pool not installed")
+def test_pools_are_closed_explicitly_or_with_their_loop():
+    async def explicit():
+        pool = await async_pool.get_async_pool(UNREACHABLE_DB, min_size=0)
+        assert await async_pool.get_async_pool(UNREACHABLE_DB, min_size=0) is pool
+        await async_pool.close_async_pool(UNREACHABLE_DB)
+        return pool
+
+    async def left_open():
+        return await async_pool.get_async_pool(UNREACHABLE_DB, min_size=0)
+
+    assert asyncio.run(explicit()).closed
+    # A crawl that forgets to close still does not leak past asyncio.run()
+    first = asyncio.run(left_open())
+    assert first.closed
+
+    second = asyncio.run(left_open())
+    assert second is not first and second.closed
+    assert all(entry[0] is not first for entry in async_pool._pools.values())
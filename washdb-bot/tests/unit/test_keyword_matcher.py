@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared keyword matcher (runner/keyword_matcher.py) and the
+discovery filters built on it.
+"""
+
+import os
+import random
+import string
+
+import pytest
+
+import runner.keyword_matcher as keyword_matcher
+from runner.keyword_matcher import DomainMatcher, KeywordMatcher, RuleHit, get_file_matcher
+
+
+def _sequential(keywords, text):
+    """Reference: the per-keyword `in` checks the matcher replaced."""
+    text = text.lower()
+    return [keyword for keyword in keywords if keyword in text]
+
+
+@pytest.fixture(params=[0, 10_000], ids=["automaton", "linear"])
+def scan_mode(request, monkeypatch):
+    monkeypatch.setattr(keyword_matcher, "LINEAR_SCAN_MAX_KEYWORDS", request.param)
+
+
+def test_matches_sequential_scan(scan_mode):
+    rng = random.Random(7)
+    keywords = ["supplies", "supply", "sup", "equipment rental", "rental", "pressure washer sales"]
+    keywords += ["".join(rng.choices(string.ascii_lowercase + " ", k=rng.randint(3, 9))).strip() for _ in range(300)]
+    matcher = KeywordMatcher(keywords)
+
+    texts = [
+        "ABC Pressure Washer Sales & Equipment Rental",
+        "Pressure washing supplies and SUPPLY store",
+        "",
+        None,
+    ] + ["".join(rng.choices(string.ascii_lowercase + " ", k=200)) for _ in range(50)]
+
+    for text in texts:
+        assert matcher.find_all(text) == _sequential(matcher.keywords, text or "")
+    assert matcher.find_all_batch(texts) == [matcher.find_all(text) for text in texts]
+
+
+def test_priority_order_and_dedup(scan_mode):
+    matcher = KeywordMatcher(["Rental", "equipment", "rental", " ", "equip"])
+    assert matcher.keywords == ("rental", "equipment", "equip")
+    assert matcher.find_all("EQUIPMENT RENTAL") == ["rental", "equipment", "equip"]
+    assert matcher.first("equipment rental") == "rental"
+    assert matcher.first("soft wash") is None
+
+
+def test_domain_matcher():
+    matcher = DomainMatcher(["amazon.com", "www.yelp.com"])
+    assert matcher.match("amazon.com") == "amazon.com"
+    assert matcher.match("smile.amazon.com") == "amazon.com"
+    assert matcher.match("www.yelp.com") == "yelp.com"
+    assert matcher.match("notamazon.com") is None
+    assert matcher.match("") is None
+
+
+def test_file_matcher_shared_and_reloaded(tmp_path):
+    path = tmp_path / "anti_keywords.txt"
+    path.write_text("supplies\nRental\n")
+
+    first = get_file_matcher(str(path))
+    assert first is get_file_matcher(str(path))
+    assert first.keywords == ("supplies", "rental")
+
+    path.write_text("supplies\nrental\ntraining\n")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+    assert get_file_matcher(str(path)).keywords == ("supplies", "rental", "training")
+
+    assert len(get_file_matcher(str(tmp_path / "missing.txt"))) == 0
+
+
+def test_yp_filter_batched_page(tmp_path):
+    from scrape_yp.yp_filter import YPFilter
+
+    (tmp_path / "allow.txt").write_text("window cleaning\npressure washing\n")
+    (tmp_path / "block.txt").write_text("auto detailing\n")
+    (tmp_path / "anti.txt").write_text("supplies\nequipment\n")
+    (tmp_path / "hints.txt").write_text("soft wash\n")
+
+    yp_filter = YPFilter(
+        allowlist_file=str(tmp_path / "allow.txt"),
+        blocklist_file=str(tmp_path / "block.txt"),
+        anti_keywords_file=str(tmp_path / "anti.txt"),
+        positive_hints_file=str(tmp_path / "hints.txt"),
+    )
+    listings = [
+        {"name": "Nu-Way Window Cleaning", "category_tags": ["Window Cleaning"],
+         "description": "Soft wash specialists", "website": "https://nuway.com"},
+        {"name": "AAA Cleaning Supplies", "category_tags": ["Window Cleaning"],
+         "website": "https://aaa.com"},
+        {"name": "Shiny Cars", "category_tags": ["Pressure Washing", "Auto Detailing"],
+         "website": "https://shiny.com"},
+        {"name": "Deck Pros", "category_tags": ["Pressure Washing"],
+         "website": "https://deckpros.myshopify.com"},
+    ]
+
+    accepted, stats = yp_filter.filter_listings(listings, min_score=0)
+    assert [listing["name"] for listing in accepted] == ["Nu-Way Window Cleaning"]
+    assert stats["rejected_reasons"] == {
+        "anti_keyword:supplies": 1,
+        "blocked_category:Auto Detailing": 1,
+        "ecommerce_url": 1,
+    }
+
+    explanations = yp_filter.explain_listings(listings)
+    assert RuleHit("positive_hint", "text", "soft wash") in explanations[0]
+    assert RuleHit("anti_keyword", "name", "supplies") in explanations[1]
+    assert RuleHit("category_block", "category_tags", "Auto Detailing") in explanations[2]
+    assert RuleHit("ecommerce_url", "website", "e-commerce platform: .myshopify.com") in explanations[3]
+
+
+def test_google_filter_batch(tmp_path):
+    from scrape_google.google_filter import GoogleFilter
+
+    (tmp_path / "anti.txt").write_text("rental\n")
+    (tmp_path / "hints.txt").write_text("pressure washing\n")
+    google_filter = GoogleFilter(
+        anti_keywords_file=str(tmp_path / "anti.txt"),
+        positive_hints_file=str(tmp_path / "hints.txt"),
+    )
+
+    businesses = [
+        {"name": "ABC Pressure Washing", "categories": ["Pressure Washing"], "website": "https://abc.com"},
+        {"name": "Joe's Rental", "categories": [], "website": "https://joes.com"},
+        {"name": "Big Box", "categories": [], "website": "https://smile.amazon.com/x"},
+    ]
+    passed, filtered = google_filter.filter_batch(businesses)
+
+    assert [b["name"] for b in passed] == ["ABC Pressure Washing"]
+    assert passed[0]["filter_result"]["confidence"] == 0.8
+    assert "positive_hint:text:pressure washing" in passed[0]["filter_result"]["rule_hits"]
+    assert filtered[0]["filter_result"]["signals"]["anti_keywords"] == ["rental"]
+    assert filtered[1]["filter_result"]["filter_reason"] == "Blocked domain: smile.amazon.com"
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for queued logging (runner/logging_setup.py).
+"""
+
+import io
+import logging
+import sys
+import threading
+import time
+
+import pytest
+
+from runner import logging_setup
+from runner.logging_setup import HotPathFilter, setup_logging, shutdown_logging
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    monkeypatch.setattr(logging_setup, "LOG_MODE", "queued")
+    monkeypatch.delenv("LOG_RATE_LIMITS", raising=False)
+    monkeypatch.delenv("LOG_SAMPLING", raising=False)
+
+
+def test_loggers_share_one_listener_thread(queued, tmp_path):
+    first = setup_logging("test_logging_a", log_file=tmp_path / "a.log")
+    threads = threading.active_count()
+    second = setup_logging("test_logging_b", log_file=tmp_path / "b.log")
+
+    assert threading.active_count() == threads
+    assert {"test_logging_a", "test_logging_b"} <= set(logging_setup._listener.routes)
+
+    first.info("alpha line")
+    second.info("beta line")
+
+    assert wait_for(lambda: "alpha line" in (tmp_path / "a.log").read_text())
+    assert wait_for(lambda: "beta line" in (tmp_path / "b.log").read_text())
+    assert "beta line" not in (tmp_path / "a.log").read_text()
+
+
+def test_rate_limits_are_opt_in(queued, monkeypatch, tmp_path):
+    logger = setup_logging("site_parse", log_file=tmp_path / "site_parse.log")
+    assert not [f for f in logger.filters if isinstance(f, HotPathFilter)]
+
+    monkeypatch.setenv("LOG_RATE_LIMITS", "site_parse=20")
+    logger = setup_logging("site_parse", log_file=tmp_path / "site_parse.log")
+    (hot_path_filter,) = [f for f in logger.filters if isinstance(f, HotPathFilter)]
+    assert hot_path_filter.max_per_second == 20
+
+    monkeypatch.delenv("LOG_RATE_LIMITS")
+    setup_logging("site_parse", log_file=tmp_path / "site_parse.log")
+
+
+def test_suppressed_records_are_reported():
+    logger = logging.getLogger("test_logging_sampled")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = ListHandler()
+    logger.addHandler(handler)
+    hot_path_filter = HotPathFilter(max_per_second=1, logger_name=logger.name, report_interval=0)
+    logger.addFilter(hot_path_filter)
+    try:
+        for i in range(5):
+            logger.info(f"record {i}")
+    finally:
+        logger.removeFilter(hot_path_filter)
+        logger.removeHandler(handler)
+
+    infos = [r for r in handler.records if r.levelno == logging.INFO]
+    reports = [r.getMessage() for r in handler.records if r.levelno == logging.WARNING]
+    assert 1 <= len(infos) <= 2  # may straddle a second boundary
+    assert hot_path_filter.suppressed == 5 - len(infos)
+    assert sum(int(m.split()[3]) for m in reports) == hot_path_filter.suppressed
+
+
+def test_shutdown_drains_then_writes_directly(queued, tmp_path):
+    log_file = tmp_path / "drain.log"
+    logger = setup_logging("test_logging_drain", log_file=log_file)
+    for i in range(200):
+        logger.info(f"queued {i}")
+
+    shutdown_logging()
+    assert logging_setup._listener is None
+    assert "queued 199" in log_file.read_text()
+
+    # Later records bypass the stopped listener and are flushed immediately
+    logger.info("after shutdown")
+    assert "after shutdown" in log_file.read_text()
+
+    # A new setup starts a fresh listener
+    logger = setup_logging("test_logging_drain", log_file=log_file)
+    assert logging_setup._listener is not None
+    logger.info("restarted")
+    assert wait_for(lambda: "restarted" in log_file.read_text())
+
+
+def test_console_follows_current_stdout(queued, monkeypatch, tmp_path):
+    log_file = tmp_path / "console.log"
+    setup_stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", setup_stdout)
+    logger = setup_logging("test_logging_console", log_file=log_file)
+
+    # The stream seen at setup is gone by the time the listener writes
+    setup_stdout.close()
+    current = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", current)
+    errors = []
+    monkeypatch.setattr(logging.Handler, "handleError", lambda handler, record: errors.append(record))
+
+    logger.info("after swap")
+    assert wait_for(lambda: "after swap" in log_file.read_text())
+    assert wait_for(lambda: "after swap" in current.getvalue())
+    assert errors == []
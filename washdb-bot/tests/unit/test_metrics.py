@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for the stage instrumentation and cross-process metrics collector.
+"""
+
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+
+from runner.metrics import (
+    STAGE_ERRORS,
+    STAGE_SECONDS,
+    Metrics,
+    MetricsCollector,
+    merge_series,
+    render_prometheus,
+)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def series(metrics, kind, name, **labels):
+    merged = merge_series([metrics.snapshot()])
+    return merged.get((kind, name, tuple(sorted(labels.items()))))
+
+
+def test_timer_context_manager_and_decorators():
+    metrics = Metrics(enabled=True)
+
+    with metrics.timer(STAGE_SECONDS, error_counter=STAGE_ERRORS, crawler="yp", stage="parse"):
+        time.sleep(0.01)
+
+    @metrics.timer(STAGE_SECONDS, error_counter=STAGE_ERRORS, crawler="yp", stage="fetch")
+    def fetch():
+        raise RuntimeError("boom")
+
+    @metrics.timer(STAGE_SECONDS, crawler="google", stage="fetch")
+    async def fetch_async():
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        fetch()
+    assert asyncio.run(fetch_async()) == "ok"
+
+    bounds, counts, total, count = series(metrics, "histogram", STAGE_SECONDS, crawler="yp", stage="parse")
+    assert count == 1 and total >= 0.01
+    assert series(metrics, "histogram", STAGE_SECONDS, crawler="google", stage="fetch")[3] == 1
+    assert series(metrics, "counter", STAGE_ERRORS, crawler="yp", stage="fetch") == 1
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics(enabled=False)
+    with metrics.timer(STAGE_SECONDS, crawler="yp", stage="parse"):
+        pass
+    metrics.inc("x_total")
+    assert metrics.snapshot() == []
+
+
+def test_prometheus_rendering():
+    metrics = Metrics(enabled=True, buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        metrics.observe(STAGE_SECONDS, value, crawler="site", stage="fetch")
+    metrics.inc(STAGE_ERRORS, crawler="site", stage="fetch")
+
+    text = render_prometheus(merge_series([metrics.snapshot(), metrics.snapshot()]))
+
+    assert "# TYPE washdb_stage_seconds histogram" in text
+    assert 'washdb_stage_seconds_bucket{crawler="site",stage="fetch",le="0.1"} 2' in text
+    assert 'washdb_stage_seconds_bucket{crawler="site",stage="fetch",le="1"} 4' in text
+    assert 'washdb_stage_seconds_bucket{crawler="site",stage="fetch",le="+Inf"} 6' in text
+    assert 'washdb_stage_seconds_count{crawler="site",stage="fetch"} 6' in text
+    assert 'washdb_stage_errors_total{crawler="site",stage="fetch"} 2' in text
+
+
+def _child_records(address):
+    metrics = Metrics(enabled=True, flush_to=address)
+    metrics.observe(STAGE_SECONDS, 0.2, crawler="yp", stage="fetch")
+    metrics.inc("washdb_pages_total", 3)
+    metrics.stop_flusher()
+
+
+def test_collector_sums_worker_processes():
+    collector = MetricsCollector(address="127.0.0.1:0")
+    assert collector.start()
+    address = f"127.0.0.1:{collector.port}"
+    try:
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=_child_records, args=(address,)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        def total():
+            return collector.merged(include_local=False).get(("counter", "washdb_pages_total", ()), 0)
+
+        assert wait_for(lambda: total() == 9)
+        merged = collector.merged(include_local=False)
+        assert merged[("histogram", STAGE_SECONDS, (("crawler", "yp"), ("stage", "fetch")))][3] == 3
+        assert merged[("gauge", "washdb_metrics_processes", ())] == 3
+
+        # Silent processes are retired, their counters kept
+        collector.retire_after = 0
+        assert total() == 9
+        assert collector.merged(include_local=False)[("gauge", "washdb_metrics_processes", ())] == 0
+    finally:
+        collector.stop()
+
+
+def test_flusher_sends_updates():
+    collector = MetricsCollector(address="127.0.0.1:0")
+    collector.start()
+    try:
+        metrics = Metrics(enabled=True)
+        metrics.start_flusher(f"127.0.0.1:{collector.port}", interval=0.05)
+        metrics.inc("washdb_pages_total", 2)
+        assert wait_for(lambda: collector.merged(include_local=False).get(("counter", "washdb_pages_total", ())) == 2)
+        metrics.inc("washdb_pages_total", 3)
+        assert wait_for(lambda: collector.merged(include_local=False).get(("counter", "washdb_pages_total", ())) == 5)
+        metrics.stop_flusher()
+    finally:
+        collector.stop()
+
+
+def test_stage_summary():
+    collector = MetricsCollector(address="")
+    collector.ingest({
+        "process": "host:1:0",
+        "series": [
+            ["histogram", STAGE_SECONDS, {"crawler": "yp", "stage": "fetch"}, [[0.1, 1.0], [1, 3], 2.0, 4]],
+            ["counter", STAGE_ERRORS, {"crawler": "yp", "stage": "fetch"}, 1],
+        ],
+    })
+    rows = collector.stage_summary(include_local=False)
+
+    assert rows == [{
+        'crawler': "yp", 'stage': "fetch", 'calls': 4, 'total_seconds': 2.0, 'avg_ms': 500.0,
+        'p50_ms': 1000.0, 'p95_ms': 1000.0, 'errors': 1, 'items': 0,
+    }]
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the verification prefetch pipeline (verification/verification_worker.py).
+"""
+
+import logging
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import verification.verification_worker as worker
+from scrape_site.site_parse import parse_site_content
+from verification.verification_worker import PrefetchBuffer
+
+
+HTML = (
+    "<html><head><title>{name}</title></head>"
+    "<body><h1>Pressure washing</h1><p>Call 555-123-4567</p></body></html>"
+)
+
+
+class FakeSession:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeQueue:
+    """Scripted verification_queue: hands out companies, records releases."""
+
+    def __init__(self, count):
+        self.pending = [
+            {'id': i, 'name': f"Company {i}", 'website': f"https://c{i}.com"}
+            for i in range(1, count + 1)
+        ]
+        self.released = []
+        self.lock = threading.Lock()
+
+    def claim(self, session, worker_id, limit=1):
+        with self.lock:
+            batch, self.pending = self.pending[:limit], self.pending[limit:]
+        return batch
+
+    def release(self, session, ids, worker_id):
+        with self.lock:
+            self.released.extend(ids)
+        return len(ids)
+
+
+@pytest.fixture
+def fake_queue(monkeypatch):
+    fake = FakeQueue(3)
+    real_sleep = time.sleep
+    monkeypatch.setattr(worker, "claim_companies", fake.claim)
+    monkeypatch.setattr(worker, "release_companies", fake.release)
+    monkeypatch.setattr(worker, "reap_stale_claims_if_due", lambda session, logger: 0)
+    monkeypatch.setattr(worker, "reserve_deep_scrape", lambda session: False)
+    monkeypatch.setattr(worker, "fetch_page", lambda url, delay=None: HTML.format(name=url))
+    # Keep the empty-queue backoff short so stop() joins promptly
+    monkeypatch.setattr(worker, "time", SimpleNamespace(
+        sleep=lambda seconds: real_sleep(min(seconds, 0.05)),
+        time=time.time,
+        monotonic=time.monotonic,
+    ))
+    return fake
+
+
+def make_buffer(**kwargs):
+    options = dict(buffer_size=3, num_fetchers=1, parse_processes=0)
+    options.update(kwargs)
+    return PrefetchBuffer(
+        worker_id=7,
+        session_factory=FakeSession,
+        logger=logging.getLogger("test_prefetch_buffer"),
+        **options,
+    )
+
+
+def test_single_fetcher_preserves_claim_order(fake_queue):
+    buffer = make_buffer()
+    buffer.start()
+    try:
+        results = [buffer.get(timeout=5.0) for _ in range(3)]
+    finally:
+        buffer.stop()
+
+    assert [r.company['id'] for r in results] == [1, 2, 3]
+    assert all(r.fetch_error is None for r in results)
+    assert results[0].metadata['name'] == "https://c1.com"
+    assert fake_queue.released == []
+
+
+def test_stop_hands_back_unconsumed_claims(fake_queue):
+    buffer = make_buffer(buffer_size=1)
+    buffer.start()
+
+    # Buffer full, one company blocked in the fetcher, one waiting to be fetched
+    deadline = time.monotonic() + 5.0
+    while (buffer.qsize() < 1 or fake_queue.pending) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    buffer.stop()
+
+    assert sorted(fake_queue.released) == [1, 2, 3]
+
+
+def test_parse_pool_matches_inline_parse(fake_queue):
+    buffer = make_buffer(parse_processes=1)
+    buffer.start()
+    try:
+        result = buffer.get(timeout=30.0)
+    finally:
+        buffer.stop()
+
+    html = HTML.format(name="https://c1.com")
+    assert result.metadata == parse_site_content(html, "https://c1.com")
+
+
+def test_parse_after_stop_skips_shut_down_pool(fake_queue):
+    buffer = make_buffer(parse_processes=1)
+    buffer.start()
+    pool = buffer._parse_pool
+    buffer.stop()
+
+    # A fetcher still in flight after stop() sees the shut-down pool
+    buffer._parse_pool = pool
+    assert buffer._parse(HTML.format(name="x"), "https://x.com") == {}
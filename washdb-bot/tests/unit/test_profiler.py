@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-demand sampling profiler.
+"""
+
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from runner.profiler import (
+    PROFILE_SIGNAL,
+    SamplingProfiler,
+    get_profiler,
+    install_profiler,
+)
+
+
+def busy_loop(seconds):
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(200))
+    return total
+
+
+def idle_wait(stop):
+    stop.wait()
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    return SamplingProfiler(label="test", output_dir=tmp_path, interval_ms=5)
+
+
+def test_window_writes_wall_and_cpu_profiles(profiler, tmp_path):
+    stop = threading.Event()
+    idle = threading.Thread(target=idle_wait, args=(stop,), name="idle-thread")
+    busy = threading.Thread(target=busy_loop, args=(0.5,), name="busy-thread")
+    idle.start()
+    busy.start()
+
+    assert profiler.start(seconds=0.3)
+    assert not profiler.start(seconds=1)  # one window at a time
+    busy.join()
+    deadline = time.time() + 2
+    while profiler.is_profiling and time.time() < deadline:
+        time.sleep(0.01)
+    result = profiler.status()['last_profile']
+    stop.set()
+    idle.join()
+
+    assert result['samples'] > 10
+    wall = (tmp_path / os.path.basename(result['files'][0])).read_text()
+    assert "thread:idle-thread" in wall and "idle_wait (tests/unit/test_profiler.py" in wall
+    assert "thread:busy-thread" in wall
+
+    cpu_files = [f for f in result['files'] if f.endswith(".cpu.collapsed")]
+    if cpu_files:
+        cpu = open(cpu_files[0]).read()
+        assert "busy_loop" in cpu
+        assert "thread:idle-thread" not in cpu
+
+    for line in wall.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0 and stack.startswith("thread:")
+
+    # The sampler thread exits with the window
+    deadline = time.time() + 2
+    while profiler._thread is not None and time.time() < deadline:
+        time.sleep(0.01)
+    assert profiler._thread is None
+
+
+def test_slow_target_tracing(profiler, tmp_path):
+    # Off: no sampler thread, nothing written
+    with profiler.trace_target("fast"):
+        pass
+    assert profiler._thread is None
+
+    profiler.enable_slow_target_tracing(threshold=0.2)
+    with profiler.trace_target("company:1"):
+        busy_loop(0.05)
+    with profiler.trace_target("company:2"):
+        busy_loop(0.3)
+
+    files = list(tmp_path.glob("test-*-slow-*.collapsed"))
+    assert len(files) == 1 and "company_2" in files[0].name
+    assert files[0].read_text().startswith("target:company:2;thread:")
+
+    profiler.disable_slow_target_tracing()
+    deadline = time.time() + 2
+    while profiler._thread is not None and time.time() < deadline:
+        time.sleep(0.01)
+    assert profiler._thread is None
+
+
+def test_socket_commands(profiler):
+    assert profiler.handle_command({'command': 'profile_status'})['status']['profiling'] is False
+
+    started = profiler.handle_command({'command': 'profile', 'seconds': 5})
+    assert started['success'] and started['status']['profiling']
+
+    stopped = profiler.handle_command({'command': 'profile_stop'})
+    assert stopped['success'] and stopped['result']['files']
+    assert profiler.handle_command({'command': 'profile_stop'})['success'] is False
+
+    profiler.handle_command({'command': 'trace_slow', 'threshold': 30})
+    assert profiler.status()['slow_target_seconds'] == 30
+    profiler.handle_command({'command': 'trace_slow', 'threshold': 0})
+    assert profiler.status()['slow_target_seconds'] is None
+
+    assert profiler.handle_command({'command': 'bogus'})['success'] is False
+
+
+def test_signal_toggles_profile(tmp_path):
+    signum = getattr(signal, PROFILE_SIGNAL)
+    previous = signal.getsignal(signum)
+    profiler = get_profiler()
+    old_label, old_dir = profiler.label, profiler.output_dir
+    profiler.output_dir = tmp_path
+    try:
+        assert install_profiler("signal_test", slow_target_seconds=0)
+        os.kill(os.getpid(), signum)
+        deadline = time.time() + 2
+        while not profiler.is_profiling and time.time() < deadline:
+            time.sleep(0.01)
+        assert profiler.is_profiling
+
+        result = profiler.stop()
+        assert os.path.basename(result['files'][0]).startswith("signal_test-")
+    finally:
+        signal.signal(signum, previous)
+        profiler.label, profiler.output_dir = old_label, old_dir
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Tests for proxy scoring (scrape_yp/proxy_scoring.py) and scored selection
+in scrape_yp/proxy_pool.py.
+"""
+
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scrape_yp.proxy_pool import ProxyPool, WorkerProxyPool
+from scrape_yp.proxy_scoring import ProxyScorer, ProxyStatsStore, percentile
+
+
+def _record_many(scorer, proxy, n, outcome="success", latency=None, domain="yellowpages.com"):
+    for _ in range(n):
+        scorer.record(proxy, domain, outcome, latency=latency)
+
+
+def _choices(scorer, proxies, domain="yellowpages.com", n=1000):
+    return Counter(scorer.choose(proxies, domain=domain) for _ in range(n))
+
+
+def test_fast_proxy_gets_more_traffic():
+    scorer = ProxyScorer(rng=random.Random(1))
+    _record_many(scorer, "fast:1", 30, latency=0.5)
+    _record_many(scorer, "slow:1", 30, latency=3.0)
+
+    picks = _choices(scorer, ["fast:1", "slow:1"])
+    assert picks["fast:1"] > 900
+
+
+def test_captcha_rate_is_per_domain():
+    scorer = ProxyScorer(rng=random.Random(2))
+    _record_many(scorer, "a:1", 20, "captcha", latency=1.0, domain="yellowpages.com")
+    _record_many(scorer, "a:1", 20, "success", latency=1.0, domain="yelp.com")
+    _record_many(scorer, "b:1", 20, "success", latency=1.0, domain="yellowpages.com")
+    _record_many(scorer, "b:1", 20, "failure", latency=1.0, domain="yelp.com")
+
+    assert _choices(scorer, ["a:1", "b:1"], domain="yellowpages.com")["b:1"] > 950
+    assert _choices(scorer, ["a:1", "b:1"], domain="yelp.com")["a:1"] > 950
+
+
+def test_unknown_proxies_are_still_explored():
+    scorer = ProxyScorer(rng=random.Random(3))
+    _record_many(scorer, "known:1", 5, latency=1.0)
+
+    picks = _choices(scorer, ["known:1", "new:1"])
+    assert picks["new:1"] > 50
+
+
+def test_stats_are_shared_and_survive_restart(tmp_path):
+    store_path = tmp_path / "proxy_stats.db"
+    first = ProxyScorer(store=ProxyStatsStore(store_path), refresh_seconds=0)
+    other = ProxyScorer(store=ProxyStatsStore(store_path), refresh_seconds=0)
+
+    _record_many(first, "p:1", 3, latency=1.0)
+    first.record("p:1", "yellowpages.com", "captcha")
+
+    # Another process sees the events; the recording one does not count them twice
+    other.choose(["p:1", "q:1"])
+    first.choose(["p:1", "q:1"])
+    assert other.get_window_summary()["p:1"]["success"] == 3
+    assert first.get_window_summary()["p:1"]["success"] == 3
+
+    restarted = ProxyScorer(store=ProxyStatsStore(store_path))
+    assert restarted.get_window_summary()["p:1"] == {
+        "success": 3, "failure": 0, "captcha": 1, "latency_p50_ms": 1000.0,
+    }
+
+
+def test_events_outside_window_are_ignored(tmp_path):
+    store = ProxyStatsStore(tmp_path / "proxy_stats.db")
+    store.add("old:1", "yellowpages.com", "failure", None, time.time() - 7200)
+    store.add("old:1", "yellowpages.com", "success", 500.0, time.time())
+
+    scorer = ProxyScorer(store=store, window_seconds=3600)
+    assert scorer.get_window_summary()["old:1"]["failure"] == 0
+
+    stats = scorer.get_proxy_stats("old:1")
+    assert stats["1h"]["requests"] == 1
+    assert stats["24h"]["requests"] == 2
+    assert stats["24h"]["success_rate"] == 0.5
+
+
+def test_proxy_stats_percentiles():
+    scorer = ProxyScorer()
+    for latency in range(1, 101):
+        scorer.record("p:1", "yellowpages.com", "success", latency=latency / 1000)
+    scorer.record("p:1", "yellowpages.com", "captcha")
+
+    stats = scorer.get_proxy_stats("p:1")["5m"]
+    assert stats["latency_p50_ms"] == pytest.approx(50.0)
+    assert stats["latency_p90_ms"] == pytest.approx(90.0)
+    assert stats["latency_p99_ms"] == pytest.approx(99.0)
+    assert stats["domains"]["yellowpages.com"]["captcha_rate"] == pytest.approx(1 / 101)
+
+    assert percentile([], 50) is None
+
+
+class _StandInProxy(BaseHTTPRequestHandler):
+    """Answers every proxied GET with 200 after a delay."""
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = b"<html>ok</html>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_stand_in(delay):
+    handler = type("Handler", (_StandInProxy,), {"delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _closed_port():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+@pytest.fixture
+def proxy_file(tmp_path):
+    fast = _start_stand_in(0.0)
+    slow = _start_stand_in(0.3)
+    path = tmp_path / "proxies.txt"
+    path.write_text(
+        f"127.0.0.1:{fast.server_address[1]}:user:pass\n"
+        f"127.0.0.1:{slow.server_address[1]}:user:pass\n"
+        f"127.0.0.1:{_closed_port()}:user:pass\n"
+    )
+    yield path
+    for server in (fast, slow):
+        server.shutdown()
+        server.server_close()
+
+
+def test_test_all_proxies_against_stand_in(proxy_file):
+    scorer = ProxyScorer(rng=random.Random(4))
+    pool = ProxyPool(str(proxy_file), scorer=scorer)
+    fast, slow, dead = pool.proxies
+
+    start = time.perf_counter()
+    result = pool.test_all_proxies(max_concurrent=3, test_url="http://stand-in.test/", timeout=5)
+    elapsed = time.perf_counter() - start
+
+    assert result == {"passed": 2, "failed": 1}
+    assert elapsed < 2.0
+    assert dead.failure_count == 5
+
+    scores = pool.get_proxy_scores()
+    assert scores[fast.key]["5m"]["success_rate"] == 1.0
+    assert scores[dead.key]["5m"]["success_rate"] == 0.0
+    assert scores[slow.key]["5m"]["latency_p50_ms"] > scores[fast.key]["5m"]["latency_p50_ms"]
+
+    picks = Counter(pool.get_proxy(strategy="scored", domain="stand-in.test").key for _ in range(300))
+    assert picks[fast.key] > picks[slow.key] + picks[dead.key]
+
+
+def test_worker_pool_scored_selection_skips_unhealthy(proxy_file):
+    scorer = ProxyScorer(rng=random.Random(5))
+    pool = WorkerProxyPool(str(proxy_file), [0, 1, 2], worker_id=0, scorer=scorer)
+    assert pool.strategy == "scored"
+
+    for proxy in pool.proxies[:2]:
+        proxy.blacklisted = True
+    remaining = pool.proxies[2]
+    assert {pool.get_proxy_for_request(domain="yellowpages.com").key for _ in range(20)} == {remaining.key}
+
+    pool.report_failure(remaining, error_type="captcha", latency=1.2, domain="yellowpages.com")
+    assert scorer.get_window_summary()[remaining.key]["captcha"] == 1
+
+    remaining.blacklisted = True
+    assert pool.get_proxy_for_request() is None
+
+
+def test_window_counts_follow_expiry(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("scrape_yp.proxy_scoring.time.time", lambda: clock[0])
+    scorer = ProxyScorer(window_seconds=3600, refresh_seconds=0)
+    _record_many(scorer, "p:1", 3, "failure", domain="yelp.com")
+    clock[0] += 100
+    _record_many(scorer, "p:1", 2, "success")
+
+    record = scorer._records["p:1"]
+    assert record.counts() == {"success": 2, "failure": 3, "captcha": 0}
+    assert record.counts("yelp.com")["failure"] == 3
+
+    clock[0] += 3550
+    scorer.choose(["p:1", "q:1"])
+    assert record.counts() == {"success": 2, "failure": 0, "captcha": 0}
+    assert record.counts("yelp.com") == {"success": 0, "failure": 0, "captcha": 0}
+    assert "yelp.com" not in record.by_domain
+
+
+class _RecordingScorer(ProxyScorer):
+    def __init__(self):
+        super().__init__(rng=random.Random(6))
+        self.choose_calls = []
+
+    def choose(self, proxies, domain=None):
+        self.choose_calls.append(domain)
+        return super().choose(proxies, domain=domain)
+
+
+def test_pool_selection_is_scored_by_default(proxy_file):
+    scorer = _RecordingScorer()
+    pool = ProxyPool(str(proxy_file), scorer=scorer)
+
+    assert pool.get_proxy(domain="yelp.com") is not None
+    assert scorer.choose_calls == ["yelp.com"]
+
+
+def test_yp_fetch_reports_latency_and_domain(proxy_file, monkeypatch):
+    from scrape_yp import yp_crawl_city_first as crawler
+
+    class FakePage:
+        html = "<html><body><div class='result'>Shop</div></body></html>"
+
+        def goto(self, url, **kwargs):
+            time.sleep(0.01)
+
+        def wait_for_selector(self, *args, **kwargs):
+            pass
+
+        def evaluate(self, script):
+            pass
+
+        def content(self):
+            return self.html
+
+    class FakeContext:
+        def close(self):
+            pass
+
+    contexts = []
+
+    class FakeBrowserPool:
+        def get_page(self, worker_id, proxy=None):
+            contexts.append(proxy)
+            return FakePage(), FakeContext()
+
+    monkeypatch.setattr(crawler, "get_browser_pool", lambda: FakeBrowserPool())
+    monkeypatch.setattr(crawler, "human_delay", lambda **kwargs: None)
+    monkeypatch.setattr(crawler, "get_scroll_delays", lambda: [])
+    monkeypatch.setattr(crawler, "get_human_reading_delay", lambda length: 0)
+
+    scorer = ProxyScorer(rng=random.Random(7))
+    pool = WorkerProxyPool(str(proxy_file), [0], worker_id=0, scorer=scorer)
+    proxy = pool.proxies[0]
+
+    assert crawler._fetch_url_playwright("https://yp.test/", proxy_pool=pool) == FakePage.html
+    assert contexts == [proxy.to_playwright_format()]
+    stats = scorer.get_proxy_stats(proxy.key)["5m"]
+    assert stats["domains"][crawler.YP_DOMAIN]["requests"] == 1
+    assert stats["latency_p50_ms"] >= 10
+
+    FakePage.html = "<html><body>Please verify you are human: g-recaptcha</body></html>"
+    crawler._fetch_url_playwright("https://yp.test/", proxy_pool=pool)
+    assert scorer.get_window_summary()[proxy.key]["captcha"] == 1
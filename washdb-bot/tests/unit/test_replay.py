@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the record/replay fixture layer (tests/replay).
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import requests
+
+from tests.replay import FaultProfile, ReplayStore, replay
+from tests.replay.load_test import run_load_test
+
+
+@pytest.fixture
+def store():
+    store = ReplayStore()
+    store.add("https://example.com/?b=2&a=1", "<html>home</html>")
+    store.add_route("https://example.com/*", "<html>any page</html>")
+    return store
+
+
+def test_requests_served_from_store(store):
+    with replay(store) as server:
+        # Query order doesn't matter; proxies are bypassed
+        home = requests.get("https://example.com/?a=1&b=2", proxies={"https": "http://10.255.255.1:9"})
+        session = requests.Session()
+        other = session.get("https://example.com/services")
+        missing = requests.get("https://unrecorded.example.org/")
+
+    assert home.text == "<html>home</html>"
+    assert home.url == "https://example.com/?a=1&b=2"
+    assert other.text == "<html>any page</html>"
+    assert missing.status_code == 404
+
+    stats = server.get_stats()
+    assert (stats['requests'], stats['hits'], stats['misses']) == (3, 2, 1)
+    assert stats['missed_urls'] == ["https://unrecorded.example.org/"]
+    # Unpatched afterwards
+    assert requests.adapters.HTTPAdapter.send.__name__ == "send"
+    assert requests.adapters.HTTPAdapter.send.__qualname__ == "HTTPAdapter.send"
+
+
+def test_httpx_sync_and_async(store):
+    async def fetch_async():
+        async with httpx.AsyncClient() as client:
+            return await client.get("https://example.com/about")
+
+    with replay(store):
+        with httpx.Client() as client:
+            sync_response = client.get("https://example.com/?a=1&b=2")
+        async_response = asyncio.run(fetch_async())
+
+    assert sync_response.text == "<html>home</html>"
+    assert str(sync_response.request.url) == "https://example.com/?a=1&b=2"
+    assert async_response.text == "<html>any page</html>"
+
+
+def test_fault_injection(store):
+    with replay(store, FaultProfile(error_rate=1.0, error_statuses=(429,))):
+        assert requests.get("https://example.com/").status_code == 429
+
+    with replay(store, FaultProfile(drop_rate=1.0)) as server:
+        with pytest.raises(requests.ConnectionError):
+            requests.get("https://example.com/")
+    assert server.get_stats()['drops'] == 1
+
+    with replay(store, FaultProfile(latency_ms=150)):
+        start = time.perf_counter()
+        requests.get("https://example.com/")
+        assert time.perf_counter() - start >= 0.15
+
+
+def test_store_round_trip(tmp_path, store):
+    store.path = tmp_path
+    store.save()
+
+    loaded = ReplayStore(tmp_path)
+    assert len(loaded) == 2
+    assert loaded.lookup("GET", "https://example.com/?a=1&b=2").body == b"<html>home</html>"
+    assert loaded.lookup("POST", "https://example.com/form").body == b"<html>any page</html>"
+
+
+def test_site_load_test_reports_throughput():
+    report = run_load_test("site", workers=3, targets=6, profile=FaultProfile(latency_ms=20))
+
+    assert report['succeeded'] == 6
+    assert report['targets_per_hour'] > 0
+    assert report['server']['hits'] >= 6
+    assert report['server']['misses'] == 0
+
+
+def test_playwright_routes_through_server(store):
+    playwright = pytest.importorskip("playwright.sync_api")
+
+    with replay(store) as server, playwright.sync_playwright() as p:
+        try:
+            browser = p.chromium.launch()
+        except Exception as e:
+            pytest.skip(f"No Playwright browser available: {e}")
+        page = browser.new_page()
+        page.goto("https://example.com/services")
+        content = page.content()
+        browser.close()
+
+    assert "any page" in content
+    assert server.get_stats()['hits'] >= 1
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the verification work queue (verification/verification_queue.py)
+and migration 033.
+"""
+
+import re
+from datetime import datetime
+from pathlib import Path
+
+from verification.verification_queue import (
+    COMPANY_COLUMNS,
+    claim_companies,
+    enqueue_companies,
+    reap_stale_claims,
+    release_companies,
+)
+
+
+MIGRATION = Path(__file__).resolve().parents[2] / "db" / "migrations" / "033_add_verification_queue.sql"
+
+
+class FakeRow:
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+
+class FakeResult:
+    def __init__(self, rows=(), rowcount=0, scalar=None):
+        self.rows = list(rows)
+        self.rowcount = rowcount
+        self._scalar = scalar
+
+    def fetchall(self):
+        return self.rows
+
+    def scalar(self):
+        return self._scalar
+
+
+class FakeSession:
+    """Records statements and returns a scripted result."""
+
+    def __init__(self, result=None):
+        self.result = result or FakeResult()
+        self.executed = []
+        self.commits = 0
+
+    def execute(self, statement, params=None):
+        self.executed.append((" ".join(str(statement).split()), params))
+        return self.result
+
+    def commit(self):
+        self.commits += 1
+
+
+def company_row(company_id, created_at, parse_metadata=None):
+    mapping = {column: None for column in COMPANY_COLUMNS}
+    mapping.update(id=company_id, created_at=created_at, parse_metadata=parse_metadata)
+    return FakeRow(mapping)
+
+
+def test_enqueue_dedupes_ids_and_skips_empty():
+    session = FakeSession(FakeResult(rowcount=2))
+
+    assert enqueue_companies(session, [3, None, 1, 3]) == 2
+    sql, params = session.executed[0]
+    assert params == {'ids': [1, 3]}
+    assert "ON CONFLICT (company_id) DO NOTHING" in sql
+    assert session.commits == 0
+
+    session = FakeSession()
+    assert enqueue_companies(session, [None]) == 0
+    assert session.executed == []
+
+
+def test_claim_returns_newest_first_and_commits():
+    rows = [
+        company_row(1, datetime(2024, 1, 1), {'source': 'YP'}),
+        company_row(2, datetime(2024, 3, 1)),
+        company_row(3, None),
+    ]
+    session = FakeSession(FakeResult(rows=rows))
+
+    companies = claim_companies(session, worker_id=4, limit=3, lease_seconds=60)
+
+    assert [c['id'] for c in companies] == [2, 1, 3]
+    assert companies[0]['parse_metadata'] == {}
+    assert companies[1]['parse_metadata'] == {'source': 'YP'}
+    assert session.commits == 1
+
+    sql, params = session.executed[0]
+    assert "FOR UPDATE OF q SKIP LOCKED" in sql
+    assert params['limit'] == 3 and params['worker_id'] == 4 and params['lease_seconds'] == 60
+
+
+def test_release_only_touches_own_claims():
+    session = FakeSession(FakeResult(scalar=2))
+
+    assert release_companies(session, [5, 6], worker_id=1) == 2
+    sql, params = session.executed[0]
+    assert params == {'ids': [5, 6], 'worker_id': 1}
+    assert "worker_id = :worker_id" in sql
+    assert session.commits == 1
+
+    session = FakeSession()
+    assert release_companies(session, [], worker_id=1) == 0
+    assert session.executed == []
+
+
+def test_reap_returns_count_and_commits():
+    session = FakeSession(FakeResult(scalar=3))
+
+    assert reap_stale_claims(session) == 3
+    assert "lease_expires_at < NOW()" in session.executed[0][0]
+    assert session.commits == 1
+
+
+def test_migration_trigger_and_indexes():
+    sql = MIGRATION.read_text()
+
+    assert re.search(
+        r"CREATE TRIGGER trg_verification_queue_company\s+"
+        r"AFTER INSERT OR UPDATE OF parse_metadata, website ON companies",
+        sql,
+    )
+    # Claims are served by a partial index on pending rows
+    assert re.search(r"ON verification_queue\(created_at DESC NULLS LAST\)\s+WHERE status = 'pending'", sql)
+    # Final statuses leave the queue; in_progress stays until released or reaped
+    assert "verification_status <> 'in_progress'" in sql
+    assert "ON CONFLICT (version) DO NOTHING" in sql
+
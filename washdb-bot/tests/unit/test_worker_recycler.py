@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Tests for memory-bounded worker recycling.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from runner.memory_monitor import MemoryMonitor
+from runner.worker_recycler import (
+    ACTION_DRAIN,
+    ACTION_NONE,
+    ACTION_RECYCLE_BROWSER,
+    WorkerRecycler,
+    leak_slope,
+)
+
+
+class FakeMonitor:
+    """Returns scripted process-tree samples per pid."""
+
+    def __init__(self):
+        self.samples = {}
+
+    def set(self, pid, rss_mb, browser_mb=0.0):
+        self.samples[pid] = {
+            'pid': pid, 'rss_mb': rss_mb, 'own_mb': rss_mb - browser_mb, 'browser_mb': browser_mb,
+            'processes': 1, 'browser_processes': 3 if browser_mb else 0,
+        }
+
+    def get_process_tree_memory(self, pid):
+        return self.samples.get(pid)
+
+
+class FakeProcess:
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.exitcode = None if alive else 0
+
+    def is_alive(self):
+        return self.alive
+
+    def join(self, timeout=None):
+        pass
+
+
+class DrainingProcess(FakeProcess):
+    """Answers alive for a number of liveness checks, then has exited."""
+
+    def __init__(self, alive_checks):
+        super().__init__(alive=True)
+        self.alive_checks = alive_checks
+
+    def is_alive(self):
+        self.alive_checks -= 1
+        return self.alive_checks >= 0
+
+
+@pytest.fixture
+def monitor():
+    return FakeMonitor()
+
+
+def make_recycler(monitor, **kwargs):
+    options = dict(worker_budget_mb=1000, browser_budget_mb=600, leak_slope_mb_per_hour=0, window=5)
+    options.update(kwargs)
+    recycler = WorkerRecycler("test", 2, monitor=monitor, **options)
+    recycler.register(0, 100)
+    recycler.register(1, 101)
+    return recycler
+
+
+def test_leak_slope():
+    # 10 MB per minute = 600 MB/h
+    samples = [(60.0 * i, 500 + 10 * i) for i in range(6)]
+    assert leak_slope(samples) == pytest.approx(600.0)
+    assert leak_slope([(60.0 * i, 500.0) for i in range(6)]) == pytest.approx(0.0)
+    assert leak_slope(samples[:3]) is None
+
+
+def test_under_budget_posts_nothing(monitor):
+    recycler = make_recycler(monitor)
+    monitor.set(100, 700, browser_mb=400)
+    monitor.set(101, 300)
+
+    assert recycler.check() == {}
+    assert [s['rss_mb'] for s in recycler.get_stats()] == [700, 300]
+
+
+def test_browser_over_budget_recycles_browser(monitor):
+    recycler = make_recycler(monitor)
+    signal = recycler.signal_for(0)
+    monitor.set(100, 900, browser_mb=700)
+    monitor.set(101, 300)
+
+    assert recycler.check() == {0: ACTION_RECYCLE_BROWSER}
+    # Not re-posted until the worker reaches a target boundary
+    assert recycler.check() == {}
+
+    assert signal.take() == ACTION_RECYCLE_BROWSER
+    assert signal.take() == ACTION_NONE
+
+    monitor.set(100, 400, browser_mb=200)
+    assert recycler.check() == {}
+    assert recycler.get_stats()[0]['browser_recycles'] == 1
+
+
+def test_worker_over_budget_escalates_to_drain(monitor):
+    recycler = make_recycler(monitor)
+    signal = recycler.signal_for(0)
+    monitor.set(101, 300)
+
+    # A fresh browser would bring the tree back under budget: try that first
+    monitor.set(100, 1200, browser_mb=500)
+    assert recycler.check() == {0: ACTION_RECYCLE_BROWSER}
+    assert signal.take() == ACTION_RECYCLE_BROWSER
+
+    # Still over budget after the recycle: drain the worker
+    monitor.set(100, 1100, browser_mb=150)
+    assert recycler.check() == {0: ACTION_DRAIN}
+    assert signal.take() == ACTION_DRAIN
+
+    assert not recycler.should_respawn(0, FakeProcess(alive=True))
+    assert recycler.should_respawn(0, FakeProcess(alive=False))
+    assert not recycler.should_respawn(1, FakeProcess(alive=False))
+
+    # The replacement starts with a clean slate
+    recycler.register(0, 200)
+    monitor.set(200, 350, browser_mb=100)
+    assert recycler.check() == {}
+    assert not recycler.should_respawn(0, FakeProcess(alive=False))
+
+
+def test_worker_without_browser_is_drained(monitor):
+    recycler = make_recycler(monitor)
+    monitor.set(100, 1500)
+    monitor.set(101, 300)
+
+    assert recycler.check() == {0: ACTION_DRAIN}
+
+
+def test_leak_slope_drains(monitor, monkeypatch):
+    recycler = make_recycler(monitor, leak_slope_mb_per_hour=100, window=5)
+    monitor.set(101, 300)
+    clock = [0.0]
+    monkeypatch.setattr("runner.worker_recycler.time.monotonic", lambda: clock[0])
+
+    # 20 MB/min = 1200 MB/h, well under the 1000 MB budget for now
+    for step in range(4):
+        monitor.set(100, 400 + 20 * step)
+        assert recycler.check() == {}  # window not full yet
+        clock[0] += 60
+
+    monitor.set(100, 480)
+    assert recycler.check() == {0: ACTION_DRAIN}
+    assert recycler.get_stats()[0]['slope_mb_per_hour'] == pytest.approx(1200.0)
+
+
+def test_process_tree_memory_includes_children():
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        tree = MemoryMonitor(update_interval=60).get_process_tree_memory(os.getpid())
+        assert tree['processes'] >= 2
+        assert tree['rss_mb'] > tree['own_mb'] > 0
+        assert tree['browser_mb'] == 0
+        if sys.platform.startswith("linux"):
+            assert tree['memory_metric'] == 'pss'
+    finally:
+        child.kill()
+        child.wait()
+
+    assert MemoryMonitor(update_interval=60).get_process_tree_memory(child.pid) is None
+
+
+def test_worker_draining_during_wait_is_respawned(tmp_path, monkeypatch):
+    from scrape_yp.state_worker_pool import StateWorkerPoolManager
+
+    proxy_file = tmp_path / "proxies.txt"
+    proxy_file.write_text("\n".join(f"10.0.0.{n}:8080:user:pass" for n in range(5)))
+    manager = StateWorkerPoolManager({"proxy_file": str(proxy_file), "num_workers": 1})
+    monkeypatch.setattr("runner.worker_recycler.time.sleep", lambda seconds: None)
+
+    replacements = []
+
+    def start_worker(worker_id):
+        manager.recycler.register(worker_id, 200 + len(replacements))
+        replacements.append(FakeProcess(alive=False))
+        return replacements[-1]
+
+    monkeypatch.setattr(manager, "_start_worker", start_worker)
+
+    # The worker is still alive at the first check and gone by the next
+    manager.recycler.register(0, 100)
+    manager.recycler.workers[0].draining = True
+    manager.workers = [DrainingProcess(alive_checks=1)]
+
+    manager.wait()
+
+    assert len(replacements) == 1
+    assert manager.workers == replacements
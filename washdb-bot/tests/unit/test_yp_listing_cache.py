@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the listing-level YP parse cache (scrape_yp/listing_cache.py) and
+the listing parser mode of scrape_yp/yp_parser_enhanced.py.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from scrape_yp import listing_cache
+from scrape_yp import yp_parser_enhanced as parser
+from scrape_yp.listing_cache import ListingCache, ListingStore
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "block_pages" / "yp_results_normal.html"
+
+
+@pytest.fixture
+def html():
+    return FIXTURE.read_text()
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    cache = ListingCache(store=ListingStore(tmp_path / "listings.db"))
+    monkeypatch.setattr(listing_cache, "_listing_cache", cache)
+    return cache
+
+
+def test_listing_mode_matches_soup_mode(html, cache):
+    listings = parser._parse_yp_results_listings(html, "https://yp.example/page1", {})
+    soup = parser._parse_yp_results_soup(html, "https://yp.example/page1", {})
+
+    assert listings
+    assert listings == soup
+
+
+def test_unchanged_listings_are_reused(html, cache):
+    timings = {}
+    first = parser.parse_yp_results_enhanced(html, "page1", timings=timings)
+    assert timings["parsed"] == len(first)
+    assert timings["cached"] == 0
+
+    # Page-level noise (scripts, ads, comments, tracking pixels) does not
+    # invalidate the listings; neither does the page URL
+    noisy = html.replace(
+        "</body>",
+        "<script>var nonce='abc123';</script><!-- served 12:00 --><img src='/px.gif?t=9'></body>",
+    )
+    timings = {}
+    second = parser.parse_yp_results_enhanced(noisy, "page2", timings=timings)
+    assert timings["parsed"] == 0
+    assert timings["cached"] == len(first)
+    assert [r["name"] for r in second] == [r["name"] for r in first]
+    assert {r["source_page_url"] for r in second} == {"page2"}
+
+    for stage in ("tree", "select", "hash", "lookup", "parse", "store", "total"):
+        assert stage in timings
+    assert cache.get_stats()["pages"] == 2
+
+
+def test_changed_listing_is_reparsed(html, cache):
+    first = parser.parse_yp_results_enhanced(html)
+    name = first[0]["name"]
+
+    changed = html.replace(name, name + " Renamed", 1)
+    timings = {}
+    second = parser.parse_yp_results_enhanced(changed, timings=timings)
+    assert timings["parsed"] >= 1
+    assert second[0]["name"] == name + " Renamed"
+
+
+def test_returned_listings_are_copies(html, cache):
+    first = parser.parse_yp_results_enhanced(html)
+    first[0]["category_tags"].append("mutated")
+    first[0]["name"] = "mutated"
+
+    second = parser.parse_yp_results_enhanced(html)
+    assert second[0]["name"] != "mutated"
+    assert "mutated" not in second[0]["category_tags"]
+
+
+def test_store_shared_across_caches(tmp_path):
+    store_path = tmp_path / "listings.db"
+    ListingCache(store=ListingStore(store_path)).put_many({"k1": {"name": "Acme Wash", "tags": ["a"]}})
+
+    other = ListingCache(store=ListingStore(store_path))
+    assert other.get_many(["k1", "k2"]) == {"k1": {"name": "Acme Wash", "tags": ["a"]}}
+    stats = other.get_stats()
+    assert stats["store_hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_expired_listings_are_ignored(tmp_path):
+    store = ListingStore(tmp_path / "listings.db")
+    store.save_many({"old": {"name": "Old"}})
+
+    cache = ListingCache(ttl_hours=0, store=store)
+    assert cache.get_many(["old"]) == {}
+    assert store.count() == 0
+
+
+def test_parser_version_follows_source(tmp_path):
+    source = tmp_path / "parser.py"
+    source.write_text("def parse(): return 1\n")
+    version = parser.parser_source_version([str(source)])
+    assert parser.parser_source_version([str(source)]) == version
+
+    source.write_text("def parse(): return 2\n")
+    assert parser.parser_source_version([str(source)]) != version
+    assert parser.parser_source_version([str(tmp_path / "missing.py")]) != version
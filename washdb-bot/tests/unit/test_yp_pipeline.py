@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Tests for the staged YP crawl pipeline (scrape_yp/yp_pipeline.py), the
+background batch writer (db/batch_writer.py) and the pipelined
+crawl_single_target in scrape_yp/yp_crawl_city_first.py.
+"""
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from db.batch_writer import BatchWriter
+from scrape_yp import yp_crawl_city_first as crawler
+from scrape_yp.yp_pipeline import PageVerdict, PageVerdicts, StagePipeline
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "block_pages" / "yp_results_normal.html"
+EMPTY_PAGE = "<html><body><div class='no-results'>No results</div></body></html>"
+
+
+class AcceptAllFilter:
+    """Pass-through filter (the fixture's categories are not on the allowlist)."""
+
+    def filter_listings(self, listings, min_score=0, include_sponsored=False):
+        return list(listings), {'accepted': len(listings), 'rejected': 0}
+
+
+class FakeSession:
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def make_target(max_pages=3):
+    return SimpleNamespace(
+        id=1, city="Providence", state_id="RI", category_label="Window Cleaning",
+        max_pages=max_pages, priority=1, status="planned", attempts=0, note=None,
+        last_attempt_ts=None, primary_url="https://yp.test/primary", fallback_url="https://yp.test/fallback",
+    )
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch):
+    """Serve pages from a dict keyed by (url, page); record sent requests."""
+    pages = {}
+    sent = []
+
+    def fetch(url, page=1, worker_id=0, gate=None, **kwargs):
+        if gate and not gate():
+            return None
+        sent.append((url, page))
+        html = pages.get((url, page))
+        if isinstance(html, Exception):
+            raise html
+        return html if html is not None else EMPTY_PAGE
+
+    monkeypatch.setattr(crawler, "fetch_city_category_page", fetch)
+    return SimpleNamespace(pages=pages, sent=sent)
+
+
+def _crawl(target, **kwargs):
+    return crawler.crawl_single_target(target, FakeSession(), AcceptAllFilter(), **kwargs)
+
+
+def test_pipeline_preserves_order_and_reports_stages():
+    out = []
+    with StagePipeline([("double", lambda x: (x * 2,)), ("split", lambda x: (x, x + 1))], sink=out.append) as pipeline:
+        for i in range(5):
+            pipeline.put(i)
+
+    assert out == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    stats = {stage['stage']: stage for stage in pipeline.get_stats()}
+    assert stats['double']['items_in'] == 5
+    assert stats['split']['items_out'] == 10
+
+
+def test_pipeline_stage_error_drops_item():
+    errors = []
+
+    def fail_on_two(x):
+        if x == 2:
+            raise ValueError("bad item")
+        return (x,)
+
+    out = []
+    with StagePipeline([("check", fail_on_two)], sink=out.append,
+                       on_error=lambda stage, item, e: errors.append((stage, item))) as pipeline:
+        for i in range(4):
+            pipeline.put(i)
+
+    assert out == [0, 1, 3]
+    assert errors == [("check", 2)]
+    assert pipeline.get_stats()[1]['errors'] == 1
+
+
+def test_pipeline_backpressure_bounds_queues():
+    release = threading.Event()
+    out = []
+
+    def slow_sink(x):
+        release.wait()
+        out.append(x)
+
+    pipeline = StagePipeline([("a", lambda x: (x,)), ("b", lambda x: (x,))], sink=slow_sink, queue_size=1)
+    submitted = []
+
+    def producer():
+        for i in range(20):
+            pipeline.put(i)
+            submitted.append(i)
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    time.sleep(0.2)
+    # One item in the sink, one queued and one in hand per stage, one in the first queue
+    assert len(submitted) < 8
+
+    release.set()
+    thread.join()
+    pipeline.close()
+    assert out == list(range(20))
+
+
+def test_page_verdicts():
+    verdicts = PageVerdicts()
+    assert verdicts.wait(1, timeout=0.01) is None
+
+    verdicts.post(1, PageVerdict(parsed=10, accepted=3))
+    verdicts.post(1, PageVerdict(parsed=0))
+    assert verdicts.wait(1).proceed
+
+    verdicts.reset(1)
+    verdicts.post(1, PageVerdict(error=RuntimeError("boom")))
+    assert not verdicts.wait(1).proceed
+
+
+def test_batch_writer_batches_and_flushes():
+    batches = []
+    writer = BatchWriter(lambda batch: (batches.append(list(batch)) or (len(batch), 0)),
+                         batch_size=3, flush_interval=60, count_names=("inserted", "updated"))
+    for i in range(7):
+        writer.put(i)
+
+    writer.flush()
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+    writer.put(7)
+    writer.close()
+    stats = writer.get_stats()
+    assert stats['written'] == 8
+    assert stats['inserted'] == 8
+    assert stats['pending'] == 0
+
+    with pytest.raises(RuntimeError):
+        writer.put(8)
+
+
+def test_batch_writer_interval_and_failures():
+    calls = []
+
+    def write(batch):
+        calls.append(list(batch))
+        if "bad" in batch:
+            raise RuntimeError("db down")
+
+    writer = BatchWriter(write, batch_size=100, flush_interval=0.05)
+    writer.put("a")
+    time.sleep(0.3)
+    writer.put("b")
+    writer.put("bad")
+    writer.put("c")
+
+    # The failed batch is retried row by row; only the bad row is lost
+    assert writer.flush() == 1
+    assert calls == [["a"], ["b", "bad", "c"], ["b"], ["bad"], ["c"]]
+    assert writer.flush() == 0
+    writer.close()
+
+    stats = writer.get_stats()
+    assert stats['failed'] == 1
+    assert stats['written'] == 3
+    assert "db down" in stats['last_error']
+
+
+def test_crawl_streams_results_and_stops_without_extra_requests(fake_fetch):
+    html = FIXTURE.read_text()
+    target = make_target(max_pages=3)
+    fake_fetch.pages[(target.primary_url, 1)] = html
+    # Page 2 repeats page 1: no new unique results, so page 3 is never requested
+    fake_fetch.pages[(target.primary_url, 2)] = html
+    fake_fetch.pages[(target.primary_url, 3)] = html
+
+    written = []
+    with BatchWriter(written.extend, batch_size=10) as writer:
+        results, stats = _crawl(target, writer=writer)
+
+    assert fake_fetch.sent == [(target.primary_url, 1), (target.primary_url, 2)]
+    assert results == []
+    assert stats['total_accepted'] > 0
+    assert len(written) == stats['total_accepted']
+    assert len({r['domain'] for r in written}) == len(written)
+    assert stats['pages_fetched'] == 2
+    assert target.status == "done"
+    assert [stage['stage'] for stage in stats['stages']] == ["submit", "parse", "filter", "dedup"]
+
+
+def test_crawl_without_writer_returns_results(fake_fetch):
+    html = FIXTURE.read_text()
+    target = make_target(max_pages=1)
+    fake_fetch.pages[(target.primary_url, 1)] = html
+
+    results, stats = _crawl(target)
+    assert len(results) == stats['total_accepted'] > 0
+    assert all(r['city'] == "Providence" and r['source'] == "YP" for r in results)
+
+
+def test_crawl_uses_fallback_for_empty_first_page(fake_fetch):
+    target = make_target(max_pages=1)
+    fake_fetch.pages[(target.fallback_url, 1)] = FIXTURE.read_text()
+
+    results, stats = _crawl(target)
+    assert fake_fetch.sent == [(target.primary_url, 1), (target.fallback_url, 1)]
+    assert stats['used_fallback']
+    assert results
+
+
+def test_crawl_fails_target_when_first_page_errors(fake_fetch):
+    target = make_target(max_pages=2)
+    fake_fetch.pages[(target.primary_url, 1)] = RuntimeError("timeout")
+    fake_fetch.pages[(target.fallback_url, 1)] = RuntimeError("timeout")
+
+    with pytest.raises(RuntimeError):
+        _crawl(target)
+    assert target.status == "failed"
+    assert fake_fetch.sent == [(target.primary_url, 1), (target.fallback_url, 1)]
+
+
+def test_crawl_fails_target_when_results_are_not_saved(fake_fetch):
+    target = make_target(max_pages=1)
+    fake_fetch.pages[(target.primary_url, 1)] = FIXTURE.read_text()
+
+    def write(batch):
+        raise RuntimeError("db down")
+
+    with BatchWriter(write, batch_size=100, flush_interval=60) as writer:
+        with pytest.raises(RuntimeError, match="could not be saved"):
+            _crawl(target, writer=writer)
+    assert target.status == "failed"
@@ -94,14 +94,17 @@ MAX_DELAY_SECONDS = float(os.getenv('VERIFY_MAX_DELAY_SECONDS', '5.0'))
 EMPTY_QUEUE_DELAY = 60        # Seconds to wait when queue is empty
 MAX_EMPTY_QUEUE_DELAY = 300   # Max backoff delay
 
-# Prefetch buffer
-PREFETCH_BUFFER_SIZE = int(os.getenv('VERIFY_PREFETCH_SIZE', '3'))
+# Prefetch pipeline
+PREFETCH_BUFFER_SIZE = int(os.getenv('VERIFY_PREFETCH_SIZE', '3'))             # Ready-to-verify buffer
+PREFETCH_FETCHERS = int(os.getenv('VERIFY_PREFETCH_FETCHERS', '4'))             # Concurrent website fetchers
+PREFETCH_PARSE_PROCESSES = int(os.getenv('VERIFY_PARSE_PROCESSES', '1'))        # 0 = parse in fetcher thread
 
 # Rate limits
 MAX_LLM_VERIFICATIONS_PER_HOUR = int(os.getenv('VERIFY_MAX_LLM_HOUR', '300'))
 
 # Stale in_progress cleanup (seconds)
-STALE_IN_PROGRESS_TIMEOUT = 600  # 10 minutes
+STALE_IN_PROGRESS_TIMEOUT = 600  # 10 minutes (verification_queue claim lease)
+QUEUE_REAP_INTERVAL = 60         # How often a worker reaps expired claims
 
 
 # ==============================================================================
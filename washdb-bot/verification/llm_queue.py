@@ -24,6 +24,8 @@ import threading
 import requests
 from typing import Optional, Dict, Any
 
+from runner.metrics import stage_timer
+
 
 # Configuration
 SOCKET_PATH = os.getenv("LLM_SERVICE_SOCKET", "/tmp/llm_service.sock")
@@ -236,17 +238,18 @@ def llm_generate(prompt: str, max_tokens: int = 5, timeout: float = 30.0) -> str
     Returns:
         Generated response text
     """
-    # Try shared service first
-    if is_service_available():
-        try:
-            client = _get_client()
-            return client.generate(prompt, max_tokens, timeout)
-        except Exception as e:
-            logger.debug(f"Service call failed, falling back to direct: {e}")
+    with stage_timer("verification", "llm_call"):
+        # Try shared service first
+        if is_service_available():
+            try:
+                client = _get_client()
+                return client.generate(prompt, max_tokens, timeout)
+            except Exception as e:
+                logger.debug(f"Service call failed, falling back to direct: {e}")
 
-    # Fall back to direct call
-    direct_client = _get_direct_client()
-    return direct_client.generate(prompt, max_tokens, timeout)
+        # Fall back to direct call
+        direct_client = _get_direct_client()
+        return direct_client.generate(prompt, max_tokens, timeout)
 
 
 # Legacy compatibility - these functions existed in the old version
@@ -29,6 +29,8 @@ from dataclasses import dataclass
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from runner.logging_setup import get_logger
+from runner.metrics import record_stage, stage_timer
+from runner.profiler import handle_profile_command, install_profiler, is_profile_command
 
 # Configuration
 SOCKET_PATH = os.getenv("LLM_SERVICE_SOCKET", "/tmp/llm_service.sock")
@@ -174,6 +176,11 @@ class LLMService:
                     logger.error(f"Invalid JSON: {e}")
                     continue
 
+                # Profiler commands are answered directly, not queued
+                if is_profile_command(request_data):
+                    conn.sendall((json.dumps(handle_profile_command(request_data)) + "\n").encode('utf-8'))
+                    continue
+
                 # Create request
                 request = LLMRequest(
                     request_id=request_data.get('id', ''),
@@ -220,9 +227,11 @@ class LLMService:
 
                 # Process immediately
                 start_time = time.time()
+                record_stage("llm_service", "wait", max(0.0, start_time - request.received_at))
 
                 try:
-                    response_text = self._call_ollama(request.prompt, request.max_tokens)
+                    with stage_timer("llm_service", "llm_call"):
+                        response_text = self._call_ollama(request.prompt, request.max_tokens)
                     latency_ms = (time.time() - start_time) * 1000
 
                     response = {
@@ -343,6 +352,7 @@ def main():
     # Register signal handlers
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
+    install_profiler("llm_service")
 
     # Start service
     service = LLMService()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Verification work queue.
+
+Workers claim companies from the slim verification_queue table (migration 033)
+instead of scanning companies for an unset parse_metadata verification status.
+A partial index on pending rows serves every claim, so claim latency no longer
+grows with the size of companies.
+
+Lifecycle:
+1. Companies are enqueued by a trigger on companies whenever they have a
+   website and no verification status (enqueue_companies() re-queues
+   companies explicitly, e.g. after bulk loads that bypassed the trigger)
+2. claim_companies() leases a batch with FOR UPDATE SKIP LOCKED and marks the
+   companies in_progress in the same statement
+3. Writing a final verification status removes the queue row (trigger)
+4. reap_stale_claims() returns expired leases to pending
+
+Usage:
+    from verification.verification_queue import claim_companies
+
+    companies = claim_companies(session, worker_id=0, limit=3)
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from sqlalchemy import text
+
+from verification.config_verifier import STALE_IN_PROGRESS_TIMEOUT
+
+
+# Columns returned for each claimed company (matches the worker company dict)
+COMPANY_COLUMNS = [
+    'id', 'name', 'website', 'domain', 'phone', 'email',
+    'services', 'service_area', 'address', 'source',
+    'rating_yp', 'rating_google', 'reviews_yp', 'reviews_google',
+    'parse_metadata', 'active', 'created_at', 'last_updated',
+]
+
+
+def enqueue_companies(session, company_ids: Iterable[int]) -> int:
+    """
+    Add companies to the verification queue if they still need verification.
+
+    Companies without a website, with a verification status, or already
+    queued are skipped. Does not commit.
+
+    Args:
+        session: SQLAlchemy session
+        company_ids: Company IDs to enqueue
+
+    Returns:
+        Number of companies newly enqueued
+    """
+    ids = sorted({int(company_id) for company_id in company_ids if company_id is not None})
+    if not ids:
+        return 0
+
+    result = session.execute(
+        text("""
+            INSERT INTO verification_queue (company_id, created_at)
+            SELECT id, created_at
+            FROM companies
+            WHERE id = ANY(:ids)
+              AND website IS NOT NULL
+              AND (parse_metadata->'verification'->>'status') IS NULL
+            ON CONFLICT (company_id) DO NOTHING
+        """),
+        {'ids': ids}
+    )
+    return result.rowcount or 0
+
+
+def claim_companies(
+    session,
+    worker_id: int,
+    limit: int = 1,
+    lease_seconds: int = STALE_IN_PROGRESS_TIMEOUT,
+) -> List[Dict]:
+    """
+    Claim a batch of companies for verification and commit the claim.
+
+    Pending queue rows are locked with FOR UPDATE SKIP LOCKED (newest
+    companies first), leased to the worker, and their companies marked
+    in_progress in a single round trip.
+
+    Args:
+        session: SQLAlchemy session
+        worker_id: Worker ID recorded on the claim
+        limit: Maximum number of companies to claim
+        lease_seconds: Seconds before an unfinished claim may be reaped
+
+    Returns:
+        List of company dicts (parse_metadata as it was before the claim)
+    """
+    returning = ',\n                '.join(
+        f"b.parse_metadata AS {col}" if col == 'parse_metadata' else f"c.{col}"
+        for col in COMPANY_COLUMNS
+    )
+    query = text(f"""
+        WITH next AS (
+            SELECT q.company_id
+            FROM verification_queue q
+            JOIN companies c ON c.id = q.company_id
+            WHERE q.status = 'pending'
+              AND c.website IS NOT NULL
+              AND (c.parse_metadata->'verification'->>'status') IS NULL
+            ORDER BY q.created_at DESC NULLS LAST
+            LIMIT :limit
+            FOR UPDATE OF q SKIP LOCKED
+        ),
+        claimed AS (
+            UPDATE verification_queue q
+            SET status = 'in_progress',
+                worker_id = :worker_id,
+                claimed_at = NOW(),
+                lease_expires_at = NOW() + make_interval(secs => :lease_seconds),
+                attempts = q.attempts + 1
+            FROM next
+            WHERE q.company_id = next.company_id
+            RETURNING q.company_id, q.created_at
+        ),
+        before AS (
+            SELECT c.id, c.parse_metadata
+            FROM companies c
+            JOIN claimed ON claimed.company_id = c.id
+        )
+        UPDATE companies c
+        SET parse_metadata = jsonb_set(
+            COALESCE(c.parse_metadata, '{{}}'::jsonb),
+            '{{verification}}',
+            jsonb_build_object(
+                'status', 'in_progress'::text,
+                'worker_id', CAST(:worker_id AS integer),
+                'started_at', CAST(:started_at AS text)
+            )
+        )
+        FROM before b
+        WHERE c.id = b.id
+        RETURNING
+                {returning}
+    """)
+
+    rows = session.execute(query, {
+        'limit': limit,
+        'worker_id': worker_id,
+        'lease_seconds': lease_seconds,
+        'started_at': datetime.now().isoformat(),
+    }).fetchall()
+    session.commit()
+
+    companies = []
+    for row in rows:
+        company = dict(row._mapping)
+        company['parse_metadata'] = company['parse_metadata'] or {}
+        companies.append(company)
+
+    # Preserve claim order (newest first) - RETURNING order is unspecified
+    companies.sort(key=lambda c: c['created_at'] or datetime.min, reverse=True)
+    return companies
+
+
+def release_companies(session, company_ids: Iterable[int], worker_id: int) -> int:
+    """
+    Return claimed companies to the queue without verifying them.
+
+    Only claims still held by worker_id are released. Commits.
+
+    Args:
+        session: SQLAlchemy session
+        company_ids: Company IDs claimed by this worker
+        worker_id: Worker ID that holds the claims
+
+    Returns:
+        Number of companies released
+    """
+    ids = [int(company_id) for company_id in company_ids]
+    if not ids:
+        return 0
+
+    result = session.execute(
+        text("""
+            WITH released AS (
+                UPDATE verification_queue
+                SET status = 'pending',
+                    worker_id = NULL,
+                    claimed_at = NULL,
+                    lease_expires_at = NULL
+                WHERE company_id = ANY(:ids)
+                  AND status = 'in_progress'
+                  AND worker_id = :worker_id
+                RETURNING company_id
+            ),
+            cleared AS (
+                UPDATE companies c
+                SET parse_metadata = c.parse_metadata - 'verification'
+                FROM released r
+                WHERE c.id = r.company_id
+                  AND (c.parse_metadata->'verification'->>'status') = 'in_progress'
+                RETURNING c.id
+            )
+            SELECT COUNT(*) FROM released
+        """),
+        {'ids': ids, 'worker_id': worker_id}
+    )
+    released = result.scalar() or 0
+    session.commit()
+    return released
+
+
+def reap_stale_claims(session) -> int:
+    """
+    Return expired in_progress claims to pending.
+
+    Covers workers that crashed or were killed mid-verification: their
+    companies stay in_progress forever otherwise. Commits.
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        Number of claims reaped
+    """
+    result = session.execute(text("""
+        WITH stale AS (
+            SELECT company_id
+            FROM verification_queue
+            WHERE status = 'in_progress'
+              AND lease_expires_at < NOW()
+            FOR UPDATE SKIP LOCKED
+        ),
+        reset AS (
+            UPDATE verification_queue q
+            SET status = 'pending',
+                worker_id = NULL,
+                claimed_at = NULL,
+                lease_expires_at = NULL
+            FROM stale
+            WHERE q.company_id = stale.company_id
+            RETURNING q.company_id
+        ),
+        cleared AS (
+            UPDATE companies c
+            SET parse_metadata = c.parse_metadata - 'verification'
+            FROM reset r
+            WHERE c.id = r.company_id
+              AND (c.parse_metadata->'verification'->>'status') = 'in_progress'
+            RETURNING c.id
+        )
+        SELECT COUNT(*) FROM reset
+    """))
+    reaped = result.scalar() or 0
+    session.commit()
+    return reaped
@@ -6,10 +6,11 @@ Uses a background thread to prefetch company websites while the main thread
 runs LLM verification, keeping the GPU queue fed continuously.
 
 Architecture:
-1. Background prefetch thread acquires companies and fetches HTML
-2. Prefetch buffer holds N ready-to-verify companies
-3. Main thread pulls from buffer and runs verification
-4. GPU stays busy because work is always ready
+1. Background claim thread leases batches of companies from the queue
+2. Fetcher threads download websites concurrently; a process pool parses them
+3. Prefetch buffer holds N ready-to-verify companies
+4. Main thread pulls from buffer and runs verification
+5. GPU stays busy because work is always ready
 """
 
 import os
@@ -19,19 +20,25 @@ import signal
 import json
 import threading
 import queue
+import multiprocessing
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text, or_
+from sqlalchemy import text, or_
 from sqlalchemy.orm import sessionmaker
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from db.engine_registry import get_engine
 from runner.logging_setup import get_logger
+from runner.profiler import install_profiler, trace_target
+from runner.worker_recycler import ACTION_DRAIN, ACTION_NONE, RecycleSignal
 from scrape_site.site_scraper import fetch_page, scrape_website
 from scrape_site.site_parse import parse_site_content
 from scrape_site.service_verifier import create_verifier
@@ -48,17 +55,24 @@ from verification.config_verifier import (
     EMPTY_QUEUE_DELAY,
     MAX_EMPTY_QUEUE_DELAY,
     PREFETCH_BUFFER_SIZE,
+    PREFETCH_FETCHERS,
+    PREFETCH_PARSE_PROCESSES,
     COMBINED_HIGH_THRESHOLD,
     COMBINED_LOW_THRESHOLD,
     RED_FLAG_AUTO_REJECT_COUNT,
     LLM_CONFIDENCE_LOW,
     THIN_TEXT_THRESHOLD,
     MAX_DEEP_SCRAPES_PER_HOUR,
+    QUEUE_REAP_INTERVAL,
+)
+from verification.verification_queue import (
+    claim_companies,
+    release_companies,
+    reap_stale_claims,
 )
 
-# Track deep scrapes per hour (reset hourly)
-_deep_scrape_count = 0
-_deep_scrape_hour = None
+# Last stale-claim reap (monotonic seconds)
+_last_reap_time = None
 
 load_dotenv()
 
@@ -77,38 +91,93 @@ class PrefetchedCompany:
 
 class PrefetchBuffer:
     """
-    Buffer that prefetches company websites in background.
+    Pipeline that prefetches company websites in background.
 
     Keeps N companies ready with their HTML already fetched,
     so verification can proceed immediately without waiting for network I/O.
+
+    Stages:
+    1. Claim thread leases batches of companies from the verification queue
+    2. num_fetchers threads download websites concurrently
+    3. HTML is parsed on a process pool (CPU-bound, off the GIL)
+    4. Results land in a bounded buffer consumed by the verification loop
     """
 
-    def __init__(self, worker_id: int, session_factory, logger, buffer_size: int = 3):
+    def __init__(
+        self,
+        worker_id: int,
+        session_factory,
+        logger,
+        buffer_size: int = 3,
+        num_fetchers: int = PREFETCH_FETCHERS,
+        parse_processes: int = PREFETCH_PARSE_PROCESSES,
+    ):
         self.worker_id = worker_id
         self.session_factory = session_factory
         self.logger = logger
         self.buffer_size = buffer_size
+        self.num_fetchers = max(1, num_fetchers)
+        self.parse_processes = parse_processes
 
         self._buffer: queue.Queue[PrefetchedCompany] = queue.Queue(maxsize=buffer_size)
-        self._prefetch_thread: Optional[threading.Thread] = None
+        self._work: queue.Queue[Dict] = queue.Queue(maxsize=self.num_fetchers)  # Claimed, not yet fetched
+        self._threads: List[threading.Thread] = []
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
         self._running = False
 
     def start(self):
-        """Start the prefetch background thread."""
+        """Start the claim and fetcher threads."""
         self._running = True
-        self._prefetch_thread = threading.Thread(
-            target=self._prefetch_loop,
-            name=f"Prefetch-{self.worker_id}",
-            daemon=True
+
+        if self.parse_processes > 0:
+            # Not fork: this process runs the claim/fetch threads (and the
+            # logging listener), and a forked child could inherit their locks held
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_processes,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+
+        self._threads = [
+            threading.Thread(
+                target=self._claim_loop,
+                name=f"Prefetch-{self.worker_id}-claim",
+                daemon=True
+            )
+        ]
+        for i in range(self.num_fetchers):
+            self._threads.append(threading.Thread(
+                target=self._fetch_loop,
+                name=f"Prefetch-{self.worker_id}-fetch-{i}",
+                daemon=True
+            ))
+        for thread in self._threads:
+            thread.start()
+
+        self.logger.info(
+            f"Prefetch buffer started (size={self.buffer_size}, "
+            f"fetchers={self.num_fetchers}, parse_processes={self.parse_processes})"
         )
-        self._prefetch_thread.start()
-        self.logger.info(f"Prefetch buffer started (size={self.buffer_size})")
 
     def stop(self):
-        """Stop the prefetch thread."""
+        """Stop the prefetch pipeline."""
         self._running = False
-        if self._prefetch_thread:
-            self._prefetch_thread.join(timeout=5.0)
+        for thread in self._threads:
+            thread.join(timeout=5.0)
+
+        if self._parse_pool:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+
+        # Hand unfetched and unverified claims back to other workers
+        pending = []
+        for stage in (self._work, self._buffer):
+            while True:
+                try:
+                    item = stage.get_nowait()
+                except queue.Empty:
+                    break
+                pending.append(item.company if isinstance(item, PrefetchedCompany) else item)
+        self._release(pending)
 
     def get(self, timeout: float = 30.0) -> Optional[PrefetchedCompany]:
         """Get next prefetched company (blocks until available)."""
@@ -121,174 +190,156 @@ class PrefetchBuffer:
         """Current buffer size."""
         return self._buffer.qsize()
 
-    def _prefetch_loop(self):
-        """Background loop that continuously prefetches companies."""
+    def _claim_loop(self):
+        """Keep the fetchers' work queue topped up from the verification queue."""
         while self._running and not shutdown_requested:
-            # Only prefetch if buffer has room
-            if self._buffer.full():
+            free_slots = self._work.maxsize - self._work.qsize()
+            if free_slots <= 0:
                 time.sleep(0.1)
                 continue
 
             session = self.session_factory()
             try:
-                # Acquire company
-                company = self._acquire_company(session)
+                reap_stale_claims_if_due(session, self.logger)
+                companies = claim_companies(session, self.worker_id, limit=free_slots)
+            except Exception as e:
+                self.logger.error(f"Error acquiring companies: {e}")
+                session.rollback()
+                companies = []
+            finally:
+                session.close()
 
-                if not company:
-                    # Queue empty - wait before retrying
-                    session.close()
-                    time.sleep(5.0)
-                    continue
+            if not companies:
+                # Queue empty - wait before retrying
+                time.sleep(5.0)
+                continue
+
+            # Only this thread adds work, so the claimed slots are still free
+            for company in companies:
+                self._work.put(company)
+
+    def _fetch_loop(self):
+        """Fetcher thread: fetch, parse and buffer claimed companies."""
+        while self._running and not shutdown_requested:
+            try:
+                company = self._work.get(timeout=1.0)
+            except queue.Empty:
+                continue
 
-                # Fetch website HTML (this is the slow part)
-                website = company.get('website')
-                html = None
-                metadata = None
-                fetch_error = None
-                used_deep_scrape = False
-
-                if website:
-                    try:
-                        html = fetch_page(website, delay=MIN_DELAY_SECONDS)
-                        if html:
-                            metadata = parse_site_content(html, website)
-
-                            # === Deep scrape for thin sites ===
-                            # Check if site has minimal content
-                            services_len = len(metadata.get('services') or '')
-                            homepage_len = len(metadata.get('homepage_text') or '')
-
-                            if (services_len < THIN_TEXT_THRESHOLD and
-                                homepage_len < THIN_TEXT_THRESHOLD):
-                                # This is a thin site - check deep scrape budget
-                                global _deep_scrape_count, _deep_scrape_hour
-                                current_hour = datetime.now().hour
-
-                                # Reset hourly counter
-                                if _deep_scrape_hour != current_hour:
-                                    _deep_scrape_count = 0
-                                    _deep_scrape_hour = current_hour
-
-                                if _deep_scrape_count < MAX_DEEP_SCRAPES_PER_HOUR:
-                                    try:
-                                        self.logger.info(
-                                            f"Thin site detected ({homepage_len} chars), "
-                                            f"running deep scrape for {company['name']}"
-                                        )
-                                        scraper_result = scrape_website(website)
-                                        if scraper_result:
-                                            # Merge deep scrape metadata
-                                            metadata = scraper_result
-                                            metadata['deep_scraped'] = True
-                                            used_deep_scrape = True
-                                            _deep_scrape_count += 1
-                                    except Exception as e:
-                                        self.logger.warning(
-                                            f"Deep scrape failed for {website}: {e}"
-                                        )
-                                        # Continue with original metadata
-                        else:
-                            fetch_error = "Failed to fetch website"
-                    except Exception as e:
-                        fetch_error = str(e)
-                        self.logger.debug(f"Prefetch error for {company['name']}: {e}")
-
-                # Add to buffer
+            try:
+                prefetched = self._prefetch(company)
+            except Exception as e:
+                self.logger.error(f"Prefetch error for {company['name']}: {e}")
                 prefetched = PrefetchedCompany(
-                    company=company,
-                    html=html,
-                    metadata=metadata,
-                    fetch_error=fetch_error
+                    company=company, html=None, metadata=None, fetch_error=str(e)
                 )
 
+            # Block until the verification loop has room (backpressure)
+            while self._running and not shutdown_requested:
                 try:
-                    self._buffer.put(prefetched, timeout=5.0)
+                    self._buffer.put(prefetched, timeout=1.0)
                     self.logger.debug(f"Prefetched: {company['name']} (buffer: {self._buffer.qsize()})")
+                    break
                 except queue.Full:
-                    # Buffer full, mark company as not in_progress
-                    self.logger.warning(f"Buffer full, releasing {company['name']}")
-
+                    continue
+            else:
+                self._release([company])
+
+    def _prefetch(self, company: Dict) -> PrefetchedCompany:
+        """Fetch and parse one company website (deep scrape for thin sites)."""
+        # Fetch website HTML (this is the slow part)
+        website = company.get('website')
+        html = None
+        metadata = None
+        fetch_error = None
+
+        if website:
+            try:
+                html = fetch_page(website, delay=MIN_DELAY_SECONDS)
+                if html:
+                    metadata = self._parse(html, website)
+
+                    # === Deep scrape for thin sites ===
+                    # Check if site has minimal content
+                    services_len = len(metadata.get('services') or '')
+                    homepage_len = len(metadata.get('homepage_text') or '')
+
+                    if (self._running and
+                        services_len < THIN_TEXT_THRESHOLD and
+                        homepage_len < THIN_TEXT_THRESHOLD and
+                        self._reserve_deep_scrape()):
+                        try:
+                            self.logger.info(
+                                f"Thin site detected ({homepage_len} chars), "
+                                f"running deep scrape for {company['name']}"
+                            )
+                            scraper_result = scrape_website(website)
+                            if scraper_result:
+                                # Merge deep scrape metadata
+                                metadata = scraper_result
+                                metadata['deep_scraped'] = True
+                        except Exception as e:
+                            self.logger.warning(
+                                f"Deep scrape failed for {website}: {e}"
+                            )
+                            # Continue with original metadata
+                else:
+                    fetch_error = "Failed to fetch website"
             except Exception as e:
-                self.logger.error(f"Prefetch loop error: {e}")
-                time.sleep(1.0)
-            finally:
-                session.close()
+                fetch_error = str(e)
+                self.logger.debug(f"Prefetch error for {company['name']}: {e}")
+
+        return PrefetchedCompany(
+            company=company,
+            html=html,
+            metadata=metadata,
+            fetch_error=fetch_error
+        )
 
-    def _acquire_company(self, session) -> Optional[Dict]:
-        """Acquire a company for verification (same logic as main acquire)."""
+    def _parse(self, html: str, website: str) -> Dict:
+        """Parse site HTML on the process pool (inline if disabled, broken or stopped)."""
+        pool = self._parse_pool
+        if pool is not None:
+            try:
+                return pool.submit(parse_site_content, html, website).result()
+            except BrokenProcessPool:
+                self.logger.warning("Parse process pool broken, parsing inline")
+                self._parse_pool = None
+            except (RuntimeError, CancelledError):
+                # stop() shut the pool down while this fetch was in flight;
+                # the fetcher releases the claim, so skip the parse
+                if self._running:
+                    raise
+                return {}
+        return parse_site_content(html, website)
+
+    def _reserve_deep_scrape(self) -> bool:
+        """Reserve a deep scrape from the budget shared by all workers."""
+        session = self.session_factory()
         try:
-            query = text("""
-                SELECT
-                    id, name, website, domain, phone, email,
-                    services, service_area, address, source,
-                    rating_yp, rating_google, reviews_yp, reviews_google,
-                    parse_metadata, active, created_at, last_updated
-                FROM companies
-                WHERE website IS NOT NULL
-                  AND (
-                      parse_metadata->'verification' IS NULL
-                      OR parse_metadata->'verification'->>'status' IS NULL
-                  )
-                ORDER BY created_at DESC
-                FOR UPDATE SKIP LOCKED
-                LIMIT 1
-            """)
-
-            result = session.execute(query)
-            row = result.fetchone()
-
-            if not row:
-                return None
-
-            company = {
-                'id': row.id,
-                'name': row.name,
-                'website': row.website,
-                'domain': row.domain,
-                'phone': row.phone,
-                'email': row.email,
-                'services': row.services,
-                'service_area': row.service_area,
-                'address': row.address,
-                'source': row.source,
-                'rating_yp': row.rating_yp,
-                'rating_google': row.rating_google,
-                'reviews_yp': row.reviews_yp,
-                'reviews_google': row.reviews_google,
-                'parse_metadata': row.parse_metadata or {},
-                'active': row.active,
-                'created_at': row.created_at,
-                'last_updated': row.last_updated
-            }
-
-            # Mark as in_progress
-            mark_query = text("""
-                UPDATE companies
-                SET parse_metadata = jsonb_set(
-                    COALESCE(parse_metadata, '{}'::jsonb),
-                    '{verification}',
-                    jsonb_build_object(
-                        'status', 'in_progress'::text,
-                        'worker_id', CAST(:worker_id AS integer),
-                        'started_at', CAST(:started_at AS text)
-                    )
-                )
-                WHERE id = :company_id
-            """)
-
-            session.execute(mark_query, {
-                'company_id': company['id'],
-                'worker_id': self.worker_id,
-                'started_at': datetime.now().isoformat()
-            })
-            session.commit()
+            return reserve_deep_scrape(session)
+        except Exception as e:
+            self.logger.warning(f"Deep scrape budget check failed: {e}")
+            session.rollback()
+            return False
+        finally:
+            session.close()
 
-            return company
+    def _release(self, companies):
+        """Return claimed companies to the verification queue."""
+        ids = [company['id'] for company in companies]
+        if not ids:
+            return
 
+        session = self.session_factory()
+        try:
+            released = release_companies(session, ids, self.worker_id)
+            self.logger.info(f"Released {released} claimed companies back to queue")
         except Exception as e:
-            self.logger.error(f"Error acquiring company: {e}")
+            self.logger.warning(f"Failed to release claimed companies: {e}")
             session.rollback()
-            return None
+        finally:
+            session.close()
 
 
 def signal_handler(signum, frame):
@@ -297,12 +348,65 @@ def signal_handler(signum, frame):
     shutdown_requested = True
 
 
+def reap_stale_claims_if_due(session, logger) -> int:
+    """
+    Reap expired verification claims at most once per QUEUE_REAP_INTERVAL.
+
+    Args:
+        session: SQLAlchemy session
+        logger: Logger instance
+
+    Returns:
+        Number of claims reaped (0 if not due)
+    """
+    global _last_reap_time
+    now = time.monotonic()
+    if _last_reap_time is not None and now - _last_reap_time < QUEUE_REAP_INTERVAL:
+        return 0
+    _last_reap_time = now
+
+    reaped = reap_stale_claims(session)
+    if reaped:
+        logger.warning(f"Reaped {reaped} stale in_progress claims back to queue")
+    return reaped
+
+
+def reserve_deep_scrape(session, max_per_hour: int = MAX_DEEP_SCRAPES_PER_HOUR) -> bool:
+    """
+    Reserve one deep scrape from the hourly budget shared by all workers.
+
+    Args:
+        session: SQLAlchemy session
+        max_per_hour: Deep scrapes allowed per clock hour across all workers
+
+    Returns:
+        True if a deep scrape was reserved, False if the budget is spent
+    """
+    if max_per_hour <= 0:
+        return False
+
+    result = session.execute(
+        text("""
+            INSERT INTO verification_deep_scrape_budget (hour_start, used)
+            VALUES (date_trunc('hour', NOW()), 1)
+            ON CONFLICT (hour_start) DO UPDATE
+                SET used = verification_deep_scrape_budget.used + 1
+                WHERE verification_deep_scrape_budget.used < :max_per_hour
+            RETURNING used
+        """),
+        {'max_per_hour': max_per_hour}
+    )
+    reserved = result.fetchone() is not None
+    session.commit()
+    return reserved
+
+
 def acquire_company_for_verification(session, worker_id: int, logger) -> Optional[Dict]:
     """
-    Acquire next unverified company using row-level locking.
+    Acquire next unverified company from the verification queue.
 
-    Uses PostgreSQL's FOR UPDATE SKIP LOCKED to prevent multiple
-    workers from processing the same company.
+    Uses PostgreSQL's FOR UPDATE SKIP LOCKED on verification_queue to
+    prevent multiple workers from processing the same company.
 
     Args:
         session: SQLAlchemy session
@@ -313,74 +417,13 @@ def acquire_company_for_verification(session, worker_id: int, logger) -> Optiona
         Company dict or None if queue is empty
     """
     try:
-        # Query for next unverified company with row-level lock
-        query = text("""
-            SELECT
-                id, name, website, domain, phone, email,
-                services, service_area, address, source,
-                rating_yp, rating_google, reviews_yp, reviews_google,
-                parse_metadata, active, created_at, last_updated
-            FROM companies
-            WHERE website IS NOT NULL
-              AND (
-                  parse_metadata->'verification' IS NULL
-                  OR parse_metadata->'verification'->>'status' IS NULL
-              )
-            ORDER BY created_at DESC
-            FOR UPDATE SKIP LOCKED
-            LIMIT 1
-        """)
-
-        result = session.execute(query)
-        row = result.fetchone()
-
-        if not row:
-            return None
-
-        # Convert to dict
-        company = {
-            'id': row.id,
-            'name': row.name,
-            'website': row.website,
-            'domain': row.domain,
-            'phone': row.phone,
-            'email': row.email,
-            'services': row.services,
-            'service_area': row.service_area,
-            'address': row.address,
-            'source': row.source,
-            'rating_yp': row.rating_yp,
-            'rating_google': row.rating_google,
-            'reviews_yp': row.reviews_yp,
-            'reviews_google': row.reviews_google,
-            'parse_metadata': row.parse_metadata or {},
-            'active': row.active,
-            'created_at': row.created_at,
-            'last_updated': row.last_updated
-        }
+        reap_stale_claims_if_due(session, logger)
+        companies = claim_companies(session, worker_id, limit=1)
 
-        # Mark as in_progress immediately to prevent other workers from claiming
-        mark_query = text("""
-            UPDATE companies
-            SET parse_metadata = jsonb_set(
-                COALESCE(parse_metadata, '{}'::jsonb),
-                '{verification}',
-                jsonb_build_object(
-                    'status', 'in_progress'::text,
-                    'worker_id', CAST(:worker_id AS integer),
-                    'started_at', CAST(:started_at AS text)
-                )
-            )
-            WHERE id = :company_id
-        """)
-
-        session.execute(mark_query, {
-            'company_id': company['id'],
-            'worker_id': worker_id,
-            'started_at': datetime.now().isoformat()
-        })
-        session.commit()
+        if not companies:
+            return None
 
+        company = companies[0]
         logger.info(f"Acquired company {company['id']}: {company['name']}")
         return company
 
@@ -697,7 +740,7 @@ def update_company_verification(
         session.rollback()
 
 
-def run_worker(worker_id: int, config: Dict):
+def run_worker(worker_id: int, config: Dict, recycle_signal: Optional[RecycleSignal] = None):
     """
     Main worker function - runs continuously until shutdown.
 
@@ -706,9 +749,13 @@ def run_worker(worker_id: int, config: Dict):
     - Main thread pulls from buffer and runs verification (LLM)
     - No network I/O wait in main thread = GPU always has work
 
+    Between companies it exits gracefully (claims released, pool manager
+    starts a fresh process) when the pool's memory supervisor drains it.
+
     Args:
         worker_id: Worker ID (0-4 for 5 workers)
         config: Configuration dict
+        recycle_signal: Action slot of the pool's WorkerRecycler (optional)
     """
     # Setup logger
     logger = get_logger(f"verify_worker_{worker_id}")
@@ -721,14 +768,16 @@ def run_worker(worker_id: int, config: Dict):
     logger.info(f"High threshold (auto-pass): {COMBINED_HIGH_THRESHOLD}")
     logger.info(f"Low threshold (auto-reject): {COMBINED_LOW_THRESHOLD}")
     logger.info(f"Prefetch buffer size: {PREFETCH_BUFFER_SIZE}")
+    logger.info(f"Prefetch fetchers: {PREFETCH_FETCHERS}, parse processes: {PREFETCH_PARSE_PROCESSES}")
     logger.info("-" * 70)
 
     # Register signal handlers
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
+    install_profiler(f"verify_worker_{worker_id}")
 
     # Connect to database
-    engine = create_engine(os.getenv('DATABASE_URL'))
+    engine = get_engine(os.getenv('DATABASE_URL'))
     Session = sessionmaker(bind=engine)
 
     # Create verifier with LLM mode (can be controlled via env var)
@@ -773,6 +822,12 @@ def run_worker(worker_id: int, config: Dict):
 
     try:
         while not shutdown_requested:
+            # Memory supervisor: no browser here, so only drains apply
+            action = recycle_signal.take() if recycle_signal else ACTION_NONE
+            if action == ACTION_DRAIN:
+                logger.info("Memory budget exceeded, draining worker for a fresh process...")
+                break
+
             session = Session()
 
             try:
@@ -793,7 +848,8 @@ def run_worker(worker_id: int, config: Dict):
 
                     # Verify using pre-fetched data (only LLM call, no network)
                     company = prefetched.company
-                    verification_result = verify_prefetched_company(prefetched, verifier, logger)
+                    with trace_target(f"company:{company['id']}"):
+                        verification_result = verify_prefetched_company(prefetched, verifier, logger)
 
                 else:
                     # LEGACY MODE: Fetch and verify sequentially
@@ -809,7 +865,8 @@ def run_worker(worker_id: int, config: Dict):
                     empty_queue_count = 0
                     current_delay = EMPTY_QUEUE_DELAY
 
-                    verification_result = verify_company(company, verifier, logger)
+                    with trace_target(f"company:{company['id']}"):
+                        verification_result = verify_company(company, verifier, logger)
 
                 # Update database with results
                 if verification_result:
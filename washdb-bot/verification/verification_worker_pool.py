@@ -20,6 +20,7 @@ from typing import Dict, List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from runner.logging_setup import get_logger
+from runner.worker_recycler import WorkerRecycler
 from verification.verification_worker import run_worker
 
 # Configuration
@@ -38,6 +39,8 @@ class VerificationWorkerPoolManager:
     - Graceful shutdown with timeout
     - PID tracking for process management
     - Shared state file for GUI monitoring
+    - Per-worker memory budgets: workers over budget are drained and
+      restarted (runner.worker_recycler)
     """
 
     def __init__(self, num_workers: int = DEFAULT_NUM_WORKERS, config: Optional[Dict] = None):
@@ -54,6 +57,7 @@ class VerificationWorkerPoolManager:
         self.worker_pids: Dict[int, int] = {}  # worker_id -> PID
         self.logger = get_logger("verification_pool_manager")
         self.shutdown_requested = False
+        self.recycler = WorkerRecycler("verification", num_workers)
 
         # Ensure logs directory exists
         Path('logs').mkdir(exist_ok=True)
@@ -124,26 +128,14 @@ class VerificationWorkerPoolManager:
         self.logger.info("-" * 70)
 
         self.pool_started_at = datetime.now().isoformat()
+        self.recycler.start()
 
         for worker_id in range(self.num_workers):
             if self.shutdown_requested:
                 self.logger.warning("Shutdown requested during startup, aborting...")
                 break
 
-            self.logger.info(f"Starting worker {worker_id}...")
-
-            # Create worker process
-            process = mp.Process(
-                target=run_worker,
-                args=(worker_id, self.config),
-                name=f'verify_worker_{worker_id}'
-            )
-            process.start()
-
-            self.workers.append(process)
-            self.worker_pids[worker_id] = process.pid
-
-            self.logger.info(f"Worker {worker_id} started with PID {process.pid}")
+            self.workers.append(self._start_worker(worker_id))
 
             # Update state and PID files
             self._write_pid_file()
@@ -158,6 +150,32 @@ class VerificationWorkerPoolManager:
         self.logger.info(f"All {len(self.workers)} workers started successfully")
         self.logger.info("=" * 70)
 
+    def _start_worker(self, worker_id: int) -> mp.Process:
+        """
+        Start one worker process and register it with the memory supervisor.
+
+        Args:
+            worker_id: Worker ID
+
+        Returns:
+            The started process
+        """
+        self.logger.info(f"Starting worker {worker_id}...")
+
+        # Create worker process
+        process = mp.Process(
+            target=run_worker,
+            args=(worker_id, self.config, self.recycler.signal_for(worker_id)),
+            name=f'verify_worker_{worker_id}'
+        )
+        process.start()
+
+        self.worker_pids[worker_id] = process.pid
+        self.recycler.register(worker_id, process.pid)
+
+        self.logger.info(f"Worker {worker_id} started with PID {process.pid}")
+        return process
+
     def monitor(self):
         """
         Monitor worker processes and update state file.
@@ -170,7 +188,14 @@ class VerificationWorkerPoolManager:
             while not self.shutdown_requested:
                 # Check worker health
                 for worker_id, process in enumerate(self.workers):
-                    if not process.is_alive():
+                    if self.recycler.should_respawn(worker_id, process):
+                        process.join()
+                        self.logger.info(
+                            f"Worker {worker_id} drained (exit code {process.exitcode}), restarting..."
+                        )
+                        self.workers[worker_id] = self._start_worker(worker_id)
+                        self._write_pid_file()
+                    elif not process.is_alive():
                         self.logger.warning(f"Worker {worker_id} (PID {process.pid}) has died!")
 
                 # Update state file
@@ -197,6 +222,8 @@ class VerificationWorkerPoolManager:
         self.logger.info("STOPPING VERIFICATION WORKER POOL")
         self.logger.info("=" * 70)
 
+        self.recycler.stop()
+
         for worker_id, process in enumerate(self.workers):
             if not process.is_alive():
                 self.logger.info(f"Worker {worker_id} already stopped")